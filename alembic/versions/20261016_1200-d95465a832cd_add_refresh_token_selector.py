@@ -0,0 +1,57 @@
+"""add_refresh_token_selector
+
+Revision ID: d95465a832cd
+Revises: b568ab23752a
+Create Date: 2026-10-16 12:00:00.000000+00:00
+
+Adds the non-secret selector used to look refresh tokens up by index.
+Existing rows keep a NULL selector and their bcrypt hash; they are still
+accepted (legacy verification path) and are rotated into the
+selector/verifier format on their next refresh.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d95465a832cd"
+down_revision: Union[str, Sequence[str], None] = "b568ab23752a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "refresh_tokens",
+        sa.Column(
+            "token_selector",
+            sa.String(length=32),
+            nullable=True,
+            comment="Non-secret lookup ID (NULL for legacy bcrypt tokens)",
+        ),
+    )
+    op.create_index(
+        op.f("ix_refresh_tokens_token_selector"),
+        "refresh_tokens",
+        ["token_selector"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Selector tokens carry an HMAC hash the previous code cannot verify
+    op.execute(
+        "UPDATE refresh_tokens SET revoked_at = NOW(), "
+        "revoked_reason = 'schema_downgrade' "
+        "WHERE token_selector IS NOT NULL AND revoked_at IS NULL"
+    )
+    op.drop_index(
+        op.f("ix_refresh_tokens_token_selector"), table_name="refresh_tokens"
+    )
+    op.drop_column("refresh_tokens", "token_selector")
@@ -0,0 +1,45 @@
+"""add_transactions_keyset_index
+
+Revision ID: 5c1e8f2a9b47
+Revises: d95465a832cd
+Create Date: 2026-10-16 13:00:00.000000+00:00
+
+Replaces idx_transactions_account_date (account_id, transaction_date) with
+idx_transactions_account_date_id (account_id, transaction_date, id). The
+wider index still serves date range queries and lets keyset pagination
+seek on (transaction_date, id) directly, scanned backward for DESC order.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e8f2a9b47"
+down_revision: Union[str, Sequence[str], None] = "d95465a832cd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "idx_transactions_account_date_id",
+        "transactions",
+        ["account_id", "transaction_date", "id"],
+        unique=False,
+    )
+    op.drop_index("idx_transactions_account_date", table_name="transactions")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "idx_transactions_account_date",
+        "transactions",
+        ["account_id", "transaction_date"],
+        unique=False,
+    )
+    op.drop_index("idx_transactions_account_date_id", table_name="transactions")
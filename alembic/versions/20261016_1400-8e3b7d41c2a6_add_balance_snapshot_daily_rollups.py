@@ -0,0 +1,148 @@
+"""add_balance_snapshot_daily_rollups
+
+Revision ID: 8e3b7d41c2a6
+Revises: 5c1e8f2a9b47
+Create Date: 2026-10-16 14:00:00.000000+00:00
+
+Adds balance_snapshot_daily_rollups: one row per (account_id, source, UTC
+day) with open/close/min/max balance. Balance history charts longer than
+BALANCE_ROLLUP_MIN_RANGE_DAYS read it instead of raw snapshots. The table
+is backfilled from existing balance_snapshots; afterwards the repository
+keeps it current on every save/delete.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8e3b7d41c2a6"
+down_revision: Union[str, Sequence[str], None] = "5c1e8f2a9b47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "balance_snapshot_daily_rollups",
+        sa.Column(
+            "account_id", sa.Uuid(), nullable=False, comment="FK to accounts table"
+        ),
+        sa.Column(
+            "source",
+            sa.String(length=50),
+            nullable=False,
+            comment="Snapshot source of the aggregated snapshots",
+        ),
+        sa.Column(
+            "day",
+            sa.Date(),
+            nullable=False,
+            comment="UTC day of the aggregated snapshots",
+        ),
+        sa.Column(
+            "currency",
+            sa.String(length=3),
+            nullable=False,
+            comment="ISO 4217 currency code",
+        ),
+        sa.Column(
+            "open_balance_amount",
+            sa.Numeric(precision=19, scale=4),
+            nullable=False,
+            comment="Balance of the first snapshot of the day",
+        ),
+        sa.Column(
+            "close_balance_amount",
+            sa.Numeric(precision=19, scale=4),
+            nullable=False,
+            comment="Balance of the last snapshot of the day",
+        ),
+        sa.Column(
+            "min_balance_amount",
+            sa.Numeric(precision=19, scale=4),
+            nullable=False,
+            comment="Lowest balance of the day",
+        ),
+        sa.Column(
+            "max_balance_amount",
+            sa.Numeric(precision=19, scale=4),
+            nullable=False,
+            comment="Highest balance of the day",
+        ),
+        sa.Column(
+            "first_captured_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Capture time of the first snapshot of the day",
+        ),
+        sa.Column(
+            "last_captured_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Capture time of the last snapshot of the day",
+        ),
+        sa.Column(
+            "snapshot_count",
+            sa.Integer(),
+            nullable=False,
+            comment="Number of snapshots aggregated",
+        ),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["account_id"], ["accounts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "account_id",
+            "source",
+            "day",
+            name="uq_balance_snapshot_daily_rollups_account_source_day",
+        ),
+    )
+
+    # Backfill from existing snapshots (same aggregation the repository uses)
+    op.execute(
+        """
+        INSERT INTO balance_snapshot_daily_rollups (
+            id, account_id, source, day, currency,
+            open_balance_amount, close_balance_amount,
+            min_balance_amount, max_balance_amount,
+            first_captured_at, last_captured_at, snapshot_count
+        )
+        SELECT
+            gen_random_uuid(),
+            account_id,
+            source,
+            (captured_at AT TIME ZONE 'UTC')::date,
+            (array_agg(currency ORDER BY captured_at DESC))[1],
+            (array_agg(balance_amount ORDER BY captured_at ASC))[1],
+            (array_agg(balance_amount ORDER BY captured_at DESC))[1],
+            min(balance_amount),
+            max(balance_amount),
+            min(captured_at),
+            max(captured_at),
+            count(*)
+        FROM balance_snapshots
+        GROUP BY account_id, source, (captured_at AT TIME ZONE 'UTC')::date
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("balance_snapshot_daily_rollups")
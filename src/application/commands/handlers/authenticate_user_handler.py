@@ -163,7 +163,9 @@ class AuthenticateUserHandler:
             return Failure(error=AuthenticationError.ACCOUNT_INACTIVE)
 
         # Step 7: Verify password
-        if not self._password_service.verify_password(cmd.password, user.password_hash):
+        if not await self._password_service.verify_password_async(
+            cmd.password, user.password_hash
+        ):
             # Increment failed login counter
             user.increment_failed_login()
             await self._user_repo.update(user)
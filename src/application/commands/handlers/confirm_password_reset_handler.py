@@ -173,7 +173,9 @@ class ConfirmPasswordResetHandler:
             return Failure(error=PasswordResetConfirmError.USER_NOT_FOUND)
 
         # Step 6: Hash new password
-        password_hash = self._password_service.hash_password(cmd.new_password)
+        password_hash = await self._password_service.hash_password_async(
+            cmd.new_password
+        )
 
         # Step 7: Update user's password
         await self._user_repo.update_password(
@@ -1,14 +1,14 @@
 """Create session handler.
 
 Flow:
-1. Enrich device info from user agent
-2. Enrich location from IP address
-3. Check session limit for user tier
-4. Evict oldest session if at limit
-5. Create session in database
-6. Cache session for fast lookups
-7. Publish SessionCreated event
-8. Return session ID
+1. Get user (session tier)
+2. Concurrently: enrich device info from user agent, enrich location from
+   IP address, and count active sessions (if the tier has a limit)
+3. Evict oldest session if at limit
+4. Create session in database
+5. Cache session for fast lookups
+6. Publish SessionCreated event
+7. Return session ID
 
 Architecture:
 - Application layer ONLY imports from domain layer (entities, protocols, events)
@@ -16,6 +16,7 @@ Architecture:
 - Handler orchestrates business logic without knowing persistence details
 """
 
+import asyncio
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
@@ -116,27 +117,30 @@ class CreateSessionHandler:
         if user is None:
             return Failure(error=CreateSessionError.USER_NOT_FOUND)
 
-        # Step 2: Enrich device info
-        device_result = await self._device_enricher.enrich(cmd.user_agent or "")
+        # Steps 2-3: Enrich device and location while counting active sessions
+        # (enrichers do no database work, so they overlap the count query)
+        max_sessions = user.get_max_sessions()
+        device_result, location_result, active_count = await asyncio.gather(
+            self._device_enricher.enrich(cmd.user_agent or ""),
+            self._location_enricher.enrich(cmd.ip_address or ""),
+            self._count_active_sessions(cmd.user_id, max_sessions),
+        )
         device_info = device_result.device_info
-
-        # Step 3: Enrich location
-        location_result = await self._location_enricher.enrich(cmd.ip_address or "")
         location = location_result.location
 
         # Step 4: Check session limit
-        max_sessions = user.get_max_sessions()
-        if max_sessions is not None:
-            active_count = await self._session_repo.count_active_sessions(cmd.user_id)
-
-            if active_count >= max_sessions:
-                # Evict oldest session (FIFO)
-                evict_result = await self._evict_oldest_session(
-                    user_id=cmd.user_id,
-                    reason="session_limit_exceeded",
-                )
-                if not evict_result:
-                    return Failure(error=CreateSessionError.EVICTION_FAILED)
+        if (
+            max_sessions is not None
+            and active_count is not None
+            and active_count >= max_sessions
+        ):
+            # Evict oldest session (FIFO)
+            evict_result = await self._evict_oldest_session(
+                user_id=cmd.user_id,
+                reason="session_limit_exceeded",
+            )
+            if not evict_result:
+                return Failure(error=CreateSessionError.EVICTION_FAILED)
 
         # Step 5: Create session
         session_id = uuid7()
@@ -191,6 +195,24 @@ class CreateSessionHandler:
             )
         )
 
+    async def _count_active_sessions(
+        self,
+        user_id: UUID,
+        max_sessions: int | None,
+    ) -> int | None:
+        """Count active sessions when the user's tier has a session limit.
+
+        Args:
+            user_id: User identifier.
+            max_sessions: Tier session limit (None = unlimited).
+
+        Returns:
+            Active session count, or None if unlimited (no query).
+        """
+        if max_sessions is None:
+            return None
+        return await self._session_repo.count_active_sessions(user_id)
+
     async def _evict_oldest_session(
         self,
         user_id: UUID,
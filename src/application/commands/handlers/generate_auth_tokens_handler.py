@@ -97,6 +97,7 @@ class GenerateAuthTokensHandler:
             expires_at=expires_at,
             token_version=security_config.global_min_token_version,
             global_version_at_issuance=security_config.global_min_token_version,
+            token_selector=self._refresh_token_service.get_selector(refresh_token),
         )
 
         # Step 6: Return tokens
@@ -12,11 +12,13 @@ Architecture:
 Flow:
     1. Emit FileImportAttempted event
     2. Get or create provider connection for user
-    3. Parse file via provider.fetch_accounts() (credentials = file content)
+    3. Parse file once via provider.parse_file() (credentials = file content),
+       which returns accounts and their transactions together
     4. Upsert accounts to repository
-    5. Fetch transactions via provider.fetch_transactions()
-    6. Upsert transactions to repository (with duplicate detection by FITID)
-    7. Emit FileImportProgress events during transaction processing
+    5. Group transactions by account
+    6. Bulk insert transactions per account: one FITID prefetch, in-memory
+       deduplication, batched INSERT ... ON CONFLICT DO NOTHING
+    7. Emit throttled FileImportProgress events between batches
     8. Emit FileImportSucceeded or FileImportFailed event
     9. Return import results
 
@@ -25,8 +27,9 @@ Reference:
     - docs/architecture/sse-architecture.md (Section 3.2, Import Events)
 """
 
+import time
 from datetime import UTC, datetime
-from typing import Any, cast
+from typing import Any, TypeGuard, cast
 from uuid import UUID
 
 from uuid_extensions import uuid7
@@ -43,6 +46,7 @@ from src.domain.enums.credential_type import CredentialType
 from src.domain.enums.transaction_subtype import TransactionSubtype
 from src.domain.enums.transaction_status import TransactionStatus
 from src.domain.enums.transaction_type import TransactionType
+from src.domain.errors import ProviderError
 from src.domain.protocols.account_repository import AccountRepository
 from src.domain.protocols.event_bus_protocol import EventBusProtocol
 from src.domain.protocols.provider_connection_repository import (
@@ -50,11 +54,15 @@ from src.domain.protocols.provider_connection_repository import (
 )
 from src.domain.protocols.provider_factory_protocol import ProviderFactoryProtocol
 from src.domain.protocols.provider_protocol import (
+    FileProviderProtocol,
     ProviderAccountData,
+    ProviderFileData,
+    ProviderProtocol,
     ProviderTransactionData,
 )
 from src.domain.protocols.provider_repository import ProviderRepository
 from src.domain.protocols.transaction_repository import TransactionRepository
+from src.domain.providers.registry import get_file_import_providers
 from src.domain.value_objects.money import Money
 from src.domain.value_objects.provider_credentials import ProviderCredentials
 from src.domain.events.data_events import (
@@ -74,9 +82,13 @@ class ImportFromFileError:
     IMPORT_FAILED = "Import failed"
 
 
-# Progress emission interval: emit every N records or N% progress
-_PROGRESS_RECORD_INTERVAL = 100  # Emit every 100 records
-_PROGRESS_PERCENT_INTERVAL = 5  # Or every 5% progress
+# New transactions per bulk insert (one commit per batch)
+_TRANSACTION_BATCH_SIZE = 1_000
+
+# Progress throttling: checked between batches, emit once N records or
+# N seconds have passed since the previous progress event
+_PROGRESS_RECORD_INTERVAL = 5_000
+_PROGRESS_TIME_INTERVAL_SECONDS = 1.0
 
 
 class ImportFromFileHandler:
@@ -150,17 +162,18 @@ class ImportFromFileHandler:
             "file_name": command.file_name,
         }
 
-        # 3. Parse file via provider.fetch_accounts()
-        accounts_result = await provider.fetch_accounts(credentials_data)
+        # 3. Parse file once (accounts and transactions together)
+        file_result = await self._parse_file(provider, credentials_data)
 
-        if isinstance(accounts_result, Failure):
+        if isinstance(file_result, Failure):
             error_msg = (
-                f"{ImportFromFileError.INVALID_FILE}: {accounts_result.error.message}"
+                f"{ImportFromFileError.INVALID_FILE}: {file_result.error.message}"
             )
             await self._emit_failed_event(command, error_msg)
             return Failure(error=error_msg)
 
-        provider_accounts = accounts_result.value
+        file_data = file_result.value
+        provider_accounts = file_data.accounts
 
         if not provider_accounts:
             await self._emit_failed_event(command, ImportFromFileError.NO_ACCOUNTS)
@@ -203,60 +216,30 @@ class ImportFromFileHandler:
                 accounts_updated += 1
 
         # 7. Collect all transactions to get total count for progress
-        all_transactions: list[tuple[UUID, ProviderTransactionData]] = []
-        for provider_account in provider_accounts:
-            account_id = account_map[provider_account.provider_account_id]
-            txn_result = await provider.fetch_transactions(
-                credentials_data,
-                provider_account_id=provider_account.provider_account_id,
-            )
-            if isinstance(txn_result, Success):
-                for txn in txn_result.value:
-                    all_transactions.append((account_id, txn))
-
-        total_records = len(all_transactions)
+        account_transactions: list[tuple[UUID, list[ProviderTransactionData]]] = []
+        for provider_account_id, account_id in account_map.items():
+            provider_txns = file_data.transactions.get(provider_account_id)
+            if provider_txns:
+                account_transactions.append((account_id, provider_txns))
+
+        progress = _ImportProgress(
+            event_bus=self._event_bus,
+            command=command,
+            total_records=sum(len(txns) for _, txns in account_transactions),
+        )
 
-        # 8. Import transactions with progress events
+        # 8. Bulk import transactions with throttled progress events
         transactions_created = 0
         transactions_skipped = 0
-        last_progress_percent = 0
 
-        for i, (account_id, provider_txn) in enumerate(all_transactions):
-            was_created = await self._upsert_transaction(
+        for account_id, provider_txns in account_transactions:
+            created, skipped = await self._import_account_transactions(
                 account_id=account_id,
-                data=provider_txn,
-            )
-            if was_created:
-                transactions_created += 1
-            else:
-                transactions_skipped += 1
-
-            # Emit progress event at intervals
-            records_processed = i + 1
-            progress_percent = (
-                (records_processed * 100) // total_records if total_records > 0 else 100
-            )
-
-            # Emit if: every N records OR crossed a percent threshold
-            should_emit = (
-                records_processed % _PROGRESS_RECORD_INTERVAL == 0
-                or progress_percent
-                >= last_progress_percent + _PROGRESS_PERCENT_INTERVAL
+                provider_transactions=provider_txns,
+                progress=progress,
             )
-
-            if should_emit and records_processed < total_records:
-                await self._event_bus.publish(
-                    FileImportProgress(
-                        user_id=command.user_id,
-                        provider_slug=command.provider_slug,
-                        file_name=command.file_name,
-                        file_format=command.file_format,
-                        progress_percent=progress_percent,
-                        records_processed=records_processed,
-                        total_records=total_records,
-                    )
-                )
-                last_progress_percent = progress_percent
+            transactions_created += created
+            transactions_skipped += skipped
 
         # 9. Update connection last_sync_at
         connection.record_sync()
@@ -292,6 +275,49 @@ class ImportFromFileHandler:
 
         return Success(value=result)
 
+    async def _parse_file(
+        self,
+        provider: ProviderProtocol,
+        credentials_data: dict[str, Any],
+    ) -> Result[ProviderFileData, ProviderError]:
+        """Read accounts and transactions from the uploaded file.
+
+        File import providers parse the file once (parse_file). Other
+        providers fall back to fetch_accounts() plus fetch_transactions()
+        per account; accounts whose transactions fail to load import none.
+
+        Args:
+            provider: Provider resolved from the command slug.
+            credentials_data: Dict with file_content, file_format, file_name.
+
+        Returns:
+            Success(ProviderFileData): Accounts and transactions by account.
+            Failure(ProviderError): If the file is invalid or unparseable.
+        """
+        if _is_file_provider(provider):
+            return await provider.parse_file(credentials_data)
+
+        accounts_result = await provider.fetch_accounts(credentials_data)
+        if isinstance(accounts_result, Failure):
+            return Failure(error=accounts_result.error)
+
+        transactions: dict[str, list[ProviderTransactionData]] = {}
+        for provider_account in accounts_result.value:
+            txn_result = await provider.fetch_transactions(
+                credentials_data,
+                provider_account_id=provider_account.provider_account_id,
+            )
+            transactions[provider_account.provider_account_id] = (
+                txn_result.value if isinstance(txn_result, Success) else []
+            )
+
+        return Success(
+            value=ProviderFileData(
+                accounts=accounts_result.value,
+                transactions=transactions,
+            )
+        )
+
     async def _emit_failed_event(
         self,
         command: ImportFromFile,
@@ -449,36 +475,60 @@ class ImportFromFileHandler:
 
         account.mark_synced()
 
-    async def _upsert_transaction(
+    async def _import_account_transactions(
         self,
         account_id: UUID,
-        data: ProviderTransactionData,
-    ) -> bool:
-        """Upsert transaction from provider data.
+        provider_transactions: list[ProviderTransactionData],
+        progress: _ImportProgress,
+    ) -> tuple[int, int]:
+        """Bulk import one account's transactions.
 
-        Uses provider_transaction_id (FITID) for duplicate detection.
+        Existing FITIDs are prefetched once; duplicates (already stored or
+        repeated within the file) are skipped in memory. New transactions
+        are inserted in batches of _TRANSACTION_BATCH_SIZE, each committed
+        on its own so progress can be reported between batches. Re-importing
+        after a partial failure is safe: committed rows are skipped by FITID.
 
         Args:
             account_id: Account ID.
-            data: Transaction data from provider.
+            provider_transactions: Parsed transactions for the account.
+            progress: Progress tracker for throttled events.
 
         Returns:
-            True if created, False if skipped (duplicate).
+            Tuple of (created, skipped).
         """
-        # Check for duplicate by provider_transaction_id
-        existing = await self._transaction_repo.find_by_provider_transaction_id(
+        created = 0
+        skipped = 0
+        existing_ids = await self._transaction_repo.find_provider_transaction_ids(
             account_id=account_id,
-            provider_transaction_id=data.provider_transaction_id,
         )
 
-        if existing is not None:
-            # Duplicate - skip
-            return False
-
-        # Create new transaction
-        transaction = self._create_transaction(account_id, data)
-        await self._transaction_repo.save(transaction)
-        return True
+        batch: list[Transaction] = []
+        for data in provider_transactions:
+            if data.provider_transaction_id in existing_ids:
+                skipped += 1
+                progress.advance(1)
+                continue
+
+            existing_ids.add(data.provider_transaction_id)
+            batch.append(self._create_transaction(account_id, data))
+
+            if len(batch) >= _TRANSACTION_BATCH_SIZE:
+                inserted = await self._transaction_repo.bulk_insert(batch)
+                created += inserted
+                skipped += len(batch) - inserted
+                progress.advance(len(batch))
+                batch = []
+                await progress.maybe_emit()
+
+        if batch:
+            inserted = await self._transaction_repo.bulk_insert(batch)
+            created += inserted
+            skipped += len(batch) - inserted
+            progress.advance(len(batch))
+
+        await progress.maybe_emit()
+        return created, skipped
 
     def _create_transaction(
         self,
@@ -527,3 +577,73 @@ class ImportFromFileHandler:
             created_at=now,
             updated_at=now,
         )
+
+
+def _is_file_provider(
+    provider: ProviderProtocol,
+) -> TypeGuard[FileProviderProtocol]:
+    """Check if provider supports single-pass parse_file() (registry-driven).
+
+    Args:
+        provider: Any provider instance.
+
+    Returns:
+        True for file import providers; type narrowed to FileProviderProtocol.
+    """
+    return provider.slug in get_file_import_providers()
+
+
+class _ImportProgress:
+    """Throttled FileImportProgress emitter for one import.
+
+    Records processed (created or skipped) are counted as they happen, but an
+    event is only published when at least _PROGRESS_RECORD_INTERVAL records
+    or _PROGRESS_TIME_INTERVAL_SECONDS have passed since the previous event.
+    The final state is reported by FileImportSucceeded, not a progress event.
+    """
+
+    def __init__(
+        self,
+        event_bus: EventBusProtocol,
+        command: ImportFromFile,
+        total_records: int,
+    ) -> None:
+        self._event_bus = event_bus
+        self._command = command
+        self.total_records = total_records
+        self.records_processed = 0
+        self._last_emitted_records = 0
+        self._last_emitted_at = time.monotonic()
+
+    def advance(self, count: int) -> None:
+        """Record processed transactions."""
+        self.records_processed += count
+
+    async def maybe_emit(self) -> None:
+        """Publish a progress event if the throttle interval has elapsed."""
+        if self.records_processed >= self.total_records:
+            return
+        if self.records_processed == self._last_emitted_records:
+            return
+
+        now = time.monotonic()
+        if (
+            self.records_processed - self._last_emitted_records
+            < _PROGRESS_RECORD_INTERVAL
+            and now - self._last_emitted_at < _PROGRESS_TIME_INTERVAL_SECONDS
+        ):
+            return
+
+        self._last_emitted_records = self.records_processed
+        self._last_emitted_at = now
+        await self._event_bus.publish(
+            FileImportProgress(
+                user_id=self._command.user_id,
+                provider_slug=self._command.provider_slug,
+                file_name=self._command.file_name,
+                file_format=self._command.file_format,
+                progress_percent=(self.records_processed * 100) // self.total_records,
+                records_processed=self.records_processed,
+                total_records=self.total_records,
+            )
+        )
@@ -114,10 +114,11 @@ class LogoutUserHandler:
             metadata=metadata,
         )
 
-        # Step 2: Find refresh token by verification
+        # Step 2: Find refresh token by selector and verification
         token_data = await self._refresh_token_repo.find_by_token_verification(
             cmd.refresh_token,
-            self._refresh_token_service.verify_token,
+            self._refresh_token_service.verify_token_async,
+            selector=self._refresh_token_service.get_selector(cmd.refresh_token),
         )
 
         session_id: UUID | None = None
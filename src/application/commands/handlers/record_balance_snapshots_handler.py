@@ -0,0 +1,105 @@
+"""Handler for RecordBalanceSnapshots command.
+
+Flow:
+1. Page through active accounts by id (keyset, no OFFSET)
+2. Build a snapshot per account from its stored balance
+3. Bulk insert and commit each page, skipping balances unchanged within the
+   dedupe window
+4. Return Success(RecordBalanceSnapshotsResult)
+
+Provider APIs are not called; balances are whatever the last sync stored.
+"""
+
+from datetime import UTC, datetime
+from uuid import UUID
+
+from src.application.commands.sync_commands import RecordBalanceSnapshots
+from src.application.dtos import RecordBalanceSnapshotsResult
+from src.application.services.balance_snapshot_capture import (
+    SNAPSHOT_DEDUPE_WINDOW,
+    snapshot_from_account,
+)
+from src.core.constants import BALANCE_SNAPSHOT_CAPTURE_PAGE_SIZE
+from src.core.result import Failure, Result, Success
+from src.domain.protocols.account_repository import AccountRepository
+from src.domain.protocols.balance_snapshot_repository import (
+    BalanceSnapshotRepository,
+)
+
+
+class RecordBalanceSnapshotsHandler:
+    """Handler for scheduled balance snapshot capture.
+
+    Records one snapshot per active account in a single multi-row insert
+    per page, so a full run costs one SELECT and one INSERT per
+    BALANCE_SNAPSHOT_CAPTURE_PAGE_SIZE accounts. Each page is committed on
+    its own; a failure keeps the pages already recorded.
+    """
+
+    def __init__(
+        self,
+        account_repo: AccountRepository,
+        snapshot_repo: BalanceSnapshotRepository,
+    ) -> None:
+        """Initialize handler with dependencies.
+
+        Args:
+            account_repo: Account repository.
+            snapshot_repo: Balance snapshot repository.
+        """
+        self._account_repo = account_repo
+        self._snapshot_repo = snapshot_repo
+
+    async def handle(
+        self,
+        cmd: RecordBalanceSnapshots,
+    ) -> Result[RecordBalanceSnapshotsResult, str]:
+        """Handle scheduled balance snapshot capture.
+
+        Args:
+            cmd: RecordBalanceSnapshots command.
+
+        Returns:
+            Success(RecordBalanceSnapshotsResult) on success.
+            Failure(error) on database failure.
+        """
+        captured_at = datetime.now(UTC)
+        accounts_scanned = 0
+        snapshots_captured = 0
+        after_id: UUID | None = None
+
+        try:
+            while True:
+                accounts = await self._account_repo.find_active_page(
+                    after_id=after_id,
+                    limit=BALANCE_SNAPSHOT_CAPTURE_PAGE_SIZE,
+                )
+                if not accounts:
+                    break
+
+                accounts_scanned += len(accounts)
+                snapshots = [
+                    snapshot_from_account(account, cmd.source, captured_at)
+                    for account in accounts
+                ]
+                # Commit per page: a large run never holds one long transaction
+                snapshots_captured += await self._snapshot_repo.bulk_insert(
+                    snapshots, dedupe_window=SNAPSHOT_DEDUPE_WINDOW, commit=True
+                )
+
+                if len(accounts) < BALANCE_SNAPSHOT_CAPTURE_PAGE_SIZE:
+                    break
+                after_id = accounts[-1].id
+        except Exception as e:
+            return Failure(error=f"Failed to record balance snapshots: {e}")
+
+        return Success(
+            value=RecordBalanceSnapshotsResult(
+                accounts_scanned=accounts_scanned,
+                snapshots_captured=snapshots_captured,
+                message=(
+                    f"Recorded {snapshots_captured} snapshots "
+                    f"for {accounts_scanned} accounts"
+                ),
+            )
+        )
@@ -3,7 +3,7 @@
 Flow:
 1. Emit AuthTokenRefreshAttempted event
 2. Verify refresh token format
-3. Look up all refresh tokens for user and verify against provided token
+3. Look up refresh token by selector and verify against provided token
 4. Verify token not expired
 5. Verify token not revoked
 6. Get user from database
@@ -160,12 +160,7 @@ class RefreshAccessTokenHandler:
             metadata=metadata,
         )
 
-        # Step 2-3: Look up token by iterating through database tokens
-        # Note: We hash the provided token and compare against stored hashes
-        # Since bcrypt hashes are non-deterministic, we need to verify each stored hash
-
-        # First, we need to find the token record
-        # The refresh_token_service can verify token against hash
+        # Step 2-3: Look up token by selector and verify its keyed hash
         token_data = await self._find_valid_refresh_token(cmd.refresh_token)
 
         if token_data is None:
@@ -281,6 +276,7 @@ class RefreshAccessTokenHandler:
             expires_at=new_expires_at,
             token_version=security_config.global_min_token_version,
             global_version_at_issuance=security_config.global_min_token_version,
+            token_selector=self._refresh_token_service.get_selector(new_refresh_token),
         )
 
         # Step 10: Emit SUCCEEDED event
@@ -305,16 +301,11 @@ class RefreshAccessTokenHandler:
     async def _find_valid_refresh_token(
         self, provided_token: str
     ) -> RefreshTokenData | None:
-        """Find refresh token by verifying against stored hashes.
-
-        Since bcrypt hashes are non-deterministic, we cannot simply hash
-        the provided token and look it up. Instead, we need to fetch
-        candidates and verify each one.
+        """Find refresh token by selector and verify against its stored hash.
 
-        Note: This is a simplistic implementation. For production with
-        many tokens, consider:
-        - Adding a token prefix/identifier to narrow search
-        - Using a deterministic hash as a lookup key alongside bcrypt
+        Selector/verifier tokens cost one indexed lookup and one HMAC
+        comparison. Legacy tokens (no selector) fall back to verifying the
+        remaining legacy rows and are rotated into the new format on success.
 
         Args:
             provided_token: Plain refresh token from user request.
@@ -322,31 +313,10 @@ class RefreshAccessTokenHandler:
         Returns:
             RefreshTokenData if found and valid, None otherwise.
         """
-        # For now, we need a way to look up tokens
-        # The repository should have a method to iterate tokens
-        # OR we add a token prefix for lookup
-
-        # Since our current protocol doesn't support iteration,
-        # we need to verify by hash directly
-        # Let's add find_by_verification to the protocol
-
-        # Actually, the login handler saves token_hash, so we need
-        # to verify the provided token against each stored hash
-        # This requires iterating - not ideal but secure
-
-        # For MVP: Let's look up by user from JWT claims
-        # But we don't have user_id in the refresh request...
-
-        # Alternative approach: Store a non-secret token identifier
-        # alongside the bcrypt hash for lookup, then verify
-
-        # For now, let's assume the repository has a method to
-        # iterate active tokens and verify (we'll add this)
-
-        # Using the verify_and_find pattern:
         return await self._refresh_token_repo.find_by_token_verification(
             provided_token,
-            self._refresh_token_service.verify_token,
+            self._refresh_token_service.verify_token_async,
+            selector=self._refresh_token_service.get_selector(provided_token),
         )
 
     async def _publish_failed_event(
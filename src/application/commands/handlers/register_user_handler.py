@@ -141,7 +141,9 @@ class RegisterUserHandler:
                 return Failure(error=RegistrationError.EMAIL_ALREADY_EXISTS)
 
             # Step 4: Hash password
-            password_hash = self._password_service.hash_password(cmd.password)
+            password_hash = await self._password_service.hash_password_async(
+                cmd.password
+            )
 
             # Step 5: Create User entity
             user_id = uuid7()
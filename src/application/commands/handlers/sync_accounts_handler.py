@@ -8,6 +8,7 @@ Architecture:
     - Blocking operation (not background job)
     - Uses provider adapter for external API calls
     - Publishes domain events for audit/observability
+    - Records one balance snapshot per synced account (single bulk insert)
 
 Reference:
     - docs/architecture/cqrs-pattern.md
@@ -22,9 +23,15 @@ from uuid_extensions import uuid7
 
 from src.application.commands.sync_commands import SyncAccounts
 from src.application.dtos import BalanceChange, SyncAccountsResult
+from src.application.services.balance_snapshot_capture import (
+    SNAPSHOT_DEDUPE_WINDOW,
+    snapshot_from_account,
+)
 from src.core.result import Failure, Result, Success
 from src.domain.entities.account import Account
+from src.domain.entities.balance_snapshot import BalanceSnapshot
 from src.domain.enums.account_type import AccountType
+from src.domain.enums.snapshot_source import SnapshotSource
 from src.domain.events.data_events import (
     AccountSyncAttempted,
     AccountSyncFailed,
@@ -32,7 +39,9 @@ from src.domain.events.data_events import (
 )
 from src.domain.events.portfolio_events import AccountBalanceUpdated
 from src.domain.protocols.account_repository import AccountRepository
+from src.domain.protocols.balance_snapshot_repository import BalanceSnapshotRepository
 from src.domain.protocols.event_bus_protocol import EventBusProtocol
+from src.domain.protocols.logger_protocol import LoggerProtocol
 from src.domain.protocols.provider_connection_repository import (
     ProviderConnectionRepository,
 )
@@ -70,11 +79,13 @@ class SyncAccountsHandler:
         3. Decrypt provider credentials
         4. Call provider.fetch_accounts()
         5. Upsert accounts to repository
-        6. Update connection last_sync_at
+        6. Record balance snapshots (deduplicated, one bulk insert)
+        7. Update connection last_sync_at
 
     Dependencies (injected via constructor):
         - ProviderConnectionRepository: For connection lookup
         - AccountRepository: For account persistence
+        - BalanceSnapshotRepository: For balance history capture
         - EncryptionService: For credential decryption
         - ProviderFactoryProtocol: Factory for runtime provider resolution
         - EventBus: For domain events
@@ -84,24 +95,30 @@ class SyncAccountsHandler:
         self,
         connection_repo: ProviderConnectionRepository,
         account_repo: AccountRepository,
+        snapshot_repo: BalanceSnapshotRepository,
         encryption_service: EncryptionProtocol,
         provider_factory: ProviderFactoryProtocol,
         event_bus: EventBusProtocol,
+        logger: LoggerProtocol,
     ) -> None:
         """Initialize handler with dependencies.
 
         Args:
             connection_repo: Provider connection repository.
             account_repo: Account repository.
+            snapshot_repo: Balance snapshot repository.
             encryption_service: For decrypting credentials.
             provider_factory: Factory for runtime provider resolution.
             event_bus: For publishing domain events.
+            logger: For reporting best-effort snapshot failures.
         """
         self._connection_repo = connection_repo
         self._account_repo = account_repo
+        self._snapshot_repo = snapshot_repo
         self._encryption_service = encryption_service
         self._provider_factory = provider_factory
         self._event_bus = event_bus
+        self._logger = logger
 
     async def handle(self, command: SyncAccounts) -> Result[SyncAccountsResult, str]:
         """Handle SyncAccounts command.
@@ -252,11 +269,25 @@ class SyncAccountsHandler:
         provider_accounts = fetch_result.value
 
         # 9. Sync accounts to repository
-        sync_result = await self._sync_accounts_to_repository(
+        sync_result, snapshots = await self._sync_accounts_to_repository(
             connection_id=connection.id,
             provider_accounts=provider_accounts,
         )
 
+        # 9b. Record balance history (unchanged balances are deduplicated).
+        # Best-effort: a snapshot failure must not fail the sync itself.
+        try:
+            sync_result.snapshots_captured = await self._snapshot_repo.bulk_insert(
+                snapshots, dedupe_window=SNAPSHOT_DEDUPE_WINDOW
+            )
+        except Exception as e:
+            self._logger.error(
+                "balance_snapshot_capture_failed",
+                error=e,
+                connection_id=str(connection.id),
+                snapshot_count=len(snapshots),
+            )
+
         # 10. Update connection last_sync_at
         connection.record_sync()
         await self._connection_repo.save(connection)
@@ -296,23 +327,27 @@ class SyncAccountsHandler:
         self,
         connection_id: UUID,
         provider_accounts: list[ProviderAccountData],
-    ) -> SyncAccountsResult:
+    ) -> tuple[SyncAccountsResult, list[BalanceSnapshot]]:
         """Sync provider accounts to repository using upsert logic.
 
-        Tracks balance changes for portfolio notifications.
+        Tracks balance changes for portfolio notifications and builds one
+        balance snapshot per successfully synced account.
 
         Args:
             connection_id: Provider connection ID.
             provider_accounts: Accounts fetched from provider.
 
         Returns:
-            SyncAccountsResult with counts and balance changes.
+            Tuple of SyncAccountsResult (counts and balance changes) and the
+            snapshots to record.
         """
         created = 0
         updated = 0
         unchanged = 0
         errors = 0
         balance_changes: list[BalanceChange] = []
+        snapshots: list[BalanceSnapshot] = []
+        captured_at = datetime.now(UTC)
 
         for provider_account in provider_accounts:
             try:
@@ -330,6 +365,11 @@ class SyncAccountsHandler:
                     )
                     await self._account_repo.save(account)
                     created += 1
+                    snapshots.append(
+                        snapshot_from_account(
+                            account, SnapshotSource.INITIAL_CONNECTION, captured_at
+                        )
+                    )
                     # New account - balance went from 0 to new_balance
                     if provider_account.balance != 0:
                         balance_changes.append(
@@ -364,6 +404,11 @@ class SyncAccountsHandler:
                             )
                     else:
                         unchanged += 1
+                    snapshots.append(
+                        snapshot_from_account(
+                            existing, SnapshotSource.ACCOUNT_SYNC, captured_at
+                        )
+                    )
 
             except Exception:
                 # Log error but continue with other accounts
@@ -377,7 +422,7 @@ class SyncAccountsHandler:
         if errors > 0:
             message += f", {errors} errors"
 
-        return SyncAccountsResult(
+        sync_result = SyncAccountsResult(
             created=created,
             updated=updated,
             unchanged=unchanged,
@@ -385,6 +430,7 @@ class SyncAccountsHandler:
             message=message,
             balance_changes=balance_changes,
         )
+        return sync_result, snapshots
 
     def _create_account_from_provider_data(
         self,
@@ -8,6 +8,7 @@ Architecture:
     - Blocking operation (not background job)
     - Uses provider adapter for external API calls
     - Syncs holdings for a specific account
+    - Records a balance snapshot with the new holdings value
 
 Reference:
     - docs/architecture/cqrs-pattern.md
@@ -15,6 +16,7 @@ Reference:
 """
 
 from datetime import UTC, datetime, timedelta
+from decimal import Decimal
 from typing import cast
 from uuid import UUID
 
@@ -22,9 +24,14 @@ from uuid_extensions import uuid7
 
 from src.application.commands.sync_commands import SyncHoldings
 from src.application.dtos import SyncHoldingsResult
+from src.application.services.balance_snapshot_capture import (
+    SNAPSHOT_DEDUPE_WINDOW,
+    snapshot_from_account,
+)
 from src.core.result import Failure, Result, Success
 from src.domain.entities.holding import Holding
 from src.domain.enums.asset_type import AssetType
+from src.domain.enums.snapshot_source import SnapshotSource
 from src.domain.events.data_events import (
     HoldingsSyncAttempted,
     HoldingsSyncFailed,
@@ -32,7 +39,9 @@ from src.domain.events.data_events import (
 )
 from src.domain.events.portfolio_events import AccountHoldingsUpdated
 from src.domain.protocols.account_repository import AccountRepository
+from src.domain.protocols.balance_snapshot_repository import BalanceSnapshotRepository
 from src.domain.protocols.event_bus_protocol import EventBusProtocol
+from src.domain.protocols.logger_protocol import LoggerProtocol
 from src.domain.protocols.holding_repository import HoldingRepository
 from src.domain.protocols.provider_connection_repository import (
     ProviderConnectionRepository,
@@ -75,11 +84,13 @@ class SyncHoldingsHandler:
         6. Upsert holdings to repository
         7. Deactivate holdings no longer in provider
         8. Update account last_sync_at
+        9. Record balance snapshot with holdings value (deduplicated)
 
     Dependencies (injected via constructor):
         - AccountRepository: For account lookup
         - ProviderConnectionRepository: For connection lookup
         - HoldingRepository: For holding persistence
+        - BalanceSnapshotRepository: For balance history capture
         - EncryptionService: For credential decryption
         - ProviderFactoryProtocol: Factory for runtime provider resolution
         - EventBus: For domain events
@@ -90,9 +101,11 @@ class SyncHoldingsHandler:
         account_repo: AccountRepository,
         connection_repo: ProviderConnectionRepository,
         holding_repo: HoldingRepository,
+        snapshot_repo: BalanceSnapshotRepository,
         encryption_service: EncryptionProtocol,
         provider_factory: ProviderFactoryProtocol,
         event_bus: EventBusProtocol,
+        logger: LoggerProtocol,
     ) -> None:
         """Initialize handler with dependencies.
 
@@ -100,16 +113,20 @@ class SyncHoldingsHandler:
             account_repo: Account repository.
             connection_repo: Provider connection repository.
             holding_repo: Holding repository.
+            snapshot_repo: Balance snapshot repository.
             encryption_service: For decrypting credentials.
             provider_factory: Factory for runtime provider resolution.
             event_bus: For publishing domain events.
+            logger: For reporting best-effort snapshot failures.
         """
         self._account_repo = account_repo
         self._connection_repo = connection_repo
         self._holding_repo = holding_repo
+        self._snapshot_repo = snapshot_repo
         self._encryption_service = encryption_service
         self._provider_factory = provider_factory
         self._event_bus = event_bus
+        self._logger = logger
 
     async def handle(self, command: SyncHoldings) -> Result[SyncHoldingsResult, str]:
         """Handle SyncHoldings command.
@@ -290,6 +307,38 @@ class SyncHoldingsHandler:
         account.mark_synced()
         await self._account_repo.save(account)
 
+        # 11b. Record balance history with the synced holdings value.
+        # Best-effort: a snapshot failure must not fail the sync itself.
+        holdings_value = Money(
+            amount=sum(
+                (
+                    holding.market_value
+                    for holding in provider_holdings
+                    if holding.currency == account.currency
+                ),
+                Decimal("0"),
+            ),
+            currency=account.currency,
+        )
+        try:
+            sync_result.snapshots_captured = await self._snapshot_repo.bulk_insert(
+                [
+                    snapshot_from_account(
+                        account,
+                        SnapshotSource.HOLDINGS_SYNC,
+                        datetime.now(UTC),
+                        holdings_value=holdings_value,
+                    )
+                ],
+                dedupe_window=SNAPSHOT_DEDUPE_WINDOW,
+            )
+        except Exception as e:
+            self._logger.error(
+                "balance_snapshot_capture_failed",
+                error=e,
+                account_id=str(account.id),
+            )
+
         # 12. Emit SUCCEEDED event
         total_holdings = (
             sync_result.created + sync_result.updated + sync_result.unchanged
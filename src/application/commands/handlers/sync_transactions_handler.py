@@ -8,26 +8,36 @@ Architecture:
     - Blocking operation (not background job)
     - Uses provider adapter for external API calls
     - Syncs transactions for all accounts under a connection
+    - Fetches accounts concurrently, bounded per provider
+      (ProviderConcurrencyProtocol); persists sequentially in account order
 
 Reference:
     - docs/architecture/cqrs-pattern.md
     - docs/architecture/api-design-patterns.md
 """
 
+import asyncio
+import time
 from datetime import UTC, date, datetime, timedelta
-from typing import cast
+from typing import Any, cast
 from uuid import UUID
 
 from uuid_extensions import uuid7
 
 from src.application.commands.sync_commands import SyncTransactions
-from src.application.dtos import SyncTransactionsResult
+from src.application.dtos import AccountSyncTiming, SyncTransactionsResult
+from src.core.constants import (
+    PROVIDER_RATE_LIMIT_MAX_RETRIES,
+    PROVIDER_RETRY_AFTER_DEFAULT_SECONDS,
+    PROVIDER_RETRY_AFTER_MAX_SECONDS,
+)
 from src.core.result import Failure, Result, Success
 from src.domain.entities.transaction import Transaction
 from src.domain.enums.asset_type import AssetType
 from src.domain.enums.transaction_status import TransactionStatus
 from src.domain.enums.transaction_subtype import TransactionSubtype
 from src.domain.enums.transaction_type import TransactionType
+from src.domain.errors import ProviderError, ProviderRateLimitError
 from src.domain.events.data_events import (
     TransactionSyncAttempted,
     TransactionSyncFailed,
@@ -35,11 +45,17 @@ from src.domain.events.data_events import (
 )
 from src.domain.protocols.account_repository import AccountRepository
 from src.domain.protocols.event_bus_protocol import EventBusProtocol
+from src.domain.protocols.provider_concurrency_protocol import (
+    ProviderConcurrencyProtocol,
+)
 from src.domain.protocols.provider_connection_repository import (
     ProviderConnectionRepository,
 )
 from src.domain.protocols.provider_factory_protocol import ProviderFactoryProtocol
-from src.domain.protocols.provider_protocol import ProviderTransactionData
+from src.domain.protocols.provider_protocol import (
+    ProviderProtocol,
+    ProviderTransactionData,
+)
 from src.domain.protocols.transaction_repository import TransactionRepository
 from src.domain.protocols.encryption_protocol import EncryptionProtocol
 from src.domain.value_objects.money import Money
@@ -73,8 +89,11 @@ class SyncTransactionsHandler:
         1. Verify connection exists and is owned by user
         2. Decrypt provider credentials
         3. Get accounts for connection (or specific account)
-        4. For each account: call provider.fetch_transactions()
-        5. Upsert transactions to repository
+        4. Call provider.fetch_transactions() for all accounts concurrently,
+           bounded by the provider's concurrency limit; 429 responses pause
+           the provider for Retry-After and are retried
+        5. In account order: prefetch existing IDs and dedupe in memory
+        6. Bulk insert new transactions of all accounts in one transaction
 
     Dependencies (injected via constructor):
         - ProviderConnectionRepository: For connection lookup
@@ -83,6 +102,7 @@ class SyncTransactionsHandler:
         - EncryptionService: For credential decryption
         - ProviderFactoryProtocol: Factory for runtime provider resolution
         - EventBus: For domain events
+        - ProviderConcurrencyProtocol: Per-provider limits on in-flight calls
     """
 
     def __init__(
@@ -93,6 +113,7 @@ class SyncTransactionsHandler:
         encryption_service: EncryptionProtocol,
         provider_factory: ProviderFactoryProtocol,
         event_bus: EventBusProtocol,
+        concurrency_limiter: ProviderConcurrencyProtocol,
     ) -> None:
         """Initialize handler with dependencies.
 
@@ -103,6 +124,7 @@ class SyncTransactionsHandler:
             encryption_service: For decrypting credentials.
             provider_factory: Factory for runtime provider resolution.
             event_bus: For publishing domain events.
+            concurrency_limiter: Per-provider concurrency limits (app-scoped).
         """
         self._connection_repo = connection_repo
         self._account_repo = account_repo
@@ -110,6 +132,7 @@ class SyncTransactionsHandler:
         self._encryption_service = encryption_service
         self._provider_factory = provider_factory
         self._event_bus = event_bus
+        self._concurrency_limiter = concurrency_limiter
 
     async def handle(
         self, command: SyncTransactions
@@ -293,43 +316,63 @@ class SyncTransactionsHandler:
         # 8. Resolve provider from connection slug
         provider = self._provider_factory.get_provider(connection.provider_slug)
 
-        # 9. Sync transactions for each account
+        # 9. Fetch transactions for all accounts concurrently
+        # Provider extracts what it needs from the full credentials dict
+        # (access_token for OAuth, api_key for API Key, etc.)
+        fetches = await asyncio.gather(
+            *(
+                self._fetch_account_transactions(
+                    provider=provider,
+                    provider_slug=connection.provider_slug,
+                    credentials=credentials_data,
+                    account_id=account.id,
+                    provider_account_id=account.provider_account_id,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+                for account in accounts
+            )
+        )
+
+        # 10. Persist in account order (the session is not shared across tasks)
         total_created = 0
         total_updated = 0
         total_unchanged = 0
         total_errors = 0
-        accounts_synced = 0
-
-        for account in accounts:
-            # Fetch transactions from provider (pass full credentials dict)
-            # Provider extracts what it needs (access_token for OAuth, api_key for API Key, etc.)
-            fetch_result = await provider.fetch_transactions(
-                credentials=credentials_data,
-                provider_account_id=account.provider_account_id,
-                start_date=start_date,
-                end_date=end_date,
-            )
+        synced_accounts = []
+        account_timings: list[AccountSyncTiming] = []
+        new_transactions: list[Transaction] = []
 
+        for account, (fetch_result, timing) in zip(accounts, fetches, strict=True):
+            account_timings.append(timing)
             if isinstance(fetch_result, Failure):
-                # Log error but continue with other accounts
+                # Provider error for this account - continue with the others
                 total_errors += 1
                 continue
 
-            provider_transactions = fetch_result.value
-
-            # Sync to repository
-            sync_result = await self._sync_transactions_to_repository(
+            prepared, unchanged, errors = await self._prepare_new_transactions(
                 account_id=account.id,
-                provider_transactions=provider_transactions,
+                provider_transactions=fetch_result.value,
             )
+            new_transactions.extend(prepared)
+            total_unchanged += unchanged
+            total_errors += errors
+            synced_accounts.append(account)
+
+        inserted = await self._insert_transactions(new_transactions)
+        if inserted is None:
+            # Batch rolled back as a whole: no account's transactions were
+            # stored, so none of them counts as synced
+            total_errors += len(new_transactions)
+            synced_accounts = []
+        else:
+            # Rows inserted concurrently by another sync were skipped
+            total_created += inserted
+            total_unchanged += len(new_transactions) - inserted
+        accounts_synced = len(synced_accounts)
 
-            total_created += sync_result["created"]
-            total_updated += sync_result["updated"]
-            total_unchanged += sync_result["unchanged"]
-            total_errors += sync_result["errors"]
-            accounts_synced += 1
-
-            # Mark account as synced
+        # Mark accounts as synced (only after their transactions are stored)
+        for account in synced_accounts:
             account.mark_synced()
             await self._account_repo.save(account)
 
@@ -342,7 +385,7 @@ class SyncTransactionsHandler:
         if total_errors > 0:
             message += f", {total_errors} errors"
 
-        # 10. Emit SUCCEEDED event
+        # 11. Emit SUCCEEDED event
         await self._event_bus.publish(
             TransactionSyncSucceeded(
                 event_id=uuid7(),
@@ -362,66 +405,140 @@ class SyncTransactionsHandler:
                 errors=total_errors,
                 accounts_synced=accounts_synced,
                 message=message,
+                account_timings=account_timings,
             )
         )
 
-    async def _sync_transactions_to_repository(
+    async def _fetch_account_transactions(
+        self,
+        *,
+        provider: ProviderProtocol,
+        provider_slug: str,
+        credentials: dict[str, Any],
+        account_id: UUID,
+        provider_account_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> tuple[Result[list[ProviderTransactionData], ProviderError], AccountSyncTiming]:
+        """Fetch one account's transactions within the provider's limits.
+
+        Each call holds a provider slot. On a rate limit response the
+        provider is paused for Retry-After (so concurrent fetches back off
+        too) and the call is retried, unless the pause exceeds
+        PROVIDER_RETRY_AFTER_MAX_SECONDS or retries are exhausted.
+
+        Args:
+            provider: Provider adapter.
+            provider_slug: Provider identifier (concurrency limit key).
+            credentials: Decrypted provider credentials.
+            account_id: Local account ID (for timing).
+            provider_account_id: Provider's account identifier.
+            start_date: Start of the sync range.
+            end_date: End of the sync range.
+
+        Returns:
+            Tuple of the provider fetch result and the account's timing.
+        """
+        started = time.perf_counter()
+        attempts = 0
+        while True:
+            attempts += 1
+            async with self._concurrency_limiter.slot(provider_slug):
+                result = await provider.fetch_transactions(
+                    credentials=credentials,
+                    provider_account_id=provider_account_id,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+
+            if not (
+                isinstance(result, Failure)
+                and isinstance(result.error, ProviderRateLimitError)
+                and attempts <= PROVIDER_RATE_LIMIT_MAX_RETRIES
+            ):
+                break
+            retry_after = (
+                result.error.retry_after
+                if result.error.retry_after is not None
+                else PROVIDER_RETRY_AFTER_DEFAULT_SECONDS
+            )
+            if retry_after > PROVIDER_RETRY_AFTER_MAX_SECONDS:
+                break
+            self._concurrency_limiter.defer(provider_slug, retry_after)
+
+        timing = AccountSyncTiming(
+            account_id=account_id,
+            duration_ms=(time.perf_counter() - started) * 1000,
+            attempts=attempts,
+            fetched=len(result.value) if isinstance(result, Success) else 0,
+            error=result.error.message if isinstance(result, Failure) else None,
+        )
+        return result, timing
+
+    async def _prepare_new_transactions(
         self,
         account_id: UUID,
         provider_transactions: list[ProviderTransactionData],
-    ) -> dict[str, int]:
-        """Sync provider transactions to repository.
+    ) -> tuple[list[Transaction], int, int]:
+        """Build entities for provider transactions not stored yet.
+
+        One prefetch of existing provider transaction IDs, then in-memory
+        deduplication. Existing transactions are left untouched (transactions
+        are immutable), so they count as unchanged.
 
         Args:
             account_id: Account ID to associate transactions with.
             provider_transactions: Transactions fetched from provider.
 
         Returns:
-            Dict with counts: created, updated, unchanged, errors.
+            Tuple of (new transactions, unchanged count, error count).
         """
-        created = 0
-        updated = 0
         unchanged = 0
         errors = 0
 
+        existing_ids = await self._transaction_repo.find_provider_transaction_ids(
+            account_id=account_id,
+        )
+
+        new_transactions: list[Transaction] = []
         for provider_txn in provider_transactions:
+            # Duplicates within the same provider payload are also unchanged
+            if provider_txn.provider_transaction_id in existing_ids:
+                unchanged += 1
+                continue
+
             try:
-                # Check if transaction exists
-                existing = await self._transaction_repo.find_by_provider_transaction_id(
+                transaction = self._create_transaction_from_provider_data(
                     account_id=account_id,
-                    provider_transaction_id=provider_txn.provider_transaction_id,
+                    data=provider_txn,
                 )
-
-                if existing is None:
-                    # Create new transaction
-                    transaction = self._create_transaction_from_provider_data(
-                        account_id=account_id,
-                        data=provider_txn,
-                    )
-                    await self._transaction_repo.save(transaction)
-                    created += 1
-                else:
-                    # Transaction exists - check if status changed
-                    # Transactions are immutable except status can change from PENDING → SETTLED
-                    new_status = self._map_status(provider_txn.status)
-                    if existing.status != new_status:
-                        # Status changed - create updated transaction (immutable, so save as new version)
-                        # For now, we don't update transactions since they're immutable
-                        # A proper implementation would mark old as superseded
-                        unchanged += 1
-                    else:
-                        unchanged += 1
-
             except Exception:
-                # Log error but continue with other transactions
+                # Invalid provider data - skip and continue with the rest
                 errors += 1
+                continue
+
+            existing_ids.add(provider_txn.provider_transaction_id)
+            new_transactions.append(transaction)
+
+        return new_transactions, unchanged, errors
 
-        return {
-            "created": created,
-            "updated": updated,
-            "unchanged": unchanged,
-            "errors": errors,
-        }
+    async def _insert_transactions(self, transactions: list[Transaction]) -> int | None:
+        """Bulk insert new transactions committed as a single transaction.
+
+        Args:
+            transactions: New transactions of all synced accounts.
+
+        Returns:
+            Number of rows inserted, or None if the batch failed.
+        """
+        if not transactions:
+            return 0
+
+        try:
+            return await self._transaction_repo.bulk_insert(transactions)
+        except Exception:
+            # Batch rolled back as a whole
+            return None
 
     def _create_transaction_from_provider_data(
         self,
@@ -17,6 +17,8 @@ from dataclasses import dataclass
 from datetime import date
 from uuid import UUID
 
+from src.domain.enums.snapshot_source import SnapshotSource
+
 
 @dataclass(frozen=True, kw_only=True)
 class SyncAccounts:
@@ -76,3 +78,18 @@ class SyncHoldings:
     account_id: UUID
     user_id: UUID
     force: bool = False
+
+
+@dataclass(frozen=True, kw_only=True)
+class RecordBalanceSnapshots:
+    """Command to record balance snapshots for all active accounts.
+
+    Scheduled capture: snapshots current stored balances without calling
+    providers. Accounts whose balance has not changed within the dedupe
+    window are skipped.
+
+    Attributes:
+        source: Snapshot source recorded on each snapshot.
+    """
+
+    source: SnapshotSource = SnapshotSource.SCHEDULED_SYNC
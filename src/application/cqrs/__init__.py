@@ -49,6 +49,7 @@ from src.application.cqrs.computed_views import (
     get_commands_emitting_events,
     get_queries_by_category,
     get_query_metadata,
+    get_query_metadata_by_handler,
     get_statistics,
     validate_registry_consistency,
 )
@@ -70,6 +71,7 @@ __all__ = [
     "get_commands_emitting_events",
     "get_queries_by_category",
     "get_query_metadata",
+    "get_query_metadata_by_handler",
     "get_statistics",
     "validate_registry_consistency",
 ]
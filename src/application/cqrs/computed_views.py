@@ -142,6 +142,29 @@ def get_query_metadata(query_class: type) -> "QueryMetadata | None":
     return None
 
 
+def get_query_metadata_by_handler(handler_class: type) -> "QueryMetadata | None":
+    """Get query metadata for a specific handler class.
+
+    Args:
+        handler_class: The query handler class to look up.
+
+    Returns:
+        QueryMetadata if the handler serves a registered query, None otherwise
+        (e.g., command handlers).
+
+    Example:
+        >>> meta = get_query_metadata_by_handler(GetAccountHandler)
+        >>> meta.cache_policy
+        <CachePolicy.SHORT: 'short'>
+    """
+    from src.application.cqrs.registry import QUERY_REGISTRY
+
+    for meta in QUERY_REGISTRY:
+        if meta.handler_class == handler_class:
+            return meta
+    return None
+
+
 def get_commands_with_result_dto() -> list["CommandMetadata"]:
     """Get all commands that return result DTOs.
 
@@ -0,0 +1,143 @@
+"""Read-through cache decorator for CQRS query handlers.
+
+Wraps a query handler so ``handle(query)`` first consults the query result
+cache and only runs the handler on a miss. Driven by the registry's
+``QueryMetadata.cache_policy`` - the container wraps handlers whose policy is
+not ``CachePolicy.NONE`` (see src/core/container/handler_factory.py).
+
+Behavior:
+    - Hit: return Success(cached DTO) without touching the database
+    - Miss: run the wrapped handler; cache Success values only
+    - Failures are never cached (ownership/not-found stays authoritative)
+    - Cache errors are fail-open (treated as a miss)
+    - Hits/misses recorded per query namespace in CacheMetrics
+
+Reference:
+    - docs/architecture/cqrs-registry.md
+"""
+
+from typing import Any, get_args, get_type_hints
+
+from src.core.result import Result, Success
+from src.domain.protocols.cache_metrics_protocol import CacheMetricsProtocol
+from src.domain.protocols.query_result_cache_protocol import QueryResultCache
+
+
+def resolve_result_type(handler_class: type[Any]) -> type[Any] | None:
+    """Resolve the success DTO type from a handler's ``handle`` annotation.
+
+    Args:
+        handler_class: Query handler class with
+            ``async def handle(self, query) -> Result[DTO, str]``.
+
+    Returns:
+        DTO type, or None if the annotation cannot be resolved.
+
+    Example:
+        >>> resolve_result_type(GetAccountHandler)
+        <class 'AccountResult'>
+    """
+    try:
+        return_type = get_type_hints(handler_class.handle).get("return")
+    except Exception:
+        return None
+
+    args = get_args(return_type)
+    if not args or not isinstance(args[0], type):
+        return None
+    return args[0]
+
+
+class CachedQueryHandler:
+    """Read-through caching decorator around a query handler.
+
+    Exposes the same ``handle(query)`` interface as the wrapped handler, so
+    routers use it transparently.
+
+    Attributes:
+        _handler: Wrapped query handler.
+        _cache: Query result cache.
+        _metrics: Optional metrics tracker.
+        _result_type: Success DTO type used to rebuild cached values.
+        _ttl: Cache TTL in seconds (from the query's CachePolicy).
+        _namespace: Metrics namespace (e.g., "query:get_account").
+
+    Example:
+        >>> handler = CachedQueryHandler(
+        ...     handler=GetAccountHandler(account_repo=repo, connection_repo=conn),
+        ...     cache=get_query_result_cache(),
+        ...     metrics=get_cache_metrics(),
+        ...     result_type=AccountResult,
+        ...     ttl=60,
+        ...     namespace="query:get_account",
+        ... )
+        >>> result = await handler.handle(GetAccount(account_id=..., user_id=...))
+    """
+
+    def __init__(
+        self,
+        *,
+        handler: Any,
+        cache: QueryResultCache,
+        metrics: CacheMetricsProtocol | None,
+        result_type: type[Any],
+        ttl: int,
+        namespace: str,
+    ) -> None:
+        """Initialize caching decorator.
+
+        Args:
+            handler: Query handler to wrap.
+            cache: Query result cache.
+            metrics: Optional metrics tracker.
+            result_type: Success DTO type.
+            ttl: Cache TTL in seconds.
+            namespace: Metrics namespace.
+        """
+        self._handler = handler
+        self._cache = cache
+        self._metrics = metrics
+        self._result_type = result_type
+        self._ttl = ttl
+        self._namespace = namespace
+
+    @property
+    def wrapped(self) -> Any:
+        """The underlying query handler."""
+        return self._handler
+
+    async def handle(self, query: Any) -> Result[Any, Any]:
+        """Return cached result or run the wrapped handler and cache it.
+
+        Args:
+            query: Query dataclass instance.
+
+        Returns:
+            Result from cache (Success) or from the wrapped handler.
+        """
+        try:
+            cached = await self._cache.get(query, self._result_type)
+        except Exception:
+            cached = None
+            if self._metrics:
+                self._metrics.record_error(self._namespace)
+
+        if cached is not None:
+            if self._metrics:
+                self._metrics.record_hit(self._namespace)
+            return Success(value=cached)
+
+        if self._metrics:
+            self._metrics.record_miss(self._namespace)
+
+        result: Result[Any, Any] = await self._handler.handle(query)
+
+        if isinstance(result, Success):
+            try:
+                await self._cache.set(query, result.value, ttl=self._ttl)
+            except Exception:
+                # Fail-open: cache write failure doesn't affect response
+                if self._metrics:
+                    self._metrics.record_error(self._namespace)
+
+        return result
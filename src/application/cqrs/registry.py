@@ -61,6 +61,7 @@ from src.application.commands.session_commands import (
     UpdateSessionActivity,
 )
 from src.application.commands.sync_commands import (
+    RecordBalanceSnapshots,
     SyncAccounts,
     SyncHoldings,
     SyncTransactions,
@@ -92,6 +93,9 @@ from src.application.commands.handlers.import_from_file_handler import (
     ImportFromFileHandler,
 )
 from src.application.commands.handlers.logout_user_handler import LogoutUserHandler
+from src.application.commands.handlers.record_balance_snapshots_handler import (
+    RecordBalanceSnapshotsHandler,
+)
 from src.application.commands.handlers.refresh_access_token_handler import (
     RefreshAccessTokenHandler,
 )
@@ -154,6 +158,7 @@ from src.application.queries.transaction_queries import (
     ListSecurityTransactions,
     ListTransactionsByAccount,
     ListTransactionsByDateRange,
+    ListTransactionsForExport,
 )
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -185,6 +190,7 @@ from src.application.queries.handlers.list_transactions_handler import (
     ListTransactionsByAccountHandler,
     ListTransactionsByDateRangeHandler,
     ListSecurityTransactionsHandler,
+    ListTransactionsForExportHandler,
 )
 from src.application.queries.handlers.get_holding_handler import GetHoldingHandler
 from src.application.queries.handlers.list_holdings_handler import (
@@ -203,6 +209,7 @@ from src.application.dtos import (
     AuthTokens,
     GlobalRotationResult,
     ImportResult,
+    RecordBalanceSnapshotsResult,
     SyncAccountsResult,
     SyncHoldingsResult,
     SyncTransactionsResult,
@@ -211,7 +218,7 @@ from src.application.dtos import (
 
 
 # ═══════════════════════════════════════════════════════════════════════════
-# COMMAND REGISTRY - Single Source of Truth (23 commands)
+# COMMAND REGISTRY - Single Source of Truth (24 commands)
 # ═══════════════════════════════════════════════════════════════════════════
 
 COMMAND_REGISTRY: list[CommandMetadata] = [
@@ -406,7 +413,7 @@ COMMAND_REGISTRY: list[CommandMetadata] = [
         description="Refresh provider credentials after OAuth token refresh",
     ),
     # ═══════════════════════════════════════════════════════════════════════
-    # Data Sync Commands (3 commands)
+    # Data Sync Commands (4 commands)
     # ═══════════════════════════════════════════════════════════════════════
     CommandMetadata(
         command_class=SyncAccounts,
@@ -438,6 +445,16 @@ COMMAND_REGISTRY: list[CommandMetadata] = [
         requires_transaction=True,
         description="Sync holdings from provider connection",
     ),
+    CommandMetadata(
+        command_class=RecordBalanceSnapshots,
+        handler_class=RecordBalanceSnapshotsHandler,
+        category=CQRSCategory.DATA_SYNC,
+        has_result_dto=True,
+        result_dto_class=RecordBalanceSnapshotsResult,
+        emits_events=False,
+        requires_transaction=True,
+        description="Record balance snapshots for all active accounts",
+    ),
     # ═══════════════════════════════════════════════════════════════════════
     # Import Commands (1 command)
     # ═══════════════════════════════════════════════════════════════════════
@@ -455,7 +472,7 @@ COMMAND_REGISTRY: list[CommandMetadata] = [
 
 
 # ═══════════════════════════════════════════════════════════════════════════
-# QUERY REGISTRY - Single Source of Truth (18 queries)
+# QUERY REGISTRY - Single Source of Truth (19 queries)
 # ═══════════════════════════════════════════════════════════════════════════
 
 QUERY_REGISTRY: list[QueryMetadata] = [
@@ -525,7 +542,7 @@ QUERY_REGISTRY: list[QueryMetadata] = [
         description="List all accounts for a user across all connections",
     ),
     # ═══════════════════════════════════════════════════════════════════════
-    # Transaction Queries (4 queries)
+    # Transaction Queries (5 queries)
     # ═══════════════════════════════════════════════════════════════════════
     QueryMetadata(
         query_class=GetTransaction,
@@ -559,6 +576,14 @@ QUERY_REGISTRY: list[QueryMetadata] = [
         cache_policy=CachePolicy.SHORT,
         description="List transactions for a specific security/symbol",
     ),
+    QueryMetadata(
+        query_class=ListTransactionsForExport,
+        handler_class=ListTransactionsForExportHandler,
+        category=CQRSCategory.DATA_SYNC,
+        is_paginated=False,  # Streamed, never materialized
+        cache_policy=CachePolicy.NONE,  # Result is a one-shot stream
+        description="Stream all transactions for an account (NDJSON/CSV export)",
+    ),
     # ═══════════════════════════════════════════════════════════════════════
     # Balance Snapshot Queries (4 queries)
     # ═══════════════════════════════════════════════════════════════════════
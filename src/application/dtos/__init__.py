@@ -29,7 +29,9 @@ from src.application.dtos.auth_dtos import (
 )
 from src.application.dtos.import_dtos import ImportResult
 from src.application.dtos.sync_dtos import (
+    AccountSyncTiming,
     BalanceChange,
+    RecordBalanceSnapshotsResult,
     SyncAccountsResult,
     SyncHoldingsResult,
     SyncTransactionsResult,
@@ -42,10 +44,12 @@ __all__ = [
     "GlobalRotationResult",
     "UserRotationResult",
     # Sync DTOs
+    "AccountSyncTiming",
     "BalanceChange",
     "SyncAccountsResult",
     "SyncTransactionsResult",
     "SyncHoldingsResult",
+    "RecordBalanceSnapshotsResult",
     # Import DTOs
     "ImportResult",
 ]
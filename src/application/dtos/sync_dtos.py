@@ -7,7 +7,9 @@ DTOs:
     - SyncAccountsResult: Result from SyncAccounts command
     - SyncTransactionsResult: Result from SyncTransactions command
     - SyncHoldingsResult: Result from SyncHoldings command
+    - RecordBalanceSnapshotsResult: Result from RecordBalanceSnapshots command
     - BalanceChange: Tracks balance changes for portfolio events
+    - AccountSyncTiming: Per-account provider fetch timing
 
 Reference:
     - docs/architecture/cqrs.md (DTOs section)
@@ -37,6 +39,26 @@ class BalanceChange:
     currency: str
 
 
+@dataclass
+class AccountSyncTiming:
+    """Provider fetch timing for a single account during sync.
+
+    Attributes:
+        account_id: Account that was fetched.
+        duration_ms: Wall time of the fetch, including limiter waits and
+            Retry-After pauses.
+        attempts: Provider calls made (more than 1 after rate limiting).
+        fetched: Records returned by the provider (0 on failure).
+        error: Provider error message if the fetch failed, else None.
+    """
+
+    account_id: UUID
+    duration_ms: float
+    attempts: int
+    fetched: int
+    error: str | None = None
+
+
 @dataclass
 class SyncAccountsResult:
     """Result of account sync operation.
@@ -48,6 +70,7 @@ class SyncAccountsResult:
         errors: Number of accounts that failed to sync.
         message: Human-readable summary.
         balance_changes: List of balance changes for portfolio events.
+        snapshots_captured: Balance snapshots recorded (after dedupe).
     """
 
     created: int
@@ -56,6 +79,7 @@ class SyncAccountsResult:
     errors: int
     message: str
     balance_changes: list[BalanceChange] = field(default_factory=list)
+    snapshots_captured: int = 0
 
 
 @dataclass
@@ -69,6 +93,7 @@ class SyncTransactionsResult:
         errors: Number of transactions that failed to sync.
         accounts_synced: Number of accounts processed.
         message: Human-readable summary.
+        account_timings: Provider fetch timing per account (account order).
     """
 
     created: int
@@ -77,6 +102,7 @@ class SyncTransactionsResult:
     errors: int
     accounts_synced: int
     message: str
+    account_timings: list[AccountSyncTiming] = field(default_factory=list)
 
 
 @dataclass
@@ -90,6 +116,7 @@ class SyncHoldingsResult:
         deactivated: Number of holdings deactivated (no longer in provider).
         errors: Number of holdings that failed to sync.
         message: Human-readable summary.
+        snapshots_captured: Balance snapshots recorded (0 or 1, after dedupe).
     """
 
     created: int
@@ -98,3 +125,19 @@ class SyncHoldingsResult:
     deactivated: int
     errors: int
     message: str
+    snapshots_captured: int = 0
+
+
+@dataclass
+class RecordBalanceSnapshotsResult:
+    """Result of scheduled balance snapshot capture.
+
+    Attributes:
+        accounts_scanned: Number of active accounts examined.
+        snapshots_captured: Snapshots recorded (after dedupe).
+        message: Human-readable summary.
+    """
+
+    accounts_scanned: int
+    snapshots_captured: int
+    message: str
@@ -38,6 +38,7 @@ class ApplicationErrorCode(Enum):
     CONFLICT = "conflict"
     RATE_LIMIT_EXCEEDED = "rate_limit_exceeded"
     EXTERNAL_SERVICE_ERROR = "external_service_error"
+    SERVICE_UNAVAILABLE = "service_unavailable"
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
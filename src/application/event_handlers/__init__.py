@@ -14,5 +14,13 @@ See: docs/architecture/domain-events.md Section 5.2 for pattern documentation.
 from src.application.event_handlers.portfolio_event_handler import (
     PortfolioEventHandler,
 )
+from src.application.event_handlers.query_cache_event_handler import (
+    QUERY_CACHE_INVALIDATION_EVENTS,
+    QueryCacheEventHandler,
+)
 
-__all__ = ["PortfolioEventHandler"]
+__all__ = [
+    "QUERY_CACHE_INVALIDATION_EVENTS",
+    "PortfolioEventHandler",
+    "QueryCacheEventHandler",
+]
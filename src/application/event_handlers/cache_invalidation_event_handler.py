@@ -0,0 +1,133 @@
+"""Local cache invalidation handler.
+
+Drops per-process (L1) cache entries in every worker when domain events
+make them stale without going through a cache write: token rotation (user
+and global) and provider connection changes.
+
+Session revocation and role changes invalidate at the write site
+(session cache, authorization adapter) and need no subscription here.
+
+Architecture:
+    - Application layer (coordination)
+    - App-scoped singleton (created once at startup)
+    - Depends only on CacheInvalidationProtocol and ProviderConnectionCache
+
+Reference:
+    - docs/architecture/domain-events.md
+    - docs/architecture/cache-keys.md
+"""
+
+from src.domain.events.auth_events import (
+    GlobalTokenRotationSucceeded,
+    UserTokenRotationSucceeded,
+)
+from src.domain.events.base_event import DomainEvent
+from src.domain.events.provider_events import (
+    ProviderDisconnectionSucceeded,
+    ProviderTokenRefreshFailed,
+    ProviderTokenRefreshSucceeded,
+)
+from src.domain.protocols.cache_invalidation_protocol import (
+    CacheInvalidationProtocol,
+)
+from src.domain.protocols.logger_protocol import LoggerProtocol
+from src.domain.protocols.provider_connection_cache_protocol import (
+    ProviderConnectionCache,
+)
+
+PROVIDER_CONNECTION_CHANGE_EVENTS: tuple[type[DomainEvent], ...] = (
+    ProviderDisconnectionSucceeded,
+    ProviderTokenRefreshSucceeded,
+    ProviderTokenRefreshFailed,
+)
+"""Domain events that make a cached provider connection stale."""
+
+
+class CacheInvalidationEventHandler:
+    """Event handler that invalidates local cache tiers across workers.
+
+    Example:
+        >>> handler = CacheInvalidationEventHandler(
+        ...     invalidation=get_cache_invalidation_bus(),
+        ...     connection_cache=get_provider_connection_cache(),
+        ...     logger=get_logger(),
+        ... )
+        >>> event_bus.subscribe(
+        ...     UserTokenRotationSucceeded, handler.handle_user_token_rotation
+        ... )
+    """
+
+    def __init__(
+        self,
+        invalidation: CacheInvalidationProtocol,
+        connection_cache: ProviderConnectionCache,
+        logger: LoggerProtocol,
+    ) -> None:
+        """Initialize handler with dependencies.
+
+        Args:
+            invalidation: Cross-process local cache invalidation.
+            connection_cache: Provider connection cache (Redis + L1).
+            logger: Logger protocol implementation from container.
+        """
+        self._invalidation = invalidation
+        self._connection_cache = connection_cache
+        self._logger = logger
+
+    async def handle_user_token_rotation(
+        self, event: UserTokenRotationSucceeded
+    ) -> None:
+        """Drop the user's local entries (sessions, connections, permissions).
+
+        Args:
+            event: UserTokenRotationSucceeded with user_id.
+        """
+        try:
+            await self._invalidation.invalidate_user(event.user_id)
+        except Exception as e:
+            self._logger.warning(
+                "local_cache_invalidation_failed",
+                user_id=str(event.user_id),
+                event_type=type(event).__name__,
+                error=str(e),
+            )
+
+    async def handle_global_token_rotation(
+        self, event: GlobalTokenRotationSucceeded
+    ) -> None:
+        """Drop every local entry in every worker.
+
+        Args:
+            event: GlobalTokenRotationSucceeded event.
+        """
+        try:
+            await self._invalidation.invalidate_all()
+        except Exception as e:
+            self._logger.warning(
+                "local_cache_invalidation_failed",
+                event_type=type(event).__name__,
+                error=str(e),
+            )
+
+    async def handle_provider_connection_changed(self, event: DomainEvent) -> None:
+        """Drop a changed provider connection from Redis and every L1 tier.
+
+        Fail-open: cache errors are logged and never propagate to the
+        publisher (entries still expire by TTL).
+
+        Args:
+            event: Domain event carrying connection_id.
+        """
+        connection_id = getattr(event, "connection_id", None)
+        if connection_id is None:
+            return
+
+        try:
+            await self._connection_cache.delete(connection_id)
+        except Exception as e:
+            self._logger.warning(
+                "provider_connection_cache_invalidation_failed",
+                connection_id=str(connection_id),
+                event_type=type(event).__name__,
+                error=str(e),
+            )
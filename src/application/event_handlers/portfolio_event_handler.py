@@ -12,16 +12,20 @@ Architecture:
 Pattern:
     This is a REACTIVE AGGREGATION handler:
     1. Listens to AccountBalanceUpdated and AccountHoldingsUpdated
-    2. Queries repository to calculate current net worth
-    3. Compares with cached previous value
-    4. Emits PortfolioNetWorthRecalculated if changed
+    2. Coalesces events per user within a short window (one sync over
+       12 accounts emits 12 events but triggers one recalculation)
+    3. Queries repository to calculate current net worth (single query)
+    4. Compares with cached previous value
+    5. Emits PortfolioNetWorthRecalculated if changed
 
 Reference:
     - docs/architecture/domain-events-architecture.md
     - Implementation Plan: Issue #257, Phase 6
 """
 
+import asyncio
 from decimal import Decimal
+from typing import Any
 from uuid import UUID
 
 from uuid_extensions import uuid7
@@ -73,6 +77,7 @@ class PortfolioEventHandler:
         cache: CacheProtocol,
         event_bus: EventBusProtocol,
         logger: LoggerProtocol,
+        coalesce_window_seconds: float = 0.0,
     ) -> None:
         """Initialize handler with dependencies.
 
@@ -81,11 +86,22 @@ class PortfolioEventHandler:
             cache: Cache for storing previous net worth values.
             event_bus: Event bus for publishing derived events and getting session context.
             logger: Logger protocol implementation from container.
+            coalesce_window_seconds: Delay after a user's first event during
+                which further events for that user share one recalculation.
+                0 recalculates inline for every event (no coalescing).
         """
         self._database = database
         self._cache = cache
         self._event_bus = event_bus
         self._logger = logger
+        self._coalesce_window = coalesce_window_seconds
+        # user_id -> scheduled recalculation (still inside its window)
+        self._pending: dict[UUID, asyncio.Task[None]] = {}
+        # Strong references to scheduled/running tasks (asyncio keeps weak refs)
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._events_received = 0
+        self._events_coalesced = 0
+        self._recalculations = 0
 
     async def handle_balance_updated(self, event: AccountBalanceUpdated) -> None:
         """React to balance change, recalculate net worth.
@@ -99,7 +115,7 @@ class PortfolioEventHandler:
             account_id=str(event.account_id),
             delta=str(event.delta),
         )
-        await self._recalculate_networth(event.user_id)
+        await self._schedule_recalculation(event.user_id)
 
     async def handle_holdings_updated(self, event: AccountHoldingsUpdated) -> None:
         """React to holdings change, recalculate net worth.
@@ -113,18 +129,83 @@ class PortfolioEventHandler:
             account_id=str(event.account_id),
             holdings_count=event.holdings_count,
         )
-        await self._recalculate_networth(event.user_id)
+        await self._schedule_recalculation(event.user_id)
+
+    async def flush(self) -> None:
+        """Run scheduled recalculations now and wait for in-flight ones.
+
+        Used at shutdown (and in tests) so coalesced events are not lost.
+        """
+        pending = list(self._pending.items())
+        self._pending.clear()
+        for _, task in pending:
+            task.cancel()
+        running = [task for task in self._tasks if not task.done()]
+        await asyncio.gather(*running, return_exceptions=True)
+        for user_id, _ in pending:
+            await self._recalculate_networth(user_id)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get coalescing statistics.
+
+        Returns:
+            Events received, events coalesced into an already scheduled
+            recalculation, recalculations run, and users currently pending.
+        """
+        return {
+            "events_received": self._events_received,
+            "events_coalesced": self._events_coalesced,
+            "recalculations": self._recalculations,
+            "pending_users": len(self._pending),
+        }
+
+    async def _schedule_recalculation(self, user_id: UUID) -> None:
+        """Schedule (or join) a recalculation for a user.
+
+        The first event for a user starts a window; events arriving before it
+        closes are counted and coalesced. Events arriving while the
+        recalculation runs start a new window, so the final value is never
+        older than the last event.
+
+        Args:
+            user_id: User whose net worth changed.
+        """
+        self._events_received += 1
+        if self._coalesce_window <= 0:
+            await self._recalculate_networth(user_id)
+            return
+
+        if user_id in self._pending:
+            self._events_coalesced += 1
+            return
+
+        task = asyncio.create_task(self._recalculate_after_window(user_id))
+        self._pending[user_id] = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _recalculate_after_window(self, user_id: UUID) -> None:
+        """Wait out the coalescing window, then recalculate once.
+
+        Args:
+            user_id: User whose net worth to recalculate.
+        """
+        await asyncio.sleep(self._coalesce_window)
+        # Close the window before querying: later events schedule a new run
+        self._pending.pop(user_id, None)
+        await self._recalculate_networth(user_id)
 
     async def _recalculate_networth(self, user_id: UUID) -> None:
         """Calculate current net worth and emit event if changed.
 
-        Creates a database session, queries repository for current total,
-        compares with cached previous value, and emits PortfolioNetWorthRecalculated
-        if the value changed.
+        Creates a database session, queries repository for current total and
+        account count, compares with cached previous value, and emits
+        PortfolioNetWorthRecalculated if the value changed.
 
         Args:
             user_id: User whose net worth to recalculate.
         """
+        self._recalculations += 1
         try:
             # Create session and repository for this query
             async with self._database.get_session() as session:
@@ -134,9 +215,9 @@ class PortfolioEventHandler:
 
                 account_repo = AccountRepository(session=session)
 
-                # Query current total from repository
-                current = await account_repo.sum_balances_for_user(user_id)
-                account_count = await account_repo.count_for_user(user_id)
+                # Query current total and account count (one round trip)
+                summary = await account_repo.summarize_balances_for_user(user_id)
+                current, account_count = summary
 
             # Get previous from cache (fail-open if cache unavailable)
             cache_key = f"portfolio:networth:{user_id}"
@@ -0,0 +1,114 @@
+"""Query cache invalidation handler.
+
+Drops a user's cached CQRS query results when domain events signal that
+their data changed, so registry CachePolicy caching (CachedQueryHandler)
+never serves reads older than the latest sync, import, or connection change.
+
+Architecture:
+    - Application layer (coordination)
+    - App-scoped singleton (created once at startup)
+    - Subscribes to QUERY_CACHE_INVALIDATION_EVENTS (all carry user_id)
+    - Depends only on QueryResultCache protocol
+
+Reference:
+    - docs/architecture/domain-events.md
+    - docs/architecture/cqrs-registry.md
+"""
+
+from src.domain.events.base_event import DomainEvent
+from src.domain.events.data_events import (
+    AccountSyncSucceeded,
+    FileImportSucceeded,
+    HoldingsSyncSucceeded,
+    TransactionSyncSucceeded,
+)
+from src.domain.events.portfolio_events import (
+    AccountBalanceUpdated,
+    AccountHoldingsUpdated,
+)
+from src.domain.events.provider_events import (
+    ProviderConnectionSucceeded,
+    ProviderDisconnectionSucceeded,
+)
+from src.domain.events.session_events import (
+    AllSessionsRevokedEvent,
+    SessionCreatedEvent,
+    SessionEvictedEvent,
+    SessionRevokedEvent,
+)
+from src.domain.protocols.logger_protocol import LoggerProtocol
+from src.domain.protocols.query_result_cache_protocol import QueryResultCache
+
+QUERY_CACHE_INVALIDATION_EVENTS: tuple[type[DomainEvent], ...] = (
+    # Data sync / import
+    AccountSyncSucceeded,
+    TransactionSyncSucceeded,
+    HoldingsSyncSucceeded,
+    FileImportSucceeded,
+    # Portfolio changes
+    AccountBalanceUpdated,
+    AccountHoldingsUpdated,
+    # Provider connections
+    ProviderConnectionSucceeded,
+    ProviderDisconnectionSucceeded,
+    # Session lifecycle
+    SessionCreatedEvent,
+    SessionRevokedEvent,
+    SessionEvictedEvent,
+    AllSessionsRevokedEvent,
+)
+"""Domain events that make a user's cached query results stale."""
+
+
+class QueryCacheEventHandler:
+    """Event handler that invalidates a user's cached query results.
+
+    Example:
+        >>> handler = QueryCacheEventHandler(
+        ...     query_cache=get_query_result_cache(),
+        ...     logger=get_logger(),
+        ... )
+        >>> for event_class in QUERY_CACHE_INVALIDATION_EVENTS:
+        ...     event_bus.subscribe(event_class, handler.handle_user_data_changed)
+    """
+
+    def __init__(self, query_cache: QueryResultCache, logger: LoggerProtocol) -> None:
+        """Initialize handler with dependencies.
+
+        Args:
+            query_cache: Query result cache to invalidate.
+            logger: Logger protocol implementation from container.
+        """
+        self._query_cache = query_cache
+        self._logger = logger
+
+    async def handle_user_data_changed(self, event: DomainEvent) -> None:
+        """Invalidate cached query results for the event's user.
+
+        Fail-open: cache errors are logged and never propagate to the
+        publisher (entries still expire by TTL).
+
+        Args:
+            event: Domain event carrying user_id.
+        """
+        user_id = getattr(event, "user_id", None)
+        if user_id is None:
+            return
+
+        try:
+            removed = await self._query_cache.invalidate_user(user_id)
+        except Exception as e:
+            self._logger.warning(
+                "query_cache_invalidation_failed",
+                user_id=str(user_id),
+                event_type=type(event).__name__,
+                error=str(e),
+            )
+            return
+
+        self._logger.debug(
+            "query_cache_invalidated",
+            user_id=str(user_id),
+            event_type=type(event).__name__,
+            removed=removed,
+        )
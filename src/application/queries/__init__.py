@@ -22,6 +22,7 @@ from src.application.queries.transaction_queries import (
     ListSecurityTransactions,
     ListTransactionsByAccount,
     ListTransactionsByDateRange,
+    ListTransactionsForExport,
 )
 from src.application.queries.balance_snapshot_queries import (
     GetBalanceHistory,
@@ -51,6 +52,7 @@ __all__ = [
     "ListTransactionsByAccount",
     "ListTransactionsByDateRange",
     "ListSecurityTransactions",
+    "ListTransactionsForExport",
     # Balance snapshot queries (F3.7)
     "GetBalanceHistory",
     "GetLatestBalanceSnapshots",
@@ -23,7 +23,8 @@ class GetBalanceHistory:
     """Get balance history for an account within a date range.
 
     Used for portfolio charting and performance tracking.
-    Returns snapshots ordered by captured_at ascending (oldest first).
+    Returns snapshots ordered by captured_at ascending (oldest first), or
+    one aggregated bucket per period when granularity is set.
 
     Attributes:
         account_id: Account whose balance history to retrieve.
@@ -31,6 +32,8 @@ class GetBalanceHistory:
         start_date: Start of date range (inclusive).
         end_date: End of date range (inclusive).
         source: Optional filter by snapshot source.
+        granularity: Optional bucket size (hour, day, week, month).
+            None returns raw snapshots.
 
     Example:
         >>> query = GetBalanceHistory(
@@ -47,6 +50,7 @@ class GetBalanceHistory:
     start_date: datetime
     end_date: datetime
     source: str | None = None
+    granularity: str | None = None
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -101,19 +105,23 @@ class GetUserBalanceHistory:
     """Get aggregate balance history across all user accounts.
 
     Used for total portfolio value charting over time.
-    Returns snapshots from all accounts within date range.
+    Returns snapshots from all accounts within date range, or balances
+    summed across accounts per bucket when granularity is set.
 
     Attributes:
         user_id: User whose portfolio history to retrieve.
         start_date: Start of date range (inclusive).
         end_date: End of date range (inclusive).
         source: Optional filter by snapshot source.
+        granularity: Optional bucket size (hour, day, week, month).
+            None returns raw snapshots from every account.
 
     Example:
         >>> query = GetUserBalanceHistory(
         ...     user_id=user_id,
         ...     start_date=datetime(2024, 1, 1),
         ...     end_date=datetime(2024, 12, 31),
+        ...     granularity="week",
         ... )
         >>> result = await handler.handle(query)
     """
@@ -122,3 +130,4 @@ class GetUserBalanceHistory:
     start_date: datetime
     end_date: datetime
     source: str | None = None
+    granularity: str | None = None
@@ -8,12 +8,14 @@ Architecture:
 - Returns Result[DTO, str] (explicit error handling)
 - NO domain events (queries are side-effect free)
 - Account-scoped and user-scoped queries
+- Optional granularity returns database-computed buckets instead of raw
+  snapshots
 
 Reference:
     - docs/architecture/cqrs-pattern.md
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
@@ -26,9 +28,13 @@ from src.application.queries.balance_snapshot_queries import (
 )
 from src.core.result import Failure, Result, Success
 from src.domain.entities.balance_snapshot import BalanceSnapshot
+from src.domain.enums.balance_granularity import BalanceGranularity
 from src.domain.enums.snapshot_source import SnapshotSource
 from src.domain.protocols.account_repository import AccountRepository
-from src.domain.protocols.balance_snapshot_repository import BalanceSnapshotRepository
+from src.domain.protocols.balance_snapshot_repository import (
+    BalanceBucket,
+    BalanceSnapshotRepository,
+)
 from src.domain.protocols.provider_connection_repository import (
     ProviderConnectionRepository,
 )
@@ -67,20 +73,52 @@ class BalanceSnapshotResult:
     change_percent: float | None = None
 
 
+@dataclass
+class BalanceBucketResult:
+    """Single balance history bucket DTO for API responses.
+
+    Attributes:
+        bucket_start: Start of the bucket (UTC).
+        currency: ISO 4217 currency code.
+        open_balance: Balance at the first snapshot in the bucket.
+        close_balance: Balance at the last snapshot in the bucket.
+        min_balance: Lowest balance in the bucket (nullable).
+        max_balance: Highest balance in the bucket (nullable).
+        snapshot_count: Number of snapshots in the bucket.
+        account_count: Number of accounts contributing to the bucket.
+        change_amount: Close change from previous bucket (nullable).
+        change_percent: Percentage close change (nullable).
+    """
+
+    bucket_start: datetime
+    currency: str
+    open_balance: Decimal
+    close_balance: Decimal
+    min_balance: Decimal | None
+    max_balance: Decimal | None
+    snapshot_count: int
+    account_count: int
+    change_amount: Decimal | None = None
+    change_percent: float | None = None
+
+
 @dataclass
 class BalanceHistoryResult:
     """List of balance snapshots for charting.
 
-    Includes computed metrics for change tracking.
+    Includes computed metrics for change tracking. When a granularity was
+    requested, buckets holds the aggregated series and snapshots is empty.
 
     Attributes:
         snapshots: List of snapshot DTOs (ordered by time).
-        total_count: Total number of snapshots in range.
+        total_count: Total number of snapshots (or buckets) in range.
         start_balance: Balance at start of period.
         end_balance: Balance at end of period.
         total_change_amount: Change over period.
         total_change_percent: Percentage change over period.
         currency: Currency of the values.
+        granularity: Bucket size of buckets (None for raw snapshots).
+        buckets: List of bucket DTOs (ordered by bucket_start).
     """
 
     snapshots: list[BalanceSnapshotResult]
@@ -90,6 +128,8 @@ class BalanceHistoryResult:
     total_change_amount: Decimal | None
     total_change_percent: float | None
     currency: str | None
+    granularity: str | None = None
+    buckets: list[BalanceBucketResult] = field(default_factory=list)
 
 
 @dataclass
@@ -117,13 +157,58 @@ class BalanceSnapshotQueryError:
     NOT_OWNED_BY_USER = "Account not owned by user"
     INVALID_DATE_RANGE = "Start date must be before end date"
     INVALID_SOURCE = "Invalid snapshot source"
+    INVALID_GRANULARITY = "Invalid granularity (expected hour, day, week or month)"
+
+
+def _parse_granularity(value: str | None) -> Result[BalanceGranularity | None, str]:
+    """Parse an optional granularity string from a query."""
+    if value is None:
+        return Success(value=None)
+    try:
+        return Success(value=BalanceGranularity(value))
+    except ValueError:
+        return Failure(error=BalanceSnapshotQueryError.INVALID_GRANULARITY)
+
+
+def _bucket_results(buckets: list[BalanceBucket]) -> list[BalanceBucketResult]:
+    """Convert buckets to DTOs with close-to-close change per currency."""
+    results: list[BalanceBucketResult] = []
+    prev_close: dict[str, Decimal] = {}
+
+    for bucket in buckets:
+        change_amount: Decimal | None = None
+        change_percent: float | None = None
+        previous = prev_close.get(bucket.currency)
+        if previous is not None:
+            change_amount = bucket.close_balance - previous
+            if previous != 0:
+                change_percent = float((change_amount / previous) * 100)
+        prev_close[bucket.currency] = bucket.close_balance
+
+        results.append(
+            BalanceBucketResult(
+                bucket_start=bucket.bucket_start,
+                currency=bucket.currency,
+                open_balance=bucket.open_balance,
+                close_balance=bucket.close_balance,
+                min_balance=bucket.min_balance,
+                max_balance=bucket.max_balance,
+                snapshot_count=bucket.snapshot_count,
+                account_count=bucket.account_count,
+                change_amount=change_amount,
+                change_percent=change_percent,
+            )
+        )
+
+    return results
 
 
 class GetBalanceHistoryHandler:
     """Handler for GetBalanceHistory query.
 
     Retrieves balance history for an account within a date range.
-    Returns snapshots ordered chronologically for charting.
+    Returns snapshots ordered chronologically for charting, or buckets
+    aggregated by the repository when a granularity is given.
 
     Dependencies:
         - BalanceSnapshotRepository: For snapshot retrieval
@@ -166,6 +251,12 @@ class GetBalanceHistoryHandler:
             except ValueError:
                 return Failure(error=BalanceSnapshotQueryError.INVALID_SOURCE)
 
+        # Validate granularity if provided
+        granularity_result = _parse_granularity(query.granularity)
+        if isinstance(granularity_result, Failure):
+            return granularity_result
+        granularity = granularity_result.value
+
         # Verify ownership
         ownership_result = await self._verify_account_ownership(
             query.account_id, query.user_id
@@ -173,6 +264,17 @@ class GetBalanceHistoryHandler:
         if isinstance(ownership_result, Failure):
             return ownership_result
 
+        # Bucketed history (aggregated in the database)
+        if granularity is not None:
+            buckets = await self._snapshot_repo.find_buckets_by_account_id(
+                account_id=query.account_id,
+                start_date=query.start_date,
+                end_date=query.end_date,
+                granularity=granularity,
+                source=source,
+            )
+            return Success(value=self._build_bucket_result(buckets, granularity))
+
         # Fetch snapshots
         snapshots = await self._snapshot_repo.find_by_account_id_in_range(
             account_id=query.account_id,
@@ -242,6 +344,44 @@ class GetBalanceHistoryHandler:
             currency=first.currency,
         )
 
+    def _build_bucket_result(
+        self, buckets: list[BalanceBucket], granularity: BalanceGranularity
+    ) -> BalanceHistoryResult:
+        """Build BalanceHistoryResult from an account's buckets."""
+        if not buckets:
+            return BalanceHistoryResult(
+                snapshots=[],
+                total_count=0,
+                start_balance=None,
+                end_balance=None,
+                total_change_amount=None,
+                total_change_percent=None,
+                currency=None,
+                granularity=granularity.value,
+            )
+
+        # Period summary from first open to last close
+        first = buckets[0]
+        last = buckets[-1]
+        total_change: Decimal | None = None
+        total_percent: float | None = None
+        if first.currency == last.currency:
+            total_change = last.close_balance - first.open_balance
+            if first.open_balance != 0:
+                total_percent = float((total_change / first.open_balance) * 100)
+
+        return BalanceHistoryResult(
+            snapshots=[],
+            total_count=len(buckets),
+            start_balance=first.open_balance,
+            end_balance=last.close_balance,
+            total_change_amount=total_change,
+            total_change_percent=total_percent,
+            currency=last.currency,
+            granularity=granularity.value,
+            buckets=_bucket_results(buckets),
+        )
+
     def _snapshot_to_dto(
         self,
         snapshot: BalanceSnapshot,
@@ -460,7 +600,8 @@ class GetUserBalanceHistoryHandler:
     """Handler for GetUserBalanceHistory query.
 
     Retrieves balance history across all user accounts.
-    Used for aggregate portfolio charting.
+    Used for aggregate portfolio charting. With a granularity, balances are
+    summed across accounts per bucket by the repository.
 
     Dependencies:
         - BalanceSnapshotRepository: For snapshot retrieval
@@ -479,7 +620,8 @@ class GetUserBalanceHistoryHandler:
             query: GetUserBalanceHistory query with user_id and date range.
 
         Returns:
-            Success(BalanceHistoryResult): Snapshots across all accounts.
+            Success(BalanceHistoryResult): Snapshots (or summed buckets)
+                across all accounts.
             Failure(error): Invalid query parameters.
         """
         # Validate date range
@@ -494,6 +636,36 @@ class GetUserBalanceHistoryHandler:
             except ValueError:
                 return Failure(error=BalanceSnapshotQueryError.INVALID_SOURCE)
 
+        # Validate granularity if provided
+        granularity_result = _parse_granularity(query.granularity)
+        if isinstance(granularity_result, Failure):
+            return granularity_result
+        granularity = granularity_result.value
+
+        # Bucketed totals (summed across accounts in the database)
+        if granularity is not None:
+            buckets = await self._snapshot_repo.find_buckets_by_user_id(
+                user_id=query.user_id,
+                start_date=query.start_date,
+                end_date=query.end_date,
+                granularity=granularity,
+                source=source,
+            )
+            currencies = {bucket.currency for bucket in buckets}
+            return Success(
+                value=BalanceHistoryResult(
+                    snapshots=[],
+                    total_count=len(buckets),
+                    start_balance=None,
+                    end_balance=None,
+                    total_change_amount=None,
+                    total_change_percent=None,
+                    currency=currencies.pop() if len(currencies) == 1 else None,
+                    granularity=granularity.value,
+                    buckets=_bucket_results(buckets),
+                )
+            )
+
         # Fetch snapshots across all accounts
         snapshots = await self._snapshot_repo.find_by_user_id_in_range(
             user_id=query.user_id,
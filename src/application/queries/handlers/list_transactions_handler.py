@@ -13,19 +13,26 @@ Handlers:
     1. ListTransactionsByAccountHandler: List all transactions for an account
     2. ListTransactionsByDateRangeHandler: Filter by date range
     3. ListSecurityTransactionsHandler: Filter by security symbol (trades only)
+    4. ListTransactionsForExportHandler: Stream all transactions for export
 
 Reference:
     - docs/architecture/cqrs-pattern.md
     - docs/architecture/transaction-domain-model.md
 """
 
+import base64
+import binascii
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from datetime import date
+from uuid import UUID
 
 from src.application.queries.handlers.get_transaction_handler import TransactionResult
 from src.application.queries.transaction_queries import (
     ListSecurityTransactions,
     ListTransactionsByAccount,
     ListTransactionsByDateRange,
+    ListTransactionsForExport,
 )
 from src.core.result import Failure, Result, Success
 from src.domain.entities.transaction import Transaction
@@ -33,7 +40,10 @@ from src.domain.protocols.account_repository import AccountRepository
 from src.domain.protocols.provider_connection_repository import (
     ProviderConnectionRepository,
 )
-from src.domain.protocols.transaction_repository import TransactionRepository
+from src.domain.protocols.transaction_repository import (
+    TransactionCursor,
+    TransactionRepository,
+)
 from src.domain.enums.transaction_type import TransactionType
 
 
@@ -47,11 +57,13 @@ class TransactionListResult:
         transactions: List of transaction DTOs.
         total_count: Total count of transactions (for pagination).
         has_more: True if more results available after current page.
+        next_cursor: Cursor for the next page (None on the last page).
     """
 
     transactions: list[TransactionResult]
     total_count: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 class ListTransactionsError:
@@ -62,6 +74,41 @@ class ListTransactionsError:
     NOT_OWNED_BY_USER = "Account not owned by user"
     INVALID_DATE_RANGE = "Start date must be before end date"
     INVALID_TRANSACTION_TYPE = "Invalid transaction type"
+    INVALID_CURSOR = "Invalid pagination cursor"
+
+
+def encode_transaction_cursor(cursor: TransactionCursor) -> str:
+    """Encode a keyset position as an opaque, URL-safe cursor.
+
+    Args:
+        cursor: Position of the last transaction of a page.
+
+    Returns:
+        Cursor string for the next page request.
+    """
+    raw = f"{cursor.transaction_date.isoformat()}|{cursor.transaction_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_transaction_cursor(cursor: str) -> TransactionCursor | None:
+    """Decode a cursor produced by encode_transaction_cursor().
+
+    Args:
+        cursor: Cursor string from a previous page.
+
+    Returns:
+        Keyset position, or None if the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        date_part, id_part = raw.split("|")
+        return TransactionCursor(
+            transaction_date=date.fromisoformat(date_part),
+            transaction_id=UUID(id_part),
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
 
 
 def _map_transaction_to_dto(transaction: Transaction) -> TransactionResult:
@@ -172,34 +219,72 @@ class ListTransactionsByAccountHandler:
         if connection.user_id != query.user_id:
             return Failure(error=ListTransactionsError.NOT_OWNED_BY_USER)
 
-        # Fetch transactions with filters
+        # Convert string to TransactionType enum
+        transaction_type_enum: TransactionType | None = None
         if query.transaction_type is not None:
-            # Convert string to TransactionType enum
             try:
                 transaction_type_enum = TransactionType(query.transaction_type)
             except ValueError:
                 return Failure(error=ListTransactionsError.INVALID_TRANSACTION_TYPE)
-            transactions = await self._transaction_repo.find_by_account_and_type(
-                account_id=query.account_id,
-                transaction_type=transaction_type_enum,
-                limit=query.limit,
+
+        # Legacy OFFSET paging (only when no cursor is given)
+        if query.offset > 0 and query.cursor is None:
+            if transaction_type_enum is not None:
+                transactions = await self._transaction_repo.find_by_account_and_type(
+                    account_id=query.account_id,
+                    transaction_type=transaction_type_enum,
+                    limit=query.limit,
+                )
+            else:
+                transactions = await self._transaction_repo.find_by_account_id(
+                    account_id=query.account_id,
+                    limit=query.limit,
+                    offset=query.offset,
+                )
+            dtos = [_map_transaction_to_dto(t) for t in transactions]
+            return Success(
+                value=TransactionListResult(
+                    transactions=dtos,
+                    total_count=len(dtos),
+                    has_more=len(transactions) == query.limit,
+                )
             )
-        else:
-            transactions = await self._transaction_repo.find_by_account_id(
-                account_id=query.account_id, limit=query.limit, offset=query.offset
+
+        # Keyset paging: fetch one extra row to know whether a next page exists
+        after: TransactionCursor | None = None
+        if query.cursor is not None:
+            after = decode_transaction_cursor(query.cursor)
+            if after is None:
+                return Failure(error=ListTransactionsError.INVALID_CURSOR)
+
+        transactions = await self._transaction_repo.find_page_by_account(
+            account_id=query.account_id,
+            limit=query.limit + 1,
+            after=after,
+            transaction_type=transaction_type_enum,
+        )
+        has_more = len(transactions) > query.limit
+
+        transactions = transactions[: query.limit]
+
+        next_cursor: str | None = None
+        if has_more:
+            last = transactions[-1]
+            next_cursor = encode_transaction_cursor(
+                TransactionCursor(
+                    transaction_date=last.transaction_date, transaction_id=last.id
+                )
             )
 
         # Map to DTOs
         dtos = [_map_transaction_to_dto(t) for t in transactions]
 
-        # Calculate pagination info
-        has_more = len(transactions) == query.limit
-
         return Success(
             value=TransactionListResult(
                 transactions=dtos,
                 total_count=len(dtos),
                 has_more=has_more,
+                next_cursor=next_cursor,
             )
         )
 
@@ -363,3 +448,91 @@ class ListSecurityTransactionsHandler:
                 has_more=has_more,
             )
         )
+
+
+class ListTransactionsForExportHandler:
+    """Handler for ListTransactionsForExport query.
+
+    Verifies ownership up front, then returns a stream of transaction DTOs
+    read incrementally from the repository. The stream must be consumed
+    while the request's database session is open.
+    Ownership checked by verifying: Account->ProviderConnection->User
+
+    Dependencies (injected via constructor):
+        - TransactionRepository: For transaction streaming
+        - AccountRepository: For account lookup (ownership)
+        - ProviderConnectionRepository: For ownership verification
+    """
+
+    def __init__(
+        self,
+        transaction_repo: TransactionRepository,
+        account_repo: AccountRepository,
+        connection_repo: ProviderConnectionRepository,
+    ) -> None:
+        """Initialize handler with dependencies.
+
+        Args:
+            transaction_repo: Transaction repository.
+            account_repo: Account repository for ownership.
+            connection_repo: Provider connection repository for ownership check.
+        """
+        self._transaction_repo = transaction_repo
+        self._account_repo = account_repo
+        self._connection_repo = connection_repo
+
+    async def handle(
+        self, query: ListTransactionsForExport
+    ) -> Result[AsyncIterator[TransactionResult], str]:
+        """Handle ListTransactionsForExport query.
+
+        Args:
+            query: ListTransactionsForExport query.
+
+        Returns:
+            Success(AsyncIterator[TransactionResult]): Stream of transaction DTOs.
+            Failure(error): Account not found, not owned by user, or invalid type.
+        """
+        # Fetch account to get connection_id
+        account = await self._account_repo.find_by_id(query.account_id)
+
+        if account is None:
+            return Failure(error=ListTransactionsError.ACCOUNT_NOT_FOUND)
+
+        # Fetch connection to verify ownership
+        connection = await self._connection_repo.find_by_id(account.connection_id)
+
+        if connection is None:
+            return Failure(error=ListTransactionsError.CONNECTION_NOT_FOUND)
+
+        # Verify ownership (connection belongs to user)
+        if connection.user_id != query.user_id:
+            return Failure(error=ListTransactionsError.NOT_OWNED_BY_USER)
+
+        transaction_type_enum: TransactionType | None = None
+        if query.transaction_type is not None:
+            try:
+                transaction_type_enum = TransactionType(query.transaction_type)
+            except ValueError:
+                return Failure(error=ListTransactionsError.INVALID_TRANSACTION_TYPE)
+
+        return Success(value=self._stream(query.account_id, transaction_type_enum))
+
+    async def _stream(
+        self,
+        account_id: UUID,
+        transaction_type: TransactionType | None,
+    ) -> AsyncIterator[TransactionResult]:
+        """Map streamed transactions to DTOs.
+
+        Args:
+            account_id: Account to export.
+            transaction_type: Optional type filter.
+
+        Yields:
+            TransactionResult: One DTO per transaction.
+        """
+        async for transaction in self._transaction_repo.stream_by_account(
+            account_id=account_id, transaction_type=transaction_type
+        ):
+            yield _map_transaction_to_dto(transaction)
@@ -47,8 +47,12 @@ class GetTransaction:
 class ListTransactionsByAccount:
     """Query to list transactions for a specific account.
 
-    Returns transactions ordered by transaction_date DESC (most recent first).
-    Supports pagination and optional type filtering.
+    Returns transactions ordered by transaction_date DESC (most recent first,
+    ties broken by id). Supports pagination and optional type filtering.
+
+    Pagination is keyset-based: pass the ``next_cursor`` of the previous page
+    as ``cursor``. ``offset`` is kept for existing clients; it is ignored when
+    a cursor is given, and deep offsets get slower as the account grows.
 
     Attributes:
         account_id: Account to retrieve transactions for.
@@ -56,6 +60,7 @@ class ListTransactionsByAccount:
         limit: Maximum number of transactions to return (default 50).
         offset: Number of transactions to skip for pagination (default 0).
         transaction_type: Optional filter by transaction type (e.g., "trade", "transfer").
+        cursor: Opaque position returned as next_cursor by the previous page.
 
     Example:
         >>> # Get first page of all transactions
@@ -63,7 +68,13 @@ class ListTransactionsByAccount:
         ...     account_id=account_id,
         ...     user_id=current_user_id,
         ...     limit=50,
-        ...     offset=0,
+        ... )
+        >>> # Get the next page
+        >>> next_query = ListTransactionsByAccount(
+        ...     account_id=account_id,
+        ...     user_id=current_user_id,
+        ...     limit=50,
+        ...     cursor=page.next_cursor,
         ... )
         >>> # Get only trades
         >>> trades_query = ListTransactionsByAccount(
@@ -78,6 +89,35 @@ class ListTransactionsByAccount:
     limit: int = 50
     offset: int = 0
     transaction_type: str | None = None
+    cursor: str | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class ListTransactionsForExport:
+    """Query to export all transactions of an account.
+
+    The handler returns a stream rather than a list, so exports of large
+    accounts are never materialized in memory. Same ordering as
+    ListTransactionsByAccount.
+
+    Attributes:
+        account_id: Account to export transactions for.
+        user_id: User requesting the export (for ownership check).
+        transaction_type: Optional filter by transaction type (e.g., "trade").
+
+    Example:
+        >>> query = ListTransactionsForExport(
+        ...     account_id=account_id,
+        ...     user_id=current_user_id,
+        ... )
+        >>> result = await handler.handle(query)
+        >>> async for transaction in result.value:
+        ...     write_row(transaction)
+    """
+
+    account_id: UUID
+    user_id: UUID
+    transaction_type: str | None = None
 
 
 @dataclass(frozen=True, kw_only=True)
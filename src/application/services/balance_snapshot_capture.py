@@ -0,0 +1,71 @@
+"""Balance snapshot capture helpers.
+
+Builds BalanceSnapshot entities from synced accounts so sync handlers and
+scheduled capture record history the same way.
+
+Architecture:
+    - Application service (pure mapping, no I/O)
+    - Persistence is batched by BalanceSnapshotRepository.bulk_insert()
+    - Unchanged balances are deduplicated within SNAPSHOT_DEDUPE_WINDOW
+
+Usage:
+    snapshots = [
+        snapshot_from_account(account, SnapshotSource.ACCOUNT_SYNC, now)
+        for account in accounts
+    ]
+    await snapshot_repo.bulk_insert(
+        snapshots, dedupe_window=SNAPSHOT_DEDUPE_WINDOW
+    )
+
+Reference:
+    - src/domain/entities/balance_snapshot.py
+"""
+
+from datetime import datetime, timedelta
+
+from uuid_extensions import uuid7
+
+from src.core.constants import BALANCE_SNAPSHOT_DEDUPE_WINDOW_SECONDS
+from src.domain.entities.account import Account
+from src.domain.entities.balance_snapshot import BalanceSnapshot
+from src.domain.enums.snapshot_source import SnapshotSource
+from src.domain.value_objects.money import Money
+
+SNAPSHOT_DEDUPE_WINDOW = timedelta(seconds=BALANCE_SNAPSHOT_DEDUPE_WINDOW_SECONDS)
+"""Unchanged balances captured within this window are not re-recorded."""
+
+
+def snapshot_from_account(
+    account: Account,
+    source: SnapshotSource,
+    captured_at: datetime,
+    holdings_value: Money | None = None,
+) -> BalanceSnapshot:
+    """Build a snapshot of an account's current balance.
+
+    Args:
+        account: Account whose balance to capture.
+        source: How/why the snapshot is captured.
+        captured_at: Capture timestamp (shared by one sync batch).
+        holdings_value: Total market value of holdings, when known. The
+            cash value is then derived as balance - holdings_value.
+
+    Returns:
+        New BalanceSnapshot entity (not yet persisted).
+    """
+    cash_value: Money | None = None
+    if holdings_value is not None:
+        cash_value = account.balance - holdings_value
+
+    return BalanceSnapshot(
+        id=uuid7(),
+        account_id=account.id,
+        balance=account.balance,
+        currency=account.currency,
+        source=source,
+        available_balance=account.available_balance,
+        holdings_value=holdings_value,
+        cash_value=cash_value,
+        captured_at=captured_at,
+        created_at=captured_at,
+    )
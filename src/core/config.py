@@ -151,14 +151,78 @@ class Settings(BaseSettings):
         default=300,
         description="Schwab API response cache TTL in seconds (default: 5 minutes)",
     )
-    cache_accounts_ttl: int = Field(
-        default=300,
-        description="Account list cache TTL in seconds (default: 5 minutes)",
-    )
     cache_security_ttl: int = Field(
         default=60,
         description="Security config (token versions) cache TTL in seconds (default: 1 minute)",
     )
+    cache_query_enabled: bool = Field(
+        default=True,
+        description="Enable read-through caching of CQRS query results (registry CachePolicy)",
+    )
+    cache_query_short_ttl: int = Field(
+        default=60,
+        description="Query cache TTL for CachePolicy.SHORT in seconds (default: 1 minute)",
+    )
+    cache_query_medium_ttl: int = Field(
+        default=300,
+        description="Query cache TTL for CachePolicy.MEDIUM in seconds (default: 5 minutes)",
+    )
+    cache_query_long_ttl: int = Field(
+        default=3600,
+        description="Query cache TTL for CachePolicy.LONG in seconds (default: 1 hour)",
+    )
+    cache_query_aggressive_ttl: int = Field(
+        default=86400,
+        description="Query cache TTL for CachePolicy.AGGRESSIVE in seconds (default: 1 day)",
+    )
+    cache_local_enabled: bool = Field(
+        default=True,
+        description="Enable the in-process (L1) tier in front of Redis for sessions, "
+        "provider connections, and authorization results",
+    )
+    cache_local_ttl: int = Field(
+        default=5,
+        description="In-process (L1) cache TTL in seconds; bounds staleness if an "
+        "invalidation message is missed (default: 5 seconds)",
+    )
+    cache_local_max_entries: int = Field(
+        default=10000,
+        description="Max entries per in-process (L1) cache namespace (LRU eviction)",
+    )
+
+    # Portfolio configuration
+    portfolio_recalc_window_seconds: float = Field(
+        default=1.0,
+        description="Window in seconds during which balance/holdings events for a "
+        "user are coalesced into one net worth recalculation (0 disables coalescing)",
+    )
+
+    # Audit configuration
+    audit_batch_enabled: bool = Field(
+        default=True,
+        description="Queue audit records and write them in batches (multi-row INSERT). "
+        "Compliance-critical actions still persist before the request returns. "
+        "When False, every record is committed inline.",
+    )
+    audit_batch_size: int = Field(
+        default=500,
+        description="Max audit records per INSERT (a full batch is flushed immediately)",
+    )
+    audit_flush_interval_seconds: float = Field(
+        default=0.5,
+        description="Max time a queued audit record waits before being written",
+    )
+    audit_queue_max_size: int = Field(
+        default=10000,
+        description="Queued audit records before record() waits for a flush (backpressure)",
+    )
+
+    # Rate limit configuration
+    rate_limit_event_sample_rate: float = Field(
+        default=0.01,
+        description="Fraction of allowed rate limit checks that publish Attempted/"
+        "Allowed events (audit, logging). Denied events are always published.",
+    )
 
     # Background Jobs configuration (dashtam-jobs)
     jobs_redis_url: str | None = Field(
@@ -171,6 +235,40 @@ class Settings(BaseSettings):
         default="dashtam:jobs",
         description="Redis queue name for background jobs (must match dashtam-jobs config)",
     )
+    sync_jobs_accounts_concurrency: int = Field(
+        default=4,
+        description="Account sync jobs run at once per worker process",
+    )
+    sync_jobs_transactions_concurrency: int = Field(
+        default=4,
+        description="Transaction sync jobs run at once per worker process",
+    )
+    sync_jobs_holdings_concurrency: int = Field(
+        default=8,
+        description="Holdings sync jobs run at once per worker process",
+    )
+
+    # Maintenance scheduler (leader-elected periodic tasks)
+    maintenance_scheduler_enabled: bool = Field(
+        default=True,
+        description="Run the maintenance scheduler (one leader across workers)",
+    )
+    maintenance_session_sweep_interval_seconds: int = Field(
+        default=3600,
+        description="Interval between expired session/token sweeps",
+    )
+    maintenance_stale_account_interval_seconds: int = Field(
+        default=900,
+        description="Interval between stale-account refresh runs",
+    )
+    maintenance_stale_account_threshold_minutes: int = Field(
+        default=360,
+        description="Accounts not synced for this long are refreshed",
+    )
+    maintenance_balance_snapshot_interval_seconds: int = Field(
+        default=86400,
+        description="Interval between scheduled balance snapshot captures",
+    )
 
     # SSE (Server-Sent Events) configuration
     sse_enable_retention: bool = Field(
@@ -210,6 +308,10 @@ class Settings(BaseSettings):
         default=BCRYPT_ROUNDS_DEFAULT,
         description="Number of bcrypt hashing rounds (10-14 recommended, 12 = ~300ms)",
     )
+    bcrypt_max_workers: int = Field(
+        default=4,
+        description="Worker threads for async bcrypt hashing (concurrency limit)",
+    )
 
     # API configuration
     api_base_url: str = Field(
@@ -253,6 +355,25 @@ class Settings(BaseSettings):
         description="OAuth redirect URI for Schwab callback",
     )
 
+    # Provider HTTP connection pool configuration
+    provider_http_max_connections: int = Field(
+        default=100,
+        description="Maximum concurrent HTTP connections per provider client pool",
+    )
+    provider_http_max_keepalive_connections: int = Field(
+        default=20,
+        description="Maximum idle keep-alive connections retained per provider pool",
+    )
+    provider_http_keepalive_expiry: float = Field(
+        default=30.0,
+        description="Seconds an idle provider connection is kept before closing",
+    )
+    provider_http2_enabled: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 for provider APIs (requires the h2 package; "
+        "falls back to HTTP/1.1 if not installed)",
+    )
+
     # Provider: Alpaca Configuration
     alpaca_client_id: str | None = Field(
         default=None,
@@ -36,6 +36,15 @@ AES_KEY_LENGTH: int = 32
 BCRYPT_ROUNDS_DEFAULT: int = 12
 """Default bcrypt work factor (cost parameter)."""
 
+REFRESH_TOKEN_SELECTOR_BYTES: int = 12
+"""Bytes of the non-secret refresh token selector (indexed lookup ID)."""
+
+REFRESH_TOKEN_SELECTOR_LENGTH: int = 16
+"""Length of urlsafe base64 selector prefix (REFRESH_TOKEN_SELECTOR_BYTES * 4 / 3)."""
+
+REFRESH_TOKEN_LEGACY_LENGTH: int = 43
+"""Length of pre-selector refresh tokens; only these reach the bcrypt scan."""
+
 
 # =============================================================================
 # Timeouts
@@ -79,3 +88,179 @@ SSE_RETENTION_MAX_LEN_DEFAULT: int = 1000
 
 SSE_RETENTION_TTL_DEFAULT: int = 3600
 """Default TTL for retained events (seconds)."""
+
+SSE_REPLAY_PAGE_SIZE: int = 100
+"""Stream entries fetched per XRANGE call during Last-Event-ID replay."""
+
+SSE_CLIENT_QUEUE_MAX_SIZE: int = 256
+"""Max buffered events per SSE connection before oldest events are dropped."""
+
+SSE_HUB_RECONNECT_MAX_DELAY_SECONDS: int = 30
+"""Upper bound for SSE hub Redis reconnect backoff."""
+
+SSE_HUB_READY_TIMEOUT_SECONDS: float = 5.0
+"""Max wait for the SSE hub subscription before a new stream is ended."""
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+CACHE_SCAN_COUNT: int = 1000
+"""SCAN/SSCAN COUNT hint used when iterating keys for bulk invalidation."""
+
+CACHE_DELETE_BATCH_SIZE: int = 500
+"""Keys removed per UNLINK call during bulk invalidation."""
+
+CACHE_INVALIDATION_CHANNEL: str = "cache:invalidate"
+"""Redis pub/sub channel carrying local (L1) cache invalidations."""
+
+CACHE_INVALIDATION_RECONNECT_MAX_DELAY_SECONDS: int = 30
+"""Upper bound for the cache invalidation listener reconnect backoff."""
+
+
+# =============================================================================
+# Audit
+# =============================================================================
+
+AUDIT_WRITE_MAX_ATTEMPTS: int = 3
+"""Flush attempts for a queued (non-durable) audit record before it is dropped."""
+
+
+# =============================================================================
+# CloudWatch Logging
+# =============================================================================
+
+CLOUDWATCH_QUEUE_MAX_SIZE: int = 10_000
+"""Max log events buffered in memory before the overflow policy applies."""
+
+CLOUDWATCH_MAX_BATCH_BYTES: int = 1_048_576
+"""PutLogEvents payload limit (sum of UTF-8 message bytes + per-event overhead)."""
+
+CLOUDWATCH_EVENT_OVERHEAD_BYTES: int = 26
+"""Bytes CloudWatch adds to each event when computing the batch size."""
+
+CLOUDWATCH_MAX_EVENT_BYTES: int = 262_144
+"""Max size of a single log event; larger messages are truncated."""
+
+
+# =============================================================================
+# Provider Sync
+# =============================================================================
+
+PROVIDER_MAX_CONCURRENT_REQUESTS_DEFAULT: int = 1
+"""In-flight provider API calls per provider when the registry sets no limit."""
+
+PROVIDER_RATE_LIMIT_MAX_RETRIES: int = 2
+"""Retries of a rate-limited (429) provider call within one sync."""
+
+PROVIDER_RETRY_AFTER_DEFAULT_SECONDS: float = 1.0
+"""Pause applied after a 429 response without a Retry-After header."""
+
+PROVIDER_RETRY_AFTER_MAX_SECONDS: float = 30.0
+"""Longest Retry-After a blocking sync waits for; longer ones fail the account."""
+
+
+# =============================================================================
+# Sync Jobs
+# =============================================================================
+
+SYNC_JOB_KEY_PREFIX: str = "dashtam:sync-jobs"
+"""Redis key prefix for background sync job status and dedupe locks."""
+
+SYNC_JOB_TTL_SECONDS: int = 86400
+"""How long a sync job's status stays readable after it was last updated."""
+
+SYNC_JOB_LOCK_TTL_SECONDS: int = 900
+"""Dedupe lock lifetime; bounds how long a crashed worker blocks new jobs."""
+
+SYNC_JOB_SHUTDOWN_GRACE_SECONDS: float = 30.0
+"""Time running sync jobs get to finish on shutdown before being cancelled."""
+
+
+# =============================================================================
+# Maintenance Scheduler
+# =============================================================================
+
+MAINTENANCE_LEADER_KEY: str = "dashtam:maintenance:leader"
+"""Redis lock key; the worker holding it runs the maintenance tasks."""
+
+MAINTENANCE_LEADER_TTL_SECONDS: int = 60
+"""Leader lock lifetime; another worker takes over this long after a crash."""
+
+MAINTENANCE_TICK_SECONDS: float = 15.0
+"""How often each worker renews/contends for leadership and checks due tasks."""
+
+MAINTENANCE_JITTER_RATIO: float = 0.1
+"""Random +/- fraction applied to each task interval (spreads load)."""
+
+MAINTENANCE_DELETE_BATCH_SIZE: int = 1000
+"""Rows removed per DELETE statement by the expired session/token sweep."""
+
+MAINTENANCE_MAX_DELETE_BATCHES: int = 50
+"""DELETE statements per table per sweep run; the rest waits for the next run."""
+
+MAINTENANCE_REVOKED_SESSION_RETENTION_DAYS: int = 30
+"""Revoked sessions are kept this long (session history) before the sweep."""
+
+MAINTENANCE_STALE_ACCOUNT_BATCH_SIZE: int = 50
+"""Stale accounts examined per refresh run (stalest first)."""
+
+MAINTENANCE_SYNC_STAGGER_SECONDS: float = 1.0
+"""Start delay between consecutive stale-account sync jobs."""
+
+MAINTENANCE_FAILED_SYNC_BACKOFF_SECONDS: int = 3600
+"""Connections whose last account sync failed this recently are not refreshed."""
+
+
+# =============================================================================
+# File Import
+# =============================================================================
+
+FILE_PARSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+"""Summed size of uploaded files whose parse results are kept in memory."""
+
+FILE_PARSE_CACHE_MAX_ENTRIES: int = 16
+"""Max parsed files kept in memory (least recently used evicted first)."""
+
+
+# =============================================================================
+# Session Enrichment
+# =============================================================================
+
+DEVICE_ENRICHMENT_CACHE_MAX_ENTRIES: int = 10_000
+"""Max parsed user agent strings kept in memory (least recently used evicted)."""
+
+LOCATION_ENRICHMENT_CACHE_MAX_ENTRIES: int = 50_000
+"""Max GeoIP lookups (one per IP prefix) kept in memory."""
+
+LOCATION_ENRICHMENT_IPV4_PREFIX: int = 24
+"""IPv4 prefix length sharing one cached location (city-level precision)."""
+
+LOCATION_ENRICHMENT_IPV6_PREFIX: int = 64
+"""IPv6 prefix length sharing one cached location (one subnet)."""
+
+
+# =============================================================================
+# Transaction Export
+# =============================================================================
+
+TRANSACTION_EXPORT_FETCH_SIZE: int = 1000
+"""Rows fetched per server-side cursor round trip when streaming an export."""
+
+TRANSACTION_EXPORT_CHUNK_ROWS: int = 200
+"""Rows buffered into one chunk of the streamed export response body."""
+
+
+# =============================================================================
+# Balance History
+# =============================================================================
+
+BALANCE_ROLLUP_MIN_RANGE_DAYS: int = 90
+"""Day/week/month charts longer than this read the daily rollup table."""
+
+BALANCE_SNAPSHOT_DEDUPE_WINDOW_SECONDS: int = 3600
+"""Unchanged balances captured within this window are not snapshotted again."""
+
+BALANCE_SNAPSHOT_CAPTURE_PAGE_SIZE: int = 5000
+"""Active accounts loaded per page by scheduled balance snapshot capture."""
@@ -37,7 +37,9 @@ Reference:
 from src.core.container.infrastructure import (
     get_audit,
     get_audit_session,
+    get_audit_writer,
     get_cache,
+    get_cache_invalidation_bus,
     get_cache_keys,
     get_cache_metrics,
     get_database,
@@ -45,25 +47,36 @@ from src.core.container.infrastructure import (
     get_device_enricher,
     get_email_service,
     get_encryption_service,
+    get_file_parse_cache,
     get_jobs_monitor,
+    get_local_cache,
     get_location_enricher,
     get_logger,
+    get_maintenance_scheduler,
     get_password_reset_token_service,
     get_password_service,
+    get_provider_concurrency_limiter,
     get_provider_connection_cache,
     get_provider_factory,
+    get_provider_http_clients,
+    get_query_result_cache,
     get_rate_limit,
     get_refresh_token_service,
     get_secrets,
     get_session_cache,
+    get_sync_job_runner,
     get_token_service,
 )
 
 # Event bus
-from src.core.container.events import get_event_bus
+from src.core.container.events import get_event_bus, get_portfolio_event_handler
 
 # SSE (Server-Sent Events)
-from src.core.container.sse import get_sse_publisher, get_sse_subscriber
+from src.core.container.sse import (
+    get_sse_hub,
+    get_sse_publisher,
+    get_sse_subscriber,
+)
 
 # Repositories
 from src.core.container.repositories import (
@@ -95,6 +108,7 @@ from src.core.container.authorization import (
 __all__ = [
     # Infrastructure
     "get_cache",
+    "get_cache_invalidation_bus",
     "get_cache_keys",
     "get_cache_metrics",
     "get_secrets",
@@ -103,6 +117,7 @@ __all__ = [
     "get_db_session",
     "get_audit_session",
     "get_audit",
+    "get_audit_writer",
     "get_password_service",
     "get_token_service",
     "get_email_service",
@@ -110,15 +125,24 @@ __all__ = [
     "get_logger",
     "get_session_cache",
     "get_provider_connection_cache",
+    "get_local_cache",
+    "get_query_result_cache",
     "get_device_enricher",
     "get_location_enricher",
     "get_refresh_token_service",
     "get_password_reset_token_service",
     "get_provider_factory",
+    "get_provider_http_clients",
+    "get_provider_concurrency_limiter",
+    "get_file_parse_cache",
     "get_jobs_monitor",
+    "get_sync_job_runner",
+    "get_maintenance_scheduler",
     # Events
     "get_event_bus",
+    "get_portfolio_event_handler",
     # SSE
+    "get_sse_hub",
     "get_sse_publisher",
     "get_sse_subscriber",
     # Repositories
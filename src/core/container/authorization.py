@@ -115,7 +115,7 @@ async def get_authorization(
     Creates CasbinAdapter with:
     - App-scoped enforcer (pre-initialized at startup)
     - Request-scoped audit (for per-request audit logging)
-    - App-scoped cache, event_bus, logger
+    - App-scoped cache, "authz" L1 tier, event_bus, logger
 
     Args:
         audit: Request-scoped audit adapter for logging authorization checks.
@@ -140,15 +140,30 @@ async def get_authorization(
     Reference:
         - docs/architecture/authorization-architecture.md
     """
-    from src.infrastructure.authorization.casbin_adapter import CasbinAdapter
+    from src.infrastructure.authorization.casbin_adapter import (
+        CACHE_PREFIX,
+        CasbinAdapter,
+    )
 
     from src.core.container.events import get_event_bus
-    from src.core.container.infrastructure import get_cache, get_logger
+    from src.core.container.infrastructure import (
+        get_cache,
+        get_cache_invalidation_bus,
+        get_cache_metrics,
+        get_local_cache,
+        get_logger,
+    )
 
+    local_cache = get_local_cache(CACHE_PREFIX)
     return CasbinAdapter(
         enforcer=get_enforcer(),
         cache=get_cache(),
         audit=audit,
         event_bus=get_event_bus(),
         logger=get_logger(),
+        local_cache=local_cache,
+        invalidation=(
+            get_cache_invalidation_bus() if local_cache is not None else None
+        ),
+        metrics=get_cache_metrics(),
     )
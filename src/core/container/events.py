@@ -14,9 +14,16 @@ from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from src.application.event_handlers.portfolio_event_handler import (
+        PortfolioEventHandler,
+    )
     from src.domain.protocols.event_bus_protocol import EventBusProtocol
 
 
+# Module-level reference to the portfolio handler wired by get_event_bus()
+_portfolio_handler: "PortfolioEventHandler | None" = None
+
+
 @lru_cache()
 def get_event_bus() -> "EventBusProtocol":
     """Get event bus singleton (app-scoped).
@@ -73,6 +80,8 @@ def get_event_bus() -> "EventBusProtocol":
         - docs/architecture/domain-events-architecture.md
         - docs/architecture/dependency-injection-architecture.md
     """
+    global _portfolio_handler
+
     import os
 
     from src.core.config import get_settings
@@ -96,7 +105,11 @@ def get_event_bus() -> "EventBusProtocol":
     from src.infrastructure.events.in_memory_event_bus import InMemoryEventBus
 
     # Import from infrastructure module (no circular dependency)
-    from src.core.container.infrastructure import get_database, get_logger
+    from src.core.container.infrastructure import (
+        get_audit_writer,
+        get_database,
+        get_logger,
+    )
 
     event_bus_type = os.getenv("EVENT_BUS_TYPE", "in-memory")
 
@@ -123,10 +136,16 @@ def get_event_bus() -> "EventBusProtocol":
     logging_handler = LoggingEventHandler(logger=get_logger())
 
     # Audit handler uses database session from event bus (if provided).
-    # Pass both database (fallback) and event_bus (preferred session source).
+    # Events published without a session go to the batched audit writer
+    # (compliance-critical actions are persisted before publish returns).
     # This prevents "Event loop is closed" errors in tests by avoiding
     # session creation inside event handlers.
-    audit_handler = AuditEventHandler(database=get_database(), event_bus=event_bus)
+    audit_handler = AuditEventHandler(
+        database=get_database(),
+        event_bus=event_bus,
+        audit_writer=get_audit_writer(),
+        logger=get_logger(),
+    )
 
     email_handler = EmailEventHandler(logger=get_logger(), settings=get_settings())
     session_handler = SessionEventHandler(logger=get_logger())
@@ -302,8 +321,11 @@ def get_event_bus() -> "EventBusProtocol":
         cache=get_cache(),
         event_bus=event_bus,
         logger=logger,
+        coalesce_window_seconds=settings.portfolio_recalc_window_seconds,
     )
 
+    _portfolio_handler = portfolio_handler
+
     # Subscribe to portfolio trigger events
     event_bus.subscribe(AccountBalanceUpdated, portfolio_handler.handle_balance_updated)
     event_bus.subscribe(
@@ -312,4 +334,95 @@ def get_event_bus() -> "EventBusProtocol":
 
     logger.debug("Portfolio event handler wiring complete")
 
+    # =========================================================================
+    # QUERY CACHE INVALIDATION WIRING (Manual subscription)
+    # =========================================================================
+    # Registry CachePolicy caching (handler_factory -> CachedQueryHandler)
+    # stores query results per user. Any event that changes a user's data
+    # drops that user's cached reads so the next query hits the database.
+    # =========================================================================
+    from src.application.event_handlers.query_cache_event_handler import (
+        QUERY_CACHE_INVALIDATION_EVENTS,
+        QueryCacheEventHandler,
+    )
+    from src.core.container.infrastructure import get_query_result_cache
+
+    query_cache_handler = QueryCacheEventHandler(
+        query_cache=get_query_result_cache(),
+        logger=logger,
+    )
+    for invalidating_event in QUERY_CACHE_INVALIDATION_EVENTS:
+        event_bus.subscribe(
+            invalidating_event, query_cache_handler.handle_user_data_changed
+        )
+
+    logger.debug(
+        "Query cache invalidation wiring complete",
+        subscribed_events=len(QUERY_CACHE_INVALIDATION_EVENTS),
+    )
+
+    # =========================================================================
+    # LOCAL CACHE INVALIDATION WIRING (Manual subscription)
+    # =========================================================================
+    # In-process (L1) tiers in front of Redis are invalidated at the write
+    # site for sessions and roles. Token rotation and provider connection
+    # changes do not write those caches, so they invalidate here (broadcast
+    # to every worker through Redis pub/sub).
+    # =========================================================================
+    from src.application.event_handlers.cache_invalidation_event_handler import (
+        PROVIDER_CONNECTION_CHANGE_EVENTS,
+        CacheInvalidationEventHandler,
+    )
+    from src.core.container.infrastructure import (
+        get_cache_invalidation_bus,
+        get_provider_connection_cache,
+    )
+    from src.domain.events.auth_events import (
+        GlobalTokenRotationSucceeded,
+        UserTokenRotationSucceeded,
+    )
+
+    cache_invalidation_handler = CacheInvalidationEventHandler(
+        invalidation=get_cache_invalidation_bus(),
+        connection_cache=get_provider_connection_cache(),
+        logger=logger,
+    )
+    event_bus.subscribe(
+        UserTokenRotationSucceeded,
+        cache_invalidation_handler.handle_user_token_rotation,
+    )
+    event_bus.subscribe(
+        GlobalTokenRotationSucceeded,
+        cache_invalidation_handler.handle_global_token_rotation,
+    )
+    for connection_event in PROVIDER_CONNECTION_CHANGE_EVENTS:
+        event_bus.subscribe(
+            connection_event,
+            cache_invalidation_handler.handle_provider_connection_changed,
+        )
+
+    logger.debug("Local cache invalidation wiring complete")
+
     return event_bus
+
+
+def get_portfolio_event_handler() -> "PortfolioEventHandler":
+    """Get the portfolio event handler subscribed by get_event_bus().
+
+    The handler coalesces net worth recalculations per user, so it holds
+    scheduled work that must be flushed before shutdown.
+
+    Returns:
+        PortfolioEventHandler instance (wiring the event bus if needed).
+
+    Usage:
+        # Monitoring
+        stats = get_portfolio_event_handler().get_stats()
+
+        # Shutdown (lifespan)
+        await get_portfolio_event_handler().flush()
+    """
+    get_event_bus()
+    if _portfolio_handler is None:
+        raise RuntimeError("Portfolio event handler not wired by get_event_bus()")
+    return _portfolio_handler
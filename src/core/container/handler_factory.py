@@ -8,6 +8,7 @@ Architecture:
 - Uses Python's inspect module to analyze handler signatures
 - Maps protocol types to container factory functions
 - Creates request-scoped handler instances with injected dependencies
+- Wraps query handlers with read-through caching per registry CachePolicy
 
 Usage:
     from src.core.container.handler_factory import create_handler
@@ -22,10 +23,15 @@ Reference:
 """
 
 import inspect
-from typing import Any, TypeVar, get_type_hints
+from typing import TYPE_CHECKING, Any, TypeVar, get_type_hints
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
+
+if TYPE_CHECKING:
+    from src.application.cqrs.metadata import CachePolicy
+
 # Type variable for handler classes
 T = TypeVar("T")
 
@@ -87,6 +93,8 @@ SINGLETON_TYPES: dict[str, str] = {
     # Provider Factory
     "ProviderFactoryProtocol": "get_provider_factory",
     "ProviderFactory": "get_provider_factory",
+    "ProviderConcurrencyProtocol": "get_provider_concurrency_limiter",
+    "ProviderConcurrencyLimiter": "get_provider_concurrency_limiter",
     # Other Services
     "LoggerProtocol": "get_logger",
     "EmailServiceProtocol": "get_email_service",
@@ -277,6 +285,7 @@ def _get_singleton_instance(type_name: str) -> Any:
         get_logger,
         get_password_reset_token_service,
         get_password_service,
+        get_provider_concurrency_limiter,
         get_provider_connection_cache,
         get_provider_factory,
         get_refresh_token_service,
@@ -315,6 +324,8 @@ def _get_singleton_instance(type_name: str) -> Any:
         # Provider Factory
         "ProviderFactoryProtocol": get_provider_factory,
         "ProviderFactory": get_provider_factory,
+        "ProviderConcurrencyProtocol": get_provider_concurrency_limiter,
+        "ProviderConcurrencyLimiter": get_provider_concurrency_limiter,
         # Other Services
         "LoggerProtocol": get_logger,
         "EmailServiceProtocol": get_email_service,
@@ -451,6 +462,84 @@ def get_supported_dependencies() -> dict[str, list[str]]:
     }
 
 
+# =============================================================================
+# Query Result Caching (registry CachePolicy)
+# =============================================================================
+
+
+def get_query_cache_ttl(cache_policy: "CachePolicy") -> int | None:
+    """Map a registry CachePolicy to a cache TTL in seconds.
+
+    Args:
+        cache_policy: Query cache policy from QueryMetadata.
+
+    Returns:
+        TTL in seconds, or None for CachePolicy.NONE (no caching).
+    """
+    from src.application.cqrs.metadata import CachePolicy
+
+    ttl_by_policy = {
+        CachePolicy.SHORT: settings.cache_query_short_ttl,
+        CachePolicy.MEDIUM: settings.cache_query_medium_ttl,
+        CachePolicy.LONG: settings.cache_query_long_ttl,
+        CachePolicy.AGGRESSIVE: settings.cache_query_aggressive_ttl,
+    }
+    return ttl_by_policy.get(cache_policy)
+
+
+def wrap_query_handler(handler_class: type, handler: Any) -> Any:
+    """Apply registry-driven read-through caching to a query handler.
+
+    Looks up the handler in QUERY_REGISTRY and, if its cache_policy is not
+    NONE, returns a CachedQueryHandler around it. Command handlers, queries
+    with CachePolicy.NONE, and handlers whose result DTO cannot be resolved
+    are returned unchanged.
+
+    Args:
+        handler_class: Handler class (registry lookup key).
+        handler: Handler instance created by create_handler().
+
+    Returns:
+        CachedQueryHandler or the original handler.
+    """
+    if not settings.cache_query_enabled:
+        return handler
+
+    from src.application.cqrs.computed_views import get_query_metadata_by_handler
+
+    metadata = get_query_metadata_by_handler(handler_class)
+    if metadata is None:
+        return handler
+
+    ttl = get_query_cache_ttl(metadata.cache_policy)
+    if ttl is None:
+        return handler
+
+    from src.application.cqrs.query_cache import (
+        CachedQueryHandler,
+        resolve_result_type,
+    )
+
+    result_type = resolve_result_type(handler_class)
+    if result_type is None:
+        return handler
+
+    from src.core.container.infrastructure import (
+        get_cache_metrics,
+        get_query_result_cache,
+    )
+    from src.infrastructure.cache.query_result_cache import query_name
+
+    return CachedQueryHandler(
+        handler=handler,
+        cache=get_query_result_cache(),
+        metrics=get_cache_metrics(),
+        result_type=result_type,
+        ttl=ttl,
+        namespace=f"query:{query_name(metadata.query_class)}",
+    )
+
+
 # =============================================================================
 # FastAPI Dependency Generator
 # =============================================================================
@@ -468,6 +557,9 @@ def handler_factory(handler_class: type[T]) -> Any:
     The factory function is cached per handler class to enable testing:
     tests can override the dependency using the same key.
 
+    Query handlers whose registry cache_policy is not NONE are returned
+    wrapped in a read-through CachedQueryHandler (see wrap_query_handler).
+
     Args:
         handler_class: Handler class to generate dependency for.
 
@@ -506,7 +598,9 @@ def handler_factory(handler_class: type[T]) -> Any:
     async def _factory(
         session: AsyncSession = Depends(get_db_session),
     ) -> T:
-        return await create_handler(handler_class, session)
+        handler = await create_handler(handler_class, session)
+        wrapped: T = wrap_query_handler(handler_class, handler)
+        return wrapped
 
     # Preserve handler class name for debugging/introspection
     _factory.__name__ = f"get_{handler_class.__name__.lower()}"
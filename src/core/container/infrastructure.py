@@ -18,7 +18,7 @@ Reference:
 """
 
 from functools import lru_cache
-from typing import TYPE_CHECKING, AsyncGenerator
+from typing import TYPE_CHECKING, Any, AsyncGenerator, cast
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -35,7 +35,11 @@ if TYPE_CHECKING:
     from src.domain.protocols.password_reset_token_service_protocol import (
         PasswordResetTokenServiceProtocol,
     )
+    from src.domain.protocols.provider_concurrency_protocol import (
+        ProviderConcurrencyProtocol,
+    )
     from src.domain.protocols.provider_factory_protocol import ProviderFactoryProtocol
+    from src.domain.protocols.query_result_cache_protocol import QueryResultCache
     from src.domain.protocols.rate_limit_protocol import RateLimitProtocol
     from src.domain.protocols.refresh_token_service_protocol import (
         RefreshTokenServiceProtocol,
@@ -50,10 +54,22 @@ if TYPE_CHECKING:
     from src.domain.protocols.provider_connection_cache_protocol import (
         ProviderConnectionCache,
     )
+    from src.infrastructure.audit.batched_writer import BatchedAuditWriter
+    from src.infrastructure.cache.cache_invalidation import RedisCacheInvalidationBus
     from src.infrastructure.cache.cache_keys import CacheKeys
     from src.infrastructure.cache.cache_metrics import CacheMetrics
+    from src.infrastructure.cache.local_cache import LocalTTLCache
+    from redis.asyncio import Redis
+
+    from src.core.result import Result
+    from src.infrastructure.jobs.maintenance_scheduler import MaintenanceScheduler
     from src.infrastructure.jobs.monitor import JobsMonitor
+    from src.infrastructure.jobs.sync_job_runner import SyncJobRunner
     from src.infrastructure.providers.encryption_service import EncryptionService
+    from src.infrastructure.providers.file_parse_cache import FileParseCache
+    from src.infrastructure.providers.http_client_registry import (
+        ProviderHTTPClientRegistry,
+    )
 
 
 # ============================================================================
@@ -345,6 +361,33 @@ async def get_audit(
     return PostgresAuditAdapter(session=audit_session)
 
 
+@lru_cache()
+def get_audit_writer() -> "BatchedAuditWriter":
+    """Get batched audit writer singleton (app-scoped).
+
+    Used by AuditEventHandler for events published without a session.
+    Records are queued and written in batches by a background flusher
+    (started/drained in the application lifespan); compliance-critical
+    actions are persisted before record() returns.
+
+    Returns:
+        BatchedAuditWriter configured from AUDIT_* settings.
+
+    See Also:
+        src/infrastructure/audit/batched_writer.py for durability guarantees.
+    """
+    from src.infrastructure.audit.batched_writer import BatchedAuditWriter
+
+    return BatchedAuditWriter(
+        database=get_database(),
+        logger=get_logger(),
+        batch_size=settings.audit_batch_size,
+        flush_interval_seconds=settings.audit_flush_interval_seconds,
+        max_queue_size=settings.audit_queue_max_size,
+        batching_enabled=settings.audit_batch_enabled,
+    )
+
+
 # ============================================================================
 # Security Services (Application-Scoped)
 # ============================================================================
@@ -355,7 +398,9 @@ def get_password_service() -> "PasswordHashingProtocol":
     """Get password hashing service singleton (app-scoped).
 
     Returns BcryptPasswordService with cost factor 12 (~250ms per hash).
-    Service instance is shared across entire application.
+    Service instance is shared across entire application, so its async
+    worker pool (settings.bcrypt_max_workers) bounds bcrypt concurrency
+    process-wide.
 
     Returns:
         Password hashing service implementing PasswordHashingProtocol.
@@ -365,7 +410,9 @@ def get_password_service() -> "PasswordHashingProtocol":
     """
     from src.infrastructure.security import BcryptPasswordService
 
-    return BcryptPasswordService(cost_factor=12)
+    return BcryptPasswordService(
+        cost_factor=12, max_workers=settings.bcrypt_max_workers
+    )
 
 
 @lru_cache()
@@ -443,7 +490,9 @@ def get_rate_limit() -> "RateLimitProtocol":
     Creates TokenBucketAdapter with:
     - RedisStorage for atomic token bucket operations
     - Centralized rules configuration from RATE_LIMIT_RULES
-    - Event bus for domain event publishing
+    - Per-route rule layers from RATE_LIMIT_ROUTE_RULES (one EVALSHA per route)
+    - Event bus for domain event publishing (sampled via
+      RATE_LIMIT_EVENT_SAMPLE_RATE; denials always published)
     - Logger for structured logging
 
     Fail-Open Design:
@@ -459,6 +508,7 @@ def get_rate_limit() -> "RateLimitProtocol":
     from redis.asyncio import ConnectionPool, Redis
 
     from src.infrastructure.rate_limit import (
+        RATE_LIMIT_ROUTE_RULES,
         RATE_LIMIT_RULES,
         RedisStorage,
         TokenBucketAdapter,
@@ -490,6 +540,8 @@ def get_rate_limit() -> "RateLimitProtocol":
         rules=RATE_LIMIT_RULES,
         event_bus=get_event_bus(),
         logger=get_logger(),
+        route_rules=RATE_LIMIT_ROUTE_RULES,
+        event_sample_rate=settings.rate_limit_event_sample_rate,
     )
 
 
@@ -544,19 +596,89 @@ def get_logger() -> "LoggerProtocol":
 # ============================================================================
 
 
+@lru_cache()
+def get_cache_invalidation_bus() -> "RedisCacheInvalidationBus":
+    """Get local cache invalidation bus singleton (app-scoped, one per process).
+
+    Broadcasts invalidations of the in-process (L1) cache tiers to every
+    worker over Redis pub/sub, and applies invalidations published by other
+    workers. Holds one long-lived pub/sub connection.
+
+    Returns:
+        RedisCacheInvalidationBus implementing CacheInvalidationProtocol.
+
+    Usage:
+        # Startup / shutdown (lifespan)
+        get_cache_invalidation_bus().start()
+        await get_cache_invalidation_bus().aclose()
+    """
+    from redis.asyncio import ConnectionPool, Redis
+
+    from src.infrastructure.cache.cache_invalidation import RedisCacheInvalidationBus
+
+    # One long-lived pub/sub connection plus a few for publishing
+    pool = ConnectionPool.from_url(
+        settings.redis_url,
+        max_connections=10,
+        decode_responses=False,
+        socket_connect_timeout=5,
+        socket_timeout=None,  # No timeout for pub/sub (long-lived)
+        socket_keepalive=True,
+    )
+    redis_client: Redis[bytes] = Redis(connection_pool=pool)  # type: ignore[type-arg]
+
+    return RedisCacheInvalidationBus(redis_client=redis_client)
+
+
+@lru_cache(maxsize=None)
+def get_local_cache(namespace: str) -> "LocalTTLCache | None":
+    """Get the in-process (L1) cache tier for a namespace (app-scoped).
+
+    Each tier is registered with the invalidation bus so writes in any
+    worker drop its entries. Returns None when CACHE_LOCAL_ENABLED is false.
+
+    Args:
+        namespace: Local cache namespace ("session", "provider_connection",
+            "authz").
+
+    Returns:
+        LocalTTLCache for the namespace, or None if disabled.
+    """
+    if not settings.cache_local_enabled:
+        return None
+
+    from src.infrastructure.cache.local_cache import LocalTTLCache
+
+    local_cache = LocalTTLCache(
+        max_entries=settings.cache_local_max_entries,
+        ttl_seconds=settings.cache_local_ttl,
+    )
+    get_cache_invalidation_bus().register(namespace, local_cache)
+    return local_cache
+
+
 @lru_cache()
 def get_session_cache() -> "SessionCache":
     """Get session cache singleton (app-scoped).
 
     Returns RedisSessionCache for session storage with user indexing.
-    Uses shared Redis connection pool.
+    Uses shared Redis connection pool, fronted by the "session" L1 tier.
 
     Returns:
         Session cache implementing SessionCache protocol.
     """
     from src.infrastructure.cache import RedisSessionCache
-
-    return RedisSessionCache(cache=get_cache())
+    from src.infrastructure.cache.session_cache import LOCAL_CACHE_NAMESPACE
+
+    local_cache = get_local_cache(LOCAL_CACHE_NAMESPACE)
+    return RedisSessionCache(
+        cache=get_cache(),
+        local_cache=local_cache,
+        invalidation=(
+            get_cache_invalidation_bus() if local_cache is not None else None
+        ),
+        metrics=get_cache_metrics(),
+    )
 
 
 @lru_cache()
@@ -564,14 +686,43 @@ def get_provider_connection_cache() -> "ProviderConnectionCache":
     """Get provider connection cache singleton (app-scoped).
 
     Returns RedisProviderConnectionCache for connection storage.
-    Uses shared Redis connection pool.
+    Uses shared Redis connection pool, fronted by the "provider_connection"
+    L1 tier.
 
     Returns:
         Provider connection cache implementing ProviderConnectionCache protocol.
     """
     from src.infrastructure.cache import RedisProviderConnectionCache
+    from src.infrastructure.cache.provider_connection_cache import (
+        LOCAL_CACHE_NAMESPACE,
+    )
+
+    local_cache = get_local_cache(LOCAL_CACHE_NAMESPACE)
+    return RedisProviderConnectionCache(
+        cache=get_cache(),
+        local_cache=local_cache,
+        invalidation=(
+            get_cache_invalidation_bus() if local_cache is not None else None
+        ),
+        metrics=get_cache_metrics(),
+    )
 
-    return RedisProviderConnectionCache(cache=get_cache())
+
+@lru_cache()
+def get_query_result_cache() -> "QueryResultCache":
+    """Get CQRS query result cache singleton (app-scoped).
+
+    Returns RedisQueryResultCache used by the handler factory to apply
+    registry CachePolicy read-through caching to query handlers, and by the
+    query cache invalidation handler to drop a user's cached reads.
+    Uses shared Redis connection pool.
+
+    Returns:
+        Query result cache implementing QueryResultCache protocol.
+    """
+    from src.infrastructure.cache.query_result_cache import RedisQueryResultCache
+
+    return RedisQueryResultCache(cache=get_cache(), cache_keys=get_cache_keys())
 
 
 # ============================================================================
@@ -583,7 +734,9 @@ def get_provider_connection_cache() -> "ProviderConnectionCache":
 def get_device_enricher() -> "DeviceEnricher":
     """Get device enricher singleton (app-scoped).
 
-    Returns UserAgentDeviceEnricher for parsing user agent strings.
+    Returns UserAgentDeviceEnricher for parsing user agent strings. App-scoped
+    so its parse cache (DEVICE_ENRICHMENT_CACHE_MAX_ENTRIES) is shared by
+    every login on this worker.
 
     Returns:
         Device enricher implementing DeviceEnricher protocol.
@@ -597,7 +750,9 @@ def get_device_enricher() -> "DeviceEnricher":
 def get_location_enricher() -> "LocationEnricher":
     """Get location enricher singleton (app-scoped).
 
-    Returns IPLocationEnricher for IP geolocation.
+    Returns IPLocationEnricher for IP geolocation. App-scoped so the
+    memory-mapped GeoIP database is opened once and the per-prefix lookup
+    cache (LOCATION_ENRICHMENT_CACHE_MAX_ENTRIES) is shared.
 
     Returns:
         Location enricher implementing LocationEnricher protocol.
@@ -617,13 +772,17 @@ def get_refresh_token_service() -> "RefreshTokenServiceProtocol":
     """Get refresh token service singleton (app-scoped).
 
     Returns RefreshTokenService for generating and verifying refresh tokens.
+    Token hashes are keyed with settings.secret_key; legacy bcrypt tokens
+    are verified in the password service's worker pool.
 
     Returns:
         Refresh token service implementing RefreshTokenServiceProtocol.
     """
     from src.infrastructure.security.refresh_token_service import RefreshTokenService
 
-    return RefreshTokenService()
+    return RefreshTokenService(
+        secret_key=settings.secret_key, password_service=get_password_service()
+    )
 
 
 @lru_cache()
@@ -662,11 +821,118 @@ def get_provider_factory() -> "ProviderFactoryProtocol":
     return ProviderFactory()
 
 
+@lru_cache()
+def get_provider_http_clients() -> "ProviderHTTPClientRegistry":
+    """Get provider HTTP client registry singleton (app-scoped).
+
+    Returns ProviderHTTPClientRegistry holding one pooled, keep-alive
+    httpx.AsyncClient per provider. Closed in the FastAPI lifespan shutdown.
+
+    Returns:
+        Provider HTTP client registry.
+
+    Usage:
+        # Infrastructure Layer (provider construction)
+        client = get_provider_http_clients().get_client("schwab")
+        provider = SchwabProvider(settings=settings, http_client=client)
+
+        # Observability
+        stats = get_provider_http_clients().get_all_stats()
+    """
+    from src.infrastructure.providers.http_client_registry import (
+        ProviderHTTPClientRegistry,
+    )
+
+    return ProviderHTTPClientRegistry(
+        max_connections=settings.provider_http_max_connections,
+        max_keepalive_connections=settings.provider_http_max_keepalive_connections,
+        keepalive_expiry=settings.provider_http_keepalive_expiry,
+        http2=settings.provider_http2_enabled,
+    )
+
+
+@lru_cache()
+def get_provider_concurrency_limiter() -> "ProviderConcurrencyProtocol":
+    """Get provider concurrency limiter singleton (app-scoped).
+
+    Returns ProviderConcurrencyLimiter bounding in-flight provider API calls
+    per provider (ProviderMetadata.max_concurrent_requests) and pausing a
+    provider after a 429 Retry-After. Shared by all requests in the process.
+
+    Returns:
+        Provider concurrency limiter implementing ProviderConcurrencyProtocol.
+
+    Usage:
+        # Application Layer (auto-wired via handler_factory)
+        async with limiter.slot(connection.provider_slug):
+            result = await provider.fetch_transactions(...)
+    """
+    from src.infrastructure.providers.concurrency_limiter import (
+        ProviderConcurrencyLimiter,
+    )
+
+    return ProviderConcurrencyLimiter()
+
+
+@lru_cache()
+def get_file_parse_cache() -> "FileParseCache":
+    """Get file parse cache singleton (app-scoped).
+
+    Returns FileParseCache holding parse results of uploaded provider files
+    (Chase QFX), keyed by SHA-256 of the content and bounded by
+    FILE_PARSE_CACHE_MAX_BYTES / FILE_PARSE_CACHE_MAX_ENTRIES. Shared by
+    every file provider instance so re-uploads of a file skip the parse.
+
+    Returns:
+        File parse cache.
+
+    Usage:
+        # Infrastructure Layer (provider construction)
+        provider = ChaseFileProvider(parse_cache=get_file_parse_cache())
+    """
+    from src.core.constants import (
+        FILE_PARSE_CACHE_MAX_BYTES,
+        FILE_PARSE_CACHE_MAX_ENTRIES,
+    )
+    from src.infrastructure.providers.file_parse_cache import FileParseCache
+
+    return FileParseCache(
+        max_bytes=FILE_PARSE_CACHE_MAX_BYTES,
+        max_entries=FILE_PARSE_CACHE_MAX_ENTRIES,
+    )
+
+
 # ============================================================================
-# Background Jobs Monitor (Application-Scoped)
+# Background Jobs (Application-Scoped)
 # ============================================================================
 
 
+@lru_cache()
+def get_jobs_redis() -> "Redis":
+    """Get the jobs Redis client singleton (app-scoped).
+
+    Uses JOBS_REDIS_URL if configured, otherwise falls back to main REDIS_URL.
+    Shared by JobsMonitor and the sync job runner.
+
+    Returns:
+        Async Redis client for job queue and sync job status.
+    """
+    from redis.asyncio import ConnectionPool, Redis
+
+    # Use dedicated jobs Redis URL if configured, otherwise fall back to main Redis
+    redis_url = settings.jobs_redis_url or settings.redis_url
+
+    pool = ConnectionPool.from_url(
+        redis_url,
+        max_connections=10,  # Monitoring and sync job status writes only
+        decode_responses=False,
+        socket_connect_timeout=5,
+        socket_timeout=5,
+        retry_on_timeout=True,
+    )
+    return Redis(connection_pool=pool)
+
+
 @lru_cache()
 def get_jobs_monitor() -> "JobsMonitor":
     """Get background jobs monitor singleton (app-scoped).
@@ -689,24 +955,144 @@ def get_jobs_monitor() -> "JobsMonitor":
         from fastapi import Depends
         monitor: JobsMonitor = Depends(get_jobs_monitor)
     """
-    from redis.asyncio import ConnectionPool, Redis
-
     from src.infrastructure.jobs.monitor import JobsMonitor
 
-    # Use dedicated jobs Redis URL if configured, otherwise fall back to main Redis
-    redis_url = settings.jobs_redis_url or settings.redis_url
+    return JobsMonitor(
+        redis_client=get_jobs_redis(),
+        queue_name=settings.jobs_queue_name,
+    )
 
-    pool = ConnectionPool.from_url(
-        redis_url,
-        max_connections=10,  # Fewer connections needed for monitoring
-        decode_responses=False,
-        socket_connect_timeout=5,
-        socket_timeout=5,
-        retry_on_timeout=True,
+
+async def _execute_sync_command(command: Any) -> "Result[Any, Any]":
+    """Run a sync command with its registered handler in a new session.
+
+    Executor for SyncJobRunner: the session commits when the handler
+    returns, exactly as at the end of a request.
+
+    Args:
+        command: SyncAccounts, SyncTransactions, SyncHoldings or
+            RecordBalanceSnapshots command.
+
+    Returns:
+        The handler's Result.
+    """
+    from src.application.cqrs.computed_views import get_handler_class_for_command
+    from src.core.container.handler_factory import create_handler
+
+    handler_class = get_handler_class_for_command(type(command))
+    if handler_class is None:
+        raise ValueError(f"No handler registered for {type(command).__name__}")
+
+    async with get_database().get_session() as session:
+        handler: Any = await create_handler(handler_class, session)
+        return cast("Result[Any, Any]", await handler.handle(command))
+
+
+@lru_cache()
+def get_sync_job_runner() -> "SyncJobRunner":
+    """Get background sync job runner singleton (app-scoped).
+
+    Sync endpoints submit their commands here and return 202 Accepted.
+    Jobs run on this worker's event loop (per-kind concurrency caps from
+    SYNC_JOBS_*_CONCURRENCY); status lives in the jobs Redis so any worker
+    can report it. Running jobs are drained in the application lifespan.
+
+    Returns:
+        SyncJobRunner instance.
+
+    Usage:
+        # Presentation Layer (FastAPI Depends)
+        runner: SyncJobRunner = Depends(get_sync_job_runner)
+    """
+    from src.infrastructure.jobs.sync_job_runner import SyncJobRunner
+    from src.infrastructure.jobs.sync_job_store import SyncJobKind, SyncJobStore
+
+    return SyncJobRunner(
+        store=SyncJobStore(get_jobs_redis()),
+        executor=_execute_sync_command,
+        logger=get_logger(),
+        concurrency={
+            SyncJobKind.ACCOUNTS: settings.sync_jobs_accounts_concurrency,
+            SyncJobKind.TRANSACTIONS: settings.sync_jobs_transactions_concurrency,
+            SyncJobKind.HOLDINGS: settings.sync_jobs_holdings_concurrency,
+        },
     )
-    redis_client = Redis(connection_pool=pool)
 
-    return JobsMonitor(
-        redis_client=redis_client,
-        queue_name=settings.jobs_queue_name,
+
+@lru_cache()
+def get_maintenance_scheduler() -> "MaintenanceScheduler":
+    """Get maintenance scheduler singleton (app-scoped).
+
+    Every worker runs the scheduler; only the holder of the Redis leader
+    lock (jobs Redis) runs its tasks:
+    - session_sweep: batched DELETEs of expired sessions and auth tokens
+      (every MAINTENANCE_SESSION_SWEEP_INTERVAL_SECONDS)
+    - stale_account_refresh: staggered account sync jobs for accounts not
+      synced within MAINTENANCE_STALE_ACCOUNT_THRESHOLD_MINUTES (every
+      MAINTENANCE_STALE_ACCOUNT_INTERVAL_SECONDS)
+    - balance_snapshot_capture: scheduled balance snapshots of all active
+      accounts (every MAINTENANCE_BALANCE_SNAPSHOT_INTERVAL_SECONDS)
+
+    Started in the application lifespan when MAINTENANCE_SCHEDULER_ENABLED.
+
+    Returns:
+        MaintenanceScheduler instance.
+
+    Usage:
+        # Application lifespan
+        get_maintenance_scheduler().start()
+        ...
+        await get_maintenance_scheduler().aclose()
+    """
+    from datetime import timedelta
+
+    from src.application.commands.sync_commands import (
+        RecordBalanceSnapshots,
+        SyncAccounts,
+    )
+    from src.infrastructure.jobs.maintenance_scheduler import (
+        MaintenanceScheduler,
+        MaintenanceTask,
+    )
+    from src.infrastructure.jobs.maintenance_tasks import (
+        BalanceSnapshotRecorder,
+        ExpiredSessionSweeper,
+        StaleAccountRefresher,
+    )
+
+    logger = get_logger()
+    return MaintenanceScheduler(
+        redis_client=get_jobs_redis(),
+        logger=logger,
+        tasks=[
+            MaintenanceTask(
+                name="session_sweep",
+                interval_seconds=settings.maintenance_session_sweep_interval_seconds,
+                run=ExpiredSessionSweeper(database=get_database(), logger=logger),
+            ),
+            MaintenanceTask(
+                name="stale_account_refresh",
+                interval_seconds=settings.maintenance_stale_account_interval_seconds,
+                run=StaleAccountRefresher(
+                    database=get_database(),
+                    runner=get_sync_job_runner(),
+                    build_command=lambda user_id, connection_id: SyncAccounts(
+                        user_id=user_id, connection_id=connection_id
+                    ),
+                    logger=logger,
+                    threshold=timedelta(
+                        minutes=settings.maintenance_stale_account_threshold_minutes
+                    ),
+                ),
+            ),
+            MaintenanceTask(
+                name="balance_snapshot_capture",
+                interval_seconds=settings.maintenance_balance_snapshot_interval_seconds,
+                run=BalanceSnapshotRecorder(
+                    execute=_execute_sync_command,
+                    build_command=RecordBalanceSnapshots,
+                    logger=logger,
+                ),
+            ),
+        ],
     )
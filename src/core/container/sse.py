@@ -2,6 +2,7 @@
 
 Application-scoped singletons and request-scoped factories for SSE:
 - get_sse_publisher(): App-scoped singleton for publishing SSE events
+- get_sse_hub(): App-scoped singleton multiplexing pub/sub per process
 - get_sse_subscriber(): Request-scoped factory for SSE stream subscriptions
 
 Reference:
@@ -14,6 +15,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from src.domain.protocols.sse_publisher_protocol import SSEPublisherProtocol
     from src.infrastructure.sse.redis_subscriber import RedisSSESubscriber
+    from src.infrastructure.sse.sse_hub import SSEHub
 
 
 @lru_cache()
@@ -66,37 +68,40 @@ def get_sse_publisher() -> "SSEPublisherProtocol":
     )
 
 
-def get_sse_subscriber() -> "RedisSSESubscriber":
-    """Get SSE subscriber (request-scoped).
+@lru_cache()
+def get_sse_hub() -> "SSEHub":
+    """Get SSE hub singleton (app-scoped, one per worker process).
 
-    Returns new RedisSSESubscriber instance for each SSE connection.
-    Each subscriber manages its own pub/sub subscription lifecycle.
+    The hub holds a single Redis pub/sub connection (pattern subscription to
+    all user channels + broadcast) and fans events out to in-process,
+    bounded per-connection queues. Its Redis client is also shared for
+    Last-Event-ID stream replay.
 
     Returns:
-        New RedisSSESubscriber instance.
-
-    Note:
-        NOT a singleton - each SSE connection gets its own subscriber.
-        This is intentional: pub/sub subscriptions are per-connection.
+        SSEHub instance (listener starts on first SSE connection).
 
     Usage:
-        # Presentation Layer (FastAPI Depends in SSE endpoint)
-        subscriber = get_sse_subscriber()
-        async for event in subscriber.subscribe(user_id):
-            yield event.to_sse_format()
+        # Presentation Layer (via get_sse_subscriber)
+        subscriber = get_sse_subscriber()  # uses get_sse_hub()
+
+        # Monitoring
+        stats = get_sse_hub().get_stats()
+
+        # Shutdown (lifespan)
+        await get_sse_hub().aclose()
     """
     from redis.asyncio import ConnectionPool, Redis
 
     from src.core.config import get_settings
-    from src.infrastructure.sse.redis_subscriber import RedisSSESubscriber
+    from src.core.constants import SSE_CLIENT_QUEUE_MAX_SIZE
+    from src.infrastructure.sse.sse_hub import SSEHub
 
     settings = get_settings()
 
-    # Create new Redis client for this subscriber
-    # Each subscriber needs its own connection for pub/sub
+    # One long-lived pub/sub connection plus a few for stream replay reads
     pool = ConnectionPool.from_url(
         settings.redis_url,
-        max_connections=5,  # Small pool per subscriber
+        max_connections=10,
         decode_responses=False,
         socket_connect_timeout=5,
         socket_timeout=None,  # No timeout for pub/sub (long-lived)
@@ -104,7 +109,40 @@ def get_sse_subscriber() -> "RedisSSESubscriber":
     )
     redis_client: Redis[bytes] = Redis(connection_pool=pool)  # type: ignore[type-arg]
 
-    return RedisSSESubscriber(
+    return SSEHub(
         redis_client=redis_client,
+        queue_max_size=SSE_CLIENT_QUEUE_MAX_SIZE,
+    )
+
+
+def get_sse_subscriber() -> "RedisSSESubscriber":
+    """Get SSE subscriber (request-scoped).
+
+    Returns new RedisSSESubscriber instance for each SSE connection, backed
+    by the process-wide SSE hub, so open streams share one Redis pub/sub
+    connection instead of opening one each.
+
+    Returns:
+        New RedisSSESubscriber instance.
+
+    Note:
+        NOT a singleton - each SSE connection gets its own subscriber
+        (its own bounded queue in the hub). Redis connections are shared.
+
+    Usage:
+        # Presentation Layer (FastAPI Depends in SSE endpoint)
+        subscriber = get_sse_subscriber()
+        async for event in subscriber.subscribe(user_id):
+            yield event.to_sse_format()
+    """
+    from src.core.config import get_settings
+    from src.infrastructure.sse.redis_subscriber import RedisSSESubscriber
+
+    settings = get_settings()
+    hub = get_sse_hub()
+
+    return RedisSSESubscriber(
+        redis_client=hub.redis_client,
         enable_retention=settings.sse_enable_retention,
+        hub=hub,
     )
@@ -11,6 +11,7 @@ Categories:
 - Authorization errors (PERMISSION_*, ACCOUNT_LOCKED)
 - Business rule violations (INSUFFICIENT_*, *_LIMIT_EXCEEDED)
 - Secrets management errors (SECRET_*)
+- Availability errors (SERVICE_UNAVAILABLE)
 """
 
 from enum import Enum
@@ -85,3 +86,6 @@ class ErrorCode(Enum):
     PROVIDER_UNAVAILABLE = "provider_unavailable"
     PROVIDER_RATE_LIMITED = "provider_rate_limited"
     PROVIDER_CREDENTIAL_INVALID = "provider_credential_invalid"
+
+    # Availability errors
+    SERVICE_UNAVAILABLE = "service_unavailable"
@@ -18,6 +18,7 @@ Available Enums:
 from src.domain.enums.account_type import AccountType
 from src.domain.enums.asset_type import AssetType
 from src.domain.enums.audit_action import AuditAction
+from src.domain.enums.balance_granularity import BalanceGranularity
 from src.domain.enums.connection_status import ConnectionStatus
 from src.domain.enums.credential_type import CredentialType
 from src.domain.enums.permission import Action, Resource
@@ -33,6 +34,7 @@ __all__ = [
     "AccountType",
     "AssetType",
     "AuditAction",
+    "BalanceGranularity",
     "ConnectionStatus",
     "CredentialType",
     "ProviderCategory",
@@ -0,0 +1,50 @@
+"""Balance history granularity enumeration.
+
+Defines the time bucket size used to chart balance history.
+
+Architecture:
+    - Domain layer enum (no infrastructure dependencies)
+    - Used by balance history queries and BalanceSnapshotRepository
+    - Values match PostgreSQL date_trunc() field names
+
+Reference:
+    - docs/architecture/balance-tracking-architecture.md
+
+Usage:
+    from src.domain.enums import BalanceGranularity
+
+    buckets = await repo.find_buckets_by_account_id(
+        account_id, start, end, granularity=BalanceGranularity.WEEK
+    )
+"""
+
+from enum import StrEnum
+
+
+class BalanceGranularity(StrEnum):
+    """Time bucket size for balance history.
+
+    Buckets are aligned in UTC. Weeks start on Monday.
+
+    Values:
+        HOUR: One bucket per hour.
+        DAY: One bucket per day.
+        WEEK: One bucket per ISO week.
+        MONTH: One bucket per calendar month.
+
+    Example:
+        >>> BalanceGranularity("week")
+        <BalanceGranularity.WEEK: 'week'>
+    """
+
+    HOUR = "hour"
+    """One bucket per hour."""
+
+    DAY = "day"
+    """One bucket per day."""
+
+    WEEK = "week"
+    """One bucket per ISO week (starting Monday)."""
+
+    MONTH = "month"
+    """One bucket per calendar month."""
@@ -18,6 +18,9 @@ Usage:
 # Service protocols
 from src.domain.protocols.audit_protocol import AuditProtocol
 from src.domain.protocols.authorization_protocol import AuthorizationProtocol
+from src.domain.protocols.cache_invalidation_protocol import (
+    CacheInvalidationProtocol,
+)
 from src.domain.protocols.cache_keys_protocol import CacheKeysProtocol
 from src.domain.protocols.cache_metrics_protocol import CacheMetricsProtocol
 from src.domain.protocols.cache_protocol import CacheEntry, CacheProtocol
@@ -33,10 +36,14 @@ from src.domain.protocols.password_hashing_protocol import PasswordHashingProtoc
 from src.domain.protocols.password_reset_token_service_protocol import (
     PasswordResetTokenServiceProtocol,
 )
+from src.domain.protocols.query_result_cache_protocol import QueryResultCache
 from src.domain.protocols.token_generation_protocol import TokenGenerationProtocol
 
 # Repository protocols
-from src.domain.protocols.balance_snapshot_repository import BalanceSnapshotRepository
+from src.domain.protocols.balance_snapshot_repository import (
+    BalanceBucket,
+    BalanceSnapshotRepository,
+)
 from src.domain.protocols.email_verification_token_repository import (
     EmailVerificationTokenData,
     EmailVerificationTokenRepository,
@@ -67,11 +74,16 @@ from src.domain.protocols.provider_connection_repository import (
     ProviderConnectionRepository,
 )
 from src.domain.protocols.provider_repository import ProviderRepository
+from src.domain.protocols.provider_concurrency_protocol import (
+    ProviderConcurrencyProtocol,
+)
 from src.domain.protocols.provider_factory_protocol import ProviderFactoryProtocol
 from src.domain.protocols.provider_protocol import (
+    FileProviderProtocol,
     OAuthProviderProtocol,
     OAuthTokens,
     ProviderAccountData,
+    ProviderFileData,
     ProviderHoldingData,
     ProviderProtocol,
     ProviderTransactionData,
@@ -87,6 +99,7 @@ __all__ = [
     "AuditProtocol",
     "AuthorizationProtocol",
     "CacheEntry",
+    "CacheInvalidationProtocol",
     "CacheKeysProtocol",
     "CacheMetricsProtocol",
     "CacheProtocol",
@@ -97,10 +110,12 @@ __all__ = [
     "EncryptionProtocol",
     "PasswordHashingProtocol",
     "PasswordResetTokenServiceProtocol",
+    "QueryResultCache",
     "SerializationError",
     "TokenGenerationProtocol",
     # Repository protocols
     "AccountRepository",
+    "BalanceBucket",
     "BalanceSnapshotRepository",
     "HoldingRepository",
     "EmailVerificationTokenData",
@@ -123,11 +138,14 @@ __all__ = [
     # Rate Limit protocol
     "RateLimitProtocol",
     # Provider protocols and data types
+    "FileProviderProtocol",
     "OAuthProviderProtocol",
     "OAuthTokens",
     "ProviderAccountData",
+    "ProviderConcurrencyProtocol",
     "ProviderConnectionRepository",
     "ProviderFactoryProtocol",
+    "ProviderFileData",
     "ProviderHoldingData",
     "ProviderProtocol",
     "ProviderRepository",
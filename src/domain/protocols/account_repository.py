@@ -7,6 +7,7 @@ Reference:
     - docs/architecture/account-domain-model.md
 """
 
+from collections.abc import Collection
 from datetime import timedelta
 from decimal import Decimal
 from typing import TYPE_CHECKING, Protocol
@@ -155,13 +156,19 @@ class AccountRepository(Protocol):
     async def find_needing_sync(
         self,
         threshold: timedelta,
+        *,
+        limit: int | None = None,
+        exclude_connection_ids: Collection[UUID] = (),
     ) -> list[Account]:
-        """Find accounts not synced within threshold.
+        """Find active accounts not synced within threshold.
 
-        Used by background job to identify stale accounts.
+        Used by background job to identify stale accounts. Stalest first
+        (never-synced accounts lead).
 
         Args:
             threshold: Maximum time since last sync.
+            limit: Maximum accounts returned (None = all).
+            exclude_connection_ids: Connections whose accounts are skipped.
 
         Returns:
             List of accounts needing sync (empty if none found).
@@ -173,6 +180,30 @@ class AccountRepository(Protocol):
         """
         ...
 
+    async def find_active_page(
+        self,
+        after_id: UUID | None,
+        limit: int,
+    ) -> list[Account]:
+        """Find one page of active accounts across all users.
+
+        Keyset-paginated by account ID so bulk jobs can walk every active
+        account without OFFSET scans.
+
+        Args:
+            after_id: Last account ID of the previous page (None for first).
+            limit: Maximum accounts per page.
+
+        Returns:
+            Active accounts ordered by ID (empty when exhausted).
+
+        Example:
+            >>> page = await repo.find_active_page(after_id=None, limit=5000)
+            >>> while page:
+            ...     page = await repo.find_active_page(page[-1].id, 5000)
+        """
+        ...
+
     async def save(self, account: Account) -> None:
         """Create or update account in database.
 
@@ -230,6 +261,25 @@ class AccountRepository(Protocol):
         """
         ...
 
+    async def summarize_balances_for_user(self, user_id: UUID) -> tuple[Decimal, int]:
+        """Sum balances and count active accounts for a user in one query.
+
+        Used for portfolio net worth recalculation (one round trip instead
+        of sum_balances_for_user + count_for_user).
+        Only includes active accounts (is_active=True).
+
+        Args:
+            user_id: User's unique identifier.
+
+        Returns:
+            Tuple of (total balance, active account count).
+            Returns (0, 0) if user has no active accounts.
+
+        Example:
+            >>> total, count = await repo.summarize_balances_for_user(user_id)
+        """
+        ...
+
     async def count_for_user(self, user_id: UUID) -> int:
         """Count active accounts for a user.
 
@@ -7,14 +7,49 @@ Reference:
     - docs/architecture/balance-tracking-architecture.md
 """
 
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
 from typing import Protocol
 from uuid import UUID
 
 from src.domain.entities.balance_snapshot import BalanceSnapshot
+from src.domain.enums.balance_granularity import BalanceGranularity
 from src.domain.enums.snapshot_source import SnapshotSource
 
 
+@dataclass(frozen=True, kw_only=True)
+class BalanceBucket:
+    """Balance aggregated over one time bucket.
+
+    Computed by the database, one row per bucket and currency. For a single
+    account, open/close are the first/last snapshot balances in the bucket.
+    For a user, they are summed across accounts, carrying forward the last
+    known close of accounts without a snapshot in the bucket; min/max are
+    None there because per-account extremes happen at different times and
+    do not add up.
+
+    Attributes:
+        bucket_start: Start of the bucket (UTC).
+        currency: ISO 4217 currency code.
+        open_balance: Balance at the first snapshot in the bucket.
+        close_balance: Balance at the last snapshot in the bucket.
+        min_balance: Lowest balance in the bucket (None for user totals).
+        max_balance: Highest balance in the bucket (None for user totals).
+        snapshot_count: Number of snapshots aggregated into the bucket.
+        account_count: Number of accounts contributing to the bucket.
+    """
+
+    bucket_start: datetime
+    currency: str
+    open_balance: Decimal
+    close_balance: Decimal
+    min_balance: Decimal | None
+    max_balance: Decimal | None
+    snapshot_count: int
+    account_count: int = 1
+
+
 class BalanceSnapshotRepository(Protocol):
     """Balance snapshot repository protocol (port).
 
@@ -30,7 +65,10 @@ class BalanceSnapshotRepository(Protocol):
         find_by_account_id_in_range: Retrieve snapshots within date range
         find_latest_by_account_id: Get most recent snapshot for account
         find_by_user_id_in_range: Retrieve snapshots across all user accounts
+        find_buckets_by_account_id: Time-bucketed history for an account
+        find_buckets_by_user_id: Time-bucketed totals across user accounts
         save: Create snapshot (no update - immutable)
+        bulk_insert: Create many snapshots with optional unchanged-balance dedupe
         delete: Remove snapshot
 
     Example Implementation:
@@ -162,6 +200,79 @@ class BalanceSnapshotRepository(Protocol):
         """
         ...
 
+    async def find_buckets_by_account_id(
+        self,
+        account_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+        granularity: BalanceGranularity,
+        source: SnapshotSource | None = None,
+    ) -> list[BalanceBucket]:
+        """Aggregate an account's snapshots into time buckets.
+
+        Bucketing happens in the database; only one row per bucket is
+        returned. Results are ordered by bucket_start ascending.
+
+        Args:
+            account_id: Account's unique identifier.
+            start_date: Start of date range (inclusive).
+            end_date: End of date range (inclusive).
+            granularity: Bucket size.
+            source: Optional filter by snapshot source.
+
+        Returns:
+            List of buckets with at least one snapshot (empty if none found).
+
+        Note:
+            Implementations may serve long day/week/month ranges from
+            pre-aggregated daily data; such ranges are aligned to whole
+            UTC days.
+
+        Example:
+            >>> buckets = await repo.find_buckets_by_account_id(
+            ...     account_id, start, end, BalanceGranularity.WEEK
+            ... )
+            >>> points = [(b.bucket_start, b.close_balance) for b in buckets]
+        """
+        ...
+
+    async def find_buckets_by_user_id(
+        self,
+        user_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+        granularity: BalanceGranularity,
+        source: SnapshotSource | None = None,
+    ) -> list[BalanceBucket]:
+        """Aggregate snapshots across all user accounts into time buckets.
+
+        Each account is bucketed first, then open/close balances are summed
+        across accounts per bucket and currency in the database.
+        Results are ordered by bucket_start, then currency.
+
+        Args:
+            user_id: User's unique identifier.
+            start_date: Start of date range (inclusive).
+            end_date: End of date range (inclusive).
+            granularity: Bucket size.
+            source: Optional filter by snapshot source.
+
+        Returns:
+            List of buckets, one per bucket and currency (empty if none found).
+
+        Note:
+            An account without a snapshot in a bucket contributes its last
+            known close (from an earlier bucket, or its latest snapshot
+            before start_date); account_count counts every contributing
+            account, snapshot_count only snapshots inside the bucket.
+
+        Example:
+            >>> buckets = await repo.find_buckets_by_user_id(
+            ...     user_id, start, end, BalanceGranularity.MONTH
+            ... )
+        """
+        ...
+
     async def find_latest_by_user_id(
         self,
         user_id: UUID,
@@ -202,6 +313,37 @@ class BalanceSnapshotRepository(Protocol):
         """
         ...
 
+    async def bulk_insert(
+        self,
+        snapshots: list[BalanceSnapshot],
+        dedupe_window: timedelta | None = None,
+        chunk_size: int = 500,
+        commit: bool = False,
+    ) -> int:
+        """Create many snapshots with multi-row INSERT statements.
+
+        Used by sync flows and scheduled capture to record history in a
+        fixed number of round trips instead of one per account.
+
+        Args:
+            snapshots: BalanceSnapshot entities to persist.
+            dedupe_window: If set, skip a snapshot when the account's most
+                recent snapshot is within this window and has the same
+                balance (and holdings value, if the new one carries it).
+            chunk_size: Maximum rows per INSERT statement (default 500).
+            commit: Commit afterwards (standalone capture). By default the
+                snapshots join the caller's transaction.
+
+        Returns:
+            Number of snapshots inserted.
+
+        Example:
+            >>> inserted = await repo.bulk_insert(
+            ...     snapshots, dedupe_window=timedelta(hours=1)
+            ... )
+        """
+        ...
+
     async def delete(self, snapshot_id: UUID) -> None:
         """Remove snapshot from database.
 
@@ -0,0 +1,62 @@
+"""Cache invalidation protocol for per-process (L1) cache tiers.
+
+This module defines the port (interface) for dropping entries from the
+in-process caches that sit in front of Redis. Each worker process keeps its
+own L1 tier, so an invalidation must reach every worker, not just the one
+that changed the data. Infrastructure layer implements with Redis pub/sub.
+
+Reference:
+    - docs/architecture/cache-keys.md
+"""
+
+from collections.abc import Sequence
+from typing import Protocol
+from uuid import UUID
+
+
+class CacheInvalidationProtocol(Protocol):
+    """Cross-process cache invalidation protocol (port).
+
+    Entries in a local tier are addressed by namespace (e.g., "session",
+    "authz"), key, and an optional group (the owning user ID) so that all of
+    a user's entries can be dropped together.
+
+    Delivery:
+        - Applied to the calling process immediately
+        - Broadcast to other processes best-effort (fail-open); local
+          entries also expire by a short TTL, which bounds staleness if a
+          message is lost
+
+    Example:
+        >>> await invalidation.invalidate("session", keys=[str(session_id)])
+        >>> await invalidation.invalidate_user(user_id)
+    """
+
+    async def invalidate(
+        self,
+        namespace: str,
+        *,
+        keys: Sequence[str] = (),
+        groups: Sequence[str] = (),
+    ) -> None:
+        """Drop entries from one local cache tier in every process.
+
+        Args:
+            namespace: Local cache namespace (e.g., "session").
+            keys: Entry keys to drop.
+            groups: Groups whose entries are all dropped (e.g., user IDs).
+        """
+        ...
+
+    async def invalidate_user(self, user_id: UUID) -> None:
+        """Drop every local entry owned by a user, in all namespaces.
+
+        Args:
+            user_id: User whose cached sessions, connections, and
+                permission results are stale.
+        """
+        ...
+
+    async def invalidate_all(self) -> None:
+        """Drop every local entry in every namespace and process."""
+        ...
@@ -113,6 +113,47 @@ class CacheKeysProtocol(Protocol):
         """
         ...
 
+    def query_result(self, user_id: UUID, query_name: str, fingerprint: str) -> str:
+        """CQRS query result cache key.
+
+        Pattern: {prefix}:query:{user_id}:{query_name}:{fingerprint}
+
+        Args:
+            user_id: User UUID who issued the query.
+            query_name: Query class name in snake_case.
+            fingerprint: Deterministic hash of the query's remaining fields.
+
+        Returns:
+            Cache key string.
+        """
+        ...
+
+    def query_results_pattern(self, user_id: UUID) -> str:
+        """Glob pattern matching all cached query results for a user.
+
+        Pattern: {prefix}:query:{user_id}:*
+
+        Args:
+            user_id: User UUID.
+
+        Returns:
+            Glob pattern for delete_pattern().
+        """
+        ...
+
+    def query_results_tag(self, user_id: UUID) -> str:
+        """Tag set tracking all cached query results for a user.
+
+        Pattern: {prefix}:tag:query:{user_id}
+
+        Args:
+            user_id: User UUID.
+
+        Returns:
+            Tag key for set_with_tags() / invalidate_tag().
+        """
+        ...
+
     def security_global_version(self) -> str:
         """Security global token version cache key.
 
@@ -26,19 +26,19 @@ class CacheMetricsProtocol(Protocol):
     and errors per cache namespace (e.g., \"user\", \"provider\", \"accounts\").
 
     Example:
-        class ListAccountsByUserHandler:
+        class CachedQueryHandler:
             def __init__(
                 self,
-                cache_metrics: CacheMetricsProtocol | None = None,
+                metrics: CacheMetricsProtocol | None,
                 ...
             ) -> None:
-                self._cache_metrics = cache_metrics
+                self._metrics = metrics
 
-            async def handle(self, query: ListAccountsByUser) -> Result[...]:
+            async def handle(self, query: Any) -> Result[...]:
                 if cached_value:
-                    self._cache_metrics.record_hit(\"accounts\")
+                    self._metrics.record_hit(\"query:list_accounts_by_user\")
                 else:
-                    self._cache_metrics.record_miss(\"accounts\")
+                    self._metrics.record_miss(\"query:list_accounts_by_user\")
     """
 
     def record_hit(self, namespace: str) -> None:
@@ -84,6 +84,19 @@ class CacheMetricsProtocol(Protocol):
         """
         ...
 
+    def get_tier_stats(self, namespace: str) -> dict[str, Any]:
+        """Get per-tier statistics for a two-tier (L1 + L2) cache.
+
+        Tiers are recorded as \"{namespace}:l1\" and \"{namespace}:l2\".
+
+        Args:
+            namespace: Cache namespace (e.g., \"session\", \"authz\").
+
+        Returns:
+            Dictionary with l1 and l2 stats plus the combined hit_rate.
+        """
+        ...
+
     def reset(self, namespace: str | None = None) -> None:
         """Reset metrics.
 
@@ -347,6 +347,56 @@ class CacheProtocol(Protocol):
         """
         ...
 
+    async def set_with_tags(
+        self,
+        key: str,
+        value: str,
+        *,
+        tags: list[str],
+        ttl: int | None = None,
+    ) -> Result[None, DomainError]:
+        """Set value and register the key under one or more tags.
+
+        Tags group keys so they can be dropped together with
+        invalidate_tag() without scanning the keyspace.
+
+        Args:
+            key: Cache key.
+            value: Value to cache (string).
+            tags: Tag names to register the key under.
+            ttl: Time to live in seconds (None = no expiration).
+
+        Returns:
+            Result with None on success, or CacheError.
+
+        Example:
+            await cache.set_with_tags(
+                "authz:user123:accounts:read", "1",
+                tags=["authz:tag:user123"], ttl=300,
+            )
+        """
+        ...
+
+    async def invalidate_tag(self, tag: str) -> Result[int, DomainError]:
+        """Delete every key registered under a tag.
+
+        Args:
+            tag: Tag name used with set_with_tags().
+
+        Returns:
+            Result with number of keys deleted, or CacheError.
+
+        Example:
+            result = await cache.invalidate_tag("authz:tag:user123")
+            match result:
+                case Success(count):
+                    logger.info(f"Invalidated {count} keys")
+                case Failure(_):
+                    # Fail open - entries expire by TTL
+                    pass
+        """
+        ...
+
     async def get_many(
         self, keys: list[str]
     ) -> Result[dict[str, str | None], DomainError]:
@@ -100,12 +100,15 @@ class EmailVerificationTokenRepository(Protocol):
         """
         ...
 
-    async def delete_expired_tokens(self) -> int:
+    async def delete_expired_tokens(self, *, limit: int | None = None) -> int:
         """Delete expired email verification tokens.
 
         Cleanup task to remove old tokens (typically run daily via cron).
         Deletes tokens where expires_at < current timestamp.
 
+        Args:
+            limit: Maximum tokens deleted by this call (None = all).
+
         Returns:
             Number of tokens deleted.
 
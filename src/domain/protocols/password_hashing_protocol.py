@@ -24,11 +24,14 @@ class PasswordHashingProtocol(Protocol):
         def __init__(self, password_service: PasswordHashingProtocol):
             self.password_service = password_service
 
-        # Hash password
-        password_hash = self.password_service.hash_password("SecurePass123!")
+        # Async handlers: hash/verify off the event loop
+        password_hash = await self.password_service.hash_password_async("SecurePass123!")
+        is_valid = await self.password_service.verify_password_async(
+            "SecurePass123!", password_hash
+        )
 
-        # Verify password
-        is_valid = self.password_service.verify_password("SecurePass123!", password_hash)
+        # Sync callers (scripts, seeding)
+        password_hash = self.password_service.hash_password("SecurePass123!")
     """
 
     def hash_password(self, password: str) -> str:
@@ -62,3 +65,32 @@ class PasswordHashingProtocol(Protocol):
             - Returns False for invalid hash format (no exceptions)
         """
         ...
+
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a plaintext password without blocking the event loop.
+
+        Implementations run the CPU-bound hash in a bounded worker pool.
+        Async handlers MUST use this instead of hash_password().
+
+        Args:
+            password: Plaintext password to hash.
+
+        Returns:
+            Hashed password string (bcrypt format: $2b$12$...).
+        """
+        ...
+
+    async def verify_password_async(self, password: str, password_hash: str) -> bool:
+        """Verify a plaintext password without blocking the event loop.
+
+        Implementations run the CPU-bound check in a bounded worker pool.
+        Async handlers MUST use this instead of verify_password().
+
+        Args:
+            password: Plaintext password to verify.
+            password_hash: Hashed password from database.
+
+        Returns:
+            True if password matches hash, False otherwise.
+        """
+        ...
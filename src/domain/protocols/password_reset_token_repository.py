@@ -102,12 +102,15 @@ class PasswordResetTokenRepository(Protocol):
         """
         ...
 
-    async def delete_expired_tokens(self) -> int:
+    async def delete_expired_tokens(self, *, limit: int | None = None) -> int:
         """Delete expired password reset tokens.
 
         Cleanup task to remove old tokens (typically run hourly via cron).
         Deletes tokens where expires_at < current timestamp.
 
+        Args:
+            limit: Maximum tokens deleted by this call (None = all).
+
         Returns:
             Number of tokens deleted.
         """
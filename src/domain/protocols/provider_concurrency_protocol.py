@@ -0,0 +1,59 @@
+"""Provider Concurrency Protocol - Per-provider limits on in-flight API calls.
+
+Sync handlers fetch data for several accounts of a connection concurrently.
+This protocol bounds how many provider calls run at once per provider, and
+lets handlers pause a provider after it answers 429 with ``Retry-After``.
+
+Architecture:
+- Domain layer protocol (no infrastructure imports)
+- Implemented by ProviderConcurrencyLimiter in infrastructure/providers
+- App-scoped: limits are shared by all requests in a worker process
+
+Usage:
+    class SyncTransactionsHandler:
+        async def _fetch(self, slug: str, ...):
+            async with self._concurrency_limiter.slot(slug):
+                return await provider.fetch_transactions(...)
+
+Reference:
+    - docs/architecture/provider-integration-architecture.md
+"""
+
+from contextlib import AbstractAsyncContextManager
+from typing import Protocol
+
+
+class ProviderConcurrencyProtocol(Protocol):
+    """Protocol for per-provider concurrency limits.
+
+    Example:
+        >>> limiter: ProviderConcurrencyProtocol = ...
+        >>> async with limiter.slot("schwab"):
+        ...     result = await provider.fetch_transactions(...)
+        >>> limiter.defer("schwab", 5)  # 429 with Retry-After: 5
+    """
+
+    def slot(self, provider_slug: str) -> AbstractAsyncContextManager[None]:
+        """Acquire a slot for one provider API call.
+
+        Waits while the provider is at its concurrency limit or paused by
+        ``defer()``.
+
+        Args:
+            provider_slug: Provider identifier (e.g., 'schwab').
+
+        Returns:
+            Async context manager holding the slot for the call's duration.
+        """
+        ...
+
+    def defer(self, provider_slug: str, seconds: float) -> None:
+        """Pause new calls to a provider (e.g., after 429 Retry-After).
+
+        Extends an existing pause, never shortens it.
+
+        Args:
+            provider_slug: Provider identifier.
+            seconds: Seconds to wait before the next call starts.
+        """
+        ...
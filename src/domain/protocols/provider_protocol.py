@@ -192,6 +192,29 @@ class ProviderTransactionData:
     raw_data: dict[str, Any] | None = None
 
 
+@dataclass(frozen=True, kw_only=True)
+class ProviderFileData:
+    """Accounts and transactions of one parsed provider file.
+
+    Returned by file import providers (FileProviderProtocol.parse_file) so
+    handlers get everything in a file from a single parse, instead of one
+    fetch_accounts() plus one fetch_transactions() call per account.
+
+    Attributes:
+        accounts: Accounts in the file (file order).
+        transactions: Transactions keyed by provider_account_id. Accounts
+            without transactions map to an empty list.
+
+    Example:
+        >>> result = await provider.parse_file(credentials)
+        >>> for account in result.value.accounts:
+        ...     txns = result.value.transactions[account.provider_account_id]
+    """
+
+    accounts: list[ProviderAccountData]
+    transactions: dict[str, list[ProviderTransactionData]]
+
+
 # =============================================================================
 # Provider Protocol (Port)
 # =============================================================================
@@ -467,3 +490,52 @@ class OAuthProviderProtocol(ProviderProtocol, Protocol):
             ...         logger.warning(f"Token refresh failed: {error.message}")
         """
         ...
+
+
+# =============================================================================
+# File Provider Protocol (file import extension)
+# =============================================================================
+
+
+class FileProviderProtocol(ProviderProtocol, Protocol):
+    """Extended protocol for file import providers.
+
+    Extends ProviderProtocol with a single-pass parse of an uploaded file.
+    Only file import providers (Chase QFX) implement this; the base
+    fetch_accounts()/fetch_transactions() methods stay available for callers
+    that only need part of the file.
+
+    Usage:
+        - Use ProviderProtocol for generic data fetching
+        - Use FileProviderProtocol in file import handlers
+
+    Example:
+        >>> provider: FileProviderProtocol = ChaseFileProvider()
+        >>> result = await provider.parse_file(credentials)
+    """
+
+    async def parse_file(
+        self,
+        credentials: dict[str, Any],
+    ) -> "Result[ProviderFileData, ProviderError]":
+        """Parse an uploaded file into accounts and their transactions.
+
+        Args:
+            credentials: Dict containing file_content (bytes), file_format
+                and file_name (see the provider's credentials structure).
+
+        Returns:
+            Success(ProviderFileData): Every account in the file with its
+                transactions.
+            Failure(ProviderInvalidResponseError): If the file is invalid or
+                unparseable.
+
+        Example:
+            >>> result = await provider.parse_file(credentials)
+            >>> match result:
+            ...     case Success(data):
+            ...         print(f"{len(data.accounts)} account(s)")
+            ...     case Failure(error):
+            ...         logger.error(f"Parse failed: {error.message}")
+        """
+        ...
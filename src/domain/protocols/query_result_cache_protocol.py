@@ -0,0 +1,83 @@
+"""Query result cache protocol for CQRS read-through caching.
+
+This module defines the port (interface) for caching query handler results.
+Infrastructure layer implements with Redis, keyed per user so a user's
+cached reads can be invalidated together when their data changes.
+
+Reference:
+    - docs/architecture/cache-keys.md
+    - docs/architecture/cqrs-registry.md
+"""
+
+from typing import Any, Protocol, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+
+class QueryResultCache(Protocol):
+    """Query result cache protocol (port).
+
+    Caches successful query results keyed by a deterministic fingerprint of
+    the query dataclass. All entries live under the querying user's key
+    space, so invalidation is per user.
+
+    Cache Strategy:
+        - Read-through: miss runs the handler, success result is stored
+        - TTL derived from the query's registry CachePolicy
+        - Invalidated per user by domain events (sync, holdings, connections)
+        - Fail-open: cache errors behave as misses
+
+    Key Patterns:
+        - query:{user_id}:{query_name}:{fingerprint} -> JSON result DTO
+
+    Example:
+        >>> result = await cache.get(query, AccountListResult)
+        >>> if result is None:
+        ...     result = await compute()
+        ...     await cache.set(query, result, ttl=60)
+    """
+
+    def key_for(self, query: Any) -> str | None:
+        """Derive the cache key for a query.
+
+        Args:
+            query: Query dataclass instance.
+
+        Returns:
+            Cache key, or None if the query is not user-scoped (not cacheable).
+        """
+        ...
+
+    async def get(self, query: Any, result_type: type[T]) -> T | None:
+        """Get cached result for a query.
+
+        Args:
+            query: Query dataclass instance.
+            result_type: Result DTO dataclass to rebuild.
+
+        Returns:
+            Cached result DTO, or None on miss/error.
+        """
+        ...
+
+    async def set(self, query: Any, value: Any, *, ttl: int) -> None:
+        """Store a query result.
+
+        Args:
+            query: Query dataclass instance.
+            value: Result DTO dataclass instance.
+            ttl: Time to live in seconds.
+        """
+        ...
+
+    async def invalidate_user(self, user_id: UUID) -> int:
+        """Remove all cached query results for a user.
+
+        Args:
+            user_id: User whose cached reads are stale.
+
+        Returns:
+            Number of entries removed (0 on error).
+        """
+        ...
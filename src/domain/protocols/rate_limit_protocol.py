@@ -24,9 +24,11 @@ Usage:
         raise HTTPException(429, headers={"Retry-After": str(result.value.retry_after)})
 """
 
+from collections.abc import Mapping
 from typing import Protocol
 
 from src.core.result import Result
+from src.domain.enums import RateLimitScope
 from src.domain.errors import RateLimitError
 from src.domain.value_objects.rate_limit_rule import RateLimitResult
 
@@ -107,6 +109,38 @@ class RateLimitProtocol(Protocol):
         """
         ...
 
+    async def check_route(
+        self,
+        *,
+        endpoint: str,
+        identifiers: Mapping[RateLimitScope, str],
+    ) -> Result[RateLimitResult, RateLimitError]:
+        """Check every rule of a route in one atomic operation.
+
+        Routes may be limited by several scopes at once (e.g., per user and
+        globally). All buckets are checked together: tokens are consumed
+        from every bucket only if every bucket allows the request.
+
+        Args:
+            endpoint: Route template key (e.g., "GET /api/v1/accounts/{account_id}").
+            identifiers: Identifier per rule scope (IP address, user ID, etc.).
+
+        Returns:
+            Result[RateLimitResult, RateLimitError]:
+                - Success(RateLimitResult) for the most restrictive bucket
+                - Failure(RateLimitError) only for severe errors (should be rare)
+
+        Fail-Open:
+            On infrastructure errors, MUST return Success(allowed=True).
+
+        Example:
+            result = await rate_limit.check_route(
+                endpoint="POST /api/v1/providers/{connection_id}/sync",
+                identifiers={RateLimitScope.USER_PROVIDER: "user-123:conn-1"},
+            )
+        """
+        ...
+
     async def get_remaining(
         self,
         *,
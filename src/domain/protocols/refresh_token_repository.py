@@ -14,7 +14,7 @@ Reference:
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Callable, Protocol
+from typing import Awaitable, Callable, Protocol
 from uuid import UUID
 
 
@@ -68,16 +68,19 @@ class RefreshTokenRepository(Protocol):
         *,
         token_version: int = 1,
         global_version_at_issuance: int = 1,
+        token_selector: str | None = None,
     ) -> RefreshTokenData:
         """Create new refresh token.
 
         Args:
             user_id: User's unique identifier.
-            token_hash: Bcrypt hash of the refresh token (never store plaintext).
+            token_hash: Keyed hash of the refresh token (never store plaintext).
             session_id: Associated session ID (F1.3 integration).
             expires_at: Token expiration timestamp (typically 30 days from now).
             token_version: Token version at issuance (for breach rotation).
             global_version_at_issuance: Global min version when issued (for grace period).
+            token_selector: Non-secret lookup ID from the token (None only
+                for legacy tokens).
 
         Returns:
             Created RefreshTokenData with token info.
@@ -91,7 +94,7 @@ class RefreshTokenRepository(Protocol):
         Does NOT check expiration - caller must verify expires_at.
 
         Args:
-            token_hash: Bcrypt hash of the token to find.
+            token_hash: Stored hash of the token to find.
 
         Returns:
             RefreshTokenData if found and not revoked, None otherwise.
@@ -161,25 +164,50 @@ class RefreshTokenRepository(Protocol):
         """
         ...
 
+    async def delete_expired(
+        self,
+        *,
+        before: datetime,
+        limit: int | None = None,
+    ) -> int:
+        """Delete refresh tokens that expired before a point in time.
+
+        Called by the maintenance sweep. Tokens of deleted sessions are
+        already removed by cascade; this catches expired tokens whose
+        session is still present.
+
+        Args:
+            before: Delete tokens with expires_at before this time.
+            limit: Maximum tokens deleted by this call (None = all).
+
+        Returns:
+            Number of tokens deleted.
+        """
+        ...
+
     async def find_by_token_verification(
         self,
         token: str,
-        verify_fn: Callable[[str, str], bool],
+        verify_fn: Callable[[str, str], Awaitable[bool]],
+        *,
+        selector: str | None = None,
     ) -> RefreshTokenData | None:
-        """Find refresh token by verifying against stored hashes.
+        """Find refresh token by selector and verify it against its hash.
 
-        Since bcrypt hashes are non-deterministic, we cannot look up by hash.
-        This method iterates through active tokens and verifies each one.
+        With a selector this is one indexed lookup plus one verification.
+        Without one (legacy tokens issued before the selector/verifier
+        format) it falls back to verifying each active, unexpired legacy
+        token; that set only shrinks as legacy tokens rotate or expire.
+        Tokens that are neither selector nor legacy length return None
+        without verifying anything.
 
         Args:
             token: Plain refresh token from user request.
-            verify_fn: Function to verify token against hash (token, hash) -> bool.
+            verify_fn: Async function to verify token against hash
+                (token, hash) -> bool.
+            selector: Lookup ID extracted from the token, or None for legacy.
 
         Returns:
             RefreshTokenData if found and verified, None otherwise.
-
-        Note:
-            For MVP this iterates all active tokens. For production scale,
-            consider adding a deterministic lookup identifier.
         """
         ...
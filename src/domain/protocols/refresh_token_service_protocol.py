@@ -28,8 +28,20 @@ class RefreshTokenServiceProtocol(Protocol):
 
         Returns:
             Tuple of (token, token_hash):
-                - token: Plain token to return to user (urlsafe base64)
-                - token_hash: Bcrypt hash to store in database
+                - token: Plain token to return to user (selector + verifier)
+                - token_hash: Keyed hash to store in database
+        """
+        ...
+
+    def get_selector(self, token: str) -> str | None:
+        """Extract the non-secret lookup selector from a token.
+
+        Args:
+            token: Plain token from user request.
+
+        Returns:
+            Selector to look the token up by, or None for legacy tokens
+            issued without one.
         """
         ...
 
@@ -38,7 +50,22 @@ class RefreshTokenServiceProtocol(Protocol):
 
         Args:
             token: Plain token from user request.
-            token_hash: Bcrypt hash from database.
+            token_hash: Stored hash from database.
+
+        Returns:
+            True if token matches hash, False otherwise.
+        """
+        ...
+
+    async def verify_token_async(self, token: str, token_hash: str) -> bool:
+        """Verify token against stored hash without blocking the event loop.
+
+        Implementations run slow (legacy bcrypt) checks in a worker pool.
+        Async handlers MUST use this instead of verify_token().
+
+        Args:
+            token: Plain token from user request.
+            token_hash: Stored hash from database.
 
         Returns:
             True if token matches hash, False otherwise.
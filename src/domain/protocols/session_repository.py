@@ -218,6 +218,8 @@ class SessionRepository(Protocol):
         self,
         *,
         before: datetime | None = None,
+        revoked_before: datetime | None = None,
+        limit: int | None = None,
     ) -> int:
         """Clean up expired sessions (batch operation).
 
@@ -226,6 +228,8 @@ class SessionRepository(Protocol):
         Args:
             before: Delete sessions expired before this time.
                    Defaults to now.
+            revoked_before: Also delete sessions revoked before this time.
+            limit: Maximum sessions deleted by this call (None = all).
 
         Returns:
             Number of sessions cleaned up.
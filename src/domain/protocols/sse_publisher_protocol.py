@@ -14,6 +14,7 @@ Reference:
     - docs/architecture/sse-architecture.md
 """
 
+from collections.abc import Sequence
 from typing import Protocol
 from uuid import UUID
 
@@ -81,6 +82,33 @@ class SSEPublisherProtocol(Protocol):
         """
         ...
 
+    async def publish_many(self, events: Sequence[SSEEvent]) -> None:
+        """Publish a batch of SSE events in one round trip.
+
+        Use for bursts of events produced together (e.g., import progress,
+        per-account results of a multi-account sync) instead of awaiting
+        publish() once per event.
+
+        Args:
+            events: SSE events to publish, in order. Each is routed to the
+                channel of its own user_id.
+
+        Note:
+            Same fail-open behavior as publish(). A failure of one event is
+            logged without dropping the rest of the batch.
+
+        Example:
+            >>> await publisher.publish_many([
+            ...     SSEEvent(
+            ...         event_type=SSEEventType.SYNC_TRANSACTIONS_COMPLETED,
+            ...         user_id=user_id,
+            ...         data={"account_id": str(account_id), "created": 12},
+            ...     )
+            ...     for account_id in account_ids
+            ... ])
+        """
+        ...
+
     async def broadcast(self, event: SSEEvent) -> None:
         """Broadcast SSE event to all connected clients.
 
@@ -8,7 +8,7 @@ Architecture:
     - Protocol-based (structural typing, no inheritance)
     - Async generator for streaming events
     - Category filtering for client subscriptions
-    - Last-Event-ID support for reconnection replay
+    - Last-Event-ID support for reconnection replay (paged)
 
 Reference:
     - docs/architecture/sse-architecture.md
@@ -117,6 +117,41 @@ class SSESubscriberProtocol(Protocol):
         """
         ...
 
+    async def replay_missed_events(
+        self,
+        user_id: UUID,
+        last_event_id: UUID,
+        categories: list[str] | None = None,
+    ) -> AsyncIterator[SSEEvent]:
+        """Stream events missed since last_event_id (paged reconnection replay).
+
+        Streaming variant of get_missed_events(): resumes directly after
+        last_event_id and fetches large gaps page by page instead of
+        materializing the whole backlog.
+
+        Args:
+            user_id: User ID to get events for.
+            last_event_id: Last event ID received by client.
+            categories: Optional category filter.
+
+        Yields:
+            SSEEvent: Events published after last_event_id, oldest first.
+
+        Note:
+            - Yields nothing if retention is disabled or last_event_id is unknown
+            - Only yields events within retention window (TTL)
+
+        Example:
+            >>> async for event in subscriber.replay_missed_events(
+            ...     user_id=user_id,
+            ...     last_event_id=UUID("01234567-..."),
+            ... ):
+            ...     yield event.to_sse_format()
+        """
+        ...
+        # Make this a generator
+        yield  # type: ignore[misc]
+
     def filter_by_categories(
         self,
         event: SSEEvent,
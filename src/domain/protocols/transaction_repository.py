@@ -3,6 +3,8 @@
 Defines the interface for transaction persistence operations.
 """
 
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from datetime import date
 from typing import Protocol
 from uuid import UUID
@@ -11,6 +13,23 @@ from src.domain.entities.transaction import Transaction
 from src.domain.enums.transaction_type import TransactionType
 
 
+@dataclass(frozen=True)
+class TransactionCursor:
+    """Keyset position in an account's transaction listing.
+
+    Identifies the last transaction of a page. Listings are ordered by
+    (transaction_date DESC, id DESC), so the pair is unique and the next
+    page starts strictly after it.
+
+    Attributes:
+        transaction_date: Date of the last transaction returned.
+        transaction_id: ID of the last transaction returned (tie-breaker).
+    """
+
+    transaction_date: date
+    transaction_id: UUID
+
+
 class TransactionRepository(Protocol):
     """Protocol for transaction persistence operations.
 
@@ -73,6 +92,64 @@ class TransactionRepository(Protocol):
         """
         ...
 
+    async def find_page_by_account(
+        self,
+        account_id: UUID,
+        limit: int = 50,
+        after: TransactionCursor | None = None,
+        transaction_type: TransactionType | None = None,
+    ) -> list[Transaction]:
+        """Find one page of an account's transactions by keyset.
+
+        Returns transactions ordered by (transaction_date DESC, id DESC),
+        starting strictly after ``after``. Unlike OFFSET paging, the cost of
+        a page does not grow with its depth.
+
+        Args:
+            account_id: Account identifier to query.
+            limit: Maximum number of transactions to return (default 50).
+            after: Position of the last transaction of the previous page
+                (None for the first page).
+            transaction_type: Optional filter by transaction type.
+
+        Returns:
+            List of transactions (empty list if none found).
+
+        Example:
+            >>> page = await repo.find_page_by_account(account_id, limit=50)
+            >>> last = page[-1]
+            >>> more = await repo.find_page_by_account(
+            ...     account_id,
+            ...     limit=50,
+            ...     after=TransactionCursor(last.transaction_date, last.id),
+            ... )
+        """
+        ...
+
+    def stream_by_account(
+        self,
+        account_id: UUID,
+        transaction_type: TransactionType | None = None,
+    ) -> AsyncIterator[Transaction]:
+        """Stream all of an account's transactions.
+
+        Rows are fetched incrementally (server-side cursor), so exports of
+        large accounts never hold the full list in memory. Same ordering as
+        find_page_by_account().
+
+        Args:
+            account_id: Account identifier to query.
+            transaction_type: Optional filter by transaction type.
+
+        Yields:
+            Transaction: Transactions, most recent first.
+
+        Example:
+            >>> async for transaction in repo.stream_by_account(account_id):
+            ...     writer.writerow(...)
+        """
+        ...
+
     async def find_by_account_and_type(
         self,
         account_id: UUID,
@@ -158,6 +235,24 @@ class TransactionRepository(Protocol):
         """
         ...
 
+    async def find_provider_transaction_ids(self, account_id: UUID) -> set[str]:
+        """Find all provider transaction IDs stored for an account.
+
+        Single-query prefetch for bulk sync/import deduplication, replacing
+        one find_by_provider_transaction_id() call per incoming transaction.
+
+        Args:
+            account_id: Account identifier to query.
+
+        Returns:
+            Set of provider_transaction_id values (empty set if none).
+
+        Example:
+            >>> existing_ids = await repo.find_provider_transaction_ids(account_id)
+            >>> new = [t for t in incoming if t.provider_transaction_id not in existing_ids]
+        """
+        ...
+
     async def find_security_transactions(
         self,
         account_id: UUID,
@@ -222,6 +317,30 @@ class TransactionRepository(Protocol):
         """
         ...
 
+    async def bulk_insert(
+        self,
+        transactions: list[Transaction],
+        chunk_size: int = 500,
+    ) -> int:
+        """Insert new transactions in chunks within a single transaction.
+
+        Rows whose (account_id, provider_transaction_id) already exist are
+        skipped, so callers can prefetch existing IDs, insert the remainder,
+        and stay correct if another sync inserted the same rows concurrently.
+
+        Args:
+            transactions: Transaction entities to insert.
+            chunk_size: Maximum rows per INSERT statement (default 500).
+
+        Returns:
+            Number of rows actually inserted.
+
+        Example:
+            >>> inserted = await repo.bulk_insert(new_transactions)
+            >>> skipped = len(new_transactions) - inserted
+        """
+        ...
+
     async def delete(self, transaction_id: UUID) -> None:
         """Delete a transaction.
 
@@ -9,6 +9,7 @@ from src.domain.providers.registry import (
     ProviderCategory,
     ProviderMetadata,
     get_all_provider_slugs,
+    get_file_import_providers,
     get_oauth_providers,
     get_provider_metadata,
     get_providers_by_category,
@@ -26,6 +27,7 @@ __all__ = [
     "get_provider_metadata",
     "get_all_provider_slugs",
     "get_oauth_providers",
+    "get_file_import_providers",
     "get_providers_by_category",
     "get_statistics",
 ]
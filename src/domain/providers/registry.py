@@ -181,6 +181,10 @@ class ProviderMetadata:
             Helpful for developers adding new provider support.
         is_production_ready: Whether provider is ready for production use.
             False for experimental/in-development providers (default: True).
+        max_concurrent_requests: Provider API calls allowed in flight at once
+            per worker process (e.g., parallel per-account fetches during
+            sync). Keep well below the provider's published rate limit
+            (default: 1, i.e. sequential).
 
     Example:
         >>> metadata = ProviderMetadata(
@@ -216,6 +220,9 @@ class ProviderMetadata:
     documentation_url: str | None = None
     is_production_ready: bool = True
 
+    # Rate limiting (per worker process)
+    max_concurrent_requests: int = 1
+
 
 # =============================================================================
 # Provider Registry (Single Source of Truth)
@@ -235,6 +242,7 @@ PROVIDER_REGISTRY: list[ProviderMetadata] = [
         required_settings=["schwab_api_key", "schwab_api_secret"],
         documentation_url="https://developer.schwab.com",
         is_production_ready=True,
+        max_concurrent_requests=4,  # 120 requests/minute per app
     ),
     ProviderMetadata(
         slug="alpaca",
@@ -249,6 +257,7 @@ PROVIDER_REGISTRY: list[ProviderMetadata] = [
         required_settings=[],  # API key passed per-request, not in settings
         documentation_url="https://alpaca.markets/docs",
         is_production_ready=True,
+        max_concurrent_requests=4,  # 200 requests/minute per account
     ),
     ProviderMetadata(
         slug="chase_file",
@@ -336,6 +345,24 @@ def get_oauth_providers() -> list[str]:
     return [p.slug for p in PROVIDER_REGISTRY if p.auth_type == ProviderAuthType.OAUTH]
 
 
+def get_file_import_providers() -> list[str]:
+    """Get slugs of all file import providers.
+
+    File import providers parse uploaded statements and implement
+    FileProviderProtocol (single-pass parse_file()).
+
+    Returns:
+        List of file import provider slugs (e.g., ["chase_file"]).
+
+    Example:
+        >>> file_slugs = get_file_import_providers()
+        >>> is_file_import = provider_slug in file_slugs
+    """
+    return [
+        p.slug for p in PROVIDER_REGISTRY if p.auth_type == ProviderAuthType.FILE_IMPORT
+    ]
+
+
 def get_providers_by_category(category: ProviderCategory) -> list[ProviderMetadata]:
     """Get all providers in a specific category.
 
@@ -4,6 +4,10 @@ This module contains concrete implementations of audit protocols
 for different database backends.
 """
 
+from src.infrastructure.audit.batched_writer import (
+    DURABLE_AUDIT_ACTIONS,
+    BatchedAuditWriter,
+)
 from src.infrastructure.audit.postgres_adapter import PostgresAuditAdapter
 
-__all__ = ["PostgresAuditAdapter"]
+__all__ = ["BatchedAuditWriter", "DURABLE_AUDIT_ACTIONS", "PostgresAuditAdapter"]
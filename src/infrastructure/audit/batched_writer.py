@@ -0,0 +1,436 @@
+"""Batched audit writer (asynchronous, with durable mode).
+
+Queues audit records in memory and writes them with one multi-row INSERT per
+batch from a background flusher, instead of one ``session.add`` + ``commit``
+per record in the request path. A login's ATTEMPTED/SUCCESS records cost a
+list append; the database sees one statement per batch.
+
+Durability:
+    - Durable records (``DURABLE_AUDIT_ACTIONS`` or ``durable=True``) are
+      written before ``record()`` returns: the caller waits for the batch
+      that contains the record (group commit with concurrent records)
+    - Queued records are written within ``flush_interval_seconds`` or as
+      soon as ``batch_size`` records are waiting
+    - Failed batches are retried (up to ``AUDIT_WRITE_MAX_ATTEMPTS`` flushes)
+      before records are dropped and logged at error level
+    - ``aclose()`` drains the queue on shutdown
+    - A full queue makes ``record()`` wait for a flush (backpressure, no loss);
+      if that flush fails, the record is written inline and its failure
+      returned, so the queue never grows past ``max_queue_size``
+    - Without a running flusher (scripts, tests) every record is written
+      inline, exactly like PostgresAuditAdapter
+
+    Queued records live only in process memory until flushed: a hard crash
+    loses at most one flush interval of non-durable records.
+
+Architecture:
+    - Infrastructure adapter (same table and immutability rules as
+      PostgresAuditAdapter; uses its own short-lived sessions)
+    - App-scoped singleton (see get_audit_writer())
+    - Not thread-safe: used from the event loop only
+
+Reference:
+    - docs/architecture/audit.md
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import insert
+
+from src.core.constants import AUDIT_WRITE_MAX_ATTEMPTS
+from src.core.enums import ErrorCode
+from src.core.result import Failure, Result, Success
+from src.domain.enums import AuditAction
+from src.domain.errors import AuditError
+from src.domain.protocols.logger_protocol import LoggerProtocol
+from src.infrastructure.persistence.database import Database
+from src.infrastructure.persistence.models.audit_log import AuditLog
+
+DURABLE_AUDIT_ACTIONS: frozenset[AuditAction] = frozenset(
+    {
+        # Changes to authentication mechanisms (PCI-DSS 10.2.5)
+        AuditAction.USER_PASSWORD_CHANGED,
+        AuditAction.USER_PASSWORD_RESET_COMPLETED,
+        AuditAction.USER_MFA_ENABLED,
+        AuditAction.USER_MFA_DISABLED,
+        AuditAction.GLOBAL_TOKEN_ROTATION_SUCCEEDED,
+        AuditAction.USER_TOKEN_ROTATION_SUCCEEDED,
+        AuditAction.ALL_SESSIONS_REVOKED,
+        # Privilege changes (SOC 2 CC6.1)
+        AuditAction.PERMISSION_CHANGED,
+        AuditAction.ROLE_ASSIGNED,
+        AuditAction.ROLE_REVOKED,
+        # Administrative actions (PCI-DSS 10.2.2)
+        AuditAction.ADMIN_USER_CREATED,
+        AuditAction.ADMIN_USER_DELETED,
+        AuditAction.ADMIN_USER_SUSPENDED,
+        AuditAction.ADMIN_CONFIG_CHANGED,
+        # Personal data export/deletion (GDPR Article 30)
+        AuditAction.DATA_EXPORTED,
+        AuditAction.DATA_DELETED,
+    }
+)
+"""Actions that must be persisted before the request returns."""
+
+
+@dataclass(slots=True)
+class _PendingRecord:
+    """One queued audit row and its waiter (durable records only)."""
+
+    row: dict[str, Any]
+    done: "asyncio.Future[Result[None, AuditError]] | None" = None
+    attempts: int = field(default=0)
+
+
+@dataclass(frozen=True, kw_only=True)
+class AuditWriterStats:
+    """Point-in-time audit writer statistics.
+
+    Attributes:
+        queued_records: Records waiting to be written.
+        max_queue_size: Queue bound before record() waits for a flush.
+        written_records: Records persisted (lifetime).
+        durable_records: Queued durable records written before record()
+            returned (lifetime; inline writes count as written only).
+        dropped_records: Records given up after repeated failures (lifetime).
+        batches: Successful INSERT batches (lifetime).
+        failed_batches: Failed INSERT batches (lifetime).
+        last_flush_latency_ms: Duration of the most recent batch write.
+        max_flush_latency_ms: Slowest batch write (lifetime).
+    """
+
+    queued_records: int
+    max_queue_size: int
+    written_records: int
+    durable_records: int
+    dropped_records: int
+    batches: int
+    failed_batches: int
+    last_flush_latency_ms: float
+    max_flush_latency_ms: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to dictionary.
+
+        Returns:
+            Dictionary with writer counters.
+        """
+        return asdict(self)
+
+
+class BatchedAuditWriter:
+    """Audit writer with a background batch flusher.
+
+    Attributes:
+        _database: Database used to open one session per batch.
+        _logger: Logger for flush failures and dropped records.
+        _batch_size: Max rows per INSERT.
+        _flush_interval: Max seconds a queued record waits.
+        _max_queue_size: Queue bound (backpressure).
+        _batching: False writes every record inline (durable).
+        _durable_actions: Actions written before record() returns.
+        _pending: Records waiting to be written (FIFO).
+
+    Example:
+        >>> writer = BatchedAuditWriter(database=get_database(), logger=logger)
+        >>> writer.start()  # In application lifespan
+        >>> await writer.record(
+        ...     action=AuditAction.USER_LOGIN_SUCCESS,
+        ...     resource_type="session",
+        ...     user_id=user_id,
+        ... )
+        >>> await writer.aclose()  # Drains the queue
+    """
+
+    def __init__(
+        self,
+        *,
+        database: Database,
+        logger: LoggerProtocol,
+        batch_size: int = 500,
+        flush_interval_seconds: float = 0.5,
+        max_queue_size: int = 10_000,
+        batching_enabled: bool = True,
+        durable_actions: frozenset[AuditAction] = DURABLE_AUDIT_ACTIONS,
+    ) -> None:
+        """Initialize the writer (call start() to run the flusher).
+
+        Args:
+            database: Database for audit sessions (independent of requests).
+            logger: Logger for flush failures.
+            batch_size: Max rows per INSERT; a full batch flushes immediately.
+            flush_interval_seconds: Max wait before a queued record is written.
+            max_queue_size: Queued records before record() waits for a flush.
+            batching_enabled: False writes every record inline.
+            durable_actions: Actions written before record() returns.
+        """
+        self._database = database
+        self._logger = logger
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_seconds
+        self._max_queue_size = max_queue_size
+        self._batching = batching_enabled
+        self._durable_actions = durable_actions
+        self._pending: deque[_PendingRecord] = deque()
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._closing = False
+        self._written = 0
+        self._durable = 0
+        self._dropped = 0
+        self._batches = 0
+        self._failed_batches = 0
+        self._last_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        """True while the background flusher accepts queued records."""
+        return self._task is not None and not self._task.done() and not self._closing
+
+    def start(self) -> None:
+        """Start the background flusher (idempotent)."""
+        if not self._batching or self.running:
+            return
+        self._closing = False
+        self._task = asyncio.create_task(self._run(), name="audit-writer")
+
+    async def aclose(self) -> None:
+        """Stop the flusher and write every queued record."""
+        self._closing = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        # Records that raced the shutdown
+        await self._drain()
+
+    async def record(
+        self,
+        *,
+        action: AuditAction,
+        resource_type: str,
+        user_id: UUID | None = None,
+        resource_id: UUID | None = None,
+        ip_address: str | None = None,
+        user_agent: str | None = None,
+        context: dict[str, Any] | None = None,
+        durable: bool | None = None,
+    ) -> Result[None, AuditError]:
+        """Queue an immutable audit entry (or write it before returning).
+
+        Same arguments as AuditProtocol.record(), plus ``durable``.
+
+        Args:
+            action: What happened (enum for type safety).
+            resource_type: What was affected (user, account, provider, etc.).
+            user_id: Who performed the action (None for system actions).
+            resource_id: Specific resource identifier (optional).
+            ip_address: Client IP address (required for auth events).
+            user_agent: Client user agent string (browser/app info).
+            context: Additional event context (stored as JSONB).
+            durable: Persist before returning. None (default) decides by
+                action (``DURABLE_AUDIT_ACTIONS``).
+
+        Returns:
+            Result[None, AuditError]:
+                - Success(None) if queued, or written (durable/inline)
+                - Failure(AuditError) if a durable/inline write failed
+        """
+        if durable is None:
+            durable = action in self._durable_actions
+        pending = _PendingRecord(
+            row={
+                "action": action.value,
+                "user_id": user_id,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+                "context": context,
+            }
+        )
+
+        if not self.running:
+            # No flusher: write inline (same guarantee as PostgresAuditAdapter)
+            return await self._write_inline(pending)
+
+        if len(self._pending) >= self._max_queue_size:
+            # Backpressure: make room instead of dropping records
+            await self.flush()
+            if len(self._pending) >= self._max_queue_size:
+                # Flush failed (database down): keep the queue bounded and
+                # return this record's failure to the caller
+                return await self._write_inline(pending)
+
+        if durable:
+            pending.done = asyncio.get_running_loop().create_future()
+        self._pending.append(pending)
+        if durable or len(self._pending) >= self._batch_size:
+            self._wakeup.set()
+
+        if pending.done is None:
+            return Success(value=None)
+        result = await pending.done
+        if isinstance(result, Success):
+            self._durable += 1
+        return result
+
+    async def flush(self) -> None:
+        """Write queued records in batches until the queue is empty.
+
+        Stops at the first failed batch; its records stay queued for the
+        next flush (durable waiters receive the failure immediately).
+        """
+        async with self._flush_lock:
+            while self._pending:
+                batch = [
+                    self._pending.popleft()
+                    for _ in range(min(self._batch_size, len(self._pending)))
+                ]
+                if not await self._write_batch(batch):
+                    break
+
+    def get_stats(self) -> AuditWriterStats:
+        """Get writer statistics.
+
+        Returns:
+            Snapshot of queue depth and write counters.
+        """
+        return AuditWriterStats(
+            queued_records=len(self._pending),
+            max_queue_size=self._max_queue_size,
+            written_records=self._written,
+            durable_records=self._durable,
+            dropped_records=self._dropped,
+            batches=self._batches,
+            failed_batches=self._failed_batches,
+            last_flush_latency_ms=self._last_flush_ms,
+            max_flush_latency_ms=self._max_flush_ms,
+        )
+
+    async def _run(self) -> None:
+        """Flush on interval, on a full batch, or when a durable record waits."""
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._flush_interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                # Keep the flusher alive; records stay queued
+                self._logger.error(
+                    "audit_writer_flush_error",
+                    error_type=type(e).__name__,
+                    error_message=str(e),
+                )
+        await self._drain()
+
+    async def _drain(self) -> None:
+        """Flush until the queue is empty (bounded retries on failure)."""
+        for _ in range(AUDIT_WRITE_MAX_ATTEMPTS):
+            await self.flush()
+            if not self._pending:
+                return
+        # Database still failing at shutdown: drop and log what is left
+        self._drop(list(self._pending), reason="shutdown")
+        self._pending.clear()
+
+    async def _write_inline(self, pending: _PendingRecord) -> Result[None, AuditError]:
+        """Write one record immediately (no flusher running)."""
+        result = await self._insert([pending.row])
+        if isinstance(result, Success):
+            self._written += 1
+        return result
+
+    async def _write_batch(self, batch: list[_PendingRecord]) -> bool:
+        """Write one batch and settle its records.
+
+        Args:
+            batch: Records taken from the head of the queue.
+
+        Returns:
+            True if written; False if the batch failed (records requeued).
+        """
+        start = time.perf_counter()
+        result = await self._insert([pending.row for pending in batch])
+        self._last_flush_ms = (time.perf_counter() - start) * 1000
+        self._max_flush_ms = max(self._max_flush_ms, self._last_flush_ms)
+
+        if isinstance(result, Success):
+            self._batches += 1
+            self._written += len(batch)
+            for pending in batch:
+                if pending.done is not None and not pending.done.done():
+                    pending.done.set_result(result)
+            return True
+
+        self._failed_batches += 1
+        retry: list[_PendingRecord] = []
+        exhausted: list[_PendingRecord] = []
+        for pending in batch:
+            if pending.done is not None:
+                # Durable: the caller gets the failure (as with inline writes)
+                if not pending.done.done():
+                    pending.done.set_result(result)
+                continue
+            pending.attempts += 1
+            if pending.attempts < AUDIT_WRITE_MAX_ATTEMPTS:
+                retry.append(pending)
+            else:
+                exhausted.append(pending)
+        # Keep FIFO order: retried records go back to the head of the queue
+        self._pending.extendleft(reversed(retry))
+        self._drop(exhausted, reason="max_attempts")
+        return False
+
+    def _drop(self, records: list[_PendingRecord], *, reason: str) -> None:
+        """Give up on records and log them (no silent audit loss)."""
+        for pending in records:
+            self._dropped += 1
+            self._logger.error(
+                "audit_record_dropped",
+                reason=reason,
+                action=pending.row["action"],
+                resource_type=pending.row["resource_type"],
+                user_id=str(pending.row["user_id"]) if pending.row["user_id"] else None,
+            )
+
+    async def _insert(self, rows: list[dict[str, Any]]) -> Result[None, AuditError]:
+        """Insert rows with one multi-row INSERT in its own transaction.
+
+        Args:
+            rows: Column values per audit record.
+
+        Returns:
+            Success(None) or Failure(AuditError).
+        """
+        try:
+            async with self._database.get_session() as session:
+                await session.execute(insert(AuditLog), rows)
+            return Success(value=None)
+        except Exception as e:
+            self._logger.warning(
+                "audit_batch_write_failed",
+                rows=len(rows),
+                error_type=type(e).__name__,
+                error_message=str(e),
+            )
+            return Failure(
+                error=AuditError(
+                    message=f"Failed to record audit log: {str(e)}",
+                    code=ErrorCode.AUDIT_RECORD_FAILED,
+                    details={
+                        "rows": str(len(rows)),
+                        "error_type": type(e).__name__,
+                    },
+                )
+            )
@@ -4,6 +4,7 @@ This adapter provides RBAC authorization using Casbin with:
 - AsyncEnforcer for async policy checks
 - PostgreSQL adapter for persistent policy storage
 - Redis caching for performance (5-min TTL)
+- Optional in-process L1 tier in front of Redis (short TTL)
 - Audit trail for all authorization events
 - Domain events for role changes
 
@@ -31,15 +32,21 @@ from src.domain.events import (
     RoleRevocationFailed,
     RoleRevocationSucceeded,
 )
+from src.infrastructure.cache.cache_metrics import TIER_L1, TIER_L2
 
 if TYPE_CHECKING:
     from src.domain.protocols.audit_protocol import AuditProtocol
+    from src.domain.protocols.cache_invalidation_protocol import (
+        CacheInvalidationProtocol,
+    )
+    from src.domain.protocols.cache_metrics_protocol import CacheMetricsProtocol
     from src.domain.protocols.cache_protocol import CacheProtocol
     from src.domain.protocols.event_bus_protocol import EventBusProtocol
     from src.domain.protocols.logger_protocol import LoggerProtocol
+    from src.infrastructure.cache.local_cache import LocalTTLCache
 
 
-# Cache key prefix and TTL
+# Cache key prefix and TTL (also the local tier / metrics namespace)
 CACHE_PREFIX = "authz"
 CACHE_TTL_SECONDS = 300  # 5 minutes
 
@@ -54,6 +61,8 @@ class CasbinAdapter:
         - AsyncEnforcer: Async Casbin enforcer for FastAPI
         - PostgreSQL Adapter: Persistent policy storage (casbin_rule table)
         - Redis Cache: 5-minute TTL for permission results
+        - Local Cache (optional): per-process L1 tier, invalidated in every
+          worker on role changes
         - Audit Integration: All checks logged
         - Event Bus: Role changes emit domain events
 
@@ -67,6 +76,9 @@ class CasbinAdapter:
         _audit: Audit adapter for logging authorization checks.
         _event_bus: Event bus for domain events.
         _logger: Structured logger.
+        _local: Optional in-process L1 tier for permission results.
+        _invalidation: Broadcasts L1 invalidations to other processes.
+        _metrics: Optional per-tier hit/miss tracking.
     """
 
     def __init__(
@@ -76,6 +88,9 @@ class CasbinAdapter:
         audit: "AuditProtocol",
         event_bus: "EventBusProtocol",
         logger: "LoggerProtocol",
+        local_cache: "LocalTTLCache | None" = None,
+        invalidation: "CacheInvalidationProtocol | None" = None,
+        metrics: "CacheMetricsProtocol | None" = None,
     ) -> None:
         """Initialize adapter with dependencies.
 
@@ -85,12 +100,18 @@ class CasbinAdapter:
             audit: Audit adapter for logging.
             event_bus: Event bus for domain events.
             logger: Structured logger.
+            local_cache: Optional app-scoped L1 tier (None disables it).
+            invalidation: Cross-process invalidation for the L1 tier.
+            metrics: Optional metrics tracker ("authz:l1"/"authz:l2").
         """
         self._enforcer = enforcer
         self._cache = cache
         self._audit = audit
         self._event_bus = event_bus
         self._logger = logger
+        self._local = local_cache
+        self._invalidation = invalidation
+        self._metrics = metrics
 
     async def check_permission(
         self,
@@ -100,8 +121,8 @@ class CasbinAdapter:
     ) -> bool:
         """Check if user has permission for resource/action.
 
-        Checks cache first, then Casbin enforcer. Results are cached
-        and all checks are audited.
+        Checks the local tier, then Redis, then the Casbin enforcer.
+        Results are cached and all enforcer checks are audited.
 
         Args:
             user_id: User's UUID.
@@ -112,11 +133,27 @@ class CasbinAdapter:
             bool: True if allowed, False if denied.
         """
         cache_key = f"{CACHE_PREFIX}:{user_id}:{resource}:{action}"
+        local_key = f"{user_id}:{resource}:{action}"
+        user_group = str(user_id)
+
+        # 1. Check local (L1) tier, then Redis
+        generation = None
+        if self._local is not None:
+            cached = self._local.get(local_key)
+            if cached is not None:
+                self._record(TIER_L1, hit=True)
+                return bool(cached)
+            self._record(TIER_L1, hit=False)
+            generation = self._local.generation
 
-        # 1. Check cache first
         cache_result = await self._cache.get(cache_key)
         if isinstance(cache_result, Success) and cache_result.value is not None:
             allowed = cache_result.value == "1"
+            self._record(TIER_L2, hit=True)
+            if self._local is not None:
+                self._local.set(
+                    local_key, allowed, group=user_group, generation=generation
+                )
             self._logger.debug(
                 "authorization_cache_hit",
                 user_id=str(user_id),
@@ -125,6 +162,7 @@ class CasbinAdapter:
                 allowed=allowed,
             )
             return allowed
+        self._record(TIER_L2, hit=False)
 
         # 2. Check with Casbin enforcer
         # Note: enforce() is synchronous in Casbin, even with AsyncEnforcer
@@ -142,12 +180,15 @@ class CasbinAdapter:
             )
             allowed = False
 
-        # 3. Cache result
-        await self._cache.set(
+        # 3. Cache result (tagged for per-user invalidation)
+        await self._cache.set_with_tags(
             cache_key,
             "1" if allowed else "0",
+            tags=[self._user_cache_tag(user_id)],
             ttl=CACHE_TTL_SECONDS,
         )
+        if self._local is not None:
+            self._local.set(local_key, allowed, group=user_group, generation=generation)
 
         # 4. Audit the check
         audit_action = (
@@ -425,17 +466,18 @@ class CasbinAdapter:
         """Invalidate all cached permissions for user.
 
         Called after role changes to ensure fresh permission checks.
+        Drops the user's tag set instead of scanning for authz:{user_id}:*.
 
         Args:
             user_id: User whose cache should be invalidated.
         """
-        pattern = f"{CACHE_PREFIX}:{user_id}:*"
+        tag = self._user_cache_tag(user_id)
         try:
-            await self._cache.delete_pattern(pattern)
+            await self._cache.invalidate_tag(tag)
             self._logger.debug(
                 "cache_invalidated",
                 user_id=str(user_id),
-                pattern=pattern,
+                tag=tag,
             )
         except Exception as e:
             # Log but don't fail - cache miss is safe
@@ -444,3 +486,36 @@ class CasbinAdapter:
                 user_id=str(user_id),
                 error=str(e),
             )
+
+        # Then drop L1 results in every worker, not just this one (fail-open)
+        if self._invalidation is not None:
+            await self._invalidation.invalidate(CACHE_PREFIX, groups=[str(user_id)])
+        elif self._local is not None:
+            self._local.invalidate_group(str(user_id))
+
+    def _record(self, tier: str, *, hit: bool) -> None:
+        """Record a hit or miss for one permission cache tier.
+
+        Args:
+            tier: TIER_L1 or TIER_L2.
+            hit: True for a hit, False for a miss.
+        """
+        if self._metrics is None:
+            return
+        namespace = f"{CACHE_PREFIX}:{tier}"
+        if hit:
+            self._metrics.record_hit(namespace)
+        else:
+            self._metrics.record_miss(namespace)
+
+    @staticmethod
+    def _user_cache_tag(user_id: UUID) -> str:
+        """Tag grouping all cached permission results for a user.
+
+        Args:
+            user_id: User's UUID.
+
+        Returns:
+            Tag key (outside the authz:{user_id}:* key namespace).
+        """
+        return f"{CACHE_PREFIX}:tag:{user_id}"
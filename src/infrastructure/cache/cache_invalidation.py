@@ -0,0 +1,261 @@
+"""Redis pub/sub implementation of CacheInvalidationProtocol.
+
+Keeps the per-process (L1) cache tiers of all worker processes coherent.
+Writers call ``invalidate()``; the change is applied to the local tier
+immediately and published on a single Redis channel. Every process runs one
+listener task that applies messages published by other processes.
+
+Message Format (JSON):
+    {"origin": "<process id>", "namespace": "session" | "*",
+     "keys": [...], "groups": [...], "clear": false}
+
+Delivery Guarantees:
+    Redis pub/sub is at-most-once. Local entries expire after
+    CACHE_LOCAL_TTL seconds, and every (re)subscription clears all local
+    tiers, because messages published while disconnected are lost.
+
+Architecture:
+    - App-scoped singleton (one bus per worker process)
+    - Local tiers register by namespace at container wiring time
+    - Listener started at application startup, reconnects with backoff
+    - Publish is fail-open (Redis errors are logged, never raised)
+
+Reference:
+    - docs/architecture/cache-keys.md
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID, uuid4
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.core.constants import (
+    CACHE_INVALIDATION_CHANNEL,
+    CACHE_INVALIDATION_RECONNECT_MAX_DELAY_SECONDS,
+)
+from src.infrastructure.cache.local_cache import LocalTTLCache
+
+# Namespace wildcard: message applies to every registered local tier
+ALL_NAMESPACES = "*"
+
+
+class RedisCacheInvalidationBus:
+    """Broadcasts local cache invalidations to every worker process.
+
+    Note: Does NOT inherit from CacheInvalidationProtocol (structural typing).
+
+    Attributes:
+        redis_client: Async Redis client (one long-lived pub/sub connection).
+        _channel: Pub/sub channel name.
+        _origin: Random ID of this process (own messages are skipped).
+        _caches: Registered local tiers by namespace.
+        _listener: Background task reading from Redis pub/sub.
+        _ready: Set once the subscription is active.
+        _logger: Logger instance.
+
+    Example:
+        >>> bus = get_cache_invalidation_bus()
+        >>> bus.register("session", LocalTTLCache(max_entries=100, ttl_seconds=5))
+        >>> bus.start()  # application startup
+        >>> await bus.invalidate("session", keys=[str(session_id)])
+    """
+
+    def __init__(
+        self,
+        redis_client: "Redis[bytes]",  # type: ignore[type-arg]
+        channel: str = CACHE_INVALIDATION_CHANNEL,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        """Initialize invalidation bus (listener starts on start()).
+
+        Args:
+            redis_client: Async Redis client instance.
+            channel: Pub/sub channel name.
+            logger: Optional logger (creates default if not provided).
+        """
+        self.redis_client = redis_client
+        self._channel = channel
+        self._origin = uuid4().hex
+        self._logger = logger or logging.getLogger(__name__)
+        self._caches: dict[str, LocalTTLCache] = {}
+        self._listener: asyncio.Task[None] | None = None
+        self._ready = asyncio.Event()
+
+    def register(self, namespace: str, cache: LocalTTLCache) -> None:
+        """Register a local tier to receive invalidations.
+
+        Args:
+            namespace: Local cache namespace (e.g., "session").
+            cache: The process-local cache tier.
+        """
+        self._caches[namespace] = cache
+
+    async def invalidate(
+        self,
+        namespace: str,
+        *,
+        keys: Sequence[str] = (),
+        groups: Sequence[str] = (),
+    ) -> None:
+        """Drop entries locally and broadcast the invalidation.
+
+        Args:
+            namespace: Local cache namespace (e.g., "session").
+            keys: Entry keys to drop.
+            groups: Groups whose entries are all dropped (e.g., user IDs).
+        """
+        message = {
+            "namespace": namespace,
+            "keys": list(keys),
+            "groups": list(groups),
+            "clear": False,
+        }
+        self._apply(message)
+        await self._publish(message)
+
+    async def invalidate_user(self, user_id: UUID) -> None:
+        """Drop a user's entries from every local tier in every process.
+
+        Args:
+            user_id: User whose cached entries are stale.
+        """
+        await self.invalidate(ALL_NAMESPACES, groups=[str(user_id)])
+
+    async def invalidate_all(self) -> None:
+        """Drop every local entry in every process."""
+        message = {"namespace": ALL_NAMESPACES, "keys": [], "groups": [], "clear": True}
+        self._apply(message)
+        await self._publish(message)
+
+    def start(self) -> None:
+        """Start the pub/sub listener task if it is not running."""
+        if (
+            self._listener is None
+            or self._listener.done()
+            or self._listener.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._ready.clear()
+            self._listener = asyncio.create_task(
+                self._run(), name="cache-invalidation-listener"
+            )
+
+    async def wait_ready(self) -> None:
+        """Wait until the subscription is active (used by tests and startup)."""
+        await self._ready.wait()
+
+    async def aclose(self) -> None:
+        """Stop the listener task (call on application shutdown)."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        self._ready.clear()
+
+    async def _publish(self, message: dict[str, Any]) -> None:
+        """Publish an invalidation to other processes (fail-open).
+
+        Args:
+            message: Invalidation message without origin.
+        """
+        payload = json.dumps({"origin": self._origin, **message})
+        try:
+            await self.redis_client.publish(self._channel, payload)
+        except RedisError as e:
+            self._logger.warning(
+                "Failed to publish cache invalidation",
+                extra={
+                    "namespace": message["namespace"],
+                    "error": str(e),
+                },
+            )
+
+    async def _run(self) -> None:
+        """Read pub/sub messages forever, reconnecting on Redis errors."""
+        delay = 1
+        while True:
+            pubsub = self.redis_client.pubsub()
+            try:
+                await pubsub.subscribe(self._channel)
+                delay = 1
+
+                async for message in pubsub.listen():
+                    if message["type"] == "subscribe":
+                        # Anything published while unsubscribed was missed
+                        self._clear_all()
+                        self._ready.set()
+                        continue
+                    if message["type"] == "message":
+                        self._handle(message["data"])
+
+            except RedisError as e:
+                self._ready.clear()
+                self._logger.warning(
+                    "Cache invalidation listener lost Redis subscription, reconnecting",
+                    extra={
+                        "error": str(e),
+                        "error_type": type(e).__name__,
+                        "retry_in_seconds": delay,
+                    },
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, CACHE_INVALIDATION_RECONNECT_MAX_DELAY_SECONDS)
+            finally:
+                try:
+                    await pubsub.aclose()  # type: ignore[no-untyped-call]
+                except Exception as e:
+                    self._logger.warning(
+                        "Error closing cache invalidation subscription",
+                        extra={"error": str(e)},
+                    )
+
+    def _handle(self, data: bytes | str) -> None:
+        """Apply one message published by another process.
+
+        Args:
+            data: Raw JSON payload.
+        """
+        try:
+            message = json.loads(data)
+            if message["origin"] == self._origin:
+                return  # Already applied when published
+            self._apply(message)
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            self._logger.warning(
+                "Invalid cache invalidation message",
+                extra={"error": str(e)},
+            )
+
+    def _apply(self, message: dict[str, Any]) -> None:
+        """Apply an invalidation to the matching local tiers.
+
+        Args:
+            message: Decoded invalidation message.
+        """
+        namespace = message["namespace"]
+        if namespace == ALL_NAMESPACES:
+            caches = list(self._caches.values())
+        elif namespace in self._caches:
+            caches = [self._caches[namespace]]
+        else:
+            return
+
+        for cache in caches:
+            if message.get("clear"):
+                cache.clear()
+                continue
+            for key in message.get("keys", ()):
+                cache.delete(key)
+            for group in message.get("groups", ()):
+                cache.invalidate_group(group)
+
+    def _clear_all(self) -> None:
+        """Drop every entry from every registered local tier."""
+        for cache in self._caches.values():
+            cache.clear()
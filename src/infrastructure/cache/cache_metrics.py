@@ -20,6 +20,11 @@ from threading import Lock
 from typing import Any
 
 
+# Tier suffixes for two-tier caches ("session:l1", "session:l2")
+TIER_L1 = "l1"
+TIER_L2 = "l2"
+
+
 @dataclass
 class CacheStats:
     """Cache statistics for a specific cache namespace.
@@ -139,6 +144,30 @@ class CacheMetrics:
                 namespace: stats.to_dict() for namespace, stats in self._stats.items()
             }
 
+    def get_tier_stats(self, namespace: str) -> dict[str, Any]:
+        """Get per-tier statistics for a two-tier (L1 + L2) cache.
+
+        Each lookup is recorded once in "{namespace}:l1" (in-process tier)
+        and, on an L1 miss, once in "{namespace}:l2" (Redis). Without an L1
+        tier only "{namespace}:l2" is recorded.
+
+        Args:
+            namespace: Cache namespace (e.g., "session", "authz").
+
+        Returns:
+            Dictionary with l1 and l2 stats plus hit_rate (either tier).
+        """
+        with self._lock:
+            l1 = self._stats.get(f"{namespace}:{TIER_L1}", CacheStats())
+            l2 = self._stats.get(f"{namespace}:{TIER_L2}", CacheStats())
+            lookups = l1.total_requests or l2.total_requests
+            hits = l1.hits + l2.hits
+            return {
+                TIER_L1: l1.to_dict(),
+                TIER_L2: l2.to_dict(),
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            }
+
     def reset(self, namespace: str | None = None) -> None:
         """Reset metrics.
 
@@ -0,0 +1,185 @@
+"""In-process (L1) TTL + LRU cache tier.
+
+Sits in front of Redis (L2) for hot, small lookups that run on nearly every
+request: session revocation checks, provider connections, and authorization
+results. A hit costs a dict lookup instead of a Redis round trip plus JSON
+decode.
+
+Coherence:
+    Every worker process has its own tier, so writes elsewhere are announced
+    through RedisCacheInvalidationBus (Redis pub/sub). Entries also expire
+    after a short TTL, which bounds staleness when a message is missed.
+
+    Callers read ``generation`` before going to Redis and pass it back to
+    ``set()``. Any invalidation in between bumps the generation and the
+    (possibly stale) value is not stored.
+
+Architecture:
+    - Infrastructure-only helper (not a domain port)
+    - Not thread-safe: used from the event loop only
+    - Entries are grouped by owner (user ID) for bulk invalidation
+
+Reference:
+    - docs/architecture/cache-keys.md
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+
+class LocalTTLCache:
+    """Bounded per-process cache with TTL expiry and LRU eviction.
+
+    Attributes:
+        _max_entries: Entry bound (least recently used entry evicted first).
+        _ttl_seconds: Lifetime of an entry from the time it is stored.
+        _clock: Monotonic clock (injectable for tests).
+        _entries: key -> (expires_at, value, group), in LRU order.
+        _groups: group -> keys stored under that group.
+        _generation: Bumped on every invalidation.
+
+    Example:
+        >>> local = LocalTTLCache(max_entries=10_000, ttl_seconds=5)
+        >>> generation = local.generation
+        >>> value = await load_from_redis()
+        >>> local.set("key", value, group=str(user_id), generation=generation)
+        >>> local.get("key")
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache tier.
+
+        Args:
+            max_entries: Maximum number of entries kept.
+            ttl_seconds: Entry lifetime in seconds.
+            clock: Monotonic time source (default: time.monotonic).
+        """
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any, str | None]] = OrderedDict()
+        self._groups: dict[str, set[str]] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Invalidation counter (read before an L2 lookup, pass to set())."""
+        return self._generation
+
+    def __len__(self) -> int:
+        """Number of stored entries (including not yet purged expired ones)."""
+        return len(self._entries)
+
+    def get(self, key: str) -> Any | None:
+        """Get a live entry and mark it most recently used.
+
+        Args:
+            key: Entry key.
+
+        Returns:
+            Stored value, or None if missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value, _ = entry
+        if expires_at <= self._clock():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        *,
+        group: str | None = None,
+        generation: int | None = None,
+    ) -> bool:
+        """Store an entry, evicting the least recently used if full.
+
+        Args:
+            key: Entry key.
+            value: Value to store (treated as immutable by callers).
+            group: Optional owner group (e.g., user ID) for bulk invalidation.
+            generation: Generation read before loading ``value``. If an
+                invalidation happened since, the value is not stored.
+
+        Returns:
+            True if stored, False if skipped due to a concurrent invalidation.
+        """
+        if generation is not None and generation != self._generation:
+            return False
+
+        self._remove(key)
+        self._entries[key] = (self._clock() + self._ttl_seconds, value, group)
+        if group is not None:
+            self._groups.setdefault(group, set()).add(key)
+
+        while len(self._entries) > self._max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+        return True
+
+    def delete(self, key: str) -> bool:
+        """Drop one entry.
+
+        Args:
+            key: Entry key.
+
+        Returns:
+            True if an entry was removed.
+        """
+        self._generation += 1
+        return self._remove(key)
+
+    def invalidate_group(self, group: str) -> int:
+        """Drop every entry stored under a group.
+
+        Args:
+            group: Owner group (e.g., user ID).
+
+        Returns:
+            Number of entries removed.
+        """
+        self._generation += 1
+        keys = self._groups.pop(group, set())
+        for key in keys:
+            self._entries.pop(key, None)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._generation += 1
+        self._entries.clear()
+        self._groups.clear()
+
+    def _remove(self, key: str) -> bool:
+        """Remove an entry and its group membership.
+
+        Args:
+            key: Entry key.
+
+        Returns:
+            True if an entry was removed.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        group = entry[2]
+        if group is not None:
+            keys = self._groups.get(group)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._groups[group]
+        return True
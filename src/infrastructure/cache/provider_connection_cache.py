@@ -9,6 +9,8 @@ Key Patterns:
 Architecture:
     - Implements ProviderConnectionCache protocol (structural typing)
     - Uses CacheProtocol for low-level Redis operations
+    - Optional in-process L1 tier in front of Redis (short TTL), kept
+      coherent across workers via CacheInvalidationProtocol on every write
     - Returns None on cache miss (fail-open for resilience)
     - Database is always source of truth
 
@@ -26,11 +28,20 @@ from src.core.result import Success
 from src.domain.entities.provider_connection import ProviderConnection
 from src.domain.enums.connection_status import ConnectionStatus
 from src.domain.enums.credential_type import CredentialType
+from src.domain.protocols.cache_invalidation_protocol import (
+    CacheInvalidationProtocol,
+)
+from src.domain.protocols.cache_metrics_protocol import CacheMetricsProtocol
 from src.domain.protocols.cache_protocol import CacheProtocol
 from src.domain.value_objects.provider_credentials import ProviderCredentials
+from src.infrastructure.cache.cache_metrics import TIER_L1, TIER_L2
+from src.infrastructure.cache.local_cache import LocalTTLCache
 
 logger = logging.getLogger(__name__)
 
+# Local (L1) tier and metrics namespace
+LOCAL_CACHE_NAMESPACE = "provider_connection"
+
 
 class RedisProviderConnectionCache:
     """Redis implementation of ProviderConnectionCache protocol.
@@ -45,16 +56,33 @@ class RedisProviderConnectionCache:
 
     Attributes:
         _cache: Cache instance implementing CacheProtocol.
+        _local: Optional in-process L1 tier (connection_id -> cached dict).
+        _invalidation: Broadcasts L1 invalidations to other processes.
+        _metrics: Optional per-tier hit/miss tracking.
     """
 
-    def __init__(self, cache: CacheProtocol) -> None:
+    def __init__(
+        self,
+        cache: CacheProtocol,
+        *,
+        local_cache: LocalTTLCache | None = None,
+        invalidation: CacheInvalidationProtocol | None = None,
+        metrics: CacheMetricsProtocol | None = None,
+    ) -> None:
         """Initialize provider connection cache.
 
         Args:
             cache: Cache instance implementing CacheProtocol.
+            local_cache: Optional in-process L1 tier (None disables it).
+            invalidation: Cross-process invalidation for the L1 tier.
+            metrics: Optional metrics tracker
+                ("provider_connection:l1"/"provider_connection:l2").
         """
         self._cache = cache
         self._ttl = settings.cache_provider_ttl
+        self._local = local_cache
+        self._invalidation = invalidation
+        self._metrics = metrics
 
     def _connection_key(self, connection_id: UUID) -> str:
         """Generate cache key for provider connection.
@@ -76,23 +104,46 @@ class RedisProviderConnectionCache:
         Returns:
             ProviderConnection if cached, None otherwise (cache miss or error).
         """
+        local_key = str(connection_id)
+        generation = None
+        if self._local is not None:
+            cached = self._local.get(local_key)
+            if cached is not None:
+                self._record(TIER_L1, hit=True)
+                # Rebuilt per call: callers never share a mutable entity
+                return self._from_dict(cached)
+            self._record(TIER_L1, hit=False)
+            generation = self._local.generation
+
         key = self._connection_key(connection_id)
         result = await self._cache.get_json(key)
 
         match result:
             case Success(value=None):
+                self._record(TIER_L2, hit=False)
                 return None
             case Success(value=data) if data is not None:
                 try:
-                    return self._from_dict(data)
+                    connection = self._from_dict(data)
                 except (KeyError, TypeError, ValueError) as e:
                     logger.warning(
                         "Failed to deserialize provider connection from cache",
                         extra={"connection_id": str(connection_id), "error": str(e)},
                     )
                     return None
+                self._record(TIER_L2, hit=True)
+                if self._local is not None:
+                    self._local.set(
+                        local_key,
+                        data,
+                        group=str(connection.user_id),
+                        generation=generation,
+                    )
+                return connection
             case _:
                 # Cache error - fail open (return None)
+                if self._metrics is not None:
+                    self._metrics.record_error(f"{LOCAL_CACHE_NAMESPACE}:{TIER_L2}")
                 logger.warning(
                     "Cache error getting provider connection",
                     extra={"connection_id": str(connection_id)},
@@ -118,6 +169,8 @@ class RedisProviderConnectionCache:
         data = self._to_dict(connection)
 
         result = await self._cache.set_json(key, data, ttl=ttl_seconds)
+        # Other processes may hold the previous status/credentials
+        await self._invalidate_local(str(connection.id))
         if not isinstance(result, Success):
             logger.warning(
                 "Failed to cache provider connection",
@@ -135,6 +188,7 @@ class RedisProviderConnectionCache:
         """
         key = self._connection_key(connection_id)
         result = await self._cache.delete(key)
+        await self._invalidate_local(str(connection_id))
 
         match result:
             case Success(value=deleted):
@@ -164,6 +218,36 @@ class RedisProviderConnectionCache:
             case _:
                 return False
 
+    # =========================================================================
+    # Local (L1) tier helpers
+    # =========================================================================
+
+    async def _invalidate_local(self, key: str) -> None:
+        """Drop an L1 entry in this and every other process.
+
+        Args:
+            key: Connection ID.
+        """
+        if self._invalidation is not None:
+            await self._invalidation.invalidate(LOCAL_CACHE_NAMESPACE, keys=[key])
+        elif self._local is not None:
+            self._local.delete(key)
+
+    def _record(self, tier: str, *, hit: bool) -> None:
+        """Record a hit or miss for one cache tier.
+
+        Args:
+            tier: TIER_L1 or TIER_L2.
+            hit: True for a hit, False for a miss.
+        """
+        if self._metrics is None:
+            return
+        namespace = f"{LOCAL_CACHE_NAMESPACE}:{tier}"
+        if hit:
+            self._metrics.record_hit(namespace)
+        else:
+            self._metrics.record_miss(namespace)
+
     # =========================================================================
     # Serialization helpers
     # =========================================================================
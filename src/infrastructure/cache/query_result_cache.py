@@ -0,0 +1,274 @@
+"""Redis implementation of QueryResultCache protocol.
+
+Caches CQRS query handler results (frozen result DTO dataclasses) as JSON,
+keyed by the querying user and a deterministic fingerprint of the query.
+
+Key Patterns:
+    - {prefix}:query:{user_id}:{query_name}:{fingerprint} -> JSON result DTO
+    - {prefix}:tag:query:{user_id} -> SET of the user's result keys
+
+Serialization:
+    Result DTOs are converted to JSON-safe values (UUID, Decimal, datetime,
+    date, Enum, nested dataclasses, lists, dicts) and rebuilt from the DTO's
+    type hints on read, so cached and fresh results are indistinguishable.
+
+Architecture:
+    - Implements QueryResultCache protocol (structural typing)
+    - Uses CacheProtocol for low-level Redis operations
+    - Fail-open: errors and undecodable entries behave as misses
+    - Database is always source of truth
+
+Reference:
+    - docs/architecture/cache-keys.md
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import re
+import types
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, TypeVar, Union, get_args, get_origin, get_type_hints
+from uuid import UUID
+
+from src.core.result import Success
+from src.domain.protocols.cache_keys_protocol import CacheKeysProtocol
+from src.domain.protocols.cache_protocol import CacheProtocol
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def query_name(query_class: type) -> str:
+    """Convert a query class name to snake_case.
+
+    Args:
+        query_class: Query dataclass type.
+
+    Returns:
+        snake_case name (e.g., ListAccountsByUser -> "list_accounts_by_user").
+    """
+    return _CAMEL_BOUNDARY.sub("_", query_class.__name__).lower()
+
+
+def query_fingerprint(query: Any) -> str:
+    """Compute a deterministic fingerprint of a query's fields.
+
+    ``user_id`` is excluded because it is already part of the key prefix.
+    Field order and dict ordering do not affect the result.
+
+    Args:
+        query: Query dataclass instance.
+
+    Returns:
+        Hex digest (32 chars) of the canonical JSON encoding.
+    """
+    payload = {
+        field.name: to_jsonable(getattr(query, field.name))
+        for field in dataclasses.fields(query)
+        if field.name != "user_id"
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convert a DTO value into JSON-serializable primitives.
+
+    Args:
+        value: Dataclass, collection, or scalar value.
+
+    Returns:
+        JSON-serializable equivalent.
+    """
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, Enum):
+        return to_jsonable(value.value)
+    if isinstance(value, UUID | Decimal):
+        return str(value)
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: to_jsonable(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, list | tuple | set | frozenset):
+        return [to_jsonable(item) for item in value]
+    msg = f"Unsupported type for query cache: {type(value).__name__}"
+    raise TypeError(msg)
+
+
+def from_jsonable(data: Any, annotation: Any) -> Any:
+    """Rebuild a value of the annotated type from JSON primitives.
+
+    Args:
+        data: Value produced by to_jsonable() after a JSON round trip.
+        annotation: Target type hint (dataclass, collection, or scalar).
+
+    Returns:
+        Value of the annotated type.
+
+    Raises:
+        TypeError, ValueError, KeyError: If data does not match annotation.
+    """
+    if data is None or annotation is Any:
+        return data
+
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        # Ambiguous unions (e.g., int | str) keep the JSON value as-is
+        return from_jsonable(data, members[0]) if len(members) == 1 else data
+    if origin is list:
+        (item_type,) = get_args(annotation) or (Any,)
+        return [from_jsonable(item, item_type) for item in data]
+    if origin is tuple:
+        args = get_args(annotation)
+        item_type = args[0] if args else Any
+        return tuple(from_jsonable(item, item_type) for item in data)
+    if origin is dict:
+        key_type, value_type = get_args(annotation) or (Any, Any)
+        return {
+            from_jsonable(k, key_type): from_jsonable(v, value_type)
+            for k, v in data.items()
+        }
+
+    if isinstance(annotation, type):
+        if dataclasses.is_dataclass(annotation):
+            hints = get_type_hints(annotation)
+            return annotation(
+                **{
+                    field.name: from_jsonable(data[field.name], hints[field.name])
+                    for field in dataclasses.fields(annotation)
+                    if field.init
+                }
+            )
+        if issubclass(annotation, Enum):
+            return annotation(data)
+        if annotation is UUID:
+            return UUID(data)
+        if annotation is Decimal:
+            return Decimal(data)
+        if annotation is datetime:
+            return datetime.fromisoformat(data)
+        if annotation is date:
+            return date.fromisoformat(data)
+    return data
+
+
+class RedisQueryResultCache:
+    """Redis implementation of QueryResultCache protocol.
+
+    Note: Does NOT inherit from QueryResultCache protocol (uses structural typing).
+
+    Attributes:
+        _cache: Cache instance implementing CacheProtocol.
+        _cache_keys: Key builder for query result keys.
+    """
+
+    def __init__(self, cache: CacheProtocol, cache_keys: CacheKeysProtocol) -> None:
+        """Initialize query result cache.
+
+        Args:
+            cache: Cache instance implementing CacheProtocol.
+            cache_keys: Cache key builder.
+        """
+        self._cache = cache
+        self._cache_keys = cache_keys
+
+    def key_for(self, query: Any) -> str | None:
+        """Derive the cache key for a query.
+
+        Args:
+            query: Query dataclass instance.
+
+        Returns:
+            Cache key, or None if the query has no user_id.
+        """
+        user_id = getattr(query, "user_id", None)
+        if user_id is None or not dataclasses.is_dataclass(query):
+            return None
+        return self._cache_keys.query_result(
+            user_id, query_name(type(query)), query_fingerprint(query)
+        )
+
+    async def get(self, query: Any, result_type: type[T]) -> T | None:
+        """Get cached result for a query.
+
+        Args:
+            query: Query dataclass instance.
+            result_type: Result DTO dataclass to rebuild.
+
+        Returns:
+            Cached result DTO, or None on miss, error, or undecodable entry.
+        """
+        key = self.key_for(query)
+        if key is None:
+            return None
+
+        result = await self._cache.get(key)
+        if not isinstance(result, Success) or result.value is None:
+            return None
+
+        try:
+            decoded: T = from_jsonable(json.loads(result.value), result_type)
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.warning(
+                "Failed to deserialize query result from cache",
+                extra={"key": key, "error": str(e)},
+            )
+            return None
+        return decoded
+
+    async def set(self, query: Any, value: Any, *, ttl: int) -> None:
+        """Store a query result (fail-open).
+
+        Args:
+            query: Query dataclass instance.
+            value: Result DTO dataclass instance.
+            ttl: Time to live in seconds.
+        """
+        key = self.key_for(query)
+        if key is None:
+            return
+
+        try:
+            payload = json.dumps(to_jsonable(value))
+        except (TypeError, ValueError) as e:
+            logger.warning(
+                "Failed to serialize query result for cache",
+                extra={"key": key, "error": str(e)},
+            )
+            return
+        await self._cache.set_with_tags(
+            key,
+            payload,
+            tags=[self._cache_keys.query_results_tag(query.user_id)],
+            ttl=ttl,
+        )
+
+    async def invalidate_user(self, user_id: UUID) -> int:
+        """Remove all cached query results for a user.
+
+        Args:
+            user_id: User whose cached reads are stale.
+
+        Returns:
+            Number of entries removed (0 on error).
+        """
+        result = await self._cache.invalidate_tag(
+            self._cache_keys.query_results_tag(user_id)
+        )
+        if isinstance(result, Success):
+            return result.value
+        return 0
@@ -9,14 +9,18 @@ Architecture:
 - Maps Redis exceptions to CacheError with proper ErrorCode
 - Returns Result types for all operations
 - Fail-open strategy for resilience
+- Bulk invalidation via batched UNLINK (pattern scan or tag sets)
 """
 
 import json
+from collections.abc import AsyncIterator
 from typing import Any
+from uuid import uuid4
 
 from redis.asyncio import Redis
-from redis.exceptions import RedisError
+from redis.exceptions import RedisError, ResponseError
 
+from src.core.constants import CACHE_DELETE_BATCH_SIZE, CACHE_SCAN_COUNT
 from src.core.enums import ErrorCode
 from src.core.result import Failure, Result, Success
 from src.infrastructure.enums import InfrastructureErrorCode
@@ -34,15 +38,26 @@ class RedisAdapter:
 
     Attributes:
         _redis: Async Redis client instance.
+        _scan_count: COUNT hint for SCAN/SSCAN during bulk invalidation.
+        _delete_batch_size: Keys per UNLINK batch.
     """
 
-    def __init__(self, redis_client: Redis) -> None:
+    def __init__(
+        self,
+        redis_client: Redis,
+        scan_count: int = CACHE_SCAN_COUNT,
+        delete_batch_size: int = CACHE_DELETE_BATCH_SIZE,
+    ) -> None:
         """Initialize Redis adapter.
 
         Args:
             redis_client: Async Redis client instance.
+            scan_count: COUNT hint for SCAN/SSCAN (keys examined per call).
+            delete_batch_size: Keys removed per UNLINK call.
         """
         self._redis = redis_client
+        self._scan_count = scan_count
+        self._delete_batch_size = delete_batch_size
 
     async def get(self, key: str) -> Result[str | None, CacheError]:
         """Get value from Redis.
@@ -437,8 +452,10 @@ class RedisAdapter:
     async def delete_pattern(self, pattern: str) -> Result[int, CacheError]:
         """Delete all keys matching pattern.
 
-        Uses Redis SCAN to find matching keys and DELETE to remove them.
-        This is safer than KEYS + DELETE for large datasets.
+        Uses Redis SCAN (with a COUNT hint) to find matching keys and removes
+        them with one multi-key UNLINK per batch, so the cost is one round
+        trip per batch rather than per key. UNLINK reclaims memory in a background
+        thread, keeping large invalidations off the Redis main thread.
 
         Args:
             pattern: Glob-style pattern (e.g., "authz:user123:*").
@@ -447,11 +464,8 @@ class RedisAdapter:
             Result with number of keys deleted, or CacheError.
         """
         try:
-            deleted_count = 0
-            # Use SCAN to iterate keys matching pattern (safer than KEYS)
-            async for key in self._redis.scan_iter(match=pattern):
-                await self._redis.delete(key)
-                deleted_count += 1
+            keys = self._redis.scan_iter(match=pattern, count=self._scan_count)
+            deleted_count = await self._unlink_all(keys)
             return Success(value=deleted_count)
         except RedisError as e:
             return Failure(
@@ -476,6 +490,143 @@ class RedisAdapter:
                 )
             )
 
+    async def set_with_tags(
+        self,
+        key: str,
+        value: str,
+        *,
+        tags: list[str],
+        ttl: int | None = None,
+    ) -> Result[None, CacheError]:
+        """Set value and register the key under one or more tags.
+
+        Writes the value and adds the key to each tag set in a single
+        pipeline. Tag sets never expire before their newest member: they get
+        the entry TTL when created and are only ever extended (NX/GT).
+
+        Args:
+            key: Cache key.
+            value: Value to cache (string).
+            tags: Tag set keys to register the key under.
+            ttl: Time to live in seconds (None = no expiration).
+
+        Returns:
+            Result with None on success, or CacheError.
+        """
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                if ttl is not None:
+                    pipe.setex(key, ttl, value)
+                else:
+                    pipe.set(key, value)
+                for tag in tags:
+                    pipe.sadd(tag, key)
+                    if ttl is not None:
+                        pipe.expire(tag, ttl, nx=True)
+                        pipe.expire(tag, ttl, gt=True)
+                    else:
+                        pipe.persist(tag)
+                await pipe.execute()
+            return Success(value=None)
+        except RedisError as e:
+            return Failure(
+                error=CacheError(
+                    code=ErrorCode.VALIDATION_FAILED,
+                    infrastructure_code=InfrastructureErrorCode.CACHE_SET_ERROR,
+                    message=f"Failed to set tagged key '{key}' in cache",
+                    details={"key": key, "tags": tags, "error": str(e)},
+                )
+            )
+        except Exception as e:
+            return Failure(
+                error=CacheError(
+                    code=ErrorCode.VALIDATION_FAILED,
+                    infrastructure_code=InfrastructureErrorCode.CACHE_SET_ERROR,
+                    message=f"Unexpected error setting tagged key '{key}'",
+                    details={
+                        "key": key,
+                        "tags": tags,
+                        "error": str(e),
+                        "type": type(e).__name__,
+                    },
+                )
+            )
+
+    async def invalidate_tag(self, tag: str) -> Result[int, CacheError]:
+        """Delete every key registered under a tag, then the tag itself.
+
+        The tag set is first renamed to a private key, so keys tagged while
+        the invalidation runs land in a fresh set and are not lost. Members
+        are then read with SSCAN and removed with batched UNLINK; the
+        keyspace is never scanned.
+
+        Args:
+            tag: Tag set key (e.g., "authz:tag:user123").
+
+        Returns:
+            Result with number of tagged keys deleted, or CacheError.
+        """
+        draining = f"{tag}:invalidating:{uuid4().hex}"
+        try:
+            try:
+                await self._redis.rename(tag, draining)
+            except ResponseError:
+                return Success(value=0)  # No such tag: nothing cached
+
+            members = self._redis.sscan_iter(draining, count=self._scan_count)
+            deleted_count = await self._unlink_all(members)
+            await self._redis.unlink(draining)
+            return Success(value=deleted_count)
+        except RedisError as e:
+            return Failure(
+                error=CacheError(
+                    code=ErrorCode.VALIDATION_FAILED,
+                    infrastructure_code=InfrastructureErrorCode.CACHE_DELETE_ERROR,
+                    message=f"Failed to invalidate tag '{tag}'",
+                    details={"tag": tag, "error": str(e)},
+                )
+            )
+        except Exception as e:
+            return Failure(
+                error=CacheError(
+                    code=ErrorCode.VALIDATION_FAILED,
+                    infrastructure_code=InfrastructureErrorCode.CACHE_DELETE_ERROR,
+                    message=f"Unexpected error invalidating tag '{tag}'",
+                    details={"tag": tag, "error": str(e), "type": type(e).__name__},
+                )
+            )
+
+    async def _unlink_all(self, keys: AsyncIterator[Any]) -> int:
+        """UNLINK keys from an async iterator in fixed-size batches.
+
+        Args:
+            keys: Async iterator of keys (SCAN/SSCAN results).
+
+        Returns:
+            Number of keys that existed and were removed.
+        """
+        deleted_count = 0
+        batch: list[Any] = []
+        async for key in keys:
+            batch.append(key)
+            if len(batch) >= self._delete_batch_size:
+                deleted_count += await self._unlink_batch(batch)
+                batch = []
+        if batch:
+            deleted_count += await self._unlink_batch(batch)
+        return deleted_count
+
+    async def _unlink_batch(self, keys: list[Any]) -> int:
+        """UNLINK one batch of keys in a single round trip.
+
+        Args:
+            keys: Keys to remove.
+
+        Returns:
+            Number of keys that existed and were removed.
+        """
+        return int(await self._redis.unlink(*keys))
+
     async def get_many(
         self, keys: list[str]
     ) -> Result[dict[str, str | None], CacheError]:
@@ -10,6 +10,8 @@ Key Patterns:
 Architecture:
     - Implements SessionCache protocol (structural typing)
     - Uses RedisAdapter for low-level operations
+    - Optional in-process L1 tier in front of Redis (short TTL), kept
+      coherent across workers via CacheInvalidationProtocol on every write
     - Returns None on cache miss (fail-open for resilience)
     - Database is always source of truth
 
@@ -24,8 +26,14 @@ from datetime import UTC, datetime
 from uuid import UUID
 
 from src.core.result import Success
+from src.domain.protocols.cache_invalidation_protocol import (
+    CacheInvalidationProtocol,
+)
+from src.domain.protocols.cache_metrics_protocol import CacheMetricsProtocol
 from src.domain.protocols.cache_protocol import CacheProtocol
 from src.domain.protocols.session_repository import SessionData
+from src.infrastructure.cache.cache_metrics import TIER_L1, TIER_L2
+from src.infrastructure.cache.local_cache import LocalTTLCache
 
 
 logger = logging.getLogger(__name__)
@@ -33,6 +41,9 @@ logger = logging.getLogger(__name__)
 # Default session TTL (30 days in seconds)
 DEFAULT_SESSION_TTL = 30 * 24 * 60 * 60  # 2,592,000 seconds
 
+# Local (L1) tier and metrics namespace
+LOCAL_CACHE_NAMESPACE = "session"
+
 
 class RedisSessionCache:
     """Redis implementation of SessionCache protocol.
@@ -48,15 +59,31 @@ class RedisSessionCache:
 
     Attributes:
         _cache: Cache instance implementing CacheProtocol.
+        _local: Optional in-process L1 tier (session_id -> cached dict).
+        _invalidation: Broadcasts L1 invalidations to other processes.
+        _metrics: Optional per-tier hit/miss tracking.
     """
 
-    def __init__(self, cache: CacheProtocol) -> None:
+    def __init__(
+        self,
+        cache: CacheProtocol,
+        *,
+        local_cache: LocalTTLCache | None = None,
+        invalidation: CacheInvalidationProtocol | None = None,
+        metrics: CacheMetricsProtocol | None = None,
+    ) -> None:
         """Initialize session cache.
 
         Args:
             cache: Cache instance implementing CacheProtocol.
+            local_cache: Optional in-process L1 tier (None disables it).
+            invalidation: Cross-process invalidation for the L1 tier.
+            metrics: Optional metrics tracker ("session:l1"/"session:l2").
         """
         self._cache = cache
+        self._local = local_cache
+        self._invalidation = invalidation
+        self._metrics = metrics
 
     def _session_key(self, session_id: UUID) -> str:
         """Generate cache key for session data.
@@ -89,23 +116,46 @@ class RedisSessionCache:
         Returns:
             SessionData if cached, None otherwise (cache miss or error).
         """
+        local_key = str(session_id)
+        generation = None
+        if self._local is not None:
+            cached = self._local.get(local_key)
+            if cached is not None:
+                self._record(TIER_L1, hit=True)
+                # Rebuilt per call: callers never share a mutable instance
+                return self._from_dict(cached)
+            self._record(TIER_L1, hit=False)
+            generation = self._local.generation
+
         key = self._session_key(session_id)
         result = await self._cache.get_json(key)
 
         match result:
             case Success(value=None):
+                self._record(TIER_L2, hit=False)
                 return None
             case Success(value=data) if data is not None:
                 try:
-                    return self._from_dict(data)
+                    session_data = self._from_dict(data)
                 except (KeyError, TypeError, ValueError) as e:
                     logger.warning(
                         "Failed to deserialize session from cache",
                         extra={"session_id": str(session_id), "error": str(e)},
                     )
                     return None
+                self._record(TIER_L2, hit=True)
+                if self._local is not None:
+                    self._local.set(
+                        local_key,
+                        data,
+                        group=str(session_data.user_id),
+                        generation=generation,
+                    )
+                return session_data
             case _:
                 # Cache error - fail open (return None)
+                if self._metrics is not None:
+                    self._metrics.record_error(f"{LOCAL_CACHE_NAMESPACE}:{TIER_L2}")
                 logger.warning(
                     "Cache error getting session",
                     extra={"session_id": str(session_id)},
@@ -144,6 +194,8 @@ class RedisSessionCache:
         data = self._to_dict(session_data)
 
         result = await self._cache.set_json(key, data, ttl=ttl_seconds)
+        # Other processes may hold the previous version (e.g., not revoked)
+        await self._invalidate_local(keys=[str(session_data.id)])
         if not isinstance(result, Success):
             logger.warning(
                 "Failed to cache session",
@@ -159,6 +211,19 @@ class RedisSessionCache:
 
         Note: Does NOT remove from user index (caller should use remove_user_session).
 
+        Args:
+            session_id: Session identifier.
+
+        Returns:
+            True if deleted, False if not found or error.
+        """
+        deleted = await self._delete_cached(session_id)
+        await self._invalidate_local(keys=[str(session_id)])
+        return deleted
+
+    async def _delete_cached(self, session_id: UUID) -> bool:
+        """Remove session data from Redis (no L1 invalidation).
+
         Args:
             session_id: Session identifier.
 
@@ -193,18 +258,23 @@ class RedisSessionCache:
         session_ids = await self.get_user_session_ids(user_id)
 
         if not session_ids:
+            # L1 entries may outlive the Redis index; drop them anyway
+            await self._invalidate_local(groups=[str(user_id)])
             return 0
 
         # Delete each session
         deleted_count = 0
         for session_id in session_ids:
-            if await self.delete(session_id):
+            if await self._delete_cached(session_id):
                 deleted_count += 1
 
         # Clear the user's session index
         user_key = self._user_sessions_key(user_id)
         await self._cache.delete(user_key)
 
+        # One broadcast drops every L1 entry of the user in all processes
+        await self._invalidate_local(groups=[str(user_id)])
+
         return deleted_count
 
     async def exists(self, session_id: UUID) -> bool:
@@ -347,6 +417,47 @@ class RedisSessionCache:
         await self.set(updated_data)
         return True
 
+    # =========================================================================
+    # Local (L1) tier helpers
+    # =========================================================================
+
+    async def _invalidate_local(
+        self,
+        *,
+        keys: list[str] | None = None,
+        groups: list[str] | None = None,
+    ) -> None:
+        """Drop L1 entries in this and every other process.
+
+        Args:
+            keys: Session IDs to drop.
+            groups: User IDs whose sessions are all dropped.
+        """
+        if self._invalidation is not None:
+            await self._invalidation.invalidate(
+                LOCAL_CACHE_NAMESPACE, keys=keys or (), groups=groups or ()
+            )
+        elif self._local is not None:
+            for key in keys or ():
+                self._local.delete(key)
+            for group in groups or ():
+                self._local.invalidate_group(group)
+
+    def _record(self, tier: str, *, hit: bool) -> None:
+        """Record a hit or miss for one cache tier.
+
+        Args:
+            tier: TIER_L1 or TIER_L2.
+            hit: True for a hit, False for a miss.
+        """
+        if self._metrics is None:
+            return
+        namespace = f"{LOCAL_CACHE_NAMESPACE}:{tier}"
+        if hit:
+            self._metrics.record_hit(namespace)
+        else:
+            self._metrics.record_miss(namespace)
+
     # =========================================================================
     # Serialization helpers
     # =========================================================================
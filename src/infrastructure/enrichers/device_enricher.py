@@ -3,15 +3,34 @@
 Parses user agent strings to extract device, browser, and OS information.
 Implements DeviceEnricher protocol with fail-open behavior.
 
+Performance:
+    - Results are cached per user agent string (bounded LRU); a few browser
+      builds account for most logins, so most calls skip the parse
+    - Cache misses parse in a worker thread (asyncio.to_thread): the
+      regex-heavy parser never runs on the event loop
+    - Hit/miss counters and parse latency via get_stats()
+
 Reference:
     - docs/architecture/session-management-architecture.md
 """
 
+import asyncio
+import time
+
 from user_agents import parse as parse_user_agent
 from user_agents.parsers import UserAgent
 
+from src.core.constants import DEVICE_ENRICHMENT_CACHE_MAX_ENTRIES
 from src.domain.protocols.logger_protocol import LoggerProtocol
 from src.domain.protocols.session_enricher_protocol import DeviceEnrichmentResult
+from src.infrastructure.enrichers.enrichment_cache import (
+    EnrichmentCache,
+    EnrichmentStats,
+)
+
+# Longer (unusual or crafted) user agents are parsed but not cached, so
+# junk headers cannot fill the cache with large keys.
+_MAX_CACHED_USER_AGENT_LENGTH = 512
 
 
 class UserAgentDeviceEnricher:
@@ -24,17 +43,23 @@ class UserAgentDeviceEnricher:
 
     Behavior:
         - Fail-open: Returns empty result on parse errors
-        - Non-blocking: Pure string parsing (<1ms)
+        - Non-blocking: Cached, or parsed in a worker thread
         - Best-effort: Unknown agents return partial data
     """
 
-    def __init__(self, logger: LoggerProtocol) -> None:
+    def __init__(
+        self,
+        logger: LoggerProtocol,
+        cache_max_entries: int = DEVICE_ENRICHMENT_CACHE_MAX_ENTRIES,
+    ) -> None:
         """Initialize device enricher.
 
         Args:
             logger: Logger for error/debug messages.
+            cache_max_entries: Max parsed user agents kept in memory.
         """
         self._logger = logger
+        self._cache = EnrichmentCache(max_entries=cache_max_entries)
 
     async def enrich(self, user_agent: str) -> DeviceEnrichmentResult:
         """Parse user agent string to extract device information.
@@ -49,38 +74,13 @@ class UserAgentDeviceEnricher:
         if not user_agent:
             return DeviceEnrichmentResult()
 
-        try:
-            ua: UserAgent = parse_user_agent(user_agent)
-
-            # Extract browser info
-            browser = ua.browser.family if ua.browser.family else None
-            browser_version = (
-                ua.browser.version_string if ua.browser.version_string else None
-            )
-
-            # Extract OS info
-            os_name = ua.os.family if ua.os.family else None
-            os_version = ua.os.version_string if ua.os.version_string else None
-
-            # Determine device type
-            device_type = self._determine_device_type(ua)
-
-            # Check if bot
-            is_bot = ua.is_bot
-
-            # Build human-readable device info
-            device_info = self._build_device_info(browser, os_name)
-
-            return DeviceEnrichmentResult(
-                device_info=device_info,
-                browser=browser,
-                browser_version=browser_version,
-                os=os_name,
-                os_version=os_version,
-                device_type=device_type,
-                is_bot=is_bot,
-            )
+        cached: DeviceEnrichmentResult | None = self._cache.get(user_agent)
+        if cached is not None:
+            return cached
 
+        started = time.perf_counter()
+        try:
+            result = await asyncio.to_thread(self._parse, user_agent)
         except Exception as e:
             self._logger.warning(
                 "Failed to parse user agent",
@@ -88,6 +88,59 @@ class UserAgentDeviceEnricher:
                 error=str(e),
             )
             return DeviceEnrichmentResult()
+        self._cache.record_lookup((time.perf_counter() - started) * 1000)
+
+        if len(user_agent) <= _MAX_CACHED_USER_AGENT_LENGTH:
+            self._cache.set(user_agent, result)
+        return result
+
+    def get_stats(self) -> EnrichmentStats:
+        """Get parse cache statistics.
+
+        Returns:
+            EnrichmentStats with hit/miss counters and parse latency.
+        """
+        return self._cache.get_stats()
+
+    def _parse(self, user_agent: str) -> DeviceEnrichmentResult:
+        """Parse a user agent string (runs in a worker thread).
+
+        Args:
+            user_agent: Raw user agent string.
+
+        Returns:
+            DeviceEnrichmentResult with parsed device info.
+        """
+        ua: UserAgent = parse_user_agent(user_agent)
+
+        # Extract browser info
+        browser = ua.browser.family if ua.browser.family else None
+        browser_version = (
+            ua.browser.version_string if ua.browser.version_string else None
+        )
+
+        # Extract OS info
+        os_name = ua.os.family if ua.os.family else None
+        os_version = ua.os.version_string if ua.os.version_string else None
+
+        # Determine device type
+        device_type = self._determine_device_type(ua)
+
+        # Check if bot
+        is_bot = ua.is_bot
+
+        # Build human-readable device info
+        device_info = self._build_device_info(browser, os_name)
+
+        return DeviceEnrichmentResult(
+            device_info=device_info,
+            browser=browser,
+            browser_version=browser_version,
+            os=os_name,
+            os_version=os_version,
+            device_type=device_type,
+            is_bot=is_bot,
+        )
 
     def _determine_device_type(self, ua: UserAgent) -> str:
         """Determine device type from parsed user agent.
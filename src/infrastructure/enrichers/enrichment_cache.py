@@ -0,0 +1,152 @@
+"""Bounded LRU cache and metrics for session enrichers.
+
+Session creation enriches every login with a user agent parse and a GeoIP
+lookup. Both inputs repeat heavily (a handful of browser builds, users
+logging in from the same networks), so results are memoized per process.
+
+Entries never expire: a parse result depends only on the user agent
+string, and GeoIP results only change when the database file is replaced,
+which requires a restart. Least recently used entries are evicted once
+max_entries is exceeded.
+
+Lookup latency (cache misses only, time spent in the worker thread) is
+recorded alongside hit/miss counters so get_stats() shows both how often
+the cache helps and what a miss costs.
+
+Architecture:
+    - Infrastructure-only helper (not a domain port)
+    - Not thread-safe: used from the event loop only (lookups run in
+      worker threads, cache reads/writes stay on the loop)
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class EnrichmentStats:
+    """Snapshot of enricher cache usage and lookup latency.
+
+    Attributes:
+        entries: Number of cached results.
+        hits: Enrichments served from the cache.
+        misses: Enrichments that ran a lookup.
+        evictions: Entries dropped to stay within max_entries.
+        total_lookup_ms: Cumulative lookup time (misses).
+        max_lookup_ms: Slowest lookup.
+    """
+
+    entries: int
+    hits: int
+    misses: int
+    evictions: int
+    total_lookup_ms: float
+    max_lookup_ms: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to dictionary.
+
+        Returns:
+            Dictionary with counters, hit ratio and average lookup time.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": self.entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "avg_lookup_ms": (
+                round(self.total_lookup_ms / self.misses, 3) if self.misses else 0.0
+            ),
+            "max_lookup_ms": round(self.max_lookup_ms, 3),
+        }
+
+
+class EnrichmentCache:
+    """Bounded LRU cache with hit/miss and lookup latency counters.
+
+    Attributes:
+        _max_entries: Entry bound (least recently used entry evicted first).
+        _entries: key -> result, in LRU order.
+
+    Example:
+        >>> cache = EnrichmentCache(max_entries=10_000)
+        >>> result = cache.get(user_agent)
+        >>> if result is None:
+        ...     result = await asyncio.to_thread(parse, user_agent)
+        ...     cache.set(user_agent, result, lookup_ms=elapsed_ms)
+    """
+
+    def __init__(self, *, max_entries: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of results kept.
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._total_lookup_ms = 0.0
+        self._max_lookup_ms = 0.0
+
+    def __len__(self) -> int:
+        """Number of cached results."""
+        return len(self._entries)
+
+    def get(self, key: str) -> Any | None:
+        """Get a cached result and mark it most recently used.
+
+        Args:
+            key: User agent string or IP prefix.
+
+        Returns:
+            Cached result, or None on a miss.
+        """
+        result = self._entries.get(key)
+        if result is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return result
+
+    def record_lookup(self, lookup_ms: float) -> None:
+        """Record the duration of a lookup run for a miss.
+
+        Args:
+            lookup_ms: Time spent in the lookup, in milliseconds.
+        """
+        self._total_lookup_ms += lookup_ms
+        self._max_lookup_ms = max(self._max_lookup_ms, lookup_ms)
+
+    def set(self, key: str, result: Any) -> None:
+        """Store a result, evicting the least recently used entry if full.
+
+        Args:
+            key: User agent string or IP prefix.
+            result: Enrichment result (treated as immutable by callers).
+        """
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def get_stats(self) -> EnrichmentStats:
+        """Get a snapshot of cache usage.
+
+        Returns:
+            EnrichmentStats with hit/miss/eviction counters and latency.
+        """
+        return EnrichmentStats(
+            entries=len(self._entries),
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            total_lookup_ms=self._total_lookup_ms,
+            max_lookup_ms=self._max_lookup_ms,
+        )
@@ -4,6 +4,12 @@ Resolves IP addresses to geographic locations using MaxMind GeoIP2.
 
 Implementation:
     - Uses GeoLite2-City database for city-level geolocation
+    - Database opened memory-mapped (MODE_MMAP): pages are shared by all
+      worker processes and loaded by the OS on demand
+    - Lookups cached per IP prefix (/24 IPv4, /64 IPv6; bounded LRU), since
+      addresses in one prefix resolve to the same city in GeoLite2
+    - Cache misses look up in a worker thread (asyncio.to_thread), never on
+      the event loop; hit/miss counters and latency via get_stats()
     - Fail-open: Returns empty result on any errors
     - Private IPs: Returns empty (no meaningful location)
     - TODO: F7.3 - Automate monthly database updates via background jobs
@@ -13,15 +19,27 @@ Reference:
     - MaxMind GeoIP2: https://dev.maxmind.com/geoip/docs/databases/city-and-country
 """
 
+import asyncio
 import ipaddress
+import threading
+import time
 from pathlib import Path
 
 import geoip2.database
 import geoip2.errors
 
 from src.core.config import settings
+from src.core.constants import (
+    LOCATION_ENRICHMENT_CACHE_MAX_ENTRIES,
+    LOCATION_ENRICHMENT_IPV4_PREFIX,
+    LOCATION_ENRICHMENT_IPV6_PREFIX,
+)
 from src.domain.protocols.logger_protocol import LoggerProtocol
 from src.domain.protocols.session_enricher_protocol import LocationEnrichmentResult
+from src.infrastructure.enrichers.enrichment_cache import (
+    EnrichmentCache,
+    EnrichmentStats,
+)
 
 
 class IPLocationEnricher:
@@ -37,6 +55,7 @@ class IPLocationEnricher:
         - Private IPs: Always return empty (no meaningful location data)
         - Best-effort: Unknown IPs return empty data
         - Lazy loading: Database reader initialized on first use
+        - Cached: One lookup per IP prefix until evicted
 
     Args:
         db_path: Path to GeoLite2-City.mmdb file. If None, geolocation is disabled.
@@ -46,16 +65,20 @@ class IPLocationEnricher:
         self,
         logger: LoggerProtocol,
         db_path: str | None = None,
+        cache_max_entries: int = LOCATION_ENRICHMENT_CACHE_MAX_ENTRIES,
     ) -> None:
         """Initialize location enricher.
 
         Args:
             logger: Logger for error/debug messages.
             db_path: Path to GeoIP2 database file. Defaults to settings.geoip_db_path.
+            cache_max_entries: Max IP prefixes whose location is kept in memory.
         """
         self._logger = logger
         self._db_path = db_path or settings.geoip_db_path
         self._reader: geoip2.database.Reader | None = None
+        self._reader_lock = threading.Lock()
+        self._cache = EnrichmentCache(max_entries=cache_max_entries)
 
     async def enrich(self, ip_address: str) -> LocationEnrichmentResult:
         """Resolve IP address to geographic location using GeoIP2.
@@ -86,51 +109,29 @@ class IPLocationEnricher:
                 )
                 return LocationEnrichmentResult()
 
-            # Lazy load database reader
-            if self._reader is None:
-                self._init_reader()
+            cache_key = self._cache_key(ip_address)
+            cached: LocationEnrichmentResult | None = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-            # If reader still None (init failed), return empty
-            if self._reader is None:
-                return LocationEnrichmentResult()
-
-            # Lookup IP in GeoIP2 database
-            response = self._reader.city(ip_address)
-
-            # Extract location data (all fields optional in GeoIP2)
-            city = response.city.name if response.city.name else None
-            country_code = (
-                response.country.iso_code if response.country.iso_code else None
-            )
-            latitude = (
-                response.location.latitude if response.location.latitude else None
-            )
-            longitude = (
-                response.location.longitude if response.location.longitude else None
-            )
+            started = time.perf_counter()
+            try:
+                result = await asyncio.to_thread(self._lookup, ip_address)
+            except geoip2.errors.AddressNotFoundError:
+                # IP not in database (common for some IP ranges)
+                self._logger.debug(
+                    "IP not found in GeoIP database",
+                    ip_address=ip_address,
+                )
+                result = LocationEnrichmentResult()
 
-            # Format location string: "City, CC" or "CC" if no city
-            location = None
-            if city and country_code:
-                location = f"{city}, {country_code}"
-            elif country_code:
-                location = country_code
-
-            return LocationEnrichmentResult(
-                location=location,
-                city=city,
-                country_code=country_code,
-                latitude=latitude,
-                longitude=longitude,
-            )
+            # Reader unavailable (init failed): nothing worth caching
+            if result is None:
+                return LocationEnrichmentResult()
 
-        except geoip2.errors.AddressNotFoundError:
-            # IP not in database (common for some IP ranges)
-            self._logger.debug(
-                "IP not found in GeoIP database",
-                ip_address=ip_address,
-            )
-            return LocationEnrichmentResult()
+            self._cache.record_lookup((time.perf_counter() - started) * 1000)
+            self._cache.set(cache_key, result)
+            return result
 
         except Exception as e:
             # Any other error: fail-open (log warning, return empty)
@@ -141,11 +142,65 @@ class IPLocationEnricher:
             )
             return LocationEnrichmentResult()
 
+    def get_stats(self) -> EnrichmentStats:
+        """Get lookup cache statistics.
+
+        Returns:
+            EnrichmentStats with hit/miss counters and lookup latency.
+        """
+        return self._cache.get_stats()
+
+    def _lookup(self, ip_address: str) -> LocationEnrichmentResult | None:
+        """Look up an IP in the GeoIP2 database (runs in a worker thread).
+
+        Args:
+            ip_address: Public IP address.
+
+        Returns:
+            LocationEnrichmentResult, or None if the database is unavailable.
+
+        Raises:
+            geoip2.errors.AddressNotFoundError: IP not in database.
+        """
+        # Lazy load database reader
+        if self._reader is None:
+            with self._reader_lock:
+                if self._reader is None:
+                    self._init_reader()
+
+        # If reader still None (init failed), no lookup
+        if self._reader is None:
+            return None
+
+        response = self._reader.city(ip_address)
+
+        # Extract location data (all fields optional in GeoIP2)
+        city = response.city.name if response.city.name else None
+        country_code = response.country.iso_code if response.country.iso_code else None
+        latitude = response.location.latitude if response.location.latitude else None
+        longitude = response.location.longitude if response.location.longitude else None
+
+        # Format location string: "City, CC" or "CC" if no city
+        location = None
+        if city and country_code:
+            location = f"{city}, {country_code}"
+        elif country_code:
+            location = country_code
+
+        return LocationEnrichmentResult(
+            location=location,
+            city=city,
+            country_code=country_code,
+            latitude=latitude,
+            longitude=longitude,
+        )
+
     def _init_reader(self) -> None:
         """Initialize GeoIP2 database reader (lazy loading).
 
-        Called on first use. If initialization fails, logs warning and sets
-        reader to None (geolocation disabled).
+        Called on first use. The database is memory-mapped, so the file is
+        not read into this process's heap. If initialization fails, logs
+        warning and sets reader to None (geolocation disabled).
         """
         try:
             if not self._db_path:
@@ -159,7 +214,9 @@ class IPLocationEnricher:
                 )
                 return
 
-            self._reader = geoip2.database.Reader(str(db_file))
+            self._reader = geoip2.database.Reader(
+                str(db_file), mode=geoip2.database.MODE_MMAP
+            )
             self._logger.info(
                 "GeoIP database loaded successfully",
                 db_path=self._db_path,
@@ -173,6 +230,24 @@ class IPLocationEnricher:
             )
             self._reader = None
 
+    @staticmethod
+    def _cache_key(ip_address: str) -> str:
+        """Get the IP prefix an address's location is cached under.
+
+        Args:
+            ip_address: Valid public IP address.
+
+        Returns:
+            Network string, e.g. "203.0.113.0/24".
+        """
+        ip = ipaddress.ip_address(ip_address)
+        prefix = (
+            LOCATION_ENRICHMENT_IPV4_PREFIX
+            if ip.version == 4
+            else LOCATION_ENRICHMENT_IPV6_PREFIX
+        )
+        return str(ipaddress.ip_network((str(ip), prefix), strict=False))
+
     def _is_private_ip(self, ip_address: str) -> bool:
         """Check if IP address is private/reserved.
 
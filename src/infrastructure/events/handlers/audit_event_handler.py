@@ -40,8 +40,9 @@ Reference:
     - docs/architecture/audit-trail-architecture.md
 """
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from src.core.result import Failure
 from src.domain.enums.audit_action import AuditAction
 from src.domain.events.auth_events import (
     # Auth Token Refresh Events (JWT rotation)
@@ -147,9 +148,13 @@ from src.domain.events.data_events import (
     FileImportSucceeded,
     FileImportFailed,
 )
+from src.domain.protocols.logger_protocol import LoggerProtocol
 from src.infrastructure.events.in_memory_event_bus import InMemoryEventBus
 from src.infrastructure.persistence.database import Database
 
+if TYPE_CHECKING:
+    from src.infrastructure.audit.batched_writer import BatchedAuditWriter
+
 
 class AuditEventHandler:
     """Event handler for audit trail recording.
@@ -158,13 +163,18 @@ class AuditEventHandler:
     full context for compliance (PCI-DSS, SOC 2, GDPR). Supports ATTEMPT →
     OUTCOME audit pattern for security event tracking.
 
-    REQUIRES database session from event bus to ensure proper lifecycle
-    management and compliance with F0.9.1 (Separate Audit Session). Session
-    MUST be passed to event_bus.publish(event, session=session).
+    Records are written through one of two paths:
+        - Session passed to event_bus.publish(event, session=session): written
+          and committed inline in that session (caller-managed lifecycle,
+          F0.9.1 Separate Audit Session)
+        - No session: handed to the batched audit writer, which persists
+          compliance-critical actions before returning and batches the rest
 
     Attributes:
         _database: Database instance (kept for future use/debugging).
-        _event_bus: Event bus instance to get required session from.
+        _event_bus: Event bus instance to get session and metadata from.
+        _audit_writer: Batched writer for events published without a session.
+        _logger: Logger for audit writes that failed (optional).
 
     Example:
         >>> # Create handler
@@ -185,13 +195,23 @@ class AuditEventHandler:
         >>> # Audit record created using provided session
     """
 
-    def __init__(self, database: Database, event_bus: InMemoryEventBus) -> None:
+    def __init__(
+        self,
+        database: Database,
+        event_bus: InMemoryEventBus,
+        audit_writer: "BatchedAuditWriter | None" = None,
+        logger: LoggerProtocol | None = None,
+    ) -> None:
         """Initialize audit handler with database and event bus.
 
         Args:
             database: Database instance from container (kept for future use).
-            event_bus: Event bus instance to get REQUIRED session from during
-                event handling. Session must be passed to event_bus.publish().
+            event_bus: Event bus instance to get session and metadata from
+                during event handling.
+            audit_writer: Batched writer used when publish() received no
+                session. None requires a session on every publish.
+            logger: Logger for failed audit writes. Audit failures never
+                fail the operation that emitted the event.
 
         Example:
             >>> from src.core.container import get_database, get_event_bus
@@ -201,13 +221,16 @@ class AuditEventHandler:
         """
         self._database = database
         self._event_bus = event_bus
+        self._audit_writer = audit_writer
+        self._logger = logger
 
     async def _create_audit_record(self, **kwargs: Any) -> None:
         """Helper to create audit record using session and metadata from event bus.
 
-        Gets session from event bus. Session is REQUIRED for audit trail recording
-        to ensure proper lifecycle management and compliance with F0.9.1 (Separate
-        Audit Session).
+        If a session was passed to publish(), the record is written and
+        committed in it (caller-managed lifecycle, F0.9.1 Separate Audit
+        Session). Otherwise it goes to the batched audit writer, which keeps
+        the request path free of per-record commits.
 
         Also extracts request metadata (IP address, user agent) for PCI-DSS 10.2.7
         compliance. Metadata is optional and defaults to None if not provided.
@@ -216,21 +239,35 @@ class AuditEventHandler:
             **kwargs: Arguments to pass to audit.record().
 
         Raises:
-            RuntimeError: If no session provided to event bus. This is a
-                programming error - caller must pass session to event_bus.publish().
+            RuntimeError: If no session provided to event bus and no audit
+                writer configured. This is a programming error - caller must
+                pass session to event_bus.publish().
 
         Note:
-            Session must be passed to event_bus.publish(event, session=session).
             Metadata can optionally be passed: event_bus.publish(event, session, metadata={}).
             See docs/architecture/domain-events-architecture.md for session
             lifecycle management patterns.
         """
         from src.infrastructure.audit.postgres_adapter import PostgresAuditAdapter
 
-        # Get session from event bus (REQUIRED)
         session = self._event_bus.get_session()
 
-        if session is None:
+        # Get metadata from event bus (OPTIONAL - for PCI-DSS 10.2.7 compliance)
+        metadata = self._event_bus.get_metadata()
+
+        # Merge metadata into kwargs (use setdefault to not overwrite explicit values)
+        if metadata:
+            kwargs.setdefault("ip_address", metadata.get("ip_address"))
+            kwargs.setdefault("user_agent", metadata.get("user_agent"))
+
+        if session is not None:
+            # Use session from event bus (proper lifecycle)
+            audit = PostgresAuditAdapter(session=session)
+            result = await audit.record(**kwargs)
+        elif self._audit_writer is not None:
+            # Batched path (durable actions persisted before returning)
+            result = await self._audit_writer.record(**kwargs)
+        else:
             raise RuntimeError(
                 "AuditEventHandler requires a database session for audit recording. "
                 "No session was provided to event_bus.publish(). "
@@ -240,17 +277,14 @@ class AuditEventHandler:
                 "\n\nSee docs/architecture/domain-events-architecture.md for details."
             )
 
-        # Get metadata from event bus (OPTIONAL - for PCI-DSS 10.2.7 compliance)
-        metadata = self._event_bus.get_metadata()
-
-        # Merge metadata into kwargs (use setdefault to not overwrite explicit values)
-        if metadata:
-            kwargs.setdefault("ip_address", metadata.get("ip_address"))
-            kwargs.setdefault("user_agent", metadata.get("user_agent"))
-
-        # Use session from event bus (proper lifecycle)
-        audit = PostgresAuditAdapter(session=session)
-        await audit.record(**kwargs)
+        if isinstance(result, Failure) and self._logger is not None:
+            self._logger.error(
+                "audit_record_failed",
+                action=kwargs["action"].value,
+                user_id=str(kwargs.get("user_id")),
+                error_code=result.error.code.value,
+                error_message=result.error.message,
+            )
 
     # =========================================================================
     # User Registration Event Handlers
@@ -10,6 +10,7 @@ Architecture:
     - Fail-open behavior (one handler failure doesn't break others)
     - Concurrent handler execution (asyncio.gather)
     - Comprehensive error logging for handler failures
+    - Publish context (session, metadata) carried per task (contextvars)
 
 Usage:
     >>> # Container creates singleton instance
@@ -29,6 +30,8 @@ Reference:
 
 import asyncio
 from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from src.domain.events.base_event import DomainEvent
@@ -39,6 +42,17 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
+@dataclass(frozen=True, slots=True)
+class _PublishContext:
+    """Session and request metadata of one publish() call."""
+
+    session: "AsyncSession | None" = None
+    metadata: dict[str, str] = field(default_factory=dict)
+
+
+_EMPTY_CONTEXT = _PublishContext()
+
+
 class InMemoryEventBus:
     """In-memory event bus with fail-open behavior.
 
@@ -51,6 +65,13 @@ class InMemoryEventBus:
         - For multi-threaded, use locks or separate adapter
         - For distributed systems, use RabbitMQ/Kafka adapter
 
+    Concurrency:
+        - Concurrent publishes on one worker are safe: session and metadata
+          live in a ContextVar, so each publish (and the handler tasks it
+          starts) sees its own values
+        - A handler publishing another event gets the outer context back
+          once the nested publish returns
+
     Performance:
         - O(1) handler lookup by event type
         - Concurrent handler execution (asyncio.gather)
@@ -61,6 +82,7 @@ class InMemoryEventBus:
             Key: Event class (e.g., UserRegistered)
             Value: List of async handler functions
         _logger: Logger for handler failures and event publishing
+        _context: Per-task publish context (session, metadata)
 
     Example:
         >>> # Subscribe handlers
@@ -97,12 +119,10 @@ class InMemoryEventBus:
         """
         self._handlers: dict[type[DomainEvent], list[EventHandler]] = defaultdict(list)
         self._logger = logger
-        self._session: "AsyncSession | None" = (
-            None  # Session for handlers that need DB access
+        # Per-bus var: handler tasks copy the context of the publishing task
+        self._context: ContextVar[_PublishContext] = ContextVar(
+            f"event_bus_publish_context_{id(self)}", default=_EMPTY_CONTEXT
         )
-        self._metadata: dict[
-            str, str
-        ] = {}  # Metadata for handlers (IP, user agent, etc.)
 
     def subscribe(
         self,
@@ -153,12 +173,14 @@ class InMemoryEventBus:
             event: Domain event to publish (subclass of DomainEvent). All
                 handlers registered for type(event) will be called.
             session: Optional database session for handlers that need database
-                access (e.g., AuditEventHandler). Stored as instance variable
-                for duration of publish() so handlers can access via get_session().
+                access (e.g., AuditEventHandler). Set in the publishing task's
+                context for duration of publish() so handlers can access via
+                get_session().
                 Defaults to None for backward compatibility.
             metadata: Optional dict with request context (ip_address, user_agent,
-                trace_id) for audit trail enrichment. Stored as instance variable
-                for duration of publish() so handlers can access via get_metadata().
+                trace_id) for audit trail enrichment. Set in the publishing task's
+                context for duration of publish() so handlers can access via
+                get_metadata().
                 Defaults to None for backward compatibility.
 
         Example:
@@ -193,9 +215,11 @@ class InMemoryEventBus:
             - Handler failures logged with event_id for debugging
             - NEVER raises exceptions (fail-open guarantee)
         """
-        # Store session and metadata for handlers that need them
-        self._session = session
-        self._metadata = metadata or {}
+        # Scope session and metadata to this task; handler tasks started by
+        # asyncio.gather copy the context, so overlapping publishes never mix
+        token = self._context.set(
+            _PublishContext(session=session, metadata=metadata or {})
+        )
 
         try:
             event_type = type(event)
@@ -235,9 +259,8 @@ class InMemoryEventBus:
                         exc_info=result,
                     )
         finally:
-            # Clear session and metadata after publish completes
-            self._session = None
-            self._metadata = {}
+            # Restore the previous context (outer publish or none)
+            self._context.reset(token)
 
     def get_session(self) -> "AsyncSession | None":
         """Get current database session for event handlers.
@@ -266,9 +289,10 @@ class InMemoryEventBus:
         Notes:
             - Only available during publish() execution
             - Returns None if no session provided to publish()
-            - Cleared after publish() completes (finally block)
+            - Scoped to the current task: concurrent publishes never see
+              each other's session
         """
-        return self._session
+        return self._context.get().session
 
     def get_metadata(self) -> dict[str, str]:
         """Get current request metadata for event handlers.
@@ -301,7 +325,7 @@ class InMemoryEventBus:
         Notes:
             - Only available during publish() execution
             - Returns empty dict if no metadata provided to publish()
-            - Cleared after publish() completes (finally block)
+            - Scoped to the current task (like get_session())
             - Handlers should use setdefault() to avoid overwriting explicit values
         """
-        return self._metadata
+        return self._context.get().metadata
@@ -0,0 +1,370 @@
+"""Leader-elected scheduler for periodic maintenance tasks.
+
+Every API worker runs a scheduler, but only the worker holding the Redis
+leader lock (``MAINTENANCE_LEADER_KEY``) runs tasks, so a sweep or refresh
+happens once per interval across the deployment rather than once per
+worker. The leader renews its lock on every tick, before each task and
+every tick while a task runs (so a slow task cannot outlive the lock);
+if it crashes, another worker takes over within
+``MAINTENANCE_LEADER_TTL_SECONDS``.
+
+Scheduling:
+    - Each task runs every ``interval_seconds`` +/- ``MAINTENANCE_JITTER_RATIO``
+      (random per run), so tasks drift apart instead of firing together
+    - A new leader runs each task within the first jitter window of its
+      interval (not all at once on election)
+    - Tasks run sequentially in the scheduler task; a failing task is
+      logged and retried at its next interval
+    - Tasks bound their own work per run (batch size limits)
+
+Metrics:
+    - Each run logs ``maintenance_task_completed`` (or ``_failed``) with
+      the task name, items processed and duration_ms
+    - ``get_stats()`` reports runs, failures, items and durations per task
+
+Architecture:
+    - Infrastructure adapter (app-scoped singleton, see
+      get_maintenance_scheduler())
+    - Tasks are plain async callables returning the number of items they
+      processed (wired in the container)
+    - Not thread-safe: used from the event loop only
+"""
+
+import asyncio
+import contextlib
+import random
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import Any, cast
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from uuid_extensions import uuid7
+
+from src.core.constants import (
+    MAINTENANCE_JITTER_RATIO,
+    MAINTENANCE_LEADER_KEY,
+    MAINTENANCE_LEADER_TTL_SECONDS,
+    MAINTENANCE_TICK_SECONDS,
+)
+from src.domain.protocols.logger_protocol import LoggerProtocol
+
+# Extend the lock only if this instance still holds it.
+_RENEW_LEADER_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# Release the lock only if this instance still holds it.
+_RELEASE_LEADER_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass(frozen=True, kw_only=True)
+class MaintenanceTask:
+    """A periodic maintenance task.
+
+    Attributes:
+        name: Task name (metrics and log key).
+        interval_seconds: Nominal time between runs (jitter is applied).
+        run: Async callable doing one bounded run; returns items processed.
+    """
+
+    name: str
+    interval_seconds: float
+    run: Callable[[], Awaitable[int]]
+
+
+@dataclass(kw_only=True)
+class MaintenanceTaskStats:
+    """Run statistics for one task (this process, while leader).
+
+    Attributes:
+        runs: Runs started (lifetime).
+        failures: Runs that raised (lifetime).
+        items_processed: Items processed by all runs (lifetime).
+        last_items: Items processed by the most recent run.
+        last_duration_ms: Duration of the most recent run.
+        max_duration_ms: Slowest run (lifetime).
+        last_run_at: When the most recent run finished.
+    """
+
+    runs: int = 0
+    failures: int = 0
+    items_processed: int = 0
+    last_items: int = 0
+    last_duration_ms: float = 0.0
+    max_duration_ms: float = 0.0
+    last_run_at: datetime | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class MaintenanceSchedulerStats:
+    """Point-in-time scheduler statistics.
+
+    Attributes:
+        is_leader: Whether this process currently runs the tasks.
+        leader_terms: Times this process acquired leadership (lifetime).
+        tasks: Per-task run statistics.
+    """
+
+    is_leader: bool
+    leader_terms: int
+    tasks: dict[str, MaintenanceTaskStats]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to dictionary.
+
+        Returns:
+            Dictionary with leadership and per-task counters.
+        """
+        return asdict(self)
+
+
+class MaintenanceScheduler:
+    """Runs maintenance tasks on the worker that holds the leader lock.
+
+    Attributes:
+        _redis: Redis client holding the leader lock.
+        _tasks: Tasks to schedule.
+        _logger: Logger for runs, failures and leadership changes.
+        _instance_id: Lock value identifying this process.
+        _next_run: Monotonic due time per task (while leader).
+        _task: Background scheduler loop.
+
+    Example:
+        >>> scheduler = get_maintenance_scheduler()
+        >>> scheduler.start()  # In application lifespan
+        >>> scheduler.get_stats().tasks["session_sweep"].runs
+        3
+        >>> await scheduler.aclose()  # In application shutdown
+    """
+
+    def __init__(
+        self,
+        *,
+        redis_client: Redis,
+        tasks: Sequence[MaintenanceTask],
+        logger: LoggerProtocol,
+        leader_key: str = MAINTENANCE_LEADER_KEY,
+        leader_ttl_seconds: int = MAINTENANCE_LEADER_TTL_SECONDS,
+        tick_seconds: float = MAINTENANCE_TICK_SECONDS,
+        jitter_ratio: float = MAINTENANCE_JITTER_RATIO,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize scheduler.
+
+        Args:
+            redis_client: Redis client for the leader lock.
+            tasks: Tasks to run while leader.
+            logger: Logger for runs and leadership changes.
+            leader_key: Redis key of the leader lock.
+            leader_ttl_seconds: Leader lock lifetime (renewed every tick and
+                before each task).
+            tick_seconds: Time between leadership checks / due-task checks.
+            jitter_ratio: Random +/- fraction applied to task intervals.
+            rng: Random source (injectable for tests).
+        """
+        self._redis = redis_client
+        self._tasks = list(tasks)
+        self._logger = logger
+        self._leader_key = leader_key
+        self._leader_ttl_ms = leader_ttl_seconds * 1000
+        self._tick = tick_seconds
+        self._jitter = jitter_ratio
+        self._rng = rng or random.Random()
+        self._instance_id = str(uuid7())
+        self._is_leader = False
+        self._leader_terms = 0
+        self._next_run: dict[str, float] = {}
+        self._stats = {task.name: MaintenanceTaskStats() for task in self._tasks}
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this process currently holds the leader lock."""
+        return self._is_leader
+
+    def start(self) -> None:
+        """Start the scheduler loop (idempotent)."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._loop(), name="maintenance-scheduler")
+
+    async def aclose(self) -> None:
+        """Stop the loop and give up leadership."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._is_leader:
+            self._is_leader = False
+            with contextlib.suppress(RedisError):
+                await cast(
+                    Awaitable[int],
+                    self._redis.eval(
+                        _RELEASE_LEADER_SCRIPT, 1, self._leader_key, self._instance_id
+                    ),
+                )
+
+    def get_stats(self) -> MaintenanceSchedulerStats:
+        """Get scheduler statistics.
+
+        Returns:
+            Leadership state and per-task run statistics.
+        """
+        return MaintenanceSchedulerStats(
+            is_leader=self._is_leader,
+            leader_terms=self._leader_terms,
+            tasks={
+                name: MaintenanceTaskStats(**asdict(stats))
+                for name, stats in self._stats.items()
+            },
+        )
+
+    async def run_once(self) -> None:
+        """One tick: renew or contend for leadership, then run due tasks."""
+        if not await self._elect():
+            return
+
+        for task in self._tasks:
+            if time.monotonic() < self._next_run[task.name]:
+                continue
+            # Earlier tasks may have used up most of the lock TTL.
+            if not await self._renew():
+                break
+            await self._run_task(task)
+            self._next_run[task.name] = time.monotonic() + self._jittered(
+                task.interval_seconds
+            )
+
+    async def _loop(self) -> None:
+        """Tick until cancelled."""
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self._tick)
+
+    async def _elect(self) -> bool:
+        """Renew the leader lock, or try to take it; return leadership."""
+        try:
+            if self._is_leader:
+                await self._extend_lock()
+
+            if not self._is_leader and await self._redis.set(
+                self._leader_key, self._instance_id, nx=True, px=self._leader_ttl_ms
+            ):
+                self._become_leader()
+        except RedisError as e:
+            self._stand_down(e)
+        return self._is_leader
+
+    async def _renew(self) -> bool:
+        """Extend the leader lock before a task; return leadership."""
+        try:
+            await self._extend_lock()
+        except RedisError as e:
+            self._stand_down(e)
+        return self._is_leader
+
+    async def _keep_lease(self) -> None:
+        """Renew the leader lock every tick while a task runs."""
+        while self._is_leader:
+            await asyncio.sleep(self._tick)
+            await self._renew()
+
+    async def _extend_lock(self) -> None:
+        """Reset the lock TTL; give up leadership if the lock is gone."""
+        renewed = await cast(
+            Awaitable[int],
+            self._redis.eval(
+                _RENEW_LEADER_SCRIPT,
+                1,
+                self._leader_key,
+                self._instance_id,
+                self._leader_ttl_ms,
+            ),
+        )
+        if not renewed:
+            self._is_leader = False
+            self._logger.warning(
+                "maintenance_leadership_lost", instance_id=self._instance_id
+            )
+
+    def _stand_down(self, error: RedisError) -> None:
+        """Give up leadership after a Redis error."""
+        # Without Redis no one can prove leadership; stand down.
+        self._is_leader = False
+        self._logger.warning(
+            "maintenance_leader_election_failed",
+            instance_id=self._instance_id,
+            error_message=str(error),
+        )
+
+    def _become_leader(self) -> None:
+        """Record a new term and schedule each task's first run."""
+        self._is_leader = True
+        self._leader_terms += 1
+        now = time.monotonic()
+        for task in self._tasks:
+            first_window = task.interval_seconds * self._jitter
+            self._next_run[task.name] = now + self._rng.uniform(0, first_window)
+        self._logger.info(
+            "maintenance_leadership_acquired", instance_id=self._instance_id
+        )
+
+    async def _run_task(self, task: MaintenanceTask) -> None:
+        """Run one task, recording duration and items processed."""
+        stats = self._stats[task.name]
+        stats.runs += 1
+        start = time.perf_counter()
+        # A long run (e.g. a large sweep) must not outlive the lock TTL.
+        lease = asyncio.create_task(self._keep_lease())
+        try:
+            items = await task.run()
+        except Exception as e:
+            duration_ms = (time.perf_counter() - start) * 1000
+            stats.failures += 1
+            self._record_duration(stats, duration_ms)
+            self._logger.error(
+                "maintenance_task_failed",
+                task=task.name,
+                duration_ms=round(duration_ms, 2),
+                error_type=type(e).__name__,
+                error_message=str(e),
+            )
+            return
+        finally:
+            lease.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await lease
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        stats.items_processed += items
+        stats.last_items = items
+        self._record_duration(stats, duration_ms)
+        self._logger.info(
+            "maintenance_task_completed",
+            task=task.name,
+            items=items,
+            duration_ms=round(duration_ms, 2),
+        )
+
+    def _jittered(self, interval_seconds: float) -> float:
+        """Apply +/- jitter to an interval."""
+        return interval_seconds * (1 + self._rng.uniform(-self._jitter, self._jitter))
+
+    @staticmethod
+    def _record_duration(stats: MaintenanceTaskStats, duration_ms: float) -> None:
+        """Record the timing of a finished run."""
+        stats.last_duration_ms = duration_ms
+        stats.max_duration_ms = max(stats.max_duration_ms, duration_ms)
+        stats.last_run_at = datetime.now(UTC)
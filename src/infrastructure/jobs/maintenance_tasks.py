@@ -0,0 +1,281 @@
+"""Maintenance tasks run by the MaintenanceScheduler.
+
+Each task does one bounded run and returns the number of items it
+processed (the scheduler records it as a metric).
+
+Tasks:
+    ExpiredSessionSweeper - Batched DELETEs of expired sessions and tokens
+    StaleAccountRefresher - Enqueue staggered syncs for stale accounts
+      (connections whose last sync failed recently are skipped)
+    BalanceSnapshotRecorder - Scheduled balance snapshots for all active
+      accounts (RecordBalanceSnapshots, committed per page)
+
+Architecture:
+    - Infrastructure only: repositories and the SyncJobRunner are used
+      directly; commands are built by callables from the container
+    - Each DELETE batch runs in its own short transaction, so a sweep
+      never holds locks on many rows at once
+"""
+
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from src.core.constants import (
+    MAINTENANCE_DELETE_BATCH_SIZE,
+    MAINTENANCE_FAILED_SYNC_BACKOFF_SECONDS,
+    MAINTENANCE_MAX_DELETE_BATCHES,
+    MAINTENANCE_REVOKED_SESSION_RETENTION_DAYS,
+    MAINTENANCE_STALE_ACCOUNT_BATCH_SIZE,
+    MAINTENANCE_SYNC_STAGGER_SECONDS,
+)
+from src.core.result import Failure, Result
+from src.domain.protocols.logger_protocol import LoggerProtocol
+from src.infrastructure.jobs.sync_job_runner import SyncJobRunner
+from src.infrastructure.jobs.sync_job_store import SyncJobKind
+from src.infrastructure.persistence.database import Database
+from src.infrastructure.persistence.repositories import (
+    AccountRepository,
+    EmailVerificationTokenRepository,
+    PasswordResetTokenRepository,
+    ProviderConnectionRepository,
+    RefreshTokenRepository,
+    SessionRepository,
+)
+
+
+class ExpiredSessionSweeper:
+    """Delete expired sessions and auth tokens in bounded batches.
+
+    Per table, deletes up to ``batch_size`` rows per transaction and at
+    most ``max_batches`` batches per run; leftovers are picked up by the
+    next run. Revoked sessions are kept for ``revoked_retention`` (audit
+    and "recent sessions" views) before being swept.
+    """
+
+    def __init__(
+        self,
+        *,
+        database: Database,
+        logger: LoggerProtocol,
+        batch_size: int = MAINTENANCE_DELETE_BATCH_SIZE,
+        max_batches: int = MAINTENANCE_MAX_DELETE_BATCHES,
+        revoked_retention: timedelta = timedelta(
+            days=MAINTENANCE_REVOKED_SESSION_RETENTION_DAYS
+        ),
+    ) -> None:
+        """Initialize sweeper.
+
+        Args:
+            database: Database for per-batch sessions.
+            logger: Logger for per-table counts.
+            batch_size: Maximum rows deleted per DELETE statement.
+            max_batches: Maximum DELETE statements per table per run.
+            revoked_retention: How long revoked sessions are kept.
+        """
+        self._database = database
+        self._logger = logger
+        self._batch_size = batch_size
+        self._max_batches = max_batches
+        self._revoked_retention = revoked_retention
+
+    async def __call__(self) -> int:
+        """Run one sweep.
+
+        Returns:
+            Total rows deleted across all tables.
+        """
+        now = datetime.now(UTC)
+        limit = self._batch_size
+        deleted = {
+            "sessions": await self._sweep(
+                lambda s: SessionRepository(s).cleanup_expired_sessions(
+                    before=now,
+                    revoked_before=now - self._revoked_retention,
+                    limit=limit,
+                )
+            ),
+            "refresh_tokens": await self._sweep(
+                lambda s: RefreshTokenRepository(s).delete_expired(
+                    before=now, limit=limit
+                )
+            ),
+            "password_reset_tokens": await self._sweep(
+                lambda s: PasswordResetTokenRepository(s).delete_expired_tokens(
+                    limit=limit
+                )
+            ),
+            "email_verification_tokens": await self._sweep(
+                lambda s: EmailVerificationTokenRepository(s).delete_expired_tokens(
+                    limit=limit
+                )
+            ),
+        }
+        self._logger.info("maintenance_session_sweep", **deleted)
+        return sum(deleted.values())
+
+    async def _sweep(self, delete_batch: Callable[[Any], Any]) -> int:
+        """Repeat a batched DELETE until a short batch or the batch cap."""
+        total = 0
+        for _ in range(self._max_batches):
+            async with self._database.get_session() as session:
+                count: int = await delete_batch(session)
+            total += count
+            if count < self._batch_size:
+                break
+        return total
+
+
+class StaleAccountRefresher:
+    """Enqueue account syncs for connections with stale accounts.
+
+    Picks the stalest active accounts (up to ``batch_size``), groups them
+    by provider connection and submits one ACCOUNTS sync job per
+    connection that can sync. Submissions are staggered by
+    ``stagger_seconds`` so a run never hits providers all at once. The
+    runner's dedupe lock skips connections already syncing.
+
+    Connections whose last account sync failed within ``failure_backoff``
+    are excluded from the stale account query, so a few broken
+    connections cannot occupy the batch (and be retried) on every run.
+    """
+
+    def __init__(
+        self,
+        *,
+        database: Database,
+        runner: SyncJobRunner,
+        build_command: Callable[[UUID, UUID], Any],
+        logger: LoggerProtocol,
+        threshold: timedelta,
+        batch_size: int = MAINTENANCE_STALE_ACCOUNT_BATCH_SIZE,
+        stagger_seconds: float = MAINTENANCE_SYNC_STAGGER_SECONDS,
+        failure_backoff: timedelta = timedelta(
+            seconds=MAINTENANCE_FAILED_SYNC_BACKOFF_SECONDS
+        ),
+    ) -> None:
+        """Initialize refresher.
+
+        Args:
+            database: Database for the stale account query.
+            runner: Background sync job runner.
+            build_command: Builds the sync command from (user_id, connection_id).
+            logger: Logger for enqueue failures.
+            threshold: Accounts not synced within this are stale.
+            batch_size: Maximum stale accounts considered per run.
+            stagger_seconds: Delay added between consecutive submissions.
+            failure_backoff: How long a connection is skipped after its
+                last sync job failed.
+        """
+        self._database = database
+        self._runner = runner
+        self._build_command = build_command
+        self._logger = logger
+        self._threshold = threshold
+        self._batch_size = batch_size
+        self._stagger = stagger_seconds
+        self._failure_backoff = failure_backoff
+
+    async def __call__(self) -> int:
+        """Run one refresh pass.
+
+        Returns:
+            Number of sync jobs enqueued (duplicates excluded).
+        """
+        failed = await self._runner.recently_failed_targets(
+            SyncJobKind.ACCOUNTS, self._failure_backoff.total_seconds()
+        )
+        if isinstance(failed, Failure):
+            # Jobs could not be submitted either; retry next run.
+            self._logger.warning(
+                "maintenance_sync_backoff_lookup_failed",
+                error_message=failed.error.message,
+            )
+            return 0
+
+        async with self._database.get_session() as session:
+            accounts = await AccountRepository(session).find_needing_sync(
+                self._threshold,
+                limit=self._batch_size,
+                exclude_connection_ids=failed.value,
+            )
+            connection_repo = ProviderConnectionRepository(session)
+            connections = []
+            # Stalest first: dict keeps first-seen connection order.
+            for connection_id in dict.fromkeys(a.connection_id for a in accounts):
+                connection = await connection_repo.find_by_id(connection_id)
+                if connection is not None and connection.can_sync():
+                    connections.append(connection)
+
+        enqueued = 0
+        for connection in connections:
+            result = await self._runner.submit(
+                kind=SyncJobKind.ACCOUNTS,
+                user_id=connection.user_id,
+                target_id=connection.id,
+                command=self._build_command(connection.user_id, connection.id),
+                delay_seconds=enqueued * self._stagger,
+            )
+            if isinstance(result, Failure):
+                self._logger.warning(
+                    "maintenance_sync_enqueue_failed",
+                    connection_id=str(connection.id),
+                    error_message=result.error.message,
+                )
+                break
+            if not result.value.deduplicated:
+                enqueued += 1
+        return enqueued
+
+
+class BalanceSnapshotRecorder:
+    """Record scheduled balance snapshots for all active accounts.
+
+    Runs the RecordBalanceSnapshots command through ``execute`` (its
+    handler in a new session). The handler pages through active accounts
+    and commits each page, so a failed run keeps the pages it recorded;
+    balances unchanged within the dedupe window are skipped. Providers
+    are not called.
+    """
+
+    def __init__(
+        self,
+        *,
+        execute: Callable[[Any], Awaitable[Result[Any, Any]]],
+        build_command: Callable[[], Any],
+        logger: LoggerProtocol,
+    ) -> None:
+        """Initialize recorder.
+
+        Args:
+            execute: Runs a command with its registered handler.
+            build_command: Builds the RecordBalanceSnapshots command.
+            logger: Logger for capture counts and failures.
+        """
+        self._execute = execute
+        self._build_command = build_command
+        self._logger = logger
+
+    async def __call__(self) -> int:
+        """Run one capture.
+
+        Returns:
+            Number of snapshots recorded (unchanged balances excluded).
+        """
+        result = await self._execute(self._build_command())
+        if isinstance(result, Failure):
+            # Pages committed before the failure are kept; retry next run.
+            self._logger.warning(
+                "maintenance_balance_snapshots_failed",
+                error_message=str(result.error),
+            )
+            return 0
+
+        captured: int = result.value.snapshots_captured
+        self._logger.info(
+            "maintenance_balance_snapshots",
+            accounts_scanned=result.value.accounts_scanned,
+            snapshots_captured=captured,
+        )
+        return captured
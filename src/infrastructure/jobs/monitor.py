@@ -2,7 +2,9 @@
 
 This module provides JobsMonitor, which connects to the dashtam-jobs Redis
 instance to query queue length, job status, and health. It enables the API
-to monitor the background jobs service without code dependencies.
+to monitor the background jobs service without code dependencies. It also
+reads the status of in-process sync jobs (see sync_job_runner.py) kept in
+the same Redis.
 
 Architecture:
 - Uses redis.asyncio for async Redis operations
@@ -14,6 +16,7 @@ Architecture:
 import json
 from dataclasses import dataclass
 from typing import Any
+from uuid import UUID
 
 from redis.asyncio import Redis
 from redis.exceptions import RedisError
@@ -22,6 +25,7 @@ from src.core.enums import ErrorCode
 from src.core.result import Failure, Result, Success
 from src.infrastructure.enums import InfrastructureErrorCode
 from src.infrastructure.errors import InfrastructureError
+from src.infrastructure.jobs.sync_job_store import SyncJob, SyncJobStore
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -33,12 +37,16 @@ class JobsHealthStatus:
         queue_length: Number of jobs waiting in the queue.
         redis_connected: Whether Redis connection is active.
         error: Error message if unhealthy.
+        sync_jobs_queued: Sync jobs waiting for a worker slot (all workers).
+        sync_jobs_running: Sync jobs currently running (all workers).
     """
 
     healthy: bool
     queue_length: int
     redis_connected: bool
     error: str | None = None
+    sync_jobs_queued: int = 0
+    sync_jobs_running: int = 0
 
     def to_dict(self) -> dict[str, Any]:  # noqa: PLW3201
         """Convert to dictionary for JSON serialization.
@@ -51,6 +59,8 @@ class JobsHealthStatus:
             "queue_length": self.queue_length,
             "redis_connected": self.redis_connected,
             "error": self.error,
+            "sync_jobs_queued": self.sync_jobs_queued,
+            "sync_jobs_running": self.sync_jobs_running,
         }
 
 
@@ -64,17 +74,26 @@ class JobsMonitor:
     Attributes:
         _redis: Async Redis client instance.
         _queue_name: Name of the jobs queue in Redis.
+        _sync_jobs: Sync job status store (same Redis).
     """
 
-    def __init__(self, redis_client: Redis, queue_name: str = "dashtam:jobs") -> None:
+    def __init__(
+        self,
+        redis_client: Redis,
+        queue_name: str = "dashtam:jobs",
+        sync_job_store: SyncJobStore | None = None,
+    ) -> None:
         """Initialize jobs monitor.
 
         Args:
             redis_client: Async Redis client instance.
             queue_name: Name of the jobs queue (must match dashtam-jobs config).
+            sync_job_store: Sync job status store (defaults to one on
+                redis_client).
         """
         self._redis = redis_client
         self._queue_name = queue_name
+        self._sync_jobs = sync_job_store or SyncJobStore(redis_client)
 
     async def check_health(self) -> Result[JobsHealthStatus, InfrastructureError]:
         """Check health of the background jobs service.
@@ -91,11 +110,16 @@ class JobsMonitor:
             # Get queue length
             queue_length = await self._redis.llen(self._queue_name)  # type: ignore[misc]
 
+            # In-process sync jobs (all API workers)
+            sync_queued, sync_running = await self._sync_jobs.count_active()
+
             return Success(
                 value=JobsHealthStatus(
                     healthy=True,
                     queue_length=queue_length,
                     redis_connected=True,
+                    sync_jobs_queued=sync_queued,
+                    sync_jobs_running=sync_running,
                 )
             )
         except RedisError as e:
@@ -186,3 +210,27 @@ class JobsMonitor:
                     },
                 )
             )
+
+    async def get_sync_job(
+        self, job_id: UUID
+    ) -> Result[SyncJob | None, InfrastructureError]:
+        """Get the status of a background sync job.
+
+        Args:
+            job_id: Sync job identifier (from the 202 sync response).
+
+        Returns:
+            Result with SyncJob if found, None if unknown or expired,
+            or InfrastructureError.
+        """
+        try:
+            return Success(value=await self._sync_jobs.get(job_id))
+        except RedisError as e:
+            return Failure(
+                error=InfrastructureError(
+                    code=ErrorCode.VALIDATION_FAILED,
+                    infrastructure_code=InfrastructureErrorCode.CONNECTION_ERROR,
+                    message="Failed to get sync job",
+                    details={"error": str(e), "job_id": str(job_id)},
+                )
+            )
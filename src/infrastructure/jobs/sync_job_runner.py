@@ -0,0 +1,365 @@
+"""In-process runner for background provider sync jobs.
+
+Sync endpoints submit their command here and return 202 Accepted with the
+job id instead of holding the request open for the provider API. The
+runner executes the command on the worker's event loop in its own database
+session, bounded by a concurrency cap per sync kind, and records status in
+SyncJobStore so every API worker (and /admin/jobs) can read it. Progress
+reaches clients through the SYNC_* SSE events the sync handlers already
+publish (started, completed, failed).
+
+Guarantees:
+    - At most one queued/running job per (kind, target): duplicates return
+      the existing job (only for the same user; routes check target
+      ownership before submitting)
+    - Each kind has its own semaphore, so a burst of holdings syncs cannot
+      starve account syncs
+    - ``aclose()`` gives running jobs ``SYNC_JOB_SHUTDOWN_GRACE_SECONDS`` to
+      finish, then cancels them and marks them failed
+    - A Redis outage does not stop a job that already started: status
+      writes are best-effort and logged
+
+    Jobs live in the memory of the worker that accepted them; a hard crash
+    loses them (their locks expire after ``SYNC_JOB_LOCK_TTL_SECONDS``).
+
+Architecture:
+    - Infrastructure adapter (app-scoped singleton, see get_sync_job_runner())
+    - Executor callable resolves and runs the CQRS handler (wired in the
+      container), keeping this module free of handler imports
+    - Returns Result types for submit/lookup
+    - Not thread-safe: used from the event loop only
+"""
+
+import asyncio
+import dataclasses
+import json
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from redis.exceptions import RedisError
+from uuid_extensions import uuid7
+
+from src.core.constants import SYNC_JOB_SHUTDOWN_GRACE_SECONDS
+from src.core.enums import ErrorCode
+from src.core.result import Failure, Result, Success
+from src.domain.protocols.logger_protocol import LoggerProtocol
+from src.infrastructure.enums import InfrastructureErrorCode
+from src.infrastructure.errors import InfrastructureError
+from src.infrastructure.jobs.sync_job_store import (
+    SyncJob,
+    SyncJobKind,
+    SyncJobStatus,
+    SyncJobStore,
+)
+
+SyncJobExecutor = Callable[[Any], Awaitable[Result[Any, Any]]]
+"""Runs a sync command in its own session and returns the handler Result."""
+
+
+@dataclass(frozen=True, kw_only=True)
+class SyncJobSubmission:
+    """Outcome of submitting a sync job.
+
+    Attributes:
+        job: The accepted job (new, or the active duplicate).
+        deduplicated: True if an unfinished job for the same target was
+            returned instead of starting a new one.
+    """
+
+    job: SyncJob
+    deduplicated: bool = False
+
+
+@dataclass(frozen=True, kw_only=True)
+class SyncJobRunnerStats:
+    """Point-in-time runner statistics for this worker process.
+
+    Attributes:
+        running: Jobs holding a worker slot, per kind.
+        waiting: Jobs waiting for a worker slot, per kind.
+        capacity: Concurrency cap, per kind.
+        completed: Jobs finished by this process (lifetime).
+    """
+
+    running: dict[str, int]
+    waiting: dict[str, int]
+    capacity: dict[str, int]
+    completed: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to dictionary.
+
+        Returns:
+            Dictionary with per-kind counters.
+        """
+        return dataclasses.asdict(self)
+
+
+class SyncJobRunner:
+    """Runs sync commands as background jobs with per-kind concurrency caps.
+
+    Attributes:
+        _store: Redis status store (shared across workers).
+        _executor: Runs a command and returns the handler Result.
+        _logger: Logger for job failures and status write errors.
+        _capacity: Concurrency cap per kind.
+        _semaphores: One semaphore per kind.
+        _tasks: Jobs submitted by this process that have not finished.
+
+    Example:
+        >>> runner = get_sync_job_runner()
+        >>> result = await runner.submit(
+        ...     kind=SyncJobKind.ACCOUNTS,
+        ...     user_id=user_id,
+        ...     target_id=connection_id,
+        ...     command=SyncAccounts(connection_id=connection_id, user_id=user_id),
+        ... )
+        >>> job_id = result.value.job.job_id  # Return 202 with this id
+        >>> await runner.aclose()  # In application shutdown
+    """
+
+    def __init__(
+        self,
+        *,
+        store: SyncJobStore,
+        executor: SyncJobExecutor,
+        logger: LoggerProtocol,
+        concurrency: Mapping[SyncJobKind, int],
+        shutdown_grace_seconds: float = SYNC_JOB_SHUTDOWN_GRACE_SECONDS,
+    ) -> None:
+        """Initialize runner.
+
+        Args:
+            store: Redis status store.
+            executor: Runs a command in its own database session.
+            logger: Logger for failures.
+            concurrency: Max jobs running at once per kind (default 1).
+            shutdown_grace_seconds: Time running jobs get on aclose().
+        """
+        self._store = store
+        self._executor = executor
+        self._logger = logger
+        self._capacity = {
+            kind: max(1, concurrency.get(kind, 1)) for kind in SyncJobKind
+        }
+        self._semaphores = {
+            kind: asyncio.Semaphore(limit) for kind, limit in self._capacity.items()
+        }
+        self._running = {kind: 0 for kind in SyncJobKind}
+        self._waiting = {kind: 0 for kind in SyncJobKind}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._completed = 0
+        self._shutdown_grace = shutdown_grace_seconds
+        self._closing = False
+
+    async def submit(
+        self,
+        *,
+        kind: SyncJobKind,
+        user_id: UUID,
+        target_id: UUID,
+        command: Any,
+        delay_seconds: float = 0.0,
+    ) -> Result[SyncJobSubmission, InfrastructureError]:
+        """Accept a sync command as a background job.
+
+        Args:
+            kind: Sync kind (selects the concurrency cap and dedupe lock).
+            user_id: Requesting user (job owner).
+            target_id: Connection (accounts, transactions) or account
+                (holdings) being synced.
+            command: Sync command passed to the executor.
+            delay_seconds: Time the job stays queued before it competes
+                for a slot (used to stagger scheduled syncs).
+
+        Returns:
+            Success(SyncJobSubmission) with the new or duplicate job.
+            Failure(InfrastructureError) with SERVICE_UNAVAILABLE if shutting
+            down or Redis failed.
+        """
+        if self._closing:
+            return Failure(
+                error=InfrastructureError(
+                    code=ErrorCode.SERVICE_UNAVAILABLE,
+                    infrastructure_code=InfrastructureErrorCode.UNEXPECTED_ERROR,
+                    message="Sync jobs are not accepted during shutdown",
+                )
+            )
+
+        job = SyncJob(
+            job_id=uuid7(),
+            kind=kind,
+            status=SyncJobStatus.QUEUED,
+            user_id=user_id,
+            target_id=target_id,
+            created_at=datetime.now(UTC),
+        )
+        try:
+            active = await self._store.claim(job)
+            if active is not None:
+                if active.user_id == user_id:
+                    return Success(
+                        value=SyncJobSubmission(job=active, deduplicated=True)
+                    )
+                # Another user's job holds the lock: run without dedupe
+                await self._store.save(job)
+        except RedisError as e:
+            return Failure(
+                error=InfrastructureError(
+                    code=ErrorCode.SERVICE_UNAVAILABLE,
+                    infrastructure_code=InfrastructureErrorCode.CONNECTION_ERROR,
+                    message="Failed to enqueue sync job",
+                    details={"error": str(e), "kind": kind.value},
+                )
+            )
+
+        task = asyncio.create_task(
+            self._run(job, command, delay_seconds), name=f"sync-job-{kind}"
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return Success(value=SyncJobSubmission(job=job))
+
+    async def get_job(
+        self, job_id: UUID
+    ) -> Result[SyncJob | None, InfrastructureError]:
+        """Look up a job's status (any worker's job).
+
+        Args:
+            job_id: Job identifier.
+
+        Returns:
+            Success(SyncJob | None) or Failure(InfrastructureError).
+        """
+        try:
+            return Success(value=await self._store.get(job_id))
+        except RedisError as e:
+            return Failure(
+                error=InfrastructureError(
+                    code=ErrorCode.SERVICE_UNAVAILABLE,
+                    infrastructure_code=InfrastructureErrorCode.CONNECTION_ERROR,
+                    message="Failed to get sync job",
+                    details={"error": str(e), "job_id": str(job_id)},
+                )
+            )
+
+    async def recently_failed_targets(
+        self, kind: SyncJobKind, within_seconds: float
+    ) -> Result[set[UUID], InfrastructureError]:
+        """Find targets whose last job of a kind failed within a window.
+
+        Args:
+            kind: Sync kind.
+            within_seconds: How far back a failure counts.
+
+        Returns:
+            Success(set of target ids) or Failure(InfrastructureError).
+        """
+        try:
+            return Success(
+                value=await self._store.recently_failed(kind, within_seconds)
+            )
+        except RedisError as e:
+            return Failure(
+                error=InfrastructureError(
+                    code=ErrorCode.SERVICE_UNAVAILABLE,
+                    infrastructure_code=InfrastructureErrorCode.CONNECTION_ERROR,
+                    message="Failed to get failed sync targets",
+                    details={"error": str(e), "kind": kind.value},
+                )
+            )
+
+    def get_stats(self) -> SyncJobRunnerStats:
+        """Get this process's runner statistics.
+
+        Returns:
+            Per-kind running/waiting counts and caps.
+        """
+        return SyncJobRunnerStats(
+            running={kind.value: n for kind, n in self._running.items()},
+            waiting={kind.value: n for kind, n in self._waiting.items()},
+            capacity={kind.value: n for kind, n in self._capacity.items()},
+            completed=self._completed,
+        )
+
+    async def aclose(self) -> None:
+        """Stop accepting jobs; let running ones finish, then cancel the rest."""
+        self._closing = True
+        if not self._tasks:
+            return
+        _, pending = await asyncio.wait(set(self._tasks), timeout=self._shutdown_grace)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _run(self, job: SyncJob, command: Any, delay_seconds: float) -> None:
+        """Wait for a slot, execute the command and record the outcome."""
+        kind = job.kind
+        self._waiting[kind] += 1
+        try:
+            if delay_seconds > 0:
+                await asyncio.sleep(delay_seconds)
+            async with self._semaphores[kind]:
+                self._waiting[kind] -= 1
+                self._running[kind] += 1
+                try:
+                    job = job.started()
+                    await self._save(job)
+                    job = await self._execute(job, command)
+                finally:
+                    self._running[kind] -= 1
+        except asyncio.CancelledError:
+            if job.status == SyncJobStatus.QUEUED:
+                self._waiting[kind] -= 1
+            await self._save(job.failed("Sync job interrupted by shutdown"))
+            raise
+        self._completed += 1
+        await self._save(job)
+
+    async def _execute(self, job: SyncJob, command: Any) -> SyncJob:
+        """Run the command and return the job in its finished state."""
+        try:
+            result = await self._executor(command)
+        except Exception as e:
+            self._logger.error(
+                "sync_job_failed",
+                job_id=str(job.job_id),
+                kind=job.kind.value,
+                error_type=type(e).__name__,
+                error_message=str(e),
+            )
+            return job.failed(f"Unexpected error: {e}")
+
+        if isinstance(result, Failure):
+            return job.failed(str(result.error))
+        value = result.value
+        return job.succeeded(
+            message=getattr(value, "message", None),
+            result=_to_json_dict(value),
+        )
+
+    async def _save(self, job: SyncJob) -> None:
+        """Write job status; a Redis error is logged, never raised."""
+        try:
+            await self._store.save(job)
+        except RedisError as e:
+            self._logger.warning(
+                "sync_job_status_write_failed",
+                job_id=str(job.job_id),
+                status=job.status.value,
+                error_message=str(e),
+            )
+
+
+def _to_json_dict(value: Any) -> dict[str, Any] | None:
+    """Convert a result DTO dataclass to a JSON-safe dict (None otherwise)."""
+    if not dataclasses.is_dataclass(value) or isinstance(value, type):
+        return None
+    result: dict[str, Any] = json.loads(
+        json.dumps(dataclasses.asdict(value), default=str)
+    )
+    return result
@@ -0,0 +1,386 @@
+"""Redis-backed status store for background sync jobs.
+
+Each sync job is one JSON document in the jobs Redis, readable by any API
+worker (status endpoint, JobsMonitor, /admin/jobs) regardless of which
+worker runs it. A per-target lock key deduplicates jobs: while a job for
+(kind, target) is queued or running, submitting the same sync returns the
+existing job instead of starting another provider call.
+
+Keys (prefix ``SYNC_JOB_KEY_PREFIX``):
+    - ``{prefix}:job:{job_id}``: Job document (JSON, ``SYNC_JOB_TTL_SECONDS``)
+    - ``{prefix}:lock:{kind}:{target_id}``: Active job id for a target
+      (``SYNC_JOB_LOCK_TTL_SECONDS``, written atomically with the job
+      document, released when the job finishes)
+    - ``{prefix}:queued`` / ``{prefix}:running``: Sorted sets of job ids by
+      state, scored by the job's last status write. Members older than the
+      lock TTL belong to jobs lost with a crashed worker and are pruned when
+      counting.
+    - ``{prefix}:failed:{kind}``: Sorted set of target ids whose last job
+      failed, scored by failure time (cleared by a successful job)
+
+Architecture:
+    - Uses redis.asyncio (works with redis-py clients and fakeredis)
+    - Raises RedisError; callers decide how to surface it
+    - No dependency on sync handler code (commands are opaque to the store)
+"""
+
+import json
+import time
+from collections.abc import Awaitable
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import Any, cast
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from src.core.constants import (
+    SYNC_JOB_KEY_PREFIX,
+    SYNC_JOB_LOCK_TTL_SECONDS,
+    SYNC_JOB_TTL_SECONDS,
+)
+
+# Take the dedupe lock and write the QUEUED job document in one step, so a
+# concurrent claim never finds a lock whose job document does not exist yet.
+# ARGV[1] is the holder the caller found stale ('' if it found no lock): the
+# lock is replaced only if it is free or still names that holder. Returns
+# the current holder if the lock was not taken.
+_CLAIM_SCRIPT = """
+local holder = redis.call('GET', KEYS[1])
+if holder and holder ~= ARGV[1] then
+    return holder
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+redis.call('SET', KEYS[2], ARGV[4], 'EX', ARGV[5])
+redis.call('ZADD', KEYS[3], ARGV[6], ARGV[2])
+return false
+"""
+
+# Delete the lock only if it still names this job (another job may own it
+# after the TTL expired).
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class SyncJobKind(StrEnum):
+    """Kind of provider sync a job performs."""
+
+    ACCOUNTS = "accounts"
+    TRANSACTIONS = "transactions"
+    HOLDINGS = "holdings"
+
+
+class SyncJobStatus(StrEnum):
+    """Lifecycle state of a sync job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    @property
+    def is_finished(self) -> bool:
+        """True for terminal states (succeeded, failed)."""
+        return self in (SyncJobStatus.SUCCEEDED, SyncJobStatus.FAILED)
+
+
+@dataclass(frozen=True, kw_only=True)
+class SyncJob:
+    """Status of one background sync job.
+
+    Attributes:
+        job_id: Unique job identifier (returned by the 202 response).
+        kind: Which sync the job runs.
+        status: Current lifecycle state.
+        user_id: User who requested the sync.
+        target_id: Connection (accounts, transactions) or account (holdings).
+        created_at: When the job was accepted.
+        started_at: When a worker slot picked the job up.
+        finished_at: When the job succeeded or failed.
+        message: Handler summary on success.
+        error: Handler error on failure.
+        result: Handler result DTO as JSON-safe dict (on success).
+    """
+
+    job_id: UUID
+    kind: SyncJobKind
+    status: SyncJobStatus
+    user_id: UUID
+    target_id: UUID
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    message: str | None = None
+    error: str | None = None
+    result: dict[str, Any] | None = None
+
+    def started(self) -> "SyncJob":
+        """Return a copy in RUNNING state."""
+        return replace(self, status=SyncJobStatus.RUNNING, started_at=datetime.now(UTC))
+
+    def succeeded(
+        self, message: str | None, result: dict[str, Any] | None
+    ) -> "SyncJob":
+        """Return a copy in SUCCEEDED state."""
+        return replace(
+            self,
+            status=SyncJobStatus.SUCCEEDED,
+            finished_at=datetime.now(UTC),
+            message=message,
+            result=result,
+        )
+
+    def failed(self, error: str) -> "SyncJob":
+        """Return a copy in FAILED state."""
+        return replace(
+            self,
+            status=SyncJobStatus.FAILED,
+            finished_at=datetime.now(UTC),
+            error=error,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-safe dictionary.
+
+        Returns:
+            Dict representation (UUIDs and datetimes as strings).
+        """
+        return {
+            "job_id": str(self.job_id),
+            "kind": self.kind.value,
+            "status": self.status.value,
+            "user_id": str(self.user_id),
+            "target_id": str(self.target_id),
+            "created_at": self.created_at.isoformat(),
+            "started_at": _isoformat(self.started_at),
+            "finished_at": _isoformat(self.finished_at),
+            "message": self.message,
+            "error": self.error,
+            "result": self.result,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SyncJob":
+        """Rebuild a job from its stored dictionary.
+
+        Args:
+            data: Output of to_dict().
+
+        Returns:
+            SyncJob instance.
+        """
+        return cls(
+            job_id=UUID(data["job_id"]),
+            kind=SyncJobKind(data["kind"]),
+            status=SyncJobStatus(data["status"]),
+            user_id=UUID(data["user_id"]),
+            target_id=UUID(data["target_id"]),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            started_at=_parse_datetime(data.get("started_at")),
+            finished_at=_parse_datetime(data.get("finished_at")),
+            message=data.get("message"),
+            error=data.get("error"),
+            result=data.get("result"),
+        )
+
+
+class SyncJobStore:
+    """Persists sync job status and dedupe locks in Redis.
+
+    Attributes:
+        _redis: Async Redis client (jobs Redis).
+        _prefix: Key prefix for all sync job keys.
+        _job_ttl: Seconds a job document is kept after its last update.
+        _lock_ttl: Seconds a dedupe lock survives without release (also
+            the age after which a queued/running entry counts as lost).
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        key_prefix: str = SYNC_JOB_KEY_PREFIX,
+        job_ttl_seconds: int = SYNC_JOB_TTL_SECONDS,
+        lock_ttl_seconds: int = SYNC_JOB_LOCK_TTL_SECONDS,
+    ) -> None:
+        """Initialize store.
+
+        Args:
+            redis_client: Async Redis client.
+            key_prefix: Key prefix for all sync job keys.
+            job_ttl_seconds: Retention of job documents.
+            lock_ttl_seconds: Upper bound on a dedupe lock's lifetime.
+        """
+        self._redis = redis_client
+        self._prefix = key_prefix
+        self._job_ttl = job_ttl_seconds
+        self._lock_ttl = lock_ttl_seconds
+
+    async def claim(self, job: SyncJob) -> SyncJob | None:
+        """Take the dedupe lock for the job's (kind, target) and store the job.
+
+        The lock and the QUEUED job document are written atomically. A lock
+        whose job finished or expired is taken over with compare-and-set, so
+        of several concurrent claims exactly one wins and the others get
+        its job.
+
+        Args:
+            job: New job (QUEUED) that wants to run.
+
+        Returns:
+            None if the lock was taken and ``job`` saved; otherwise the
+            unfinished job that already holds it (``job`` is not saved).
+        """
+        keys = (
+            self._lock_key(job.kind, job.target_id),
+            self._job_key(job.job_id),
+            f"{self._prefix}:queued",
+        )
+        document = json.dumps(job.to_dict())
+        expected_holder = ""
+        # Each retry means another claim replaced the lock in between
+        while True:
+            holder_id = await cast(
+                Awaitable[bytes | str | None],
+                self._redis.eval(
+                    _CLAIM_SCRIPT,
+                    len(keys),
+                    *keys,
+                    expected_holder,
+                    str(job.job_id),
+                    self._lock_ttl,
+                    document,
+                    self._job_ttl,
+                    time.time(),
+                ),
+            )
+            if holder_id is None:
+                return None
+
+            expected_holder = _decode(holder_id)
+            holder = await self.get(UUID(expected_holder))
+            if holder is not None and not holder.status.is_finished:
+                return holder
+
+    async def save(self, job: SyncJob) -> None:
+        """Write the job document and move it between state sets.
+
+        Finished jobs also release their dedupe lock and record (or clear)
+        a failure for their target.
+
+        Args:
+            job: Job in its new state.
+        """
+        job_id = str(job.job_id)
+        queued_key = f"{self._prefix}:queued"
+        running_key = f"{self._prefix}:running"
+        now = time.time()
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(
+                self._job_key(job.job_id),
+                json.dumps(job.to_dict()),
+                ex=self._job_ttl,
+            )
+            if job.status == SyncJobStatus.QUEUED:
+                pipe.zadd(queued_key, {job_id: now})
+            elif job.status == SyncJobStatus.RUNNING:
+                pipe.zrem(queued_key, job_id)
+                pipe.zadd(running_key, {job_id: now})
+            else:
+                pipe.zrem(queued_key, job_id)
+                pipe.zrem(running_key, job_id)
+                failed_key = self._failed_key(job.kind)
+                if job.status == SyncJobStatus.FAILED:
+                    pipe.zadd(failed_key, {str(job.target_id): now})
+                else:
+                    pipe.zrem(failed_key, str(job.target_id))
+                pipe.eval(
+                    _RELEASE_LOCK_SCRIPT,
+                    1,
+                    self._lock_key(job.kind, job.target_id),
+                    job_id,
+                )
+            await pipe.execute()
+
+    async def get(self, job_id: UUID) -> SyncJob | None:
+        """Load a job by id.
+
+        Args:
+            job_id: Job identifier.
+
+        Returns:
+            SyncJob, or None if unknown or expired.
+        """
+        raw = await self._redis.get(self._job_key(job_id))
+        if raw is None:
+            return None
+        return SyncJob.from_dict(json.loads(_decode(raw)))
+
+    async def count_active(self) -> tuple[int, int]:
+        """Count unfinished jobs across all workers.
+
+        Entries not updated within the lock TTL (jobs lost with a crashed
+        worker) are pruned first, so they do not inflate the counts.
+
+        Returns:
+            Tuple of (queued, running) job counts.
+        """
+        queued_key = f"{self._prefix}:queued"
+        running_key = f"{self._prefix}:running"
+        stale_before = time.time() - self._lock_ttl
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(queued_key, "-inf", stale_before)
+            pipe.zremrangebyscore(running_key, "-inf", stale_before)
+            pipe.zcard(queued_key)
+            pipe.zcard(running_key)
+            _, _, queued, running = await pipe.execute()
+        return int(queued), int(running)
+
+    async def recently_failed(
+        self, kind: SyncJobKind, within_seconds: float
+    ) -> set[UUID]:
+        """Find targets whose last job of a kind failed within a window.
+
+        Failures older than the window are pruned.
+
+        Args:
+            kind: Sync kind.
+            within_seconds: How far back a failure counts.
+
+        Returns:
+            Target ids with a recent failed job.
+        """
+        failed_key = self._failed_key(kind)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(failed_key, "-inf", time.time() - within_seconds)
+            pipe.zrange(failed_key, 0, -1)
+            _, target_ids = await pipe.execute()
+        return {UUID(_decode(target_id)) for target_id in target_ids}
+
+    def _job_key(self, job_id: UUID) -> str:
+        return f"{self._prefix}:job:{job_id}"
+
+    def _failed_key(self, kind: SyncJobKind) -> str:
+        return f"{self._prefix}:failed:{kind.value}"
+
+    def _lock_key(self, kind: SyncJobKind, target_id: UUID) -> str:
+        return f"{self._prefix}:lock:{kind.value}:{target_id}"
+
+
+def _decode(value: bytes | str) -> str:
+    """Decode a Redis reply (clients may or may not decode responses)."""
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value is not None else None
@@ -1,7 +1,20 @@
 """CloudWatch logging adapter (production).
 
-Sends structured logs to AWS CloudWatch Logs. Minimal, safe implementation that
-batches events and flushes periodically to reduce API calls.
+Sends structured logs to AWS CloudWatch Logs. Events are serialized on the
+calling thread into a bounded in-memory queue and shipped by ONE dedicated
+flusher thread, so a logging burst never spawns extra threads or grows
+memory without bound.
+
+Flushing:
+    The flusher wakes every ``batch_interval`` seconds, or as soon as
+    ``batch_size`` events are queued, and drains the queue in PutLogEvents
+    batches capped by both event count and the 1 MB payload limit
+    (message bytes + 26 bytes per event).
+
+Overflow Policy:
+    - Once the queue is half full, DEBUG events are shed (not queued)
+    - When the queue is full, the OLDEST event is dropped for the new one
+    Both are counted and reported by ``get_stats()``.
 
 Notes:
 - This adapter is synchronous internally (boto3) but exposes non-async methods
@@ -12,8 +25,9 @@ Notes:
 import atexit
 import json
 import threading
+import time
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from typing import Any, Deque
 
@@ -22,19 +36,65 @@ from botocore.exceptions import ClientError
 from mypy_boto3_logs.client import CloudWatchLogsClient
 from mypy_boto3_logs.type_defs import InputLogEventTypeDef
 
+from src.core.constants import (
+    CLOUDWATCH_EVENT_OVERHEAD_BYTES,
+    CLOUDWATCH_MAX_BATCH_BYTES,
+    CLOUDWATCH_MAX_EVENT_BYTES,
+    CLOUDWATCH_QUEUE_MAX_SIZE,
+)
 from src.infrastructure.logging.console_adapter import ConsoleAdapter
 
+# Max time close() waits for an in-flight flush before draining itself
+_CLOSE_JOIN_TIMEOUT_SECONDS = 5.0
+
+# Characters of the original message kept when an event is truncated
+_TRUNCATED_MESSAGE_CHARS = 1024
+
 
 @dataclass(slots=True)
 class _Event:
-    ts: datetime
-    level: str
+    timestamp_ms: int
     message: str
-    context: dict[str, Any]
+    size: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class CloudWatchStats:
+    """Point-in-time CloudWatch adapter statistics.
+
+    Attributes:
+        queued_events: Events waiting to be sent.
+        max_queue_size: Queue bound before the overflow policy applies.
+        sent_events: Events accepted by PutLogEvents (lifetime).
+        dropped_events: Oldest events dropped from a full queue (lifetime).
+        shed_debug_events: DEBUG events shed under queue pressure (lifetime).
+        flushes: Successful PutLogEvents calls (lifetime).
+        failed_flushes: Failed PutLogEvents calls (lifetime).
+        last_flush_latency_ms: Duration of the most recent PutLogEvents call.
+        max_flush_latency_ms: Slowest PutLogEvents call (lifetime).
+    """
+
+    queued_events: int
+    max_queue_size: int
+    sent_events: int
+    dropped_events: int
+    shed_debug_events: int
+    flushes: int
+    failed_flushes: int
+    last_flush_latency_ms: float
+    max_flush_latency_ms: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to dictionary.
+
+        Returns:
+            Dictionary with adapter counters.
+        """
+        return asdict(self)
 
 
 class CloudWatchAdapter:
-    """CloudWatch logger with simple background flushing.
+    """CloudWatch logger with a single bounded background flusher.
 
     Args:
         log_group (str): CloudWatch log group name (e.g., /dashtam/production/app).
@@ -42,6 +102,8 @@ class CloudWatchAdapter:
         region (str): AWS region name.
         batch_size (int): Maximum events per PutLogEvents call.
         batch_interval (float): Seconds between automatic flush attempts.
+        max_queue_size (int): Events buffered before the overflow policy applies.
+        max_batch_bytes (int): Payload limit per PutLogEvents call.
     """
 
     def __init__(
@@ -52,6 +114,8 @@ class CloudWatchAdapter:
         region: str = "us-east-1",
         batch_size: int = 50,
         batch_interval: float = 5.0,
+        max_queue_size: int = CLOUDWATCH_QUEUE_MAX_SIZE,
+        max_batch_bytes: int = CLOUDWATCH_MAX_BATCH_BYTES,
     ) -> None:
         """Initialize the CloudWatch adapter.
 
@@ -61,21 +125,36 @@ class CloudWatchAdapter:
             region (str): AWS region.
             batch_size (int): Events per batch.
             batch_interval (float): Periodic flush interval in seconds.
+            max_queue_size (int): Queue bound (oldest dropped when full).
+            max_batch_bytes (int): Max PutLogEvents payload in bytes.
         """
         self._client: CloudWatchLogsClient = boto3.client("logs", region_name=region)
         self._group = log_group
         self._stream = log_stream
         self._batch_size = batch_size
         self._batch_interval = batch_interval
+        self._max_queue_size = max_queue_size
+        self._debug_high_water = max_queue_size // 2
+        self._max_batch_bytes = max_batch_bytes
         self._seq_token: str | None = None
 
         self._queue: Deque[_Event] = deque()
         self._lock = threading.Lock()
+        self._wake = threading.Event()
         self._stop = threading.Event()
         self._flusher = threading.Thread(
             target=self._flush_loop, name="cw-logger", daemon=True
         )
 
+        # Self-metrics (guarded by _lock)
+        self._sent = 0
+        self._dropped = 0
+        self._shed_debug = 0
+        self._flushes = 0
+        self._failed_flushes = 0
+        self._last_flush_latency_ms = 0.0
+        self._max_flush_latency_ms = 0.0
+
         # Fallback to console on error
         self._fallback = ConsoleAdapter(use_json=True)
 
@@ -153,37 +232,122 @@ class CloudWatchAdapter:
         """Alias for bind() - returns self."""
         return self.bind(**context)
 
+    def get_stats(self) -> CloudWatchStats:
+        """Get current adapter statistics.
+
+        Returns:
+            Snapshot of queue depth, drop, and flush counters.
+        """
+        with self._lock:
+            return CloudWatchStats(
+                queued_events=len(self._queue),
+                max_queue_size=self._max_queue_size,
+                sent_events=self._sent,
+                dropped_events=self._dropped,
+                shed_debug_events=self._shed_debug,
+                flushes=self._flushes,
+                failed_flushes=self._failed_flushes,
+                last_flush_latency_ms=self._last_flush_latency_ms,
+                max_flush_latency_ms=self._max_flush_latency_ms,
+            )
+
     # Internal helpers
     def _enqueue(self, level: str, message: str, context: dict[str, Any]) -> None:
-        """Add a log event to the in-memory queue.
+        """Add a log event to the bounded in-memory queue.
+
+        Applies the overflow policy and wakes the flusher once a full batch
+        is waiting. Never blocks on CloudWatch.
 
         Args:
             level (str): Log level.
             message (str): Message text.
             context (dict[str, Any]): Structured context.
         """
-        ev = _Event(ts=datetime.now(UTC), level=level, message=message, context=context)
         with self._lock:
+            depth = len(self._queue)
+            if level == "DEBUG" and depth >= self._debug_high_water:
+                self._shed_debug += 1
+                return
+
+        ev = self._build_event(level, message, context)
+        with self._lock:
+            if len(self._queue) >= self._max_queue_size:
+                self._queue.popleft()
+                self._dropped += 1
             self._queue.append(ev)
-            if len(self._queue) >= self._batch_size:
-                # Flush immediately in a separate thread
-                threading.Thread(target=self._flush_safe, daemon=True).start()
+            full_batch = len(self._queue) >= self._batch_size
+        if full_batch:
+            self._wake.set()
+
+    @staticmethod
+    def _build_event(level: str, message: str, context: dict[str, Any]) -> _Event:
+        """Serialize a log record into a CloudWatch event.
+
+        Messages over CLOUDWATCH_MAX_EVENT_BYTES are replaced by a truncated
+        record (message prefix, no context) so one huge event cannot block
+        a batch.
+
+        Args:
+            level (str): Log level.
+            message (str): Message text.
+            context (dict[str, Any]): Structured context.
+
+        Returns:
+            _Event: Serialized event with its batch size in bytes.
+        """
+        ts = datetime.now(UTC)
+        record = {
+            "timestamp": ts.isoformat(),
+            "level": level.lower(),
+            "message": message,
+            **context,
+        }
+        body = json.dumps(record, separators=(",", ":"), default=str)
+        size = len(body.encode("utf-8"))
+        if size + CLOUDWATCH_EVENT_OVERHEAD_BYTES > CLOUDWATCH_MAX_EVENT_BYTES:
+            body = json.dumps(
+                {
+                    "timestamp": record["timestamp"],
+                    "level": record["level"],
+                    "message": message[:_TRUNCATED_MESSAGE_CHARS],
+                    "truncated": True,
+                    "original_bytes": size,
+                },
+                separators=(",", ":"),
+            )
+            size = len(body.encode("utf-8"))
+        return _Event(
+            timestamp_ms=int(ts.timestamp() * 1000),
+            message=body,
+            size=size + CLOUDWATCH_EVENT_OVERHEAD_BYTES,
+        )
 
     def _flush_loop(self) -> None:
-        """Background loop that periodically flushes queued events."""
+        """Background loop: drain on interval or when a batch is full."""
         while not self._stop.is_set():
-            self._stop.wait(timeout=self._batch_interval)
-            self._flush_safe()
+            self._wake.wait(timeout=self._batch_interval)
+            self._wake.clear()
+            self._drain()
 
-    def _flush_safe(self) -> None:
-        """Flush queued events with best-effort error handling.
+    def _drain(self) -> None:
+        """Flush batches until the queue is empty."""
+        while self._flush_safe():
+            pass
+
+    def _flush_safe(self) -> bool:
+        """Flush one batch with best-effort error handling.
 
         On failure, logs the error to the console fallback and continues.
         Silently ignores I/O errors during shutdown (stdout closed).
+
+        Returns:
+            bool: True if a batch was taken from the queue.
         """
         try:
-            self._flush()
+            return self._flush()
         except Exception as e:  # noqa: BLE001 - best-effort logging
+            with self._lock:
+                self._failed_flushes += 1
             try:
                 self._fallback.error(
                     "CloudWatch flush failed", error=e, pending=len(self._queue)
@@ -191,6 +355,7 @@ class CloudWatchAdapter:
             except (ValueError, OSError):
                 # Ignore I/O errors during shutdown (stdout closed)
                 pass
+            return True
 
     def _ensure_destination(self) -> None:
         """Ensure CloudWatch log group and stream exist.
@@ -214,39 +379,46 @@ class CloudWatchAdapter:
             if code != "ResourceAlreadyExistsException":
                 raise
 
-    def _flush(self) -> None:
-        """Flush the current batch to CloudWatch Logs.
+    def _take_batch(self) -> list[_Event]:
+        """Pop the next batch within the event count and payload limits.
 
-        Aggregates queued events into CloudWatch InputLogEvent objects and
-        submits them using PutLogEvents with the maintained sequence token.
-
-        Raises:
-            ClientError: If CloudWatch APIs fail (handled in caller for fallback).
+        Returns:
+            list[_Event]: Events in queue order (may be empty).
         """
         events: list[_Event] = []
+        size = 0
         with self._lock:
             while self._queue and len(events) < self._batch_size:
+                ev = self._queue[0]
+                if events and size + ev.size > self._max_batch_bytes:
+                    break
                 events.append(self._queue.popleft())
+                size += ev.size
+        return events
+
+    def _flush(self) -> bool:
+        """Flush the next batch to CloudWatch Logs.
+
+        Submits queued events using PutLogEvents with the maintained sequence
+        token. Events are sorted by timestamp, as CloudWatch requires, since
+        concurrent callers may enqueue slightly out of order.
+
+        Returns:
+            bool: True if a batch was taken from the queue.
 
+        Raises:
+            Exception: Non-ClientError failures (handled in caller).
+        """
+        events = self._take_batch()
         if not events:
-            return
+            return False
 
+        events.sort(key=lambda ev: ev.timestamp_ms)
         payload: list[InputLogEventTypeDef] = [
-            {
-                "timestamp": int(ev.ts.timestamp() * 1000),
-                "message": json.dumps(
-                    {
-                        "timestamp": ev.ts.isoformat(),
-                        "level": ev.level.lower(),
-                        "message": ev.message,
-                        **ev.context,
-                    },
-                    separators=(",", ":"),
-                ),
-            }
-            for ev in events
+            {"timestamp": ev.timestamp_ms, "message": ev.message} for ev in events
         ]
 
+        start = time.perf_counter()
         try:
             if self._seq_token is not None:
                 resp = self._client.put_log_events(
@@ -263,21 +435,31 @@ class CloudWatchAdapter:
                 )
             self._seq_token = resp.get("nextSequenceToken", self._seq_token)
         except ClientError as e:
-            # Fallback to console; re-enqueue for retry on next loop
+            with self._lock:
+                self._failed_flushes += 1
+            # Fallback to console so the events are not lost silently
             for ev in events:
                 self._fallback.error(
-                    "CloudWatch send failed",
-                    error=e,
-                    level=ev.level,
-                    message=ev.message,
-                    **ev.context,
+                    "CloudWatch send failed", error=e, event=ev.message
                 )
+            return True
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self._sent += len(events)
+            self._flushes += 1
+            self._last_flush_latency_ms = latency_ms
+            self._max_flush_latency_ms = max(self._max_flush_latency_ms, latency_ms)
+        return True
 
     def close(self) -> None:
-        """Stop background flusher and attempt a final flush.
+        """Stop the background flusher and flush everything still queued.
 
         Ensures that any buffered log events are sent before process exit.
+        Safe to call more than once.
         """
         self._stop.set()
-        # Attempt a final flush
-        self._flush_safe()
+        self._wake.set()
+        if self._flusher.is_alive() and self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=_CLOSE_JOIN_TIMEOUT_SECONDS)
+        self._drain()
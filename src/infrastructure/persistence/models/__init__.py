@@ -36,6 +36,9 @@ from src.infrastructure.persistence.models.account import Account as AccountMode
 from src.infrastructure.persistence.models.balance_snapshot import (
     BalanceSnapshot as BalanceSnapshotModel,
 )
+from src.infrastructure.persistence.models.balance_snapshot_daily_rollup import (
+    BalanceSnapshotDailyRollup as BalanceSnapshotDailyRollupModel,
+)
 from src.infrastructure.persistence.models.holding import Holding as HoldingModel
 from src.infrastructure.persistence.models.transaction import (
     Transaction as TransactionModel,
@@ -48,6 +51,7 @@ from src.infrastructure.persistence.models.user import User
 __all__ = [
     "AccountModel",
     "AuditLog",
+    "BalanceSnapshotDailyRollupModel",
     "BalanceSnapshotModel",
     "CasbinRule",
     "EmailVerificationToken",
@@ -0,0 +1,166 @@
+"""BalanceSnapshotDailyRollup database model.
+
+Pre-aggregated daily balance per account and snapshot source, used to chart
+long date ranges without scanning every raw snapshot.
+
+Architecture:
+    - One row per (account_id, source, UTC day)
+    - Maintained incrementally by BalanceSnapshotRepository: save() upserts
+      the day's row, delete() rebuilds it from the remaining snapshots
+    - Backfilled from balance_snapshots by the creating migration
+    - Derived data: can always be rebuilt from balance_snapshots
+
+Reference:
+    - docs/architecture/balance-tracking-architecture.md
+    - src/infrastructure/persistence/models/balance_snapshot.py
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    Numeric,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.persistence.base import BaseMutableModel
+
+
+class BalanceSnapshotDailyRollup(BaseMutableModel):
+    """Daily open/close/min/max balance for an account and source.
+
+    Fields:
+        id: UUID primary key (from BaseModel)
+        created_at: Timestamp when created (from BaseModel)
+        updated_at: Timestamp of the last upsert (from TimestampMixin)
+        account_id: FK to accounts table
+        source: Snapshot source (account_sync, manual_sync, etc.)
+        day: UTC calendar day of the aggregated snapshots
+        currency: ISO 4217 currency code
+        open_balance_amount: Balance of the first snapshot of the day
+        close_balance_amount: Balance of the last snapshot of the day
+        min_balance_amount: Lowest balance of the day
+        max_balance_amount: Highest balance of the day
+        first_captured_at: captured_at of the first snapshot of the day
+        last_captured_at: captured_at of the last snapshot of the day
+        snapshot_count: Number of snapshots aggregated
+
+    Indexes:
+        - uq_balance_snapshot_daily_rollups_account_source_day: Upsert target
+          and account + day range scans
+    """
+
+    __tablename__ = "balance_snapshot_daily_rollups"
+
+    # =========================================================================
+    # Rollup Key
+    # =========================================================================
+
+    # Foreign key to accounts (CASCADE delete)
+    account_id: Mapped[UUID] = mapped_column(
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="FK to accounts table",
+    )
+
+    # Snapshot source (kept so source-filtered charts can use the rollup)
+    source: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        comment="Snapshot source of the aggregated snapshots",
+    )
+
+    # UTC calendar day
+    day: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+        comment="UTC day of the aggregated snapshots",
+    )
+
+    # =========================================================================
+    # Aggregated Values
+    # =========================================================================
+
+    currency: Mapped[str] = mapped_column(
+        String(3),
+        nullable=False,
+        default="USD",
+        comment="ISO 4217 currency code",
+    )
+
+    open_balance_amount: Mapped[Decimal] = mapped_column(
+        Numeric(precision=19, scale=4),
+        nullable=False,
+        comment="Balance of the first snapshot of the day",
+    )
+
+    close_balance_amount: Mapped[Decimal] = mapped_column(
+        Numeric(precision=19, scale=4),
+        nullable=False,
+        comment="Balance of the last snapshot of the day",
+    )
+
+    min_balance_amount: Mapped[Decimal] = mapped_column(
+        Numeric(precision=19, scale=4),
+        nullable=False,
+        comment="Lowest balance of the day",
+    )
+
+    max_balance_amount: Mapped[Decimal] = mapped_column(
+        Numeric(precision=19, scale=4),
+        nullable=False,
+        comment="Highest balance of the day",
+    )
+
+    first_captured_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Capture time of the first snapshot of the day",
+    )
+
+    last_captured_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Capture time of the last snapshot of the day",
+    )
+
+    snapshot_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Number of snapshots aggregated",
+    )
+
+    # =========================================================================
+    # Table Constraints and Indexes
+    # =========================================================================
+
+    __table_args__ = (
+        UniqueConstraint(
+            "account_id",
+            "source",
+            "day",
+            name="uq_balance_snapshot_daily_rollups_account_source_day",
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation for debugging.
+
+        Returns:
+            str: Human-readable representation of the daily rollup.
+        """
+        return (
+            f"<BalanceSnapshotDailyRollup("
+            f"account_id={self.account_id}, "
+            f"source={self.source}, "
+            f"day={self.day}, "
+            f"close={self.close_balance_amount}"
+            f")>"
+        )
@@ -3,7 +3,8 @@
 This module defines the RefreshToken model for storing long-lived refresh tokens.
 
 Security:
-    - token_hash: Bcrypt hashed token (NOT plaintext, revocable)
+    - token_selector: Non-secret lookup ID (token prefix, unique)
+    - token_hash: HMAC-SHA256 of the token (bcrypt for legacy rows, NOT plaintext)
     - expires_at: 30 days from creation
     - revoked_at: Immediate revocation (logout, password change, theft detection)
     - rotation_count: Track token rotations for security monitoring
@@ -37,7 +38,7 @@ class RefreshToken(BaseMutableModel):
 
     Security Features:
         - Opaque tokens (long random strings, not JWT)
-        - Hashed with bcrypt before storage (like passwords)
+        - Selector/verifier: indexed selector lookup, keyed hash verification
         - One-time use (rotated on every refresh)
         - Immediate revocation (logout, security events)
         - Theft detection (attempt to use rotated token)
@@ -47,7 +48,8 @@ class RefreshToken(BaseMutableModel):
         created_at: Timestamp when token created (from BaseMutableModel)
         updated_at: Timestamp when token last used (from BaseMutableModel)
         user_id: Foreign key to users table (cascade delete)
-        token_hash: Bcrypt hashed token (NEVER plaintext)
+        token_selector: Lookup ID (NULL for legacy bcrypt tokens)
+        token_hash: Keyed hash of token (NEVER plaintext)
         session_id: Foreign key to sessions table (F1.3, cascade delete)
         expires_at: Timestamp when token expires (30 days from creation)
         revoked_at: Timestamp when revoked (nullable, set on revocation)
@@ -59,7 +61,8 @@ class RefreshToken(BaseMutableModel):
 
     Indexes:
         - idx_refresh_tokens_user_id: (user_id) for user's active tokens
-        - idx_refresh_tokens_token_hash: (token_hash) for lookup (unique)
+        - ix_refresh_tokens_token_selector: (token_selector) for lookup (unique)
+        - idx_refresh_tokens_token_hash: (token_hash) (unique)
         - idx_refresh_tokens_expires_at: (expires_at) for cleanup queries
         - idx_refresh_tokens_session_id: (session_id) for session revocation
 
@@ -71,7 +74,8 @@ class RefreshToken(BaseMutableModel):
         # Create refresh token (via repository)
         token = RefreshToken(
             user_id=user_id,
-            token_hash="$2b$12$...",  # Bcrypt hash of token
+            token_selector=token[:16],  # Selector prefix of token
+            token_hash=token_hash,  # HMAC-SHA256 of token
             session_id=session_id,
             expires_at=datetime.now(UTC) + timedelta(days=30),
             rotation_count=0,
@@ -79,10 +83,10 @@ class RefreshToken(BaseMutableModel):
         session.add(token)
         await session.commit()
 
-        # Query token by hash (refresh)
+        # Query token by selector (refresh), then verify token_hash
         result = await session.execute(
             select(RefreshToken)
-            .where(RefreshToken.token_hash == token_hash)
+            .where(RefreshToken.token_selector == selector)
             .where(RefreshToken.revoked_at.is_(None))
             .where(RefreshToken.expires_at > datetime.now(UTC))
         )
@@ -99,13 +103,22 @@ class RefreshToken(BaseMutableModel):
         comment="User who owns this refresh token",
     )
 
-    # Token hash (bcrypt, unique, indexed for lookup)
+    # Token selector (non-secret token prefix, unique, indexed for lookup)
+    token_selector: Mapped[str | None] = mapped_column(
+        String(32),
+        nullable=True,
+        unique=True,
+        index=True,
+        comment="Non-secret lookup ID (NULL for legacy bcrypt tokens)",
+    )
+
+    # Token hash (HMAC-SHA256, or bcrypt for legacy rows)
     token_hash: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
         unique=True,
         index=True,
-        comment="Bcrypt hashed refresh token (NEVER plaintext)",
+        comment="Keyed hash of refresh token (NEVER plaintext)",
     )
 
     # Session relationship (cascade delete when session deleted)
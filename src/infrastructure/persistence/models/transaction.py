@@ -70,6 +70,7 @@ class Transaction(BaseMutableModel):
         - ix_transactions_symbol: Security transaction lookup
         - ix_transactions_status: Filter by status
         - idx_transactions_settled: Partial index for settled transactions
+        - idx_transactions_account_date_id: Date range and keyset pagination
         - uq_transactions_account_provider: Unique (account_id, provider_transaction_id)
 
     Example:
@@ -261,11 +262,13 @@ class Transaction(BaseMutableModel):
             "transaction_date",
             postgresql_where="status = 'settled'",
         ),
-        # Composite index for date range queries by account
+        # Composite index for date range queries and keyset pagination by
+        # account; id makes (transaction_date, id) a unique seek key
         Index(
-            "idx_transactions_account_date",
+            "idx_transactions_account_date_id",
             "account_id",
             "transaction_date",
+            "id",
         ),
     )
 
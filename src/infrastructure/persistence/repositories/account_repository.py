@@ -8,6 +8,7 @@ Reference:
     - docs/architecture/account-domain-model.md
 """
 
+from collections.abc import Collection
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from uuid import UUID
@@ -178,23 +179,69 @@ class AccountRepository:
 
         return [self._to_domain(model) for model in models]
 
-    async def find_needing_sync(self, threshold: timedelta) -> list[Account]:
-        """Find accounts not synced within threshold.
+    async def find_needing_sync(
+        self,
+        threshold: timedelta,
+        *,
+        limit: int | None = None,
+        exclude_connection_ids: Collection[UUID] = (),
+    ) -> list[Account]:
+        """Find active accounts not synced within threshold.
 
         Used by background job to identify stale accounts.
-        Returns accounts where last_synced_at is NULL or older than threshold.
+        Returns active accounts where last_synced_at is NULL or older than
+        threshold, stalest first (never-synced accounts lead).
 
         Args:
             threshold: Maximum time since last sync.
+            limit: Maximum accounts returned (None = all).
+            exclude_connection_ids: Connections whose accounts are skipped.
 
         Returns:
             List of accounts needing sync (empty if none found).
         """
         cutoff = datetime.now(UTC) - threshold
+        stmt = (
+            select(AccountModel)
+            .where(
+                AccountModel.is_active == True,  # noqa: E712
+                (AccountModel.last_synced_at == None)  # noqa: E711
+                | (AccountModel.last_synced_at < cutoff),
+            )
+            .order_by(AccountModel.last_synced_at.asc().nulls_first())
+        )
+        if exclude_connection_ids:
+            stmt = stmt.where(AccountModel.connection_id.not_in(exclude_connection_ids))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await self.session.execute(stmt)
+        models = result.scalars().all()
+
+        return [self._to_domain(model) for model in models]
+
+    async def find_active_page(
+        self,
+        after_id: UUID | None,
+        limit: int,
+    ) -> list[Account]:
+        """Find one page of active accounts across all users.
+
+        Keyset pagination on the primary key (no OFFSET scan).
+
+        Args:
+            after_id: Last account ID of the previous page (None for first).
+            limit: Maximum accounts per page.
+
+        Returns:
+            Active accounts ordered by ID (empty when exhausted).
+        """
         stmt = select(AccountModel).where(
-            (AccountModel.last_synced_at == None)  # noqa: E711
-            | (AccountModel.last_synced_at < cutoff)
+            AccountModel.is_active == True  # noqa: E712
         )
+        if after_id is not None:
+            stmt = stmt.where(AccountModel.id > after_id)
+        stmt = stmt.order_by(AccountModel.id).limit(limit)
+
         result = await self.session.execute(stmt)
         models = result.scalars().all()
 
@@ -374,6 +421,34 @@ class AccountRepository:
         result = await self.session.execute(stmt)
         return Decimal(str(result.scalar_one()))
 
+    async def summarize_balances_for_user(self, user_id: UUID) -> tuple[Decimal, int]:
+        """Sum balances and count active accounts for a user in one query.
+
+        Same filters as sum_balances_for_user and count_for_user, computed
+        in a single round trip (used for net worth recalculation).
+
+        Args:
+            user_id: User's unique identifier.
+
+        Returns:
+            Tuple of (total balance, active account count).
+            Returns (0, 0) if user has no active accounts.
+        """
+        stmt = (
+            select(
+                func.coalesce(func.sum(AccountModel.balance), 0),
+                func.count(AccountModel.id),
+            )
+            .join(ProviderConnectionModel)
+            .where(
+                ProviderConnectionModel.user_id == user_id,
+                AccountModel.is_active == True,  # noqa: E712
+            )
+        )
+        result = await self.session.execute(stmt)
+        total, count = result.one()
+        return Decimal(str(total)), int(count)
+
     async def count_for_user(self, user_id: UUID) -> int:
         """Count active accounts for a user.
 
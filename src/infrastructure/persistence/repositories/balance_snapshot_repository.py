@@ -3,28 +3,60 @@
 Adapter for hexagonal architecture.
 Maps between domain BalanceSnapshot entities and database BalanceSnapshotModel.
 
+Balance history buckets are computed in SQL (date_trunc + ordered array_agg
+for first/last). Day/week/month ranges longer than
+BALANCE_ROLLUP_MIN_RANGE_DAYS read balance_snapshot_daily_rollups, which
+save() and delete() keep current.
+
 Reference:
     - docs/architecture/repository-pattern.md
     - src/domain/entities/balance_snapshot.py
 """
 
-from datetime import datetime
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import (
+    ColumnElement,
+    DateTime,
+    Select,
+    and_,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    true,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.constants import BALANCE_ROLLUP_MIN_RANGE_DAYS
 from src.domain.entities.balance_snapshot import BalanceSnapshot
+from src.domain.enums.balance_granularity import BalanceGranularity
 from src.domain.enums.snapshot_source import SnapshotSource
+from src.domain.protocols.balance_snapshot_repository import BalanceBucket
 from src.domain.value_objects.money import Money
 from src.infrastructure.persistence.models.account import Account as AccountModel
 from src.infrastructure.persistence.models.balance_snapshot import (
     BalanceSnapshot as BalanceSnapshotModel,
 )
+from src.infrastructure.persistence.models.balance_snapshot_daily_rollup import (
+    BalanceSnapshotDailyRollup as DailyRollupModel,
+)
 from src.infrastructure.persistence.models.provider_connection import (
     ProviderConnection as ProviderConnectionModel,
 )
 
+# Rows per INSERT statement in bulk_insert() and rollup upserts.
+# Snapshot rows bind 11 parameters each; 500 rows stays far below
+# PostgreSQL's 32767 bind parameter limit.
+BULK_INSERT_CHUNK_SIZE = 500
+
 
 class BalanceSnapshotRepository:
     """SQLAlchemy implementation of BalanceSnapshotRepository protocol.
@@ -216,6 +248,194 @@ class BalanceSnapshotRepository:
 
         return [self._to_domain(model) for model in models]
 
+    async def find_buckets_by_account_id(
+        self,
+        account_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+        granularity: BalanceGranularity,
+        source: SnapshotSource | None = None,
+    ) -> list[BalanceBucket]:
+        """Aggregate an account's snapshots into time buckets.
+
+        Results are ordered by bucket_start ascending.
+
+        Args:
+            account_id: Account's unique identifier.
+            start_date: Start of date range (inclusive).
+            end_date: End of date range (inclusive).
+            granularity: Bucket size.
+            source: Optional filter by snapshot source.
+
+        Returns:
+            List of buckets with at least one snapshot (empty if none found).
+        """
+        per_account = self._per_account_buckets(
+            start_date, end_date, granularity, source
+        )
+        stmt = per_account.where(per_account.selected_columns.account_id == account_id)
+        stmt = stmt.order_by(literal_column("bucket_start"))
+
+        result = await self._session.execute(stmt)
+
+        return [
+            BalanceBucket(
+                bucket_start=self._as_utc(row.bucket_start),
+                currency=row.currency,
+                open_balance=row.open_balance,
+                close_balance=row.close_balance,
+                min_balance=row.min_balance,
+                max_balance=row.max_balance,
+                snapshot_count=int(row.snapshot_count),
+            )
+            for row in result.all()
+        ]
+
+    async def find_buckets_by_user_id(
+        self,
+        user_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+        granularity: BalanceGranularity,
+        source: SnapshotSource | None = None,
+    ) -> list[BalanceBucket]:
+        """Aggregate snapshots across all user accounts into time buckets.
+
+        Buckets each account first, then sums open/close balances across
+        accounts per bucket and currency. Accounts sync at different times,
+        so an account without a snapshot in a bucket contributes its last
+        known close (from an earlier bucket, or its latest snapshot before
+        start_date) instead of dropping out of the total.
+        Results are ordered by bucket_start, then currency.
+
+        Args:
+            user_id: User's unique identifier.
+            start_date: Start of date range (inclusive).
+            end_date: End of date range (inclusive).
+            granularity: Bucket size.
+            source: Optional filter by snapshot source.
+
+        Returns:
+            List of buckets, one per bucket and currency (empty if none found).
+        """
+        per_account = self._per_account_buckets(
+            start_date, end_date, granularity, source
+        )
+        user_accounts = (
+            select(AccountModel.id.label("account_id"))
+            .join(ProviderConnectionModel)
+            .where(ProviderConnectionModel.user_id == user_id)
+            .subquery("user_accounts")
+        )
+        buckets = per_account.where(
+            per_account.selected_columns.account_id.in_(
+                select(user_accounts.c.account_id)
+            )
+        ).cte("account_buckets")
+        # Buckets with at least one snapshot from any of the user's accounts
+        series = select(buckets.c.bucket_start).distinct().cte("bucket_series")
+
+        # Each account's latest balance before the range (carried into the
+        # buckets before its first snapshot in the range)
+        prior = select(
+            BalanceSnapshotModel.currency,
+            BalanceSnapshotModel.balance_amount,
+        ).where(
+            BalanceSnapshotModel.account_id == user_accounts.c.account_id,
+            BalanceSnapshotModel.captured_at < start_date,
+        )
+        if source is not None:
+            prior = prior.where(BalanceSnapshotModel.source == source.value)
+        prior_lateral = (
+            prior.order_by(BalanceSnapshotModel.captured_at.desc())
+            .limit(1)
+            .lateral("prior")
+        )
+
+        # One row per (bucket, account); "filled" numbers the account's
+        # buckets with a snapshot, so rows sharing it carry that bucket's close
+        grid = (
+            select(
+                series.c.bucket_start,
+                user_accounts.c.account_id,
+                buckets.c.currency,
+                buckets.c.open_balance,
+                buckets.c.close_balance,
+                buckets.c.snapshot_count,
+                prior_lateral.c.currency.label("prior_currency"),
+                prior_lateral.c.balance_amount.label("prior_balance"),
+                func.count(buckets.c.close_balance)
+                .over(
+                    partition_by=user_accounts.c.account_id,
+                    order_by=series.c.bucket_start,
+                )
+                .label("filled"),
+            )
+            .select_from(series)
+            .join(user_accounts, true())
+            .outerjoin(prior_lateral, true())
+            .outerjoin(
+                buckets,
+                and_(
+                    buckets.c.account_id == user_accounts.c.account_id,
+                    buckets.c.bucket_start == series.c.bucket_start,
+                ),
+            )
+            .subquery("grid")
+        )
+        carry_partition = (grid.c.account_id, grid.c.filled)
+        carried = select(
+            grid.c.bucket_start,
+            grid.c.open_balance,
+            grid.c.snapshot_count,
+            func.coalesce(
+                func.first_value(grid.c.currency).over(
+                    partition_by=carry_partition, order_by=grid.c.bucket_start
+                ),
+                grid.c.prior_currency,
+            ).label("currency"),
+            func.coalesce(
+                func.first_value(grid.c.close_balance).over(
+                    partition_by=carry_partition, order_by=grid.c.bucket_start
+                ),
+                grid.c.prior_balance,
+            ).label("close_balance"),
+        ).subquery("carried")
+
+        stmt = (
+            select(
+                carried.c.bucket_start,
+                carried.c.currency,
+                func.sum(
+                    func.coalesce(carried.c.open_balance, carried.c.close_balance)
+                ).label("open_balance"),
+                func.sum(carried.c.close_balance).label("close_balance"),
+                func.coalesce(func.sum(carried.c.snapshot_count), 0).label(
+                    "snapshot_count"
+                ),
+                func.count().label("account_count"),
+            )
+            .where(carried.c.close_balance.is_not(None))
+            .group_by(carried.c.bucket_start, carried.c.currency)
+            .order_by(carried.c.bucket_start, carried.c.currency)
+        )
+
+        result = await self._session.execute(stmt)
+
+        return [
+            BalanceBucket(
+                bucket_start=self._as_utc(row.bucket_start),
+                currency=row.currency,
+                open_balance=row.open_balance,
+                close_balance=row.close_balance,
+                min_balance=None,
+                max_balance=None,
+                snapshot_count=int(row.snapshot_count),
+                account_count=int(row.account_count),
+            )
+            for row in result.all()
+        ]
+
     async def find_latest_by_user_id(
         self,
         user_id: UUID,
@@ -260,6 +480,7 @@ class BalanceSnapshotRepository:
         """Create snapshot in database.
 
         Snapshots are immutable - this only creates, never updates.
+        Folds the snapshot into its daily rollup in the same transaction.
 
         Args:
             snapshot: BalanceSnapshot entity to persist.
@@ -267,19 +488,77 @@ class BalanceSnapshotRepository:
         model = self._to_model(snapshot)
         self._session.add(model)
         await self._session.flush()
+        await self._upsert_daily_rollups([snapshot])
+
+    async def bulk_insert(
+        self,
+        snapshots: list[BalanceSnapshot],
+        dedupe_window: timedelta | None = None,
+        chunk_size: int = BULK_INSERT_CHUNK_SIZE,
+        commit: bool = False,
+    ) -> int:
+        """Insert many snapshots with multi-row INSERT statements.
+
+        Each chunk is one multi-row INSERT; the affected daily rollups are
+        upserted the same way. With dedupe_window, a snapshot is skipped
+        when the account's most recent snapshot (stored or earlier in the
+        batch) is within the window and has the same balance.
+
+        Args:
+            snapshots: Snapshot entities to insert.
+            dedupe_window: Skip unchanged balances captured within this window.
+            chunk_size: Maximum rows per INSERT statement.
+            commit: Commit the session's transaction afterwards (standalone
+                capture); by default the caller's transaction continues.
+
+        Returns:
+            Number of snapshots inserted (deduplicated ones excluded).
+        """
+        # Savepoint: a failed statement rolls back only the snapshots, so
+        # callers recording history best-effort keep a usable transaction.
+        async with self._session.begin_nested():
+            if dedupe_window is not None:
+                snapshots = await self._drop_unchanged(snapshots, dedupe_window)
+
+            for start in range(0, len(snapshots), chunk_size):
+                rows = [
+                    self._to_row(snapshot)
+                    for snapshot in snapshots[start : start + chunk_size]
+                ]
+                await self._session.execute(insert(BalanceSnapshotModel).values(rows))
+
+            if snapshots:
+                await self._upsert_daily_rollups(snapshots)
+        if commit:
+            await self._session.commit()
+        return len(snapshots)
 
     async def delete(self, snapshot_id: UUID) -> None:
         """Remove snapshot from database.
 
         Hard delete - permanently removes the record.
+        Rebuilds the snapshot's daily rollup from the remaining snapshots.
 
         Args:
             snapshot_id: Snapshot's unique identifier.
         """
-        stmt = delete(BalanceSnapshotModel).where(
-            BalanceSnapshotModel.id == snapshot_id
+        stmt = (
+            delete(BalanceSnapshotModel)
+            .where(BalanceSnapshotModel.id == snapshot_id)
+            .returning(
+                BalanceSnapshotModel.account_id,
+                BalanceSnapshotModel.source,
+                BalanceSnapshotModel.captured_at,
+            )
         )
-        await self._session.execute(stmt)
+        result = await self._session.execute(stmt)
+        deleted = result.first()
+        if deleted is not None:
+            await self._rebuild_daily_rollup(
+                deleted.account_id,
+                deleted.source,
+                self._utc_day(deleted.captured_at),
+            )
         await self._session.flush()
 
     async def count_by_account_id(self, account_id: UUID) -> int:
@@ -299,6 +578,336 @@ class BalanceSnapshotRepository:
         result = await self._session.execute(stmt)
         return result.scalar_one()
 
+    # =========================================================================
+    # Bucketing and Daily Rollups (Private Methods)
+    # =========================================================================
+
+    def _per_account_buckets(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        granularity: BalanceGranularity,
+        source: SnapshotSource | None,
+    ) -> Select[Any]:
+        """Build the per-account bucket query for a date range.
+
+        Day/week/month ranges longer than BALANCE_ROLLUP_MIN_RANGE_DAYS are
+        aggregated from daily rollups (whole UTC days); everything else from
+        raw snapshots. Both produce the same columns: account_id,
+        bucket_start, currency, open_balance, close_balance, min_balance,
+        max_balance, snapshot_count.
+
+        Args:
+            start_date: Start of date range (inclusive).
+            end_date: End of date range (inclusive).
+            granularity: Bucket size.
+            source: Optional filter by snapshot source.
+
+        Returns:
+            Select grouped by account, bucket and currency (unordered).
+        """
+        # date_trunc field is inlined: a bound parameter would differ between
+        # the SELECT and GROUP BY expressions and fail the grouping check
+        field: ColumnElement[str] = literal_column(f"'{granularity.value}'")
+
+        use_rollup = granularity != BalanceGranularity.HOUR and end_date - (
+            start_date
+        ) > timedelta(days=BALANCE_ROLLUP_MIN_RANGE_DAYS)
+
+        if use_rollup:
+            bucket = func.date_trunc(field, cast(DailyRollupModel.day, DateTime()))
+            stmt = select(
+                DailyRollupModel.account_id,
+                bucket.label("bucket_start"),
+                DailyRollupModel.currency,
+                self._first(
+                    DailyRollupModel.open_balance_amount,
+                    DailyRollupModel.first_captured_at,
+                ).label("open_balance"),
+                self._last(
+                    DailyRollupModel.close_balance_amount,
+                    DailyRollupModel.last_captured_at,
+                ).label("close_balance"),
+                func.min(DailyRollupModel.min_balance_amount).label("min_balance"),
+                func.max(DailyRollupModel.max_balance_amount).label("max_balance"),
+                func.sum(DailyRollupModel.snapshot_count).label("snapshot_count"),
+            ).where(
+                DailyRollupModel.day >= self._utc_day(start_date),
+                DailyRollupModel.day <= self._utc_day(end_date),
+            )
+            if source is not None:
+                stmt = stmt.where(DailyRollupModel.source == source.value)
+            return stmt.group_by(
+                DailyRollupModel.account_id, bucket, DailyRollupModel.currency
+            )
+
+        bucket = func.date_trunc(
+            field,
+            func.timezone(literal_column("'UTC'"), BalanceSnapshotModel.captured_at),
+        )
+        stmt = select(
+            BalanceSnapshotModel.account_id,
+            bucket.label("bucket_start"),
+            BalanceSnapshotModel.currency,
+            self._first(
+                BalanceSnapshotModel.balance_amount, BalanceSnapshotModel.captured_at
+            ).label("open_balance"),
+            self._last(
+                BalanceSnapshotModel.balance_amount, BalanceSnapshotModel.captured_at
+            ).label("close_balance"),
+            func.min(BalanceSnapshotModel.balance_amount).label("min_balance"),
+            func.max(BalanceSnapshotModel.balance_amount).label("max_balance"),
+            func.count().label("snapshot_count"),
+        ).where(
+            BalanceSnapshotModel.captured_at >= start_date,
+            BalanceSnapshotModel.captured_at <= end_date,
+        )
+        if source is not None:
+            stmt = stmt.where(BalanceSnapshotModel.source == source.value)
+        return stmt.group_by(
+            BalanceSnapshotModel.account_id, bucket, BalanceSnapshotModel.currency
+        )
+
+    async def _drop_unchanged(
+        self, snapshots: list[BalanceSnapshot], dedupe_window: timedelta
+    ) -> list[BalanceSnapshot]:
+        """Filter out snapshots that repeat the account's latest balance.
+
+        Loads the latest stored snapshot per account within the window in
+        one DISTINCT ON query, then walks the batch in capture order. A
+        snapshot carrying a holdings value only counts as unchanged if the
+        holdings value matches too.
+
+        Args:
+            snapshots: Candidate snapshots.
+            dedupe_window: How far back an unchanged balance suppresses a
+                new snapshot.
+
+        Returns:
+            Snapshots to insert, in capture order.
+        """
+        if not snapshots:
+            return []
+
+        ordered = sorted(snapshots, key=lambda s: s.captured_at)
+        stmt = (
+            select(BalanceSnapshotModel)
+            .where(
+                BalanceSnapshotModel.account_id.in_(
+                    {snapshot.account_id for snapshot in ordered}
+                ),
+                BalanceSnapshotModel.captured_at
+                >= ordered[0].captured_at - dedupe_window,
+            )
+            .order_by(
+                BalanceSnapshotModel.account_id,
+                BalanceSnapshotModel.captured_at.desc(),
+            )
+            .distinct(BalanceSnapshotModel.account_id)
+        )
+        result = await self._session.execute(stmt)
+        latest: dict[UUID, BalanceSnapshot] = {
+            model.account_id: self._to_domain(model) for model in result.scalars().all()
+        }
+
+        kept: list[BalanceSnapshot] = []
+        for snapshot in ordered:
+            previous = latest.get(snapshot.account_id)
+            if (
+                previous is not None
+                and snapshot.captured_at - previous.captured_at <= dedupe_window
+                and previous.balance == snapshot.balance
+                and (
+                    snapshot.holdings_value is None
+                    or previous.holdings_value == snapshot.holdings_value
+                )
+            ):
+                continue
+            kept.append(snapshot)
+            latest[snapshot.account_id] = snapshot
+        return kept
+
+    async def _upsert_daily_rollups(self, snapshots: list[BalanceSnapshot]) -> None:
+        """Fold new snapshots into their (account, source, day) rollup rows.
+
+        Snapshots sharing a rollup key are pre-aggregated so each key appears
+        once per statement (ON CONFLICT cannot update a row twice).
+
+        Args:
+            snapshots: Snapshots just inserted.
+        """
+        rows: dict[tuple[UUID, str, date], dict[str, Any]] = {}
+        for snapshot in sorted(snapshots, key=lambda s: s.captured_at):
+            amount = snapshot.balance.amount
+            key = (
+                snapshot.account_id,
+                snapshot.source.value,
+                self._utc_day(snapshot.captured_at),
+            )
+            row = rows.get(key)
+            if row is None:
+                rows[key] = {
+                    "account_id": key[0],
+                    "source": key[1],
+                    "day": key[2],
+                    "currency": snapshot.currency,
+                    "open_balance_amount": amount,
+                    "close_balance_amount": amount,
+                    "min_balance_amount": amount,
+                    "max_balance_amount": amount,
+                    "first_captured_at": snapshot.captured_at,
+                    "last_captured_at": snapshot.captured_at,
+                    "snapshot_count": 1,
+                }
+                continue
+            row["currency"] = snapshot.currency
+            row["close_balance_amount"] = amount
+            row["min_balance_amount"] = min(row["min_balance_amount"], amount)
+            row["max_balance_amount"] = max(row["max_balance_amount"], amount)
+            row["last_captured_at"] = snapshot.captured_at
+            row["snapshot_count"] += 1
+
+        values = list(rows.values())
+        for start in range(0, len(values), BULK_INSERT_CHUNK_SIZE):
+            await self._session.execute(
+                self._rollup_upsert(values[start : start + BULK_INSERT_CHUNK_SIZE])
+            )
+
+    def _rollup_upsert(self, rows: list[dict[str, Any]]) -> Any:
+        """Build the multi-row rollup upsert merging rows into existing days.
+
+        Args:
+            rows: Pre-aggregated rollup rows with distinct keys.
+
+        Returns:
+            INSERT ... ON CONFLICT DO UPDATE statement.
+        """
+        stmt = pg_insert(DailyRollupModel).values(rows)
+        current = DailyRollupModel.__table__.c
+        new = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_balance_snapshot_daily_rollups_account_source_day",
+            set_={
+                "open_balance_amount": case(
+                    (
+                        new.first_captured_at < current.first_captured_at,
+                        new.open_balance_amount,
+                    ),
+                    else_=current.open_balance_amount,
+                ),
+                "close_balance_amount": case(
+                    (
+                        new.last_captured_at >= current.last_captured_at,
+                        new.close_balance_amount,
+                    ),
+                    else_=current.close_balance_amount,
+                ),
+                "currency": case(
+                    (new.last_captured_at >= current.last_captured_at, new.currency),
+                    else_=current.currency,
+                ),
+                "min_balance_amount": func.least(
+                    current.min_balance_amount, new.min_balance_amount
+                ),
+                "max_balance_amount": func.greatest(
+                    current.max_balance_amount, new.max_balance_amount
+                ),
+                "first_captured_at": func.least(
+                    current.first_captured_at, new.first_captured_at
+                ),
+                "last_captured_at": func.greatest(
+                    current.last_captured_at, new.last_captured_at
+                ),
+                "snapshot_count": current.snapshot_count + new.snapshot_count,
+                "updated_at": func.now(),
+            },
+        )
+        return stmt
+
+    async def _rebuild_daily_rollup(
+        self, account_id: UUID, source: str, day: date
+    ) -> None:
+        """Recompute one rollup row from the snapshots left on that day.
+
+        Args:
+            account_id: Account of the rollup row.
+            source: Snapshot source of the rollup row.
+            day: UTC day of the rollup row.
+        """
+        await self._session.execute(
+            delete(DailyRollupModel).where(
+                DailyRollupModel.account_id == account_id,
+                DailyRollupModel.source == source,
+                DailyRollupModel.day == day,
+            )
+        )
+
+        day_start = datetime.combine(day, time.min, tzinfo=UTC)
+        stmt = select(
+            self._last(
+                BalanceSnapshotModel.currency, BalanceSnapshotModel.captured_at
+            ).label("currency"),
+            self._first(
+                BalanceSnapshotModel.balance_amount, BalanceSnapshotModel.captured_at
+            ).label("open_balance"),
+            self._last(
+                BalanceSnapshotModel.balance_amount, BalanceSnapshotModel.captured_at
+            ).label("close_balance"),
+            func.min(BalanceSnapshotModel.balance_amount).label("min_balance"),
+            func.max(BalanceSnapshotModel.balance_amount).label("max_balance"),
+            func.min(BalanceSnapshotModel.captured_at).label("first_captured_at"),
+            func.max(BalanceSnapshotModel.captured_at).label("last_captured_at"),
+            func.count().label("snapshot_count"),
+        ).where(
+            BalanceSnapshotModel.account_id == account_id,
+            BalanceSnapshotModel.source == source,
+            BalanceSnapshotModel.captured_at >= day_start,
+            BalanceSnapshotModel.captured_at < day_start + timedelta(days=1),
+        )
+        row = (await self._session.execute(stmt)).first()
+        if row is None or row.snapshot_count == 0:
+            return
+
+        self._session.add(
+            DailyRollupModel(
+                account_id=account_id,
+                source=source,
+                day=day,
+                currency=row.currency,
+                open_balance_amount=row.open_balance,
+                close_balance_amount=row.close_balance,
+                min_balance_amount=row.min_balance,
+                max_balance_amount=row.max_balance,
+                first_captured_at=row.first_captured_at,
+                last_captured_at=row.last_captured_at,
+                snapshot_count=row.snapshot_count,
+            )
+        )
+
+    @staticmethod
+    def _first(value: Any, order_by: Any) -> ColumnElement[Any]:
+        """Aggregate: value of the row with the smallest order_by."""
+        return func.array_agg(aggregate_order_by(value, order_by.asc()))[1]
+
+    @staticmethod
+    def _last(value: Any, order_by: Any) -> ColumnElement[Any]:
+        """Aggregate: value of the row with the largest order_by."""
+        return func.array_agg(aggregate_order_by(value, order_by.desc()))[1]
+
+    @staticmethod
+    def _utc_day(value: datetime) -> date:
+        """UTC calendar day of a timestamp (naive values are taken as UTC)."""
+        if value.tzinfo is None:
+            return value.date()
+        return value.astimezone(UTC).date()
+
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        """Attach UTC to a date_trunc() result (timestamp without time zone)."""
+        if value.tzinfo is None:
+            return value.replace(tzinfo=UTC)
+        return value
+
     # =========================================================================
     # Entity ↔ Model Mapping (Private Methods)
     # =========================================================================
@@ -357,6 +966,17 @@ class BalanceSnapshotRepository:
     def _to_model(self, entity: BalanceSnapshot) -> BalanceSnapshotModel:
         """Convert domain entity to database model.
 
+        Args:
+            entity: Domain BalanceSnapshot entity.
+
+        Returns:
+            SQLAlchemy BalanceSnapshotModel instance.
+        """
+        return BalanceSnapshotModel(**self._to_row(entity))
+
+    def _to_row(self, entity: BalanceSnapshot) -> dict[str, Any]:
+        """Convert domain entity to a column mapping for Core inserts.
+
         Extracts amount from Money value objects.
         Converts SnapshotSource enum to string value.
 
@@ -364,28 +984,28 @@ class BalanceSnapshotRepository:
             entity: Domain BalanceSnapshot entity.
 
         Returns:
-            SQLAlchemy BalanceSnapshotModel instance.
+            Column name to value mapping.
         """
-        return BalanceSnapshotModel(
-            id=entity.id,
-            account_id=entity.account_id,
-            balance_amount=entity.balance.amount,
-            currency=entity.currency,
-            source=entity.source.value,
-            available_balance_amount=(
+        return {
+            "id": entity.id,
+            "account_id": entity.account_id,
+            "balance_amount": entity.balance.amount,
+            "currency": entity.currency,
+            "source": entity.source.value,
+            "available_balance_amount": (
                 entity.available_balance.amount
                 if entity.available_balance is not None
                 else None
             ),
-            holdings_value_amount=(
+            "holdings_value_amount": (
                 entity.holdings_value.amount
                 if entity.holdings_value is not None
                 else None
             ),
-            cash_value_amount=(
+            "cash_value_amount": (
                 entity.cash_value.amount if entity.cash_value is not None else None
             ),
-            provider_metadata=entity.provider_metadata,
-            captured_at=entity.captured_at,
-            created_at=entity.created_at,
-        )
+            "provider_metadata": entity.provider_metadata,
+            "captured_at": entity.captured_at,
+            "created_at": entity.created_at,
+        }
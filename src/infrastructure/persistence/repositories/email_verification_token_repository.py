@@ -4,9 +4,10 @@ Handles CRUD operations for email verification tokens with expiration checks.
 """
 
 from datetime import UTC, datetime
+from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.protocols.email_verification_token_repository import (
@@ -112,26 +113,33 @@ class EmailVerificationTokenRepository:
         token.used_at = datetime.now(UTC)
         await self.session.commit()
 
-    async def delete_expired_tokens(self) -> int:
+    async def delete_expired_tokens(self, *, limit: int | None = None) -> int:
         """Delete expired email verification tokens.
 
         Cleanup task to remove old tokens (typically run daily).
+        Uses a single DELETE; with a limit, at most ``limit`` rows per call.
+
+        Args:
+            limit: Maximum tokens deleted by this call (None = all).
 
         Returns:
             Number of tokens deleted.
         """
-        stmt = select(EmailVerificationToken).where(
-            EmailVerificationToken.expires_at < datetime.now(UTC)
+        # Database clock: expires_at is stored without a time zone
+        condition = EmailVerificationToken.expires_at < func.now()
+        if limit is None:
+            stmt = delete(EmailVerificationToken).where(condition)
+        else:
+            batch_ids = select(EmailVerificationToken.id).where(condition).limit(limit)
+            stmt = delete(EmailVerificationToken).where(
+                EmailVerificationToken.id.in_(batch_ids)
+            )
+
+        result = await self.session.execute(
+            stmt.execution_options(synchronize_session=False)
         )
-        result = await self.session.execute(stmt)
-        tokens = result.scalars().all()
-
-        count = len(tokens)
-        for token in tokens:
-            await self.session.delete(token)
-
         await self.session.commit()
-        return count
+        return cast(Any, result).rowcount or 0
 
     async def find_by_user_id(self, user_id: UUID) -> list[EmailVerificationTokenData]:
         """Find all email verification tokens for a user.
@@ -4,9 +4,10 @@ Handles CRUD operations for password reset tokens with expiration checks.
 """
 
 from datetime import UTC, datetime
+from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.protocols.password_reset_token_repository import (
@@ -120,26 +121,33 @@ class PasswordResetTokenRepository:
         token.used_at = datetime.now(UTC)
         await self.session.commit()
 
-    async def delete_expired_tokens(self) -> int:
+    async def delete_expired_tokens(self, *, limit: int | None = None) -> int:
         """Delete expired password reset tokens.
 
         Cleanup task to remove old tokens (typically run hourly).
+        Uses a single DELETE; with a limit, at most ``limit`` rows per call.
+
+        Args:
+            limit: Maximum tokens deleted by this call (None = all).
 
         Returns:
             Number of tokens deleted.
         """
-        stmt = select(PasswordResetToken).where(
-            PasswordResetToken.expires_at < datetime.now(UTC)
+        # Database clock: expires_at is stored without a time zone
+        condition = PasswordResetToken.expires_at < func.now()
+        if limit is None:
+            stmt = delete(PasswordResetToken).where(condition)
+        else:
+            batch_ids = select(PasswordResetToken.id).where(condition).limit(limit)
+            stmt = delete(PasswordResetToken).where(
+                PasswordResetToken.id.in_(batch_ids)
+            )
+
+        result = await self.session.execute(
+            stmt.execution_options(synchronize_session=False)
         )
-        result = await self.session.execute(stmt)
-        tokens = result.scalars().all()
-
-        count = len(tokens)
-        for token in tokens:
-            await self.session.delete(token)
-
         await self.session.commit()
-        return count
+        return cast(Any, result).rowcount or 0
 
     async def find_by_user_id(self, user_id: UUID) -> list[PasswordResetTokenData]:
         """Find all password reset tokens for a user.
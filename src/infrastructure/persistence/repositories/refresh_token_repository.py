@@ -3,13 +3,15 @@
 Handles CRUD operations for refresh tokens with automatic expiration checks.
 """
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
+from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.constants import REFRESH_TOKEN_LEGACY_LENGTH
 from src.domain.protocols.refresh_token_repository import RefreshTokenData
 from src.infrastructure.persistence.models.refresh_token import RefreshToken
 
@@ -65,22 +67,25 @@ class RefreshTokenRepository:
         *,
         token_version: int = 1,
         global_version_at_issuance: int = 1,
+        token_selector: str | None = None,
     ) -> RefreshTokenData:
         """Create new refresh token in database.
 
         Args:
             user_id: User's unique identifier.
-            token_hash: Bcrypt hash of the refresh token.
+            token_hash: Keyed hash of the refresh token.
             session_id: Associated session ID.
             expires_at: Token expiration timestamp.
             token_version: Token version at issuance (for breach rotation).
             global_version_at_issuance: Global min version when issued.
+            token_selector: Non-secret lookup ID (None for legacy tokens).
 
         Returns:
             Created RefreshTokenData.
         """
         token_model = RefreshToken(
             user_id=user_id,
+            token_selector=token_selector,
             token_hash=token_hash,
             session_id=session_id,
             expires_at=expires_at,
@@ -96,7 +101,7 @@ class RefreshTokenRepository:
         """Find refresh token by hash.
 
         Args:
-            token_hash: Bcrypt hash of the token.
+            token_hash: Stored hash of the token.
 
         Returns:
             RefreshTokenData if found and not revoked, None otherwise.
@@ -197,31 +202,90 @@ class RefreshTokenRepository:
 
         await self.session.commit()
 
+    async def delete_expired(
+        self,
+        *,
+        before: datetime,
+        limit: int | None = None,
+    ) -> int:
+        """Delete refresh tokens that expired before a point in time.
+
+        With a limit, one DELETE removes at most ``limit`` rows.
+
+        Args:
+            before: Delete tokens with expires_at before this time.
+            limit: Maximum tokens deleted by this call (None = all).
+
+        Returns:
+            Number of tokens deleted.
+        """
+        # expires_at is stored without a time zone (UTC): bind a naive value
+        condition = RefreshToken.expires_at < before.astimezone(UTC).replace(
+            tzinfo=None
+        )
+        if limit is None:
+            stmt = delete(RefreshToken).where(condition)
+        else:
+            batch_ids = select(RefreshToken.id).where(condition).limit(limit)
+            stmt = delete(RefreshToken).where(RefreshToken.id.in_(batch_ids))
+
+        result = await self.session.execute(
+            stmt.execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        return cast(Any, result).rowcount or 0
+
     async def find_by_token_verification(
         self,
         token: str,
-        verify_fn: Callable[[str, str], bool],
+        verify_fn: Callable[[str, str], Awaitable[bool]],
+        *,
+        selector: str | None = None,
     ) -> RefreshTokenData | None:
-        """Find refresh token by verifying against stored hashes.
+        """Find refresh token by selector and verify it against its hash.
 
-        Since bcrypt hashes are non-deterministic, we iterate through active
-        tokens and verify each one against the provided token.
+        Selector tokens: one indexed lookup, one verification. Legacy tokens
+        (no selector): verify each active, unexpired legacy row, which no
+        longer includes any selector-format token. Tokens with neither a
+        selector nor the legacy length are rejected without a scan, so
+        malformed tokens cannot trigger bcrypt work.
 
         Args:
             token: Plain refresh token from user request.
-            verify_fn: Function to verify token against hash (token, hash) -> bool.
+            verify_fn: Async function to verify token against hash
+                (token, hash) -> bool.
+            selector: Lookup ID extracted from the token, or None for legacy.
 
         Returns:
             RefreshTokenData if found and verified, None otherwise.
         """
-        # Get all active (non-revoked) tokens
-        stmt = select(RefreshToken).where(RefreshToken.revoked_at.is_(None))
+        if selector is not None:
+            stmt = (
+                select(RefreshToken)
+                .where(RefreshToken.token_selector == selector)
+                .where(RefreshToken.revoked_at.is_(None))
+            )
+            result = await self.session.execute(stmt)
+            model = result.scalar_one_or_none()
+            if model is None or not await verify_fn(token, model.token_hash):
+                return None
+            return _to_data(model)
+
+        # Legacy bcrypt tokens (issued before selector/verifier format)
+        if len(token) != REFRESH_TOKEN_LEGACY_LENGTH:
+            return None
+        # Database clock: expires_at is stored without a time zone
+        stmt = (
+            select(RefreshToken)
+            .where(RefreshToken.token_selector.is_(None))
+            .where(RefreshToken.revoked_at.is_(None))
+            .where(RefreshToken.expires_at > func.now())
+        )
         result = await self.session.execute(stmt)
         tokens = result.scalars().all()
 
-        # Verify each token against the provided token
         for token_model in tokens:
-            if verify_fn(token, token_model.token_hash):
+            if await verify_fn(token, token_model.token_hash):
                 return _to_data(token_model)
 
         return None
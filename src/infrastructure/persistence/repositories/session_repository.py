@@ -17,7 +17,7 @@ from datetime import UTC, datetime
 from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import and_, delete, func, select, update
+from sqlalchemy import and_, delete, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.protocols.session_repository import SessionData
@@ -285,17 +285,25 @@ class SessionRepository:
         self,
         *,
         before: datetime | None = None,
+        revoked_before: datetime | None = None,
+        limit: int | None = None,
     ) -> int:
         """Clean up expired sessions (batch operation).
 
         Called by scheduled job to remove old sessions.
         Deletes sessions that are either:
         - Expired (expires_at < before)
-        - Revoked more than retention period ago
+        - Revoked before revoked_before (if given)
+
+        With a limit, one DELETE removes at most ``limit`` rows (keyed by a
+        LIMITed id subquery), keeping each sweep transaction short. Refresh
+        tokens of deleted sessions are removed by ON DELETE CASCADE.
 
         Args:
             before: Delete sessions expired before this time.
                    Defaults to now.
+            revoked_before: Also delete sessions revoked before this time.
+            limit: Maximum sessions deleted by this call (None = all).
 
         Returns:
             Number of sessions cleaned up.
@@ -303,12 +311,25 @@ class SessionRepository:
         if before is None:
             before = datetime.now(UTC)
 
-        # Delete expired or revoked sessions
-        stmt = delete(SessionModel).where(
-            SessionModel.expires_at < before,
-        )
+        condition = SessionModel.expires_at < before
+        if revoked_before is not None:
+            condition = or_(
+                condition,
+                and_(
+                    SessionModel.is_revoked == True,  # noqa: E712
+                    SessionModel.revoked_at < revoked_before,
+                ),
+            )
 
-        result = await self._session.execute(stmt)
+        if limit is None:
+            stmt = delete(SessionModel).where(condition)
+        else:
+            batch_ids = select(SessionModel.id).where(condition).limit(limit)
+            stmt = delete(SessionModel).where(SessionModel.id.in_(batch_ids))
+
+        result = await self._session.execute(
+            stmt.execution_options(synchronize_session=False)
+        )
         await self._session.commit()
         return cast(Any, result).rowcount or 0
 
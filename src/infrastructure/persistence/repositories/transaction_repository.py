@@ -8,22 +8,32 @@ Reference:
     - src/domain/entities/transaction.py
 """
 
+from collections.abc import AsyncIterator
 from datetime import date
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.constants import TRANSACTION_EXPORT_FETCH_SIZE
 from src.domain.entities.transaction import Transaction
 from src.domain.enums.asset_type import AssetType
 from src.domain.enums.transaction_status import TransactionStatus
 from src.domain.enums.transaction_subtype import TransactionSubtype
 from src.domain.enums.transaction_type import TransactionType
+from src.domain.protocols.transaction_repository import TransactionCursor
 from src.domain.value_objects.money import Money
 from src.infrastructure.persistence.models.transaction import (
     Transaction as TransactionModel,
 )
 
+# Rows per INSERT statement in bulk_insert().
+# Transaction rows bind 20 parameters each; 500 rows keeps a statement well
+# under PostgreSQL's 32767 bind parameter limit.
+BULK_INSERT_CHUNK_SIZE = 500
+
 
 class TransactionRepository:
     """SQLAlchemy implementation of TransactionRepository protocol.
@@ -90,7 +100,9 @@ class TransactionRepository:
         stmt = (
             select(TransactionModel)
             .where(TransactionModel.account_id == account_id)
-            .order_by(TransactionModel.transaction_date.desc())
+            .order_by(
+                TransactionModel.transaction_date.desc(), TransactionModel.id.desc()
+            )
             .limit(limit)
             .offset(offset)
         )
@@ -122,7 +134,9 @@ class TransactionRepository:
                 TransactionModel.account_id == account_id,
                 TransactionModel.transaction_type == transaction_type.value,
             )
-            .order_by(TransactionModel.transaction_date.desc())
+            .order_by(
+                TransactionModel.transaction_date.desc(), TransactionModel.id.desc()
+            )
             .limit(limit)
         )
         result = await self.session.execute(stmt)
@@ -130,6 +144,72 @@ class TransactionRepository:
 
         return [self._to_domain(model) for model in models]
 
+    async def find_page_by_account(
+        self,
+        account_id: UUID,
+        limit: int = 50,
+        after: TransactionCursor | None = None,
+        transaction_type: TransactionType | None = None,
+    ) -> list[Transaction]:
+        """Find one page of an account's transactions by keyset.
+
+        Seeks with a row comparison ``(transaction_date, id) < (:date, :id)``,
+        which PostgreSQL answers from idx_transactions_account_date_id
+        without scanning the rows of earlier pages.
+
+        Args:
+            account_id: Account identifier to query.
+            limit: Maximum number of transactions to return.
+            after: Position of the last transaction of the previous page.
+            transaction_type: Optional filter by transaction type.
+
+        Returns:
+            List of transactions (empty if none found).
+            Ordered by (transaction_date DESC, id DESC).
+        """
+        stmt = self._account_listing(account_id, transaction_type)
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(TransactionModel.transaction_date, TransactionModel.id)
+                < tuple_(
+                    literal(
+                        after.transaction_date, TransactionModel.transaction_date.type
+                    ),
+                    literal(after.transaction_id, TransactionModel.id.type),
+                )
+            )
+        result = await self.session.execute(stmt.limit(limit))
+        models = result.scalars().all()
+
+        return [self._to_domain(model) for model in models]
+
+    async def stream_by_account(
+        self,
+        account_id: UUID,
+        transaction_type: TransactionType | None = None,
+    ) -> AsyncIterator[Transaction]:
+        """Stream all of an account's transactions.
+
+        Uses a server-side cursor fetching TRANSACTION_EXPORT_FETCH_SIZE rows
+        per round trip; each batch is released once mapped and yielded.
+
+        Args:
+            account_id: Account identifier to query.
+            transaction_type: Optional filter by transaction type.
+
+        Yields:
+            Transaction: Transactions ordered by (transaction_date DESC, id DESC).
+        """
+        stmt = self._account_listing(account_id, transaction_type).execution_options(
+            yield_per=TRANSACTION_EXPORT_FETCH_SIZE
+        )
+        result = await self.session.stream_scalars(stmt)
+        try:
+            async for model in result:
+                yield self._to_domain(model)
+        finally:
+            await result.close()
+
     async def find_by_date_range(
         self,
         account_id: UUID,
@@ -191,6 +271,24 @@ class TransactionRepository:
 
         return self._to_domain(model)
 
+    async def find_provider_transaction_ids(self, account_id: UUID) -> set[str]:
+        """Find all provider transaction IDs stored for an account.
+
+        Single-query prefetch used by bulk sync/import paths to deduplicate
+        provider data in memory instead of one lookup per transaction.
+
+        Args:
+            account_id: Account identifier to query.
+
+        Returns:
+            Set of provider_transaction_id values (empty if none).
+        """
+        stmt = select(TransactionModel.provider_transaction_id).where(
+            TransactionModel.account_id == account_id
+        )
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+
     async def find_security_transactions(
         self,
         account_id: UUID,
@@ -277,6 +375,56 @@ class TransactionRepository:
 
         await self.session.commit()
 
+    async def bulk_insert(
+        self,
+        transactions: list[Transaction],
+        chunk_size: int = BULK_INSERT_CHUNK_SIZE,
+    ) -> int:
+        """Insert new transactions in chunks within a single transaction.
+
+        Each chunk is one multi-row ``INSERT ... ON CONFLICT (account_id,
+        provider_transaction_id) DO NOTHING`` statement, so rows that already
+        exist (e.g. inserted by a concurrent sync) are skipped rather than
+        failing the batch. All chunks are committed together.
+
+        Args:
+            transactions: Transaction entities to insert.
+            chunk_size: Maximum rows per INSERT statement.
+
+        Returns:
+            Number of rows actually inserted (conflicting rows excluded).
+
+        Raises:
+            SQLAlchemyError: If any chunk fails. The whole batch is rolled back.
+        """
+        if not transactions:
+            return 0
+
+        inserted = 0
+        try:
+            for start in range(0, len(transactions), chunk_size):
+                rows = [
+                    self._to_row(transaction)
+                    for transaction in transactions[start : start + chunk_size]
+                ]
+                stmt = (
+                    insert(TransactionModel)
+                    .values(rows)
+                    .on_conflict_do_nothing(
+                        constraint="uq_transactions_account_provider"
+                    )
+                    .returning(TransactionModel.id)
+                )
+                result = await self.session.execute(stmt)
+                inserted += len(result.scalars().all())
+
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        return inserted
+
     async def delete(self, transaction_id: UUID) -> None:
         """Delete a transaction.
 
@@ -295,6 +443,33 @@ class TransactionRepository:
         await self.session.delete(model)
         await self.session.commit()
 
+    # =========================================================================
+    # Query Builders (Private Methods)
+    # =========================================================================
+
+    def _account_listing(
+        self,
+        account_id: UUID,
+        transaction_type: TransactionType | None,
+    ) -> Select[tuple[TransactionModel]]:
+        """Build the keyset-ordered listing query for an account.
+
+        Args:
+            account_id: Account identifier to query.
+            transaction_type: Optional filter by transaction type.
+
+        Returns:
+            SELECT ordered by (transaction_date DESC, id DESC).
+        """
+        stmt = select(TransactionModel).where(TransactionModel.account_id == account_id)
+        if transaction_type is not None:
+            stmt = stmt.where(
+                TransactionModel.transaction_type == transaction_type.value
+            )
+        return stmt.order_by(
+            TransactionModel.transaction_date.desc(), TransactionModel.id.desc()
+        )
+
     # =========================================================================
     # Entity ↔ Model Mapping (Private Methods)
     # =========================================================================
@@ -396,6 +571,44 @@ class TransactionRepository:
             updated_at=entity.updated_at,
         )
 
+    def _to_row(self, entity: Transaction) -> dict[str, Any]:
+        """Convert domain entity to a column/value mapping for Core inserts.
+
+        Mirrors _to_model() for bulk statements that bypass the ORM unit of work.
+
+        Args:
+            entity: Domain Transaction entity.
+
+        Returns:
+            Dict keyed by TransactionModel column name.
+        """
+        return {
+            "id": entity.id,
+            "account_id": entity.account_id,
+            "provider_transaction_id": entity.provider_transaction_id,
+            "transaction_type": entity.transaction_type.value,
+            "subtype": entity.subtype.value,
+            "status": entity.status.value,
+            "amount": entity.amount.amount,
+            "currency": entity.amount.currency,
+            "description": entity.description,
+            "asset_type": entity.asset_type.value if entity.asset_type else None,
+            "symbol": entity.symbol,
+            "security_name": entity.security_name,
+            "quantity": entity.quantity,
+            "unit_price_amount": (
+                entity.unit_price.amount if entity.unit_price is not None else None
+            ),
+            "commission_amount": (
+                entity.commission.amount if entity.commission is not None else None
+            ),
+            "transaction_date": entity.transaction_date,
+            "settlement_date": entity.settlement_date,
+            "provider_metadata": entity.provider_metadata,
+            "created_at": entity.created_at,
+            "updated_at": entity.updated_at,
+        }
+
     def _update_model(self, model: TransactionModel, entity: Transaction) -> None:
         """Update existing model with entity data.
 
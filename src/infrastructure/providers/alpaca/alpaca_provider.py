@@ -33,6 +33,7 @@ Reference:
 from datetime import date
 from typing import Any
 
+import httpx
 import structlog
 
 from src.core.config import Settings
@@ -99,6 +100,7 @@ class AlpacaProvider:
         cache_keys: CacheKeys | None = None,
         cache_metrics: CacheMetrics | None = None,
         timeout: float = 30.0,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize Alpaca provider.
 
@@ -108,6 +110,8 @@ class AlpacaProvider:
             cache_keys: Optional cache key utility.
             cache_metrics: Optional metrics tracker.
             timeout: HTTP request timeout in seconds.
+            http_client: Optional shared pooled client for Trading API calls.
+                Owned by the caller.
         """
         self._settings = settings
         self._timeout = timeout
@@ -122,10 +126,12 @@ class AlpacaProvider:
         self._accounts_api = AlpacaAccountsAPI(
             base_url=self._base_url,
             timeout=timeout,
+            http_client=http_client,
         )
         self._transactions_api = AlpacaTransactionsAPI(
             base_url=self._base_url,
             timeout=timeout,
+            http_client=http_client,
         )
         self._account_mapper = AlpacaAccountMapper()
         self._holding_mapper = AlpacaHoldingMapper()
@@ -14,6 +14,8 @@ Reference:
 
 from typing import Any
 
+import httpx
+
 from src.core.constants import PROVIDER_TIMEOUT_DEFAULT
 from src.core.result import Result
 from src.domain.errors import ProviderError
@@ -26,7 +28,8 @@ class AlpacaAccountsAPI(BaseProviderAPIClient):
     Extends BaseProviderAPIClient with Alpaca API Key authentication.
     Returns raw JSON responses - mapping to domain types is done by mappers.
 
-    Thread-safe: Uses httpx.AsyncClient per-request (no shared state).
+    Connection reuse: Uses the injected pooled httpx.AsyncClient when
+    provided, otherwise opens a client per request.
 
     Example:
         >>> api = AlpacaAccountsAPI(
@@ -41,17 +44,20 @@ class AlpacaAccountsAPI(BaseProviderAPIClient):
         *,
         base_url: str,
         timeout: float = PROVIDER_TIMEOUT_DEFAULT,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize Alpaca Accounts API client.
 
         Args:
             base_url: Alpaca Trading API base URL.
             timeout: HTTP request timeout in seconds.
+            http_client: Optional shared pooled client (see ProviderHTTPClientRegistry).
         """
         super().__init__(
             base_url=base_url,
             provider_name="alpaca",
             timeout=timeout,
+            http_client=http_client,
         )
 
     async def get_account(
@@ -28,6 +28,8 @@ Reference:
 from datetime import date
 from typing import Any
 
+import httpx
+
 from src.core.constants import PROVIDER_TIMEOUT_DEFAULT
 from src.core.result import Result
 from src.domain.errors import ProviderError
@@ -59,17 +61,20 @@ class AlpacaTransactionsAPI(BaseProviderAPIClient):
         *,
         base_url: str,
         timeout: float = PROVIDER_TIMEOUT_DEFAULT,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize Alpaca Activities API client.
 
         Args:
             base_url: Alpaca Trading API base URL.
             timeout: HTTP request timeout in seconds.
+            http_client: Optional shared pooled client (see ProviderHTTPClientRegistry).
         """
         super().__init__(
             base_url=base_url,
             provider_name="alpaca",
             timeout=timeout,
+            http_client=http_client,
         )
 
     async def get_transactions(
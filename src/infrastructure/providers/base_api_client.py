@@ -14,7 +14,8 @@ This eliminates ~400 lines of duplicated code across provider API clients.
 
 Architecture:
     - Infrastructure layer (adapter for external APIs)
-    - Uses httpx for async HTTP
+    - Uses httpx for async HTTP (pooled app-lifetime client when injected,
+      see ProviderHTTPClientRegistry)
     - Returns Result types (no exceptions for business errors)
 
 Reference:
@@ -54,6 +55,7 @@ class BaseProviderAPIClient:
         _base_url: Provider API base URL (without trailing slash).
         _provider_name: Provider identifier for logging and error messages.
         _timeout: HTTP request timeout in seconds.
+        _http_client: Shared pooled client (None = per-request client).
         _logger: Structured logger with provider context.
 
     Example:
@@ -80,6 +82,7 @@ class BaseProviderAPIClient:
         base_url: str,
         provider_name: str,
         timeout: float = PROVIDER_TIMEOUT_DEFAULT,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize base provider API client.
 
@@ -87,10 +90,13 @@ class BaseProviderAPIClient:
             base_url: Provider API base URL (e.g., "https://api.schwabapi.com/trader/v1").
             provider_name: Provider identifier (e.g., "schwab", "alpaca").
             timeout: HTTP request timeout in seconds.
+            http_client: Optional long-lived pooled client. Owned by the caller
+                (never closed here). If None, a client is opened per request.
         """
         self._base_url = base_url.rstrip("/")
         self._provider_name = provider_name
         self._timeout = timeout
+        self._http_client = http_client
         self._logger = structlog.get_logger(f"{provider_name}_api")
 
     async def _execute_request(
@@ -120,14 +126,24 @@ class BaseProviderAPIClient:
         url = f"{self._base_url}{path}"
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.request(
+            if self._http_client is not None:
+                response = await self._http_client.request(
                     method=method,
                     url=url,
                     headers=headers,
                     params=params,
                     json=json_data,
+                    timeout=self._timeout,
                 )
+            else:
+                async with httpx.AsyncClient(timeout=self._timeout) as client:
+                    response = await client.request(
+                        method=method,
+                        url=url,
+                        headers=headers,
+                        params=params,
+                        json=json_data,
+                    )
             return Success(value=response)
 
         except httpx.TimeoutException as e:
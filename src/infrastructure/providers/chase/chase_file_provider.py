@@ -20,6 +20,11 @@ Architecture:
     - mappers/account_mapper.py: ParsedAccount → ProviderAccountData
     - mappers/transaction_mapper.py: ParsedTransaction → ProviderTransactionData
 
+    Parse results are kept in a FileParseCache keyed by the SHA-256 of the
+    file content and bounded by a byte budget. The container shares one
+    cache across provider instances, so fetch_accounts(), fetch_transactions()
+    and re-uploads of the same file parse it only once.
+
 Reference:
     - docs/architecture/provider-integration-architecture.md
 """
@@ -29,11 +34,16 @@ from typing import Any
 
 import structlog
 
+from src.core.constants import (
+    FILE_PARSE_CACHE_MAX_BYTES,
+    FILE_PARSE_CACHE_MAX_ENTRIES,
+)
 from src.core.enums import ErrorCode
 from src.core.result import Failure, Result, Success
 from src.domain.errors import ProviderError, ProviderInvalidResponseError
 from src.domain.protocols.provider_protocol import (
     ProviderAccountData,
+    ProviderFileData,
     ProviderHoldingData,
     ProviderTransactionData,
 )
@@ -44,15 +54,16 @@ from src.infrastructure.providers.chase.mappers.transaction_mapper import (
     ChaseTransactionMapper,
 )
 from src.infrastructure.providers.chase.parsers.qfx_parser import (
-    ParsedAccount,
+    ParsedStatement,
     QfxParser,
 )
+from src.infrastructure.providers.file_parse_cache import FileParseCache
 
 logger = structlog.get_logger(__name__)
 
 
 class ChaseFileProvider:
-    """Chase file import provider implementing ProviderProtocol.
+    """Chase file import provider implementing FileProviderProtocol.
 
     Parses QFX/OFX files from Chase bank and returns structured data.
     Unlike API providers, this receives file content in credentials dict.
@@ -60,11 +71,12 @@ class ChaseFileProvider:
     Key Differences from API Providers:
     - Credentials contain file_content (bytes) instead of tokens/keys
     - No HTTP requests - all data comes from parsed file
-    - fetch_accounts returns single account per file (Chase exports one per file)
+    - fetch_accounts returns every account in the file (Chase exports one)
     - fetch_transactions returns transactions embedded in same file
+    - parse_file returns accounts and transactions from a single parse
     - No token refresh needed
 
-    Thread-safe: No mutable state, can be shared across requests.
+    Not thread-safe: the parse cache is used from the event loop only.
 
     Example:
         >>> provider = ChaseFileProvider()
@@ -73,23 +85,30 @@ class ChaseFileProvider:
         ...     "file_format": "qfx",
         ...     "file_name": "Chase0737_Activity.QFX",
         ... }
-        >>> result = await provider.fetch_accounts(credentials)
+        >>> result = await provider.parse_file(credentials)
         >>> match result:
-        ...     case Success(accounts):
-        ...         print(f"Found {len(accounts)} account(s)")
+        ...     case Success(data):
+        ...         print(f"Found {len(data.accounts)} account(s)")
         ...     case Failure(error):
         ...         print(f"Failed: {error.message}")
     """
 
-    def __init__(self) -> None:
-        """Initialize Chase file provider."""
+    def __init__(self, parse_cache: FileParseCache | None = None) -> None:
+        """Initialize Chase file provider.
+
+        Args:
+            parse_cache: Shared parse cache (app-scoped, from the container).
+                Defaults to a cache private to this instance.
+        """
         self._parser = QfxParser()
         self._account_mapper = ChaseAccountMapper()
         self._transaction_mapper = ChaseTransactionMapper()
-
-        # Cache parsed data within a single request
-        # Key: hash of file_content, Value: ParsedAccount
-        self._parsed_cache: dict[int, ParsedAccount] = {}
+        if parse_cache is None:
+            parse_cache = FileParseCache(
+                max_bytes=FILE_PARSE_CACHE_MAX_BYTES,
+                max_entries=FILE_PARSE_CACHE_MAX_ENTRIES,
+            )
+        self._parse_cache = parse_cache
 
     @property
     def slug(self) -> str:
@@ -100,9 +119,10 @@ class ChaseFileProvider:
         self,
         credentials: dict[str, Any],
     ) -> Result[list[ProviderAccountData], ProviderError]:
-        """Fetch account from parsed QFX file.
+        """Fetch accounts from parsed QFX file.
 
-        Chase exports one account per QFX file, so this returns a single-item list.
+        Chase exports one account per QFX file, so this usually returns a
+        single-item list.
 
         Args:
             credentials: Dict containing:
@@ -111,7 +131,7 @@ class ChaseFileProvider:
                 - file_name: Original filename (optional, for logging)
 
         Returns:
-            Success(list[ProviderAccountData]): Single account from file.
+            Success(list[ProviderAccountData]): Accounts from file.
             Failure(ProviderInvalidResponseError): If file is invalid or unparseable.
         """
         # Parse file (with caching)
@@ -119,19 +139,21 @@ class ChaseFileProvider:
         if isinstance(parsed_result, Failure):
             return Failure(error=parsed_result.error)
 
-        parsed = parsed_result.value
-
         # Map to ProviderAccountData
-        account_data = self._account_mapper.map_account(parsed)
-
-        logger.info(
-            "chase_file_fetch_accounts_succeeded",
-            provider=self.slug,
-            account_id_masked=account_data.account_number_masked,
-            account_type=account_data.account_type,
-        )
+        accounts = [
+            self._account_mapper.map_account(parsed)
+            for parsed in parsed_result.value.accounts
+        ]
+
+        for account_data in accounts:
+            logger.info(
+                "chase_file_fetch_accounts_succeeded",
+                provider=self.slug,
+                account_id_masked=account_data.account_number_masked,
+                account_type=account_data.account_type,
+            )
 
-        return Success(value=[account_data])
+        return Success(value=accounts)
 
     async def fetch_transactions(
         self,
@@ -160,15 +182,24 @@ class ChaseFileProvider:
         if isinstance(parsed_result, Failure):
             return Failure(error=parsed_result.error)
 
-        parsed = parsed_result.value
-
-        # Validate account ID matches
-        if parsed.account_id != provider_account_id:
+        # Find the requested account
+        parsed = next(
+            (
+                account
+                for account in parsed_result.value.accounts
+                if account.account_id == provider_account_id
+            ),
+            None,
+        )
+        if parsed is None:
             logger.warning(
                 "chase_file_account_mismatch",
                 provider=self.slug,
                 expected=provider_account_id,
-                got_masked=self._mask_account_id(parsed.account_id),
+                got_masked=[
+                    self._mask_account_id(account.account_id)
+                    for account in parsed_result.value.accounts
+                ],
             )
             # Don't fail - user might have multiple files, just return empty
             return Success(value=[])
@@ -193,6 +224,49 @@ class ChaseFileProvider:
 
         return Success(value=transactions)
 
+    async def parse_file(
+        self,
+        credentials: dict[str, Any],
+    ) -> Result[ProviderFileData, ProviderError]:
+        """Parse QFX file into accounts and their transactions in one pass.
+
+        Equivalent to fetch_accounts() plus fetch_transactions() for each
+        account, without re-reading the parse result per account.
+
+        Args:
+            credentials: Dict containing file data (see fetch_accounts).
+
+        Returns:
+            Success(ProviderFileData): Accounts and transactions by account.
+            Failure(ProviderInvalidResponseError): If file is invalid or unparseable.
+        """
+        parsed_result = self._parse_file(credentials)
+        if isinstance(parsed_result, Failure):
+            return Failure(error=parsed_result.error)
+
+        accounts: list[ProviderAccountData] = []
+        transactions: dict[str, list[ProviderTransactionData]] = {}
+        for parsed in parsed_result.value.accounts:
+            account_data = self._account_mapper.map_account(parsed)
+            accounts.append(account_data)
+            transactions.setdefault(account_data.provider_account_id, []).extend(
+                self._transaction_mapper.map_transactions(
+                    parsed.transactions,
+                    currency=parsed.currency,
+                )
+            )
+
+        logger.info(
+            "chase_file_parse_file_succeeded",
+            provider=self.slug,
+            account_count=len(accounts),
+            transaction_count=sum(len(txns) for txns in transactions.values()),
+        )
+
+        return Success(
+            value=ProviderFileData(accounts=accounts, transactions=transactions)
+        )
+
     async def fetch_holdings(
         self,
         credentials: dict[str, Any],
@@ -219,14 +293,14 @@ class ChaseFileProvider:
     def _parse_file(
         self,
         credentials: dict[str, Any],
-    ) -> Result[ParsedAccount, ProviderError]:
+    ) -> Result[ParsedStatement, ProviderError]:
         """Parse file from credentials with caching.
 
         Args:
             credentials: Dict containing file_content, file_format, file_name.
 
         Returns:
-            Success(ParsedAccount): Parsed account data.
+            Success(ParsedStatement): Parsed accounts.
             Failure(ProviderInvalidResponseError): If file is invalid.
         """
         # Extract file content
@@ -247,11 +321,6 @@ class ChaseFileProvider:
         if isinstance(file_content, str):
             file_content = file_content.encode("utf-8")
 
-        # Check cache
-        content_hash = hash(file_content)
-        if content_hash in self._parsed_cache:
-            return Success(value=self._parsed_cache[content_hash])
-
         # Validate format
         if file_format.lower() not in ("qfx", "ofx"):
             return Failure(
@@ -262,13 +331,19 @@ class ChaseFileProvider:
                 )
             )
 
+        # Check cache (content-addressed: same bytes, same parse result)
+        cache_key = self._parse_cache.key_for(file_content)
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None:
+            return Success(value=cached)
+
         # Parse
-        result = self._parser.parse(file_content, file_name)
+        result = self._parser.parse_statement(file_content, file_name)
         if isinstance(result, Failure):
             return Failure(error=result.error)
 
         # Cache result
-        self._parsed_cache[content_hash] = result.value
+        self._parse_cache.set(cache_key, result.value, size_bytes=len(file_content))
 
         return result
 
@@ -308,7 +383,7 @@ class ChaseFileProvider:
     def clear_cache(self) -> None:
         """Clear the parsed file cache.
 
-        Call this if the same provider instance processes multiple files
-        and you want to free memory.
+        The cache is bounded, so this is only needed to free memory early.
+        Clears the shared cache when one was injected.
         """
-        self._parsed_cache.clear()
+        self._parse_cache.clear()
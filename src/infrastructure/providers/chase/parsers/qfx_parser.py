@@ -3,13 +3,23 @@
 Parses QFX (Quicken Financial Exchange) files exported from Chase.
 QFX is Chase's variant of OFX (Open Financial Exchange) format.
 
-Uses the ofxparse library for SGML/XML parsing.
+Uses the ofxparse library for the statement envelope and a streaming
+scanner for the transaction list.
 
 Architecture:
-    QfxParser extracts:
-    - Account information (BANKACCTFROM section)
-    - Transaction list (BANKTRANLIST section)
-    - Balance information (LEDGERBAL, AVAILBAL sections)
+    QfxParser extracts, for every bank (STMTRS) and credit card (CCSTMTRS)
+    statement in the file:
+    - Account information (BANKACCTFROM/CCACCTFROM section) via ofxparse
+    - Balance information (LEDGERBAL, AVAILBAL sections) via ofxparse
+    - Transaction list (STMTTRN entries of the statement's BANKTRANLIST) via
+      a linear regex scan over the raw bytes
+
+    ofxparse builds a BeautifulSoup tree and re-tokenizes the whole file,
+    which grows superlinearly with file size (minutes for a multi-year
+    export). The transaction lists are therefore cut out before ofxparse
+    runs, so the envelope of a multi-account file is parsed once, and the
+    entries are scanned one by one, applying the same field rules as
+    ofxparse.
 
     Returns intermediate dataclasses that mappers convert to ProviderData types.
 
@@ -18,9 +28,12 @@ Reference:
     - ofxparse library: https://github.com/jseutter/ofxparse
 """
 
+import html
+import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import date, datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from io import BytesIO
 from typing import Any
 
@@ -33,6 +46,15 @@ from src.domain.errors import ProviderError, ProviderInvalidResponseError
 
 logger = structlog.get_logger(__name__)
 
+# Bank and credit card statements, their transaction list and the STMTTRN
+# aggregates inside it. OFX 1.x SGML omits closing tags only for leaf
+# elements, so aggregates are always closed.
+_STATEMENT_RE = re.compile(rb"(?is)<(STMTRS|CCSTMTRS)>.*?</\1>")
+_TRANSACTION_LIST_RE = re.compile(rb"(?is)<BANKTRANLIST>(.*?)</BANKTRANLIST>")
+_TRANSACTION_RE = re.compile(rb"(?is)<STMTTRN>(.*?)</STMTTRN>")
+_ELEMENT_RE = re.compile(r"<([A-Za-z0-9_.]+)>([^<]*)")
+_HEADER_RE = re.compile(rb"(?im)^\s*(ENCODING|CHARSET)\s*:\s*(\S+)")
+
 
 @dataclass(frozen=True, kw_only=True)
 class ParsedTransaction:
@@ -95,6 +117,18 @@ class ParsedAccount:
     balance: ParsedBalance | None
 
 
+@dataclass(frozen=True, kw_only=True)
+class ParsedStatement:
+    """Every account extracted from one QFX file.
+
+    Attributes:
+        accounts: Parsed accounts (bank statements first, then credit card
+            statements, each in file order). Never empty.
+    """
+
+    accounts: list[ParsedAccount]
+
+
 class QfxParser:
     """Parser for Chase QFX/OFX bank statement files.
 
@@ -105,10 +139,11 @@ class QfxParser:
 
     Example:
         >>> parser = QfxParser()
-        >>> result = parser.parse(file_bytes)
+        >>> result = parser.parse_statement(file_bytes)
         >>> match result:
-        ...     case Success(parsed_account):
-        ...         print(f"Found {len(parsed_account.transactions)} transactions")
+        ...     case Success(statement):
+        ...         for account in statement.accounts:
+        ...             print(f"Found {len(account.transactions)} transactions")
         ...     case Failure(error):
         ...         print(f"Parse failed: {error.message}")
     """
@@ -118,14 +153,40 @@ class QfxParser:
         file_content: bytes,
         file_name: str = "unknown.qfx",
     ) -> Result[ParsedAccount, ProviderError]:
-        """Parse QFX file content into structured data.
+        """Parse QFX file content and return its first account.
+
+        Chase exports one account per file; use parse_statement() for files
+        that may contain several.
+
+        Args:
+            file_content: Raw bytes of QFX file.
+            file_name: Original filename for logging/debugging.
+
+        Returns:
+            Success(ParsedAccount): First account with transactions and balance.
+            Failure(ProviderInvalidResponseError): If file is invalid or unparseable.
+        """
+        result = self.parse_statement(file_content, file_name)
+        if isinstance(result, Failure):
+            return Failure(error=result.error)
+        return Success(value=result.value.accounts[0])
+
+    def parse_statement(
+        self,
+        file_content: bytes,
+        file_name: str = "unknown.qfx",
+    ) -> Result[ParsedStatement, ProviderError]:
+        """Parse QFX file content into every account it contains.
+
+        The envelope is parsed by ofxparse once; each statement's transaction
+        list is scanned from the raw bytes in the same pass.
 
         Args:
             file_content: Raw bytes of QFX file.
             file_name: Original filename for logging/debugging.
 
         Returns:
-            Success(ParsedAccount): Parsed account with transactions and balance.
+            Success(ParsedStatement): Accounts with transactions and balance.
             Failure(ProviderInvalidResponseError): If file is invalid or unparseable.
         """
         logger.info(
@@ -134,9 +195,11 @@ class QfxParser:
             file_size=len(file_content),
         )
 
+        envelope, transaction_lists = self._split_transaction_lists(file_content)
+
         try:
             # ofxparse expects a file-like object
-            file_handle = BytesIO(file_content)
+            file_handle = BytesIO(envelope)
             ofx = OfxParser.parse(file_handle)
         except Exception as e:
             logger.error(
@@ -152,7 +215,6 @@ class QfxParser:
                 )
             )
 
-        # OFX files can contain multiple accounts, but Chase exports one per file
         if not ofx.accounts:
             logger.warning(
                 "qfx_parse_no_accounts",
@@ -166,9 +228,48 @@ class QfxParser:
                 )
             )
 
-        # Chase exports one account per file
-        account = ofx.accounts[0]
+        encoding = self._detect_encoding(file_content)
+        accounts: list[ParsedAccount] = []
 
+        # ofxparse lists bank statements, then credit card statements, each
+        # in file order: the same order as transaction_lists
+        for index, account in enumerate(ofx.accounts):
+            transaction_list = (
+                transaction_lists[index] if index < len(transaction_lists) else b""
+            )
+            parsed = self._parse_account(account, transaction_list, encoding, file_name)
+            accounts.append(parsed)
+
+            logger.info(
+                "qfx_parse_succeeded",
+                file_name=file_name,
+                account_id=self._mask_account_id(parsed.account_id),
+                account_type=parsed.account_type,
+                transaction_count=len(parsed.transactions),
+                has_balance=parsed.balance is not None,
+            )
+
+        return Success(value=ParsedStatement(accounts=accounts))
+
+    def _parse_account(
+        self,
+        account: Any,
+        transaction_list: bytes,
+        encoding: str,
+        file_name: str,
+    ) -> ParsedAccount:
+        """Build one ParsedAccount from an ofxparse account.
+
+        Args:
+            account: ofxparse Account object.
+            transaction_list: Raw STMTTRN entries cut from the account's
+                statement (empty if nothing was cut).
+            encoding: Text encoding declared by the file.
+            file_name: For logging.
+
+        Returns:
+            Parsed account with transactions and balance.
+        """
         # Extract account info
         account_id = str(account.account_id) if account.account_id else ""
         account_type = (
@@ -181,31 +282,176 @@ class QfxParser:
             else "USD"
         )
 
-        # Parse transactions
-        transactions = self._parse_transactions(account, file_name)
-
-        # Parse balance
-        balance = self._parse_balance(account, currency)
+        # Parse transactions (scanned from the raw transaction list; the
+        # envelope parsed by ofxparse no longer contains them)
+        if transaction_list:
+            transactions = list(
+                self._iter_transactions(transaction_list, encoding, file_name)
+            )
+        else:
+            transactions = self._parse_transactions(account, file_name)
 
-        parsed = ParsedAccount(
+        return ParsedAccount(
             account_id=account_id,
             account_type=account_type,
             bank_id=bank_id,
             currency=currency,
             transactions=transactions,
-            balance=balance,
+            balance=self._parse_balance(account, currency),
         )
 
-        logger.info(
-            "qfx_parse_succeeded",
-            file_name=file_name,
-            account_id=self._mask_account_id(account_id),
-            account_type=account_type,
-            transaction_count=len(transactions),
-            has_balance=balance is not None,
-        )
+    @staticmethod
+    def _split_transaction_lists(file_content: bytes) -> tuple[bytes, list[bytes]]:
+        """Cut the STMTTRN entries of every statement out of a file.
+
+        Args:
+            file_content: Raw bytes of QFX file.
+
+        Returns:
+            Tuple of (envelope without those entries, raw entries per
+            statement). Raw entries are ordered like ofxparse's accounts
+            (bank statements, then credit card statements) and are empty for
+            a statement without a transaction list.
+        """
+        bank: list[bytes] = []
+        credit_card: list[bytes] = []
+        cuts: list[tuple[int, int]] = []
+
+        for statement in _STATEMENT_RE.finditer(file_content):
+            target = bank if statement.group(1).upper() == b"STMTRS" else credit_card
+            list_match = _TRANSACTION_LIST_RE.search(
+                file_content, statement.start(), statement.end()
+            )
+            start = end = -1
+            if list_match is not None:
+                for entry in _TRANSACTION_RE.finditer(
+                    file_content, list_match.start(1), list_match.end(1)
+                ):
+                    if start < 0:
+                        start = entry.start()
+                    end = entry.end()
+            if start < 0:
+                target.append(b"")
+                continue
+            target.append(file_content[start:end])
+            cuts.append((start, end))
+
+        if not cuts:
+            return file_content, bank + credit_card
+
+        pieces: list[bytes] = []
+        cursor = 0
+        for start, end in cuts:
+            pieces.append(file_content[cursor:start])
+            cursor = end
+        pieces.append(file_content[cursor:])
+        return b"".join(pieces), bank + credit_card
+
+    @staticmethod
+    def _detect_encoding(file_content: bytes) -> str:
+        """Resolve the text encoding declared in the OFX SGML headers.
+
+        Mirrors ofxparse: USASCII uses the CHARSET code page (cp1252 by
+        default), UNICODE/UTF-8 use UTF-8.
+
+        Args:
+            file_content: Raw bytes of QFX file.
+
+        Returns:
+            Python codec name.
+        """
+        headers = {
+            name.decode("ascii").upper(): value.decode("ascii", "replace").upper()
+            for name, value in _HEADER_RE.findall(
+                file_content[: file_content.find(b"<")]
+            )
+        }
+        if headers.get("ENCODING") in ("UNICODE", "UTF-8"):
+            return "utf-8"
+        charset = headers.get("CHARSET", "1252")
+        return "iso-8859-1" if charset == "8859-1" else f"cp{charset}"
+
+    def _iter_transactions(
+        self,
+        transaction_list: bytes,
+        encoding: str,
+        file_name: str,
+    ) -> Iterator[ParsedTransaction]:
+        """Scan STMTTRN entries one by one (linear in file size).
+
+        Applies ofxparse's field rules: FITID, TRNAMT and DTPOSTED are
+        required (entries missing them are skipped), DTPOSTED honours the
+        [offset:TZ] suffix, TRNAMT accepts locale-formatted numbers and
+        "null", and entities such as &amp; are unescaped.
+
+        Args:
+            transaction_list: Raw STMTTRN aggregates.
+            encoding: Text encoding declared by the file.
+            file_name: For logging.
 
-        return Success(value=parsed)
+        Yields:
+            ParsedTransaction for each valid entry, in file order.
+        """
+        for match in _TRANSACTION_RE.finditer(transaction_list):
+            fields: dict[str, str] = {}
+            for tag, value in _ELEMENT_RE.findall(
+                match.group(1).decode(encoding, "replace")
+            ):
+                fields.setdefault(tag.upper(), html.unescape(value).strip())
+
+            fit_id = fields.get("FITID", "")
+            try:
+                if not fit_id:
+                    raise ValueError("Missing FIT id")
+                amount = self._parse_amount(fields["TRNAMT"])
+                posted = OfxParser.parseOfxDateTime(fields["DTPOSTED"])
+            except (KeyError, ValueError, InvalidOperation) as e:
+                logger.warning(
+                    "qfx_transaction_parse_error",
+                    file_name=file_name,
+                    error=str(e),
+                )
+                continue
+
+            if posted is None:
+                logger.warning(
+                    "qfx_transaction_invalid_date",
+                    file_name=file_name,
+                    fit_id=fit_id,
+                )
+                continue
+
+            yield ParsedTransaction(
+                fit_id=fit_id,
+                transaction_type=fields.get("TRNTYPE", "").upper() or "OTHER",
+                date_posted=posted.date(),
+                amount=amount,
+                name=fields.get("NAME", ""),
+                memo=fields.get("MEMO") or None,
+            )
+
+    @staticmethod
+    def _parse_amount(value: str) -> Decimal:
+        """Parse a TRNAMT value the way ofxparse does.
+
+        Args:
+            value: Raw amount text (e.g., "-50.00", "1.025,53", "null").
+
+        Returns:
+            Decimal amount ("null" amounts are zero).
+
+        Raises:
+            InvalidOperation: If the value is not a number.
+        """
+        if value in ("null", "-null"):
+            return Decimal(0)
+        if re.search(r".*\..*,", value):
+            value = value.replace(".", "")
+        if re.search(r".*,.*\.", value):
+            value = value.replace(",", "")
+        if "." not in value and "," in value:
+            value = value.replace(",", ".")
+        return Decimal(value.replace(" ", "").replace("+", ""))
 
     def _parse_transactions(
         self,
@@ -0,0 +1,151 @@
+"""Per-provider concurrency limiter for provider API calls.
+
+Bounds in-flight calls per provider with one ``asyncio.Semaphore`` each,
+sized from the provider registry (``ProviderMetadata.max_concurrent_requests``),
+and pauses a provider after it answers 429 so concurrent account fetches
+stop hammering it until ``Retry-After`` has elapsed.
+
+Lifecycle:
+    App-scoped singleton created lazily by the container
+    (get_provider_concurrency_limiter). Limits apply per worker process.
+
+Reference:
+    - docs/architecture/provider-integration-architecture.md
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.constants import PROVIDER_MAX_CONCURRENT_REQUESTS_DEFAULT
+from src.domain.providers.registry import get_provider_metadata
+
+
+@dataclass
+class _ProviderLimit:
+    """Semaphore and pause deadline for one provider."""
+
+    semaphore: asyncio.Semaphore
+    limit: int
+    resume_at: float = 0.0
+    in_flight: int = 0
+    waiting: int = 0
+    deferrals: int = 0
+
+
+class ProviderConcurrencyLimiter:
+    """Implements ProviderConcurrencyProtocol with per-provider semaphores.
+
+    Attributes:
+        _default_limit: Limit for providers without a registry value.
+        _limits: Per-provider semaphore and pause state.
+        _loop: Event loop the semaphores belong to.
+
+    Example:
+        >>> limiter = ProviderConcurrencyLimiter()
+        >>> async with limiter.slot("schwab"):
+        ...     result = await provider.fetch_transactions(...)
+        >>> limiter.get_stats()["schwab"]["limit"]
+        4
+    """
+
+    def __init__(
+        self, default_limit: int = PROVIDER_MAX_CONCURRENT_REQUESTS_DEFAULT
+    ) -> None:
+        """Initialize limiter (semaphores are created on first use).
+
+        Args:
+            default_limit: In-flight calls allowed for unregistered providers.
+        """
+        self._default_limit = default_limit
+        self._limits: dict[str, _ProviderLimit] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @asynccontextmanager
+    async def slot(self, provider_slug: str) -> AsyncIterator[None]:
+        """Acquire a slot for one provider API call.
+
+        Args:
+            provider_slug: Provider identifier.
+
+        Yields:
+            None while the slot is held.
+        """
+        limit = self._get_limit(provider_slug)
+        loop = asyncio.get_running_loop()
+        limit.waiting += 1
+        try:
+            await limit.semaphore.acquire()
+        finally:
+            limit.waiting -= 1
+        try:
+            # Deadline may move while sleeping (another call got a 429)
+            while (delay := limit.resume_at - loop.time()) > 0:
+                await asyncio.sleep(delay)
+            limit.in_flight += 1
+            try:
+                yield
+            finally:
+                limit.in_flight -= 1
+        finally:
+            limit.semaphore.release()
+
+    def defer(self, provider_slug: str, seconds: float) -> None:
+        """Pause new calls to a provider for ``seconds``.
+
+        Args:
+            provider_slug: Provider identifier.
+            seconds: Pause duration (from the Retry-After header).
+        """
+        limit = self._get_limit(provider_slug)
+        resume_at = asyncio.get_running_loop().time() + seconds
+        limit.resume_at = max(limit.resume_at, resume_at)
+        limit.deferrals += 1
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-provider limiter statistics.
+
+        Returns:
+            Mapping of provider slug to limit, in-flight, waiting, and
+            deferral counters.
+        """
+        return {
+            slug: {
+                "limit": limit.limit,
+                "in_flight": limit.in_flight,
+                "waiting": limit.waiting,
+                "deferrals": limit.deferrals,
+            }
+            for slug, limit in self._limits.items()
+        }
+
+    def _get_limit(self, provider_slug: str) -> _ProviderLimit:
+        """Get (or lazily create) the limit state for a provider.
+
+        Semaphores are bound to the running event loop, so state is reset if
+        the limiter is used from a new loop (e.g., between test runs).
+
+        Args:
+            provider_slug: Provider identifier.
+
+        Returns:
+            Limit state for the provider.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._limits = {}
+
+        limit = self._limits.get(provider_slug)
+        if limit is None:
+            metadata = get_provider_metadata(provider_slug)
+            size = (
+                metadata.max_concurrent_requests
+                if metadata is not None
+                else self._default_limit
+            )
+            limit = _ProviderLimit(semaphore=asyncio.Semaphore(size), limit=size)
+            self._limits[provider_slug] = limit
+        return limit
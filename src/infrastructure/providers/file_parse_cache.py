@@ -0,0 +1,179 @@
+"""Content-addressed LRU cache for parsed provider files.
+
+File import providers (Chase QFX) parse the uploaded bytes once and serve
+accounts and transactions from the parsed result. Re-uploading the same
+file (a common way to retry a failed import) then skips the parse entirely.
+
+Keys are SHA-256 digests of the file content: stable across processes,
+collision-resistant, and independent of the file name. Entries are evicted
+least recently used first once either bound is exceeded:
+
+- max_bytes: Sum of the source file sizes of cached entries. Parsed objects
+  are larger than the file, but grow linearly with it, so the file size is a
+  cheap, deterministic cost estimate.
+- max_entries: Upper bound on the number of cached files.
+
+A file larger than max_bytes is never cached.
+
+Architecture:
+    - Infrastructure-only helper (not a domain port)
+    - App-scoped, shared by every provider instance (see
+      src/core/container/infrastructure.py::get_file_parse_cache)
+    - Not thread-safe: used from the event loop only
+"""
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class FileParseCacheStats:
+    """Snapshot of parse cache usage.
+
+    Attributes:
+        entries: Number of cached files.
+        size_bytes: Sum of the source file sizes of cached entries.
+        hits: Lookups served from the cache.
+        misses: Lookups that required a parse.
+        evictions: Entries dropped to stay within the bounds.
+    """
+
+    entries: int
+    size_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class FileParseCache:
+    """Bounded LRU cache keyed by the SHA-256 digest of file content.
+
+    Attributes:
+        _max_bytes: Budget for the summed source file sizes.
+        _max_entries: Entry bound.
+        _entries: digest -> (size_bytes, value), in LRU order.
+        _size_bytes: Current summed size.
+
+    Example:
+        >>> cache = FileParseCache(max_bytes=64 * 1024 * 1024, max_entries=16)
+        >>> key = cache.key_for(file_content)
+        >>> parsed = cache.get(key)
+        >>> if parsed is None:
+        ...     parsed = parser.parse(file_content)
+        ...     cache.set(key, parsed, size_bytes=len(file_content))
+    """
+
+    def __init__(self, *, max_bytes: int, max_entries: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: Maximum summed source file size of cached entries.
+            max_entries: Maximum number of cached files.
+        """
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[int, Any]] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key_for(file_content: bytes) -> str:
+        """Compute the cache key of a file.
+
+        Args:
+            file_content: Raw file bytes.
+
+        Returns:
+            Hex SHA-256 digest of the content.
+        """
+        return hashlib.sha256(file_content).hexdigest()
+
+    def __len__(self) -> int:
+        """Number of cached files."""
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Summed source file size of cached entries."""
+        return self._size_bytes
+
+    def get(self, key: str) -> Any | None:
+        """Get a cached value and mark it most recently used.
+
+        Args:
+            key: Digest from key_for().
+
+        Returns:
+            Cached value, or None on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: str, value: Any, *, size_bytes: int) -> bool:
+        """Store a value, evicting least recently used entries if needed.
+
+        Args:
+            key: Digest from key_for().
+            value: Parsed result (treated as immutable by callers).
+            size_bytes: Source file size (cost against max_bytes).
+
+        Returns:
+            True if stored, False if the file alone exceeds max_bytes.
+        """
+        self._remove(key)
+        if size_bytes > self._max_bytes:
+            return False
+
+        self._entries[key] = (size_bytes, value)
+        self._size_bytes += size_bytes
+
+        while (
+            self._size_bytes > self._max_bytes or len(self._entries) > self._max_entries
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._evictions += 1
+        return True
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self._size_bytes = 0
+
+    def get_stats(self) -> FileParseCacheStats:
+        """Get a snapshot of cache usage.
+
+        Returns:
+            FileParseCacheStats with sizes and hit/miss/eviction counters.
+        """
+        return FileParseCacheStats(
+            entries=len(self._entries),
+            size_bytes=self._size_bytes,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
+
+    def _remove(self, key: str) -> bool:
+        """Remove an entry and release its size.
+
+        Args:
+            key: Entry key.
+
+        Returns:
+            True if an entry was removed.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._size_bytes -= entry[0]
+        return True
@@ -0,0 +1,234 @@
+"""Pooled HTTP client registry for provider API adapters.
+
+Holds one long-lived ``httpx.AsyncClient`` per provider for the lifetime of
+the application, so provider calls reuse TCP/TLS connections (keep-alive)
+instead of paying a new handshake on every request.
+
+Features:
+    - Per-provider client isolation (one pool per provider host)
+    - Configurable pool limits (max connections, keep-alive, expiry)
+    - Optional HTTP/2 (requires the ``h2`` package, ``httpx[http2]``)
+    - Pool statistics (active/idle connections, connection reuse ratio)
+
+Lifecycle:
+    Created lazily by the container (get_provider_http_clients) and closed in
+    the FastAPI lifespan shutdown via ``aclose()``.
+
+Reference:
+    - docs/architecture/provider-integration.md
+"""
+
+import importlib.util
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+import httpx
+import structlog
+
+from src.core.constants import PROVIDER_TIMEOUT_DEFAULT
+
+logger = structlog.get_logger(__name__)
+
+# httpcore trace event emitted once per newly established TCP connection
+_CONNECT_COMPLETE_EVENT = "connection.connect_tcp.complete"
+
+
+@dataclass
+class ConnectionPoolStats:
+    """Request/connection counters for a provider client.
+
+    Attributes:
+        requests: Number of requests sent through the client.
+        connections_opened: Number of new TCP connections established.
+    """
+
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of requests served on an existing connection (0.0 to 1.0)."""
+        if self.requests == 0:
+            return 0.0
+        reused = max(self.requests - self.connections_opened, 0)
+        return reused / self.requests
+
+
+class ProviderHTTPClientRegistry:
+    """App-lifetime registry of pooled HTTP clients, one per provider.
+
+    Provider adapters obtain their client via ``get_client(provider_name)``
+    and must not close it - the registry owns client lifecycle.
+
+    Attributes:
+        _timeout: Default request timeout in seconds.
+        _limits: httpx connection pool limits applied to every client.
+        _http2: Whether HTTP/2 is negotiated (falls back to HTTP/1.1 if
+            ``h2`` is not installed).
+
+    Example:
+        >>> registry = ProviderHTTPClientRegistry(max_connections=50)
+        >>> client = registry.get_client("schwab")
+        >>> response = await client.get("https://api.schwabapi.com/...")
+        >>> registry.get_stats("schwab")["reuse_ratio"]
+        0.98
+        >>> await registry.aclose()
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = PROVIDER_TIMEOUT_DEFAULT,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+    ) -> None:
+        """Initialize registry with pool configuration.
+
+        Args:
+            timeout: Default request timeout in seconds.
+            max_connections: Maximum concurrent connections per provider.
+            max_keepalive_connections: Maximum idle connections kept per provider.
+            keepalive_expiry: Seconds an idle connection is kept before closing.
+            http2: Enable HTTP/2 negotiation.
+        """
+        self._timeout = timeout
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning(
+                "provider_http2_unavailable",
+                reason="h2 package not installed, falling back to HTTP/1.1",
+            )
+            http2 = False
+        self._http2 = http2
+
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._transports: dict[str, httpx.AsyncHTTPTransport] = {}
+        self._stats: dict[str, ConnectionPoolStats] = {}
+        self._lock = Lock()
+
+    def get_client(self, provider_name: str) -> httpx.AsyncClient:
+        """Get (or lazily create) the pooled client for a provider.
+
+        Args:
+            provider_name: Provider identifier (e.g., "schwab", "alpaca").
+
+        Returns:
+            Shared httpx.AsyncClient for the provider.
+        """
+        with self._lock:
+            client = self._clients.get(provider_name)
+            if client is None or client.is_closed:
+                client = self._create_client(provider_name)
+                self._clients[provider_name] = client
+            return client
+
+    def get_stats(self, provider_name: str) -> dict[str, Any]:
+        """Get pool statistics for a provider.
+
+        Args:
+            provider_name: Provider identifier.
+
+        Returns:
+            Dictionary with active_connections, idle_connections, requests,
+            connections_opened, reuse_ratio.
+        """
+        with self._lock:
+            stats = self._stats.get(provider_name, ConnectionPoolStats())
+            active, idle = self._connection_counts(provider_name)
+            return {
+                "active_connections": active,
+                "idle_connections": idle,
+                "requests": stats.requests,
+                "connections_opened": stats.connections_opened,
+                "reuse_ratio": round(stats.reuse_ratio, 4),
+            }
+
+    def get_all_stats(self) -> dict[str, dict[str, Any]]:
+        """Get pool statistics for every provider with a client.
+
+        Returns:
+            Dictionary mapping provider name to stats dictionary.
+        """
+        with self._lock:
+            providers = list(self._clients)
+        return {provider: self.get_stats(provider) for provider in providers}
+
+    async def aclose(self) -> None:
+        """Close all provider clients and release pooled connections.
+
+        Safe to call multiple times. Clients are recreated on next use.
+        """
+        with self._lock:
+            clients = list(self._clients.items())
+            self._clients.clear()
+            self._transports.clear()
+
+        for provider_name, client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(
+                    "provider_http_client_close_failed",
+                    provider=provider_name,
+                    error=str(e),
+                )
+
+    def _create_client(self, provider_name: str) -> httpx.AsyncClient:
+        """Create a pooled client with request/connection accounting.
+
+        Args:
+            provider_name: Provider identifier.
+
+        Returns:
+            New httpx.AsyncClient.
+        """
+        stats = self._stats.setdefault(provider_name, ConnectionPoolStats())
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            if event_name == _CONNECT_COMPLETE_EVENT:
+                stats.connections_opened += 1
+
+        async def on_request(request: httpx.Request) -> None:
+            stats.requests += 1
+            request.extensions["trace"] = trace
+
+        transport = httpx.AsyncHTTPTransport(limits=self._limits, http2=self._http2)
+        self._transports[provider_name] = transport
+
+        logger.debug(
+            "provider_http_client_created",
+            provider=provider_name,
+            http2=self._http2,
+            max_connections=self._limits.max_connections,
+            max_keepalive_connections=self._limits.max_keepalive_connections,
+        )
+
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=self._timeout,
+            event_hooks={"request": [on_request]},
+        )
+
+    def _connection_counts(self, provider_name: str) -> tuple[int, int]:
+        """Count active and idle connections in a provider's pool.
+
+        Args:
+            provider_name: Provider identifier.
+
+        Returns:
+            Tuple of (active, idle) connection counts. (0, 0) if no pool.
+        """
+        transport = self._transports.get(provider_name)
+        # httpx does not expose the underlying httpcore pool publicly
+        pool = getattr(transport, "_pool", None)
+        connections = getattr(pool, "connections", None) or []
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return len(connections) - idle, idle
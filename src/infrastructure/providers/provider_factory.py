@@ -64,19 +64,28 @@ class ProviderFactory:
         # Lazy import and instantiate (avoid circular imports)
         match slug:
             case "schwab":
+                from src.core.container.infrastructure import get_provider_http_clients
                 from src.infrastructure.providers.schwab import SchwabProvider
 
-                return SchwabProvider(settings=settings)
+                return SchwabProvider(
+                    settings=settings,
+                    http_client=get_provider_http_clients().get_client("schwab"),
+                )
 
             case "alpaca":
+                from src.core.container.infrastructure import get_provider_http_clients
                 from src.infrastructure.providers.alpaca import AlpacaProvider
 
-                return AlpacaProvider(settings=settings)
+                return AlpacaProvider(
+                    settings=settings,
+                    http_client=get_provider_http_clients().get_client("alpaca"),
+                )
 
             case "chase_file":
+                from src.core.container.infrastructure import get_file_parse_cache
                 from src.infrastructure.providers.chase import ChaseFileProvider
 
-                return ChaseFileProvider()
+                return ChaseFileProvider(parse_cache=get_file_parse_cache())
 
             case _:
                 raise ValueError(
@@ -14,6 +14,8 @@ Reference:
 
 from typing import Any
 
+import httpx
+
 from src.core.constants import BEARER_PREFIX, PROVIDER_TIMEOUT_DEFAULT
 from src.core.result import Result
 from src.domain.errors import ProviderError
@@ -26,7 +28,8 @@ class SchwabAccountsAPI(BaseProviderAPIClient):
     Extends BaseProviderAPIClient with Schwab-specific authentication.
     Returns raw JSON responses - mapping to domain types is done by mappers.
 
-    Thread-safe: Uses httpx.AsyncClient per-request (no shared state).
+    Connection reuse: Uses the injected pooled httpx.AsyncClient when
+    provided, otherwise opens a client per request.
 
     Example:
         >>> api = SchwabAccountsAPI(
@@ -46,17 +49,20 @@ class SchwabAccountsAPI(BaseProviderAPIClient):
         *,
         base_url: str,
         timeout: float = PROVIDER_TIMEOUT_DEFAULT,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize Schwab Accounts API client.
 
         Args:
             base_url: Schwab Trader API base URL (e.g., "https://api.schwabapi.com/trader/v1").
             timeout: HTTP request timeout in seconds.
+            http_client: Optional shared pooled client (see ProviderHTTPClientRegistry).
         """
         super().__init__(
             base_url=base_url,
             provider_name="schwab",
             timeout=timeout,
+            http_client=http_client,
         )
 
     async def get_accounts(
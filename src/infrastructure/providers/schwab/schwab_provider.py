@@ -99,6 +99,7 @@ class SchwabProvider:
         cache_keys: CacheKeys | None = None,
         cache_metrics: CacheMetrics | None = None,
         timeout: float = 30.0,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize Schwab provider.
 
@@ -108,6 +109,8 @@ class SchwabProvider:
             cache_keys: Optional cache key utility.
             cache_metrics: Optional metrics tracker.
             timeout: HTTP request timeout in seconds.
+            http_client: Optional shared pooled client used for OAuth token
+                requests and Trader API calls. Owned by the caller.
 
         Raises:
             ValueError: If required Schwab settings are not configured.
@@ -120,7 +123,9 @@ class SchwabProvider:
             raise ValueError("schwab_redirect_uri is required in settings")
 
         self._settings = settings
+        self._redirect_uri = settings.schwab_redirect_uri
         self._timeout = timeout
+        self._http_client = http_client
         self._cache = cache
         self._cache_keys = cache_keys
         self._cache_metrics = cache_metrics
@@ -130,10 +135,12 @@ class SchwabProvider:
         self._accounts_api = SchwabAccountsAPI(
             base_url=self._trader_api_base,
             timeout=timeout,
+            http_client=http_client,
         )
         self._transactions_api = SchwabTransactionsAPI(
             base_url=self._trader_api_base,
             timeout=timeout,
+            http_client=http_client,
         )
         self._account_mapper = SchwabAccountMapper()
         self._holding_mapper = SchwabHoldingMapper()
@@ -168,6 +175,38 @@ class SchwabProvider:
         encoded = base64.b64encode(credentials.encode()).decode()
         return f"Basic {encoded}"
 
+    async def _post_token_request(self, data: dict[str, str]) -> httpx.Response:
+        """POST a form request to the OAuth token endpoint.
+
+        Uses the shared pooled client when configured so token exchange and
+        refresh reuse the keep-alive connection to Schwab.
+
+        Args:
+            data: Form fields (grant_type and grant-specific parameters).
+
+        Returns:
+            Raw HTTP response from the token endpoint.
+
+        Raises:
+            httpx.TimeoutException: If the request times out.
+            httpx.RequestError: If the connection fails.
+        """
+        headers = {
+            "Authorization": self._get_basic_auth_header(),
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+
+        if self._http_client is not None:
+            return await self._http_client.post(
+                self._token_url,
+                headers=headers,
+                data=data,
+                timeout=self._timeout,
+            )
+
+        async with httpx.AsyncClient(timeout=self._timeout) as client:
+            return await client.post(self._token_url, headers=headers, data=data)
+
     async def exchange_code_for_tokens(
         self,
         authorization_code: str,
@@ -190,19 +229,13 @@ class SchwabProvider:
         )
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.post(
-                    self._token_url,
-                    headers={
-                        "Authorization": self._get_basic_auth_header(),
-                        "Content-Type": "application/x-www-form-urlencoded",
-                    },
-                    data={
-                        "grant_type": "authorization_code",
-                        "code": authorization_code,
-                        "redirect_uri": self._settings.schwab_redirect_uri,
-                    },
-                )
+            response = await self._post_token_request(
+                {
+                    "grant_type": "authorization_code",
+                    "code": authorization_code,
+                    "redirect_uri": self._redirect_uri,
+                }
+            )
 
             return self._handle_token_response(response, "exchange")
 
@@ -257,18 +290,12 @@ class SchwabProvider:
         )
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.post(
-                    self._token_url,
-                    headers={
-                        "Authorization": self._get_basic_auth_header(),
-                        "Content-Type": "application/x-www-form-urlencoded",
-                    },
-                    data={
-                        "grant_type": "refresh_token",
-                        "refresh_token": refresh_token,
-                    },
-                )
+            response = await self._post_token_request(
+                {
+                    "grant_type": "refresh_token",
+                    "refresh_token": refresh_token,
+                }
+            )
 
             return self._handle_token_response(response, "refresh")
 
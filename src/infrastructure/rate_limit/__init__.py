@@ -8,18 +8,31 @@ Exports:
     RedisStorage: Redis-backed token bucket storage with atomic Lua scripts.
     TokenBucketAdapter: Token bucket adapter implementing RateLimitProtocol.
     RATE_LIMIT_RULES: Endpoint to rate limit rule mapping (SSOT).
+    RATE_LIMIT_ROUTE_RULES: Endpoint to rule layers mapping (checked together).
+    RATE_LIMIT_INDEX: Compiled path-template index over the rule layers.
+    RateLimitRuleIndex: Path-template index type (CompiledRateLimitRoute results).
     get_rule_for_endpoint: Helper to lookup rules with path parameter support.
 """
 
 from src.infrastructure.rate_limit.config import (
+    RATE_LIMIT_INDEX,
+    RATE_LIMIT_ROUTE_RULES,
     RATE_LIMIT_RULES,
     get_rule_for_endpoint,
 )
 from src.infrastructure.rate_limit.redis_storage import RedisStorage
+from src.infrastructure.rate_limit.rule_index import (
+    CompiledRateLimitRoute,
+    RateLimitRuleIndex,
+)
 from src.infrastructure.rate_limit.token_bucket_adapter import TokenBucketAdapter
 
 __all__ = [
+    "RATE_LIMIT_INDEX",
+    "RATE_LIMIT_ROUTE_RULES",
     "RATE_LIMIT_RULES",
+    "CompiledRateLimitRoute",
+    "RateLimitRuleIndex",
     "RedisStorage",
     "TokenBucketAdapter",
     "get_rule_for_endpoint",
@@ -60,9 +60,16 @@ Reference:
 
 # Import registry-generated rules
 from src.infrastructure.rate_limit.from_registry import (
+    RATE_LIMIT_INDEX,
+    RATE_LIMIT_ROUTE_RULES,
     RATE_LIMIT_RULES,
     get_rule_for_endpoint,
 )
 
 # Re-export for backward compatibility
-__all__ = ["RATE_LIMIT_RULES", "get_rule_for_endpoint"]
+__all__ = [
+    "RATE_LIMIT_INDEX",
+    "RATE_LIMIT_ROUTE_RULES",
+    "RATE_LIMIT_RULES",
+    "get_rule_for_endpoint",
+]
@@ -23,6 +23,8 @@ To Modify Rate Limits:
 
 Exports:
     RATE_LIMIT_RULES: Dict mapping endpoints to rate limit rules (auto-generated)
+    RATE_LIMIT_ROUTE_RULES: Dict mapping endpoints to every rule layer checked
+    RATE_LIMIT_INDEX: Compiled path-template index used by the middleware
     get_rule_for_endpoint: Lookup function with path parameter matching
 
 Usage:
@@ -37,7 +39,9 @@ Reference:
 """
 
 from src.domain.value_objects.rate_limit_rule import RateLimitRule
+from src.infrastructure.rate_limit.rule_index import RateLimitRuleIndex
 from src.presentation.routers.api.v1.routes.derivations import (
+    build_rate_limit_route_rules,
     build_rate_limit_rules,
 )
 from src.presentation.routers.api.v1.routes.registry import ROUTE_REGISTRY
@@ -62,6 +66,21 @@ To modify rate limits:
 DO NOT modify this dict directly - it will be regenerated on next import.
 """
 
+RATE_LIMIT_ROUTE_RULES: dict[str, tuple[RateLimitRule, ...]] = (
+    build_rate_limit_route_rules(ROUTE_REGISTRY)
+)
+"""Endpoint to rule layers mapping (policy rule first, then GLOBAL brake).
+
+All enabled layers of an endpoint are checked in a single atomic operation.
+"""
+
+RATE_LIMIT_INDEX: RateLimitRuleIndex = RateLimitRuleIndex(RATE_LIMIT_ROUTE_RULES)
+"""Compiled path-template index over RATE_LIMIT_ROUTE_RULES.
+
+Built once at import time; resolves "METHOD /concrete/path" to the route
+template and its enabled rules without scanning every template.
+"""
+
 
 # =============================================================================
 # Lookup Functions
@@ -84,53 +103,9 @@ def get_rule_for_endpoint(endpoint: str) -> RateLimitRule | None:
         >>> rule.max_tokens
         100
     """
-    # Try exact match first
-    if endpoint in RATE_LIMIT_RULES:
-        return RATE_LIMIT_RULES[endpoint]
-
-    # Try pattern matching for path parameters
     method, _, path = endpoint.partition(" ")
     if not path:
         return None
 
-    for pattern, rule in RATE_LIMIT_RULES.items():
-        pattern_method, _, pattern_path = pattern.partition(" ")
-        if method != pattern_method:
-            continue
-
-        # Check if paths match (handling {param} placeholders)
-        if _paths_match(path, pattern_path):
-            return rule
-
-    return None
-
-
-def _paths_match(actual: str, pattern: str) -> bool:
-    """Check if actual path matches pattern with placeholders.
-
-    Args:
-        actual: Actual request path (e.g., "/api/v1/accounts/123").
-        pattern: Pattern path (e.g., "/api/v1/accounts/{account_id}").
-
-    Returns:
-        True if paths match, False otherwise.
-
-    Example:
-        >>> _paths_match("/api/v1/accounts/123", "/api/v1/accounts/{id}")
-        True
-        >>> _paths_match("/api/v1/accounts", "/api/v1/accounts/{id}")
-        False
-    """
-    actual_parts = actual.strip("/").split("/")
-    pattern_parts = pattern.strip("/").split("/")
-
-    if len(actual_parts) != len(pattern_parts):
-        return False
-
-    for actual_part, pattern_part in zip(actual_parts, pattern_parts, strict=True):
-        if pattern_part.startswith("{") and pattern_part.endswith("}"):
-            continue  # Placeholder matches anything
-        if actual_part != pattern_part:
-            return False
-
-    return True
+    route = RATE_LIMIT_INDEX.match(method, path)
+    return RATE_LIMIT_RULES[route.endpoint] if route is not None else None
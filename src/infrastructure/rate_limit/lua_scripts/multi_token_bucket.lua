@@ -0,0 +1,84 @@
+-- multi_token_bucket.lua
+-- Atomic all-or-nothing check of several token buckets (one per rule scope)
+--
+-- KEYS[i]: Base key for bucket i (e.g., "rate_limit:user:{id}:GET /api/v1/accounts")
+-- ARGV[1]: now (current timestamp in seconds since epoch, float)
+-- ARGV[2 + (i-1)*3]: max_tokens for bucket i (integer)
+-- ARGV[3 + (i-1)*3]: refill_rate for bucket i (tokens per minute, float)
+-- ARGV[4 + (i-1)*3]: cost for bucket i (integer)
+--
+-- Returns array: { allowed (0/1), retry_after_1, remaining_1, ..., retry_after_n, remaining_n }
+--   retry_after is returned as a string (Redis truncates Lua numbers to integers)
+-- Notes:
+--   - Tokens are consumed from every bucket only if every bucket has enough;
+--     a denial consumes nothing (refill progress is still persisted)
+--   - retry_after is non-zero only for the buckets that caused the denial
+--   - All keys must hash to the same slot when running against Redis Cluster
+--   - Fail-open policy must be enforced by caller on Redis errors
+
+local now = tonumber(ARGV[1])
+local count = #KEYS
+
+local current = {}
+local allowed = 1
+
+-- Phase 1: refill every bucket and decide
+for i = 1, count do
+  local offset = 1 + (i - 1) * 3
+  local max_tokens = tonumber(ARGV[offset + 1])
+  local refill_rate = tonumber(ARGV[offset + 2])
+  local cost = tonumber(ARGV[offset + 3])
+
+  local tokens = tonumber(redis.call("GET", KEYS[i] .. ":tokens"))
+  local last_refill = tonumber(redis.call("GET", KEYS[i] .. ":time"))
+
+  -- Initialize if first request
+  if not tokens or not last_refill then
+    tokens = max_tokens
+    last_refill = now
+  end
+
+  -- Guard against clock skew: treat negative elapsed as zero
+  local elapsed = now - last_refill
+  if elapsed < 0 then
+    elapsed = 0
+  end
+
+  local level = tokens + elapsed * (refill_rate / 60.0)
+  if level > max_tokens then
+    level = max_tokens
+  end
+
+  current[i] = level
+  if level < cost then
+    allowed = 0
+  end
+end
+
+-- Phase 2: consume (only if allowed) and persist state
+local result = { allowed }
+for i = 1, count do
+  local offset = 1 + (i - 1) * 3
+  local max_tokens = tonumber(ARGV[offset + 1])
+  local refill_rate = tonumber(ARGV[offset + 2])
+  local cost = tonumber(ARGV[offset + 3])
+
+  -- TTL: time to full refill + 60s buffer
+  local ttl = math.ceil((max_tokens / refill_rate) * 60) + 60
+
+  local level = current[i]
+  local retry_after = 0.0
+  if allowed == 1 then
+    level = level - cost
+  elseif level < cost then
+    retry_after = (cost - level) / (refill_rate / 60.0)
+  end
+
+  redis.call("SETEX", KEYS[i] .. ":tokens", ttl, level)
+  redis.call("SETEX", KEYS[i] .. ":time", ttl, now)
+
+  result[#result + 1] = tostring(retry_after)
+  result[#result + 1] = math.floor(level)
+end
+
+return result
@@ -15,6 +15,7 @@ Note:
 """
 
 import asyncio
+from collections.abc import Sequence
 from dataclasses import dataclass
 from functools import partial
 from pathlib import Path
@@ -32,13 +33,15 @@ class _LuaRefs:
     """Holds compiled Lua script SHA references."""
 
     token_bucket_sha: str | None = None
+    multi_token_bucket_sha: str | None = None
 
 
 class RedisStorage:
     """Redis storage for rate limiting with atomic Lua script.
 
-    This class loads the token bucket Lua script once and executes it via
-    EVALSHA for atomic check/consume operations.
+    This class loads the token bucket Lua scripts once and executes them via
+    EVALSHA for atomic check/consume operations. Routes limited by several
+    scopes are checked with the multi-bucket script in a single round trip.
 
     Args:
         redis_client: An async Redis client (redis.asyncio.Redis compatible).
@@ -101,6 +104,53 @@ class RedisStorage:
         except Exception:  # Fail-open
             return Success(value=(True, 0.0, rule.max_tokens))
 
+    async def check_and_consume_many(
+        self,
+        *,
+        buckets: Sequence[tuple[str, RateLimitRule, int]],
+        now_ts: float | None = None,
+    ) -> Result[tuple[bool, list[tuple[float, int]]], RateLimitError]:
+        """Atomically check several buckets and consume from all or none.
+
+        One EVALSHA covers every bucket, so a route limited by IP, user and
+        provider scopes costs a single round trip.
+
+        Args:
+            buckets: (key_base, rule, cost) per bucket, in rule order.
+            now_ts: Override current timestamp in seconds (for testing). Defaults to time().
+
+        Returns:
+            Result with tuple: (allowed, [(retry_after_seconds, remaining_tokens), ...])
+            with one state per bucket, in input order.
+
+        Fail-open:
+            On Redis errors, returns Success(True, [(0.0, rule.max_tokens), ...]).
+        """
+        try:
+            sha = await self._ensure_multi_token_bucket_script()
+            now = now_ts if now_ts is not None else time()
+            args: list[int | float] = [float(now)]
+            for _, rule, cost in buckets:
+                args.extend(
+                    (int(rule.max_tokens), float(rule.refill_rate), int(max(0, cost)))
+                )
+            resp = await self.redis.evalsha(
+                sha,
+                len(buckets),
+                *(key_base for key_base, _, _ in buckets),
+                *args,
+            )
+            # Expect resp: [allowed(0/1), retry_after_1, remaining_1, ...]
+            states = [
+                (float(resp[1 + index * 2]), int(resp[2 + index * 2]))
+                for index in range(len(buckets))
+            ]
+            return Success(value=(bool(resp[0]), states))
+        except Exception:  # Fail-open
+            return Success(
+                value=(True, [(0.0, rule.max_tokens) for _, rule, _ in buckets])
+            )
+
     async def get_remaining(
         self,
         *,
@@ -172,6 +222,22 @@ class RedisStorage:
             self._lua.token_bucket_sha = sha
             return sha
 
+    async def _ensure_multi_token_bucket_script(self) -> str:
+        """Load multi-bucket Lua script into Redis and cache the SHA.
+
+        Returns:
+            str: Script SHA.
+        """
+        if self._lua.multi_token_bucket_sha:
+            return self._lua.multi_token_bucket_sha
+        async with self._script_lock:
+            if self._lua.multi_token_bucket_sha:
+                return self._lua.multi_token_bucket_sha
+            script = await _read_lua_script("lua_scripts/multi_token_bucket.lua")
+            sha: str = await self.redis.script_load(script)
+            self._lua.multi_token_bucket_sha = sha
+            return sha
+
 
 def _read_lua_script_sync(path: Path) -> str:
     """Synchronous helper to read Lua script (called via run_in_executor)."""
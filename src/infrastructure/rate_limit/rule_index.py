@@ -0,0 +1,119 @@
+"""Compiled path-template index for rate limit rule lookup.
+
+RATE_LIMIT_RULES is keyed by route template ("GET /api/v1/accounts/{account_id}").
+Resolving a concrete request path against it used to scan every template and
+re-split both paths on each request. This module compiles the templates once
+at startup into:
+
+- An exact-match dict for templates without path parameters (fast path)
+- Per (method, segment count) buckets of pre-split templates, most specific
+  (most literal segments) first, which also match trailing-slash variants
+
+so a lookup is one dict probe plus a short scan of same-shaped templates.
+
+Usage:
+    from src.infrastructure.rate_limit.from_registry import RATE_LIMIT_INDEX
+
+    route = RATE_LIMIT_INDEX.match("GET", "/api/v1/accounts/abc-123")
+    route.endpoint  # "GET /api/v1/accounts/{account_id}"
+    route.rules     # Enabled rules, checked together in one EVALSHA
+"""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+from src.domain.enums import RateLimitScope
+from src.domain.value_objects.rate_limit_rule import RateLimitRule
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRateLimitRoute:
+    """Rate limit configuration resolved for one route template.
+
+    Attributes:
+        endpoint: Route template key (e.g., "GET /api/v1/accounts/{account_id}").
+            Used as the bucket key so all requests to a route share buckets.
+        rules: Enabled rules for the route (policy rule first). Empty when
+            every rule is disabled.
+        scopes: Distinct scopes of the enabled rules (identifiers to extract).
+    """
+
+    endpoint: str
+    rules: tuple[RateLimitRule, ...]
+    scopes: tuple[RateLimitScope, ...]
+
+
+class RateLimitRuleIndex:
+    """Precompiled endpoint template → rules index.
+
+    Built once from the registry-generated rules; immutable afterwards, so
+    it is safe to share across requests without locking.
+
+    Args:
+        route_rules: Mapping of endpoint template to the rules applying to it.
+    """
+
+    def __init__(self, route_rules: Mapping[str, Sequence[RateLimitRule]]) -> None:
+        self._exact: dict[str, CompiledRateLimitRoute] = {}
+        self._templates: dict[
+            tuple[str, int],
+            list[tuple[tuple[str | None, ...], CompiledRateLimitRoute]],
+        ] = {}
+
+        for endpoint, rules in route_rules.items():
+            method, _, path = endpoint.partition(" ")
+            route = _compile_route(endpoint, rules)
+            segments = tuple(
+                None if part.startswith("{") and part.endswith("}") else part
+                for part in _split(path)
+            )
+            if None not in segments:
+                self._exact[endpoint] = route
+            self._templates.setdefault((method, len(segments)), []).append(
+                (segments, route)
+            )
+
+        # Most specific template wins (e.g., /providers/callback before /providers/{id})
+        for candidates in self._templates.values():
+            candidates.sort(key=lambda item: -sum(part is not None for part in item[0]))
+
+    def __len__(self) -> int:
+        """Number of indexed route templates."""
+        return sum(len(candidates) for candidates in self._templates.values())
+
+    def match(self, method: str, path: str) -> CompiledRateLimitRoute | None:
+        """Resolve a concrete request to its route template and rules.
+
+        Args:
+            method: HTTP method (e.g., "GET").
+            path: Request path (e.g., "/api/v1/accounts/abc-123").
+
+        Returns:
+            CompiledRateLimitRoute if a template matches, None otherwise.
+        """
+        route = self._exact.get(f"{method} {path}")
+        if route is not None:
+            return route
+
+        parts = _split(path)
+        for segments, candidate in self._templates.get((method, len(parts)), ()):
+            for expected, actual in zip(segments, parts, strict=True):
+                if expected is not None and expected != actual:
+                    break
+            else:
+                return candidate
+        return None
+
+
+def _compile_route(
+    endpoint: str, rules: Sequence[RateLimitRule]
+) -> CompiledRateLimitRoute:
+    """Drop disabled rules and collect the scopes to extract identifiers for."""
+    enabled = tuple(rule for rule in rules if rule.enabled)
+    scopes = tuple(dict.fromkeys(rule.scope for rule in enabled))
+    return CompiledRateLimitRoute(endpoint=endpoint, rules=enabled, scopes=scopes)
+
+
+def _split(path: str) -> list[str]:
+    """Split a path into segments (leading/trailing slashes ignored)."""
+    return path.strip("/").split("/")
@@ -3,7 +3,8 @@
 This adapter integrates RedisStorage with the domain protocol, providing:
 - Key construction based on scope (IP, USER, USER_PROVIDER, GLOBAL)
 - Rule lookup from centralized configuration
-- Domain event publishing (Attempted, Succeeded, Failed)
+- Multi-scope route checks in one atomic storage call
+- Domain event publishing (Attempted, Succeeded, Failed), sampled
 - Structured logging
 - Fail-open semantics at all layers
 
@@ -21,6 +22,8 @@ Usage:
     )
 """
 
+import random
+from collections.abc import Mapping
 from time import perf_counter
 from typing import TYPE_CHECKING
 from uuid_extensions import uuid7
@@ -54,11 +57,21 @@ class TokenBucketAdapter:
         All public methods return Success with allowed=True if any error occurs.
         Rate limit failures should NEVER cause denial-of-service.
 
+    Event Sampling:
+        Attempted/Allowed events are published for a random fraction
+        (event_sample_rate) of checks; every check of a sampled request
+        publishes both, so the pair stays consistent. Denied events are
+        always published (security-relevant).
+
     Args:
         storage: RedisStorage instance for atomic token bucket operations.
         rules: Mapping of endpoint to RateLimitRule configuration.
         event_bus: EventBus for domain event publishing.
         logger: Structured logger for observability.
+        route_rules: Mapping of endpoint to every rule layer checked by
+            check_route(). Defaults to the single rule from ``rules``.
+        event_sample_rate: Fraction (0.0-1.0) of allowed checks that publish
+            Attempted/Allowed events. Default 1.0 (every check).
     """
 
     def __init__(
@@ -68,11 +81,19 @@ class TokenBucketAdapter:
         rules: dict[str, RateLimitRule],
         event_bus: EventBusProtocol,
         logger: LoggerProtocol,
+        route_rules: Mapping[str, tuple[RateLimitRule, ...]] | None = None,
+        event_sample_rate: float = 1.0,
     ) -> None:
         self._storage = storage
         self._rules = rules
+        self._route_rules: Mapping[str, tuple[RateLimitRule, ...]] = (
+            route_rules
+            if route_rules is not None
+            else {endpoint: (rule,) for endpoint, rule in rules.items()}
+        )
         self._event_bus = event_bus
         self._logger = logger
+        self._event_sample_rate = event_sample_rate
 
     # -------------------------------------------------------------------------
     # RateLimitProtocol implementation
@@ -139,13 +160,15 @@ class TokenBucketAdapter:
             endpoint=endpoint, identifier=identifier, scope=rule.scope
         )
 
-        # Publish ATTEMPTED event
-        await self._publish_attempted(
-            endpoint=endpoint,
-            identifier=identifier,
-            scope=rule.scope,
-            cost=cost,
-        )
+        # Publish ATTEMPTED event (sampled)
+        sampled = self._should_sample()
+        if sampled:
+            await self._publish_attempted(
+                endpoint=endpoint,
+                identifier=identifier,
+                scope=rule.scope,
+                cost=cost,
+            )
 
         # Check and consume tokens
         effective_cost = cost if cost > 0 else rule.cost
@@ -168,13 +191,14 @@ class TokenBucketAdapter:
                 )
 
                 if allowed:
-                    await self._publish_allowed(
-                        endpoint=endpoint,
-                        identifier=identifier,
-                        scope=rule.scope,
-                        remaining_tokens=remaining,
-                        execution_time_ms=elapsed_ms,
-                    )
+                    if sampled:
+                        await self._publish_allowed(
+                            endpoint=endpoint,
+                            identifier=identifier,
+                            scope=rule.scope,
+                            remaining_tokens=remaining,
+                            execution_time_ms=elapsed_ms,
+                        )
                 else:
                     await self._publish_denied(
                         endpoint=endpoint,
@@ -203,6 +227,130 @@ class TokenBucketAdapter:
                     )
                 )
 
+    async def check_route(
+        self,
+        *,
+        endpoint: str,
+        identifiers: Mapping[RateLimitScope, str],
+    ) -> Result[RateLimitResult, RateLimitError]:
+        """Check every enabled rule of a route in one atomic operation.
+
+        Tokens are consumed from all buckets or none. The result (and rate
+        limit headers) reflects the binding bucket: the one with the longest
+        retry_after when denied, the one with the fewest remaining tokens
+        when allowed.
+
+        Args:
+            endpoint: Route template key (e.g., "GET /api/v1/accounts/{account_id}").
+            identifiers: Identifier per rule scope (IP address, user ID, etc.).
+
+        Returns:
+            Result[RateLimitResult, RateLimitError]:
+                - Success(RateLimitResult) with rate limit decision
+                - Failure only for severe errors (should be rare)
+
+        Fail-Open:
+            On any error, returns Success(RateLimitResult(allowed=True, ...)).
+        """
+        start_time = perf_counter()
+
+        rules = tuple(
+            rule for rule in self._route_rules.get(endpoint, ()) if rule.enabled
+        )
+        if not rules:
+            return Success(
+                value=RateLimitResult(
+                    allowed=True,
+                    retry_after=0.0,
+                    remaining=0,
+                    limit=0,
+                    reset_seconds=0,
+                )
+            )
+
+        buckets = [
+            (
+                self._build_key(
+                    endpoint=endpoint,
+                    identifier=identifiers.get(rule.scope, "unknown"),
+                    scope=rule.scope,
+                ),
+                rule,
+                rule.cost,
+            )
+            for rule in rules
+        ]
+
+        sampled = self._should_sample()
+        if sampled:
+            for rule in rules:
+                await self._publish_attempted(
+                    endpoint=endpoint,
+                    identifier=identifiers.get(rule.scope, "unknown"),
+                    scope=rule.scope,
+                    cost=rule.cost,
+                )
+
+        result = await self._storage.check_and_consume_many(buckets=buckets)
+
+        elapsed_ms = (perf_counter() - start_time) * 1000
+
+        match result:
+            case Success(value=(allowed, states)):
+                if allowed:
+                    # Binding bucket: fewest remaining tokens
+                    index = min(range(len(rules)), key=lambda i: states[i][1])
+                else:
+                    # Binding bucket: longest wait
+                    index = max(range(len(rules)), key=lambda i: states[i][0])
+                binding = rules[index]
+                binding_retry_after, binding_remaining = states[index]
+
+                for rule, (retry_after, remaining) in zip(rules, states, strict=True):
+                    identifier = identifiers.get(rule.scope, "unknown")
+                    if allowed and sampled:
+                        await self._publish_allowed(
+                            endpoint=endpoint,
+                            identifier=identifier,
+                            scope=rule.scope,
+                            remaining_tokens=remaining,
+                            execution_time_ms=elapsed_ms,
+                        )
+                    elif not allowed and retry_after > 0:
+                        await self._publish_denied(
+                            endpoint=endpoint,
+                            identifier=identifier,
+                            scope=rule.scope,
+                            retry_after=retry_after,
+                            execution_time_ms=elapsed_ms,
+                        )
+
+                return Success(
+                    value=RateLimitResult(
+                        allowed=allowed,
+                        retry_after=binding_retry_after,
+                        remaining=binding_remaining,
+                        limit=binding.max_tokens,
+                        reset_seconds=binding.ttl_seconds,
+                    )
+                )
+
+            case _:
+                # Fail-open on any unexpected result
+                self._logger.warning(
+                    "Rate limit storage error - allowing request",
+                    endpoint=endpoint,
+                )
+                return Success(
+                    value=RateLimitResult(
+                        allowed=True,
+                        retry_after=0.0,
+                        remaining=rules[0].max_tokens,
+                        limit=rules[0].max_tokens,
+                        reset_seconds=rules[0].ttl_seconds,
+                    )
+                )
+
     async def get_remaining(
         self,
         *,
@@ -304,6 +452,12 @@ class TokenBucketAdapter:
             case RateLimitScope.GLOBAL:
                 return f"rate_limit:global:{endpoint}"
 
+    def _should_sample(self) -> bool:
+        """Decide whether this check publishes Attempted/Allowed events."""
+        if self._event_sample_rate >= 1.0:
+            return True
+        return random.random() < self._event_sample_rate
+
     async def _publish_attempted(
         self,
         *,
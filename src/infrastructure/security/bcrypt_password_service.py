@@ -18,12 +18,68 @@ Performance:
     - Verify: ~250ms (same as hash)
     - Cost factor 12 = 2^12 = 4096 iterations
 
+Concurrency:
+    - hash_password_async/verify_password_async run bcrypt in a bounded
+      thread pool (bcrypt releases the GIL), so the event loop keeps serving
+      other requests during a login burst
+    - Pool size is the concurrency limit; excess calls wait in the pool queue
+    - Queue depth and wait time are exposed via get_stats()
+
 Reference:
     - docs/architecture/authentication-architecture.md (Lines 853-875)
 """
 
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, TypeVar
+
 import bcrypt
 
+T = TypeVar("T")
+
+
+@dataclass
+class PasswordHashingStats:
+    """Worker pool statistics for async password hashing.
+
+    Attributes:
+        max_workers: Concurrency limit (pool size).
+        queued: Calls waiting for a free worker.
+        active: Calls currently running bcrypt.
+        completed: Calls finished (success or failure).
+        max_queue_depth: Highest observed number of waiting calls.
+        total_wait_seconds: Cumulative time calls spent waiting for a worker.
+    """
+
+    max_workers: int
+    queued: int = 0
+    active: int = 0
+    completed: int = 0
+    max_queue_depth: int = 0
+    total_wait_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to dictionary.
+
+        Returns:
+            Dictionary with pool counters and average queue wait in ms.
+        """
+        avg_wait_ms = (
+            self.total_wait_seconds / self.completed * 1000 if self.completed else 0.0
+        )
+        return {
+            "max_workers": self.max_workers,
+            "queued": self.queued,
+            "active": self.active,
+            "completed": self.completed,
+            "max_queue_depth": self.max_queue_depth,
+            "avg_wait_ms": round(avg_wait_ms, 2),
+        }
+
 
 class BcryptPasswordService:
     """Bcrypt password hashing service.
@@ -38,14 +94,16 @@ class BcryptPasswordService:
 
         password_service: PasswordHashingProtocol = get_password_service()
 
-        # Hash password
-        password_hash = password_service.hash_password("SecurePass123!")
+        # Hash password (async handlers - off the event loop)
+        password_hash = await password_service.hash_password_async("SecurePass123!")
 
         # Verify password
-        is_valid = password_service.verify_password("SecurePass123!", password_hash)
+        is_valid = await password_service.verify_password_async(
+            "SecurePass123!", password_hash
+        )
     """
 
-    def __init__(self, cost_factor: int = 12) -> None:
+    def __init__(self, cost_factor: int = 12, max_workers: int = 4) -> None:
         """Initialize bcrypt password service.
 
         Args:
@@ -53,6 +111,8 @@ class BcryptPasswordService:
                 Higher values = more secure but slower.
                 12 = ~250ms per hash (recommended for 2024).
                 Increase over time as hardware improves.
+            max_workers: Worker threads for async hashing (default: 4).
+                Caps concurrent bcrypt operations; roughly one per CPU core.
 
         Note:
             Cost factor is logarithmic: each +1 doubles computation time.
@@ -68,8 +128,15 @@ class BcryptPasswordService:
         if cost_factor > 20:
             msg = "Cost factor above 20 is impractically slow"
             raise ValueError(msg)
+        if max_workers < 1:
+            msg = "max_workers must be at least 1"
+            raise ValueError(msg)
 
         self._cost_factor = cost_factor
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._stats = PasswordHashingStats(max_workers=max_workers)
+        self._lock = Lock()
 
     def hash_password(self, password: str) -> str:
         """Hash a plaintext password using bcrypt.
@@ -140,3 +207,85 @@ class BcryptPasswordService:
             # Invalid hash format or encoding error
             # Return False instead of raising (fail securely)
             return False
+
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a plaintext password in the worker pool.
+
+        Same result as hash_password() without blocking the event loop.
+
+        Args:
+            password: Plaintext password to hash.
+
+        Returns:
+            Hashed password string (bcrypt format: $2b$12$...).
+        """
+        return await self._run_in_pool(self.hash_password, password)
+
+    async def verify_password_async(self, password: str, password_hash: str) -> bool:
+        """Verify a plaintext password against a bcrypt hash in the worker pool.
+
+        Same result as verify_password() without blocking the event loop.
+
+        Args:
+            password: Plaintext password to verify.
+            password_hash: Hashed password from database.
+
+        Returns:
+            True if password matches hash, False otherwise.
+        """
+        return await self._run_in_pool(self.verify_password, password, password_hash)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get worker pool statistics.
+
+        Returns:
+            Dictionary with max_workers, queued, active, completed,
+            max_queue_depth, avg_wait_ms.
+        """
+        with self._lock:
+            return self._stats.to_dict()
+
+    async def _run_in_pool(self, func: Callable[..., T], *args: Any) -> T:
+        """Submit a bcrypt call to the pool and await its result.
+
+        Args:
+            func: Synchronous bcrypt operation.
+            *args: Arguments for func.
+
+        Returns:
+            Result of func.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="password-hash",
+                )
+            self._stats.queued += 1
+            self._stats.max_queue_depth = max(
+                self._stats.max_queue_depth, self._stats.queued
+            )
+            executor = self._executor
+
+        future = executor.submit(self._run_tracked, func, time.perf_counter(), *args)
+        future.add_done_callback(self._on_cancelled)
+        return await asyncio.wrap_future(future)
+
+    def _run_tracked(self, func: Callable[..., T], enqueued_at: float, *args: Any) -> T:
+        """Run func on a worker thread, updating queue/active counters."""
+        with self._lock:
+            self._stats.queued -= 1
+            self._stats.active += 1
+            self._stats.total_wait_seconds += time.perf_counter() - enqueued_at
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._stats.active -= 1
+                self._stats.completed += 1
+
+    def _on_cancelled(self, future: Future[Any]) -> None:
+        """Release the queue slot of a call cancelled before it started."""
+        if future.cancelled():
+            with self._lock:
+                self._stats.queued -= 1
@@ -7,107 +7,159 @@ Architecture:
     - Used by application handlers directly
     - Tokens stored hashed in database (via repository)
 
-Token Strategy:
+Token Strategy (selector/verifier):
     - Opaque tokens (NOT JWT)
-    - 32-byte random string (urlsafe base64)
-    - Hashed with bcrypt before storage
+    - 16-char selector (12 random bytes) + 43-char verifier (32 random bytes),
+      both urlsafe base64, concatenated into one 59-char token
+    - Selector is stored in plaintext (unique index) for O(1) lookup
+    - Full token is hashed with HMAC-SHA256 (key derived from SECRET_KEY)
     - 30-day expiration
     - Rotated on every use
 
+Legacy Tokens:
+    Tokens issued before the selector/verifier format are 43 chars with a
+    bcrypt hash and no selector. verify_token() still accepts them; they are
+    rotated into the new format on their next refresh and age out after
+    30 days. verify_token_async() runs their bcrypt check in the password
+    service's worker pool so it never blocks the event loop.
+
 Reference:
     - docs/architecture/authentication-architecture.md (Lines 174-231)
 """
 
+import asyncio
+import hashlib
+import hmac
 import secrets
 from datetime import UTC, datetime, timedelta
 
 import bcrypt
 
-from src.core.constants import BCRYPT_ROUNDS_DEFAULT, TOKEN_BYTES
+from src.core.constants import (
+    REFRESH_TOKEN_SELECTOR_BYTES,
+    REFRESH_TOKEN_SELECTOR_LENGTH,
+    TOKEN_BYTES,
+)
+from src.domain.protocols.password_hashing_protocol import PasswordHashingProtocol
+
+# Verifier length: urlsafe base64 of TOKEN_BYTES without padding (43 chars)
+_VERIFIER_LENGTH = -(-TOKEN_BYTES * 4 // 3)
+_TOKEN_LENGTH = REFRESH_TOKEN_SELECTOR_LENGTH + _VERIFIER_LENGTH
+
+# Domain separation for the HMAC key derived from SECRET_KEY
+_HMAC_KEY_CONTEXT = b"dashtam:refresh-token:v1"
+
+_BCRYPT_PREFIX = "$2"
 
 
 class RefreshTokenService:
     """Refresh token generation and validation service.
 
-    Generates opaque refresh tokens for long-lived authentication.
-    Tokens are hashed before database storage for security.
+    Generates opaque selector/verifier refresh tokens for long-lived
+    authentication. Tokens are hashed with HMAC-SHA256 before database
+    storage; the selector prefix is the indexed lookup key.
 
     Usage:
         # Application handler uses directly
-        service = RefreshTokenService(expiration_days=30)
+        service = RefreshTokenService(secret_key=settings.secret_key)
 
         # Generate token
         token, token_hash = service.generate_token()
 
-        # Store token_hash in database, return token to user
+        # Store selector + token_hash in database, return token to user
         await refresh_token_repo.save(
             user_id=user_id,
             token_hash=token_hash,
-            expires_at=datetime.now(UTC) + timedelta(days=30),
+            session_id=session_id,
+            expires_at=service.calculate_expiration(),
+            token_selector=service.get_selector(token),
         )
 
         # Later: Verify token from user
-        is_valid = service.verify_token(provided_token, stored_hash)
+        is_valid = await service.verify_token_async(provided_token, stored_hash)
     """
 
-    def __init__(self, expiration_days: int = 30) -> None:
+    def __init__(
+        self,
+        secret_key: str,
+        expiration_days: int = 30,
+        password_service: PasswordHashingProtocol | None = None,
+    ) -> None:
         """Initialize refresh token service.
 
         Args:
+            secret_key: Application secret used to derive the HMAC key.
+                Rotating it invalidates all selector/verifier tokens.
             expiration_days: Token expiration in days (default: 30).
+            password_service: Runs legacy bcrypt checks in its bounded
+                worker pool. Without one, they run in a worker thread.
 
         Note:
             Expiration is tracked in database, not in token itself.
         """
+        self._hmac_key = hmac.new(
+            secret_key.encode("utf-8"), _HMAC_KEY_CONTEXT, hashlib.sha256
+        ).digest()
         self._expiration_days = expiration_days
+        self._password_service = password_service
 
     def generate_token(self) -> tuple[str, str]:
         """Generate refresh token and its hash.
 
         Returns:
             Tuple of (token, token_hash):
-                - token: Plain token to return to user (urlsafe base64)
-                - token_hash: Bcrypt hash to store in database
+                - token: Plain token to return to user (selector + verifier)
+                - token_hash: HMAC-SHA256 hex digest to store in database
 
         Example:
-            >>> service = RefreshTokenService()
+            >>> service = RefreshTokenService(secret_key="x" * 32)
             >>> token, token_hash = service.generate_token()
-            >>> len(token)  # ~43 characters
-            43
-            >>> token_hash.startswith("$2b$")  # Bcrypt format
-            True
+            >>> len(token)  # 16-char selector + 43-char verifier
+            59
+            >>> len(token_hash)  # SHA-256 hex digest
+            64
 
         Note:
-            - Token is 32 bytes = 256 bits of entropy
+            - Verifier is 32 bytes = 256 bits of entropy, so a fast keyed
+              hash is sufficient (no bcrypt work factor needed)
             - Each generation produces unique token
-            - Token hash is bcrypt with cost factor 12
-            - Store token_hash in database, return token to user
+            - Store token_hash and get_selector(token) in database
         """
-        # Generate cryptographically secure random token
-        # 32 bytes = 256 bits of entropy
-        token = secrets.token_urlsafe(TOKEN_BYTES)
-
-        # Hash token with bcrypt before storage
-        # Cost factor 12 = ~250ms (same as passwords)
-        token_hash = bcrypt.hashpw(
-            token.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS_DEFAULT)
-        )
+        selector = secrets.token_urlsafe(REFRESH_TOKEN_SELECTOR_BYTES)
+        verifier = secrets.token_urlsafe(TOKEN_BYTES)
+        token = f"{selector}{verifier}"
+        return token, self._hash(token)
+
+    def get_selector(self, token: str) -> str | None:
+        """Extract the lookup selector from a refresh token.
 
-        # Return as strings (bcrypt returns bytes)
-        return token, token_hash.decode("utf-8")
+        Args:
+            token: Plain token from user request.
+
+        Returns:
+            Selector prefix, or None for legacy (pre-selector) tokens and
+            tokens of unexpected length.
+
+        Example:
+            >>> token, _ = service.generate_token()
+            >>> service.get_selector(token) == token[:16]
+            True
+        """
+        if len(token) != _TOKEN_LENGTH:
+            return None
+        return token[:REFRESH_TOKEN_SELECTOR_LENGTH]
 
     def verify_token(self, token: str, token_hash: str) -> bool:
         """Verify token against stored hash.
 
         Args:
             token: Plain token from user request.
-            token_hash: Bcrypt hash from database.
+            token_hash: HMAC-SHA256 hex digest (or legacy bcrypt hash).
 
         Returns:
             True if token matches hash, False otherwise.
 
         Example:
-            >>> service = RefreshTokenService()
             >>> token, token_hash = service.generate_token()
             >>> service.verify_token(token, token_hash)
             True
@@ -119,12 +171,29 @@ class RefreshTokenService:
             - Returns False for invalid hash format (no exceptions)
             - Does NOT check expiration (repository handles that)
         """
-        try:
-            # bcrypt.checkpw does constant-time comparison
-            return bcrypt.checkpw(token.encode("utf-8"), token_hash.encode("utf-8"))
-        except (ValueError, AttributeError):
-            # Invalid hash format or encoding error
-            return False
+        if token_hash.startswith(_BCRYPT_PREFIX):
+            return self._verify_legacy(token, token_hash)
+        return hmac.compare_digest(self._hash(token), token_hash)
+
+    async def verify_token_async(self, token: str, token_hash: str) -> bool:
+        """Verify token against stored hash without blocking the event loop.
+
+        Same result as verify_token(). The HMAC comparison runs inline;
+        legacy bcrypt hashes are checked in the password service's worker
+        pool (bcrypt cost is paid off the event loop).
+
+        Args:
+            token: Plain token from user request.
+            token_hash: HMAC-SHA256 hex digest (or legacy bcrypt hash).
+
+        Returns:
+            True if token matches hash, False otherwise.
+        """
+        if not token_hash.startswith(_BCRYPT_PREFIX):
+            return hmac.compare_digest(self._hash(token), token_hash)
+        if self._password_service is not None:
+            return await self._password_service.verify_password_async(token, token_hash)
+        return await asyncio.to_thread(self._verify_legacy, token, token_hash)
 
     def calculate_expiration(self) -> datetime:
         """Calculate expiration timestamp for new token.
@@ -133,7 +202,7 @@ class RefreshTokenService:
             Expiration datetime (UTC) based on configured expiration_days.
 
         Example:
-            >>> service = RefreshTokenService(expiration_days=30)
+            >>> service = RefreshTokenService(secret_key="x" * 32)
             >>> expires_at = service.calculate_expiration()
             >>> # ~30 days from now
 
@@ -142,3 +211,33 @@ class RefreshTokenService:
             - Add configured days to current time
         """
         return datetime.now(UTC) + timedelta(days=self._expiration_days)
+
+    def _hash(self, token: str) -> str:
+        """Compute the keyed hash stored for a token.
+
+        Args:
+            token: Plain token (selector + verifier).
+
+        Returns:
+            HMAC-SHA256 hex digest.
+        """
+        return hmac.new(
+            self._hmac_key, token.encode("utf-8"), hashlib.sha256
+        ).hexdigest()
+
+    def _verify_legacy(self, token: str, token_hash: str) -> bool:
+        """Verify a pre-selector token against its bcrypt hash.
+
+        Args:
+            token: Plain token from user request.
+            token_hash: Bcrypt hash from database.
+
+        Returns:
+            True if token matches hash, False otherwise.
+        """
+        try:
+            # bcrypt.checkpw does constant-time comparison
+            return bcrypt.checkpw(token.encode("utf-8"), token_hash.encode("utf-8"))
+        except (ValueError, AttributeError):
+            # Invalid hash format or encoding error
+            return False
@@ -4,6 +4,7 @@ This package contains Redis-backed implementations of SSE protocols:
 - RedisSSEPublisher: Publishes SSE events via Redis pub/sub
 - RedisSSESubscriber: Subscribes to SSE event streams
 - SSEChannelKeys: Redis channel naming conventions
+- SSEHub: Per-process pub/sub multiplexer (one Redis connection per worker)
 - SSEEventHandler: Bridges domain events to SSE (app-scoped singleton)
 
 Architecture:
@@ -20,10 +21,13 @@ from src.infrastructure.sse.channel_keys import SSEChannelKeys
 from src.infrastructure.sse.redis_publisher import RedisSSEPublisher
 from src.infrastructure.sse.redis_subscriber import RedisSSESubscriber
 from src.infrastructure.sse.sse_event_handler import SSEEventHandler
+from src.infrastructure.sse.sse_hub import SSEHub, SSEHubStats
 
 __all__ = [
     "SSEChannelKeys",
     "RedisSSEPublisher",
     "RedisSSESubscriber",
     "SSEEventHandler",
+    "SSEHub",
+    "SSEHubStats",
 ]
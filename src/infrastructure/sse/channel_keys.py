@@ -5,8 +5,10 @@ following the same pattern as CacheKeys in src/infrastructure/cache/cache_keys.p
 
 Channel Patterns:
     sse:user:{user_id}           - Per-user event channel (pub/sub)
+    sse:user:*                   - Pattern matching all user channels (SSE hub)
     sse:broadcast                - Global broadcast channel (pub/sub)
     sse:stream:user:{user_id}    - Redis Stream for event retention
+    sse:stream:user:{user_id}:event:{event_id} - event_id -> stream entry ID
 
 Reference:
     - docs/architecture/sse-architecture.md (Section 5.2)
@@ -47,6 +49,22 @@ class SSEChannelKeys:
         """
         return f"{SSE_CHANNEL_PREFIX}:user:{user_id}"
 
+    @staticmethod
+    def user_channel_pattern() -> str:
+        """Get Redis pub/sub pattern matching every user channel.
+
+        Used by the per-process SSE hub to receive all user events over a
+        single PSUBSCRIBE connection.
+
+        Returns:
+            Glob pattern for user-specific channels.
+
+        Example:
+            >>> SSEChannelKeys.user_channel_pattern()
+            "sse:user:*"
+        """
+        return f"{SSE_CHANNEL_PREFIX}:user:*"
+
     @staticmethod
     def broadcast_channel() -> str:
         """Get Redis pub/sub channel for broadcasts.
@@ -79,6 +97,27 @@ class SSEChannelKeys:
         """
         return f"{SSE_CHANNEL_PREFIX}:stream:user:{user_id}"
 
+    @staticmethod
+    def user_stream_entry(user_id: UUID, event_id: UUID) -> str:
+        """Get key mapping an event ID to its Redis Stream entry ID.
+
+        Written alongside each retained event so Last-Event-ID replay can
+        start reading directly after the client's last event instead of
+        scanning the whole stream.
+
+        Args:
+            user_id: User's UUID.
+            event_id: SSE event's UUID (the SSE ``id:`` value).
+
+        Returns:
+            Key holding the stream entry ID (e.g., "1717171717171-0").
+
+        Example:
+            >>> SSEChannelKeys.user_stream_entry(UUID("abc123..."), UUID("def456..."))
+            "sse:stream:user:abc123...:event:def456..."
+        """
+        return f"{SSE_CHANNEL_PREFIX}:stream:user:{user_id}:event:{event_id}"
+
     @staticmethod
     def parse_user_id_from_channel(channel: str) -> UUID | None:
         """Extract user_id from channel name.
@@ -0,0 +1,38 @@
+-- publish_event.lua
+-- Store an SSE event for replay and publish it in one round trip
+--
+-- KEYS[1]: User stream key (e.g., "sse:stream:user:<user_id>")
+-- KEYS[2]: Entry index key (e.g., "sse:stream:user:<user_id>:event:<event_id>")
+-- ARGV[1]: Pub/sub channel (e.g., "sse:user:<user_id>")
+-- ARGV[2]: Pub/sub payload (JSON of SSEEvent.to_dict())
+-- ARGV[3]: event_id
+-- ARGV[4]: event_type
+-- ARGV[5]: data (JSON of SSEEvent.data)
+-- ARGV[6]: occurred_at (ISO 8601)
+-- ARGV[7]: Stream MAXLEN (approximate)
+-- ARGV[8]: Retention TTL in seconds
+--
+-- Returns: stream entry ID
+-- Notes:
+--   - Event is stored before it is published, so a client that receives it
+--     live can always resume from it with Last-Event-ID
+--   - EXPIRE NX only sets the stream TTL if missing (Redis >= 7.0)
+--   - Fail-open policy must be enforced by caller on Redis errors
+
+local stream_key = KEYS[1]
+local index_key = KEYS[2]
+local ttl = tonumber(ARGV[8])
+
+local entry_id = redis.call(
+    "XADD", stream_key, "MAXLEN", "~", ARGV[7], "*",
+    "event_id", ARGV[3],
+    "event_type", ARGV[4],
+    "data", ARGV[5],
+    "occurred_at", ARGV[6]
+)
+
+redis.call("SET", index_key, entry_id, "EX", ttl)
+redis.call("EXPIRE", stream_key, ttl, "NX")
+redis.call("PUBLISH", ARGV[1], ARGV[2])
+
+return entry_id
@@ -8,17 +8,25 @@ Architecture:
     - Implements SSEPublisherProtocol without inheritance (structural typing)
     - Uses Redis pub/sub for horizontal scaling (multiple API instances)
     - Optional Redis Streams for event retention
+    - One round trip per event: with retention, XADD + index SET + EXPIRE +
+      PUBLISH run in a single Lua script (lua_scripts/publish_event.lua)
+    - publish_many() pipelines a batch of events into one round trip
     - Fail-open design: publish errors are logged but don't raise
 
 Reference:
     - docs/architecture/sse-architecture.md
 """
 
+import asyncio
 import json
 import logging
+from collections.abc import Sequence
+from functools import partial
+from pathlib import Path
 from uuid import UUID
 
 from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
 from redis.exceptions import RedisError
 
 from src.core.constants import (
@@ -43,6 +51,7 @@ class RedisSSEPublisher:
         _retention_max_len: Max events to retain per user.
         _retention_ttl: TTL for retained events (seconds).
         _logger: Logger instance.
+        _publish_script: Publish Lua script (loaded on first retained publish).
     """
 
     def __init__(
@@ -67,6 +76,7 @@ class RedisSSEPublisher:
         self._retention_max_len = retention_max_len
         self._retention_ttl = retention_ttl_seconds
         self._logger = logger or logging.getLogger(__name__)
+        self._publish_script: AsyncScript | None = None
 
     async def publish(self, event: SSEEvent) -> None:
         """Publish SSE event to user's channel.
@@ -86,6 +96,9 @@ class RedisSSEPublisher:
     async def publish_to_user(self, user_id: UUID, event: SSEEvent) -> None:
         """Publish SSE event to specific user's channel.
 
+        One round trip per event: a plain PUBLISH, or (with retention) one
+        EVALSHA of the publish script that stores, indexes and publishes.
+
         Args:
             user_id: Target user ID.
             event: SSE event to publish.
@@ -96,11 +109,12 @@ class RedisSSEPublisher:
         channel = SSEChannelKeys.user_channel(user_id)
 
         try:
-            # Serialize event to JSON for pub/sub
-            event_json = json.dumps(event.to_dict())
-
-            # Publish to pub/sub channel
-            await self._redis.publish(channel, event_json)
+            if self._enable_retention:
+                script = await self._get_publish_script()
+                keys, args = self._publish_script_params(user_id, event)
+                await script(keys=keys, args=args)
+            else:
+                await self._redis.publish(channel, json.dumps(event.to_dict()))
 
             self._logger.debug(
                 "Published SSE event",
@@ -109,13 +123,10 @@ class RedisSSEPublisher:
                     "user_id": str(user_id),
                     "event_id": str(event.event_id),
                     "channel": channel,
+                    "retained": self._enable_retention,
                 },
             )
 
-            # Store in Redis Stream if retention enabled
-            if self._enable_retention:
-                await self._store_in_stream(user_id, event)
-
         except RedisError as e:
             # Fail-open: log error but don't raise
             self._logger.warning(
@@ -139,6 +150,77 @@ class RedisSSEPublisher:
                 },
             )
 
+    async def publish_many(self, events: Sequence[SSEEvent]) -> None:
+        """Publish a batch of SSE events in a single pipelined round trip.
+
+        Each event goes to its own user's channel, in order. Per-event
+        failures inside the pipeline are logged without discarding the rest
+        of the batch.
+
+        Args:
+            events: SSE events to publish (each routed by its user_id).
+
+        Note:
+            Same fail-open behavior as publish().
+        """
+        if not events:
+            return
+
+        try:
+            script = (
+                await self._get_publish_script() if self._enable_retention else None
+            )
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for event in events:
+                    if script is not None:
+                        keys, args = self._publish_script_params(event.user_id, event)
+                        await script(keys=keys, args=args, client=pipe)
+                    else:
+                        pipe.publish(
+                            SSEChannelKeys.user_channel(event.user_id),
+                            json.dumps(event.to_dict()),
+                        )
+                results = await pipe.execute(raise_on_error=False)
+
+            failed = [r for r in results if isinstance(r, Exception)]
+            if failed:
+                self._logger.warning(
+                    "Failed to publish some SSE events in batch (fail-open)",
+                    extra={
+                        "batch_size": len(events),
+                        "failed": len(failed),
+                        "error": str(failed[0]),
+                        "error_type": type(failed[0]).__name__,
+                    },
+                )
+            else:
+                self._logger.debug(
+                    "Published SSE event batch",
+                    extra={
+                        "batch_size": len(events),
+                        "retained": self._enable_retention,
+                    },
+                )
+
+        except RedisError as e:
+            self._logger.warning(
+                "Failed to publish SSE event batch (fail-open)",
+                extra={
+                    "batch_size": len(events),
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                },
+            )
+        except Exception as e:
+            self._logger.error(
+                "Unexpected error publishing SSE event batch (fail-open)",
+                extra={
+                    "batch_size": len(events),
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                },
+            )
+
     async def broadcast(self, event: SSEEvent) -> None:
         """Broadcast SSE event to all connected clients.
 
@@ -184,53 +266,65 @@ class RedisSSEPublisher:
                 },
             )
 
-    async def _store_in_stream(self, user_id: UUID, event: SSEEvent) -> None:
-        """Store event in Redis Stream for retention.
+    async def _get_publish_script(self) -> AsyncScript:
+        """Load the publish Lua script on first use.
 
-        Called when retention is enabled. Uses XADD with MAXLEN
-        to keep stream size bounded.
+        The returned script runs via EVALSHA and reloads itself on NOSCRIPT
+        (e.g., after a Redis restart or SCRIPT FLUSH).
 
-        Args:
-            user_id: User ID for stream key.
-            event: Event to store.
+        Returns:
+            Registered publish script.
         """
-        stream_key = SSEChannelKeys.user_stream(user_id)
+        if self._publish_script is None:
+            source = await _read_lua_script("lua_scripts/publish_event.lua")
+            self._publish_script = self._redis.register_script(source)
+        return self._publish_script
 
-        try:
-            # XADD with MAXLEN to cap stream size
-            # Using ~ (approximate) for better performance
-            await self._redis.xadd(
-                stream_key,
-                {
-                    "event_id": str(event.event_id),
-                    "event_type": event.event_type.value,
-                    "data": json.dumps(event.data),
-                    "occurred_at": event.occurred_at.isoformat(),
-                },
-                maxlen=self._retention_max_len,
-                approximate=True,
-            )
-
-            # Set TTL on stream if not already set
-            # This ensures old streams get cleaned up
-            ttl = await self._redis.ttl(stream_key)
-            if ttl == -1:  # No TTL set
-                await self._redis.expire(stream_key, self._retention_ttl)
+    def _publish_script_params(
+        self, user_id: UUID, event: SSEEvent
+    ) -> tuple[list[str], list[str | int]]:
+        """Build KEYS and ARGV for the publish script.
 
-            self._logger.debug(
-                "Stored SSE event in stream",
-                extra={
-                    "stream_key": stream_key,
-                    "event_id": str(event.event_id),
-                },
-            )
+        Args:
+            user_id: Target user ID (stream and channel owner).
+            event: Event to store and publish.
 
-        except RedisError as e:
-            # Fail-open: stream storage is optional
-            self._logger.warning(
-                "Failed to store SSE event in stream (fail-open)",
-                extra={
-                    "stream_key": stream_key,
-                    "error": str(e),
-                },
-            )
+        Returns:
+            Tuple of (keys, args) matching publish_event.lua.
+        """
+        keys = [
+            SSEChannelKeys.user_stream(user_id),
+            SSEChannelKeys.user_stream_entry(user_id, event.event_id),
+        ]
+        args: list[str | int] = [
+            SSEChannelKeys.user_channel(user_id),
+            json.dumps(event.to_dict()),
+            str(event.event_id),
+            event.event_type.value,
+            json.dumps(event.data),
+            event.occurred_at.isoformat(),
+            self._retention_max_len,
+            self._retention_ttl,
+        ]
+        return keys, args
+
+
+def _read_lua_script_sync(path: Path) -> str:
+    """Synchronous helper to read Lua script (called via run_in_executor)."""
+    return path.read_text(encoding="utf-8")
+
+
+async def _read_lua_script(rel_path: str) -> str:
+    """Read Lua script file relative to this module.
+
+    Uses run_in_executor to avoid blocking the event loop on file IO.
+
+    Args:
+        rel_path: Relative path from this module's directory.
+
+    Returns:
+        Script contents as string.
+    """
+    full_path = Path(__file__).parent / rel_path
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(_read_lua_script_sync, full_path))
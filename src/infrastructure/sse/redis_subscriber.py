@@ -2,11 +2,12 @@
 
 This adapter subscribes to SSE events via Redis pub/sub and yields them
 as an async generator. Supports category filtering and Last-Event-ID
-replay from Redis Streams.
+replay from Redis Streams (cursor-based, paged XRANGE).
 
 Architecture:
     - Implements SSESubscriberProtocol without inheritance (structural typing)
     - Uses Redis pub/sub for real-time event delivery
+    - Optional SSEHub: one shared subscription per process, not per client
     - Async generator pattern for streaming
     - Optional Redis Streams for missed event replay
 
@@ -25,8 +26,10 @@ from redis.asyncio import Redis
 from redis.asyncio.client import PubSub
 from redis.exceptions import RedisError
 
+from src.core.constants import SSE_REPLAY_PAGE_SIZE
 from src.domain.events.sse_event import SSEEvent, SSEEventCategory, SSEEventType
 from src.infrastructure.sse.channel_keys import SSEChannelKeys
+from src.infrastructure.sse.sse_hub import SSEHub
 
 
 class RedisSSESubscriber:
@@ -36,11 +39,17 @@ class RedisSSESubscriber:
     yielding events as they arrive. Supports category filtering
     and replay of missed events from Redis Streams.
 
+    With an SSEHub, live events come from the hub's shared per-process
+    subscription; without one, each subscribe() call opens its own
+    pub/sub connection.
+
     Note: Does NOT inherit from SSESubscriberProtocol (uses structural typing).
 
     Attributes:
         _redis: Async Redis client instance.
         _enable_retention: Whether retention is available for replay.
+        _replay_page_size: Stream entries fetched per XRANGE during replay.
+        _hub: Optional per-process hub multiplexing live delivery.
         _logger: Logger instance.
     """
 
@@ -48,6 +57,8 @@ class RedisSSESubscriber:
         self,
         redis_client: "Redis[bytes]",  # type: ignore[type-arg]
         enable_retention: bool = False,
+        replay_page_size: int = SSE_REPLAY_PAGE_SIZE,
+        hub: SSEHub | None = None,
         logger: logging.Logger | None = None,
     ) -> None:
         """Initialize Redis SSE subscriber.
@@ -55,10 +66,16 @@ class RedisSSESubscriber:
         Args:
             redis_client: Async Redis client instance.
             enable_retention: Whether retention is enabled for replay.
+            replay_page_size: Stream entries fetched per XRANGE during replay.
+            hub: Per-process SSE hub. When provided, live events come from the
+                hub's shared subscription instead of a dedicated pub/sub
+                connection per subscriber.
             logger: Optional logger (creates default if not provided).
         """
         self._redis = redis_client
         self._enable_retention = enable_retention
+        self._replay_page_size = replay_page_size
+        self._hub = hub
         self._logger = logger or logging.getLogger(__name__)
 
     async def subscribe(
@@ -78,12 +95,19 @@ class RedisSSESubscriber:
         Yields:
             SSEEvent: Events matching the subscription criteria.
         """
-        user_channel = SSEChannelKeys.user_channel(user_id)
-        broadcast_channel = SSEChannelKeys.broadcast_channel()
-
         # Validate categories if provided
         valid_categories = self.validate_categories(categories)
 
+        if self._hub is not None:
+            # Shared per-process subscription (no Redis connection per client)
+            async for event in self._hub.listen(user_id):
+                if self.filter_by_categories(event, categories):
+                    yield event
+            return
+
+        user_channel = SSEChannelKeys.user_channel(user_id)
+        broadcast_channel = SSEChannelKeys.broadcast_channel()
+
         pubsub: PubSub = self._redis.pubsub()
 
         try:
@@ -161,7 +185,8 @@ class RedisSSESubscriber:
         """Get events missed since last_event_id.
 
         When a client reconnects with Last-Event-ID, retrieves events
-        that were published while disconnected.
+        that were published while disconnected. Collects
+        replay_missed_events() into a list.
 
         Args:
             user_id: User ID to get events for.
@@ -172,56 +197,81 @@ class RedisSSESubscriber:
             List of SSEEvent objects published after last_event_id.
             Empty list if retention disabled or no events found.
         """
+        return [
+            event
+            async for event in self.replay_missed_events(
+                user_id, last_event_id, categories
+            )
+        ]
+
+    async def replay_missed_events(
+        self,
+        user_id: UUID,
+        last_event_id: UUID,
+        categories: list[str] | None = None,
+    ) -> AsyncIterator[SSEEvent]:
+        """Stream events missed since last_event_id, one page at a time.
+
+        Looks up the stream entry ID of last_event_id (written by the
+        publisher) and reads forward with ``XRANGE (<entry_id> + COUNT n``,
+        so reconnect cost depends on the gap, not the stream length. Large
+        gaps are fetched in pages of ``replay_page_size`` entries.
+
+        Args:
+            user_id: User ID to get events for.
+            last_event_id: Last event ID received by client.
+            categories: Optional category filter.
+
+        Yields:
+            SSEEvent: Events published after last_event_id, oldest first.
+        """
         if not self._enable_retention:
-            return []
+            return
 
         stream_key = SSEChannelKeys.user_stream(user_id)
-        events: list[SSEEvent] = []
+        count = 0
 
         try:
-            # Read all entries from stream
-            # We'll filter by event_id after reading
-            entries = await self._redis.xrange(stream_key, "-", "+")
-
-            found_last = False
-            for entry_id, entry_data in entries:
-                event_id_str = entry_data.get(
-                    b"event_id", entry_data.get("event_id", "")
-                )
-                if isinstance(event_id_str, bytes):
-                    event_id_str = event_id_str.decode("utf-8")
+            cursor = await self._resolve_replay_cursor(
+                user_id, stream_key, last_event_id
+            )
+            if cursor is None:
+                # Unknown or expired last_event_id: nothing to resume from
+                return
 
-                # Skip until we find the last seen event
-                if not found_last:
-                    if event_id_str == str(last_event_id):
-                        found_last = True
-                    continue
+            while True:
+                entries = await self._redis.xrange(
+                    stream_key, f"({cursor}", "+", count=self._replay_page_size
+                )
 
-                # Parse event from stream entry
-                try:
-                    event = self._parse_stream_entry(entry_data, user_id)
+                for entry_id, entry_data in entries:
+                    try:
+                        event = self._parse_stream_entry(entry_data, user_id)
+                    except (KeyError, ValueError) as e:
+                        self._logger.warning(
+                            "Failed to parse stream entry",
+                            extra={"error": str(e), "entry_id": entry_id},
+                        )
+                        continue
 
                     # Apply category filter
                     if self.filter_by_categories(event, categories):
-                        events.append(event)
+                        count += 1
+                        yield event
 
-                except (KeyError, ValueError) as e:
-                    self._logger.warning(
-                        "Failed to parse stream entry",
-                        extra={"error": str(e), "entry_id": entry_id},
-                    )
+                if len(entries) < self._replay_page_size:
+                    break
+                cursor = self._decode(entries[-1][0])
 
             self._logger.debug(
-                "Retrieved missed events from stream",
+                "Replayed missed events from stream",
                 extra={
                     "user_id": str(user_id),
                     "last_event_id": str(last_event_id),
-                    "count": len(events),
+                    "count": count,
                 },
             )
 
-            return events
-
         except RedisError as e:
             self._logger.warning(
                 "Failed to get missed events from stream",
@@ -230,7 +280,51 @@ class RedisSSESubscriber:
                     "error": str(e),
                 },
             )
-            return []
+
+    async def _resolve_replay_cursor(
+        self,
+        user_id: UUID,
+        stream_key: str,
+        last_event_id: UUID,
+    ) -> str | None:
+        """Find the stream entry ID of the client's last received event.
+
+        Uses the event_id -> entry ID index written at publish time. Entries
+        without an index (written before it existed, or added directly) fall
+        back to a paged scan of the stream.
+
+        Args:
+            user_id: User ID owning the stream.
+            stream_key: Redis Stream key.
+            last_event_id: Last event ID received by client.
+
+        Returns:
+            Stream entry ID, or None if last_event_id is not in the stream.
+        """
+        entry_id = await self._redis.get(
+            SSEChannelKeys.user_stream_entry(user_id, last_event_id)
+        )
+        if entry_id is not None:
+            return self._decode(entry_id)
+
+        target = str(last_event_id)
+        start = "-"
+        while True:
+            entries = await self._redis.xrange(
+                stream_key, start, "+", count=self._replay_page_size
+            )
+            for scanned_id, entry_data in entries:
+                event_id = entry_data.get(b"event_id", entry_data.get("event_id", ""))
+                if self._decode(event_id) == target:
+                    return self._decode(scanned_id)
+            if len(entries) < self._replay_page_size:
+                return None
+            start = f"({self._decode(entries[-1][0])}"
+
+    @staticmethod
+    def _decode(value: bytes | str) -> str:
+        """Decode a Redis reply value (bytes or str client) to str."""
+        return value.decode("utf-8") if isinstance(value, bytes) else str(value)
 
     def _parse_stream_entry(
         self,
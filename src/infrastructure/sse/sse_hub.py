@@ -0,0 +1,362 @@
+"""Per-process SSE hub multiplexing Redis pub/sub to local connections.
+
+Instead of one Redis pub/sub connection per open ``/events`` stream, each
+worker process keeps a single connection that pattern-subscribes to all user
+channels (plus the broadcast channel) and dispatches events to in-process,
+per-connection queues.
+
+Backpressure Policy:
+    Each connection has a bounded queue (SSE_CLIENT_QUEUE_MAX_SIZE). When a
+    slow client's queue is full, the OLDEST buffered event is dropped to make
+    room for the newest one. Dropped events are counted; clients with
+    retention enabled can recover them via Last-Event-ID replay.
+
+Architecture:
+    - App-scoped singleton (one hub per worker process)
+    - Used by RedisSSESubscriber.subscribe() when provided
+    - Lazily starts its listener task on the first connection
+    - Supervised listener: any failure (Redis or otherwise) ends the open
+      streams and resubscribes with exponential backoff; a bad message is
+      logged and skipped
+    - Streams end instead of waiting forever while the hub is unavailable;
+      clients reconnect and recover missed events via Last-Event-ID replay
+    - Events are decoded once per message, only if a local client wants them
+
+Reference:
+    - docs/architecture/sse-architecture.md
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import AsyncGenerator
+from dataclasses import asdict, dataclass
+from typing import Any
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.core.constants import (
+    SSE_CLIENT_QUEUE_MAX_SIZE,
+    SSE_HUB_READY_TIMEOUT_SECONDS,
+    SSE_HUB_RECONNECT_MAX_DELAY_SECONDS,
+)
+from src.domain.events.sse_event import SSEEvent
+from src.infrastructure.sse.channel_keys import SSEChannelKeys
+
+
+@dataclass(frozen=True, kw_only=True)
+class SSEHubStats:
+    """Point-in-time SSE hub statistics.
+
+    Attributes:
+        connected_clients: Open SSE connections served by this process.
+        subscribed_users: Distinct users with at least one open connection.
+        queued_events: Events buffered across all connection queues.
+        max_queue_depth: Deepest single connection queue right now.
+        dispatched_events: Events delivered to connection queues (lifetime).
+        dropped_events: Events dropped from full queues (lifetime).
+    """
+
+    connected_clients: int
+    subscribed_users: int
+    queued_events: int
+    max_queue_depth: int
+    dispatched_events: int
+    dropped_events: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to dictionary.
+
+        Returns:
+            Dictionary with hub counters.
+        """
+        return asdict(self)
+
+
+class _SSEHubClient:
+    """Bounded event queue for one SSE connection (drop-oldest on overflow).
+
+    A None entry marks the end of the stream (hub lost its subscription).
+    """
+
+    __slots__ = ("dropped", "queue", "user_id")
+
+    def __init__(self, user_id: UUID, max_size: int) -> None:
+        self.user_id = user_id
+        self.queue: asyncio.Queue[SSEEvent | None] = asyncio.Queue(maxsize=max_size)
+        self.dropped = 0
+
+    def offer(self, event: SSEEvent) -> bool:
+        """Enqueue event without blocking the hub.
+
+        Returns:
+            True if an older event had to be dropped to make room.
+        """
+        dropped = False
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+            dropped = True
+        self.queue.put_nowait(event)
+        return dropped
+
+    def close(self) -> None:
+        """End the stream after any events already buffered."""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(None)
+
+
+class SSEHub:
+    """Multiplexes one Redis pub/sub connection to many SSE connections.
+
+    Attributes:
+        redis_client: Shared async Redis client (also used for stream replay).
+        _queue_max_size: Per-connection queue bound.
+        _clients: Open connections grouped by user.
+        _listener: Background task reading from Redis pub/sub.
+        _ready: Set once the pub/sub subscriptions are active.
+        _ready_timeout: Max wait for _ready before a new stream is ended.
+        _logger: Logger instance.
+
+    Example:
+        >>> hub = get_sse_hub()
+        >>> async for event in hub.listen(user_id):
+        ...     yield event.to_sse_format()
+    """
+
+    def __init__(
+        self,
+        redis_client: "Redis[bytes]",  # type: ignore[type-arg]
+        queue_max_size: int = SSE_CLIENT_QUEUE_MAX_SIZE,
+        ready_timeout_seconds: float = SSE_HUB_READY_TIMEOUT_SECONDS,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        """Initialize SSE hub (listener starts on first connection).
+
+        Args:
+            redis_client: Async Redis client instance.
+            queue_max_size: Max buffered events per connection.
+            ready_timeout_seconds: Max wait for the shared subscription
+                before a new stream is ended.
+            logger: Optional logger (creates default if not provided).
+        """
+        self.redis_client = redis_client
+        self._queue_max_size = queue_max_size
+        self._ready_timeout = ready_timeout_seconds
+        self._logger = logger or logging.getLogger(__name__)
+        self._clients: dict[UUID, set[_SSEHubClient]] = {}
+        self._listener: asyncio.Task[None] | None = None
+        self._ready = asyncio.Event()
+        self._dispatched = 0
+        self._dropped = 0
+
+    async def listen(self, user_id: UUID) -> AsyncGenerator[SSEEvent, None]:
+        """Yield events for a user (user channel + broadcasts).
+
+        Registers a bounded queue for the caller's connection and removes it
+        when the generator is closed (client disconnect).
+
+        The stream ends (like a dedicated subscription on a Redis error) if
+        the hub is not subscribed within the ready timeout, or when it loses
+        its subscription; the client then reconnects with Last-Event-ID.
+
+        Args:
+            user_id: User whose events to receive.
+
+        Yields:
+            SSEEvent: Events in publish order (oldest dropped if client lags).
+        """
+        client = _SSEHubClient(user_id, self._queue_max_size)
+        self._clients.setdefault(user_id, set()).add(client)
+        self._ensure_listener()
+
+        try:
+            try:
+                async with asyncio.timeout(self._ready_timeout):
+                    await self._ready.wait()
+            except TimeoutError:
+                self._logger.warning(
+                    "SSE hub unavailable, ending stream",
+                    extra={"user_id": str(user_id)},
+                )
+                return
+
+            while True:
+                event = await client.queue.get()
+                if event is None:
+                    return  # Hub lost its subscription
+                yield event
+        finally:
+            users_clients = self._clients.get(user_id)
+            if users_clients is not None:
+                users_clients.discard(client)
+                if not users_clients:
+                    del self._clients[user_id]
+
+    def get_stats(self) -> SSEHubStats:
+        """Get current hub statistics.
+
+        Returns:
+            Snapshot of connection, queue, and drop counters.
+        """
+        depths = [
+            client.queue.qsize()
+            for clients in self._clients.values()
+            for client in clients
+        ]
+        return SSEHubStats(
+            connected_clients=len(depths),
+            subscribed_users=len(self._clients),
+            queued_events=sum(depths),
+            max_queue_depth=max(depths, default=0),
+            dispatched_events=self._dispatched,
+            dropped_events=self._dropped,
+        )
+
+    async def aclose(self) -> None:
+        """Stop the listener task (call on application shutdown)."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        self._ready.clear()
+
+    def _ensure_listener(self) -> None:
+        """Start the pub/sub listener task if it is not running."""
+        if (
+            self._listener is None
+            or self._listener.done()
+            or self._listener.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._ready.clear()
+            self._listener = asyncio.create_task(self._run(), name="sse-hub-listener")
+            self._listener.add_done_callback(self._on_listener_done)
+
+    def _on_listener_done(self, task: asyncio.Task[None]) -> None:
+        """End open streams if the listener stopped (next stream restarts it)."""
+        if self._listener is not None and task is not self._listener:
+            return  # Superseded by a newer listener
+        self._ready.clear()
+        self._close_clients()
+        exc = None if task.cancelled() else task.exception()
+        if exc is not None:
+            self._logger.error(
+                "SSE hub listener stopped unexpectedly",
+                extra={"error": str(exc), "error_type": type(exc).__name__},
+            )
+
+    async def _run(self) -> None:
+        """Read pub/sub messages forever, resubscribing after any failure.
+
+        A failed subscription ends every open stream (events published while
+        resubscribing would otherwise be silently missed), then retries with
+        exponential backoff. Errors while handling a single message are
+        logged and the message skipped.
+        """
+        delay = 1
+        while True:
+            pubsub = self.redis_client.pubsub()
+            try:
+                await pubsub.psubscribe(SSEChannelKeys.user_channel_pattern())
+                await pubsub.subscribe(SSEChannelKeys.broadcast_channel())
+                delay = 1
+
+                async for message in pubsub.listen():
+                    if message["type"] == "subscribe":
+                        # Broadcast subscription is confirmed last: Redis
+                        # now delivers everything published from here on
+                        self._ready.set()
+                        continue
+                    try:
+                        self._dispatch(message)
+                    except Exception as e:
+                        self._logger.error(
+                            "SSE hub failed to dispatch message",
+                            extra={
+                                "error": str(e),
+                                "error_type": type(e).__name__,
+                            },
+                        )
+
+                # listen() only returns once no subscriptions are left
+                raise RedisError("SSE hub subscription closed")
+
+            except Exception as e:
+                self._ready.clear()
+                self._close_clients()
+                log = (
+                    self._logger.warning
+                    if isinstance(e, RedisError)
+                    else self._logger.error
+                )
+                log(
+                    "SSE hub lost Redis subscription, reconnecting",
+                    extra={
+                        "error": str(e),
+                        "error_type": type(e).__name__,
+                        "retry_in_seconds": delay,
+                    },
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, SSE_HUB_RECONNECT_MAX_DELAY_SECONDS)
+            finally:
+                try:
+                    await pubsub.aclose()  # type: ignore[no-untyped-call]
+                except Exception as e:
+                    self._logger.warning(
+                        "Error closing SSE hub subscription",
+                        extra={"error": str(e)},
+                    )
+
+    def _close_clients(self) -> None:
+        """End every open stream (buffered events are delivered first)."""
+        for clients in self._clients.values():
+            for client in clients:
+                client.close()
+
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        """Route one pub/sub message to the matching connection queues.
+
+        Args:
+            message: Raw redis-py pub/sub message.
+        """
+        if message["type"] == "pmessage":
+            user_id = SSEChannelKeys.parse_user_id_from_channel(
+                self._decode(message["channel"])
+            )
+            if user_id is None or user_id not in self._clients:
+                return  # No local connection for this user: skip decoding
+            targets = list(self._clients[user_id])
+        elif message["type"] == "message":
+            targets = [
+                client for clients in self._clients.values() for client in clients
+            ]
+            if not targets:
+                return
+        else:
+            return  # psubscribe/unsubscribe confirmations
+
+        try:
+            event = SSEEvent.from_dict(json.loads(message["data"]))
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            self._logger.warning(
+                "Invalid SSE event data in hub",
+                extra={"error": str(e), "error_type": type(e).__name__},
+            )
+            return
+
+        for client in targets:
+            if client.offer(event):
+                self._dropped += 1
+        self._dispatched += len(targets)
+
+    @staticmethod
+    def _decode(value: bytes | str) -> str:
+        """Decode a Redis reply value (bytes or str client) to str."""
+        return value.decode("utf-8") if isinstance(value, bytes) else str(value)
@@ -32,8 +32,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan context manager.
 
     Handles startup and shutdown events:
-    - Startup: Initialize Casbin enforcer, load policies
-    - Shutdown: Cleanup resources (future)
+    - Startup: Initialize Casbin enforcer, load policies, start the local
+      cache invalidation listener, the batched audit writer and (if enabled)
+      the maintenance scheduler
+    - Shutdown: Stop the maintenance scheduler; let running sync jobs
+      finish; run coalesced net worth recalculations; close pooled provider
+      HTTP clients, the SSE hub, and the local cache invalidation listener;
+      drain queued audit records
 
     Args:
         app: FastAPI application instance.
@@ -46,9 +51,56 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     await init_enforcer()
 
+    # Startup: Apply L1 cache invalidations published by other workers
+    from src.core.container import get_cache_invalidation_bus
+
+    get_cache_invalidation_bus().start()
+
+    # Startup: Write audit records in batches off the request path
+    from src.core.container import get_audit_writer
+
+    get_audit_writer().start()
+
+    # Startup: Periodic session sweeps and stale account refresh (the
+    # worker holding the leader lock runs them)
+    from src.core.container import get_maintenance_scheduler
+
+    if settings.maintenance_scheduler_enabled:
+        get_maintenance_scheduler().start()
+
     yield
 
-    # Shutdown: Cleanup (future: close connections, etc.)
+    # Shutdown: Stop scheduling and release the leader lock
+    if settings.maintenance_scheduler_enabled:
+        await get_maintenance_scheduler().aclose()
+
+    # Shutdown: Finish (or cancel after a grace period) running sync jobs
+    # while provider clients and the audit writer are still available
+    from src.core.container import get_sync_job_runner
+
+    await get_sync_job_runner().aclose()
+
+    # Shutdown: Run net worth recalculations still waiting in their
+    # coalescing window (the last sync jobs may have scheduled some)
+    from src.core.container import get_portfolio_event_handler
+
+    await get_portfolio_event_handler().flush()
+
+    # Shutdown: Close pooled provider HTTP connections
+    from src.core.container import get_provider_http_clients
+
+    await get_provider_http_clients().aclose()
+
+    # Shutdown: Stop the SSE hub's shared pub/sub listener
+    from src.core.container import get_sse_hub
+
+    await get_sse_hub().aclose()
+
+    # Shutdown: Stop the local cache invalidation listener
+    await get_cache_invalidation_bus().aclose()
+
+    # Shutdown: Write every queued audit record before exiting
+    await get_audit_writer().aclose()
 
 
 # Initialize FastAPI application with settings and lifespan
@@ -30,9 +30,9 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.container import get_cache, get_db_session, get_token_service
+from src.core.container import get_db_session, get_session_cache, get_token_service
 from src.core.result import Failure, Success
-from src.domain.protocols import CacheProtocol, SessionCache
+from src.domain.protocols import SessionCache
 from src.domain.protocols.token_generation_protocol import TokenGenerationProtocol
 
 if TYPE_CHECKING:
@@ -195,7 +195,7 @@ async def get_current_user_optional(
 
 async def get_current_active_user(
     current_user: Annotated[CurrentUser, Depends(get_current_user)],
-    cache: Annotated[CacheProtocol, Depends(get_cache)],
+    session_cache: Annotated[SessionCache, Depends(get_session_cache)],
     session: Annotated[AsyncSession, Depends(get_db_session)],
 ) -> CurrentUser:
     """Get current user with session revocation check.
@@ -206,14 +206,14 @@ async def get_current_active_user(
     Flow:
         1. JWT already validated (by get_current_user dependency)
         2. Extract session_id from JWT payload
-        3. Check session in Redis cache (fast path <5ms)
+        3. Check session cache: in-process L1 tier, then Redis (fast path)
         4. If cache miss, check database (slow path ~50ms)
         5. Verify session exists and is NOT revoked
         6. Return 401 if session revoked
 
     Args:
         current_user: Current user from JWT (already validated).
-        cache: Redis cache for fast session lookups.
+        session_cache: App-scoped session cache (L1 tier + Redis).
         session: Database session for fallback lookups.
 
     Returns:
@@ -236,10 +236,7 @@ async def get_current_active_user(
     if current_user.session_id is None:
         return current_user
 
-    # Fast path: Check Redis cache (<5ms)
-    from src.infrastructure.cache import RedisSessionCache
-
-    session_cache: SessionCache = RedisSessionCache(cache=cache)
+    # Fast path: App-scoped session cache (in-process L1, then Redis)
     cached_session = await session_cache.get(current_user.session_id)
 
     if cached_session is not None:
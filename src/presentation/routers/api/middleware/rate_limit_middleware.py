@@ -4,6 +4,7 @@ This middleware intercepts all HTTP requests and applies rate limit
 based on the endpoint configuration. It handles:
 - IP-scoped rate limit for unauthenticated endpoints (login, register)
 - User-scoped rate limit for authenticated endpoints (optional JWT extraction)
+- Routes limited by several scopes checked in one atomic call
 - Proper HTTP 429 responses with RFC 6585 headers
 - Fail-open semantics (never blocks if rate limit infrastructure fails)
 
@@ -22,28 +23,36 @@ Reference:
 """
 
 import json
-from typing import TYPE_CHECKING, Awaitable, Callable
+from typing import TYPE_CHECKING
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
-from starlette.types import ASGIApp
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.core.config import settings
 from src.core.result import Success
-from src.infrastructure.rate_limit.config import get_rule_for_endpoint
+from src.infrastructure.rate_limit.config import RATE_LIMIT_INDEX
 
 if TYPE_CHECKING:
     from src.domain.protocols import RateLimitProtocol
     from src.domain.protocols.logger_protocol import LoggerProtocol
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Starlette middleware for rate limit on HTTP requests.
+class RateLimitMiddleware:
+    """ASGI middleware for rate limit on HTTP requests.
 
     Intercepts all HTTP requests and applies token bucket rate limit
     based on endpoint configuration. Returns HTTP 429 when rate limit exceeded.
 
+    Implemented as raw ASGI middleware (not BaseHTTPMiddleware): allowed
+    responses, including StreamingResponses, pass straight through with
+    rate limit headers added to the response start message.
+
+    Rules are resolved through RATE_LIMIT_INDEX (path templates compiled at
+    startup). Buckets are keyed by route template, and all enabled rules of
+    a route are checked with one RateLimitProtocol.check_route() call.
+
     Fail-Open Design:
         All errors result in allowing the request. Rate limit
         infrastructure failures should NEVER cause denial of service.
@@ -55,6 +64,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         - X-RateLimit-Reset: Seconds until bucket fully refills
 
     Attributes:
+        app: The wrapped ASGI application.
         _rate_limit: RateLimitProtocol implementation (lazy loaded from container).
         _logger: LoggerProtocol for structured logging (lazy loaded).
     """
@@ -65,7 +75,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         Args:
             app: The ASGI application to wrap.
         """
-        super().__init__(app)
+        self.app = app
         self._rate_limit: RateLimitProtocol | None = None
         self._logger: LoggerProtocol | None = None
 
@@ -93,77 +103,47 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             self._logger = get_logger()
         return self._logger
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        """Intercept request and apply rate limit.
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Intercept an HTTP request and apply rate limit.
 
         Args:
-            request: Incoming HTTP request.
-            call_next: Next handler in middleware chain.
-
-        Returns:
-            Response: Either rate limit error (429) or downstream response.
+            scope: ASGI connection scope.
+            receive: ASGI receive channel.
+            send: ASGI send channel.
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Skip rate limit for health checks and docs
-        path = request.url.path
+        path: str = scope["path"]
         if self._should_skip(path):
-            return await call_next(request)
-
-        # Build endpoint key: "METHOD /path"
-        endpoint = f"{request.method} {path}"
-
-        # Check if endpoint has a rate limit rule
-        rule = get_rule_for_endpoint(endpoint)
-        if rule is None or not rule.enabled:
-            # No rule or disabled - allow request
-            return await call_next(request)
-
-        # Extract identifier based on scope
-        identifier = self._extract_identifier(request, rule.scope.value)
+            await self.app(scope, receive, send)
+            return
+
+        # Resolve route template and its enabled rules
+        route = RATE_LIMIT_INDEX.match(scope["method"], path)
+        if route is None or not route.rules:
+            # No rule or all disabled - allow request
+            await self.app(scope, receive, send)
+            return
+
+        # Extract one identifier per rule scope
+        request = Request(scope)
+        identifiers = {
+            rule_scope: self._extract_identifier(request, rule_scope.value)
+            for rule_scope in route.scopes
+        }
+        endpoint = route.endpoint
+        identifier = identifiers[route.rules[0].scope]
 
         try:
-            # Check rate limit
+            # Check every bucket of the route in one call
             rate_limit = self._get_rate_limit()
-            result = await rate_limit.is_allowed(
+            result = await rate_limit.check_route(
                 endpoint=endpoint,
-                identifier=identifier,
-                cost=rule.cost,
+                identifiers=identifiers,
             )
-
-            match result:
-                case Success(value=rate_result):
-                    if not rate_result.allowed:
-                        # Rate limited - return 429
-                        return self._build_429_response(
-                            request=request,
-                            retry_after=rate_result.retry_after,
-                            limit=rate_result.limit,
-                            remaining=rate_result.remaining,
-                            reset_seconds=rate_result.reset_seconds,
-                        )
-
-                    # Allowed - continue to endpoint
-                    response = await call_next(request)
-
-                    # Add rate limit headers to response
-                    response.headers["X-RateLimit-Limit"] = str(rate_result.limit)
-                    response.headers["X-RateLimit-Remaining"] = str(
-                        rate_result.remaining
-                    )
-                    response.headers["X-RateLimit-Reset"] = str(
-                        rate_result.reset_seconds
-                    )
-
-                    return response
-
-                case _:
-                    # Failure result - fail-open
-                    self._log_fail_open(
-                        "rate_limit_result_failure", endpoint, identifier
-                    )
-                    return await call_next(request)
-
         except Exception as exc:
             # Fail-open on any exception
             self._log_fail_open(
@@ -172,7 +152,41 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 identifier,
                 error=str(exc),
             )
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
+
+        match result:
+            case Success(value=rate_result):
+                if not rate_result.allowed:
+                    # Rate limited - return 429
+                    response = self._build_429_response(
+                        request=request,
+                        retry_after=rate_result.retry_after,
+                        limit=rate_result.limit,
+                        remaining=rate_result.remaining,
+                        reset_seconds=rate_result.reset_seconds,
+                    )
+                    await response(scope, receive, send)
+                    return
+
+                # Allowed - continue to endpoint with rate limit headers
+                headers = {
+                    "X-RateLimit-Limit": str(rate_result.limit),
+                    "X-RateLimit-Remaining": str(rate_result.remaining),
+                    "X-RateLimit-Reset": str(rate_result.reset_seconds),
+                }
+
+                async def send_with_headers(message: Message) -> None:
+                    if message["type"] == "http.response.start":
+                        MutableHeaders(scope=message).update(headers)
+                    await send(message)
+
+                await self.app(scope, receive, send_with_headers)
+
+            case _:
+                # Failure result - fail-open
+                self._log_fail_open("rate_limit_result_failure", endpoint, identifier)
+                await self.app(scope, receive, send)
 
     def _should_skip(self, path: str) -> bool:
         """Check if path should skip rate limit.
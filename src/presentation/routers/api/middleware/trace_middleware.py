@@ -2,15 +2,18 @@
 
 - Adds X-Trace-Id response header
 - Exposes get_trace_id() helper for logging calls outside request handlers
+
+Implemented as raw ASGI middleware (not BaseHTTPMiddleware): the endpoint
+runs in the same task, so trace_id_context is visible to handlers and to
+the body of long-lived StreamingResponses (e.g., /events) without a task
+and memory-stream hop per request.
 """
 
 from contextvars import ContextVar
-from typing import Awaitable, Callable
-from uuid_extensions import uuid7
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from uuid_extensions import uuid7
 
 trace_id_context: ContextVar[str | None] = ContextVar("trace_id", default=None)
 
@@ -27,27 +30,39 @@ def get_trace_id() -> str | None:
     return trace_id_context.get()
 
 
-class TraceMiddleware(BaseHTTPMiddleware):
-    """Starlette middleware that injects a trace ID into each request context."""
+class TraceMiddleware:
+    """ASGI middleware that injects a trace ID into each request context."""
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        """Intercept a request to set and propagate a trace ID.
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize trace middleware.
 
         Args:
-            request (Request): Incoming request.
-            call_next (Callable[[Request], Awaitable[Response]]): Next handler.
+            app: The ASGI application to wrap.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Set and propagate a trace ID for an HTTP request.
 
-        Returns:
-            Response: Response with X-Trace-Id header added.
+        Args:
+            scope: ASGI connection scope.
+            receive: ASGI receive channel.
+            send: ASGI send channel (response start gets X-Trace-Id).
         """
-        trace_id = request.headers.get("X-Trace-Id") or str(uuid7())
-        trace_id_context.set(trace_id)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace_id = Headers(scope=scope).get("X-Trace-Id") or str(uuid7())
+        token = trace_id_context.set(trace_id)
+
+        async def send_with_trace_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Trace-Id"] = trace_id
+            await send(message)
+
         try:
-            response = await call_next(request)
-            response.headers["X-Trace-Id"] = trace_id
-            return response
+            await self.app(scope, receive, send_with_trace_id)
         finally:
             # Clear context after request to prevent leakage
-            trace_id_context.set(None)
+            trace_id_context.reset(token)
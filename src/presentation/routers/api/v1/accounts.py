@@ -6,7 +6,7 @@ Routes are registered via ROUTE_REGISTRY in routes/registry.py.
 Handlers:
     list_accounts              - List all accounts for user
     get_account                - Get account details
-    sync_accounts              - Sync accounts from provider
+    sync_accounts              - Start background account sync job
     list_accounts_by_connection - List accounts for a connection
 
 Reference:
@@ -14,15 +14,12 @@ Reference:
     - docs/architecture/error-handling-architecture.md
 """
 
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 from uuid import UUID
 
 from fastapi import Depends, Path, Query, Request
 from fastapi.responses import JSONResponse
 
-from src.application.commands.handlers.sync_accounts_handler import (
-    SyncAccountsHandler,
-)
 from src.application.commands.sync_commands import SyncAccounts
 from src.application.errors import ApplicationError, ApplicationErrorCode
 from src.application.queries.account_queries import (
@@ -32,21 +29,30 @@ from src.application.queries.account_queries import (
 )
 from src.domain.enums.account_type import AccountType
 from src.application.queries.handlers.get_account_handler import GetAccountHandler
+from src.application.queries.handlers.get_provider_handler import (
+    GetProviderConnectionHandler,
+)
 from src.application.queries.handlers.list_accounts_handler import (
     ListAccountsByConnectionHandler,
     ListAccountsByUserHandler,
 )
+from src.application.queries.provider_queries import GetProviderConnection
+from src.core.container import get_sync_job_runner
 from src.core.container.handler_factory import handler_factory
 from src.core.result import Failure
 from src.presentation.routers.api.middleware.auth_dependencies import AuthenticatedUser
 from src.presentation.routers.api.middleware.trace_middleware import get_trace_id
 from src.presentation.routers.api.v1.errors import ErrorResponseBuilder
+from src.infrastructure.jobs.sync_job_store import SyncJobKind
 from src.schemas.account_schemas import (
     AccountListResponse,
     AccountResponse,
     SyncAccountsRequest,
-    SyncAccountsResponse,
 )
+from src.schemas.sync_job_schemas import SyncJobResponse
+
+if TYPE_CHECKING:
+    from src.infrastructure.jobs.sync_job_runner import SyncJobRunner
 
 
 # =============================================================================
@@ -203,50 +209,72 @@ async def sync_accounts(
     request: Request,
     current_user: AuthenticatedUser,
     data: SyncAccountsRequest,
-    handler: SyncAccountsHandler = Depends(handler_factory(SyncAccountsHandler)),
-) -> SyncAccountsResponse | JSONResponse:
-    """Sync accounts from a provider connection.
+    connection_handler: GetProviderConnectionHandler = Depends(
+        handler_factory(GetProviderConnectionHandler)
+    ),
+    runner: "SyncJobRunner" = Depends(get_sync_job_runner),
+) -> SyncJobResponse | JSONResponse:
+    """Start a background account sync for a provider connection.
 
-    POST /api/v1/accounts/syncs → 201 Created
+    POST /api/v1/accounts/syncs → 202 Accepted
 
-    Fetches accounts from the provider and upserts them to the database.
-    Returns sync statistics (created/updated counts).
+    Returns immediately with a sync job; the accounts are fetched from the
+    provider and upserted in the background. Progress is streamed as
+    SYNC_ACCOUNTS_* SSE events and via GET /api/v1/sync-jobs/{job_id}.
+    A sync already queued or running for the connection is returned
+    instead of starting another one.
 
     Args:
         request: FastAPI request object.
         current_user: Authenticated user (from JWT).
         data: Sync request with connection_id and force flag.
-        handler: Sync accounts handler (injected).
+        connection_handler: Connection lookup (ownership check).
+        runner: Background sync job runner (app-scoped).
 
     Returns:
-        SyncAccountsResponse with sync statistics.
-        JSONResponse with RFC 9457 error on failure.
+        SyncJobResponse with the job id and status.
+        JSONResponse with RFC 9457 error if the connection is not the user's
+        (404/403) or the job could not be queued (503).
     """
+    # Reject connections the user does not own before queueing a job
+    ownership = await connection_handler.handle(
+        GetProviderConnection(
+            connection_id=data.connection_id,
+            user_id=current_user.user_id,
+        )
+    )
+    if isinstance(ownership, Failure):
+        return ErrorResponseBuilder.from_application_error(
+            error=_map_account_error(ownership.error),
+            request=request,
+            trace_id=get_trace_id() or "",
+        )
+
     command = SyncAccounts(
         user_id=current_user.user_id,
         connection_id=data.connection_id,
         force=data.force,
     )
-    result = await handler.handle(command)
+    result = await runner.submit(
+        kind=SyncJobKind.ACCOUNTS,
+        user_id=current_user.user_id,
+        target_id=data.connection_id,
+        command=command,
+    )
 
     if isinstance(result, Failure):
-        app_error = _map_account_error(result.error)
         return ErrorResponseBuilder.from_application_error(
-            error=app_error,
+            error=ApplicationError(
+                code=ApplicationErrorCode.SERVICE_UNAVAILABLE,
+                message="Failed to start account sync",
+            ),
             request=request,
             trace_id=get_trace_id() or "",
         )
 
-    # Convert handler result to response
-    sync_result = result.value
-    return SyncAccountsResponse(
-        created=sync_result.created,
-        updated=sync_result.updated,
-        unchanged=sync_result.unchanged,
-        errors=sync_result.errors,
-        message=sync_result.message,
-        accounts_created=sync_result.created,
-        accounts_updated=sync_result.updated,
+    submission = result.value
+    return SyncJobResponse.from_job(
+        submission.job, deduplicated=submission.deduplicated
     )
 
 
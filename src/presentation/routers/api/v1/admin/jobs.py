@@ -50,7 +50,8 @@ async def get_jobs_status(
     GET /api/v1/admin/jobs → 200 OK
 
     Returns detailed status of the dashtam-jobs background worker service,
-    including queue length, Redis connectivity, and health status.
+    including queue length, background sync job counts, Redis connectivity,
+    and health status.
 
     Requires admin role (Casbin RBAC).
 
@@ -82,5 +83,7 @@ async def get_jobs_status(
         healthy=status.healthy,
         queue_length=status.queue_length,
         redis_connected=status.redis_connected,
+        sync_jobs_queued=status.sync_jobs_queued,
+        sync_jobs_running=status.sync_jobs_running,
         error=status.error,
     )
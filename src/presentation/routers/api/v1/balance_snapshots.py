@@ -5,6 +5,7 @@ Routes are registered via ROUTE_REGISTRY in routes/registry.py.
 
 Handlers:
     get_latest_snapshots  - Get latest snapshots for user
+    get_user_balance_history - Get aggregate balance history for user
     get_balance_history   - Get balance history for account
     list_balance_snapshots - List balance snapshots for account
 
@@ -24,11 +25,13 @@ from src.application.errors import ApplicationError, ApplicationErrorCode
 from src.application.queries.balance_snapshot_queries import (
     GetBalanceHistory,
     GetLatestBalanceSnapshots,
+    GetUserBalanceHistory,
     ListBalanceSnapshotsByAccount,
 )
 from src.application.queries.handlers.balance_snapshot_handlers import (
     GetBalanceHistoryHandler,
     GetLatestBalanceSnapshotsHandler,
+    GetUserBalanceHistoryHandler,
     ListBalanceSnapshotsByAccountHandler,
 )
 from src.core.container.handler_factory import handler_factory
@@ -78,6 +81,11 @@ def _map_snapshot_error(error: str) -> ApplicationError:
             code=ApplicationErrorCode.QUERY_VALIDATION_FAILED,
             message=error,
         )
+    if "invalid granularity" in error_lower:
+        return ApplicationError(
+            code=ApplicationErrorCode.QUERY_VALIDATION_FAILED,
+            message=error,
+        )
 
     return ApplicationError(
         code=ApplicationErrorCode.QUERY_EXECUTION_FAILED,
@@ -117,6 +125,51 @@ async def get_latest_snapshots(
     return LatestSnapshotsResponse.from_dto(result.value)
 
 
+async def get_user_balance_history(
+    request: Request,
+    current_user: AuthenticatedUser,
+    start_date: Annotated[datetime, Query(description="Start of date range")],
+    end_date: Annotated[datetime, Query(description="End of date range")],
+    source: Annotated[
+        str | None,
+        Query(
+            description="Filter by snapshot source (account_sync, manual_sync, etc.)"
+        ),
+    ] = None,
+    granularity: Annotated[
+        str | None,
+        Query(description="Bucket size (hour, day, week, month)"),
+    ] = None,
+    handler: GetUserBalanceHistoryHandler = Depends(
+        handler_factory(GetUserBalanceHistoryHandler)
+    ),
+) -> BalanceHistoryResponse | JSONResponse:
+    """Get balance history across all of the user's accounts.
+
+    GET /api/v1/balance-history → 200 OK
+
+    With a granularity, returns balances summed across accounts per bucket.
+    """
+    query = GetUserBalanceHistory(
+        user_id=current_user.user_id,
+        start_date=start_date,
+        end_date=end_date,
+        source=source,
+        granularity=granularity,
+    )
+    result = await handler.handle(query)
+
+    if isinstance(result, Failure):
+        app_error = _map_snapshot_error(result.error)
+        return ErrorResponseBuilder.from_application_error(
+            error=app_error,
+            request=request,
+            trace_id=get_trace_id() or "",
+        )
+
+    return BalanceHistoryResponse.from_dto(result.value)
+
+
 # =============================================================================
 # Nested Handlers (/accounts/{id}/balance-history)
 # =============================================================================
@@ -134,6 +187,10 @@ async def get_balance_history(
             description="Filter by snapshot source (account_sync, manual_sync, etc.)"
         ),
     ] = None,
+    granularity: Annotated[
+        str | None,
+        Query(description="Bucket size (hour, day, week, month)"),
+    ] = None,
     handler: GetBalanceHistoryHandler = Depends(
         handler_factory(GetBalanceHistoryHandler)
     ),
@@ -142,7 +199,8 @@ async def get_balance_history(
 
     GET /api/v1/accounts/{id}/balance-history → 200 OK
 
-    Returns snapshots ordered chronologically for charting.
+    Returns snapshots ordered chronologically for charting, or one
+    aggregated bucket per period when granularity is set.
     """
     query = GetBalanceHistory(
         account_id=account_id,
@@ -150,6 +208,7 @@ async def get_balance_history(
         start_date=start_date,
         end_date=end_date,
         source=source,
+        granularity=granularity,
     )
     result = await handler.handle(query)
 
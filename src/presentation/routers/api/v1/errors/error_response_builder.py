@@ -119,6 +119,7 @@ class ErrorResponseBuilder:
             ApplicationErrorCode.NOT_FOUND: status.HTTP_404_NOT_FOUND,
             ApplicationErrorCode.CONFLICT: status.HTTP_409_CONFLICT,
             ApplicationErrorCode.RATE_LIMIT_EXCEEDED: status.HTTP_429_TOO_MANY_REQUESTS,
+            ApplicationErrorCode.SERVICE_UNAVAILABLE: status.HTTP_503_SERVICE_UNAVAILABLE,
         }
         return mapping.get(code, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
@@ -150,5 +151,6 @@ class ErrorResponseBuilder:
             ApplicationErrorCode.NOT_FOUND: "Resource Not Found",
             ApplicationErrorCode.CONFLICT: "Resource Conflict",
             ApplicationErrorCode.RATE_LIMIT_EXCEEDED: "Rate Limit Exceeded",
+            ApplicationErrorCode.SERVICE_UNAVAILABLE: "Service Unavailable",
         }
         return mapping.get(code, "Internal Server Error")
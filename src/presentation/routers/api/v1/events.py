@@ -86,18 +86,22 @@ async def get_events(
         yield f"retry: {SSE_RETRY_INTERVAL_MS}\n\n"
 
         # Replay missed events if last_event_id provided
+        # Streamed page by page so large gaps don't buffer in memory
+        replay_from: UUID | None = None
         if last_event_id:
             try:
-                missed = await subscriber.get_missed_events(
-                    user_id=current_user.user_id,
-                    last_event_id=UUID(last_event_id),
-                    categories=categories,
-                )
-                for event in missed:
-                    yield event.to_sse_format()
+                replay_from = UUID(last_event_id)
             except ValueError:
                 pass  # Invalid UUID, skip replay
 
+        if replay_from is not None:
+            async for event in subscriber.replay_missed_events(
+                user_id=current_user.user_id,
+                last_event_id=replay_from,
+                categories=categories,
+            ):
+                yield event.to_sse_format()
+
         # Stream live events with timeout-based heartbeat
         # Heartbeat is sent when no events arrive within the interval
         try:
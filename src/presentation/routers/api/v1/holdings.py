@@ -6,42 +6,43 @@ Routes are registered via ROUTE_REGISTRY in routes/registry.py.
 Handlers:
     list_holdings           - List all holdings for user
     list_holdings_by_account - List holdings for an account
-    sync_holdings           - Sync holdings from provider
+    sync_holdings           - Start background holdings sync job
 
 Reference:
     - docs/architecture/api-design-patterns.md
     - docs/architecture/error-handling-architecture.md
 """
 
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 from uuid import UUID
 
 from fastapi import Depends, Path, Query, Request
 from fastapi.responses import JSONResponse
 
-from src.application.commands.handlers.sync_holdings_handler import (
-    SyncHoldingsHandler,
-)
 from src.application.commands.sync_commands import SyncHoldings
 from src.application.errors import ApplicationError, ApplicationErrorCode
 from src.application.queries.holding_queries import (
     ListHoldingsByAccount,
     ListHoldingsByUser,
 )
+from src.application.queries.account_queries import GetAccount
+from src.application.queries.handlers.get_account_handler import GetAccountHandler
 from src.application.queries.handlers.list_holdings_handler import (
     ListHoldingsByAccountHandler,
     ListHoldingsByUserHandler,
 )
+from src.core.container import get_sync_job_runner
 from src.core.container.handler_factory import handler_factory
 from src.core.result import Failure
 from src.presentation.routers.api.middleware.auth_dependencies import AuthenticatedUser
 from src.presentation.routers.api.middleware.trace_middleware import get_trace_id
 from src.presentation.routers.api.v1.errors import ErrorResponseBuilder
-from src.schemas.holding_schemas import (
-    HoldingListResponse,
-    SyncHoldingsRequest,
-    SyncHoldingsResponse,
-)
+from src.infrastructure.jobs.sync_job_store import SyncJobKind
+from src.schemas.holding_schemas import HoldingListResponse, SyncHoldingsRequest
+from src.schemas.sync_job_schemas import SyncJobResponse
+
+if TYPE_CHECKING:
+    from src.infrastructure.jobs.sync_job_runner import SyncJobRunner
 
 
 # =============================================================================
@@ -221,50 +222,66 @@ async def sync_holdings(
     current_user: AuthenticatedUser,
     account_id: Annotated[UUID, Path(description="Account UUID")],
     data: SyncHoldingsRequest,
-    handler: SyncHoldingsHandler = Depends(handler_factory(SyncHoldingsHandler)),
-) -> SyncHoldingsResponse | JSONResponse:
-    """Sync holdings from provider for an account.
+    account_handler: GetAccountHandler = Depends(handler_factory(GetAccountHandler)),
+    runner: "SyncJobRunner" = Depends(get_sync_job_runner),
+) -> SyncJobResponse | JSONResponse:
+    """Start a background holdings sync for an account.
 
-    POST /api/v1/accounts/{id}/holdings/syncs → 201 Created
+    POST /api/v1/accounts/{id}/holdings/syncs → 202 Accepted
 
-    Fetches holdings from the provider and upserts them to the database.
-    Returns sync statistics (created/updated/deactivated counts).
+    Returns immediately with a sync job; holdings are fetched from the
+    provider and upserted in the background. Progress is streamed as
+    SYNC_HOLDINGS_* SSE events and via GET /api/v1/sync-jobs/{job_id}.
+    A holdings sync already queued or running for the account is returned
+    instead of starting another one.
 
     Args:
         request: FastAPI request object.
         current_user: Authenticated user (from JWT).
         account_id: Account UUID.
         data: Sync request with force flag.
-        handler: Sync holdings handler (injected).
+        account_handler: Account lookup (ownership check).
+        runner: Background sync job runner (app-scoped).
 
     Returns:
-        SyncHoldingsResponse with sync statistics.
-        JSONResponse with RFC 9457 error on failure.
+        SyncJobResponse with the job id and status.
+        JSONResponse with RFC 9457 error if the account is not the user's
+        (404/403) or the job could not be queued (503).
     """
+    # Reject accounts the user does not own before queueing a job
+    ownership = await account_handler.handle(
+        GetAccount(account_id=account_id, user_id=current_user.user_id)
+    )
+    if isinstance(ownership, Failure):
+        return ErrorResponseBuilder.from_application_error(
+            error=_map_holding_error(ownership.error),
+            request=request,
+            trace_id=get_trace_id() or "",
+        )
+
     command = SyncHoldings(
         account_id=account_id,
         user_id=current_user.user_id,
         force=data.force,
     )
-    result = await handler.handle(command)
+    result = await runner.submit(
+        kind=SyncJobKind.HOLDINGS,
+        user_id=current_user.user_id,
+        target_id=account_id,
+        command=command,
+    )
 
     if isinstance(result, Failure):
-        app_error = _map_holding_error(result.error)
         return ErrorResponseBuilder.from_application_error(
-            error=app_error,
+            error=ApplicationError(
+                code=ApplicationErrorCode.SERVICE_UNAVAILABLE,
+                message="Failed to start holdings sync",
+            ),
             request=request,
             trace_id=get_trace_id() or "",
         )
 
-    # Convert handler result to response
-    sync_result = result.value
-    return SyncHoldingsResponse(
-        created=sync_result.created,
-        updated=sync_result.updated,
-        unchanged=sync_result.unchanged,
-        errors=sync_result.errors,
-        message=sync_result.message,
-        holdings_created=sync_result.created,
-        holdings_updated=sync_result.updated,
-        holdings_deactivated=sync_result.deactivated,
+    submission = result.value
+    return SyncJobResponse.from_job(
+        submission.job, deduplicated=submission.deduplicated
     )
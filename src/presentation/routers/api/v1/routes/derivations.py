@@ -28,6 +28,7 @@ To Modify Rate Limits:
 
 Functions:
     build_rate_limit_rules: Generate rate limit rules dict from registry
+    build_rate_limit_route_rules: Generate every rule layer applying to each route
     _create_rate_limit_rule: Map RateLimitPolicy enum to RateLimitRule (Tier 2)
 
 Reference:
@@ -80,6 +81,39 @@ def build_rate_limit_rules(
     return rules
 
 
+def build_rate_limit_route_rules(
+    registry: list[RouteMetadata],
+) -> dict[str, tuple[RateLimitRule, ...]]:
+    """Build the rule layers checked for each endpoint.
+
+    Every endpoint is limited by its own policy rule first. The GLOBAL
+    policy (emergency brake, disabled by default) is layered on top of
+    every endpoint so enabling it in _create_rate_limit_rule() caps all
+    routes at once; disabled layers are dropped by the middleware index.
+
+    Args:
+        registry: List of route metadata entries from ROUTE_REGISTRY.
+
+    Returns:
+        Dict mapping endpoint strings to their rules (policy rule first).
+
+    Example:
+        >>> layers = build_rate_limit_route_rules(ROUTE_REGISTRY)
+        >>> [rule.scope for rule in layers["POST /api/v1/sessions"]]
+        [<RateLimitScope.IP: 'ip'>, <RateLimitScope.GLOBAL: 'global'>]
+    """
+    global_rule = _create_rate_limit_rule(RateLimitPolicy.GLOBAL)
+    layers: dict[str, tuple[RateLimitRule, ...]] = {}
+
+    for endpoint, rule in build_rate_limit_rules(registry).items():
+        if rule.scope == RateLimitScope.GLOBAL:
+            layers[endpoint] = (rule,)
+        else:
+            layers[endpoint] = (rule, global_rule)
+
+    return layers
+
+
 def _rule(
     max_tokens: int,
     refill_rate: float,
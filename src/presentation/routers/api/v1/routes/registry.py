@@ -5,7 +5,7 @@ The registry is used to generate FastAPI routes, rate limit rules, auth dependen
 and OpenAPI metadata at application startup.
 
 Registry structure:
-    - 37 total endpoints across 13 resource categories
+    - 41 total endpoints across 15 resource categories
     - Each entry is a RouteMetadata instance with complete specification
     - Handlers reference actual functions from router modules
     - Auth policies explicitly declared (PUBLIC, AUTHENTICATED, ADMIN, MANUAL_AUTH)
@@ -48,6 +48,7 @@ from src.presentation.routers.api.v1.admin.token_rotation import (
 from src.presentation.routers.api.v1.balance_snapshots import (
     get_balance_history,
     get_latest_snapshots,
+    get_user_balance_history,
     list_balance_snapshots,
 )
 from src.presentation.routers.api.v1.email_verifications import (
@@ -83,8 +84,10 @@ from src.presentation.routers.api.v1.sessions import (
     revoke_all_sessions,
     revoke_session,
 )
+from src.presentation.routers.api.v1.sync_jobs import get_sync_job
 from src.presentation.routers.api.v1.tokens import create_tokens
 from src.presentation.routers.api.v1.transactions import (
+    export_transactions_by_account,
     get_transaction,
     list_transactions_by_account,
     sync_transactions,
@@ -94,7 +97,6 @@ from src.presentation.routers.api.v1.users import create_user
 from src.schemas.account_schemas import (
     AccountListResponse,
     AccountResponse,
-    SyncAccountsResponse,
 )
 from src.schemas.auth_schemas import (
     EmailVerificationCreateResponse,
@@ -108,7 +110,7 @@ from src.schemas.balance_snapshot_schemas import (
     BalanceHistoryResponse,
     LatestSnapshotsResponse,
 )
-from src.schemas.holding_schemas import HoldingListResponse, SyncHoldingsResponse
+from src.schemas.holding_schemas import HoldingListResponse
 from src.schemas.import_schemas import ImportResponse, SupportedFormatsResponse
 from src.schemas.provider_schemas import (
     AuthorizationUrlResponse,
@@ -127,8 +129,8 @@ from src.schemas.session_schemas import (
     SessionResponse,
     SessionRevokeAllResponse,
 )
+from src.schemas.sync_job_schemas import SyncJobResponse
 from src.schemas.transaction_schemas import (
-    SyncTransactionsResponse,
     TransactionListResponse,
     TransactionResponse,
 )
@@ -567,14 +569,17 @@ ROUTE_REGISTRY: list[RouteMetadata] = [
         resource="accounts",
         tags=["Accounts"],
         summary="Sync accounts",
-        description="Sync accounts from a provider connection.",
+        description=(
+            "Start a background job that syncs accounts from a provider "
+            "connection. Follow progress via SSE or GET /sync-jobs/{job_id}."
+        ),
         operation_id="sync_accounts",
-        response_model=SyncAccountsResponse,
-        status_code=201,
+        response_model=SyncJobResponse,
+        status_code=202,
         errors=[
             ErrorSpec(status=404, description="Connection not found"),
             ErrorSpec(status=403, description="Not authorized to sync this connection"),
-            ErrorSpec(status=429, description="Sync rate limit exceeded"),
+            ErrorSpec(status=503, description="Sync jobs temporarily unavailable"),
         ],
         idempotency=IdempotencyLevel.NON_IDEMPOTENT,
         auth_policy=AuthPolicy(level=AuthLevel.AUTHENTICATED),
@@ -611,14 +616,17 @@ ROUTE_REGISTRY: list[RouteMetadata] = [
         resource="transactions",
         tags=["Transactions"],
         summary="Sync transactions",
-        description="Sync transactions from a provider connection.",
+        description=(
+            "Start a background job that syncs transactions from a provider "
+            "connection. Follow progress via SSE or GET /sync-jobs/{job_id}."
+        ),
         operation_id="sync_transactions",
-        response_model=SyncTransactionsResponse,
-        status_code=201,
+        response_model=SyncJobResponse,
+        status_code=202,
         errors=[
-            ErrorSpec(status=404, description="Connection or account not found"),
-            ErrorSpec(status=403, description="Not authorized to sync"),
-            ErrorSpec(status=429, description="Sync rate limit exceeded"),
+            ErrorSpec(status=404, description="Connection not found"),
+            ErrorSpec(status=403, description="Not authorized to sync this connection"),
+            ErrorSpec(status=503, description="Sync jobs temporarily unavailable"),
         ],
         idempotency=IdempotencyLevel.NON_IDEMPOTENT,
         auth_policy=AuthPolicy(level=AuthLevel.AUTHENTICATED),
@@ -650,21 +658,47 @@ ROUTE_REGISTRY: list[RouteMetadata] = [
         resource="holdings",
         tags=["Accounts"],
         summary="Sync holdings",
-        description="Sync holdings from provider for a specific account.",
+        description=(
+            "Start a background job that syncs holdings from the provider for "
+            "a specific account. Follow progress via SSE or "
+            "GET /sync-jobs/{job_id}."
+        ),
         operation_id="sync_holdings",
-        response_model=SyncHoldingsResponse,
-        status_code=201,
+        response_model=SyncJobResponse,
+        status_code=202,
         errors=[
             ErrorSpec(status=404, description="Account not found"),
             ErrorSpec(status=403, description="Not authorized to sync this account"),
-            ErrorSpec(status=429, description="Sync rate limit exceeded"),
+            ErrorSpec(status=503, description="Sync jobs temporarily unavailable"),
         ],
         idempotency=IdempotencyLevel.NON_IDEMPOTENT,
         auth_policy=AuthPolicy(level=AuthLevel.AUTHENTICATED),
         rate_limit_policy=RateLimitPolicy.PROVIDER_SYNC,
     ),
     # =========================================================================
-    # Balance Snapshots Resource (3 endpoints)
+    # Sync Jobs Resource (1 endpoint)
+    # =========================================================================
+    RouteMetadata(
+        method=HTTPMethod.GET,
+        path="/sync-jobs/{job_id}",
+        handler=get_sync_job,
+        resource="sync_jobs",
+        tags=["Sync Jobs"],
+        summary="Get sync job",
+        description="Get the status and result of a background sync job.",
+        operation_id="get_sync_job",
+        response_model=SyncJobResponse,
+        status_code=200,
+        errors=[
+            ErrorSpec(status=404, description="Sync job not found"),
+            ErrorSpec(status=503, description="Sync job status unavailable"),
+        ],
+        idempotency=IdempotencyLevel.SAFE,
+        auth_policy=AuthPolicy(level=AuthLevel.AUTHENTICATED),
+        rate_limit_policy=RateLimitPolicy.API_READ,
+    ),
+    # =========================================================================
+    # Balance Snapshots Resource (4 endpoints)
     # =========================================================================
     RouteMetadata(
         method=HTTPMethod.GET,
@@ -682,6 +716,27 @@ ROUTE_REGISTRY: list[RouteMetadata] = [
         auth_policy=AuthPolicy(level=AuthLevel.AUTHENTICATED),
         rate_limit_policy=RateLimitPolicy.API_READ,
     ),
+    RouteMetadata(
+        method=HTTPMethod.GET,
+        path="/balance-history",
+        handler=get_user_balance_history,
+        resource="balance_snapshots",
+        tags=["Balance Snapshots"],
+        summary="Get portfolio balance history",
+        description=(
+            "Get balance history across all of user's accounts. With a "
+            "granularity, balances are summed across accounts per bucket."
+        ),
+        operation_id="get_user_balance_history",
+        response_model=BalanceHistoryResponse,
+        status_code=200,
+        errors=[
+            ErrorSpec(status=400, description="Invalid date range or granularity"),
+        ],
+        idempotency=IdempotencyLevel.SAFE,
+        auth_policy=AuthPolicy(level=AuthLevel.AUTHENTICATED),
+        rate_limit_policy=RateLimitPolicy.API_READ,
+    ),
     RouteMetadata(
         method=HTTPMethod.GET,
         path="/accounts/{account_id}/balance-history",
@@ -696,7 +751,7 @@ ROUTE_REGISTRY: list[RouteMetadata] = [
         errors=[
             ErrorSpec(status=404, description="Account not found"),
             ErrorSpec(status=403, description="Not authorized to access this account"),
-            ErrorSpec(status=400, description="Invalid date range"),
+            ErrorSpec(status=400, description="Invalid date range or granularity"),
         ],
         idempotency=IdempotencyLevel.SAFE,
         auth_policy=AuthPolicy(level=AuthLevel.AUTHENTICATED),
@@ -843,7 +898,7 @@ ROUTE_REGISTRY: list[RouteMetadata] = [
         rate_limit_policy=RateLimitPolicy.API_READ,
     ),
     # =========================================================================
-    # Nested Resource Routes (4 endpoints)
+    # Nested Resource Routes (5 endpoints)
     # =========================================================================
     RouteMetadata(
         method=HTTPMethod.GET,
@@ -878,6 +933,7 @@ ROUTE_REGISTRY: list[RouteMetadata] = [
         response_model=TransactionListResponse,
         status_code=200,
         errors=[
+            ErrorSpec(status=400, description="Invalid cursor or transaction type"),
             ErrorSpec(status=404, description="Account not found"),
             ErrorSpec(status=403, description="Not authorized to access this account"),
         ],
@@ -885,6 +941,26 @@ ROUTE_REGISTRY: list[RouteMetadata] = [
         auth_policy=AuthPolicy(level=AuthLevel.AUTHENTICATED),
         rate_limit_policy=RateLimitPolicy.API_READ,
     ),
+    RouteMetadata(
+        method=HTTPMethod.GET,
+        path="/accounts/{account_id}/transactions/export",
+        handler=export_transactions_by_account,
+        resource="transactions",
+        tags=["Accounts"],
+        summary="Export transactions for account",
+        description="Stream all transactions of an account as NDJSON or CSV.",
+        operation_id="export_transactions_by_account",
+        response_model=None,  # StreamingResponse (NDJSON/CSV)
+        status_code=200,
+        errors=[
+            ErrorSpec(status=400, description="Invalid transaction type"),
+            ErrorSpec(status=404, description="Account not found"),
+            ErrorSpec(status=403, description="Not authorized to access this account"),
+        ],
+        idempotency=IdempotencyLevel.SAFE,
+        auth_policy=AuthPolicy(level=AuthLevel.AUTHENTICATED),
+        rate_limit_policy=RateLimitPolicy.EXPENSIVE_EXPORT,
+    ),
     RouteMetadata(
         method=HTTPMethod.GET,
         path="/accounts/{account_id}/holdings",
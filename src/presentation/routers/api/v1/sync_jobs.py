@@ -0,0 +1,83 @@
+"""Sync jobs resource handlers.
+
+Handler functions for background sync job endpoints.
+Routes are registered via ROUTE_REGISTRY in routes/registry.py.
+
+Handlers:
+    get_sync_job - Get status and result of a background sync job
+
+Reference:
+    - docs/architecture/api-design-patterns.md
+    - docs/architecture/error-handling-architecture.md
+"""
+
+from typing import TYPE_CHECKING, Annotated
+from uuid import UUID
+
+from fastapi import Depends, Path, Request
+from fastapi.responses import JSONResponse
+
+from src.application.errors import ApplicationError, ApplicationErrorCode
+from src.core.container import get_sync_job_runner
+from src.core.result import Failure
+from src.presentation.routers.api.middleware.auth_dependencies import AuthenticatedUser
+from src.presentation.routers.api.middleware.trace_middleware import get_trace_id
+from src.presentation.routers.api.v1.errors import ErrorResponseBuilder
+from src.schemas.sync_job_schemas import SyncJobResponse
+
+if TYPE_CHECKING:
+    from src.infrastructure.jobs.sync_job_runner import SyncJobRunner
+
+
+# =============================================================================
+# Handlers
+# =============================================================================
+
+
+async def get_sync_job(
+    request: Request,
+    current_user: AuthenticatedUser,
+    job_id: Annotated[UUID, Path(description="Sync job UUID")],
+    runner: "SyncJobRunner" = Depends(get_sync_job_runner),
+) -> SyncJobResponse | JSONResponse:
+    """Get a background sync job.
+
+    GET /api/v1/sync-jobs/{job_id} → 200 OK
+
+    Jobs are readable from any API worker for SYNC_JOB_TTL_SECONDS after
+    their last update. Jobs owned by other users are reported as not found.
+
+    Args:
+        request: FastAPI request object.
+        current_user: Authenticated user (from JWT).
+        job_id: Sync job UUID (from the 202 sync response).
+        runner: Background sync job runner (app-scoped).
+
+    Returns:
+        SyncJobResponse with status, summary message and result counts.
+        JSONResponse with RFC 9457 error on failure.
+    """
+    result = await runner.get_job(job_id)
+
+    if isinstance(result, Failure):
+        return ErrorResponseBuilder.from_application_error(
+            error=ApplicationError(
+                code=ApplicationErrorCode.SERVICE_UNAVAILABLE,
+                message="Failed to get sync job",
+            ),
+            request=request,
+            trace_id=get_trace_id() or "",
+        )
+
+    job = result.value
+    if job is None or job.user_id != current_user.user_id:
+        return ErrorResponseBuilder.from_application_error(
+            error=ApplicationError(
+                code=ApplicationErrorCode.NOT_FOUND,
+                message="Sync job not found",
+            ),
+            request=request,
+            trace_id=get_trace_id() or "",
+        )
+
+    return SyncJobResponse.from_job(job)
@@ -4,51 +4,66 @@ Handler functions for transaction management endpoints.
 Routes are registered via ROUTE_REGISTRY in routes/registry.py.
 
 Handlers:
-    get_transaction              - Get transaction details
-    sync_transactions            - Sync transactions from provider
-    list_transactions_by_account - List transactions for an account
+    get_transaction                - Get transaction details
+    sync_transactions              - Start background transaction sync job
+    list_transactions_by_account   - List transactions for an account
+    export_transactions_by_account - Stream all transactions (NDJSON/CSV)
 
 Reference:
     - docs/architecture/api-design-patterns.md
     - docs/architecture/error-handling-architecture.md
 """
 
+import csv
+import io
+from collections.abc import AsyncGenerator, AsyncIterator
 from datetime import date
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 from uuid import UUID
 
 from fastapi import Depends, Path, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from src.application.commands.handlers.sync_transactions_handler import (
-    SyncTransactionsHandler,
-)
 from src.application.commands.sync_commands import SyncTransactions
 from src.application.errors import ApplicationError, ApplicationErrorCode
+from src.application.queries.handlers.get_provider_handler import (
+    GetProviderConnectionHandler,
+)
 from src.application.queries.handlers.get_transaction_handler import (
     GetTransactionHandler,
+    TransactionResult,
 )
 from src.application.queries.handlers.list_transactions_handler import (
     ListTransactionsByAccountHandler,
     ListTransactionsByDateRangeHandler,
+    ListTransactionsForExportHandler,
 )
+from src.application.queries.provider_queries import GetProviderConnection
 from src.application.queries.transaction_queries import (
     GetTransaction,
     ListTransactionsByAccount,
     ListTransactionsByDateRange,
+    ListTransactionsForExport,
 )
+from src.core.constants import TRANSACTION_EXPORT_CHUNK_ROWS
+from src.core.container import get_sync_job_runner
 from src.core.container.handler_factory import handler_factory
 from src.core.result import Failure
 from src.presentation.routers.api.middleware.auth_dependencies import AuthenticatedUser
 from src.presentation.routers.api.middleware.trace_middleware import get_trace_id
 from src.presentation.routers.api.v1.errors import ErrorResponseBuilder
+from src.infrastructure.jobs.sync_job_store import SyncJobKind
+from src.schemas.sync_job_schemas import SyncJobResponse
 from src.schemas.transaction_schemas import (
     SyncTransactionsRequest,
-    SyncTransactionsResponse,
+    TransactionExportFormat,
     TransactionListResponse,
     TransactionResponse,
 )
 
+if TYPE_CHECKING:
+    from src.infrastructure.jobs.sync_job_runner import SyncJobRunner
+
 
 # =============================================================================
 # Error Mapping (String → ApplicationError)
@@ -147,27 +162,47 @@ async def sync_transactions(
     request: Request,
     current_user: AuthenticatedUser,
     data: SyncTransactionsRequest,
-    handler: SyncTransactionsHandler = Depends(
-        handler_factory(SyncTransactionsHandler)
+    connection_handler: GetProviderConnectionHandler = Depends(
+        handler_factory(GetProviderConnectionHandler)
     ),
-) -> SyncTransactionsResponse | JSONResponse:
-    """Sync transactions from a provider connection.
+    runner: "SyncJobRunner" = Depends(get_sync_job_runner),
+) -> SyncJobResponse | JSONResponse:
+    """Start a background transaction sync for a provider connection.
 
-    POST /api/v1/transactions/syncs → 201 Created
+    POST /api/v1/transactions/syncs → 202 Accepted
 
-    Fetches transactions from the provider and upserts them to the database.
-    Returns sync statistics (created/updated counts).
+    Returns immediately with a sync job; transactions are fetched from the
+    provider and stored in the background. Progress is streamed as
+    SYNC_TRANSACTIONS_* SSE events and via GET /api/v1/sync-jobs/{job_id}.
+    A transaction sync already queued or running for the connection is
+    returned instead of starting another one.
 
     Args:
         request: FastAPI request object.
         current_user: Authenticated user (from JWT).
         data: Sync request with connection_id and optional filters.
-        handler: Sync transactions handler (injected).
+        connection_handler: Connection lookup (ownership check).
+        runner: Background sync job runner (app-scoped).
 
     Returns:
-        SyncTransactionsResponse with sync statistics.
-        JSONResponse with RFC 9457 error on failure.
+        SyncJobResponse with the job id and status.
+        JSONResponse with RFC 9457 error if the connection is not the user's
+        (404/403) or the job could not be queued (503).
     """
+    # Reject connections the user does not own before queueing a job
+    ownership = await connection_handler.handle(
+        GetProviderConnection(
+            connection_id=data.connection_id,
+            user_id=current_user.user_id,
+        )
+    )
+    if isinstance(ownership, Failure):
+        return ErrorResponseBuilder.from_application_error(
+            error=_map_transaction_error(ownership.error),
+            request=request,
+            trace_id=get_trace_id() or "",
+        )
+
     command = SyncTransactions(
         user_id=current_user.user_id,
         connection_id=data.connection_id,
@@ -176,26 +211,26 @@ async def sync_transactions(
         end_date=data.end_date,
         force=data.force,
     )
-    result = await handler.handle(command)
+    result = await runner.submit(
+        kind=SyncJobKind.TRANSACTIONS,
+        user_id=current_user.user_id,
+        target_id=data.connection_id,
+        command=command,
+    )
 
     if isinstance(result, Failure):
-        app_error = _map_transaction_error(result.error)
         return ErrorResponseBuilder.from_application_error(
-            error=app_error,
+            error=ApplicationError(
+                code=ApplicationErrorCode.SERVICE_UNAVAILABLE,
+                message="Failed to start transaction sync",
+            ),
             request=request,
             trace_id=get_trace_id() or "",
         )
 
-    # Convert handler result to response
-    sync_result = result.value
-    return SyncTransactionsResponse(
-        created=sync_result.created,
-        updated=sync_result.updated,
-        unchanged=sync_result.unchanged,
-        errors=sync_result.errors,
-        message=sync_result.message,
-        transactions_created=sync_result.created,
-        transactions_updated=sync_result.updated,
+    submission = result.value
+    return SyncJobResponse.from_job(
+        submission.job, deduplicated=submission.deduplicated
     )
 
 
@@ -217,8 +252,12 @@ async def list_transactions_by_account(
     ] = 50,
     offset: Annotated[
         int,
-        Query(description="Number of results to skip", ge=0),
+        Query(description="Number of results to skip (deprecated, use cursor)", ge=0),
     ] = 0,
+    cursor: Annotated[
+        str | None,
+        Query(description="next_cursor from the previous page"),
+    ] = None,
     transaction_type: Annotated[
         str | None,
         Query(description="Filter by transaction type (e.g., trade, transfer)"),
@@ -242,16 +281,20 @@ async def list_transactions_by_account(
 
     GET /api/v1/accounts/{id}/transactions → 200 OK
 
-    Supports pagination via limit/offset and filtering by:
+    Supports keyset pagination via limit/cursor (pass the previous page's
+    next_cursor) and filtering by:
     - transaction_type: Filter to specific type (e.g., "trade")
     - start_date/end_date: Date range filter
 
+    limit/offset is still accepted but gets slower the deeper the page.
+
     Args:
         request: FastAPI request object.
         current_user: Authenticated user (from JWT).
         account_id: Account UUID.
         limit: Maximum results to return.
-        offset: Number of results to skip.
+        offset: Number of results to skip (ignored when cursor is given).
+        cursor: Keyset cursor from the previous page.
         transaction_type: Optional type filter.
         start_date: Optional start date filter.
         end_date: Optional end date filter.
@@ -278,6 +321,7 @@ async def list_transactions_by_account(
             limit=limit,
             offset=offset,
             transaction_type=transaction_type,
+            cursor=cursor,
         )
         result = await account_handler.handle(account_query)
 
@@ -290,3 +334,121 @@ async def list_transactions_by_account(
         )
 
     return TransactionListResponse.from_dto(result.value)
+
+
+async def export_transactions_by_account(
+    request: Request,
+    current_user: AuthenticatedUser,
+    account_id: Annotated[UUID, Path(description="Account UUID")],
+    export_format: Annotated[
+        TransactionExportFormat,
+        Query(alias="format", description="Export format (ndjson or csv)"),
+    ] = TransactionExportFormat.NDJSON,
+    transaction_type: Annotated[
+        str | None,
+        Query(description="Filter by transaction type (e.g., trade, transfer)"),
+    ] = None,
+    handler: ListTransactionsForExportHandler = Depends(
+        handler_factory(ListTransactionsForExportHandler)
+    ),
+) -> StreamingResponse | JSONResponse:
+    """Export all transactions of an account.
+
+    GET /api/v1/accounts/{id}/transactions/export → 200 OK
+
+    Streams every transaction (most recent first) as NDJSON or CSV. Rows are
+    read from a server-side cursor and written in chunks, so memory use does
+    not depend on the size of the account.
+
+    Args:
+        request: FastAPI request object.
+        current_user: Authenticated user (from JWT).
+        account_id: Account UUID.
+        export_format: Output format (?format=ndjson|csv).
+        transaction_type: Optional type filter.
+        handler: Export transactions handler (injected).
+
+    Returns:
+        StreamingResponse with the export as an attachment.
+        JSONResponse with RFC 9457 error on failure.
+    """
+    query = ListTransactionsForExport(
+        account_id=account_id,
+        user_id=current_user.user_id,
+        transaction_type=transaction_type,
+    )
+    result = await handler.handle(query)
+
+    if isinstance(result, Failure):
+        app_error = _map_transaction_error(result.error)
+        return ErrorResponseBuilder.from_application_error(
+            error=app_error,
+            request=request,
+            trace_id=get_trace_id() or "",
+        )
+
+    if export_format is TransactionExportFormat.CSV:
+        body = _csv_chunks(result.value)
+        media_type = "text/csv"
+    else:
+        body = _ndjson_chunks(result.value)
+        media_type = "application/x-ndjson"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="transactions-{account_id}.'
+                f'{export_format.value}"'
+            ),
+        },
+    )
+
+
+async def _ndjson_chunks(
+    transactions: AsyncIterator[TransactionResult],
+) -> AsyncGenerator[str, None]:
+    """Serialize transactions as NDJSON, TRANSACTION_EXPORT_CHUNK_ROWS per chunk.
+
+    Args:
+        transactions: Stream of transaction DTOs.
+
+    Yields:
+        Chunks of newline-terminated JSON objects.
+    """
+    lines: list[str] = []
+    async for dto in transactions:
+        lines.append(TransactionResponse.from_dto(dto).model_dump_json() + "\n")
+        if len(lines) >= TRANSACTION_EXPORT_CHUNK_ROWS:
+            yield "".join(lines)
+            lines.clear()
+    if lines:
+        yield "".join(lines)
+
+
+async def _csv_chunks(
+    transactions: AsyncIterator[TransactionResult],
+) -> AsyncGenerator[str, None]:
+    """Serialize transactions as CSV, TRANSACTION_EXPORT_CHUNK_ROWS per chunk.
+
+    Args:
+        transactions: Stream of transaction DTOs.
+
+    Yields:
+        Header row, then chunks of CSV rows.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(TransactionResponse.model_fields))
+    writer.writeheader()
+    rows = 0
+    async for dto in transactions:
+        writer.writerow(TransactionResponse.from_dto(dto).model_dump(mode="json"))
+        rows += 1
+        if rows >= TRANSACTION_EXPORT_CHUNK_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    if buffer.tell():
+        yield buffer.getvalue()
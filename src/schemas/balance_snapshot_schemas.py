@@ -16,6 +16,7 @@ from uuid import UUID
 from pydantic import BaseModel, Field
 
 from src.application.queries.handlers.balance_snapshot_handlers import (
+    BalanceBucketResult,
     BalanceHistoryResult,
     BalanceSnapshotResult,
     LatestSnapshotsResult,
@@ -96,19 +97,81 @@ class BalanceSnapshotResponse(BaseModel):
         )
 
 
+class BalanceBucketResponse(BaseModel):
+    """Single balance history bucket response.
+
+    Attributes:
+        bucket_start: Start of the bucket (UTC).
+        currency: ISO 4217 currency code.
+        open_balance: Balance at the first snapshot in the bucket.
+        close_balance: Balance at the last snapshot in the bucket.
+        min_balance: Lowest balance in the bucket (nullable).
+        max_balance: Highest balance in the bucket (nullable).
+        snapshot_count: Number of snapshots in the bucket.
+        account_count: Number of accounts contributing to the bucket.
+        change_amount: Close change from previous bucket (nullable).
+        change_percent: Percentage close change (nullable).
+    """
+
+    bucket_start: datetime = Field(..., description="Start of the bucket (UTC)")
+    currency: str = Field(..., description="ISO 4217 currency code", examples=["USD"])
+    open_balance: Decimal = Field(..., description="Balance at first snapshot")
+    close_balance: Decimal = Field(..., description="Balance at last snapshot")
+    min_balance: Decimal | None = Field(
+        None, description="Lowest balance (omitted for user totals)"
+    )
+    max_balance: Decimal | None = Field(
+        None, description="Highest balance (omitted for user totals)"
+    )
+    snapshot_count: int = Field(..., description="Snapshots in the bucket")
+    account_count: int = Field(..., description="Accounts contributing")
+    change_amount: Decimal | None = Field(
+        None, description="Close change from previous bucket"
+    )
+    change_percent: float | None = Field(
+        None, description="Percentage close change from previous bucket"
+    )
+
+    @classmethod
+    def from_dto(cls, dto: BalanceBucketResult) -> "BalanceBucketResponse":
+        """Convert application DTO to response schema.
+
+        Args:
+            dto: BalanceBucketResult from handler.
+
+        Returns:
+            BalanceBucketResponse for API response.
+        """
+        return cls(
+            bucket_start=dto.bucket_start,
+            currency=dto.currency,
+            open_balance=dto.open_balance,
+            close_balance=dto.close_balance,
+            min_balance=dto.min_balance,
+            max_balance=dto.max_balance,
+            snapshot_count=dto.snapshot_count,
+            account_count=dto.account_count,
+            change_amount=dto.change_amount,
+            change_percent=dto.change_percent,
+        )
+
+
 class BalanceHistoryResponse(BaseModel):
     """Balance history response for charting.
 
-    Includes computed metrics for change tracking.
+    Includes computed metrics for change tracking. When a granularity was
+    requested, buckets holds the series and snapshots is empty.
 
     Attributes:
         snapshots: List of snapshot responses (ordered by time).
-        total_count: Total number of snapshots in range.
+        total_count: Total number of snapshots (or buckets) in range.
         start_balance: Balance at start of period (nullable).
         end_balance: Balance at end of period (nullable).
         total_change_amount: Change over period (nullable).
         total_change_percent: Percentage change over period (nullable).
         currency: Currency of the values (nullable).
+        granularity: Bucket size (nullable).
+        buckets: List of bucket responses (ordered by bucket_start).
     """
 
     snapshots: list[BalanceSnapshotResponse] = Field(
@@ -126,6 +189,12 @@ class BalanceHistoryResponse(BaseModel):
         None, description="Percentage change over period"
     )
     currency: str | None = Field(None, description="Currency of values")
+    granularity: str | None = Field(
+        None, description="Bucket size", examples=["day", "week"]
+    )
+    buckets: list[BalanceBucketResponse] = Field(
+        default_factory=list, description="Time-bucketed balances"
+    )
 
     @classmethod
     def from_dto(cls, dto: BalanceHistoryResult) -> "BalanceHistoryResponse":
@@ -145,6 +214,8 @@ class BalanceHistoryResponse(BaseModel):
             total_change_amount=dto.total_change_amount,
             total_change_percent=dto.total_change_percent,
             currency=dto.currency,
+            granularity=dto.granularity,
+            buckets=[BalanceBucketResponse.from_dto(b) for b in dto.buckets],
         )
 
 
@@ -194,6 +265,7 @@ class BalanceHistoryRequest(BaseModel):
         start_date: Start of date range (inclusive).
         end_date: End of date range (inclusive).
         source: Optional filter by snapshot source.
+        granularity: Optional bucket size (hour, day, week, month).
     """
 
     start_date: datetime = Field(..., description="Start of date range")
@@ -203,3 +275,8 @@ class BalanceHistoryRequest(BaseModel):
         description="Filter by snapshot source",
         examples=["account_sync", "manual_sync"],
     )
+    granularity: str | None = Field(
+        None,
+        description="Bucket size (omit for raw snapshots)",
+        examples=["hour", "day", "week", "month"],
+    )
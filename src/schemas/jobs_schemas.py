@@ -36,6 +36,14 @@ class JobsStatusResponse(BaseModel):
         ...,
         description="Whether the jobs Redis instance is connected",
     )
+    sync_jobs_queued: int = Field(
+        0,
+        description="Background sync jobs waiting for a worker slot (all workers)",
+    )
+    sync_jobs_running: int = Field(
+        0,
+        description="Background sync jobs currently running (all workers)",
+    )
     error: str | None = Field(
         None,
         description="Error message if unhealthy (null when healthy)",
@@ -47,6 +55,8 @@ class JobsStatusResponse(BaseModel):
                 "healthy": True,
                 "queue_length": 3,
                 "redis_connected": True,
+                "sync_jobs_queued": 1,
+                "sync_jobs_running": 2,
                 "error": None,
             }
         }
@@ -0,0 +1,107 @@
+"""Background sync job request/response schemas.
+
+Pydantic models for background provider sync jobs. Sync endpoints accept
+the sync as a job and return 202 Accepted; clients follow progress through
+SYNC_* SSE events or by polling the job.
+
+RESTful Endpoints:
+    POST   /api/v1/accounts/syncs                  - Start account sync job
+    POST   /api/v1/transactions/syncs              - Start transaction sync job
+    POST   /api/v1/accounts/{id}/holdings/syncs    - Start holdings sync job
+    GET    /api/v1/sync-jobs/{job_id}              - Get sync job status
+"""
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+if TYPE_CHECKING:
+    from src.infrastructure.jobs.sync_job_store import SyncJob
+
+
+# =============================================================================
+# Sync Job Response
+# =============================================================================
+
+
+class SyncJobResponse(BaseModel):
+    """Response schema for a background sync job.
+
+    POST /api/v1/accounts/syncs (and other sync endpoints)
+    Returns: 202 Accepted
+
+    GET /api/v1/sync-jobs/{job_id}
+    Returns: 200 OK
+    """
+
+    job_id: UUID = Field(..., description="Sync job identifier")
+    kind: str = Field(..., description="Sync kind: accounts, transactions or holdings")
+    status: str = Field(
+        ..., description="Job state: queued, running, succeeded or failed"
+    )
+    target_id: UUID = Field(
+        ...,
+        description="Connection (accounts, transactions) or account (holdings) "
+        "being synced",
+    )
+    deduplicated: bool = Field(
+        False,
+        description="True if an unfinished job for the same target was returned "
+        "instead of starting a new one",
+    )
+    created_at: datetime = Field(..., description="When the job was accepted")
+    started_at: datetime | None = Field(None, description="When the job started")
+    finished_at: datetime | None = Field(
+        None, description="When the job succeeded or failed"
+    )
+    message: str | None = Field(None, description="Sync summary (on success)")
+    error: str | None = Field(None, description="Failure reason (on failure)")
+    result: dict[str, Any] | None = Field(
+        None,
+        description="Sync statistics (created/updated/unchanged counts) on success",
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "job_id": "01941a2b-7c3d-7e4f-8a9b-0c1d2e3f4a5b",
+                "kind": "accounts",
+                "status": "succeeded",
+                "target_id": "01941a2b-0000-7e4f-8a9b-0c1d2e3f4a5b",
+                "deduplicated": False,
+                "created_at": "2026-01-15T10:00:00Z",
+                "started_at": "2026-01-15T10:00:00Z",
+                "finished_at": "2026-01-15T10:00:04Z",
+                "message": "Synced 2 accounts: 1 created, 1 updated, 0 unchanged",
+                "error": None,
+                "result": {"created": 1, "updated": 1, "unchanged": 0, "errors": 0},
+            }
+        }
+    )
+
+    @classmethod
+    def from_job(cls, job: "SyncJob", deduplicated: bool = False) -> "SyncJobResponse":
+        """Convert a SyncJob to response schema.
+
+        Args:
+            job: Sync job status.
+            deduplicated: Whether the job was returned for a duplicate submit.
+
+        Returns:
+            SyncJobResponse instance.
+        """
+        return cls(
+            job_id=job.job_id,
+            kind=job.kind.value,
+            status=job.status.value,
+            target_id=job.target_id,
+            deduplicated=deduplicated,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            message=job.message,
+            error=job.error,
+            result=job.result,
+        )
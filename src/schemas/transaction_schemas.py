@@ -11,6 +11,7 @@ Reference:
 
 from datetime import date, datetime
 from decimal import Decimal
+from enum import Enum
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -149,6 +150,7 @@ class TransactionListResponse(BaseModel):
         transactions: List of transactions.
         total_count: Total count of transactions.
         has_more: Whether more results are available.
+        next_cursor: Cursor for the next page (None on the last page).
     """
 
     transactions: list[TransactionResponse] = Field(
@@ -156,6 +158,9 @@ class TransactionListResponse(BaseModel):
     )
     total_count: int = Field(..., description="Total transaction count")
     has_more: bool = Field(..., description="Whether more results available")
+    next_cursor: str | None = Field(
+        None, description="Pass as ?cursor= to fetch the next page"
+    )
 
     @classmethod
     def from_dto(cls, dto: TransactionListResult) -> "TransactionListResponse":
@@ -171,9 +176,22 @@ class TransactionListResponse(BaseModel):
             transactions=[TransactionResponse.from_dto(t) for t in dto.transactions],
             total_count=dto.total_count,
             has_more=dto.has_more,
+            next_cursor=dto.next_cursor,
         )
 
 
+class TransactionExportFormat(str, Enum):
+    """Output format of a transaction export.
+
+    Attributes:
+        NDJSON: One TransactionResponse JSON object per line.
+        CSV: Header row of TransactionResponse fields, one row per transaction.
+    """
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
 class SyncTransactionsResponse(SyncResponse):
     """Response for transaction sync operation.
 
@@ -3,7 +3,7 @@
 Tests the complete HTTP request/response cycle for account management:
 - GET /api/v1/accounts (list user accounts)
 - GET /api/v1/accounts/{id} (get account details)
-- POST /api/v1/accounts/syncs (sync accounts from providers)
+- POST /api/v1/accounts/syncs (start background account sync job)
 - GET /api/v1/providers/{id}/accounts (list accounts for provider connection)
 
 Architecture:
@@ -22,16 +22,23 @@ import pytest
 from fastapi.testclient import TestClient
 from uuid_extensions import uuid7
 
-from src.application.commands.handlers.sync_accounts_handler import (
-    SyncAccountsHandler,
-)
 from src.application.queries.handlers.get_account_handler import GetAccountHandler
+from src.application.queries.handlers.get_provider_handler import (
+    GetProviderConnectionHandler,
+)
 from src.application.queries.handlers.list_accounts_handler import (
     ListAccountsByConnectionHandler,
     ListAccountsByUserHandler,
 )
+from src.application.commands.sync_commands import SyncAccounts
+from src.core.container import get_sync_job_runner
 from src.core.container.handler_factory import handler_factory
+from src.core.enums import ErrorCode
 from src.core.result import Failure, Success
+from src.infrastructure.enums import InfrastructureErrorCode
+from src.infrastructure.errors import InfrastructureError
+from src.infrastructure.jobs.sync_job_runner import SyncJobSubmission
+from src.infrastructure.jobs.sync_job_store import SyncJob, SyncJobKind, SyncJobStatus
 from src.main import app
 
 
@@ -65,17 +72,6 @@ class MockAccountResult:
     updated_at: datetime
 
 
-@dataclass
-class MockSyncAccountsResult:
-    """Mock result matching SyncAccountsResult from sync_accounts_handler.py."""
-
-    created: int
-    updated: int
-    unchanged: int
-    errors: int
-    message: str
-
-
 @dataclass
 class MockAccountListResult:
     """Mock result matching AccountListResult from list_accounts_handler.py."""
@@ -126,27 +122,55 @@ class MockGetAccountHandler:
         return Success(value=self._account)
 
 
-class MockSyncAccountsHandler:
-    """Mock handler for syncing accounts."""
+class MockGetConnectionHandler:
+    """Mock handler for the connection ownership check."""
 
-    def __init__(
-        self,
-        result: MockSyncAccountsResult | None = None,
-        error: str | None = None,
-    ) -> None:
-        self._result = result or MockSyncAccountsResult(
-            created=2,
-            updated=3,
-            unchanged=0,
-            errors=0,
-            message="Synced 5 accounts: 2 created, 3 updated, 0 unchanged",
-        )
+    def __init__(self, error: str | None = None) -> None:
         self._error = error
 
-    async def handle(self, command: Any) -> Success[object] | Failure[str]:
+    async def handle(self, query: Any) -> Success[object] | Failure[str]:
         if self._error:
             return Failure(error=self._error)
-        return Success(value=self._result)
+        return Success(value=None)
+
+
+class MockSyncJobRunner:
+    """Mock SyncJobRunner recording submitted commands."""
+
+    def __init__(
+        self,
+        active_job: SyncJob | None = None,
+        redis_down: bool = False,
+    ) -> None:
+        self._active_job = active_job
+        self._redis_down = redis_down
+        self.submitted: list[tuple[SyncJobKind, UUID, Any]] = []
+
+    async def submit(
+        self, *, kind: SyncJobKind, user_id: UUID, target_id: UUID, command: Any
+    ) -> Success[SyncJobSubmission] | Failure[InfrastructureError]:
+        if self._redis_down:
+            return Failure(
+                error=InfrastructureError(
+                    code=ErrorCode.SERVICE_UNAVAILABLE,
+                    infrastructure_code=InfrastructureErrorCode.CONNECTION_ERROR,
+                    message="Failed to enqueue sync job",
+                )
+            )
+        self.submitted.append((kind, target_id, command))
+        if self._active_job is not None:
+            return Success(
+                value=SyncJobSubmission(job=self._active_job, deduplicated=True)
+            )
+        job = SyncJob(
+            job_id=uuid7(),
+            kind=kind,
+            status=SyncJobStatus.QUEUED,
+            user_id=user_id,
+            target_id=target_id,
+            created_at=datetime.now(UTC),
+        )
+        return Success(value=SyncJobSubmission(job=job))
 
 
 # =============================================================================
@@ -367,28 +391,74 @@ class TestGetAccount:
 class TestSyncAccounts:
     """Tests for POST /api/v1/accounts/syncs endpoint."""
 
-    def test_sync_accounts_success(self, client, mock_connection_id):
-        """POST /api/v1/accounts/syncs triggers account sync."""
-        factory_key = handler_factory(SyncAccountsHandler)
-        app.dependency_overrides[factory_key] = lambda: MockSyncAccountsHandler()
+    @pytest.fixture(autouse=True)
+    def owned_target(self):
+        """Let the ownership check pass unless a test overrides it."""
+        factory_key = handler_factory(GetProviderConnectionHandler)
+        app.dependency_overrides[factory_key] = lambda: MockGetConnectionHandler()
+        yield
+        app.dependency_overrides.pop(factory_key, None)
+
+    def test_sync_accounts_returns_202_with_job(
+        self, client, mock_user_id, mock_connection_id
+    ):
+        """POST /api/v1/accounts/syncs queues a sync job and returns 202."""
+        runner = MockSyncJobRunner()
+        app.dependency_overrides[get_sync_job_runner] = lambda: runner
+
+        response = client.post(
+            "/api/v1/accounts/syncs",
+            json={"connection_id": str(mock_connection_id), "force": True},
+        )
+
+        assert response.status_code == 202
+        data = response.json()
+        assert data["kind"] == "accounts"
+        assert data["status"] == "queued"
+        assert data["target_id"] == str(mock_connection_id)
+        assert data["deduplicated"] is False
+        kind, target_id, command = runner.submitted[0]
+        assert kind == SyncJobKind.ACCOUNTS
+        assert target_id == mock_connection_id
+        assert command == SyncAccounts(
+            user_id=mock_user_id, connection_id=mock_connection_id, force=True
+        )
+
+        app.dependency_overrides.pop(get_sync_job_runner, None)
+
+    def test_sync_accounts_returns_active_job(
+        self, client, mock_user_id, mock_connection_id
+    ):
+        """POST /api/v1/accounts/syncs returns the running job for duplicates."""
+        active_job = SyncJob(
+            job_id=uuid7(),
+            kind=SyncJobKind.ACCOUNTS,
+            status=SyncJobStatus.RUNNING,
+            user_id=mock_user_id,
+            target_id=mock_connection_id,
+            created_at=datetime.now(UTC),
+            started_at=datetime.now(UTC),
+        )
+        runner = MockSyncJobRunner(active_job=active_job)
+        app.dependency_overrides[get_sync_job_runner] = lambda: runner
 
         response = client.post(
             "/api/v1/accounts/syncs",
             json={"connection_id": str(mock_connection_id)},
         )
 
-        assert response.status_code == 201
+        assert response.status_code == 202
         data = response.json()
-        assert data["created"] == 2
-        assert data["updated"] == 3
+        assert data["job_id"] == str(active_job.job_id)
+        assert data["status"] == "running"
+        assert data["deduplicated"] is True
 
-        app.dependency_overrides.pop(factory_key, None)
+        app.dependency_overrides.pop(get_sync_job_runner, None)
 
-    def test_sync_accounts_connection_not_found(self, client, mock_connection_id):
-        """POST /api/v1/accounts/syncs returns 404 for invalid connection."""
-        factory_key = handler_factory(SyncAccountsHandler)
-        app.dependency_overrides[factory_key] = lambda: MockSyncAccountsHandler(
-            error="Connection not found"
+    def test_sync_accounts_enqueue_failure(self, client, mock_connection_id):
+        """POST /api/v1/accounts/syncs returns 503 when the job can't be queued."""
+        app.dependency_overrides[get_sync_job_runner] = lambda: MockSyncJobRunner(
+            redis_down=True
         )
 
         response = client.post(
@@ -396,21 +466,40 @@ class TestSyncAccounts:
             json={"connection_id": str(mock_connection_id)},
         )
 
-        assert response.status_code == 404
+        assert response.status_code == 503
+        assert response.json()["status"] == 503
 
-        app.dependency_overrides.pop(factory_key, None)
+        app.dependency_overrides.pop(get_sync_job_runner, None)
+
+    def test_sync_accounts_not_owned(self, client, mock_connection_id):
+        """POST /api/v1/accounts/syncs returns 403 without queueing a job."""
+        runner = MockSyncJobRunner()
+        app.dependency_overrides[get_sync_job_runner] = lambda: runner
+        app.dependency_overrides[handler_factory(GetProviderConnectionHandler)] = (
+            lambda: MockGetConnectionHandler(error="Connection not owned by user")
+        )
+
+        response = client.post(
+            "/api/v1/accounts/syncs",
+            json={"connection_id": str(mock_connection_id)},
+        )
+
+        assert response.status_code == 403
+        assert runner.submitted == []
+
+        app.dependency_overrides.pop(get_sync_job_runner, None)
 
     def test_sync_accounts_missing_connection_id(self, client):
         """POST /api/v1/accounts/syncs returns 422 when connection_id missing."""
-        factory_key = handler_factory(SyncAccountsHandler)
-        # Mock handler to prevent encryption init during validation
-        app.dependency_overrides[factory_key] = lambda: MockSyncAccountsHandler()
+        runner = MockSyncJobRunner()
+        app.dependency_overrides[get_sync_job_runner] = lambda: runner
 
         response = client.post("/api/v1/accounts/syncs", json={})
 
         assert response.status_code == 422
+        assert runner.submitted == []
 
-        app.dependency_overrides.pop(factory_key, None)
+        app.dependency_overrides.pop(get_sync_job_runner, None)
 
 
 # =============================================================================
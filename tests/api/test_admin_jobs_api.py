@@ -187,6 +187,14 @@ class TestAdminJobsEndpoint:
         assert "redis_connected" in data
         assert isinstance(data["redis_connected"], bool)
 
+    def test_response_includes_sync_job_counts(self, client) -> None:
+        """Response should include background sync job counts."""
+        response = client.get("/api/v1/admin/jobs")
+
+        data = response.json()
+        assert data["sync_jobs_queued"] == 0
+        assert data["sync_jobs_running"] == 0
+
     def test_healthy_status_shows_correct_values(self, client, healthy_monitor) -> None:
         """Healthy jobs service should return correct status values."""
         app.dependency_overrides[get_jobs_monitor] = lambda: healthy_monitor
@@ -2,6 +2,7 @@
 
 Tests the complete HTTP request/response cycle for balance tracking:
 - GET /api/v1/balance-snapshots (latest snapshots for user)
+- GET /api/v1/balance-history (aggregate history for user)
 - GET /api/v1/accounts/{id}/balance-history (history for account)
 - GET /api/v1/accounts/{id}/balance-snapshots (list snapshots)
 
@@ -11,7 +12,7 @@ Architecture:
 - Mocks handlers to test HTTP layer behavior
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from typing import Any
@@ -24,6 +25,7 @@ from uuid_extensions import uuid7
 from src.application.queries.handlers.balance_snapshot_handlers import (
     GetBalanceHistoryHandler,
     GetLatestBalanceSnapshotsHandler,
+    GetUserBalanceHistoryHandler,
     ListBalanceSnapshotsByAccountHandler,
 )
 from src.core.container.handler_factory import handler_factory
@@ -63,6 +65,22 @@ class MockLatestSnapshotsResult:
     total_balance_by_currency: dict[str, str]
 
 
+@dataclass
+class MockBucketResult:
+    """Mock DTO matching BalanceBucketResult from handlers."""
+
+    bucket_start: datetime
+    currency: str
+    open_balance: Decimal
+    close_balance: Decimal
+    min_balance: Decimal | None
+    max_balance: Decimal | None
+    snapshot_count: int
+    account_count: int
+    change_amount: Decimal | None = None
+    change_percent: float | None = None
+
+
 @dataclass
 class MockBalanceHistoryResult:
     """Mock result matching BalanceHistoryResult from handlers."""
@@ -74,6 +92,8 @@ class MockBalanceHistoryResult:
     total_change_amount: Decimal | None
     total_change_percent: float | None
     currency: str | None
+    granularity: str | None = None
+    buckets: list[MockBucketResult] = field(default_factory=list)
 
 
 class MockGetLatestSnapshotsHandler:
@@ -135,6 +155,36 @@ class MockGetBalanceHistoryHandler:
         return Success(value=result)
 
 
+class MockGetUserBalanceHistoryHandler:
+    """Mock handler for getting aggregate balance history."""
+
+    def __init__(
+        self,
+        buckets: list[MockBucketResult] | None = None,
+        error: str | None = None,
+    ) -> None:
+        self._buckets = buckets or []
+        self._error = error
+        self.last_query: Any = None
+
+    async def handle(self, query: Any) -> Success[object] | Failure[str]:
+        self.last_query = query
+        if self._error:
+            return Failure(error=self._error)
+        result = MockBalanceHistoryResult(
+            snapshots=[],
+            total_count=len(self._buckets),
+            start_balance=None,
+            end_balance=None,
+            total_change_amount=None,
+            total_change_percent=None,
+            currency="USD" if self._buckets else None,
+            granularity=query.granularity,
+            buckets=self._buckets,
+        )
+        return Success(value=result)
+
+
 class MockListSnapshotsByAccountHandler:
     """Mock handler for listing snapshots by account."""
 
@@ -284,6 +334,74 @@ class TestGetLatestSnapshots:
         app.dependency_overrides.pop(factory_key, None)
 
 
+# =============================================================================
+# Get User Balance History Tests (GET /api/v1/balance-history)
+# =============================================================================
+
+
+@pytest.mark.api
+class TestGetUserBalanceHistory:
+    """Tests for GET /api/v1/balance-history endpoint."""
+
+    def test_get_user_balance_history_buckets(self, client):
+        """GET /api/v1/balance-history returns summed buckets."""
+        bucket = MockBucketResult(
+            bucket_start=datetime(2024, 1, 1, tzinfo=UTC),
+            currency="USD",
+            open_balance=Decimal("1000.00"),
+            close_balance=Decimal("1100.00"),
+            min_balance=None,
+            max_balance=None,
+            snapshot_count=12,
+            account_count=3,
+        )
+        mock_handler = MockGetUserBalanceHistoryHandler(buckets=[bucket])
+        factory_key = handler_factory(GetUserBalanceHistoryHandler)
+        app.dependency_overrides[factory_key] = lambda: mock_handler
+
+        now = datetime.now(UTC)
+        response = client.get(
+            "/api/v1/balance-history",
+            params={
+                "start_date": (now - timedelta(days=365)).isoformat(),
+                "end_date": now.isoformat(),
+                "granularity": "week",
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["granularity"] == "week"
+        assert data["snapshots"] == []
+        assert data["buckets"][0]["account_count"] == 3
+        assert mock_handler.last_query.granularity == "week"
+
+        app.dependency_overrides.pop(factory_key, None)
+
+    def test_get_user_balance_history_invalid_granularity(self, client):
+        """GET /api/v1/balance-history returns 400 for unknown granularity."""
+        factory_key = handler_factory(GetUserBalanceHistoryHandler)
+        app.dependency_overrides[factory_key] = (
+            lambda: MockGetUserBalanceHistoryHandler(
+                error="Invalid granularity (expected hour, day, week or month)"
+            )
+        )
+
+        now = datetime.now(UTC)
+        response = client.get(
+            "/api/v1/balance-history",
+            params={
+                "start_date": (now - timedelta(days=30)).isoformat(),
+                "end_date": now.isoformat(),
+                "granularity": "year",
+            },
+        )
+
+        assert response.status_code == 400
+
+        app.dependency_overrides.pop(factory_key, None)
+
+
 # =============================================================================
 # Get Balance History Tests (GET /api/v1/accounts/{id}/balance-history)
 # =============================================================================
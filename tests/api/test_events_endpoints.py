@@ -86,6 +86,16 @@ class MockSSESubscriber:
             return []
         return self._missed_events
 
+    async def replay_missed_events(
+        self,
+        user_id: UUID,
+        last_event_id: UUID,
+        categories: list[str] | None = None,
+    ) -> AsyncIterator[SSEEvent]:
+        """Yield configured missed events."""
+        for event in await self.get_missed_events(user_id, last_event_id, categories):
+            yield event
+
 
 def create_test_event(
     event_type: SSEEventType = SSEEventType.SYNC_ACCOUNTS_COMPLETED,
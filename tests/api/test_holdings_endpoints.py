@@ -3,7 +3,7 @@
 Tests the complete HTTP request/response cycle for holdings management:
 - GET /api/v1/holdings (list all user holdings)
 - GET /api/v1/accounts/{id}/holdings (list holdings for account)
-- POST /api/v1/accounts/{id}/holdings/syncs (sync holdings from provider)
+- POST /api/v1/accounts/{id}/holdings/syncs (start background holdings sync job)
 
 Architecture:
 - Uses FastAPI TestClient with real app + dependency overrides
@@ -21,15 +21,19 @@ import pytest
 from fastapi.testclient import TestClient
 from uuid_extensions import uuid7
 
-from src.application.commands.handlers.sync_holdings_handler import (
-    SyncHoldingsHandler,
-)
+from src.application.queries.handlers.get_account_handler import GetAccountHandler
 from src.application.queries.handlers.list_holdings_handler import (
     ListHoldingsByAccountHandler,
     ListHoldingsByUserHandler,
 )
+from src.core.container import get_sync_job_runner
 from src.core.container.handler_factory import handler_factory
+from src.core.enums import ErrorCode
 from src.core.result import Failure, Success
+from src.infrastructure.enums import InfrastructureErrorCode
+from src.infrastructure.errors import InfrastructureError
+from src.infrastructure.jobs.sync_job_runner import SyncJobSubmission
+from src.infrastructure.jobs.sync_job_store import SyncJob, SyncJobKind, SyncJobStatus
 from src.main import app
 
 
@@ -75,18 +79,6 @@ class MockHoldingListResult:
     total_unrealized_gain_loss_by_currency: dict[str, str]
 
 
-@dataclass
-class MockSyncHoldingsResult:
-    """Mock result matching SyncHoldingsResult from sync_holdings_handler.py."""
-
-    created: int
-    updated: int
-    unchanged: int
-    deactivated: int
-    errors: int
-    message: str
-
-
 class MockListHoldingsHandler:
     """Mock handler for listing holdings."""
 
@@ -116,28 +108,55 @@ class MockListHoldingsHandler:
         return Success(value=result)
 
 
-class MockSyncHoldingsHandler:
-    """Mock handler for syncing holdings."""
+class MockGetAccountHandler:
+    """Mock handler for the account ownership check."""
 
-    def __init__(
-        self,
-        result: MockSyncHoldingsResult | None = None,
-        error: str | None = None,
-    ) -> None:
-        self._result = result or MockSyncHoldingsResult(
-            created=3,
-            updated=2,
-            unchanged=1,
-            deactivated=0,
-            errors=0,
-            message="Synced 6 holdings: 3 created, 2 updated, 1 unchanged",
-        )
+    def __init__(self, error: str | None = None) -> None:
         self._error = error
 
-    async def handle(self, command: Any) -> Success[object] | Failure[str]:
+    async def handle(self, query: Any) -> Success[object] | Failure[str]:
         if self._error:
             return Failure(error=self._error)
-        return Success(value=self._result)
+        return Success(value=None)
+
+
+class MockSyncJobRunner:
+    """Mock SyncJobRunner recording submitted commands."""
+
+    def __init__(
+        self,
+        active_job: SyncJob | None = None,
+        redis_down: bool = False,
+    ) -> None:
+        self._active_job = active_job
+        self._redis_down = redis_down
+        self.submitted: list[tuple[SyncJobKind, UUID, Any]] = []
+
+    async def submit(
+        self, *, kind: SyncJobKind, user_id: UUID, target_id: UUID, command: Any
+    ) -> Success[SyncJobSubmission] | Failure[InfrastructureError]:
+        if self._redis_down:
+            return Failure(
+                error=InfrastructureError(
+                    code=ErrorCode.SERVICE_UNAVAILABLE,
+                    infrastructure_code=InfrastructureErrorCode.CONNECTION_ERROR,
+                    message="Failed to enqueue sync job",
+                )
+            )
+        self.submitted.append((kind, target_id, command))
+        if self._active_job is not None:
+            return Success(
+                value=SyncJobSubmission(job=self._active_job, deduplicated=True)
+            )
+        job = SyncJob(
+            job_id=uuid7(),
+            kind=kind,
+            status=SyncJobStatus.QUEUED,
+            user_id=user_id,
+            target_id=target_id,
+            created_at=datetime.now(UTC),
+        )
+        return Success(value=SyncJobSubmission(job=job))
 
 
 # =============================================================================
@@ -346,43 +365,67 @@ class TestListHoldingsByAccount:
 class TestSyncHoldings:
     """Tests for POST /api/v1/accounts/{id}/holdings/syncs endpoint."""
 
-    def test_sync_holdings_success(self, client, mock_account_id):
-        """POST /api/v1/accounts/{id}/holdings/syncs syncs holdings."""
-        factory_key = handler_factory(SyncHoldingsHandler)
-        app.dependency_overrides[factory_key] = lambda: MockSyncHoldingsHandler()
+    @pytest.fixture(autouse=True)
+    def owned_target(self):
+        """Let the ownership check pass unless a test overrides it."""
+        factory_key = handler_factory(GetAccountHandler)
+        app.dependency_overrides[factory_key] = lambda: MockGetAccountHandler()
+        yield
+        app.dependency_overrides.pop(factory_key, None)
+
+    def test_sync_holdings_returns_202_with_job(self, client, mock_account_id):
+        """POST /api/v1/accounts/{id}/holdings/syncs queues a job and returns 202."""
+        runner = MockSyncJobRunner()
+        app.dependency_overrides[get_sync_job_runner] = lambda: runner
 
         response = client.post(
             f"/api/v1/accounts/{mock_account_id}/holdings/syncs",
             json={"force": False},
         )
 
-        assert response.status_code == 201
+        assert response.status_code == 202
         data = response.json()
-        assert data["created"] == 3
-        assert data["updated"] == 2
-        assert "message" in data
+        assert data["kind"] == "holdings"
+        assert data["status"] == "queued"
+        assert data["target_id"] == str(mock_account_id)
+        assert data["deduplicated"] is False
+        kind, target_id, command = runner.submitted[0]
+        assert kind == SyncJobKind.HOLDINGS
+        assert target_id == mock_account_id
+        assert command.account_id == mock_account_id
 
-        app.dependency_overrides.pop(factory_key, None)
+        app.dependency_overrides.pop(get_sync_job_runner, None)
 
     def test_sync_holdings_force(self, client, mock_account_id):
         """POST /api/v1/accounts/{id}/holdings/syncs with force=true."""
-        factory_key = handler_factory(SyncHoldingsHandler)
-        app.dependency_overrides[factory_key] = lambda: MockSyncHoldingsHandler()
+        runner = MockSyncJobRunner()
+        app.dependency_overrides[get_sync_job_runner] = lambda: runner
 
         response = client.post(
             f"/api/v1/accounts/{mock_account_id}/holdings/syncs",
             json={"force": True},
         )
 
-        assert response.status_code == 201
+        assert response.status_code == 202
+        assert runner.submitted[0][2].force is True
 
-        app.dependency_overrides.pop(factory_key, None)
+        app.dependency_overrides.pop(get_sync_job_runner, None)
 
-    def test_sync_holdings_account_not_found(self, client, mock_account_id):
-        """POST /api/v1/accounts/{id}/holdings/syncs returns 404."""
-        factory_key = handler_factory(SyncHoldingsHandler)
-        app.dependency_overrides[factory_key] = lambda: MockSyncHoldingsHandler(
-            error="Account not found"
+    def test_sync_holdings_returns_active_job(
+        self, client, mock_user_id, mock_account_id
+    ):
+        """POST /api/v1/accounts/{id}/holdings/syncs returns the running job."""
+        active_job = SyncJob(
+            job_id=uuid7(),
+            kind=SyncJobKind.HOLDINGS,
+            status=SyncJobStatus.RUNNING,
+            user_id=mock_user_id,
+            target_id=mock_account_id,
+            created_at=datetime.now(UTC),
+            started_at=datetime.now(UTC),
+        )
+        app.dependency_overrides[get_sync_job_runner] = lambda: MockSyncJobRunner(
+            active_job=active_job
         )
 
         response = client.post(
@@ -390,15 +433,17 @@ class TestSyncHoldings:
             json={"force": False},
         )
 
-        assert response.status_code == 404
+        assert response.status_code == 202
+        data = response.json()
+        assert data["job_id"] == str(active_job.job_id)
+        assert data["deduplicated"] is True
 
-        app.dependency_overrides.pop(factory_key, None)
+        app.dependency_overrides.pop(get_sync_job_runner, None)
 
-    def test_sync_holdings_rate_limited(self, client, mock_account_id):
-        """POST /api/v1/accounts/{id}/holdings/syncs returns 429 when too soon."""
-        factory_key = handler_factory(SyncHoldingsHandler)
-        app.dependency_overrides[factory_key] = lambda: MockSyncHoldingsHandler(
-            error="Holdings were recently synced"
+    def test_sync_holdings_enqueue_failure(self, client, mock_account_id):
+        """POST /api/v1/accounts/{id}/holdings/syncs returns 503 if not queued."""
+        app.dependency_overrides[get_sync_job_runner] = lambda: MockSyncJobRunner(
+            redis_down=True
         )
 
         response = client.post(
@@ -406,15 +451,17 @@ class TestSyncHoldings:
             json={"force": False},
         )
 
-        assert response.status_code == 429
+        assert response.status_code == 503
+        assert response.json()["status"] == 503
 
-        app.dependency_overrides.pop(factory_key, None)
+        app.dependency_overrides.pop(get_sync_job_runner, None)
 
-    def test_sync_holdings_provider_error(self, client, mock_account_id):
-        """POST /api/v1/accounts/{id}/holdings/syncs returns 502 on provider error."""
-        factory_key = handler_factory(SyncHoldingsHandler)
-        app.dependency_overrides[factory_key] = lambda: MockSyncHoldingsHandler(
-            error="Provider API error: timeout"
+    def test_sync_holdings_not_owned(self, client, mock_account_id):
+        """POST /api/v1/accounts/{mock_account_id}/holdings/syncs returns 403 without queueing a job."""
+        runner = MockSyncJobRunner()
+        app.dependency_overrides[get_sync_job_runner] = lambda: runner
+        app.dependency_overrides[handler_factory(GetAccountHandler)] = lambda: (
+            MockGetAccountHandler(error="Account not owned by user")
         )
 
         response = client.post(
@@ -422,7 +469,7 @@ class TestSyncHoldings:
             json={"force": False},
         )
 
-        # Provider errors should map to external service error (502)
-        assert response.status_code == 502
+        assert response.status_code == 403
+        assert runner.submitted == []
 
-        app.dependency_overrides.pop(factory_key, None)
+        app.dependency_overrides.pop(get_sync_job_runner, None)
@@ -330,8 +330,9 @@ class TestMetadataConsistency:
 
         Fails if: Route returns data but has no response schema.
 
-        Note: SSE streaming endpoints (RateLimitPolicy.SSE_STREAM) are exempt
-        because they return StreamingResponse, not Pydantic models.
+        Note: SSE streaming endpoints (RateLimitPolicy.SSE_STREAM) and file
+        exports (RateLimitPolicy.EXPENSIVE_EXPORT) are exempt because they
+        return StreamingResponse, not Pydantic models.
         """
         for entry in ROUTE_REGISTRY:
             # 204 No Content doesn't need response model
@@ -348,6 +349,13 @@ class TestMetadataConsistency:
                     f"is SSE streaming but defines response_model. "
                     f"SSE endpoints use StreamingResponse and should have response_model=None."
                 )
+            # File exports stream NDJSON/CSV, not a Pydantic model
+            elif entry.rate_limit_policy == RateLimitPolicy.EXPENSIVE_EXPORT:
+                assert entry.response_model is None, (
+                    f"Route '{entry.method.value} {entry.path}' "
+                    f"is a streamed export but defines response_model. "
+                    f"Export endpoints use StreamingResponse and should have response_model=None."
+                )
             else:
                 # Other status codes should have response model
                 assert entry.response_model is not None, (
@@ -0,0 +1,201 @@
+"""API tests for sync job endpoints.
+
+Tests the complete HTTP request/response cycle for background sync jobs:
+- GET /api/v1/sync-jobs/{job_id} (sync job status)
+
+Architecture:
+- Uses FastAPI TestClient with real app + dependency overrides
+- Mocks SyncJobRunner to test HTTP layer behavior
+- Verifies owner scoping (other users' jobs are 404)
+"""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+from fastapi.testclient import TestClient
+from uuid_extensions import uuid7
+
+from src.core.container import get_sync_job_runner
+from src.core.enums import ErrorCode
+from src.core.result import Failure, Success
+from src.infrastructure.enums import InfrastructureErrorCode
+from src.infrastructure.errors import InfrastructureError
+from src.infrastructure.jobs.sync_job_store import SyncJob, SyncJobKind, SyncJobStatus
+from src.main import app
+
+
+# =============================================================================
+# Test Doubles
+# =============================================================================
+
+
+class MockSyncJobRunner:
+    """Mock SyncJobRunner serving jobs from a dict."""
+
+    def __init__(
+        self, jobs: dict[UUID, SyncJob] | None = None, redis_down: bool = False
+    ) -> None:
+        self._jobs = jobs or {}
+        self._redis_down = redis_down
+
+    async def get_job(
+        self, job_id: UUID
+    ) -> Success[SyncJob | None] | Failure[InfrastructureError]:
+        if self._redis_down:
+            return Failure(
+                error=InfrastructureError(
+                    code=ErrorCode.SERVICE_UNAVAILABLE,
+                    infrastructure_code=InfrastructureErrorCode.CONNECTION_ERROR,
+                    message="Failed to get sync job",
+                )
+            )
+        return Success(value=self._jobs.get(job_id))
+
+
+@dataclass
+class MockCurrentUser:
+    """Mock user for auth override."""
+
+    user_id: UUID
+    email: str = "test@example.com"
+    roles: list[str] | None = None
+
+    def __post_init__(self):
+        if self.roles is None:
+            self.roles = ["user"]
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def mock_user_id():
+    """Provide consistent user ID for tests."""
+    return uuid7()
+
+
+@pytest.fixture
+def finished_job(mock_user_id):
+    """Create a succeeded account sync job owned by the test user."""
+    now = datetime.now(UTC)
+    return SyncJob(
+        job_id=uuid7(),
+        kind=SyncJobKind.ACCOUNTS,
+        status=SyncJobStatus.SUCCEEDED,
+        user_id=mock_user_id,
+        target_id=uuid7(),
+        created_at=now,
+        started_at=now,
+        finished_at=now,
+        message="Synced 2 accounts: 1 created, 1 updated, 0 unchanged",
+        result={"created": 1, "updated": 1, "unchanged": 0, "errors": 0},
+    )
+
+
+@pytest.fixture(autouse=True)
+def override_auth(mock_user_id):
+    """Override authentication for all tests."""
+    from src.presentation.routers.api.middleware.auth_dependencies import (
+        get_current_user,
+    )
+
+    mock_user = MockCurrentUser(user_id=mock_user_id)
+
+    async def mock_get_current_user():
+        return mock_user
+
+    app.dependency_overrides[get_current_user] = mock_get_current_user
+    yield
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+@pytest.fixture
+def client():
+    """Provide test client."""
+    return TestClient(app)
+
+
+# =============================================================================
+# Get Sync Job Tests (GET /api/v1/sync-jobs/{job_id})
+# =============================================================================
+
+
+@pytest.mark.api
+class TestGetSyncJob:
+    """Tests for GET /api/v1/sync-jobs/{job_id} endpoint."""
+
+    def test_get_sync_job_returns_status_and_result(self, client, finished_job):
+        """GET /api/v1/sync-jobs/{id} returns the job's outcome."""
+        app.dependency_overrides[get_sync_job_runner] = lambda: MockSyncJobRunner(
+            jobs={finished_job.job_id: finished_job}
+        )
+
+        response = client.get(f"/api/v1/sync-jobs/{finished_job.job_id}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["job_id"] == str(finished_job.job_id)
+        assert data["kind"] == "accounts"
+        assert data["status"] == "succeeded"
+        assert data["message"] == finished_job.message
+        assert data["result"]["created"] == 1
+        assert data["error"] is None
+
+        app.dependency_overrides.pop(get_sync_job_runner, None)
+
+    def test_get_sync_job_unknown_returns_404(self, client):
+        """GET /api/v1/sync-jobs/{id} returns 404 for unknown or expired jobs."""
+        app.dependency_overrides[get_sync_job_runner] = lambda: MockSyncJobRunner()
+
+        response = client.get(f"/api/v1/sync-jobs/{uuid7()}")
+
+        assert response.status_code == 404
+        assert response.json()["status"] == 404
+
+        app.dependency_overrides.pop(get_sync_job_runner, None)
+
+    def test_get_sync_job_of_other_user_returns_404(self, client):
+        """GET /api/v1/sync-jobs/{id} hides other users' jobs."""
+        other_job = SyncJob(
+            job_id=uuid7(),
+            kind=SyncJobKind.HOLDINGS,
+            status=SyncJobStatus.RUNNING,
+            user_id=uuid7(),
+            target_id=uuid7(),
+            created_at=datetime.now(UTC),
+        )
+        app.dependency_overrides[get_sync_job_runner] = lambda: MockSyncJobRunner(
+            jobs={other_job.job_id: other_job}
+        )
+
+        response = client.get(f"/api/v1/sync-jobs/{other_job.job_id}")
+
+        assert response.status_code == 404
+
+        app.dependency_overrides.pop(get_sync_job_runner, None)
+
+    def test_get_sync_job_store_failure_returns_503(self, client):
+        """GET /api/v1/sync-jobs/{id} returns 503 when Redis is unavailable."""
+        app.dependency_overrides[get_sync_job_runner] = lambda: MockSyncJobRunner(
+            redis_down=True
+        )
+
+        response = client.get(f"/api/v1/sync-jobs/{uuid7()}")
+
+        assert response.status_code == 503
+
+        app.dependency_overrides.pop(get_sync_job_runner, None)
+
+    def test_get_sync_job_invalid_uuid(self, client):
+        """GET /api/v1/sync-jobs/{id} returns 422 for a malformed id."""
+        app.dependency_overrides[get_sync_job_runner] = lambda: MockSyncJobRunner()
+
+        response = client.get("/api/v1/sync-jobs/not-a-uuid")
+
+        assert response.status_code == 422
+
+        app.dependency_overrides.pop(get_sync_job_runner, None)
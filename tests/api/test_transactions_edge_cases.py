@@ -12,8 +12,8 @@ import pytest
 from fastapi.testclient import TestClient
 from uuid_extensions import uuid7
 
-from src.application.commands.handlers.sync_transactions_handler import (
-    SyncTransactionsHandler,
+from src.application.queries.handlers.get_transaction_handler import (
+    GetTransactionHandler,
 )
 from src.application.queries.handlers.list_transactions_handler import (
     ListTransactionsByDateRangeHandler,
@@ -65,16 +65,14 @@ class MockListTransactionsByDateRangeHandler:
         return Success(value=MockTransactionListResult())
 
 
-class MockSyncTransactionsHandler:
-    """Mock handler for syncing transactions."""
+class MockGetTransactionHandler:
+    """Mock handler for getting a transaction (errors only)."""
 
-    def __init__(self, error: str | None = None):
+    def __init__(self, error: str):
         self._error = error
 
-    async def handle(self, command):
-        if self._error:
-            return Failure(error=self._error)
-        return Success(value=None)
+    async def handle(self, query):
+        return Failure(error=self._error)
 
 
 # =============================================================================
@@ -126,17 +124,14 @@ def client():
 class TestTransactionsEdgeCases:
     """Edge case tests for transactions endpoints."""
 
-    def test_sync_transactions_rate_limit_error(self, client, mock_account_id):
-        """POST /api/v1/transactions/syncs returns 429 for rate limit errors."""
-        factory_key = handler_factory(SyncTransactionsHandler)
-        app.dependency_overrides[factory_key] = lambda: MockSyncTransactionsHandler(
+    def test_get_transaction_rate_limit_error(self, client):
+        """GET /api/v1/transactions/{id} returns 429 for rate limit errors."""
+        factory_key = handler_factory(GetTransactionHandler)
+        app.dependency_overrides[factory_key] = lambda: MockGetTransactionHandler(
             error="Sync recently synced, wait before retrying"
         )
 
-        response = client.post(
-            "/api/v1/transactions/syncs",
-            json={"connection_id": str(uuid7()), "account_id": str(mock_account_id)},
-        )
+        response = client.get(f"/api/v1/transactions/{uuid7()}")
 
         assert response.status_code == 429
         data = response.json()
@@ -144,17 +139,14 @@ class TestTransactionsEdgeCases:
 
         app.dependency_overrides.pop(factory_key, None)
 
-    def test_sync_transactions_invalid_input_error(self, client, mock_account_id):
-        """POST /api/v1/transactions/syncs returns 400 for invalid input errors."""
-        factory_key = handler_factory(SyncTransactionsHandler)
-        app.dependency_overrides[factory_key] = lambda: MockSyncTransactionsHandler(
+    def test_get_transaction_invalid_input_error(self, client):
+        """GET /api/v1/transactions/{id} returns 400 for invalid input errors."""
+        factory_key = handler_factory(GetTransactionHandler)
+        app.dependency_overrides[factory_key] = lambda: MockGetTransactionHandler(
             error="Invalid date range specified"
         )
 
-        response = client.post(
-            "/api/v1/transactions/syncs",
-            json={"connection_id": str(uuid7()), "account_id": str(mock_account_id)},
-        )
+        response = client.get(f"/api/v1/transactions/{uuid7()}")
 
         assert response.status_code == 400
         data = response.json()
@@ -162,17 +154,14 @@ class TestTransactionsEdgeCases:
 
         app.dependency_overrides.pop(factory_key, None)
 
-    def test_sync_transactions_default_error_mapping(self, client, mock_account_id):
-        """POST /api/v1/transactions/syncs returns 500 for unmapped errors."""
-        factory_key = handler_factory(SyncTransactionsHandler)
-        app.dependency_overrides[factory_key] = lambda: MockSyncTransactionsHandler(
+    def test_get_transaction_default_error_mapping(self, client):
+        """GET /api/v1/transactions/{id} returns 500 for unmapped errors."""
+        factory_key = handler_factory(GetTransactionHandler)
+        app.dependency_overrides[factory_key] = lambda: MockGetTransactionHandler(
             error="Unknown database error occurred"
         )
 
-        response = client.post(
-            "/api/v1/transactions/syncs",
-            json={"connection_id": str(uuid7()), "account_id": str(mock_account_id)},
-        )
+        response = client.get(f"/api/v1/transactions/{uuid7()}")
 
         assert response.status_code == 500
         data = response.json()
@@ -2,8 +2,9 @@
 
 Tests the complete HTTP request/response cycle for transaction management:
 - GET /api/v1/transactions/{id} (get transaction details)
-- POST /api/v1/transactions/syncs (sync transactions from providers)
+- POST /api/v1/transactions/syncs (start background transaction sync job)
 - GET /api/v1/accounts/{id}/transactions (list transactions for account)
+- GET /api/v1/accounts/{id}/transactions/export (stream NDJSON/CSV export)
 
 Architecture:
 - Uses FastAPI TestClient with real app + dependency overrides
@@ -11,6 +12,10 @@ Architecture:
 - Mocks handlers to test HTTP layer behavior
 """
 
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
@@ -21,17 +26,24 @@ import pytest
 from fastapi.testclient import TestClient
 from uuid_extensions import uuid7
 
-from src.application.commands.handlers.sync_transactions_handler import (
-    SyncTransactionsHandler,
+from src.application.queries.handlers.get_provider_handler import (
+    GetProviderConnectionHandler,
 )
 from src.application.queries.handlers.get_transaction_handler import (
     GetTransactionHandler,
 )
 from src.application.queries.handlers.list_transactions_handler import (
     ListTransactionsByAccountHandler,
+    ListTransactionsForExportHandler,
 )
+from src.core.container import get_sync_job_runner
 from src.core.container.handler_factory import handler_factory
+from src.core.enums import ErrorCode
 from src.core.result import Failure, Success
+from src.infrastructure.enums import InfrastructureErrorCode
+from src.infrastructure.errors import InfrastructureError
+from src.infrastructure.jobs.sync_job_runner import SyncJobSubmission
+from src.infrastructure.jobs.sync_job_store import SyncJob, SyncJobKind, SyncJobStatus
 from src.main import app
 
 
@@ -81,18 +93,7 @@ class MockTransactionListResult:
     transactions: list[MockTransactionResult]
     total_count: int
     has_more: bool
-
-
-@dataclass
-class MockSyncTransactionsResult:
-    """Mock result matching SyncTransactionsResult from sync_transactions_handler.py."""
-
-    created: int
-    updated: int
-    unchanged: int
-    errors: int
-    accounts_synced: int
-    message: str
+    next_cursor: str | None = None
 
 
 class MockGetTransactionHandler:
@@ -126,35 +127,85 @@ class MockListTransactionsHandler:
             has_more=False,
         )
         self._error = error
+        self.queries: list[Any] = []
 
     async def handle(self, query: Any) -> Success[object] | Failure[str]:
+        self.queries.append(query)
         if self._error:
             return Failure(error=self._error)
         return Success(value=self._result)
 
 
-class MockSyncTransactionsHandler:
-    """Mock handler for syncing transactions."""
+class MockExportTransactionsHandler:
+    """Mock handler returning a stream of transactions."""
 
     def __init__(
         self,
-        result: MockSyncTransactionsResult | None = None,
+        transactions: list[MockTransactionResult] | None = None,
         error: str | None = None,
     ) -> None:
-        self._result = result or MockSyncTransactionsResult(
-            created=25,
-            updated=25,
-            unchanged=0,
-            errors=0,
-            accounts_synced=1,
-            message="Synced 50 transactions: 25 created, 25 updated",
-        )
+        self._transactions = transactions or []
         self._error = error
 
-    async def handle(self, command: Any) -> Success[object] | Failure[str]:
+    async def handle(self, query: Any) -> Success[object] | Failure[str]:
         if self._error:
             return Failure(error=self._error)
-        return Success(value=self._result)
+        return Success(value=self._stream())
+
+    async def _stream(self) -> AsyncIterator[MockTransactionResult]:
+        for transaction in self._transactions:
+            yield transaction
+
+
+class MockGetConnectionHandler:
+    """Mock handler for the connection ownership check."""
+
+    def __init__(self, error: str | None = None) -> None:
+        self._error = error
+
+    async def handle(self, query: Any) -> Success[object] | Failure[str]:
+        if self._error:
+            return Failure(error=self._error)
+        return Success(value=None)
+
+
+class MockSyncJobRunner:
+    """Mock SyncJobRunner recording submitted commands."""
+
+    def __init__(
+        self,
+        active_job: SyncJob | None = None,
+        redis_down: bool = False,
+    ) -> None:
+        self._active_job = active_job
+        self._redis_down = redis_down
+        self.submitted: list[tuple[SyncJobKind, UUID, Any]] = []
+
+    async def submit(
+        self, *, kind: SyncJobKind, user_id: UUID, target_id: UUID, command: Any
+    ) -> Success[SyncJobSubmission] | Failure[InfrastructureError]:
+        if self._redis_down:
+            return Failure(
+                error=InfrastructureError(
+                    code=ErrorCode.SERVICE_UNAVAILABLE,
+                    infrastructure_code=InfrastructureErrorCode.CONNECTION_ERROR,
+                    message="Failed to enqueue sync job",
+                )
+            )
+        self.submitted.append((kind, target_id, command))
+        if self._active_job is not None:
+            return Success(
+                value=SyncJobSubmission(job=self._active_job, deduplicated=True)
+            )
+        job = SyncJob(
+            job_id=uuid7(),
+            kind=kind,
+            status=SyncJobStatus.QUEUED,
+            user_id=user_id,
+            target_id=target_id,
+            created_at=datetime.now(UTC),
+        )
+        return Success(value=SyncJobSubmission(job=job))
 
 
 # =============================================================================
@@ -336,28 +387,72 @@ class TestGetTransaction:
 class TestSyncTransactions:
     """Tests for POST /api/v1/transactions/syncs endpoint."""
 
-    def test_sync_transactions_success(self, client, mock_connection_id):
-        """POST /api/v1/transactions/syncs triggers transaction sync."""
-        factory_key = handler_factory(SyncTransactionsHandler)
-        app.dependency_overrides[factory_key] = lambda: MockSyncTransactionsHandler()
+    @pytest.fixture(autouse=True)
+    def owned_target(self):
+        """Let the ownership check pass unless a test overrides it."""
+        factory_key = handler_factory(GetProviderConnectionHandler)
+        app.dependency_overrides[factory_key] = lambda: MockGetConnectionHandler()
+        yield
+        app.dependency_overrides.pop(factory_key, None)
+
+    def test_sync_transactions_returns_202_with_job(self, client, mock_connection_id):
+        """POST /api/v1/transactions/syncs queues a sync job and returns 202."""
+        runner = MockSyncJobRunner()
+        app.dependency_overrides[get_sync_job_runner] = lambda: runner
+
+        response = client.post(
+            "/api/v1/transactions/syncs",
+            json={
+                "connection_id": str(mock_connection_id),
+                "start_date": "2026-01-01",
+            },
+        )
+
+        assert response.status_code == 202
+        data = response.json()
+        assert data["kind"] == "transactions"
+        assert data["status"] == "queued"
+        assert data["target_id"] == str(mock_connection_id)
+        kind, target_id, command = runner.submitted[0]
+        assert kind == SyncJobKind.TRANSACTIONS
+        assert target_id == mock_connection_id
+        assert command.connection_id == mock_connection_id
+        assert command.start_date == date(2026, 1, 1)
+
+        app.dependency_overrides.pop(get_sync_job_runner, None)
+
+    def test_sync_transactions_returns_active_job(
+        self, client, mock_user_id, mock_connection_id
+    ):
+        """POST /api/v1/transactions/syncs returns the queued job for duplicates."""
+        active_job = SyncJob(
+            job_id=uuid7(),
+            kind=SyncJobKind.TRANSACTIONS,
+            status=SyncJobStatus.QUEUED,
+            user_id=mock_user_id,
+            target_id=mock_connection_id,
+            created_at=datetime.now(UTC),
+        )
+        app.dependency_overrides[get_sync_job_runner] = lambda: MockSyncJobRunner(
+            active_job=active_job
+        )
 
         response = client.post(
             "/api/v1/transactions/syncs",
             json={"connection_id": str(mock_connection_id)},
         )
 
-        assert response.status_code == 201
+        assert response.status_code == 202
         data = response.json()
-        assert data["created"] == 25
-        assert data["updated"] == 25
+        assert data["job_id"] == str(active_job.job_id)
+        assert data["deduplicated"] is True
 
-        app.dependency_overrides.pop(factory_key, None)
+        app.dependency_overrides.pop(get_sync_job_runner, None)
 
-    def test_sync_transactions_connection_not_found(self, client, mock_connection_id):
-        """POST /api/v1/transactions/syncs returns 404 for invalid connection."""
-        factory_key = handler_factory(SyncTransactionsHandler)
-        app.dependency_overrides[factory_key] = lambda: MockSyncTransactionsHandler(
-            error="Connection not found"
+    def test_sync_transactions_enqueue_failure(self, client, mock_connection_id):
+        """POST /api/v1/transactions/syncs returns 503 when the job can't be queued."""
+        app.dependency_overrides[get_sync_job_runner] = lambda: MockSyncJobRunner(
+            redis_down=True
         )
 
         response = client.post(
@@ -365,21 +460,40 @@ class TestSyncTransactions:
             json={"connection_id": str(mock_connection_id)},
         )
 
-        assert response.status_code == 404
+        assert response.status_code == 503
+        assert response.json()["status"] == 503
 
-        app.dependency_overrides.pop(factory_key, None)
+        app.dependency_overrides.pop(get_sync_job_runner, None)
+
+    def test_sync_transactions_not_owned(self, client, mock_connection_id):
+        """POST /api/v1/transactions/syncs returns 403 without queueing a job."""
+        runner = MockSyncJobRunner()
+        app.dependency_overrides[get_sync_job_runner] = lambda: runner
+        app.dependency_overrides[handler_factory(GetProviderConnectionHandler)] = (
+            lambda: MockGetConnectionHandler(error="Connection not owned by user")
+        )
+
+        response = client.post(
+            "/api/v1/transactions/syncs",
+            json={"connection_id": str(mock_connection_id)},
+        )
+
+        assert response.status_code == 403
+        assert runner.submitted == []
+
+        app.dependency_overrides.pop(get_sync_job_runner, None)
 
     def test_sync_transactions_missing_connection_id(self, client):
         """POST /api/v1/transactions/syncs returns 422 when connection_id missing."""
-        factory_key = handler_factory(SyncTransactionsHandler)
-        # Mock handler to prevent encryption init during validation
-        app.dependency_overrides[factory_key] = lambda: MockSyncTransactionsHandler()
+        runner = MockSyncJobRunner()
+        app.dependency_overrides[get_sync_job_runner] = lambda: runner
 
         response = client.post("/api/v1/transactions/syncs", json={})
 
         assert response.status_code == 422
+        assert runner.submitted == []
 
-        app.dependency_overrides.pop(factory_key, None)
+        app.dependency_overrides.pop(get_sync_job_runner, None)
 
 
 # =============================================================================
@@ -445,3 +559,128 @@ class TestListTransactionsByAccount:
         response = client.get("/api/v1/accounts/not-a-uuid/transactions")
 
         assert response.status_code == 422
+
+    def test_list_transactions_forwards_cursor(self, client, mock_account_id):
+        """GET /api/v1/accounts/{id}/transactions?cursor= pages by keyset."""
+        factory_key = handler_factory(ListTransactionsByAccountHandler)
+        handler = MockListTransactionsHandler(
+            result=MockTransactionListResult(
+                transactions=[], total_count=0, has_more=True, next_cursor="next"
+            )
+        )
+        app.dependency_overrides[factory_key] = lambda: handler
+
+        response = client.get(
+            f"/api/v1/accounts/{mock_account_id}/transactions",
+            params={"cursor": "abc", "limit": 25},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["next_cursor"] == "next"
+        assert handler.queries[0].cursor == "abc"
+        assert handler.queries[0].limit == 25
+
+        app.dependency_overrides.pop(factory_key, None)
+
+    def test_list_transactions_invalid_cursor(self, client, mock_account_id):
+        """GET /api/v1/accounts/{id}/transactions returns 400 for a bad cursor."""
+        factory_key = handler_factory(ListTransactionsByAccountHandler)
+        app.dependency_overrides[factory_key] = lambda: MockListTransactionsHandler(
+            error="Invalid pagination cursor"
+        )
+
+        response = client.get(
+            f"/api/v1/accounts/{mock_account_id}/transactions",
+            params={"cursor": "garbage"},
+        )
+
+        assert response.status_code == 400
+
+        app.dependency_overrides.pop(factory_key, None)
+
+
+# =============================================================================
+# Export Transactions Tests (GET /api/v1/accounts/{id}/transactions/export)
+# =============================================================================
+
+
+@pytest.mark.api
+class TestListTransactionsForExport:
+    """Tests for GET /api/v1/accounts/{id}/transactions/export endpoint."""
+
+    def test_export_ndjson(self, client, mock_account_id, mock_transaction):
+        """Default format streams one JSON object per line."""
+        factory_key = handler_factory(ListTransactionsForExportHandler)
+        app.dependency_overrides[factory_key] = lambda: MockExportTransactionsHandler(
+            transactions=[mock_transaction, mock_transaction]
+        )
+
+        response = client.get(f"/api/v1/accounts/{mock_account_id}/transactions/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert "attachment" in response.headers["content-disposition"]
+        lines = response.text.splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["symbol"] == "AAPL"
+
+        app.dependency_overrides.pop(factory_key, None)
+
+    def test_export_csv(self, client, mock_account_id, mock_transaction):
+        """format=csv streams a header row plus one row per transaction."""
+        factory_key = handler_factory(ListTransactionsForExportHandler)
+        app.dependency_overrides[factory_key] = lambda: MockExportTransactionsHandler(
+            transactions=[mock_transaction]
+        )
+
+        response = client.get(
+            f"/api/v1/accounts/{mock_account_id}/transactions/export",
+            params={"format": "csv"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 1
+        assert rows[0]["symbol"] == "AAPL"
+        assert rows[0]["id"] == str(mock_transaction.id)
+
+        app.dependency_overrides.pop(factory_key, None)
+
+    def test_export_empty_csv_has_header(self, client, mock_account_id):
+        """An account without transactions exports only the header row."""
+        factory_key = handler_factory(ListTransactionsForExportHandler)
+        app.dependency_overrides[factory_key] = lambda: MockExportTransactionsHandler()
+
+        response = client.get(
+            f"/api/v1/accounts/{mock_account_id}/transactions/export",
+            params={"format": "csv"},
+        )
+
+        assert response.status_code == 200
+        assert response.text.splitlines()[0].startswith("id,account_id,")
+
+        app.dependency_overrides.pop(factory_key, None)
+
+    def test_export_account_not_found(self, client, mock_account_id):
+        """Ownership failures return RFC 9457 errors before streaming."""
+        factory_key = handler_factory(ListTransactionsForExportHandler)
+        app.dependency_overrides[factory_key] = lambda: MockExportTransactionsHandler(
+            error="Account not found"
+        )
+
+        response = client.get(f"/api/v1/accounts/{mock_account_id}/transactions/export")
+
+        assert response.status_code == 404
+        assert response.json()["status"] == 404
+
+        app.dependency_overrides.pop(factory_key, None)
+
+    def test_export_invalid_format(self, client, mock_account_id):
+        """Unknown formats are rejected by validation."""
+        response = client.get(
+            f"/api/v1/accounts/{mock_account_id}/transactions/export",
+            params={"format": "xml"},
+        )
+
+        assert response.status_code == 422
@@ -443,6 +443,8 @@ async def mock_cache():
     cache.set = AsyncMock(return_value=None)
     cache.delete = AsyncMock(return_value=None)
     cache.delete_pattern = AsyncMock(return_value=None)
+    cache.set_with_tags = AsyncMock(return_value=None)
+    cache.invalidate_tag = AsyncMock(return_value=None)
     return cache
 
 
@@ -793,6 +793,59 @@ class TestAccountRepositoryFindActiveByUser:
         assert names == {"Schwab Active", "Fidelity Active"}
 
 
+@pytest.mark.integration
+class TestAccountRepositorySummarizeBalances:
+    """Test AccountRepository summarize_balances_for_user operations."""
+
+    @pytest.mark.asyncio
+    async def test_summarize_balances_sums_and_counts_active_accounts(
+        self, test_database, connection_with_provider
+    ):
+        """Test total and count match sum_balances_for_user/count_for_user."""
+        # Arrange
+        connection_id, user_id = connection_with_provider
+        accounts = [
+            create_test_account(
+                connection_id=connection_id, balance=Money(Decimal("1000.50"), "USD")
+            ),
+            create_test_account(
+                connection_id=connection_id, balance=Money(Decimal("250.25"), "USD")
+            ),
+            create_test_account(
+                connection_id=connection_id,
+                balance=Money(Decimal("9999.00"), "USD"),
+                is_active=False,
+            ),
+        ]
+
+        async with test_database.get_session() as session:
+            repo = AccountRepository(session=session)
+            for account in accounts:
+                await repo.save(account)
+
+        # Act
+        async with test_database.get_session() as session:
+            repo = AccountRepository(session=session)
+            summary = await repo.summarize_balances_for_user(user_id)
+            total = await repo.sum_balances_for_user(user_id)
+            count = await repo.count_for_user(user_id)
+
+        # Assert
+        assert summary == (Decimal("1250.75"), 2)
+        assert summary == (total, count)
+
+    @pytest.mark.asyncio
+    async def test_summarize_balances_returns_zero_without_accounts(
+        self, test_database
+    ):
+        """Test user with no accounts summarizes to (0, 0)."""
+        async with test_database.get_session() as session:
+            repo = AccountRepository(session=session)
+            summary = await repo.summarize_balances_for_user(uuid7())
+
+        assert summary == (Decimal("0"), 0)
+
+
 @pytest.mark.integration
 class TestAccountRepositoryFindNeedingSync:
     """Test AccountRepository find_needing_sync operations."""
@@ -880,6 +933,73 @@ class TestAccountRepositoryFindNeedingSync:
         assert len(accounts) == 1
         assert accounts[0].name == "Never Synced"
 
+    @pytest.mark.asyncio
+    async def test_find_needing_sync_excludes_inactive_and_honors_limit(
+        self, test_database, connection_with_provider
+    ):
+        """Test find_needing_sync skips inactive accounts, stalest first."""
+        # Arrange
+        connection_id, _ = connection_with_provider
+        now = datetime.now(UTC)
+
+        inactive = create_test_account(
+            connection_id=connection_id,
+            name="Inactive",
+            is_active=False,
+            last_synced_at=None,
+        )
+        stalest = create_test_account(
+            connection_id=connection_id,
+            name="Stalest",
+            last_synced_at=now - timedelta(days=2),
+        )
+        stale = create_test_account(
+            connection_id=connection_id,
+            name="Stale",
+            last_synced_at=now - timedelta(hours=2),
+        )
+
+        async with test_database.get_session() as session:
+            repo = AccountRepository(session=session)
+            for account in (inactive, stale, stalest):
+                await repo.save(account)
+
+        # Act
+        async with test_database.get_session() as session:
+            repo = AccountRepository(session=session)
+            accounts = await repo.find_needing_sync(timedelta(hours=1), limit=1)
+
+        # Assert
+        assert [a.name for a in accounts] == ["Stalest"]
+
+    @pytest.mark.asyncio
+    async def test_find_needing_sync_excludes_connections(
+        self, test_database, connection_with_provider
+    ):
+        """Test find_needing_sync skips accounts of excluded connections."""
+        # Arrange
+        connection_id, _ = connection_with_provider
+
+        stale = create_test_account(
+            connection_id=connection_id,
+            name="Stale",
+            last_synced_at=None,
+        )
+
+        async with test_database.get_session() as session:
+            repo = AccountRepository(session=session)
+            await repo.save(stale)
+
+        # Act
+        async with test_database.get_session() as session:
+            repo = AccountRepository(session=session)
+            accounts = await repo.find_needing_sync(
+                timedelta(hours=1), exclude_connection_ids={connection_id}
+            )
+
+        # Assert
+        assert accounts == []
+
 
 @pytest.mark.integration
 class TestAccountRepositoryDelete:
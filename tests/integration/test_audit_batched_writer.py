@@ -0,0 +1,122 @@
+"""Integration tests for BatchedAuditWriter against PostgreSQL.
+
+Tests verify:
+1. Queued records are written with multi-row INSERTs
+2. Durable (compliance-critical) records are visible when record() returns
+3. Shutdown drains every queued record
+4. Metadata from publish() reaches rows written by the batched path
+
+Usage:
+    pytest tests/integration/test_audit_batched_writer.py -v
+"""
+
+from typing import cast
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import func, select
+from uuid_extensions import uuid7
+
+from src.core.result import Success
+from src.domain.enums import AuditAction
+from src.domain.events.auth_events import UserLoginSucceeded
+from src.domain.protocols.event_bus_protocol import EventHandler
+from src.infrastructure.audit.batched_writer import BatchedAuditWriter
+from src.infrastructure.events.handlers.audit_event_handler import AuditEventHandler
+from src.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from src.infrastructure.persistence.models.audit_log import AuditLog
+
+
+async def count_rows(database, user_id) -> int:
+    """Count audit rows of one user (fresh session, committed data only)."""
+    async with database.get_session() as session:
+        result = await session.execute(
+            select(func.count())
+            .select_from(AuditLog)
+            .where(AuditLog.user_id == user_id)
+        )
+        return int(result.scalar_one())
+
+
+@pytest.mark.integration
+class TestBatchedAuditWriter:
+    """Batching and durability against a real database."""
+
+    @pytest.mark.asyncio
+    async def test_queued_records_written_in_batches(self, test_database):
+        """Records are persisted in batches of batch_size."""
+        user_id = uuid7()
+        writer = BatchedAuditWriter(
+            database=test_database,
+            logger=MagicMock(),
+            batch_size=10,
+            flush_interval_seconds=60,
+        )
+        writer.start()
+
+        for _ in range(25):
+            result = await writer.record(
+                action=AuditAction.USER_LOGIN_SUCCESS,
+                resource_type="session",
+                user_id=user_id,
+                context={"method": "password"},
+            )
+            assert isinstance(result, Success)
+        await writer.aclose()
+
+        assert await count_rows(test_database, user_id) == 25
+        stats = writer.get_stats()
+        assert stats.written_records == 25
+        assert stats.batches == 3
+
+    @pytest.mark.asyncio
+    async def test_durable_record_visible_on_return(self, test_database):
+        """A compliance-critical record is committed before record() returns."""
+        user_id = uuid7()
+        writer = BatchedAuditWriter(
+            database=test_database, logger=MagicMock(), flush_interval_seconds=60
+        )
+        writer.start()
+
+        result = await writer.record(
+            action=AuditAction.USER_PASSWORD_CHANGED,
+            resource_type="user",
+            user_id=user_id,
+            resource_id=user_id,
+        )
+
+        assert isinstance(result, Success)
+        assert await count_rows(test_database, user_id) == 1
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_event_metadata_persisted_by_batched_path(self, test_database):
+        """Events published without a session are audited with request metadata."""
+        user_id = uuid7()
+        writer = BatchedAuditWriter(
+            database=test_database, logger=MagicMock(), flush_interval_seconds=60
+        )
+        writer.start()
+        event_bus = InMemoryEventBus(logger=MagicMock())
+        handler = AuditEventHandler(
+            database=test_database, event_bus=event_bus, audit_writer=writer
+        )
+        event_bus.subscribe(
+            UserLoginSucceeded,
+            cast(EventHandler, handler.handle_user_login_succeeded),
+        )
+
+        await event_bus.publish(
+            UserLoginSucceeded(user_id=user_id, email="user@example.com"),
+            metadata={"ip_address": "203.0.113.5", "user_agent": "Mozilla/5.0"},
+        )
+        await writer.aclose()
+
+        async with test_database.get_session() as session:
+            result = await session.execute(
+                select(AuditLog).where(AuditLog.user_id == user_id)
+            )
+            row = result.scalar_one()
+        assert row.action == AuditAction.USER_LOGIN_SUCCESS.value
+        assert row.ip_address == "203.0.113.5"
+        assert row.user_agent == "Mozilla/5.0"
@@ -0,0 +1,143 @@
+"""Performance verification tests for batched audit writes.
+
+Compares login throughput with audit enabled: every login publishes
+UserLoginAttempted + UserLoginSucceeded, audited either inline (one
+session + commit per record, the pre-batching path) or through the
+BatchedAuditWriter (records queued, one multi-row INSERT per batch).
+
+Test Strategy:
+- Run concurrent simulated logins through the real event bus and
+  AuditEventHandler against PostgreSQL
+- Report logins/sec for both paths and verify every record is persisted
+
+Note: These are verification tests, not precise benchmarks. Run with ``-s``
+to see the measured numbers:
+    pytest tests/integration/test_audit_writer_performance.py -s
+"""
+
+import asyncio
+import time
+from typing import cast
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import func, select
+from uuid_extensions import uuid7
+
+from src.domain.events.auth_events import UserLoginAttempted, UserLoginSucceeded
+from src.domain.protocols.event_bus_protocol import EventHandler
+from src.infrastructure.audit.batched_writer import BatchedAuditWriter
+from src.infrastructure.events.handlers.audit_event_handler import AuditEventHandler
+from src.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from src.infrastructure.persistence.models.audit_log import AuditLog
+
+
+CONCURRENT_LOGINS = 20
+LOGINS_PER_CLIENT = 25
+METADATA = {"ip_address": "203.0.113.7", "user_agent": "Mozilla/5.0"}
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+def build_event_bus(database, audit_writer=None) -> InMemoryEventBus:
+    """Event bus with the audit handler subscribed to login events."""
+    event_bus = InMemoryEventBus(logger=MagicMock())
+    handler = AuditEventHandler(
+        database=database, event_bus=event_bus, audit_writer=audit_writer
+    )
+    event_bus.subscribe(
+        UserLoginAttempted, cast(EventHandler, handler.handle_user_login_attempted)
+    )
+    event_bus.subscribe(
+        UserLoginSucceeded, cast(EventHandler, handler.handle_user_login_succeeded)
+    )
+    return event_bus
+
+
+async def run_logins(event_bus, database, user_ids, *, inline: bool) -> float:
+    """Run concurrent simulated logins; return logins per second."""
+
+    async def client(user_id) -> None:
+        for _ in range(LOGINS_PER_CLIENT):
+            attempted = UserLoginAttempted(email=f"{user_id}@example.com")
+            succeeded = UserLoginSucceeded(
+                user_id=user_id, email=f"{user_id}@example.com"
+            )
+            if inline:
+                # Pre-batching path: audit session committed per record
+                async with database.get_session() as session:
+                    await event_bus.publish(
+                        attempted, session=session, metadata=METADATA
+                    )
+                async with database.get_session() as session:
+                    await event_bus.publish(
+                        succeeded, session=session, metadata=METADATA
+                    )
+            else:
+                await event_bus.publish(attempted, metadata=METADATA)
+                await event_bus.publish(succeeded, metadata=METADATA)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(user_id) for user_id in user_ids))
+    return CONCURRENT_LOGINS * LOGINS_PER_CLIENT / (time.perf_counter() - start)
+
+
+async def count_success_rows(database, user_ids) -> int:
+    """Count USER_LOGIN_SUCCESS rows written for the given users."""
+    async with database.get_session() as session:
+        result = await session.execute(
+            select(func.count())
+            .select_from(AuditLog)
+            .where(AuditLog.user_id.in_(user_ids))
+        )
+        return int(result.scalar_one())
+
+
+# =============================================================================
+# Performance Verification Tests
+# =============================================================================
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.slow
+async def test_batched_audit_increases_login_throughput(test_database) -> None:
+    """Verify batched audit writes sustain more logins/sec than inline commits."""
+    logins = CONCURRENT_LOGINS * LOGINS_PER_CLIENT
+
+    inline_users = [uuid7() for _ in range(CONCURRENT_LOGINS)]
+    inline_rps = await run_logins(
+        build_event_bus(test_database), test_database, inline_users, inline=True
+    )
+
+    writer = BatchedAuditWriter(
+        database=test_database, logger=MagicMock(), flush_interval_seconds=0.05
+    )
+    writer.start()
+    batched_users = [uuid7() for _ in range(CONCURRENT_LOGINS)]
+    batched_rps = await run_logins(
+        build_event_bus(test_database, writer),
+        test_database,
+        batched_users,
+        inline=False,
+    )
+    await writer.aclose()
+    stats = writer.get_stats()
+
+    print(
+        f"\nLogin throughput with audit ({logins} logins, "
+        f"{CONCURRENT_LOGINS} concurrent, 2 audit records each):"
+        f"\n  Inline commit per record: {inline_rps:>8,.0f} logins/s"
+        f"\n  Batched audit writer:     {batched_rps:>8,.0f} logins/s"
+        f"\n  Batches written:          {stats.batches:>8}"
+        f"\n  Max batch latency:        {stats.max_flush_latency_ms:>8.1f} ms"
+    )
+
+    # Every record persisted by both paths (only successes carry user_id)
+    assert await count_success_rows(test_database, inline_users) == logins
+    assert await count_success_rows(test_database, batched_users) == logins
+    assert stats.dropped_records == 0
+    assert batched_rps > inline_rps
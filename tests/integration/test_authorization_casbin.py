@@ -23,6 +23,7 @@ Reference:
 """
 
 import os
+from unittest.mock import AsyncMock
 from uuid_extensions import uuid7
 
 import pytest
@@ -32,6 +33,8 @@ from casbin_async_sqlalchemy_adapter import Adapter as CasbinSQLAdapter
 
 from src.core.config import settings
 from src.infrastructure.authorization.casbin_adapter import CasbinAdapter
+from src.infrastructure.cache.cache_metrics import CacheMetrics
+from src.infrastructure.cache.local_cache import LocalTTLCache
 
 
 # =============================================================================
@@ -421,8 +424,8 @@ class TestCacheIntegration:
             action="read",
         )
 
-        # Verify cache.set was called
-        mock_cache.set.assert_called()
+        # Verify result was cached under the user's tag
+        mock_cache.set_with_tags.assert_called()
 
     @pytest.mark.asyncio
     async def test_role_change_invalidates_cache(
@@ -439,8 +442,66 @@ class TestCacheIntegration:
             assigned_by=admin_id,
         )
 
-        # Verify cache invalidation was called
-        mock_cache.delete_pattern.assert_called()
+        # Verify the user's tag was invalidated
+        mock_cache.invalidate_tag.assert_called_once_with(f"authz:tag:{user_id}")
+
+    @pytest.mark.asyncio
+    async def test_local_tier_serves_repeat_checks(
+        self,
+        casbin_enforcer,
+        mock_cache,
+        mock_audit,
+        mock_event_bus,
+        mock_logger,
+    ):
+        """Test that repeat checks are answered by the in-process tier."""
+        metrics = CacheMetrics()
+        adapter = CasbinAdapter(
+            enforcer=casbin_enforcer,
+            cache=mock_cache,
+            audit=mock_audit,
+            event_bus=mock_event_bus,
+            logger=mock_logger,
+            local_cache=LocalTTLCache(max_entries=100, ttl_seconds=60),
+            metrics=metrics,
+        )
+        user_id = uuid7()
+        await casbin_enforcer.add_role_for_user(str(user_id), "readonly")
+
+        first = await adapter.check_permission(user_id, "accounts", "read")
+        second = await adapter.check_permission(user_id, "accounts", "read")
+
+        assert first is True and second is True
+        mock_cache.get.assert_called_once()  # Redis consulted only once
+        stats = metrics.get_tier_stats("authz")
+        assert stats["l1"]["hits"] == 1
+        assert stats["l2"]["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_role_change_invalidates_local_tier_in_all_workers(
+        self,
+        casbin_enforcer,
+        mock_cache,
+        mock_audit,
+        mock_event_bus,
+        mock_logger,
+    ):
+        """Test that role changes broadcast an L1 invalidation for the user."""
+        invalidation = AsyncMock()
+        adapter = CasbinAdapter(
+            enforcer=casbin_enforcer,
+            cache=mock_cache,
+            audit=mock_audit,
+            event_bus=mock_event_bus,
+            logger=mock_logger,
+            local_cache=LocalTTLCache(max_entries=100, ttl_seconds=60),
+            invalidation=invalidation,
+        )
+        user_id = uuid7()
+
+        await adapter.assign_role(user_id=user_id, role="user", assigned_by=uuid7())
+
+        invalidation.invalidate.assert_awaited_once_with("authz", groups=[str(user_id)])
 
 
 # =============================================================================
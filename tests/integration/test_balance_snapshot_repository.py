@@ -7,6 +7,8 @@ Tests cover:
 - List by account with pagination
 - List by user across accounts
 - Get balance history with date range
+- Time-bucketed history (raw snapshots and daily rollups)
+- Bulk insert with unchanged-balance dedupe
 - Entity ↔ Model mapping (Money, SnapshotSource)
 
 Architecture:
@@ -26,6 +28,7 @@ from uuid_extensions import uuid7
 
 from src.domain.entities.balance_snapshot import BalanceSnapshot
 from src.domain.enums.account_type import AccountType
+from src.domain.enums.balance_granularity import BalanceGranularity
 from src.domain.enums.connection_status import ConnectionStatus
 from src.domain.enums.snapshot_source import SnapshotSource
 from src.domain.value_objects.money import Money
@@ -157,9 +160,14 @@ async def create_account_in_db(
 
 @pytest_asyncio.fixture(autouse=True)
 async def clean_snapshots_table(test_database):
-    """Clean up balance_snapshots table before each test."""
+    """Clean up balance_snapshots and rollup tables before each test."""
     async with test_database.get_session() as session:
-        await session.execute(text("TRUNCATE TABLE balance_snapshots CASCADE"))
+        await session.execute(
+            text(
+                "TRUNCATE TABLE balance_snapshots, "
+                "balance_snapshot_daily_rollups CASCADE"
+            )
+        )
         await session.commit()
     yield
 
@@ -529,3 +537,360 @@ class TestBalanceSnapshotRepositoryHistory:
         # Assert
         assert len(result) == 1
         assert result[0].source == SnapshotSource.ACCOUNT_SYNC
+
+
+@pytest.mark.integration
+class TestBalanceSnapshotRepositoryBuckets:
+    """Test BalanceSnapshotRepository time-bucketed history."""
+
+    async def _save_all(self, test_database, snapshots):
+        """Save snapshots in one committed session."""
+        async with test_database.get_session() as session:
+            repo = BalanceSnapshotRepository(session)
+            for snapshot in snapshots:
+                await repo.save(snapshot)
+            await session.commit()
+
+    @pytest.mark.asyncio
+    async def test_day_buckets_from_raw_snapshots(
+        self, test_database, account_with_connection
+    ):
+        """Test intraday snapshots collapse into one open/close/min/max bucket."""
+        # Arrange
+        account_id, _, _ = account_with_connection
+        day = datetime(2024, 3, 5, tzinfo=UTC)
+        balances = ["100.00", "80.00", "130.00", "120.00"]
+        await self._save_all(
+            test_database,
+            [
+                create_test_snapshot(
+                    account_id=account_id,
+                    captured_at=day + timedelta(hours=3 * i),
+                    balance=Money(Decimal(amount), "USD"),
+                )
+                for i, amount in enumerate(balances)
+            ],
+        )
+
+        # Act
+        async with test_database.get_session() as session:
+            repo = BalanceSnapshotRepository(session)
+            buckets = await repo.find_buckets_by_account_id(
+                account_id=account_id,
+                start_date=day,
+                end_date=day + timedelta(days=1),
+                granularity=BalanceGranularity.DAY,
+            )
+
+        # Assert
+        assert len(buckets) == 1
+        bucket = buckets[0]
+        assert bucket.bucket_start == day
+        assert bucket.open_balance == Decimal("100.00")
+        assert bucket.close_balance == Decimal("120.00")
+        assert bucket.min_balance == Decimal("80.00")
+        assert bucket.max_balance == Decimal("130.00")
+        assert bucket.snapshot_count == 4
+
+    @pytest.mark.asyncio
+    async def test_long_range_reads_daily_rollups(
+        self, test_database, account_with_connection
+    ):
+        """Test month buckets over a long range match the raw snapshots."""
+        # Arrange
+        account_id, _, _ = account_with_connection
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        await self._save_all(
+            test_database,
+            [
+                create_test_snapshot(
+                    account_id=account_id,
+                    captured_at=start + timedelta(days=i, hours=12),
+                    balance=Money(Decimal(1000 + i), "USD"),
+                )
+                for i in range(0, 120, 10)
+            ],
+        )
+
+        # Act
+        async with test_database.get_session() as session:
+            repo = BalanceSnapshotRepository(session)
+            buckets = await repo.find_buckets_by_account_id(
+                account_id=account_id,
+                start_date=start,
+                end_date=start + timedelta(days=120),
+                granularity=BalanceGranularity.MONTH,
+            )
+
+        # Assert - Jan (days 0-30), Feb, Mar, Apr
+        assert [b.bucket_start.month for b in buckets] == [1, 2, 3, 4]
+        assert buckets[0].open_balance == Decimal("1000")
+        assert buckets[0].close_balance == Decimal("1030")
+        assert buckets[-1].close_balance == Decimal("1110")
+        assert sum(b.snapshot_count for b in buckets) == 12
+
+    @pytest.mark.asyncio
+    async def test_delete_rebuilds_daily_rollup(
+        self, test_database, account_with_connection
+    ):
+        """Test deleting the last snapshot of a day updates its rollup."""
+        # Arrange
+        account_id, _, _ = account_with_connection
+        day = datetime(2024, 1, 10, 9, tzinfo=UTC)
+        first = create_test_snapshot(
+            account_id=account_id,
+            captured_at=day,
+            balance=Money(Decimal("500.00"), "USD"),
+        )
+        last = create_test_snapshot(
+            account_id=account_id,
+            captured_at=day + timedelta(hours=6),
+            balance=Money(Decimal("900.00"), "USD"),
+        )
+        await self._save_all(test_database, [first, last])
+
+        # Act
+        async with test_database.get_session() as session:
+            repo = BalanceSnapshotRepository(session)
+            await repo.delete(last.id)
+            await session.commit()
+
+        # Assert
+        async with test_database.get_session() as session:
+            row = (
+                await session.execute(
+                    text(
+                        "SELECT close_balance_amount, max_balance_amount, "
+                        "snapshot_count FROM balance_snapshot_daily_rollups "
+                        "WHERE account_id = :account_id"
+                    ),
+                    {"account_id": account_id},
+                )
+            ).one()
+        assert row.close_balance_amount == Decimal("500.00")
+        assert row.max_balance_amount == Decimal("500.00")
+        assert row.snapshot_count == 1
+
+    @pytest.mark.asyncio
+    async def test_user_buckets_sum_across_accounts(
+        self, test_database, account_with_connection
+    ):
+        """Test user buckets add up each account's close balance."""
+        # Arrange
+        account_id, connection_id, user_id = account_with_connection
+        async with test_database.get_session() as session:
+            other_account_id = await create_account_in_db(session, connection_id)
+
+        day = datetime(2024, 6, 1, tzinfo=UTC)
+        await self._save_all(
+            test_database,
+            [
+                create_test_snapshot(
+                    account_id=account_id,
+                    captured_at=day + timedelta(hours=1),
+                    balance=Money(Decimal("100.00"), "USD"),
+                ),
+                create_test_snapshot(
+                    account_id=account_id,
+                    captured_at=day + timedelta(hours=5),
+                    balance=Money(Decimal("150.00"), "USD"),
+                ),
+                create_test_snapshot(
+                    account_id=other_account_id,
+                    captured_at=day + timedelta(hours=2),
+                    balance=Money(Decimal("1000.00"), "USD"),
+                ),
+            ],
+        )
+
+        # Act
+        async with test_database.get_session() as session:
+            repo = BalanceSnapshotRepository(session)
+            buckets = await repo.find_buckets_by_user_id(
+                user_id=user_id,
+                start_date=day,
+                end_date=day + timedelta(days=1),
+                granularity=BalanceGranularity.DAY,
+            )
+
+        # Assert
+        assert len(buckets) == 1
+        assert buckets[0].open_balance == Decimal("1100.00")
+        assert buckets[0].close_balance == Decimal("1150.00")
+        assert buckets[0].account_count == 2
+        assert buckets[0].snapshot_count == 3
+        assert buckets[0].min_balance is None
+
+    @pytest.mark.asyncio
+    async def test_user_buckets_carry_last_close_forward(
+        self, test_database, account_with_connection
+    ):
+        """Test accounts without a snapshot in a bucket keep their last close."""
+        # Arrange - checking syncs daily, savings only on day 2 (and before
+        # the range)
+        account_id, connection_id, user_id = account_with_connection
+        async with test_database.get_session() as session:
+            savings_id = await create_account_in_db(session, connection_id)
+
+        day = datetime(2024, 6, 1, tzinfo=UTC)
+        await self._save_all(
+            test_database,
+            [
+                create_test_snapshot(
+                    account_id=savings_id,
+                    captured_at=day - timedelta(days=3),
+                    balance=Money(Decimal("900.00"), "USD"),
+                ),
+                *(
+                    create_test_snapshot(
+                        account_id=account_id,
+                        captured_at=day + timedelta(days=i, hours=1),
+                        balance=Money(Decimal(100 + i), "USD"),
+                    )
+                    for i in range(4)
+                ),
+                create_test_snapshot(
+                    account_id=savings_id,
+                    captured_at=day + timedelta(days=2, hours=6),
+                    balance=Money(Decimal("1000.00"), "USD"),
+                ),
+            ],
+        )
+
+        # Act
+        async with test_database.get_session() as session:
+            repo = BalanceSnapshotRepository(session)
+            buckets = await repo.find_buckets_by_user_id(
+                user_id=user_id,
+                start_date=day,
+                end_date=day + timedelta(days=4),
+                granularity=BalanceGranularity.DAY,
+            )
+
+        # Assert - savings contributes 900 (before the range) until day 2,
+        # then 1000; it has a snapshot only in the day 2 bucket
+        assert [b.close_balance for b in buckets] == [
+            Decimal("1000.00"),
+            Decimal("1001.00"),
+            Decimal("1102.00"),
+            Decimal("1103.00"),
+        ]
+        assert buckets[1].open_balance == Decimal("1001.00")
+        assert [b.account_count for b in buckets] == [2, 2, 2, 2]
+        assert [b.snapshot_count for b in buckets] == [1, 1, 2, 1]
+
+
+@pytest.mark.integration
+class TestBalanceSnapshotRepositoryBulkInsert:
+    """Test BalanceSnapshotRepository batched capture."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_persists_all_snapshots(
+        self, test_database, account_with_connection
+    ):
+        """Test bulk insert writes every snapshot and their daily rollup."""
+        # Arrange
+        account_id, _, _ = account_with_connection
+        day = datetime(2024, 2, 1, 8, tzinfo=UTC)
+        snapshots = [
+            create_test_snapshot(
+                account_id=account_id,
+                captured_at=day + timedelta(hours=i),
+                balance=Money(Decimal(100 + i), "USD"),
+            )
+            for i in range(5)
+        ]
+
+        # Act
+        async with test_database.get_session() as session:
+            repo = BalanceSnapshotRepository(session)
+            inserted = await repo.bulk_insert(snapshots, chunk_size=2)
+            await session.commit()
+
+        # Assert
+        assert inserted == 5
+        async with test_database.get_session() as session:
+            repo = BalanceSnapshotRepository(session)
+            stored = await repo.find_by_account_id(account_id)
+            rollup = (
+                await session.execute(
+                    text(
+                        "SELECT close_balance_amount, snapshot_count "
+                        "FROM balance_snapshot_daily_rollups "
+                        "WHERE account_id = :account_id"
+                    ),
+                    {"account_id": account_id},
+                )
+            ).one()
+        assert len(stored) == 5
+        assert rollup.close_balance_amount == Decimal("104")
+        assert rollup.snapshot_count == 5
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_commit_ends_transaction(
+        self, test_database, account_with_connection
+    ):
+        """Test commit=True keeps the snapshots when the caller rolls back."""
+        # Arrange
+        account_id, _, _ = account_with_connection
+        snapshot = create_test_snapshot(account_id=account_id)
+
+        # Act
+        async with test_database.get_session() as session:
+            repo = BalanceSnapshotRepository(session)
+            inserted = await repo.bulk_insert([snapshot], commit=True)
+            await session.rollback()
+
+        # Assert
+        assert inserted == 1
+        async with test_database.get_session() as session:
+            repo = BalanceSnapshotRepository(session)
+            assert await repo.count_by_account_id(account_id) == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_skips_unchanged_balance_within_window(
+        self, test_database, account_with_connection
+    ):
+        """Test dedupe drops a repeat balance but keeps a changed one."""
+        # Arrange
+        account_id, _, _ = account_with_connection
+        now = datetime.now(UTC)
+        async with test_database.get_session() as session:
+            repo = BalanceSnapshotRepository(session)
+            await repo.save(
+                create_test_snapshot(
+                    account_id=account_id,
+                    captured_at=now - timedelta(minutes=10),
+                    balance=Money(Decimal("500.00"), "USD"),
+                )
+            )
+            await session.commit()
+
+        # Act
+        async with test_database.get_session() as session:
+            repo = BalanceSnapshotRepository(session)
+            unchanged = await repo.bulk_insert(
+                [
+                    create_test_snapshot(
+                        account_id=account_id,
+                        captured_at=now,
+                        balance=Money(Decimal("500.00"), "USD"),
+                    )
+                ],
+                dedupe_window=timedelta(hours=1),
+            )
+            changed = await repo.bulk_insert(
+                [
+                    create_test_snapshot(
+                        account_id=account_id,
+                        captured_at=now,
+                        balance=Money(Decimal("650.00"), "USD"),
+                    )
+                ],
+                dedupe_window=timedelta(hours=1),
+            )
+            await session.commit()
+
+        # Assert
+        assert unchanged == 0
+        assert changed == 1
@@ -0,0 +1,145 @@
+"""Performance verification tests for bulk cache invalidation.
+
+Compares the previous per-key ``DELETE`` loop against the batched
+``RedisAdapter.delete_pattern`` (SCAN COUNT + multi-key UNLINK) and the
+tag-based ``invalidate_tag`` on a keyspace of 100k keys.
+
+Test Strategy:
+- Load 100k keys in one namespace (pipelined writes)
+- Time the legacy loop, batched delete_pattern and tag invalidation
+- Time a small per-user tag invalidation inside a large keyspace
+
+Note: These are verification tests, not precise benchmarks. Run with ``-s``
+to see the measured numbers:
+    pytest tests/integration/test_cache_invalidation_performance.py -s
+"""
+
+import time
+
+import pytest
+
+from src.core.result import Success
+from src.infrastructure.cache.redis_adapter import RedisAdapter
+
+
+KEY_COUNT = 100_000
+WRITE_CHUNK = 5_000
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+async def fill_keys(redis_client, prefix: str, count: int) -> list[str]:
+    """Write ``count`` keys under ``prefix`` and return them."""
+    keys = [f"{prefix}:{i}" for i in range(count)]
+    for start in range(0, count, WRITE_CHUNK):
+        chunk = keys[start : start + WRITE_CHUNK]
+        await redis_client.mset(dict.fromkeys(chunk, "1"))
+    return keys
+
+
+async def fill_tag(redis_client, tag: str, keys: list[str]) -> None:
+    """Register keys under a tag set."""
+    for start in range(0, len(keys), WRITE_CHUNK):
+        await redis_client.sadd(tag, *keys[start : start + WRITE_CHUNK])
+
+
+async def legacy_delete_pattern(redis_client, pattern: str) -> int:
+    """Previous strategy: one DELETE round trip per scanned key."""
+    deleted = 0
+    async for key in redis_client.scan_iter(match=pattern):
+        await redis_client.delete(key)
+        deleted += 1
+    return deleted
+
+
+# =============================================================================
+# Performance Verification Tests
+# =============================================================================
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.slow
+async def test_batched_invalidation_beats_per_key_delete(redis_test_client) -> None:
+    """Verify batched UNLINK and tag invalidation outperform per-key DELETE.
+
+    Legacy: 100k DELETE round trips plus SCAN pages of 10 keys.
+    Batched: SCAN pages of CACHE_SCAN_COUNT and one UNLINK per batch.
+    Tag: SSCAN of the tag set only, no keyspace walk.
+    """
+    adapter = RedisAdapter(redis_client=redis_test_client)
+    # Keys left by other tests in the shared test database
+    existing = await redis_test_client.dbsize()
+
+    await fill_keys(redis_test_client, "bench:legacy", KEY_COUNT)
+    start = time.perf_counter()
+    legacy_deleted = await legacy_delete_pattern(redis_test_client, "bench:legacy:*")
+    legacy_s = time.perf_counter() - start
+
+    await fill_keys(redis_test_client, "bench:batched", KEY_COUNT)
+    start = time.perf_counter()
+    batched = await adapter.delete_pattern("bench:batched:*")
+    batched_s = time.perf_counter() - start
+
+    keys = await fill_keys(redis_test_client, "bench:tagged", KEY_COUNT)
+    await fill_tag(redis_test_client, "bench:tag", keys)
+    start = time.perf_counter()
+    tagged = await adapter.invalidate_tag("bench:tag")
+    tagged_s = time.perf_counter() - start
+
+    print(f"\nInvalidating {KEY_COUNT:,} keys:")
+    print(f"  per-key DELETE loop:   {legacy_s * 1000:9.1f} ms")
+    print(f"  batched delete_pattern:{batched_s * 1000:9.1f} ms")
+    print(f"  invalidate_tag:        {tagged_s * 1000:9.1f} ms")
+
+    assert legacy_deleted == KEY_COUNT
+    assert batched == Success(value=KEY_COUNT)
+    assert tagged == Success(value=KEY_COUNT)
+    assert await redis_test_client.dbsize() == existing
+    assert batched_s < legacy_s, (
+        f"Batched delete ({batched_s:.2f}s) should beat per-key DELETE "
+        f"({legacy_s:.2f}s)"
+    )
+    assert tagged_s < legacy_s
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.slow
+async def test_tag_invalidation_independent_of_keyspace_size(
+    redis_test_client,
+) -> None:
+    """Verify dropping one user's namespace does not walk the whole keyspace.
+
+    A pattern delete for ``authz:{user_id}:*`` must SCAN all 100k keys to
+    find 20 matches; the tag holds exactly those 20 keys.
+    """
+    adapter = RedisAdapter(redis_client=redis_test_client)
+    existing = await redis_test_client.dbsize()
+    await fill_keys(redis_test_client, "authz:others", KEY_COUNT)
+
+    user_keys = [f"authz:user1:resource{i}:read" for i in range(20)]
+    await redis_test_client.mset(dict.fromkeys(user_keys, "1"))
+    start = time.perf_counter()
+    pattern_result = await adapter.delete_pattern("authz:user1:*")
+    pattern_s = time.perf_counter() - start
+
+    for key in user_keys:
+        await adapter.set_with_tags(key, "1", tags=["authz:tag:user1"], ttl=300)
+    start = time.perf_counter()
+    tag_result = await adapter.invalidate_tag("authz:tag:user1")
+    tag_s = time.perf_counter() - start
+
+    print(f"\nDropping 20 keys among {KEY_COUNT:,}:")
+    print(f"  delete_pattern: {pattern_s * 1000:8.2f} ms")
+    print(f"  invalidate_tag: {tag_s * 1000:8.2f} ms")
+
+    assert pattern_result == Success(value=20)
+    assert tag_result == Success(value=20)
+    assert await redis_test_client.dbsize() == existing + KEY_COUNT
+    assert tag_s < pattern_s
+
+    await adapter.delete_pattern("authz:others:*")
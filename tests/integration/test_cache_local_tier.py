@@ -0,0 +1,250 @@
+"""Integration tests for the in-process (L1) cache tier.
+
+Verifies that L1 tiers in front of Redis stay coherent across worker
+processes through Redis pub/sub invalidation.
+
+Architecture:
+- Tests against real Redis (not mocked)
+- Each "worker" has its own LocalTTLCache and RedisCacheInvalidationBus
+  (as separate processes would); all share the same Redis database
+- Unique pub/sub channel per test for isolation
+
+Reference:
+    - docs/architecture/cache-key-patterns.md
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from uuid_extensions import uuid7
+
+from src.domain.entities.provider_connection import ProviderConnection
+from src.domain.enums.connection_status import ConnectionStatus
+from src.domain.protocols.session_repository import SessionData
+from src.infrastructure.cache import RedisProviderConnectionCache, RedisSessionCache
+from src.infrastructure.cache.cache_invalidation import RedisCacheInvalidationBus
+from src.infrastructure.cache.cache_metrics import CacheMetrics
+from src.infrastructure.cache.local_cache import LocalTTLCache
+
+
+@dataclass
+class Worker:
+    """One simulated worker process (own L1 tiers and listener)."""
+
+    bus: RedisCacheInvalidationBus
+    sessions: RedisSessionCache
+    connections: RedisProviderConnectionCache
+    session_l1: LocalTTLCache
+    metrics: CacheMetrics
+
+
+def create_worker(cache_adapter, redis_client, channel: str) -> Worker:
+    """Wire caches for one worker the way the container does."""
+    bus = RedisCacheInvalidationBus(redis_client=redis_client, channel=channel)
+    metrics = CacheMetrics()
+    session_l1 = LocalTTLCache(max_entries=100, ttl_seconds=60)
+    connection_l1 = LocalTTLCache(max_entries=100, ttl_seconds=60)
+    bus.register("session", session_l1)
+    bus.register("provider_connection", connection_l1)
+    return Worker(
+        bus=bus,
+        sessions=RedisSessionCache(
+            cache=cache_adapter,
+            local_cache=session_l1,
+            invalidation=bus,
+            metrics=metrics,
+        ),
+        connections=RedisProviderConnectionCache(
+            cache=cache_adapter,
+            local_cache=connection_l1,
+            invalidation=bus,
+            metrics=metrics,
+        ),
+        session_l1=session_l1,
+        metrics=metrics,
+    )
+
+
+@pytest_asyncio.fixture
+async def workers(cache_adapter, redis_test_client) -> AsyncIterator[list[Worker]]:
+    """Two workers with running invalidation listeners."""
+    channel = f"cache:invalidate:test:{uuid7()}"
+    pair = [create_worker(cache_adapter, redis_test_client, channel) for _ in "ab"]
+    for worker in pair:
+        worker.bus.start()
+        await asyncio.wait_for(worker.bus.wait_ready(), timeout=5)
+
+    yield pair
+
+    for worker in pair:
+        await worker.bus.aclose()
+
+
+async def wait_until(predicate: Callable[[], bool], timeout: float = 2.0) -> None:
+    """Poll until a condition holds (pub/sub delivery is asynchronous)."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met before timeout")
+        await asyncio.sleep(0.01)
+
+
+async def drain(sender: Worker, receiver: Worker) -> None:
+    """Wait until receiver has applied every invalidation sender published.
+
+    Pub/sub preserves order, so once a marker published last is applied,
+    all earlier messages have been applied too.
+    """
+    receiver.session_l1.set("drain-marker", True)
+    await sender.bus.invalidate("session", keys=["drain-marker"])
+    await wait_until(lambda: receiver.session_l1.get("drain-marker") is None)
+
+
+def create_session(user_id=None) -> SessionData:
+    """Create an active session."""
+    now = datetime.now(UTC)
+    return SessionData(
+        id=uuid7(),
+        user_id=user_id or uuid7(),
+        device_info="Chrome on macOS",
+        ip_address="203.0.113.7",
+        created_at=now,
+        last_activity_at=now,
+        expires_at=now + timedelta(days=30),
+    )
+
+
+# =============================================================================
+# Read Path Tests
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestLocalTierReads:
+    """Tests for L1 hits in front of Redis."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_served_from_local_tier(
+        self, workers, redis_test_client
+    ):
+        """Second lookup does not touch Redis."""
+        worker, _ = workers
+        session = create_session()
+        await worker.sessions.set(session)
+
+        first = await worker.sessions.get(session.id)
+        # Remove from Redis behind the cache's back: L1 still answers
+        await redis_test_client.delete(f"session:{session.id}")
+        second = await worker.sessions.get(session.id)
+
+        assert first is not None and second is not None
+        assert second.id == session.id
+        assert second is not first  # Rebuilt per call, never shared
+        stats = worker.metrics.get_tier_stats("session")
+        assert stats["l1"]["hits"] == 1
+        assert stats["l2"]["hits"] == 1
+        assert stats["hit_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_redis_miss_is_not_cached_locally(self, workers):
+        """Misses always go back to Redis."""
+        worker, _ = workers
+        session = create_session()
+
+        assert await worker.sessions.get(session.id) is None
+        await worker.sessions.set(session)
+
+        assert await worker.sessions.get(session.id) is not None
+
+
+# =============================================================================
+# Cross-Worker Coherence Tests
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestCrossWorkerInvalidation:
+    """Tests for pub/sub invalidation between workers."""
+
+    @pytest.mark.asyncio
+    async def test_session_revoke_reaches_other_worker(self, workers):
+        """Worker B never keeps serving a session revoked on worker A."""
+        worker_a, worker_b = workers
+        session = create_session()
+        await worker_a.sessions.set(session)
+        await drain(worker_a, worker_b)
+        assert await worker_b.sessions.get(session.id) is not None
+        assert len(worker_b.session_l1) == 1
+
+        revoked = replace(session, is_revoked=True, revoked_reason="logout")
+        await worker_a.sessions.set(revoked)
+        await wait_until(lambda: len(worker_b.session_l1) == 0)
+
+        cached = await worker_b.sessions.get(session.id)
+        assert cached is not None
+        assert cached.is_revoked is True
+
+    @pytest.mark.asyncio
+    async def test_delete_all_for_user_reaches_other_worker(self, workers):
+        """Revoke-all drops every L1 session of the user in other workers."""
+        worker_a, worker_b = workers
+        user_id = uuid7()
+        sessions = [create_session(user_id) for _ in range(3)]
+        other_user_session = create_session()
+        for session in [*sessions, other_user_session]:
+            await worker_a.sessions.set(session)
+        await drain(worker_a, worker_b)
+        for session in [*sessions, other_user_session]:
+            await worker_b.sessions.get(session.id)
+        assert len(worker_b.session_l1) == 4
+
+        await worker_a.sessions.delete_all_for_user(user_id)
+        await wait_until(lambda: len(worker_b.session_l1) == 1)
+
+        for session in sessions:
+            assert await worker_b.sessions.get(session.id) is None
+        assert await worker_b.sessions.get(other_user_session.id) is not None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_user_spans_namespaces(self, workers):
+        """invalidate_user drops sessions and connections of the user."""
+        worker_a, worker_b = workers
+        session = create_session()
+        connection = ProviderConnection(
+            id=uuid7(),
+            user_id=session.user_id,
+            provider_id=uuid7(),
+            provider_slug="schwab",
+            status=ConnectionStatus.PENDING,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+        )
+        await worker_a.sessions.set(session)
+        await worker_a.connections.set(connection)
+        await drain(worker_a, worker_b)
+        await worker_b.sessions.get(session.id)
+        await worker_b.connections.get(connection.id)
+        hits_before = worker_b.metrics.get_stats("provider_connection:l1")["hits"]
+
+        await worker_a.bus.invalidate_user(session.user_id)
+        await wait_until(lambda: len(worker_b.session_l1) == 0)
+
+        await worker_b.connections.get(connection.id)
+        stats = worker_b.metrics.get_stats("provider_connection:l1")
+        assert stats["hits"] == hits_before  # Served from Redis again
+
+    @pytest.mark.asyncio
+    async def test_invalidation_skipped_when_loaded_before_it(self, workers):
+        """A Redis read racing an invalidation does not repopulate L1."""
+        worker, _ = workers
+        session = create_session()
+        await worker.sessions.set(session)
+        generation = worker.session_l1.generation
+
+        await worker.bus.invalidate("session", keys=[str(session.id)])
+
+        assert not worker.session_l1.set(str(session.id), {}, generation=generation)
@@ -15,6 +15,7 @@ Architecture:
 import pytest
 
 from src.core.result import Failure, Success
+from src.infrastructure.cache.redis_adapter import RedisAdapter
 from src.infrastructure.errors import CacheError
 
 
@@ -298,6 +299,60 @@ class TestCacheIntegration:
         assert isinstance(result, Success)
         assert result.value == 0
 
+    @pytest.mark.asyncio
+    async def test_delete_pattern_spans_multiple_batches(self, redis_test_client):
+        """Test delete_pattern removes keys across several UNLINK batches."""
+        adapter = RedisAdapter(
+            redis_client=redis_test_client, scan_count=10, delete_batch_size=7
+        )
+        await adapter.set_many({f"bulk:{i}": "v" for i in range(50)})
+        await adapter.set("other:1", "keep")
+
+        result = await adapter.delete_pattern("bulk:*")
+
+        assert isinstance(result, Success)
+        assert result.value == 50
+        assert await redis_test_client.exists("other:1") == 1
+
+    @pytest.mark.asyncio
+    async def test_set_with_tags_and_invalidate_tag(self, cache_adapter):
+        """Test invalidate_tag removes exactly the keys registered under it."""
+        await cache_adapter.set_with_tags(
+            "authz:u1:accounts:read", "1", tags=["authz:tag:u1"], ttl=60
+        )
+        await cache_adapter.set_with_tags(
+            "authz:u1:accounts:write", "0", tags=["authz:tag:u1"], ttl=60
+        )
+        await cache_adapter.set_with_tags(
+            "authz:u2:accounts:read", "1", tags=["authz:tag:u2"], ttl=60
+        )
+
+        result = await cache_adapter.invalidate_tag("authz:tag:u1")
+
+        assert isinstance(result, Success)
+        assert result.value == 2
+        assert (await cache_adapter.get("authz:u1:accounts:read")).value is None
+        assert (await cache_adapter.exists("authz:tag:u1")).value is False
+        assert (await cache_adapter.get("authz:u2:accounts:read")).value == "1"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_unknown_tag_returns_zero(self, cache_adapter):
+        """Test invalidate_tag on a missing tag is a no-op."""
+        result = await cache_adapter.invalidate_tag("tag:missing")
+        assert isinstance(result, Success)
+        assert result.value == 0
+
+    @pytest.mark.asyncio
+    async def test_tag_ttl_never_shorter_than_member_ttl(self, cache_adapter):
+        """Test tag set TTL is extended, never shortened, by new members."""
+        await cache_adapter.set_with_tags("k:long", "v", tags=["tag:ttl"], ttl=600)
+        await cache_adapter.set_with_tags("k:short", "v", tags=["tag:ttl"], ttl=60)
+
+        result = await cache_adapter.ttl("tag:ttl")
+
+        assert isinstance(result, Success)
+        assert result.value is not None and result.value > 60
+
     @pytest.mark.asyncio
     async def test_get_many_retrieves_multiple_values(self, cache_adapter):
         """Test get_many retrieves multiple values in single operation."""
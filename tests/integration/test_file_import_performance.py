@@ -0,0 +1,289 @@
+"""Performance verification tests for the bulk QFX import pipeline.
+
+Imports a generated 50k-row Chase QFX statement through
+ImportFromFileHandler against the real database, and compares the streaming
+transaction scanner with ofxparse's full-document parse.
+
+Test Strategy:
+- Generate a multi-year QFX export in memory (no large fixture in the repo)
+- Parse: ofxparse full document vs QfxParser (envelope + streaming scan)
+- Import: count SQL statements, commits and progress events for 50k rows
+- Re-import: every row is skipped by the single FITID prefetch
+
+Note: These are verification tests, not precise benchmarks. Run with ``-s``
+to see the measured numbers:
+    pytest tests/integration/test_file_import_performance.py -s
+"""
+
+import math
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, timedelta
+from io import BytesIO
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import pytest_asyncio
+from ofxparse import OfxParser  # type: ignore[import-untyped]
+from sqlalchemy import event, text
+from uuid_extensions import uuid7
+
+from src.application.commands.handlers import import_from_file_handler
+from src.application.commands.handlers.import_from_file_handler import (
+    ImportFromFileHandler,
+)
+from src.application.commands.import_commands import ImportFromFile
+from src.core.result import Success
+from src.domain.events.data_events import FileImportProgress
+from src.infrastructure.persistence.repositories.account_repository import (
+    AccountRepository,
+)
+from src.infrastructure.persistence.repositories.provider_connection_repository import (
+    ProviderConnectionRepository,
+)
+from src.infrastructure.persistence.repositories.provider_repository import (
+    ProviderRepository,
+)
+from src.infrastructure.persistence.repositories.transaction_repository import (
+    BULK_INSERT_CHUNK_SIZE,
+    TransactionRepository,
+)
+from src.infrastructure.providers.chase import ChaseFileProvider
+from src.infrastructure.providers.chase.parsers.qfx_parser import QfxParser
+
+
+ROW_COUNT = 50_000
+LEGACY_PARSE_ROW_COUNT = 5_000
+
+
+# =============================================================================
+# Generated QFX Fixture
+# =============================================================================
+
+
+def generate_qfx(row_count: int) -> bytes:
+    """Generate a Chase-style checking statement with ``row_count`` entries."""
+    start = date(2015, 1, 1)
+    parts = [
+        (
+            "OFXHEADER:100\nDATA:OFXSGML\nVERSION:102\nSECURITY:NONE\n"
+            "ENCODING:USASCII\nCHARSET:1252\nCOMPRESSION:NONE\n"
+            "OLDFILEUID:NONE\nNEWFILEUID:NONE\n\n"
+            "<OFX>\n<SIGNONMSGSRSV1>\n<SONRS>\n<STATUS>\n<CODE>0\n"
+            "<SEVERITY>INFO\n</STATUS>\n<DTSERVER>20241215120000\n"
+            "<LANGUAGE>ENG\n</SONRS>\n</SIGNONMSGSRSV1>\n<BANKMSGSRSV1>\n"
+            "<STMTTRNRS>\n<TRNUID>0\n<STATUS>\n<CODE>0\n<SEVERITY>INFO\n"
+            "</STATUS>\n<STMTRS>\n<CURDEF>USD\n<BANKACCTFROM>\n"
+            "<BANKID>021000021\n<ACCTID>555000111\n<ACCTTYPE>CHECKING\n"
+            "</BANKACCTFROM>\n<BANKTRANLIST>\n<DTSTART>20150101\n"
+            "<DTEND>20241215\n"
+        )
+    ]
+    for i in range(row_count):
+        posted = (start + timedelta(days=i % 3600)).strftime("%Y%m%d")
+        kind, sign = ("CREDIT", "") if i % 10 == 0 else ("DEBIT", "-")
+        parts.append(
+            f"<STMTTRN>\n<TRNTYPE>{kind}\n<DTPOSTED>{posted}\n"
+            f"<TRNAMT>{sign}{i % 500 + 1}.25\n<FITID>{posted}{i:08d}\n"
+            f"<NAME>MERCHANT {i % 97}\n<MEMO>Card purchase {i}\n</STMTTRN>\n"
+        )
+    parts.append(
+        "</BANKTRANLIST>\n<LEDGERBAL>\n<BALAMT>1000.00\n<DTASOF>20241215\n"
+        "</LEDGERBAL>\n</STMTRS>\n</STMTTRNRS>\n</BANKMSGSRSV1>\n</OFX>"
+    )
+    return "".join(parts).encode("ascii")
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+@dataclass
+class RoundTripCounter:
+    """SQL statement and commit counts captured from engine events."""
+
+    statements: int = 0
+    commits: int = 0
+
+
+@contextmanager
+def count_round_trips(database) -> Iterator[RoundTripCounter]:
+    """Count statements and commits issued through the database engine."""
+    counter = RoundTripCounter()
+    sync_engine = database.engine.sync_engine
+
+    def on_execute(*_args, **_kwargs):
+        counter.statements += 1
+
+    def on_commit(*_args, **_kwargs):
+        counter.commits += 1
+
+    event.listen(sync_engine, "before_cursor_execute", on_execute)
+    event.listen(sync_engine, "commit", on_commit)
+    try:
+        yield counter
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", on_execute)
+        event.remove(sync_engine, "commit", on_commit)
+
+
+async def import_file(session, user_id, content: bytes, event_bus):
+    """Run ImportFromFileHandler with real repositories."""
+    provider_factory = Mock()
+    provider_factory.get_provider.return_value = ChaseFileProvider()
+    handler = ImportFromFileHandler(
+        connection_repo=ProviderConnectionRepository(session=session),
+        account_repo=AccountRepository(session=session),
+        transaction_repo=TransactionRepository(session=session),
+        provider_repo=ProviderRepository(session=session),
+        provider_factory=provider_factory,
+        event_bus=event_bus,
+    )
+    return await handler.handle(
+        ImportFromFile(
+            user_id=user_id,
+            provider_slug="chase_file",
+            file_content=content,
+            file_format="qfx",
+            file_name="Chase5550_Activity_2015_2024.QFX",
+        )
+    )
+
+
+@pytest_asyncio.fixture
+async def import_user(test_database):
+    """Provide a user and the chase_file provider with clean import tables."""
+    from src.infrastructure.persistence.models.user import User as UserModel
+
+    async with test_database.get_session() as session:
+        await session.execute(text("TRUNCATE TABLE transactions CASCADE"))
+        await session.execute(text("TRUNCATE TABLE accounts CASCADE"))
+        await session.execute(
+            text("DELETE FROM provider_connections WHERE provider_slug = 'chase_file'")
+        )
+        result = await session.execute(
+            text("SELECT id FROM providers WHERE slug = 'chase_file' LIMIT 1")
+        )
+        if result.fetchone() is None:
+            await session.execute(
+                text("""
+                    INSERT INTO providers (id, slug, name, category, credential_type, is_active, created_at, updated_at)
+                    VALUES (:id, 'chase_file', 'Chase Bank (File Import)', 'bank', 'file_import', true, NOW(), NOW())
+                """),
+                {"id": uuid7()},
+            )
+        user_id = uuid7()
+        session.add(
+            UserModel(
+                id=user_id,
+                email=f"import_perf_{user_id}@example.com",
+                password_hash="$2b$12$test_hash",
+                is_verified=True,
+                is_active=True,
+                failed_login_attempts=0,
+            )
+        )
+        await session.commit()
+    return user_id
+
+
+# =============================================================================
+# Performance Verification Tests
+# =============================================================================
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+def test_streaming_scan_beats_full_document_parse() -> None:
+    """Verify parsing 50k rows is faster than ofxparse on a tenth of them.
+
+    ofxparse re-tokenizes the whole document and builds a BeautifulSoup tree
+    (superlinear); QfxParser hands ofxparse only the envelope and scans the
+    transaction list linearly.
+    """
+    small = generate_qfx(LEGACY_PARSE_ROW_COUNT)
+    large = generate_qfx(ROW_COUNT)
+
+    start = time.perf_counter()
+    legacy = OfxParser.parse(BytesIO(small))
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = QfxParser().parse(large, "generated.qfx")
+    streaming_s = time.perf_counter() - start
+
+    print(
+        f"\nQFX parse:"
+        f"\n  ofxparse full document ({LEGACY_PARSE_ROW_COUNT:,} rows): "
+        f"{legacy_s * 1000:8.0f} ms"
+        f"\n  QfxParser streaming    ({ROW_COUNT:,} rows): "
+        f"{streaming_s * 1000:8.0f} ms"
+    )
+
+    assert len(legacy.accounts[0].statement.transactions) == LEGACY_PARSE_ROW_COUNT
+    assert isinstance(result, Success)
+    assert len(result.value.transactions) == ROW_COUNT
+    assert streaming_s < legacy_s
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.slow
+async def test_50k_row_import_round_trips_and_progress(
+    test_database, import_user
+) -> None:
+    """Verify a 50k-row import is bounded by batch count, not row count.
+
+    Legacy path: one SELECT + INSERT and one commit per row, plus a progress
+    event every 100 rows (~100k statements, 50k commits, 500 events).
+    Bulk path: one FITID prefetch, ceil(rows / chunk) INSERTs, one commit per
+    batch, and progress events throttled to at most one per batch.
+    """
+    content = generate_qfx(ROW_COUNT)
+    batch_size = import_from_file_handler._TRANSACTION_BATCH_SIZE
+    batches = math.ceil(ROW_COUNT / batch_size)
+
+    event_bus = AsyncMock()
+    async with test_database.get_session() as session:
+        with count_round_trips(test_database) as counter:
+            start = time.perf_counter()
+            result = await import_file(session, import_user, content, event_bus)
+            elapsed = time.perf_counter() - start
+
+    progress = [
+        call.args[0]
+        for call in event_bus.publish.await_args_list
+        if isinstance(call.args[0], FileImportProgress)
+    ]
+
+    reimport_bus = AsyncMock()
+    async with test_database.get_session() as session:
+        with count_round_trips(test_database) as reimport_counter:
+            start = time.perf_counter()
+            reimport = await import_file(session, import_user, content, reimport_bus)
+            reimport_elapsed = time.perf_counter() - start
+
+    print(
+        f"\nImport of {ROW_COUNT:,} QFX rows:"
+        f"\n  first import: {counter.statements} statements, "
+        f"{counter.commits} commits, {len(progress)} progress events, "
+        f"{elapsed:.2f} s ({ROW_COUNT / elapsed:,.0f} rows/s)"
+        f"\n  re-import:    {reimport_counter.statements} statements, "
+        f"{reimport_counter.commits} commits, {reimport_elapsed:.2f} s"
+    )
+
+    assert isinstance(result, Success)
+    assert result.value.transactions_created == ROW_COUNT
+    assert isinstance(reimport, Success)
+    assert reimport.value.transactions_created == 0
+    assert reimport.value.transactions_skipped == ROW_COUNT
+
+    # Transaction INSERTs dominate; everything else is a handful of statements
+    insert_statements = batches * math.ceil(batch_size / BULK_INSERT_CHUNK_SIZE)
+    assert counter.statements <= insert_statements + 20
+    assert counter.commits <= batches + 5
+    assert len(progress) <= batches
+    assert reimport_counter.statements <= 20
@@ -0,0 +1,219 @@
+"""Performance verification tests for the QFX parse cache.
+
+Parses generated multi-account Chase QFX exports through ChaseFileProvider
+and compares:
+
+- Time: cold parse vs. re-upload of the same file through a new provider
+  instance (as the container creates one per request), served from the
+  shared SHA-256 keyed cache
+- Time: per-account reads (fetch_accounts + fetch_transactions per account)
+  vs. single-pass parse_file()
+- Memory: parse results retained after importing many distinct files with
+  the legacy unbounded per-instance dict vs. the byte-budgeted LRU cache
+
+Test Strategy:
+- Generate large multi-account QFX files in memory (no fixtures in the repo)
+- Measure with time.perf_counter and tracemalloc (no database needed)
+
+Note: These are verification tests, not precise benchmarks. Run with ``-s``
+to see the measured numbers:
+    pytest tests/integration/test_file_parse_cache_performance.py -s
+"""
+
+import gc
+import time
+import tracemalloc
+from datetime import date, timedelta
+from typing import Any
+
+import pytest
+
+from src.core.result import Success
+from src.infrastructure.providers.chase import ChaseFileProvider
+from src.infrastructure.providers.chase.parsers.qfx_parser import QfxParser
+from src.infrastructure.providers.file_parse_cache import FileParseCache
+
+
+ACCOUNTS_PER_FILE = 4
+ROWS_PER_ACCOUNT = 5_000
+DISTINCT_FILES = 8
+BUDGET_FILES = 2
+
+
+# =============================================================================
+# Generated QFX Fixture
+# =============================================================================
+
+
+def generate_multi_account_qfx(seed: int) -> bytes:
+    """Generate a Chase-style export with several checking statements."""
+    start = date(2015, 1, 1)
+    parts = [
+        (
+            "OFXHEADER:100\nDATA:OFXSGML\nVERSION:102\nSECURITY:NONE\n"
+            "ENCODING:USASCII\nCHARSET:1252\nCOMPRESSION:NONE\n"
+            "OLDFILEUID:NONE\nNEWFILEUID:NONE\n\n"
+            "<OFX>\n<SIGNONMSGSRSV1>\n<SONRS>\n<STATUS>\n<CODE>0\n"
+            "<SEVERITY>INFO\n</STATUS>\n<DTSERVER>20241215120000\n"
+            "<LANGUAGE>ENG\n</SONRS>\n</SIGNONMSGSRSV1>\n<BANKMSGSRSV1>\n"
+        )
+    ]
+    for account in range(ACCOUNTS_PER_FILE):
+        parts.append(
+            "<STMTTRNRS>\n<TRNUID>0\n<STATUS>\n<CODE>0\n<SEVERITY>INFO\n"
+            "</STATUS>\n<STMTRS>\n<CURDEF>USD\n<BANKACCTFROM>\n"
+            f"<BANKID>021000021\n<ACCTID>{seed:04d}{account:05d}\n"
+            "<ACCTTYPE>CHECKING\n</BANKACCTFROM>\n<BANKTRANLIST>\n"
+            "<DTSTART>20150101\n<DTEND>20241215\n"
+        )
+        for i in range(ROWS_PER_ACCOUNT):
+            posted = (start + timedelta(days=i % 3600)).strftime("%Y%m%d")
+            kind, sign = ("CREDIT", "") if i % 10 == 0 else ("DEBIT", "-")
+            parts.append(
+                f"<STMTTRN>\n<TRNTYPE>{kind}\n<DTPOSTED>{posted}\n"
+                f"<TRNAMT>{sign}{i % 500 + 1}.25\n"
+                f"<FITID>{seed:04d}{account:02d}{i:08d}\n"
+                f"<NAME>MERCHANT {i % 97}\n<MEMO>Card purchase {i}\n</STMTTRN>\n"
+            )
+        parts.append(
+            "</BANKTRANLIST>\n<LEDGERBAL>\n<BALAMT>1000.00\n<DTASOF>20241215\n"
+            "</LEDGERBAL>\n</STMTRS>\n</STMTTRNRS>\n"
+        )
+    parts.append("</BANKMSGSRSV1>\n</OFX>")
+    return "".join(parts).encode("ascii")
+
+
+def credentials(content: bytes) -> dict[str, Any]:
+    """Credentials dict for ChaseFileProvider."""
+    return {
+        "file_content": content,
+        "file_format": "qfx",
+        "file_name": "Chase_Multi_Activity.QFX",
+    }
+
+
+def retained_bytes(fill) -> int:
+    """Bytes still allocated after ``fill()`` returns what it retains."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        retained = fill()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del retained
+    return current
+
+
+# =============================================================================
+# Performance Verification Tests
+# =============================================================================
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.slow
+async def test_reupload_and_single_pass_faster_than_reparse() -> None:
+    """Verify cache hits and parse_file() avoid repeated parse work."""
+    content = generate_multi_account_qfx(seed=1)
+    cache = FileParseCache(max_bytes=len(content) * 4, max_entries=4)
+    creds = credentials(content)
+    rows = ACCOUNTS_PER_FILE * ROWS_PER_ACCOUNT
+
+    # Cold: new provider per request, empty cache
+    start = time.perf_counter()
+    cold = await ChaseFileProvider(parse_cache=cache).parse_file(creds)
+    cold_s = time.perf_counter() - start
+
+    # Re-upload: another request, same bytes, served from the shared cache
+    start = time.perf_counter()
+    warm = await ChaseFileProvider(parse_cache=cache).parse_file(creds)
+    warm_s = time.perf_counter() - start
+
+    # Per-account reads on a cold provider (the pre-parse_file handler flow)
+    provider = ChaseFileProvider()
+    start = time.perf_counter()
+    accounts = await provider.fetch_accounts(creds)
+    assert isinstance(accounts, Success)
+    per_account_rows = 0
+    for account in accounts.value:
+        txns = await provider.fetch_transactions(
+            creds, provider_account_id=account.provider_account_id
+        )
+        assert isinstance(txns, Success)
+        per_account_rows += len(txns.value)
+    per_account_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    key = FileParseCache.key_for(content)
+    key_s = time.perf_counter() - start
+
+    print(
+        f"\nQFX parse ({len(content) / 1_048_576:.1f} MiB, "
+        f"{ACCOUNTS_PER_FILE} accounts, {rows:,} rows):"
+        f"\n  cold parse_file():                 {cold_s * 1000:8.0f} ms"
+        f"\n  re-upload (cache hit):             {warm_s * 1000:8.0f} ms"
+        f"\n  fetch_accounts + per-account txns: {per_account_s * 1000:8.0f} ms"
+        f"\n  SHA-256 cache key:                 {key_s * 1000:8.1f} ms"
+    )
+
+    assert isinstance(cold, Success)
+    assert isinstance(warm, Success)
+    assert len(cold.value.accounts) == ACCOUNTS_PER_FILE
+    assert sum(len(t) for t in cold.value.transactions.values()) == rows
+    assert per_account_rows == rows
+    assert warm.value == cold.value
+    assert cache.get_stats().hits == 1
+    assert len(key) == 64
+    assert warm_s < cold_s
+    assert key_s < cold_s / 10
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+def test_byte_budget_bounds_retained_parse_results() -> None:
+    """Verify the LRU budget caps memory held after many distinct imports.
+
+    Legacy: one long-lived provider kept every parse result keyed by
+    hash(file_content), so memory grew with each imported file.
+    """
+    files = [generate_multi_account_qfx(seed=i) for i in range(DISTINCT_FILES)]
+    parser = QfxParser()
+    file_size = len(files[0])
+
+    def fill_unbounded() -> dict[int, Any]:
+        legacy_cache: dict[int, Any] = {}
+        for content in files:
+            result = parser.parse_statement(content)
+            assert isinstance(result, Success)
+            legacy_cache[hash(content)] = result.value
+        return legacy_cache
+
+    cache = FileParseCache(max_bytes=file_size * BUDGET_FILES, max_entries=16)
+
+    def fill_bounded() -> FileParseCache:
+        for content in files:
+            key = cache.key_for(content)
+            if cache.get(key) is None:
+                result = parser.parse_statement(content)
+                assert isinstance(result, Success)
+                cache.set(key, result.value, size_bytes=len(content))
+        return cache
+
+    unbounded = retained_bytes(fill_unbounded)
+    bounded = retained_bytes(fill_bounded)
+    per_file = unbounded / DISTINCT_FILES
+
+    print(
+        f"\nParse results retained after {DISTINCT_FILES} distinct imports "
+        f"({file_size / 1_048_576:.1f} MiB each):"
+        f"\n  unbounded dict:  {unbounded / 1_048_576:8.1f} MiB"
+        f"\n  LRU, {BUDGET_FILES}-file budget: {bounded / 1_048_576:8.1f} MiB "
+        f"({len(cache)} entries, {cache.get_stats().evictions} evictions)"
+        f"\n  parsed / file size: {per_file / file_size:.1f}x"
+    )
+
+    assert len(cache) == BUDGET_FILES
+    assert cache.size_bytes <= file_size * BUDGET_FILES
+    assert bounded < unbounded * (BUDGET_FILES + 1) / DISTINCT_FILES
@@ -279,6 +279,74 @@ class TestRedisStorageReset:
         assert remaining == 4  # 5 - 1
 
 
+@pytest.mark.integration
+class TestRedisStorageCheckAndConsumeMany:
+    """Tests for the multi-bucket (one EVALSHA) check."""
+
+    @pytest.mark.asyncio
+    async def test_consumes_from_every_bucket(
+        self, storage, test_rule, clean_keys
+    ) -> None:
+        """An allowed check consumes from all buckets."""
+        wide_rule = RateLimitRule(
+            max_tokens=100, refill_rate=60.0, scope=RateLimitScope.GLOBAL
+        )
+        buckets = [
+            ("rate_limit:test:many:ip", test_rule, 1),
+            ("rate_limit:test:many:global", wide_rule, 1),
+        ]
+
+        result = await storage.check_and_consume_many(buckets=buckets, now_ts=1000.0)
+
+        assert isinstance(result, Success)
+        allowed, states = result.value
+        assert allowed is True
+        assert states == [(0.0, 4), (0.0, 99)]
+
+    @pytest.mark.asyncio
+    async def test_denial_consumes_nothing(
+        self, storage, test_rule, clean_keys
+    ) -> None:
+        """If one bucket is empty, no bucket is charged."""
+        wide_rule = RateLimitRule(
+            max_tokens=100, refill_rate=60.0, scope=RateLimitScope.GLOBAL
+        )
+        ip_key = "rate_limit:test:many:deny:ip"
+        global_key = "rate_limit:test:many:deny:global"
+        for _ in range(5):
+            await storage.check_and_consume(
+                key_base=ip_key, rule=test_rule, now_ts=1000.0
+            )
+
+        result = await storage.check_and_consume_many(
+            buckets=[(ip_key, test_rule, 1), (global_key, wide_rule, 1)],
+            now_ts=1000.0,
+        )
+
+        allowed, states = result.value
+        assert allowed is False
+        assert states[0][0] == pytest.approx(1.0)  # 1 token/s refill
+        assert states[1] == (0.0, 100)  # untouched
+
+    @pytest.mark.asyncio
+    async def test_matches_single_bucket_script(
+        self, storage, test_rule, clean_keys
+    ) -> None:
+        """One bucket behaves exactly like check_and_consume."""
+        for expected in (4, 3, 2, 1, 0):
+            result = await storage.check_and_consume_many(
+                buckets=[("rate_limit:test:many:single", test_rule, 1)],
+                now_ts=1000.0,
+            )
+            assert result.value == (True, [(0.0, expected)])
+
+        result = await storage.check_and_consume_many(
+            buckets=[("rate_limit:test:many:single", test_rule, 1)],
+            now_ts=1000.0,
+        )
+        assert result.value[0] is False
+
+
 @pytest.mark.integration
 class TestRedisStorageFailOpen:
     """Tests for fail-open behavior."""
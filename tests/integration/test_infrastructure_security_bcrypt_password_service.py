@@ -11,6 +11,8 @@ Architecture:
 - Tests edge cases (invalid hashes, special characters)
 """
 
+import asyncio
+
 import pytest
 
 from src.infrastructure.security.bcrypt_password_service import BcryptPasswordService
@@ -185,3 +187,52 @@ class TestBcryptPasswordServiceIntegration:
             BcryptPasswordService(cost_factor=21)
 
         assert "above 20" in str(exc_info.value).lower()
+
+    def test_bcrypt_service_rejects_zero_workers(self):
+        """Test that service rejects an empty worker pool."""
+        with pytest.raises(ValueError) as exc_info:
+            BcryptPasswordService(max_workers=0)
+
+        assert "max_workers" in str(exc_info.value)
+
+    # =========================================================================
+    # Async (Worker Pool) Tests
+    # =========================================================================
+
+    @pytest.mark.asyncio
+    async def test_hash_password_async_round_trip(self):
+        """Test async hash verifies with both async and sync verify."""
+        service = BcryptPasswordService(cost_factor=10)
+
+        password_hash = await service.hash_password_async("SecurePass123!")
+
+        assert password_hash.startswith("$2b$10$")
+        assert await service.verify_password_async("SecurePass123!", password_hash)
+        assert not await service.verify_password_async("WrongPass", password_hash)
+        assert service.verify_password("SecurePass123!", password_hash)
+
+    @pytest.mark.asyncio
+    async def test_verify_password_async_handles_invalid_hash(self):
+        """Test that async verify returns False for invalid hash format."""
+        service = BcryptPasswordService(cost_factor=10)
+
+        assert await service.verify_password_async("password", "invalid") is False
+
+    @pytest.mark.asyncio
+    async def test_async_pool_bounds_concurrency_and_tracks_queue(self):
+        """Test that calls beyond max_workers queue and stats reflect it."""
+        service = BcryptPasswordService(cost_factor=10, max_workers=2)
+
+        hashes = await asyncio.gather(
+            *(service.hash_password_async(f"Password{i}!") for i in range(6))
+        )
+
+        assert len(set(hashes)) == 6
+        stats = service.get_stats()
+        assert stats["max_workers"] == 2
+        assert stats["completed"] == 6
+        assert stats["queued"] == 0
+        assert stats["active"] == 0
+        # 6 submitted at once with 2 workers: at least 4 waited in the queue
+        assert stats["max_queue_depth"] >= 4
+        assert stats["avg_wait_ms"] > 0
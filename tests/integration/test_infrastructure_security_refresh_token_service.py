@@ -5,24 +5,33 @@ Following testing architecture: NO unit tests for infrastructure adapters,
 only integration tests.
 
 Architecture:
-- Tests against real secrets and bcrypt libraries (no mocking)
-- Tests token generation and verification
+- Tests against real secrets, hmac and bcrypt libraries (no mocking)
+- Tests token generation and verification (selector/verifier + legacy bcrypt)
 - Tests security properties (uniqueness, format validation)
 - Tests expiration calculation
 """
 
+import secrets
+
+import bcrypt
 import pytest
 from datetime import UTC, datetime
 from freezegun import freeze_time
 
+from src.infrastructure.security.bcrypt_password_service import (
+    BcryptPasswordService,
+)
 from src.infrastructure.security.refresh_token_service import RefreshTokenService
 
 
+SECRET_KEY = "test-secret-key-with-at-least-32-characters"
+
+
 @pytest.mark.integration
 class TestRefreshTokenServiceIntegration:
     """Integration tests for Refresh Token service.
 
-    Uses real secrets/bcrypt libraries for cryptographic operations.
+    Uses real secrets/hmac/bcrypt libraries for cryptographic operations.
     No fixtures needed - service is stateless.
     """
 
@@ -32,22 +41,22 @@ class TestRefreshTokenServiceIntegration:
 
     def test_generate_token_creates_valid_tuple(self):
         """Test that generate_token returns (token, token_hash) tuple with valid formats."""
-        service = RefreshTokenService(expiration_days=30)
+        service = RefreshTokenService(secret_key=SECRET_KEY, expiration_days=30)
 
         token, token_hash = service.generate_token()
 
-        # Token should be urlsafe base64 (~43 chars for 32 bytes)
+        # Token is a 16-char selector + 43-char verifier (urlsafe base64)
         assert isinstance(token, str)
-        assert len(token) >= 40  # ~43 chars but allow some variance
+        assert len(token) == 59
 
-        # Token hash should be bcrypt format
+        # Token hash is an HMAC-SHA256 hex digest
         assert isinstance(token_hash, str)
-        assert token_hash.startswith("$2b$12$")
-        assert len(token_hash) == 60
+        assert len(token_hash) == 64
+        assert all(c in "0123456789abcdef" for c in token_hash)
 
     def test_generate_token_creates_unique_tokens(self):
         """Test that multiple token generations produce unique tokens and hashes."""
-        service = RefreshTokenService()
+        service = RefreshTokenService(secret_key=SECRET_KEY)
 
         # Generate 10 tokens
         results = [service.generate_token() for _ in range(10)]
@@ -58,12 +67,12 @@ class TestRefreshTokenServiceIntegration:
         # All tokens should be unique
         assert len(set(tokens)) == 10
 
-        # All hashes should be unique (different salts)
+        # All hashes should be unique
         assert len(set(hashes)) == 10
 
     def test_generate_token_creates_secure_length(self):
         """Test that generated token has secure length (32 bytes = 256 bits)."""
-        service = RefreshTokenService()
+        service = RefreshTokenService(secret_key=SECRET_KEY)
 
         token, _ = service.generate_token()
 
@@ -72,15 +81,29 @@ class TestRefreshTokenServiceIntegration:
         # Should be urlsafe base64 (no +, /, =)
         assert all(c.isalnum() or c in ["-", "_"] for c in token)
 
-    def test_generate_token_hash_is_bcrypt(self):
-        """Test that token hash uses bcrypt with cost factor 12."""
-        service = RefreshTokenService()
+    def test_generate_token_hash_is_keyed(self):
+        """Test that token hash depends on the secret key."""
+        service = RefreshTokenService(secret_key=SECRET_KEY)
+        other = RefreshTokenService(secret_key="another-secret-key-with-32-characters")
 
-        _, token_hash = service.generate_token()
+        token, token_hash = service.generate_token()
+
+        assert other.verify_token(token, token_hash) is False
+
+    def test_get_selector_returns_token_prefix(self):
+        """Test that selector is the fixed-length prefix of new tokens."""
+        service = RefreshTokenService(secret_key=SECRET_KEY)
+
+        token, _ = service.generate_token()
 
-        # Bcrypt format with cost 12
-        assert token_hash.startswith("$2b$12$")
-        assert len(token_hash) == 60
+        assert service.get_selector(token) == token[:16]
+
+    def test_get_selector_returns_none_for_legacy_tokens(self):
+        """Test that pre-selector tokens (43 chars) have no selector."""
+        service = RefreshTokenService(secret_key=SECRET_KEY)
+
+        assert service.get_selector(secrets.token_urlsafe(32)) is None
+        assert service.get_selector("") is None
 
     # =========================================================================
     # Token Verification Tests
@@ -88,7 +111,7 @@ class TestRefreshTokenServiceIntegration:
 
     def test_verify_token_success(self):
         """Test successful verification of correct token."""
-        service = RefreshTokenService()
+        service = RefreshTokenService(secret_key=SECRET_KEY)
 
         token, token_hash = service.generate_token()
 
@@ -97,7 +120,7 @@ class TestRefreshTokenServiceIntegration:
 
     def test_verify_token_failure_wrong_token(self):
         """Test that wrong token fails verification."""
-        service = RefreshTokenService()
+        service = RefreshTokenService(secret_key=SECRET_KEY)
 
         token1, token_hash1 = service.generate_token()
         token2, _ = service.generate_token()
@@ -107,7 +130,7 @@ class TestRefreshTokenServiceIntegration:
 
     def test_verify_token_handles_invalid_hash(self):
         """Test that invalid hash format returns False (no exception)."""
-        service = RefreshTokenService()
+        service = RefreshTokenService(secret_key=SECRET_KEY)
 
         token, _ = service.generate_token()
 
@@ -122,9 +145,61 @@ class TestRefreshTokenServiceIntegration:
             result = service.verify_token(token, invalid_hash)
             assert result is False
 
+    def test_verify_token_rejects_tampered_verifier(self):
+        """Test that a token with the right selector but wrong verifier fails."""
+        service = RefreshTokenService(secret_key=SECRET_KEY)
+
+        token, token_hash = service.generate_token()
+        _, other_hash = service.generate_token()
+        tampered = token[:16] + secrets.token_urlsafe(32)
+
+        assert service.verify_token(tampered, token_hash) is False
+        assert service.verify_token(token, other_hash) is False
+
+    def test_verify_token_accepts_legacy_bcrypt_hash(self):
+        """Test that tokens issued before the selector format still verify."""
+        service = RefreshTokenService(secret_key=SECRET_KEY)
+        legacy_token = secrets.token_urlsafe(32)
+        legacy_hash = bcrypt.hashpw(
+            legacy_token.encode("utf-8"), bcrypt.gensalt(rounds=4)
+        ).decode("utf-8")
+
+        assert service.verify_token(legacy_token, legacy_hash) is True
+        assert service.verify_token(secrets.token_urlsafe(32), legacy_hash) is False
+
+    @pytest.mark.asyncio
+    async def test_verify_token_async_runs_legacy_check_in_password_pool(self):
+        """Test that legacy bcrypt checks go through the password worker pool."""
+        password_service = BcryptPasswordService(cost_factor=10, max_workers=1)
+        service = RefreshTokenService(
+            secret_key=SECRET_KEY, password_service=password_service
+        )
+        legacy_token = secrets.token_urlsafe(32)
+        legacy_hash = bcrypt.hashpw(
+            legacy_token.encode("utf-8"), bcrypt.gensalt(rounds=4)
+        ).decode("utf-8")
+        token, token_hash = service.generate_token()
+
+        assert await service.verify_token_async(legacy_token, legacy_hash) is True
+        assert await service.verify_token_async("x" * 43, legacy_hash) is False
+        assert await service.verify_token_async(token, token_hash) is True
+        # Two bcrypt checks in the pool; the HMAC comparison ran inline
+        assert password_service.get_stats()["completed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_verify_token_async_without_password_service(self):
+        """Test that legacy bcrypt checks still verify without a pool."""
+        service = RefreshTokenService(secret_key=SECRET_KEY)
+        legacy_token = secrets.token_urlsafe(32)
+        legacy_hash = bcrypt.hashpw(
+            legacy_token.encode("utf-8"), bcrypt.gensalt(rounds=4)
+        ).decode("utf-8")
+
+        assert await service.verify_token_async(legacy_token, legacy_hash) is True
+
     def test_verify_token_handles_empty_token(self):
         """Test that empty token returns False."""
-        service = RefreshTokenService()
+        service = RefreshTokenService(secret_key=SECRET_KEY)
 
         _, token_hash = service.generate_token()
 
@@ -139,7 +214,7 @@ class TestRefreshTokenServiceIntegration:
     @freeze_time("2024-01-01 12:00:00")
     def test_calculate_expiration_returns_future_time(self):
         """Test that calculate_expiration returns time in future."""
-        service = RefreshTokenService(expiration_days=30)
+        service = RefreshTokenService(secret_key=SECRET_KEY, expiration_days=30)
 
         expires_at = service.calculate_expiration()
 
@@ -162,7 +237,7 @@ class TestRefreshTokenServiceIntegration:
 
         frozen_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
         for days, expected_days in test_cases:
-            service = RefreshTokenService(expiration_days=days)
+            service = RefreshTokenService(secret_key=SECRET_KEY, expiration_days=days)
             expires_at = service.calculate_expiration()
 
             delta = expires_at - frozen_time
@@ -0,0 +1,105 @@
+"""Performance verification tests for the in-process (L1) cache tier.
+
+Compares session revocation lookups (the per-request check in
+``get_current_active_user``) served by Redis only with lookups served by the
+L1 tier in front of Redis.
+
+Test Strategy:
+- Cache a working set of sessions in Redis
+- Look sessions up repeatedly (hot set, as under steady authenticated load)
+- Report lookups/sec and the per-tier hit ratios from CacheMetrics
+
+Note: These are verification tests, not precise benchmarks. Run with ``-s``
+to see the measured numbers:
+    pytest tests/integration/test_local_cache_performance.py -s
+"""
+
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from uuid_extensions import uuid7
+
+from src.domain.protocols.session_repository import SessionData
+from src.infrastructure.cache import RedisSessionCache
+from src.infrastructure.cache.cache_metrics import CacheMetrics
+from src.infrastructure.cache.local_cache import LocalTTLCache
+
+
+SESSIONS = 200
+LOOKUPS = 5_000
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+def create_session() -> SessionData:
+    """Create an active session."""
+    now = datetime.now(UTC)
+    return SessionData(
+        id=uuid7(),
+        user_id=uuid7(),
+        device_info="Chrome on macOS",
+        ip_address="203.0.113.7",
+        created_at=now,
+        last_activity_at=now,
+        expires_at=now + timedelta(days=30),
+    )
+
+
+async def measure(
+    session_cache: RedisSessionCache, sessions: list[SessionData]
+) -> float:
+    """Return session lookups per second over the hot set."""
+    start = time.perf_counter()
+    for index in range(LOOKUPS):
+        found = await session_cache.get(sessions[index % len(sessions)].id)
+        assert found is not None
+    return LOOKUPS / (time.perf_counter() - start)
+
+
+# =============================================================================
+# Performance Verification Tests
+# =============================================================================
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.slow
+async def test_local_tier_outperforms_redis_only_lookups(cache_adapter) -> None:
+    """Verify L1 lookups beat a Redis GET + JSON decode per request.
+
+    Redis only: one round trip and JSON decode per lookup. L1: the first
+    lookup per session goes to Redis, the rest are dict hits (TTL longer
+    than the run).
+    """
+    sessions = [create_session() for _ in range(SESSIONS)]
+    redis_only = RedisSessionCache(cache=cache_adapter, metrics=CacheMetrics())
+    for session in sessions:
+        await redis_only.set(session)
+
+    metrics = CacheMetrics()
+    tiered = RedisSessionCache(
+        cache=cache_adapter,
+        local_cache=LocalTTLCache(max_entries=SESSIONS * 2, ttl_seconds=60),
+        metrics=metrics,
+    )
+
+    redis_rps = await measure(redis_only, sessions)
+    tiered_rps = await measure(tiered, sessions)
+    stats = metrics.get_tier_stats("session")
+
+    print(
+        f"\nSession lookups ({LOOKUPS} lookups over {SESSIONS} sessions):"
+        f"\n  Redis only:      {redis_rps:>10,.0f} lookups/s"
+        f"\n  L1 + Redis:      {tiered_rps:>10,.0f} lookups/s"
+        f"\n  L1 hit rate:     {stats['l1']['hit_rate']:>10.2%}"
+        f"\n  L2 hit rate:     {stats['l2']['hit_rate']:>10.2%}"
+        f"\n  Combined:        {stats['hit_rate']:>10.2%}"
+    )
+
+    assert stats["l1"]["misses"] == SESSIONS
+    assert stats["hit_rate"] == 1.0
+    assert tiered_rps > redis_rps
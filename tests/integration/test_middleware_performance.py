@@ -0,0 +1,213 @@
+"""Performance verification tests for TraceMiddleware and RateLimitMiddleware.
+
+Compares per-request overhead of the previous ``BaseHTTPMiddleware``
+implementations (task + memory-stream hop per request) with the raw ASGI
+implementations on a trivial endpoint.
+
+Test Strategy:
+- Wrap a bare Router with one ``GET`` endpoint in each middleware variant
+- Drive the ASGI app directly (no HTTP client) so only middleware cost shows
+- Report requests/sec and p99 latency, plus p99 overhead over no middleware
+- Rate limiter is a stub that always allows (no Redis round trip)
+
+Note: These are verification tests, not precise benchmarks. Run with ``-s``
+to see the measured numbers:
+    pytest tests/integration/test_middleware_performance.py -s
+"""
+
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+import pytest
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route, Router
+from starlette.types import ASGIApp, Message, Scope
+from uuid_extensions import uuid7
+
+from src.core.result import Success
+from src.domain.value_objects.rate_limit_rule import RateLimitResult
+from src.presentation.routers.api.middleware.rate_limit_middleware import (
+    RateLimitMiddleware,
+)
+from src.presentation.routers.api.middleware.trace_middleware import (
+    TraceMiddleware,
+    trace_id_context,
+)
+
+
+REQUESTS = 3_000
+WARMUP = 200
+# Rate limited endpoint (user scope, falls back to IP) from the route registry
+PATH = "/api/v1/accounts"
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+class StubRateLimit:
+    """Rate limiter that always allows (isolates middleware overhead)."""
+
+    _result = Success(
+        value=RateLimitResult(allowed=True, remaining=99, limit=100, reset_seconds=1)
+    )
+
+    async def is_allowed(self, *, endpoint: str, identifier: str, cost: int = 1):
+        return self._result
+
+
+# =============================================================================
+# Previous Implementations (BaseHTTPMiddleware)
+# =============================================================================
+
+
+class LegacyTraceMiddleware(BaseHTTPMiddleware):
+    """Previous TraceMiddleware implementation."""
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        trace_id = request.headers.get("X-Trace-Id") or str(uuid7())
+        trace_id_context.set(trace_id)
+        try:
+            response = await call_next(request)
+            response.headers["X-Trace-Id"] = trace_id
+            return response
+        finally:
+            trace_id_context.set(None)
+
+
+class LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+    """Previous RateLimitMiddleware dispatch (allowed path)."""
+
+    def __init__(self, app: ASGIApp, rate_limit: StubRateLimit) -> None:
+        super().__init__(app)
+        self._rate_limit = rate_limit
+        self._helpers = RateLimitMiddleware(app)
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        path = request.url.path
+        endpoint = f"{request.method} {path}"
+        identifier = self._helpers._extract_identifier(request, "user")
+        result = await self._rate_limit.is_allowed(
+            endpoint=endpoint, identifier=identifier, cost=1
+        )
+        rate_result = result.value
+        response = await call_next(request)
+        response.headers["X-RateLimit-Limit"] = str(rate_result.limit)
+        response.headers["X-RateLimit-Remaining"] = str(rate_result.remaining)
+        response.headers["X-RateLimit-Reset"] = str(rate_result.reset_seconds)
+        return response
+
+
+async def ok(request: Request) -> PlainTextResponse:
+    """Trivial endpoint."""
+    return PlainTextResponse("ok")
+
+
+def make_router() -> Router:
+    """Create the bare app under test."""
+    return Router(routes=[Route(PATH, ok)])
+
+
+def asgi_rate_limit(app: ASGIApp) -> RateLimitMiddleware:
+    """Create the ASGI RateLimitMiddleware with the stub limiter."""
+    middleware = RateLimitMiddleware(app)
+    middleware._rate_limit = StubRateLimit()  # type: ignore[assignment]
+    return middleware
+
+
+async def measure(app: ASGIApp) -> tuple[float, float]:
+    """Return (requests/sec, p99 latency in microseconds) for an ASGI app."""
+    scope: Scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": PATH,
+        "raw_path": PATH.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("203.0.113.7", 50000),
+        "server": ("testserver", 80),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    status: list[int] = []
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    for _ in range(WARMUP):
+        await app(dict(scope), receive, send)
+
+    samples = []
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        request_start = time.perf_counter()
+        await app(dict(scope), receive, send)
+        samples.append(time.perf_counter() - request_start)
+    elapsed = time.perf_counter() - start
+
+    assert set(status) == {200}
+    p99 = statistics.quantiles(samples, n=100)[98]
+    return REQUESTS / elapsed, p99 * 1_000_000
+
+
+# =============================================================================
+# Performance Verification Tests
+# =============================================================================
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.slow
+async def test_asgi_middleware_overhead_below_base_http_middleware() -> None:
+    """Verify raw ASGI middleware costs less per request than BaseHTTPMiddleware.
+
+    BaseHTTPMiddleware: runs the endpoint in a separate task and streams the
+    response through an anyio memory stream. Raw ASGI: wraps ``send`` only.
+    """
+    rate_limit = StubRateLimit()
+    variants: dict[str, ASGIApp] = {
+        "no middleware": make_router(),
+        "trace (BaseHTTPMiddleware)": LegacyTraceMiddleware(make_router()),
+        "trace (ASGI)": TraceMiddleware(make_router()),
+        "rate limit (BaseHTTPMiddleware)": LegacyRateLimitMiddleware(
+            make_router(), rate_limit=rate_limit
+        ),
+        "rate limit (ASGI)": asgi_rate_limit(make_router()),
+        "trace + rate limit (BaseHTTPMiddleware)": LegacyRateLimitMiddleware(
+            LegacyTraceMiddleware(make_router()), rate_limit=rate_limit
+        ),
+        "trace + rate limit (ASGI)": asgi_rate_limit(TraceMiddleware(make_router())),
+    }
+
+    results = {label: await measure(app) for label, app in variants.items()}
+    _, baseline_p99 = results["no middleware"]
+
+    print(f"\nMiddleware overhead ({REQUESTS} requests, trivial endpoint):")
+    for label, (rps, p99) in results.items():
+        print(
+            f"  {label:<40} {rps:>9,.0f} req/s | p99 {p99:7.1f} us"
+            f" | p99 overhead {p99 - baseline_p99:7.1f} us"
+        )
+
+    for name in ("trace", "rate limit", "trace + rate limit"):
+        legacy_rps, _ = results[f"{name} (BaseHTTPMiddleware)"]
+        asgi_rps, _ = results[f"{name} (ASGI)"]
+        assert asgi_rps > legacy_rps, (
+            f"ASGI {name} ({asgi_rps:.0f} req/s) should beat "
+            f"BaseHTTPMiddleware ({legacy_rps:.0f} req/s)"
+        )
@@ -0,0 +1,138 @@
+"""Performance verification tests for async bcrypt offloading.
+
+Compares p99 latency of an unrelated endpoint while a burst of logins is
+running, with bcrypt executed inline on the event loop (verify_password)
+versus in the bounded worker pool (verify_password_async).
+
+Test Strategy:
+- Serve a minimal ASGI app with a login endpoint and a health endpoint
+- Fire concurrent logins while continuously probing the health endpoint
+- Compare health endpoint p99 latency for blocking vs pooled hashing
+
+Note: These are verification tests, not precise benchmarks. Run with ``-s``
+to see the measured numbers:
+    pytest tests/integration/test_password_hashing_performance.py -s
+"""
+
+import asyncio
+import statistics
+import time
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.infrastructure.security.bcrypt_password_service import BcryptPasswordService
+
+
+CONCURRENT_LOGINS = 16
+PROBE_INTERVAL_SECONDS = 0.01
+PASSWORD = "SecurePass123!"
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+def build_app(service: BcryptPasswordService, password_hash: str, *, pooled: bool):
+    """Build an app whose login endpoint verifies inline or in the pool."""
+    app = FastAPI()
+
+    @app.post("/login")
+    async def login() -> dict[str, bool]:
+        if pooled:
+            valid = await service.verify_password_async(PASSWORD, password_hash)
+        else:
+            valid = service.verify_password(PASSWORD, password_hash)
+        return {"valid": valid}
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+async def measure_health_latency_during_logins(app: FastAPI) -> list[float]:
+    """Probe /health on a fixed schedule until a burst of logins completes.
+
+    Latency is measured from each probe's scheduled start time, so time the
+    event loop spent blocked before the probe could be sent is included
+    (avoids coordinated omission).
+
+    Returns:
+        Health endpoint latencies in seconds.
+    """
+    latencies: list[float] = []
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        logins = asyncio.gather(
+            *(client.post("/login") for _ in range(CONCURRENT_LOGINS))
+        )
+        start = time.perf_counter()
+        probe = 0
+        while not logins.done():
+            scheduled = start + probe * PROBE_INTERVAL_SECONDS
+            await asyncio.sleep(max(scheduled - time.perf_counter(), 0))
+            response = await client.get("/health")
+            assert response.status_code == 200
+            # Probes missed while the loop was blocked each count as late
+            now = time.perf_counter()
+            while scheduled <= now:
+                latencies.append(now - scheduled)
+                probe += 1
+                scheduled = start + probe * PROBE_INTERVAL_SECONDS
+
+        responses = await logins
+    assert all(r.json() == {"valid": True} for r in responses)
+    return latencies
+
+
+def p99(latencies: list[float]) -> float:
+    """Return the 99th percentile latency."""
+    if len(latencies) < 2:
+        return latencies[0]
+    return statistics.quantiles(latencies, n=100)[98]
+
+
+# =============================================================================
+# Performance Verification Tests
+# =============================================================================
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.slow
+async def test_pooled_hashing_keeps_unrelated_endpoints_responsive() -> None:
+    """Verify login bursts no longer stall unrelated requests.
+
+    Blocking path: each verify holds the event loop for the full bcrypt
+    duration, so health probes queue behind logins. Pooled path: bcrypt runs
+    on worker threads (GIL released) and health probes stay fast.
+    """
+    service = BcryptPasswordService(cost_factor=12, max_workers=4)
+    password_hash = service.hash_password(PASSWORD)
+
+    blocking = await measure_health_latency_during_logins(
+        build_app(service, password_hash, pooled=False)
+    )
+    pooled = await measure_health_latency_during_logins(
+        build_app(service, password_hash, pooled=True)
+    )
+
+    blocking_p99, pooled_p99 = p99(blocking), p99(pooled)
+    print(
+        f"\n/health p99 during {CONCURRENT_LOGINS} concurrent logins:"
+        f"\n  blocking: {blocking_p99 * 1000:.1f} ms ({len(blocking)} probes)"
+        f"\n  pooled:   {pooled_p99 * 1000:.1f} ms ({len(pooled)} probes)"
+        f"\n  pool stats: {service.get_stats()}"
+    )
+
+    # Conservative: timing varies by environment, but a single inline bcrypt
+    # call (~250ms at cost 12) dwarfs a pooled health probe
+    assert pooled_p99 < blocking_p99, (
+        f"Pooled p99 ({pooled_p99:.3f}s) should be lower than "
+        f"blocking p99 ({blocking_p99:.3f}s)"
+    )
+    assert service.get_stats()["max_queue_depth"] > 0
@@ -0,0 +1,194 @@
+"""Integration tests for RedisQueryResultCache.
+
+Tests the Redis-backed query result cache used by CachedQueryHandler:
+- Result DTO round trip (UUID, Decimal, datetime, nested dataclasses)
+- Deterministic, user-scoped keys per query fingerprint
+- Per-user invalidation (other users untouched)
+- Fail-open on undecodable entries
+
+Test Strategy:
+- Real Redis from test environment
+- Real query and result DTOs from the accounts feature
+"""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import cast
+from uuid import UUID
+
+import pytest
+from uuid_extensions import uuid7
+
+from src.application.queries.account_queries import ListAccountsByUser
+from src.application.queries.handlers.get_account_handler import AccountResult
+from src.application.queries.handlers.list_accounts_handler import AccountListResult
+from src.domain.enums.account_type import AccountType
+from src.infrastructure.cache.cache_keys import CacheKeys
+from src.infrastructure.cache.query_result_cache import (
+    RedisQueryResultCache,
+    query_fingerprint,
+)
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+def build_account_list_result() -> AccountListResult:
+    """Build an account list DTO covering all serialized value types."""
+    now = datetime.now(UTC)
+    account = AccountResult(
+        id=cast(UUID, uuid7()),
+        connection_id=cast(UUID, uuid7()),
+        provider_account_id="ACCT-001",
+        account_number_masked="****1234",
+        name="Brokerage",
+        account_type="brokerage",
+        currency="USD",
+        balance_amount=Decimal("12345.67"),
+        balance_currency="USD",
+        available_balance_amount=None,
+        available_balance_currency=None,
+        is_active=True,
+        is_investment=True,
+        is_bank=False,
+        is_retirement=False,
+        is_credit=False,
+        last_synced_at=None,
+        created_at=now,
+        updated_at=now,
+    )
+    return AccountListResult(
+        accounts=[account],
+        total_count=1,
+        active_count=1,
+        total_balance_by_currency={"USD": "12345.67"},
+    )
+
+
+@pytest.fixture
+def query_cache(cache_adapter) -> RedisQueryResultCache:
+    """RedisQueryResultCache backed by the test Redis."""
+    return RedisQueryResultCache(
+        cache=cache_adapter, cache_keys=CacheKeys(prefix="dashtam")
+    )
+
+
+# =============================================================================
+# Round Trip Tests
+# =============================================================================
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_result_round_trip(query_cache: RedisQueryResultCache) -> None:
+    """Cached DTO is rebuilt equal to the original (types preserved)."""
+    query = ListAccountsByUser(user_id=cast(UUID, uuid7()))
+    value = build_account_list_result()
+
+    await query_cache.set(query, value, ttl=60)
+    cached = await query_cache.get(query, AccountListResult)
+
+    assert cached == value
+    assert cached is not None
+    assert isinstance(cached.accounts[0].balance_amount, Decimal)
+    assert isinstance(cached.accounts[0].id, UUID)
+    assert isinstance(cached.accounts[0].created_at, datetime)
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_miss_returns_none(query_cache: RedisQueryResultCache) -> None:
+    """Uncached query returns None."""
+    query = ListAccountsByUser(user_id=cast(UUID, uuid7()))
+
+    assert await query_cache.get(query, AccountListResult) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_query_parameters_produce_distinct_entries(
+    query_cache: RedisQueryResultCache,
+) -> None:
+    """Different filters for the same user are cached separately."""
+    user_id = cast(UUID, uuid7())
+    all_accounts = ListAccountsByUser(user_id=user_id)
+    ira_only = ListAccountsByUser(user_id=user_id, account_type=AccountType.IRA)
+
+    await query_cache.set(all_accounts, build_account_list_result(), ttl=60)
+
+    assert query_cache.key_for(all_accounts) != query_cache.key_for(ira_only)
+    assert await query_cache.get(ira_only, AccountListResult) is None
+
+
+# =============================================================================
+# Key and Invalidation Tests
+# =============================================================================
+
+
+@pytest.mark.integration
+def test_key_is_user_scoped_and_deterministic() -> None:
+    """Key embeds user_id, query name, and a stable fingerprint."""
+    cache_keys = CacheKeys(prefix="dashtam")
+    query_cache = RedisQueryResultCache(cache=None, cache_keys=cache_keys)  # type: ignore[arg-type]
+    user_id = cast(UUID, uuid7())
+    query = ListAccountsByUser(user_id=user_id, active_only=True)
+
+    key = query_cache.key_for(query)
+
+    assert key == query_cache.key_for(
+        ListAccountsByUser(user_id=user_id, active_only=True)
+    )
+    assert key == (
+        f"dashtam:query:{user_id}:list_accounts_by_user:{query_fingerprint(query)}"
+    )
+
+
+@pytest.mark.integration
+def test_fingerprint_ignores_user_id() -> None:
+    """Same parameters for different users share a fingerprint."""
+    first = ListAccountsByUser(user_id=cast(UUID, uuid7()), active_only=True)
+    second = ListAccountsByUser(user_id=cast(UUID, uuid7()), active_only=True)
+
+    assert query_fingerprint(first) == query_fingerprint(second)
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_invalidate_user_removes_only_that_user(
+    query_cache: RedisQueryResultCache,
+) -> None:
+    """invalidate_user drops all of a user's entries and nobody else's."""
+    user_id = cast(UUID, uuid7())
+    other_user_id = cast(UUID, uuid7())
+    value = build_account_list_result()
+    user_queries = [
+        ListAccountsByUser(user_id=user_id),
+        ListAccountsByUser(user_id=user_id, active_only=True),
+    ]
+    other_query = ListAccountsByUser(user_id=other_user_id)
+
+    for query in [*user_queries, other_query]:
+        await query_cache.set(query, value, ttl=60)
+
+    removed = await query_cache.invalidate_user(user_id)
+
+    assert removed == 2
+    for query in user_queries:
+        assert await query_cache.get(query, AccountListResult) is None
+    assert await query_cache.get(other_query, AccountListResult) == value
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_undecodable_entry_is_a_miss(
+    query_cache: RedisQueryResultCache, cache_adapter
+) -> None:
+    """Corrupt or schema-mismatched entries behave as misses (fail-open)."""
+    query = ListAccountsByUser(user_id=cast(UUID, uuid7()))
+    key = query_cache.key_for(query)
+    assert key is not None
+
+    await cache_adapter.set(key, '{"accounts": []}', ttl=60)
+
+    assert await query_cache.get(query, AccountListResult) is None
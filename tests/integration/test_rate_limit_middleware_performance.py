@@ -0,0 +1,261 @@
+"""Performance verification tests for the rate limit middleware.
+
+Compares middleware throughput for routes limited by two scopes (per user
+and the GLOBAL brake layer):
+
+- Per-scope path (pre-index): linear scan over every registry template,
+  one EVALSHA per scope, Attempted/Allowed events on every request
+- Compiled path: RATE_LIMIT_INDEX lookup, one multi-bucket EVALSHA per
+  request, events sampled at 1%
+
+Test Strategy:
+- Drive the raw ASGI middleware with a stub downstream app against Redis
+- Report requests/sec, EVALSHA calls and events for both paths
+
+Note: These are verification tests, not precise benchmarks. Run with ``-s``
+to see the measured numbers:
+    pytest tests/integration/test_rate_limit_middleware_performance.py -s
+"""
+
+import asyncio
+import base64
+import json
+import time
+from collections.abc import Awaitable
+from typing import Any, cast
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+from redis.asyncio import ConnectionPool, Redis
+from starlette.requests import Request
+from starlette.types import Message, Receive, Scope, Send
+from uuid_extensions import uuid7
+
+from src.core.config import settings
+from src.core.result import Success
+from src.domain.enums import RateLimitScope
+from src.domain.events.base_event import DomainEvent
+from src.domain.events.rate_limit_events import (
+    RateLimitCheckAllowed,
+    RateLimitCheckAttempted,
+)
+from src.domain.value_objects.rate_limit_rule import RateLimitRule
+from src.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from src.infrastructure.rate_limit.from_registry import RATE_LIMIT_RULES
+from src.infrastructure.rate_limit.redis_storage import RedisStorage
+from src.infrastructure.rate_limit.rule_index import RateLimitRuleIndex
+from src.infrastructure.rate_limit.token_bucket_adapter import TokenBucketAdapter
+from src.presentation.routers.api.middleware import rate_limit_middleware
+from src.presentation.routers.api.middleware.rate_limit_middleware import (
+    RateLimitMiddleware,
+)
+
+CONCURRENT_CLIENTS = 20
+REQUESTS_PER_CLIENT = 100
+
+# Generous limits: the benchmark measures overhead, not denials
+USER_RULE = RateLimitRule(
+    max_tokens=1_000_000, refill_rate=1_000_000.0, scope=RateLimitScope.USER
+)
+BRAKE_RULE = RateLimitRule(
+    max_tokens=1_000_000, refill_rate=1_000_000.0, scope=RateLimitScope.GLOBAL
+)
+ROUTE_RULES = {endpoint: (USER_RULE, BRAKE_RULE) for endpoint in RATE_LIMIT_RULES}
+BENCH_PATH = "/api/v1/accounts/{account_id}/transactions"
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+class PerScopeRateLimitMiddleware(RateLimitMiddleware):
+    """Pre-index dispatch: template scan and one is_allowed call per scope."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        method, path = scope["method"], scope["path"]
+        endpoint = next(
+            (
+                pattern
+                for pattern in ROUTE_RULES
+                if pattern.partition(" ")[0] == method
+                and _legacy_paths_match(path, pattern.partition(" ")[2])
+            ),
+            None,
+        )
+        if endpoint is None:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        for rule in ROUTE_RULES[endpoint]:
+            identifier = self._extract_identifier(request, rule.scope.value)
+            result = await self._get_rate_limit().is_allowed(
+                endpoint=f"{endpoint}#{rule.scope.value}", identifier=identifier
+            )
+            assert isinstance(result, Success) and result.value.allowed
+        await self.app(scope, receive, send)
+
+
+def _legacy_paths_match(actual: str, pattern: str) -> bool:
+    """Pre-index matcher: split both paths on every comparison."""
+    actual_parts = actual.strip("/").split("/")
+    pattern_parts = pattern.strip("/").split("/")
+    if len(actual_parts) != len(pattern_parts):
+        return False
+    return all(
+        p.startswith("{") or a == p
+        for a, p in zip(actual_parts, pattern_parts, strict=True)
+    )
+
+
+class CountingRedis:
+    """Redis proxy counting EVALSHA round trips."""
+
+    def __init__(self, client: Redis) -> None:
+        self._client = client
+        self.evalsha_calls = 0
+
+    async def evalsha(self, *args):
+        self.evalsha_calls += 1
+        return await cast(Awaitable[Any], self._client.evalsha(*args))
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+def bearer_token(user_id: str) -> bytes:
+    """Unsigned JWT carrying only the sub claim (middleware only decodes it)."""
+
+    def encode(payload: dict[str, str]) -> str:
+        raw = json.dumps(payload).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    token = f"{encode({'alg': 'none'})}.{encode({'sub': user_id})}.sig"
+    return f"Bearer {token}".encode()
+
+
+async def stub_app(scope: Scope, receive: Receive, send: Send) -> None:
+    """Downstream app returning an empty 200."""
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def run_requests(middleware: RateLimitMiddleware) -> float:
+    """Run concurrent clients through the middleware; return requests/sec."""
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        return None
+
+    async def client() -> None:
+        headers = [(b"authorization", bearer_token(str(uuid7())))]
+        for _ in range(REQUESTS_PER_CLIENT):
+            scope: Scope = {
+                "type": "http",
+                "method": "GET",
+                "path": BENCH_PATH.format(account_id=uuid7()),
+                "query_string": b"",
+                "headers": headers,
+                "client": ("203.0.113.7", 50000),
+            }
+            await middleware(scope, receive, send)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(CONCURRENT_CLIENTS)))
+    return CONCURRENT_CLIENTS * REQUESTS_PER_CLIENT / (time.perf_counter() - start)
+
+
+def build_middleware(
+    redis: CountingRedis, middleware_cls: type, *, sample_rate: float
+) -> tuple[RateLimitMiddleware, list[DomainEvent]]:
+    """Middleware wired to a real adapter; returns it with the event sink."""
+    events: list[DomainEvent] = []
+
+    async def record(event: DomainEvent) -> None:
+        events.append(event)
+
+    event_bus = InMemoryEventBus(logger=MagicMock())
+    event_bus.subscribe(RateLimitCheckAttempted, record)
+    event_bus.subscribe(RateLimitCheckAllowed, record)
+
+    # Legacy path looks up one single-scope rule per "endpoint#scope" key
+    legacy_rules = {
+        f"{endpoint}#{rule.scope.value}": rule
+        for endpoint, rules in ROUTE_RULES.items()
+        for rule in rules
+    }
+    adapter = TokenBucketAdapter(
+        storage=RedisStorage(redis_client=redis),
+        rules=legacy_rules,
+        event_bus=event_bus,
+        logger=MagicMock(),
+        route_rules=ROUTE_RULES,
+        event_sample_rate=sample_rate,
+    )
+    middleware = middleware_cls(stub_app)
+    middleware._rate_limit = adapter
+    middleware._logger = MagicMock()
+    return middleware, events
+
+
+@pytest_asyncio.fixture
+async def redis_client():
+    """Redis client; benchmark keys removed afterwards."""
+    pool = ConnectionPool.from_url(settings.redis_url, max_connections=50)
+    client = Redis(connection_pool=pool)
+    await client.ping()  # type: ignore[misc]
+    yield client
+    keys = await client.keys("rate_limit:*")
+    if keys:
+        await client.delete(*keys)
+    await client.aclose()
+    await pool.disconnect()
+
+
+# =============================================================================
+# Performance Verification Tests
+# =============================================================================
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.slow
+async def test_compiled_index_and_batched_buckets_increase_throughput(
+    redis_client, monkeypatch
+) -> None:
+    """Verify one EVALSHA per request and sampled events beat per-scope checks."""
+    monkeypatch.setattr(
+        rate_limit_middleware, "RATE_LIMIT_INDEX", RateLimitRuleIndex(ROUTE_RULES)
+    )
+    requests = CONCURRENT_CLIENTS * REQUESTS_PER_CLIENT
+
+    legacy_redis = CountingRedis(redis_client)
+    legacy, legacy_events = build_middleware(
+        legacy_redis, PerScopeRateLimitMiddleware, sample_rate=1.0
+    )
+    legacy_rps = await run_requests(legacy)
+
+    compiled_redis = CountingRedis(redis_client)
+    compiled, compiled_events = build_middleware(
+        compiled_redis, RateLimitMiddleware, sample_rate=0.01
+    )
+    compiled_rps = await run_requests(compiled)
+
+    print(
+        f"\nRate limit middleware throughput ({requests} requests, "
+        f"{CONCURRENT_CLIENTS} concurrent, 2 scopes per route, "
+        f"{len(ROUTE_RULES)} route templates):"
+        f"\n  Per-scope checks:       {legacy_rps:>8,.0f} req/s, "
+        f"{legacy_redis.evalsha_calls:>5} EVALSHA, {len(legacy_events):>5} events"
+        f"\n  Compiled index + batch: {compiled_rps:>8,.0f} req/s, "
+        f"{compiled_redis.evalsha_calls:>5} EVALSHA, {len(compiled_events):>5} events"
+    )
+
+    assert legacy_redis.evalsha_calls == 2 * requests
+    assert compiled_redis.evalsha_calls == requests
+    assert len(compiled_events) < len(legacy_events)
+    assert compiled_rps > legacy_rps
@@ -0,0 +1,250 @@
+"""Performance verification tests for refresh token lookup.
+
+Compares the legacy lookup (bcrypt-verify every active token) with the
+selector/verifier lookup (one indexed SELECT + one HMAC comparison) as the
+number of active refresh tokens grows.
+
+Test Strategy:
+- Bulk insert selector/verifier tokens (1k, 10k, 50k active rows)
+- Time RefreshTokenRepository.find_by_token_verification for a token
+  issued last (worst case for a scan)
+- Time the legacy bcrypt scan on a few hundred legacy rows for comparison
+
+Note: These are verification tests, not precise benchmarks. Run with ``-s``
+to see the measured numbers:
+    pytest tests/integration/test_refresh_token_lookup_performance.py -s
+"""
+
+import secrets
+import statistics
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+import bcrypt
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, text
+from uuid_extensions import uuid7
+
+from src.infrastructure.persistence.models.refresh_token import RefreshToken
+from src.infrastructure.persistence.repositories.refresh_token_repository import (
+    RefreshTokenRepository,
+)
+from src.infrastructure.security.refresh_token_service import RefreshTokenService
+
+
+SECRET_KEY = "test-secret-key-with-at-least-32-characters"
+TOKEN_COUNTS = (1_000, 10_000, 50_000)
+LEGACY_TOKEN_COUNT = 200
+LOOKUPS = 20
+INSERT_CHUNK = 5_000
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+def token_row(
+    owner: tuple[UUID, UUID], token_hash: str, selector: str | None
+) -> dict[str, Any]:
+    """Build a refresh_tokens row for bulk insert."""
+    user_id, session_id = owner
+    return {
+        "id": uuid7(),
+        "user_id": user_id,
+        "session_id": session_id,
+        "token_selector": selector,
+        "token_hash": token_hash,
+        # expires_at is a timestamp without time zone (UTC)
+        "expires_at": datetime.now(UTC).replace(tzinfo=None) + timedelta(days=30),
+        "rotation_count": 0,
+        "token_version": 1,
+        "global_version_at_issuance": 1,
+    }
+
+
+async def insert_rows(database, rows: list[dict[str, Any]]) -> None:
+    """Insert refresh token rows in chunks."""
+    async with database.get_session() as session:
+        for start in range(0, len(rows), INSERT_CHUNK):
+            await session.execute(
+                insert(RefreshToken), rows[start : start + INSERT_CHUNK]
+            )
+        await session.commit()
+
+
+async def add_selector_tokens(
+    database, service: RefreshTokenService, owner, count: int
+) -> str:
+    """Insert ``count`` selector/verifier tokens and return the last token."""
+    rows = []
+    token = ""
+    for _ in range(count):
+        token, token_hash = service.generate_token()
+        rows.append(token_row(owner, token_hash, service.get_selector(token)))
+    await insert_rows(database, rows)
+    return token
+
+
+async def time_lookup(database, service: RefreshTokenService, token: str) -> float:
+    """Return the median lookup latency in milliseconds."""
+    samples = []
+    async with database.get_session() as session:
+        repo = RefreshTokenRepository(session=session)
+        for _ in range(LOOKUPS):
+            start = time.perf_counter()
+            found = await repo.find_by_token_verification(
+                token,
+                service.verify_token_async,
+                selector=service.get_selector(token),
+            )
+            samples.append((time.perf_counter() - start) * 1000)
+            assert found is not None
+    return statistics.median(samples)
+
+
+@pytest_asyncio.fixture
+async def token_owner(test_database):
+    """Provide a (user_id, session_id) pair with an empty refresh_tokens table."""
+    from src.infrastructure.persistence.models.session import Session as SessionModel
+    from src.infrastructure.persistence.models.user import User as UserModel
+
+    async with test_database.get_session() as session:
+        await session.execute(text("TRUNCATE TABLE refresh_tokens CASCADE"))
+        user_id = uuid7()
+        session_id = uuid7()
+        session.add(
+            UserModel(
+                id=user_id,
+                email=f"refresh_perf_{user_id}@example.com",
+                password_hash="$2b$12$test_hash",
+                is_verified=True,
+                is_active=True,
+                failed_login_attempts=0,
+            )
+        )
+        await session.flush()
+        session.add(SessionModel(id=session_id, user_id=user_id, is_revoked=False))
+        await session.commit()
+    return user_id, session_id
+
+
+# =============================================================================
+# Performance Verification Tests
+# =============================================================================
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.slow
+async def test_selector_lookup_stays_flat_as_active_tokens_grow(
+    test_database, token_owner
+) -> None:
+    """Verify refresh lookup latency does not grow with active token count.
+
+    Legacy: one bcrypt verification per active token until a match
+    (O(tokens x bcrypt cost)). Selector: one unique-index lookup and one
+    HMAC comparison regardless of table size.
+    """
+    service = RefreshTokenService(secret_key=SECRET_KEY)
+
+    # Legacy scan on a small table (bcrypt at the minimum cost factor)
+    legacy_rows = []
+    legacy_token = ""
+    for _ in range(LEGACY_TOKEN_COUNT):
+        legacy_token = secrets.token_urlsafe(32)
+        legacy_hash = bcrypt.hashpw(
+            legacy_token.encode("utf-8"), bcrypt.gensalt(rounds=4)
+        ).decode("utf-8")
+        legacy_rows.append(token_row(token_owner, legacy_hash, selector=None))
+    await insert_rows(test_database, legacy_rows)
+    async with test_database.get_session() as session:
+        repo = RefreshTokenRepository(session=session)
+        start = time.perf_counter()
+        found = await repo.find_by_token_verification(
+            legacy_token, service.verify_token_async, selector=None
+        )
+        legacy_ms = (time.perf_counter() - start) * 1000
+    assert found is not None
+
+    # Selector lookups as the table grows
+    latencies: dict[int, float] = {}
+    inserted = 0
+    for count in TOKEN_COUNTS:
+        token = await add_selector_tokens(
+            test_database, service, token_owner, count - inserted
+        )
+        inserted = count
+        latencies[count] = await time_lookup(test_database, service, token)
+
+    print(
+        f"\nRefresh token lookup:"
+        f"\n  legacy bcrypt scan ({LEGACY_TOKEN_COUNT} tokens, cost 4): "
+        f"{legacy_ms:9.1f} ms"
+    )
+    for count, latency in latencies.items():
+        print(f"  selector lookup ({count:>6,} tokens):         {latency:9.2f} ms")
+
+    smallest, largest = latencies[TOKEN_COUNTS[0]], latencies[TOKEN_COUNTS[-1]]
+    # Index lookup: 50x more rows must not mean proportionally slower lookups
+    assert largest < max(smallest * 5, 5.0)
+    assert largest < legacy_ms
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.slow
+async def test_legacy_scan_skips_selector_tokens(test_database, token_owner) -> None:
+    """Verify unknown legacy-format tokens never bcrypt-check selector rows.
+
+    During migration the legacy fallback only considers rows without a
+    selector, so a garbage token costs nothing once legacy tokens are gone.
+    """
+    service = RefreshTokenService(secret_key=SECRET_KEY)
+    await add_selector_tokens(test_database, service, token_owner, TOKEN_COUNTS[0])
+    verified: list[str] = []
+
+    async def counting_verify(token: str, token_hash: str) -> bool:
+        verified.append(token_hash)
+        return await service.verify_token_async(token, token_hash)
+
+    async with test_database.get_session() as session:
+        repo = RefreshTokenRepository(session=session)
+        found = await repo.find_by_token_verification(
+            secrets.token_urlsafe(32), counting_verify, selector=None
+        )
+
+    assert found is None
+    assert verified == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_malformed_token_skips_legacy_scan(test_database, token_owner) -> None:
+    """Verify tokens of neither format are rejected without bcrypt checks.
+
+    Only legacy-length tokens fall back to the bcrypt scan, so a client
+    sending arbitrary strings cannot make each request verify every
+    legacy row.
+    """
+    service = RefreshTokenService(secret_key=SECRET_KEY)
+    legacy_hash = bcrypt.hashpw(b"legacy", bcrypt.gensalt(rounds=4)).decode("utf-8")
+    await insert_rows(test_database, [token_row(token_owner, legacy_hash, None)])
+    verified: list[str] = []
+
+    async def counting_verify(token: str, token_hash: str) -> bool:
+        verified.append(token_hash)
+        return await service.verify_token_async(token, token_hash)
+
+    async with test_database.get_session() as session:
+        repo = RefreshTokenRepository(session=session)
+        for token in ("", "x" * 42, secrets.token_urlsafe(64)):
+            found = await repo.find_by_token_verification(
+                token, counting_verify, selector=None
+            )
+            assert found is None
+
+    assert verified == []
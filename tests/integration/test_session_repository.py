@@ -582,3 +582,76 @@ class TestSessionRepositoryCleanup:
             found = await repo.find_by_user_id(user.id, active_only=False)
             assert len(found) == 1
             assert found[0].device_info == "Active"
+
+    @pytest.mark.asyncio
+    @freeze_time("2024-01-01 12:00:00")
+    async def test_cleanup_with_limit_deletes_in_batches(self, test_database):
+        """Test cleanup_expired_sessions deletes at most limit rows per call."""
+        # Arrange
+        user = create_test_user()
+        expired = [
+            create_test_session(
+                user_id=user.id,
+                expires_at=datetime(2024, 1, 1, 11, 0, 0, tzinfo=UTC),
+            )
+            for _ in range(3)
+        ]
+
+        async with test_database.get_session() as db_session:
+            user_repo = UserRepository(session=db_session)
+            await user_repo.save(user)
+            await db_session.commit()
+
+        async with test_database.get_session() as db_session:
+            repo = SessionRepository(session=db_session)
+            for session_data in expired:
+                await repo.save(session_data)
+
+        # Act
+        async with test_database.get_session() as db_session:
+            repo = SessionRepository(session=db_session)
+            first = await repo.cleanup_expired_sessions(limit=2)
+            second = await repo.cleanup_expired_sessions(limit=2)
+
+        # Assert
+        assert (first, second) == (2, 1)
+
+    @pytest.mark.asyncio
+    @freeze_time("2024-01-01 12:00:00")
+    async def test_cleanup_removes_old_revoked_sessions(self, test_database):
+        """Test cleanup_expired_sessions honors revoked_before."""
+        # Arrange
+        user = create_test_user()
+        old_revoked = create_test_session(
+            user_id=user.id, device_info="Old revoked", is_revoked=True
+        )
+        old_revoked.revoked_at = datetime(2023, 11, 1, 12, 0, 0, tzinfo=UTC)
+        recent_revoked = create_test_session(
+            user_id=user.id, device_info="Recent revoked", is_revoked=True
+        )
+        recent_revoked.revoked_at = datetime(2023, 12, 31, 12, 0, 0, tzinfo=UTC)
+
+        async with test_database.get_session() as db_session:
+            user_repo = UserRepository(session=db_session)
+            await user_repo.save(user)
+            await db_session.commit()
+
+        async with test_database.get_session() as db_session:
+            repo = SessionRepository(session=db_session)
+            await repo.save(old_revoked)
+            await repo.save(recent_revoked)
+
+        # Act
+        async with test_database.get_session() as db_session:
+            repo = SessionRepository(session=db_session)
+            cleaned_count = await repo.cleanup_expired_sessions(
+                revoked_before=datetime(2023, 12, 1, 12, 0, 0, tzinfo=UTC)
+            )
+
+        # Assert
+        assert cleaned_count == 1
+
+        async with test_database.get_session() as db_session:
+            repo = SessionRepository(session=db_session)
+            found = await repo.find_by_user_id(user.id, active_only=False)
+            assert [s.device_info for s in found] == ["Recent revoked"]
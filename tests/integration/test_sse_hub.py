@@ -0,0 +1,222 @@
+"""Integration tests for the per-process SSE hub.
+
+Tests SSEHub multiplexing against real Redis:
+- User events reach only that user's connections
+- Broadcasts reach every connection
+- Many connections share one pub/sub subscription
+- Slow connections drop oldest events (bounded queues)
+- Connections are unregistered on disconnect
+- RedisSSESubscriber delivery through the hub (category filter)
+
+Reference:
+    - src/infrastructure/sse/sse_hub.py
+"""
+
+import asyncio
+import logging
+from uuid import UUID
+
+import pytest
+import pytest_asyncio
+from uuid_extensions import uuid7
+
+from src.domain.events.sse_event import SSEEvent, SSEEventType
+from src.infrastructure.sse.redis_publisher import RedisSSEPublisher
+from src.infrastructure.sse.redis_subscriber import RedisSSESubscriber
+from src.infrastructure.sse.sse_hub import SSEHub
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest_asyncio.fixture
+async def sse_publisher(redis_test_client):
+    """Provide an SSE publisher (no retention)."""
+    return RedisSSEPublisher(
+        redis_client=redis_test_client,
+        logger=logging.getLogger("test.sse.publisher"),
+    )
+
+
+@pytest_asyncio.fixture
+async def sse_hub(redis_test_client):
+    """Provide an SSE hub and stop its listener after the test."""
+    hub = SSEHub(
+        redis_client=redis_test_client,
+        logger=logging.getLogger("test.sse.hub"),
+    )
+    yield hub
+    await hub.aclose()
+
+
+def create_test_event(
+    user_id: UUID,
+    event_type: SSEEventType = SSEEventType.SYNC_ACCOUNTS_COMPLETED,
+    data: dict[str, object] | None = None,
+) -> SSEEvent:
+    """Create an SSEEvent for testing."""
+    return SSEEvent(event_type=event_type, user_id=user_id, data=data or {})
+
+
+async def collect(stream, count: int) -> list[SSEEvent]:
+    """Collect ``count`` events from an async iterator, then close it."""
+    received: list[SSEEvent] = []
+    async for event in stream:
+        received.append(event)
+        if len(received) == count:
+            break
+    await stream.aclose()
+    return received
+
+
+# =============================================================================
+# Delivery Tests
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestSSEHubDelivery:
+    """Tests for SSEHub fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_user_event_delivered_only_to_that_user(self, sse_hub, sse_publisher):
+        """Test user channel events reach all and only that user's streams."""
+        user_id, other_user_id = uuid7(), uuid7()
+
+        tab1 = asyncio.create_task(collect(sse_hub.listen(user_id), 1))
+        tab2 = asyncio.create_task(collect(sse_hub.listen(user_id), 1))
+        other = asyncio.create_task(collect(sse_hub.listen(other_user_id), 1))
+        await asyncio.sleep(0.1)
+
+        event = create_test_event(user_id)
+        await sse_publisher.publish(event)
+
+        received1, received2 = await asyncio.wait_for(
+            asyncio.gather(tab1, tab2), timeout=2.0
+        )
+        assert received1[0].event_id == event.event_id
+        assert received2[0].event_id == event.event_id
+        assert not other.done()
+        other.cancel()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_delivered_to_every_connection(
+        self, sse_hub, sse_publisher
+    ):
+        """Test broadcast events reach streams of all users."""
+        streams = [
+            asyncio.create_task(collect(sse_hub.listen(uuid7()), 1)) for _ in range(3)
+        ]
+        await asyncio.sleep(0.1)
+
+        event = create_test_event(uuid7(), SSEEventType.PROVIDER_TOKEN_EXPIRING)
+        await sse_publisher.broadcast(event)
+
+        results = await asyncio.wait_for(asyncio.gather(*streams), timeout=2.0)
+        assert all(received[0].event_id == event.event_id for received in results)
+
+    @pytest.mark.asyncio
+    async def test_connections_share_one_subscription(self, sse_hub, redis_test_client):
+        """Test many open streams use a single pub/sub connection."""
+        streams = [
+            asyncio.create_task(collect(sse_hub.listen(uuid7()), 1)) for _ in range(20)
+        ]
+        await asyncio.sleep(0.1)
+
+        stats = sse_hub.get_stats()
+        patterns = await redis_test_client.pubsub_numpat()
+
+        assert stats.connected_clients == 20
+        assert stats.subscribed_users == 20
+        assert patterns == 1
+        for stream in streams:
+            stream.cancel()
+
+
+# =============================================================================
+# Backpressure Tests
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestSSEHubBackpressure:
+    """Tests for bounded per-connection queues."""
+
+    @pytest.mark.asyncio
+    async def test_slow_connection_drops_oldest_events(
+        self, redis_test_client, sse_publisher
+    ):
+        """Test a full queue drops the oldest event and counts it."""
+        hub = SSEHub(redis_client=redis_test_client, queue_max_size=2)
+        user_id = uuid7()
+        stream = hub.listen(user_id)
+        first = asyncio.create_task(anext(stream))
+        await asyncio.sleep(0.1)
+
+        events = [create_test_event(user_id, data={"i": i}) for i in range(6)]
+        await sse_publisher.publish(events[0])
+        received = [await asyncio.wait_for(first, timeout=2.0)]
+
+        # Client stops reading while five more events arrive
+        for event in events[1:]:
+            await sse_publisher.publish(event)
+        await asyncio.sleep(0.1)
+        stats = hub.get_stats()
+        received += [await anext(stream), await anext(stream)]
+        await stream.aclose()
+        await hub.aclose()
+
+        # Queue holds two events: the three oldest unread ones were dropped
+        assert [e.data["i"] for e in received] == [0, 4, 5]
+        assert stats.dropped_events == 3
+        assert stats.max_queue_depth == 2
+
+    @pytest.mark.asyncio
+    async def test_disconnect_unregisters_connection(self, sse_hub):
+        """Test closing a stream removes its queue from the hub."""
+        stream = sse_hub.listen(uuid7())
+        pending = asyncio.create_task(anext(stream))
+        await asyncio.sleep(0.1)
+        assert sse_hub.get_stats().connected_clients == 1
+
+        pending.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+        await stream.aclose()
+
+        assert sse_hub.get_stats().connected_clients == 0
+        assert sse_hub.get_stats().subscribed_users == 0
+
+
+# =============================================================================
+# Subscriber Integration Tests
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestSubscriberWithHub:
+    """Tests for RedisSSESubscriber backed by the hub."""
+
+    @pytest.mark.asyncio
+    async def test_subscriber_filters_hub_events_by_category(
+        self, redis_test_client, sse_hub, sse_publisher
+    ):
+        """Test category filter applies to hub-delivered events."""
+        subscriber = RedisSSESubscriber(redis_client=redis_test_client, hub=sse_hub)
+        user_id = uuid7()
+
+        task = asyncio.create_task(
+            collect(subscriber.subscribe(user_id, categories=["portfolio"]), 1)
+        )
+        await asyncio.sleep(0.1)
+
+        await sse_publisher.publish(create_test_event(user_id))  # data_sync
+        portfolio_event = create_test_event(
+            user_id, SSEEventType.PORTFOLIO_BALANCE_UPDATED
+        )
+        await sse_publisher.publish(portfolio_event)
+
+        received = await asyncio.wait_for(task, timeout=2.0)
+        assert [e.event_id for e in received] == [portfolio_event.event_id]
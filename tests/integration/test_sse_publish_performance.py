@@ -0,0 +1,144 @@
+"""Performance verification tests for the SSE publish path.
+
+Compares events/sec for one publisher (one worker) on the previous publish
+path (PUBLISH, XADD, then a SET + EXPIRE pipeline: three round trips per
+event) with the scripted path (one EVALSHA per event) and the batched path
+(publish_many: one pipelined round trip per batch).
+
+Test Strategy:
+- Publish the same number of retained events through each path
+- Measure wall-clock throughput in events per second
+- Verify the batched path beats the previous sequential path
+
+Note: These are verification tests, not precise benchmarks. The gain grows
+with Redis latency (a remote Redis pays each round trip in network time).
+Run with ``-s`` to see the measured numbers:
+    pytest tests/integration/test_sse_publish_performance.py -s
+"""
+
+import json
+import time
+from collections.abc import Awaitable, Callable
+from uuid import UUID
+
+import pytest
+from uuid_extensions import uuid7
+
+from src.domain.events.sse_event import SSEEvent, SSEEventType
+from src.infrastructure.sse.channel_keys import SSEChannelKeys
+from src.infrastructure.sse.redis_publisher import RedisSSEPublisher
+
+
+EVENTS = 2_000
+BATCH_SIZE = 100
+RETENTION_MAX_LEN = 1_000
+RETENTION_TTL = 600
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+def make_events(user_id: UUID, count: int = EVENTS) -> list[SSEEvent]:
+    """Create ``count`` import-progress style events for one user."""
+    return [
+        SSEEvent(
+            event_type=SSEEventType.SYNC_TRANSACTIONS_COMPLETED,
+            user_id=user_id,
+            data={"index": i, "created": 10},
+        )
+        for i in range(count)
+    ]
+
+
+async def legacy_publish(redis_client, event: SSEEvent) -> None:
+    """Previous publish path: PUBLISH, XADD, then SET + EXPIRE pipeline."""
+    user_id = event.user_id
+    stream_key = SSEChannelKeys.user_stream(user_id)
+    await redis_client.publish(
+        SSEChannelKeys.user_channel(user_id), json.dumps(event.to_dict())
+    )
+    entry_id = await redis_client.xadd(
+        stream_key,
+        {
+            "event_id": str(event.event_id),
+            "event_type": event.event_type.value,
+            "data": json.dumps(event.data),
+            "occurred_at": event.occurred_at.isoformat(),
+        },
+        maxlen=RETENTION_MAX_LEN,
+        approximate=True,
+    )
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.set(
+            SSEChannelKeys.user_stream_entry(user_id, event.event_id),
+            entry_id,
+            ex=RETENTION_TTL,
+        )
+        pipe.expire(stream_key, RETENTION_TTL, nx=True)
+        await pipe.execute()
+
+
+async def events_per_second(
+    publish: Callable[[list[SSEEvent]], Awaitable[None]],
+) -> float:
+    """Publish a fresh user's events and return the throughput."""
+    events = make_events(uuid7())
+    start = time.perf_counter()
+    await publish(events)
+    return len(events) / (time.perf_counter() - start)
+
+
+# =============================================================================
+# Performance Verification Tests
+# =============================================================================
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.slow
+async def test_publish_throughput_per_worker(redis_test_client) -> None:
+    """Verify batched publishing beats one-round-trip-per-command publishing.
+
+    Previous: 3 round trips per retained event.
+    Scripted: 1 round trip per event (publish / publish_to_user).
+    Batched: 1 round trip per BATCH_SIZE events (publish_many).
+    """
+    publisher = RedisSSEPublisher(
+        redis_client=redis_test_client,
+        enable_retention=True,
+        retention_max_len=RETENTION_MAX_LEN,
+        retention_ttl_seconds=RETENTION_TTL,
+    )
+    # Load the script outside the timed sections
+    await publisher.publish(make_events(uuid7(), count=1)[0])
+
+    async def previous(events: list[SSEEvent]) -> None:
+        for event in events:
+            await legacy_publish(redis_test_client, event)
+
+    async def scripted(events: list[SSEEvent]) -> None:
+        for event in events:
+            await publisher.publish(event)
+
+    async def batched(events: list[SSEEvent]) -> None:
+        for start in range(0, len(events), BATCH_SIZE):
+            await publisher.publish_many(events[start : start + BATCH_SIZE])
+
+    results = {
+        "previous (3 round trips/event)": await events_per_second(previous),
+        "scripted (1 round trip/event)": await events_per_second(scripted),
+        f"publish_many (batch={BATCH_SIZE})": await events_per_second(batched),
+    }
+
+    print(f"\nSSE publish throughput ({EVENTS} retained events, one worker):")
+    for label, rate in results.items():
+        print(f"  {label:<32} {rate:>10,.0f} events/s")
+
+    previous_rate = results["previous (3 round trips/event)"]
+    batched_rate = results[f"publish_many (batch={BATCH_SIZE})"]
+    assert batched_rate > previous_rate, (
+        f"publish_many ({batched_rate:.0f}/s) should beat the previous "
+        f"sequential path ({previous_rate:.0f}/s)"
+    )
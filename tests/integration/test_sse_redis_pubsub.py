@@ -95,6 +95,11 @@ class TestSSEPublisher:
         event = create_test_event()
         await sse_publisher.broadcast(event)
 
+    @pytest.mark.asyncio
+    async def test_publish_many_empty_batch_does_not_raise(self, sse_publisher):
+        """Test publish_many with no events is a no-op."""
+        await sse_publisher.publish_many([])
+
 
 # =============================================================================
 # Subscriber Tests
@@ -252,6 +257,42 @@ class TestPubSubRoundTrip:
         assert received_events[0].data == {"step": 1}
         assert received_events[1].data == {"step": 2}
 
+    @pytest.mark.asyncio
+    async def test_pubsub_roundtrip_publish_many(
+        self, redis_test_client, sse_publisher, sse_subscriber
+    ):
+        """Test a batch published with publish_many arrives in order."""
+        user_id = uuid7()
+        events_to_send = [
+            create_test_event(user_id=user_id, data={"step": i}) for i in range(5)
+        ]
+
+        received_events: list[SSEEvent] = []
+
+        async def collect_events():
+            async for e in sse_subscriber.subscribe(user_id):
+                received_events.append(e)
+                if len(received_events) >= len(events_to_send):
+                    break
+
+        subscriber_task = asyncio.create_task(collect_events())
+        await asyncio.sleep(0.1)
+
+        await sse_publisher.publish_many(events_to_send)
+
+        try:
+            await asyncio.wait_for(subscriber_task, timeout=2.0)
+        except asyncio.TimeoutError:
+            subscriber_task.cancel()
+            try:
+                await subscriber_task
+            except asyncio.CancelledError:
+                pass
+
+        assert [e.event_id for e in received_events] == [
+            e.event_id for e in events_to_send
+        ]
+
     @pytest.mark.asyncio
     async def test_pubsub_category_filtering(
         self, redis_test_client, sse_publisher, sse_subscriber
@@ -325,6 +325,182 @@ class TestMissedEventsReplay:
         assert missed == []
 
 
+# =============================================================================
+# Cursor-Based Replay Tests
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestBatchPublish:
+    """Tests for publish_many with retention enabled."""
+
+    @pytest.mark.asyncio
+    async def test_publish_many_stores_and_indexes_each_event(
+        self, redis_test_client, sse_publisher_with_retention
+    ):
+        """Test every event in a batch is stored in order and indexed."""
+        user_id = uuid7()
+        events = [create_test_event(user_id=user_id, data={"i": i}) for i in range(4)]
+
+        await sse_publisher_with_retention.publish_many(events)
+
+        entries = await redis_test_client.xrange(
+            SSEChannelKeys.user_stream(user_id), "-", "+"
+        )
+        assert [data["event_id"] for _, data in entries] == [
+            str(e.event_id) for e in events
+        ]
+        for (entry_id, _), event in zip(entries, events, strict=True):
+            index_key = SSEChannelKeys.user_stream_entry(user_id, event.event_id)
+            assert await redis_test_client.get(index_key) == entry_id
+
+    @pytest.mark.asyncio
+    async def test_publish_many_routes_events_to_their_own_streams(
+        self, redis_test_client, sse_publisher_with_retention
+    ):
+        """Test a mixed-user batch lands in each user's own stream."""
+        user_a, user_b = uuid7(), uuid7()
+        events = [
+            create_test_event(user_id=user_a, data={"user": "a"}),
+            create_test_event(user_id=user_b, data={"user": "b"}),
+            create_test_event(user_id=user_a, data={"user": "a"}),
+        ]
+
+        await sse_publisher_with_retention.publish_many(events)
+
+        stream_a = await redis_test_client.xrange(
+            SSEChannelKeys.user_stream(user_a), "-", "+"
+        )
+        stream_b = await redis_test_client.xrange(
+            SSEChannelKeys.user_stream(user_b), "-", "+"
+        )
+        assert len(stream_a) == 2
+        assert len(stream_b) == 1
+        assert await redis_test_client.ttl(SSEChannelKeys.user_stream(user_b)) > 0
+
+    @pytest.mark.asyncio
+    async def test_publish_reloads_script_after_flush(
+        self, redis_test_client, sse_publisher_with_retention
+    ):
+        """Test publishing survives SCRIPT FLUSH (e.g., Redis restart)."""
+        user_id = uuid7()
+        first = create_test_event(user_id=user_id)
+        second = create_test_event(user_id=user_id)
+
+        await sse_publisher_with_retention.publish(first)
+        await redis_test_client.script_flush()
+        await sse_publisher_with_retention.publish_many([second])
+
+        entries = await redis_test_client.xrange(
+            SSEChannelKeys.user_stream(user_id), "-", "+"
+        )
+        assert [data["event_id"] for _, data in entries] == [
+            str(first.event_id),
+            str(second.event_id),
+        ]
+
+
+@pytest.mark.integration
+class TestCursorReplay:
+    """Tests for event_id -> entry ID index and paged replay."""
+
+    @pytest.mark.asyncio
+    async def test_publish_indexes_stream_entry_id(
+        self,
+        redis_test_client,
+        sse_publisher_with_retention,
+    ):
+        """Test publish records event_id -> stream entry ID with a TTL."""
+        user_id = uuid7()
+        event = create_test_event(user_id=user_id)
+
+        await sse_publisher_with_retention.publish(event)
+
+        index_key = SSEChannelKeys.user_stream_entry(user_id, event.event_id)
+        entry_id = await redis_test_client.get(index_key)
+        entries = await redis_test_client.xrange(
+            SSEChannelKeys.user_stream(user_id), "-", "+"
+        )
+        assert entry_id == entries[0][0]
+        assert 0 < await redis_test_client.ttl(index_key) <= 3600
+
+    @pytest.mark.asyncio
+    async def test_replay_pages_through_large_gap(
+        self,
+        redis_test_client,
+        sse_publisher_with_retention,
+    ):
+        """Test replay fetches gaps larger than one page in order."""
+        user_id = uuid7()
+        subscriber = RedisSSESubscriber(
+            redis_client=redis_test_client,
+            enable_retention=True,
+            replay_page_size=2,
+        )
+        events = [create_test_event(user_id=user_id, data={"i": i}) for i in range(7)]
+        for event in events:
+            await sse_publisher_with_retention.publish(event)
+
+        replayed = [
+            event
+            async for event in subscriber.replay_missed_events(
+                user_id=user_id,
+                last_event_id=events[1].event_id,
+            )
+        ]
+
+        assert [e.event_id for e in replayed] == [e.event_id for e in events[2:]]
+
+    @pytest.mark.asyncio
+    async def test_replay_resumes_after_trimmed_last_event(
+        self,
+        redis_test_client,
+        sse_publisher_with_retention,
+        sse_subscriber_with_retention,
+    ):
+        """Test replay resumes from the index even if the entry was trimmed."""
+        user_id = uuid7()
+        events = [create_test_event(user_id=user_id, data={"i": i}) for i in range(3)]
+        for event in events:
+            await sse_publisher_with_retention.publish(event)
+
+        # Simulate MAXLEN trimming the client's last event
+        stream_key = SSEChannelKeys.user_stream(user_id)
+        first_entry_id = (await redis_test_client.xrange(stream_key, "-", "+"))[0][0]
+        await redis_test_client.xdel(stream_key, first_entry_id)
+
+        missed = await sse_subscriber_with_retention.get_missed_events(
+            user_id=user_id,
+            last_event_id=events[0].event_id,
+        )
+
+        assert [e.event_id for e in missed] == [e.event_id for e in events[1:]]
+
+    @pytest.mark.asyncio
+    async def test_replay_falls_back_to_scan_without_index(
+        self,
+        redis_test_client,
+        sse_publisher_with_retention,
+        sse_subscriber_with_retention,
+    ):
+        """Test entries without an index entry are still found by scanning."""
+        user_id = uuid7()
+        events = [create_test_event(user_id=user_id, data={"i": i}) for i in range(3)]
+        for event in events:
+            await sse_publisher_with_retention.publish(event)
+
+        await redis_test_client.delete(
+            SSEChannelKeys.user_stream_entry(user_id, events[0].event_id)
+        )
+
+        missed = await sse_subscriber_with_retention.get_missed_events(
+            user_id=user_id,
+            last_event_id=events[0].event_id,
+        )
+
+        assert [e.event_id for e in missed] == [e.event_id for e in events[1:]]
+
+
 # =============================================================================
 # Stream Pruning Tests
 # =============================================================================
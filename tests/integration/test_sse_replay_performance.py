@@ -0,0 +1,131 @@
+"""Performance verification tests for cursor-based SSE replay.
+
+Compares Last-Event-ID reconnect latency against stream length for the
+previous full-stream scan (``XRANGE - +`` then search in Python) versus the
+cursor-based replay (index lookup + ``XRANGE (<entry_id> + COUNT n``).
+
+Test Strategy:
+- Fill user streams of increasing length via RedisSSEPublisher
+- Reconnect with a Last-Event-ID a fixed number of events from the end
+- Compare median reconnect latency for full scan vs cursor replay
+
+Note: These are verification tests, not precise benchmarks. Run with ``-s``
+to see the measured numbers:
+    pytest tests/integration/test_sse_replay_performance.py -s
+"""
+
+import statistics
+import time
+from uuid import UUID
+
+import pytest
+from uuid_extensions import uuid7
+
+from src.domain.events.sse_event import SSEEvent, SSEEventType
+from src.infrastructure.sse.channel_keys import SSEChannelKeys
+from src.infrastructure.sse.redis_publisher import RedisSSEPublisher
+from src.infrastructure.sse.redis_subscriber import RedisSSESubscriber
+
+
+STREAM_LENGTHS = (100, 1_000, 5_000)
+GAP = 10
+ROUNDS = 5
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+async def fill_stream(
+    publisher: RedisSSEPublisher, user_id: UUID, length: int
+) -> list[UUID]:
+    """Publish ``length`` events for a user and return their IDs in order."""
+    event_ids: list[UUID] = []
+    for i in range(length):
+        event = SSEEvent(
+            event_type=SSEEventType.SYNC_ACCOUNTS_COMPLETED,
+            user_id=user_id,
+            data={"index": i},
+        )
+        await publisher.publish(event)
+        event_ids.append(event.event_id)
+    return event_ids
+
+
+async def full_scan_replay(redis_client, user_id: UUID, last_event_id: UUID) -> int:
+    """Previous replay strategy: read the whole stream and search for the ID."""
+    entries = await redis_client.xrange(SSEChannelKeys.user_stream(user_id), "-", "+")
+    for position, (_, entry_data) in enumerate(entries):
+        if entry_data["event_id"] == str(last_event_id):
+            return len(entries) - position - 1
+    return 0
+
+
+async def median_latency(replay, rounds: int = ROUNDS) -> float:
+    """Return the median latency (seconds) of an async replay callable."""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        replayed = await replay()
+        samples.append(time.perf_counter() - start)
+        assert replayed == GAP
+    return statistics.median(samples)
+
+
+# =============================================================================
+# Performance Verification Tests
+# =============================================================================
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.slow
+async def test_cursor_replay_latency_independent_of_stream_length(
+    redis_test_client,
+) -> None:
+    """Verify reconnect cost tracks the gap, not the retained stream length.
+
+    Full scan: transfers and searches every retained entry on each reconnect.
+    Cursor replay: one GET plus one bounded XRANGE for a small gap.
+    """
+    publisher = RedisSSEPublisher(
+        redis_client=redis_test_client,
+        enable_retention=True,
+        retention_max_len=max(STREAM_LENGTHS) * 2,
+        retention_ttl_seconds=600,
+    )
+    subscriber = RedisSSESubscriber(
+        redis_client=redis_test_client,
+        enable_retention=True,
+    )
+
+    results: dict[int, tuple[float, float]] = {}
+    for length in STREAM_LENGTHS:
+        user_id = uuid7()
+        event_ids = await fill_stream(publisher, user_id, length)
+        last_event_id = event_ids[-GAP - 1]
+
+        async def scan() -> int:
+            return await full_scan_replay(redis_test_client, user_id, last_event_id)
+
+        async def cursor() -> int:
+            missed = await subscriber.get_missed_events(user_id, last_event_id)
+            return len(missed)
+
+        results[length] = (await median_latency(scan), await median_latency(cursor))
+
+    print(f"\nReconnect latency (median of {ROUNDS}, gap={GAP} events):")
+    for length, (scan_s, cursor_s) in results.items():
+        print(
+            f"  stream={length:>5}: full scan {scan_s * 1000:7.2f} ms"
+            f" | cursor {cursor_s * 1000:6.2f} ms"
+        )
+
+    # Conservative: at the longest stream the full scan moves ~500x more data
+    longest = max(STREAM_LENGTHS)
+    scan_s, cursor_s = results[longest]
+    assert cursor_s < scan_s, (
+        f"Cursor replay ({cursor_s:.4f}s) should beat full scan ({scan_s:.4f}s) "
+        f"for a {longest}-entry stream"
+    )
@@ -2,7 +2,7 @@
 
 Tests cover:
 - Successful account sync with provider data mapping
-- Successful transaction sync with upsert logic
+- Successful transaction sync with set-based dedupe and bulk insert
 - Provider data mapping (type, subtype, status, asset type)
 - Error handling (connection not found, not owned, credentials invalid)
 - Date range filtering for transactions
@@ -51,12 +51,18 @@ from src.domain.value_objects.provider_credentials import ProviderCredentials
 from src.infrastructure.persistence.repositories.account_repository import (
     AccountRepository,
 )
+from src.infrastructure.persistence.repositories.balance_snapshot_repository import (
+    BalanceSnapshotRepository,
+)
 from src.infrastructure.persistence.repositories.provider_connection_repository import (
     ProviderConnectionRepository,
 )
 from src.infrastructure.persistence.repositories.transaction_repository import (
     TransactionRepository,
 )
+from src.infrastructure.providers.concurrency_limiter import (
+    ProviderConcurrencyLimiter,
+)
 
 
 # =============================================================================
@@ -320,9 +326,11 @@ class TestSyncAccountsHandlerSuccess:
             handler = SyncAccountsHandler(
                 connection_repo=connection_repo,
                 account_repo=account_repo,
+                snapshot_repo=BalanceSnapshotRepository(session=session),
                 encryption_service=mock_encryption,
                 provider_factory=create_mock_provider_factory(mock_provider),
                 event_bus=event_bus,
+                logger=Mock(),
             )
 
             command = SyncAccounts(connection_id=connection_id, user_id=user_id)
@@ -333,6 +341,7 @@ class TestSyncAccountsHandlerSuccess:
         assert result.value.created == 2
         assert result.value.updated == 0
         assert result.value.unchanged == 0
+        assert result.value.snapshots_captured == 2
 
         # Verify accounts exist in database
         async with test_database.get_session() as session:
@@ -385,9 +394,11 @@ class TestSyncAccountsHandlerSuccess:
             handler = SyncAccountsHandler(
                 connection_repo=connection_repo,
                 account_repo=account_repo,
+                snapshot_repo=BalanceSnapshotRepository(session=session),
                 encryption_service=mock_encryption,
                 provider_factory=create_mock_provider_factory(mock_provider),
                 event_bus=event_bus,
+                logger=Mock(),
             )
 
             command = SyncAccounts(connection_id=connection_id, user_id=user_id)
@@ -431,9 +442,11 @@ class TestSyncAccountsHandlerFailure:
             handler = SyncAccountsHandler(
                 connection_repo=connection_repo,
                 account_repo=account_repo,
+                snapshot_repo=BalanceSnapshotRepository(session=session),
                 encryption_service=mock_encryption,
                 provider_factory=create_mock_provider_factory(mock_provider),
                 event_bus=event_bus,
+                logger=Mock(),
             )
 
             command = SyncAccounts(
@@ -465,9 +478,11 @@ class TestSyncAccountsHandlerFailure:
             handler = SyncAccountsHandler(
                 connection_repo=connection_repo,
                 account_repo=account_repo,
+                snapshot_repo=BalanceSnapshotRepository(session=session),
                 encryption_service=mock_encryption,
                 provider_factory=create_mock_provider_factory(mock_provider),
                 event_bus=event_bus,
+                logger=Mock(),
             )
 
             command = SyncAccounts(connection_id=connection_id, user_id=wrong_user_id)
@@ -539,6 +554,7 @@ class TestSyncTransactionsHandlerSuccess:
                 encryption_service=mock_encryption,
                 provider_factory=create_mock_provider_factory(mock_provider),
                 event_bus=event_bus,
+                concurrency_limiter=ProviderConcurrencyLimiter(),
             )
 
             command = SyncTransactions(
@@ -561,6 +577,76 @@ class TestSyncTransactionsHandlerSuccess:
             )
             assert len(transactions) == 2
 
+    @pytest.mark.asyncio
+    async def test_resync_counts_existing_and_duplicate_transactions_unchanged(
+        self, test_database, connection_with_dependencies
+    ):
+        """Test re-sync deduplicates against stored and in-payload provider IDs."""
+        # Arrange
+        connection_id, user_id, _ = connection_with_dependencies
+
+        async with test_database.get_session() as session:
+            account_id, _ = await create_account_in_db(session, connection_id)
+
+        mock_provider = AsyncMock()
+        mock_encryption = Mock()
+        mock_encryption.decrypt.return_value = Success(
+            value={"access_token": "mock_token"}
+        )
+
+        async def run_sync(transaction_data):
+            mock_provider.fetch_transactions.return_value = Success(
+                value=transaction_data
+            )
+            async with test_database.get_session() as session:
+                handler = SyncTransactionsHandler(
+                    connection_repo=ProviderConnectionRepository(session=session),
+                    account_repo=AccountRepository(session=session),
+                    transaction_repo=TransactionRepository(session=session),
+                    encryption_service=mock_encryption,
+                    provider_factory=create_mock_provider_factory(mock_provider),
+                    event_bus=StubEventBus(),
+                    concurrency_limiter=ProviderConcurrencyLimiter(),
+                )
+                return await handler.handle(
+                    SyncTransactions(
+                        connection_id=connection_id,
+                        user_id=user_id,
+                        account_id=account_id,
+                    )
+                )
+
+        first = await run_sync(
+            [
+                create_provider_transaction_data(provider_transaction_id="TXN-001"),
+                create_provider_transaction_data(provider_transaction_id="TXN-002"),
+            ]
+        )
+
+        # Act - TXN-002 already stored, TXN-003 repeated within the payload
+        second = await run_sync(
+            [
+                create_provider_transaction_data(provider_transaction_id="TXN-002"),
+                create_provider_transaction_data(provider_transaction_id="TXN-003"),
+                create_provider_transaction_data(provider_transaction_id="TXN-003"),
+            ]
+        )
+
+        # Assert
+        assert isinstance(first, Success)
+        assert first.value.created == 2
+        assert isinstance(second, Success)
+        assert second.value.created == 1
+        assert second.value.unchanged == 2
+        assert second.value.errors == 0
+
+        async with test_database.get_session() as session:
+            transaction_repo = TransactionRepository(session=session)
+            transactions = await transaction_repo.find_by_account_id(
+                account_id=account_id
+            )
+            assert len(transactions) == 3
+
     @pytest.mark.asyncio
     async def test_sync_with_date_range_filter(
         self, test_database, connection_with_dependencies
@@ -598,6 +684,7 @@ class TestSyncTransactionsHandlerSuccess:
                 encryption_service=mock_encryption,
                 provider_factory=create_mock_provider_factory(mock_provider),
                 event_bus=event_bus,
+                concurrency_limiter=ProviderConcurrencyLimiter(),
             )
 
             command = SyncTransactions(
@@ -643,6 +730,7 @@ class TestSyncTransactionsHandlerFailure:
                 encryption_service=mock_encryption,
                 provider_factory=create_mock_provider_factory(mock_provider),
                 event_bus=event_bus,
+                concurrency_limiter=ProviderConcurrencyLimiter(),
             )
 
             command = SyncTransactions(
@@ -682,6 +770,7 @@ class TestSyncTransactionsHandlerFailure:
                 encryption_service=mock_encryption,
                 provider_factory=create_mock_provider_factory(mock_provider),
                 event_bus=event_bus,
+                concurrency_limiter=ProviderConcurrencyLimiter(),
             )
 
             command = SyncTransactions(
@@ -754,6 +843,7 @@ class TestTransactionTypeMapping:
                 encryption_service=mock_encryption,
                 provider_factory=create_mock_provider_factory(mock_provider),
                 event_bus=event_bus,
+                concurrency_limiter=ProviderConcurrencyLimiter(),
             )
 
             command = SyncTransactions(
@@ -823,6 +913,7 @@ class TestTransactionTypeMapping:
                 encryption_service=mock_encryption,
                 provider_factory=create_mock_provider_factory(mock_provider),
                 event_bus=event_bus,
+                concurrency_limiter=ProviderConcurrencyLimiter(),
             )
 
             command = SyncTransactions(
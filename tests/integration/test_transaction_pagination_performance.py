@@ -0,0 +1,203 @@
+"""Performance verification tests for keyset transaction pagination.
+
+Compares fetching a deep page of an account's transactions with
+LIMIT/OFFSET (find_by_account_id) and with a keyset cursor
+(find_page_by_account). OFFSET reads and discards every earlier row, so its
+latency grows with page depth; the keyset seek starts at the cursor.
+
+Test Strategy:
+- Insert enough transactions for page 1000 at 50 rows per page
+- Measure median latency of page 1000 for both paths
+- Verify both paths return the same rows and keyset is faster
+
+Note: These are verification tests, not precise benchmarks. Run with ``-s``
+to see the measured numbers:
+    pytest tests/integration/test_transaction_pagination_performance.py -s
+"""
+
+import statistics
+import time
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from uuid_extensions import uuid7
+
+from src.domain.entities.transaction import Transaction
+from src.domain.enums.transaction_status import TransactionStatus
+from src.domain.enums.transaction_subtype import TransactionSubtype
+from src.domain.enums.transaction_type import TransactionType
+from src.domain.protocols.transaction_repository import TransactionCursor
+from src.domain.value_objects.money import Money
+from src.infrastructure.persistence.repositories.transaction_repository import (
+    TransactionRepository,
+)
+
+
+PAGE_SIZE = 50
+PAGE_NUMBER = 1000
+TRANSACTION_COUNT = PAGE_SIZE * (PAGE_NUMBER + 10)
+RUNS = 7
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+def build_transactions(account_id) -> list[Transaction]:
+    """Build TRANSACTION_COUNT deposits, ~20 per day (dates tie)."""
+    now = datetime.now(UTC)
+    first_day = date(2020, 1, 1)
+    return [
+        Transaction(
+            id=uuid7(),
+            account_id=account_id,
+            provider_transaction_id=f"PAGE-{i}",
+            transaction_type=TransactionType.TRANSFER,
+            subtype=TransactionSubtype.DEPOSIT,
+            status=TransactionStatus.SETTLED,
+            amount=Money(Decimal("100.00"), "USD"),
+            description=f"Deposit #{i}",
+            transaction_date=first_day + timedelta(days=i // 20),
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(TRANSACTION_COUNT)
+    ]
+
+
+async def create_account_chain(session, provider_id, provider_slug):
+    """Create user → connection → account rows and return the account_id."""
+    from src.domain.enums.connection_status import ConnectionStatus
+    from src.infrastructure.persistence.models.account import Account as AccountModel
+    from src.infrastructure.persistence.models.provider_connection import (
+        ProviderConnection as ProviderConnectionModel,
+    )
+    from src.infrastructure.persistence.models.user import User as UserModel
+
+    user_id = uuid7()
+    connection_id = uuid7()
+    account_id = uuid7()
+
+    session.add(
+        UserModel(
+            id=user_id,
+            email=f"perf_{user_id}@example.com",
+            password_hash="$2b$12$test_hash",
+            is_verified=True,
+            is_active=True,
+            failed_login_attempts=0,
+        )
+    )
+    await session.flush()
+    session.add(
+        ProviderConnectionModel(
+            id=connection_id,
+            user_id=user_id,
+            provider_id=provider_id,
+            provider_slug=provider_slug,
+            status=ConnectionStatus.ACTIVE.value,
+        )
+    )
+    await session.flush()
+    session.add(
+        AccountModel(
+            id=account_id,
+            connection_id=connection_id,
+            provider_account_id=f"PERF-{uuid7().hex[:8].upper()}",
+            account_number_masked="****1234",
+            name="Perf Account",
+            account_type="brokerage",
+            balance=Decimal("10000.00"),
+            currency="USD",
+            is_active=True,
+        )
+    )
+    await session.commit()
+    return account_id
+
+
+@pytest_asyncio.fixture
+async def large_account(test_database, schwab_provider):
+    """Provide an account holding TRANSACTION_COUNT transactions."""
+    async with test_database.get_session() as session:
+        await session.execute(text("TRUNCATE TABLE transactions CASCADE"))
+        await session.commit()
+        provider_id, provider_slug = schwab_provider
+        account_id = await create_account_chain(session, provider_id, provider_slug)
+
+    transactions = build_transactions(account_id)
+    async with test_database.get_session() as session:
+        await TransactionRepository(session=session).bulk_insert(transactions)
+        await session.execute(text("ANALYZE transactions"))
+        await session.commit()
+    return account_id, transactions
+
+
+async def median_ms(test_database, fetch) -> tuple[float, list[Transaction]]:
+    """Run fetch(repo) RUNS times; return median latency (ms) and last result."""
+    timings = []
+    rows: list[Transaction] = []
+    for _ in range(RUNS):
+        async with test_database.get_session() as session:
+            repo = TransactionRepository(session=session)
+            start = time.perf_counter()
+            rows = await fetch(repo)
+            timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), rows
+
+
+# =============================================================================
+# Performance Verification Tests
+# =============================================================================
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.slow
+async def test_keyset_page_1000_faster_than_offset(
+    test_database,
+    large_account,
+) -> None:
+    """Verify page 1000 by keyset returns the same rows faster than OFFSET."""
+    account_id, transactions = large_account
+    offset = PAGE_SIZE * (PAGE_NUMBER - 1)
+
+    # Cursor a client would hold after 999 pages: last row of page 999
+    ordered = sorted(
+        transactions, key=lambda t: (t.transaction_date, t.id), reverse=True
+    )
+    last_of_previous = ordered[offset - 1]
+    cursor = TransactionCursor(
+        transaction_date=last_of_previous.transaction_date,
+        transaction_id=last_of_previous.id,
+    )
+
+    offset_ms, offset_rows = await median_ms(
+        test_database,
+        lambda repo: repo.find_by_account_id(
+            account_id, limit=PAGE_SIZE, offset=offset
+        ),
+    )
+    keyset_ms, keyset_rows = await median_ms(
+        test_database,
+        lambda repo: repo.find_page_by_account(
+            account_id, limit=PAGE_SIZE, after=cursor
+        ),
+    )
+
+    print(
+        f"\nPage {PAGE_NUMBER} of {TRANSACTION_COUNT:,} transactions "
+        f"({PAGE_SIZE} per page, median of {RUNS}):"
+        f"\n  LIMIT/OFFSET: {offset_ms:>8.2f} ms"
+        f"\n  Keyset:       {keyset_ms:>8.2f} ms"
+        f"\n  Speedup:      {offset_ms / keyset_ms:>8.1f}x"
+    )
+
+    expected = [t.id for t in ordered[offset : offset + PAGE_SIZE]]
+    assert [t.id for t in offset_rows] == expected
+    assert [t.id for t in keyset_rows] == expected
+    assert keyset_ms < offset_ms
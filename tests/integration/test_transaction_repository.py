@@ -5,9 +5,11 @@ Tests cover:
 - Save many (bulk operations)
 - Find by ID
 - Find by account ID (with pagination)
+- Keyset pages and streamed export by account
 - Find by account and type
 - Find by date range
 - Find by provider transaction ID
+- Bulk ingest (provider ID prefetch, chunked insert with conflict skip)
 - Find security transactions (by symbol)
 - Delete transaction
 - Entity ↔ Model mapping (Money, enums)
@@ -19,7 +21,7 @@ Architecture:
 - Async tests for database operations
 """
 
-from datetime import UTC, date, datetime
+from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 
 import pytest
@@ -33,6 +35,7 @@ from src.domain.enums.asset_type import AssetType
 from src.domain.enums.transaction_status import TransactionStatus
 from src.domain.enums.transaction_subtype import TransactionSubtype
 from src.domain.enums.transaction_type import TransactionType
+from src.domain.protocols.transaction_repository import TransactionCursor
 from src.domain.value_objects.money import Money
 from src.infrastructure.persistence.repositories.transaction_repository import (
     TransactionRepository,
@@ -667,6 +670,107 @@ class TestTransactionRepositoryFindByAccountId:
         assert transactions == []
 
 
+@pytest.mark.integration
+class TestTransactionRepositoryKeysetPagination:
+    """Test TransactionRepository find_page_by_account and stream_by_account."""
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_all_rows_without_overlap(
+        self, test_database, account_with_provider
+    ):
+        """Walking pages by cursor returns every row once, newest first."""
+        # Arrange - 3 transactions per day so dates tie across page boundaries
+        account_id = account_with_provider
+        start = date(2025, 1, 1)
+        transactions = [
+            create_test_transaction(
+                account_id=account_id, transaction_date=start + timedelta(days=i // 3)
+            )
+            for i in range(12)
+        ]
+        async with test_database.get_session() as session:
+            repo = TransactionRepository(session=session)
+            await repo.bulk_insert(transactions)
+
+        # Act
+        seen = []
+        after = None
+        async with test_database.get_session() as session:
+            repo = TransactionRepository(session=session)
+            while True:
+                page = await repo.find_page_by_account(account_id, limit=5, after=after)
+                if not page:
+                    break
+                seen.extend(page)
+                after = TransactionCursor(
+                    transaction_date=page[-1].transaction_date,
+                    transaction_id=page[-1].id,
+                )
+
+        # Assert
+        assert len(seen) == 12
+        assert len({t.id for t in seen}) == 12
+        keys = [(t.transaction_date, t.id) for t in seen]
+        assert keys == sorted(keys, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_page_filters_by_type(self, test_database, account_with_provider):
+        """transaction_type restricts the page to one type."""
+        # Arrange
+        account_id = account_with_provider
+        trade = create_test_transaction(account_id=account_id)
+        transfer = create_test_transaction(
+            account_id=account_id,
+            transaction_type=TransactionType.TRANSFER,
+            subtype=TransactionSubtype.DEPOSIT,
+            asset_type=None,
+            symbol=None,
+            quantity=None,
+            unit_price=None,
+        )
+        async with test_database.get_session() as session:
+            repo = TransactionRepository(session=session)
+            await repo.save_many([trade, transfer])
+
+        # Act
+        async with test_database.get_session() as session:
+            repo = TransactionRepository(session=session)
+            page = await repo.find_page_by_account(
+                account_id, transaction_type=TransactionType.TRANSFER
+            )
+
+        # Assert
+        assert [t.id for t in page] == [transfer.id]
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_all_rows_in_page_order(
+        self, test_database, account_with_provider
+    ):
+        """stream_by_account yields the same order as keyset pages."""
+        # Arrange
+        account_id = account_with_provider
+        transactions = [
+            create_test_transaction(
+                account_id=account_id,
+                transaction_date=date(2025, 1, 1) + timedelta(days=i),
+            )
+            for i in range(25)
+        ]
+        async with test_database.get_session() as session:
+            repo = TransactionRepository(session=session)
+            await repo.bulk_insert(transactions)
+
+        # Act
+        async with test_database.get_session() as session:
+            repo = TransactionRepository(session=session)
+            streamed = [t async for t in repo.stream_by_account(account_id)]
+            paged = await repo.find_page_by_account(account_id, limit=100)
+
+        # Assert
+        assert [t.id for t in streamed] == [t.id for t in paged]
+        assert streamed[0].transaction_date == date(2025, 1, 25)
+
+
 @pytest.mark.integration
 class TestTransactionRepositoryFindByAccountAndType:
     """Test TransactionRepository find_by_account_and_type operations."""
@@ -856,6 +960,115 @@ class TestTransactionRepositoryFindByProviderTransactionId:
         assert found is None
 
 
+@pytest.mark.integration
+class TestTransactionRepositoryBulkInsert:
+    """Test TransactionRepository set-based ingest operations."""
+
+    @pytest.mark.asyncio
+    async def test_find_provider_transaction_ids_returns_account_ids(
+        self, test_database, account_with_provider
+    ):
+        """Test prefetch returns provider IDs for the account only."""
+        # Arrange
+        account_id = account_with_provider
+        transactions = [
+            create_test_transaction(
+                account_id=account_id, provider_transaction_id=f"PREFETCH-{i}"
+            )
+            for i in range(3)
+        ]
+        async with test_database.get_session() as session:
+            repo = TransactionRepository(session=session)
+            await repo.save_many(transactions)
+
+        # Act
+        async with test_database.get_session() as session:
+            repo = TransactionRepository(session=session)
+            ids = await repo.find_provider_transaction_ids(account_id)
+            other_ids = await repo.find_provider_transaction_ids(uuid7())
+
+        # Assert
+        assert ids == {"PREFETCH-0", "PREFETCH-1", "PREFETCH-2"}
+        assert other_ids == set()
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_spans_multiple_chunks(
+        self, test_database, account_with_provider
+    ):
+        """Test bulk_insert persists every row when input exceeds chunk size."""
+        # Arrange
+        account_id = account_with_provider
+        transactions = [
+            create_test_transaction(
+                account_id=account_id, provider_transaction_id=f"BULK-{i}"
+            )
+            for i in range(25)
+        ]
+
+        # Act
+        async with test_database.get_session() as session:
+            repo = TransactionRepository(session=session)
+            inserted = await repo.bulk_insert(transactions, chunk_size=10)
+
+        # Assert
+        assert inserted == 25
+        async with test_database.get_session() as session:
+            repo = TransactionRepository(session=session)
+            found = await repo.find_by_account_id(account_id, limit=100)
+            assert len(found) == 25
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_skips_existing_provider_ids(
+        self, test_database, account_with_provider
+    ):
+        """Test bulk_insert skips rows conflicting on provider_transaction_id."""
+        # Arrange
+        account_id = account_with_provider
+        existing = create_test_transaction(
+            account_id=account_id,
+            provider_transaction_id="CONFLICT-1",
+            description="Original",
+        )
+        async with test_database.get_session() as session:
+            repo = TransactionRepository(session=session)
+            await repo.save(existing)
+
+        batch = [
+            create_test_transaction(
+                account_id=account_id,
+                provider_transaction_id="CONFLICT-1",
+                description="Duplicate",
+            ),
+            create_test_transaction(
+                account_id=account_id, provider_transaction_id="NEW-1"
+            ),
+        ]
+
+        # Act
+        async with test_database.get_session() as session:
+            repo = TransactionRepository(session=session)
+            inserted = await repo.bulk_insert(batch)
+
+        # Assert
+        assert inserted == 1
+        async with test_database.get_session() as session:
+            repo = TransactionRepository(session=session)
+            original = await repo.find_by_provider_transaction_id(
+                account_id, "CONFLICT-1"
+            )
+            assert original is not None
+            assert original.description == "Original"
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_empty_list(self, test_database):
+        """Test bulk_insert with empty list is a no-op."""
+        async with test_database.get_session() as session:
+            repo = TransactionRepository(session=session)
+            inserted = await repo.bulk_insert([])
+
+        assert inserted == 0
+
+
 @pytest.mark.integration
 class TestTransactionRepositoryFindSecurityTransactions:
     """Test TransactionRepository find_security_transactions operations."""
@@ -0,0 +1,237 @@
+"""Performance verification tests for set-based transaction ingest.
+
+Compares the legacy per-row sync path (find_by_provider_transaction_id + save
+for every transaction) with the bulk path used by SyncTransactionsHandler
+(one provider ID prefetch + chunked INSERT ... ON CONFLICT, one commit).
+
+Test Strategy:
+- Count SQL round trips and commits per 1k transactions
+- Measure wall time per 1k transactions for both paths
+- Verify bulk path round trips are bounded by chunk count, not row count
+
+Note: These are verification tests, not precise benchmarks. Run with ``-s``
+to see the measured numbers:
+    pytest tests/integration/test_transaction_sync_performance.py -s
+"""
+
+import math
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from uuid_extensions import uuid7
+
+from src.domain.entities.transaction import Transaction
+from src.domain.enums.asset_type import AssetType
+from src.domain.enums.transaction_status import TransactionStatus
+from src.domain.enums.transaction_subtype import TransactionSubtype
+from src.domain.enums.transaction_type import TransactionType
+from src.domain.value_objects.money import Money
+from src.infrastructure.persistence.repositories.transaction_repository import (
+    BULK_INSERT_CHUNK_SIZE,
+    TransactionRepository,
+)
+
+
+TRANSACTION_COUNT = 1000
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+@dataclass
+class RoundTripCounter:
+    """SQL statement and commit counts captured from engine events."""
+
+    statements: int = 0
+    commits: int = 0
+
+
+@contextmanager
+def count_round_trips(database) -> Iterator[RoundTripCounter]:
+    """Count statements and commits issued through the database engine."""
+    counter = RoundTripCounter()
+    sync_engine = database.engine.sync_engine
+
+    def on_execute(*_args, **_kwargs):
+        counter.statements += 1
+
+    def on_commit(*_args, **_kwargs):
+        counter.commits += 1
+
+    event.listen(sync_engine, "before_cursor_execute", on_execute)
+    event.listen(sync_engine, "commit", on_commit)
+    try:
+        yield counter
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", on_execute)
+        event.remove(sync_engine, "commit", on_commit)
+
+
+def build_transactions(account_id, prefix: str) -> list[Transaction]:
+    """Build TRANSACTION_COUNT unique trade transactions for an account."""
+    now = datetime.now(UTC)
+    return [
+        Transaction(
+            id=uuid7(),
+            account_id=account_id,
+            provider_transaction_id=f"{prefix}-{i}",
+            transaction_type=TransactionType.TRADE,
+            subtype=TransactionSubtype.BUY,
+            status=TransactionStatus.SETTLED,
+            amount=Money(Decimal("-1050.00"), "USD"),
+            description=f"Bought 10 shares #{i}",
+            asset_type=AssetType.EQUITY,
+            symbol="AAPL",
+            security_name="Apple Inc.",
+            quantity=Decimal("10"),
+            unit_price=Money(Decimal("105.00"), "USD"),
+            commission=None,
+            transaction_date=date.today(),
+            settlement_date=None,
+            provider_metadata={"index": i},
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(TRANSACTION_COUNT)
+    ]
+
+
+async def create_account_chain(session, provider_id, provider_slug):
+    """Create user → connection → account rows and return the account_id."""
+    from src.domain.enums.connection_status import ConnectionStatus
+    from src.infrastructure.persistence.models.account import Account as AccountModel
+    from src.infrastructure.persistence.models.provider_connection import (
+        ProviderConnection as ProviderConnectionModel,
+    )
+    from src.infrastructure.persistence.models.user import User as UserModel
+
+    user_id = uuid7()
+    connection_id = uuid7()
+    account_id = uuid7()
+
+    session.add(
+        UserModel(
+            id=user_id,
+            email=f"perf_{user_id}@example.com",
+            password_hash="$2b$12$test_hash",
+            is_verified=True,
+            is_active=True,
+            failed_login_attempts=0,
+        )
+    )
+    await session.flush()
+    session.add(
+        ProviderConnectionModel(
+            id=connection_id,
+            user_id=user_id,
+            provider_id=provider_id,
+            provider_slug=provider_slug,
+            status=ConnectionStatus.ACTIVE.value,
+        )
+    )
+    await session.flush()
+    session.add(
+        AccountModel(
+            id=account_id,
+            connection_id=connection_id,
+            provider_account_id=f"PERF-{uuid7().hex[:8].upper()}",
+            account_number_masked="****1234",
+            name="Perf Account",
+            account_type="brokerage",
+            balance=Decimal("10000.00"),
+            currency="USD",
+            is_active=True,
+        )
+    )
+    await session.commit()
+    return account_id
+
+
+@pytest_asyncio.fixture
+async def perf_account(test_database, schwab_provider):
+    """Provide a fresh account with FK dependencies satisfied."""
+    async with test_database.get_session() as session:
+        await session.execute(text("TRUNCATE TABLE transactions CASCADE"))
+        await session.commit()
+        provider_id, provider_slug = schwab_provider
+        return await create_account_chain(session, provider_id, provider_slug)
+
+
+# =============================================================================
+# Performance Verification Tests
+# =============================================================================
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+@pytest.mark.slow
+async def test_bulk_ingest_round_trips_and_wall_time_per_1k(
+    test_database,
+    perf_account,
+) -> None:
+    """Verify bulk ingest is bounded by chunk count and beats per-row ingest.
+
+    Legacy path: 2 statements (SELECT + SELECT-by-id/INSERT) and 1 commit
+    per transaction. Bulk path: 1 prefetch + ceil(n / chunk_size) INSERTs
+    and a single commit.
+    """
+    account_id = perf_account
+
+    # Legacy per-row path
+    legacy_transactions = build_transactions(account_id, "LEGACY")
+    async with test_database.get_session() as session:
+        repo = TransactionRepository(session=session)
+        with count_round_trips(test_database) as legacy_counter:
+            start = time.perf_counter()
+            for transaction in legacy_transactions:
+                existing = await repo.find_by_provider_transaction_id(
+                    account_id, transaction.provider_transaction_id
+                )
+                if existing is None:
+                    await repo.save(transaction)
+            legacy_elapsed = time.perf_counter() - start
+
+    # Bulk path
+    bulk_transactions = build_transactions(account_id, "BULK")
+    async with test_database.get_session() as session:
+        repo = TransactionRepository(session=session)
+        with count_round_trips(test_database) as bulk_counter:
+            start = time.perf_counter()
+            existing_ids = await repo.find_provider_transaction_ids(account_id)
+            new = [
+                t
+                for t in bulk_transactions
+                if t.provider_transaction_id not in existing_ids
+            ]
+            inserted = await repo.bulk_insert(new)
+            bulk_elapsed = time.perf_counter() - start
+
+    print(
+        f"\nper {TRANSACTION_COUNT} transactions:"
+        f"\n  legacy: {legacy_counter.statements} statements, "
+        f"{legacy_counter.commits} commits, {legacy_elapsed * 1000:.0f} ms"
+        f"\n  bulk:   {bulk_counter.statements} statements, "
+        f"{bulk_counter.commits} commits, {bulk_elapsed * 1000:.0f} ms"
+    )
+
+    assert inserted == TRANSACTION_COUNT
+    expected_statements = 1 + math.ceil(TRANSACTION_COUNT / BULK_INSERT_CHUNK_SIZE)
+    assert bulk_counter.statements == expected_statements
+    assert bulk_counter.commits == 1
+    assert legacy_counter.statements >= 2 * TRANSACTION_COUNT
+    assert legacy_counter.commits == TRANSACTION_COUNT
+
+    # Conservative: timing varies by environment, but bulk should be far ahead
+    assert bulk_elapsed < legacy_elapsed, (
+        f"Bulk ingest ({bulk_elapsed:.3f}s) should be faster than "
+        f"per-row ingest ({legacy_elapsed:.3f}s)"
+    )
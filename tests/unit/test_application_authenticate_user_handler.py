@@ -79,8 +79,8 @@ class TestAuthenticateUserHandlerSuccess:
         mock_user_repo = AsyncMock()
         mock_user_repo.find_by_email.return_value = mock_user
 
-        mock_password_service = Mock()
-        mock_password_service.verify_password.return_value = True
+        mock_password_service = AsyncMock()
+        mock_password_service.verify_password_async.return_value = True
 
         mock_event_bus = AsyncMock()
 
@@ -114,8 +114,8 @@ class TestAuthenticateUserHandlerSuccess:
         mock_user_repo = AsyncMock()
         mock_user_repo.find_by_email.return_value = mock_user
 
-        mock_password_service = Mock()
-        mock_password_service.verify_password.return_value = True
+        mock_password_service = AsyncMock()
+        mock_password_service.verify_password_async.return_value = True
 
         mock_event_bus = AsyncMock()
 
@@ -134,7 +134,7 @@ class TestAuthenticateUserHandlerSuccess:
         await handler.handle(command)
 
         # Assert
-        mock_password_service.verify_password.assert_called_once_with(
+        mock_password_service.verify_password_async.assert_awaited_once_with(
             "MyPassword123!",
             "stored_hash",
         )
@@ -148,8 +148,8 @@ class TestAuthenticateUserHandlerSuccess:
         mock_user_repo = AsyncMock()
         mock_user_repo.find_by_email.return_value = mock_user
 
-        mock_password_service = Mock()
-        mock_password_service.verify_password.return_value = True
+        mock_password_service = AsyncMock()
+        mock_password_service.verify_password_async.return_value = True
 
         mock_event_bus = AsyncMock()
 
@@ -183,7 +183,7 @@ class TestAuthenticateUserHandlerFailure:
         mock_user_repo = AsyncMock()
         mock_user_repo.find_by_email.return_value = None
 
-        mock_password_service = Mock()
+        mock_password_service = AsyncMock()
         mock_event_bus = AsyncMock()
 
         handler = AuthenticateUserHandler(
@@ -213,8 +213,8 @@ class TestAuthenticateUserHandlerFailure:
         mock_user_repo = AsyncMock()
         mock_user_repo.find_by_email.return_value = mock_user
 
-        mock_password_service = Mock()
-        mock_password_service.verify_password.return_value = False
+        mock_password_service = AsyncMock()
+        mock_password_service.verify_password_async.return_value = False
 
         mock_event_bus = AsyncMock()
 
@@ -245,7 +245,7 @@ class TestAuthenticateUserHandlerFailure:
         mock_user_repo = AsyncMock()
         mock_user_repo.find_by_email.return_value = mock_user
 
-        mock_password_service = Mock()
+        mock_password_service = AsyncMock()
         mock_event_bus = AsyncMock()
 
         handler = AuthenticateUserHandler(
@@ -277,7 +277,7 @@ class TestAuthenticateUserHandlerFailure:
         mock_user_repo = AsyncMock()
         mock_user_repo.find_by_email.return_value = mock_user
 
-        mock_password_service = Mock()
+        mock_password_service = AsyncMock()
         mock_event_bus = AsyncMock()
 
         handler = AuthenticateUserHandler(
@@ -307,7 +307,7 @@ class TestAuthenticateUserHandlerFailure:
         mock_user_repo = AsyncMock()
         mock_user_repo.find_by_email.return_value = mock_user
 
-        mock_password_service = Mock()
+        mock_password_service = AsyncMock()
         mock_event_bus = AsyncMock()
 
         handler = AuthenticateUserHandler(
@@ -337,8 +337,8 @@ class TestAuthenticateUserHandlerFailure:
         mock_user_repo = AsyncMock()
         mock_user_repo.find_by_email.return_value = mock_user
 
-        mock_password_service = Mock()
-        mock_password_service.verify_password.return_value = False
+        mock_password_service = AsyncMock()
+        mock_password_service.verify_password_async.return_value = False
 
         mock_event_bus = AsyncMock()
 
@@ -374,8 +374,8 @@ class TestAuthenticateUserHandlerEvents:
         mock_user_repo = AsyncMock()
         mock_user_repo.find_by_email.return_value = mock_user
 
-        mock_password_service = Mock()
-        mock_password_service.verify_password.return_value = True
+        mock_password_service = AsyncMock()
+        mock_password_service.verify_password_async.return_value = True
 
         mock_event_bus = AsyncMock()
 
@@ -408,8 +408,8 @@ class TestAuthenticateUserHandlerEvents:
         mock_user_repo = AsyncMock()
         mock_user_repo.find_by_email.return_value = mock_user
 
-        mock_password_service = Mock()
-        mock_password_service.verify_password.return_value = True
+        mock_password_service = AsyncMock()
+        mock_password_service.verify_password_async.return_value = True
 
         mock_event_bus = AsyncMock()
 
@@ -440,7 +440,7 @@ class TestAuthenticateUserHandlerEvents:
         mock_user_repo = AsyncMock()
         mock_user_repo.find_by_email.return_value = None
 
-        mock_password_service = Mock()
+        mock_password_service = AsyncMock()
         mock_event_bus = AsyncMock()
 
         handler = AuthenticateUserHandler(
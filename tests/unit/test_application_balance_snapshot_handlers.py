@@ -1,7 +1,7 @@
 """Unit tests for balance snapshot query handlers.
 
 Tests GetBalanceHistoryHandler, ListBalanceSnapshotsByAccountHandler,
-and GetLatestBalanceSnapshotsHandler.
+GetLatestBalanceSnapshotsHandler, and GetUserBalanceHistoryHandler.
 
 Architecture:
 - Tests query validation and error handling
@@ -21,19 +21,23 @@ from uuid_extensions import uuid7
 from src.application.queries.balance_snapshot_queries import (
     GetBalanceHistory,
     GetLatestBalanceSnapshots,
+    GetUserBalanceHistory,
     ListBalanceSnapshotsByAccount,
 )
 from src.application.queries.handlers.balance_snapshot_handlers import (
     BalanceSnapshotQueryError,
     GetBalanceHistoryHandler,
     GetLatestBalanceSnapshotsHandler,
+    GetUserBalanceHistoryHandler,
     ListBalanceSnapshotsByAccountHandler,
 )
 from src.core.result import Failure, Success
 from src.domain.entities.account import Account
 from src.domain.entities.balance_snapshot import BalanceSnapshot
 from src.domain.entities.provider_connection import ProviderConnection
+from src.domain.enums.balance_granularity import BalanceGranularity
 from src.domain.enums.snapshot_source import SnapshotSource
+from src.domain.protocols.balance_snapshot_repository import BalanceBucket
 from src.domain.value_objects.money import Money
 
 
@@ -87,6 +91,26 @@ def create_mock_snapshot(
     return mock
 
 
+def create_bucket(
+    bucket_start: datetime,
+    open_balance: str,
+    close_balance: str,
+    currency: str = "USD",
+    account_count: int = 1,
+) -> BalanceBucket:
+    """Create a BalanceBucket as returned by the repository."""
+    return BalanceBucket(
+        bucket_start=bucket_start,
+        currency=currency,
+        open_balance=Decimal(open_balance),
+        close_balance=Decimal(close_balance),
+        min_balance=Decimal(open_balance),
+        max_balance=Decimal(close_balance),
+        snapshot_count=3,
+        account_count=account_count,
+    )
+
+
 # =============================================================================
 # Fixtures
 # =============================================================================
@@ -307,6 +331,72 @@ class TestGetBalanceHistoryHandler:
         assert result.value.start_balance is None
         assert result.value.end_balance is None
 
+    async def test_invalid_granularity_returns_failure(
+        self, handler, mock_snapshot_repo, user_id, account_id
+    ):
+        """Handle() rejects unknown granularity before touching repositories."""
+        now = datetime.now(UTC)
+        query = GetBalanceHistory(
+            account_id=account_id,
+            user_id=user_id,
+            start_date=now - timedelta(days=30),
+            end_date=now,
+            granularity="fortnight",
+        )
+        result = await handler.handle(query)
+
+        assert isinstance(result, Failure)
+        assert result.error == BalanceSnapshotQueryError.INVALID_GRANULARITY
+        mock_snapshot_repo.find_buckets_by_account_id.assert_not_called()
+
+    async def test_granularity_returns_buckets_from_repository(
+        self,
+        handler,
+        mock_account_repo,
+        mock_connection_repo,
+        mock_snapshot_repo,
+        user_id,
+        account_id,
+    ):
+        """Handle() delegates bucketing to the repository and summarizes."""
+        connection_id = uuid7()
+        mock_account_repo.find_by_id.return_value = create_mock_account(
+            id=account_id, connection_id=connection_id
+        )
+        mock_connection_repo.find_by_id.return_value = create_mock_connection(
+            id=connection_id, user_id=user_id
+        )
+        week = datetime(2024, 1, 1, tzinfo=UTC)
+        mock_snapshot_repo.find_buckets_by_account_id.return_value = [
+            create_bucket(week, "100.00", "110.00"),
+            create_bucket(week + timedelta(weeks=1), "110.00", "99.00"),
+        ]
+
+        query = GetBalanceHistory(
+            account_id=account_id,
+            user_id=user_id,
+            start_date=week,
+            end_date=week + timedelta(weeks=2),
+            granularity="week",
+        )
+        result = await handler.handle(query)
+
+        assert isinstance(result, Success)
+        mock_snapshot_repo.find_by_account_id_in_range.assert_not_called()
+        call = mock_snapshot_repo.find_buckets_by_account_id.call_args
+        assert call.kwargs["granularity"] == BalanceGranularity.WEEK
+
+        history = result.value
+        assert history.granularity == "week"
+        assert history.snapshots == []
+        assert history.total_count == 2
+        assert history.start_balance == Decimal("100.00")
+        assert history.end_balance == Decimal("99.00")
+        assert history.total_change_amount == Decimal("-1.00")
+        assert history.buckets[0].change_amount is None
+        assert history.buckets[1].change_amount == Decimal("-11.00")
+        assert history.buckets[1].change_percent == pytest.approx(-10.0)
+
 
 # =============================================================================
 # ListBalanceSnapshotsByAccountHandler Tests
@@ -520,3 +610,103 @@ class TestGetLatestBalanceSnapshotsHandler:
         assert dto.account_id == account_id
         assert dto.balance == Decimal("50000.00")
         assert dto.currency == "USD"
+
+
+# =============================================================================
+# GetUserBalanceHistoryHandler Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestGetUserBalanceHistoryHandler:
+    """Tests for GetUserBalanceHistoryHandler."""
+
+    @pytest.fixture
+    def handler(self, mock_snapshot_repo):
+        """Create handler with mocks."""
+        return GetUserBalanceHistoryHandler(snapshot_repo=mock_snapshot_repo)
+
+    async def test_without_granularity_returns_raw_snapshots(
+        self, handler, mock_snapshot_repo, user_id
+    ):
+        """Handle() keeps returning raw snapshots when no granularity given."""
+        mock_snapshot_repo.find_by_user_id_in_range.return_value = [
+            create_mock_snapshot(),
+            create_mock_snapshot(),
+        ]
+
+        now = datetime.now(UTC)
+        query = GetUserBalanceHistory(
+            user_id=user_id, start_date=now - timedelta(days=7), end_date=now
+        )
+        result = await handler.handle(query)
+
+        assert isinstance(result, Success)
+        assert len(result.value.snapshots) == 2
+        assert result.value.buckets == []
+        mock_snapshot_repo.find_buckets_by_user_id.assert_not_called()
+
+    async def test_invalid_granularity_returns_failure(self, handler, user_id):
+        """Handle() returns failure for unknown granularity."""
+        now = datetime.now(UTC)
+        query = GetUserBalanceHistory(
+            user_id=user_id,
+            start_date=now - timedelta(days=7),
+            end_date=now,
+            granularity="year",
+        )
+        result = await handler.handle(query)
+
+        assert isinstance(result, Failure)
+        assert result.error == BalanceSnapshotQueryError.INVALID_GRANULARITY
+
+    async def test_granularity_returns_summed_buckets(
+        self, handler, mock_snapshot_repo, user_id
+    ):
+        """Handle() returns the repository's per-bucket totals."""
+        month = datetime(2024, 1, 1, tzinfo=UTC)
+        mock_snapshot_repo.find_buckets_by_user_id.return_value = [
+            create_bucket(month, "1000.00", "1200.00", account_count=2),
+            create_bucket(
+                datetime(2024, 2, 1, tzinfo=UTC), "1200", "1500", account_count=3
+            ),
+        ]
+
+        query = GetUserBalanceHistory(
+            user_id=user_id,
+            start_date=month,
+            end_date=datetime(2024, 3, 1, tzinfo=UTC),
+            granularity="month",
+        )
+        result = await handler.handle(query)
+
+        assert isinstance(result, Success)
+        mock_snapshot_repo.find_by_user_id_in_range.assert_not_called()
+        history = result.value
+        assert history.granularity == "month"
+        assert history.currency == "USD"
+        assert history.total_count == 2
+        assert [b.account_count for b in history.buckets] == [2, 3]
+        assert history.buckets[1].change_amount == Decimal("300.00")
+
+    async def test_mixed_currencies_leave_currency_unset(
+        self, handler, mock_snapshot_repo, user_id
+    ):
+        """Handle() reports no single currency when buckets span several."""
+        day = datetime(2024, 1, 1, tzinfo=UTC)
+        mock_snapshot_repo.find_buckets_by_user_id.return_value = [
+            create_bucket(day, "10", "20", currency="EUR"),
+            create_bucket(day, "30", "40", currency="USD"),
+        ]
+
+        query = GetUserBalanceHistory(
+            user_id=user_id,
+            start_date=day,
+            end_date=day + timedelta(days=1),
+            granularity="day",
+        )
+        result = await handler.handle(query)
+
+        assert isinstance(result, Success)
+        assert result.value.currency is None
+        assert all(b.change_amount is None for b in result.value.buckets)
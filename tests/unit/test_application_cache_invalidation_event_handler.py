@@ -0,0 +1,137 @@
+"""Unit tests for CacheInvalidationEventHandler.
+
+Tests cover:
+- User token rotation drops the user's local (L1) entries in all workers
+- Global token rotation drops every local entry
+- Provider connection changes drop the cached connection
+- Fail-open on invalidation errors
+
+Architecture:
+- Unit tests with mocked CacheInvalidationProtocol and ProviderConnectionCache
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from uuid_extensions import uuid7
+
+from src.application.event_handlers.cache_invalidation_event_handler import (
+    PROVIDER_CONNECTION_CHANGE_EVENTS,
+    CacheInvalidationEventHandler,
+)
+from src.domain.events.auth_events import (
+    GlobalTokenRotationSucceeded,
+    UserTokenRotationSucceeded,
+)
+from src.domain.events.provider_events import ProviderDisconnectionSucceeded
+
+
+@pytest.fixture
+def invalidation() -> AsyncMock:
+    """Mocked CacheInvalidationProtocol."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def connection_cache() -> AsyncMock:
+    """Mocked ProviderConnectionCache."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def logger() -> MagicMock:
+    """Mocked logger."""
+    return MagicMock()
+
+
+@pytest.fixture
+def handler(
+    invalidation: AsyncMock, connection_cache: AsyncMock, logger: MagicMock
+) -> CacheInvalidationEventHandler:
+    """Create handler with mocked dependencies."""
+    return CacheInvalidationEventHandler(
+        invalidation=invalidation,
+        connection_cache=connection_cache,
+        logger=logger,
+    )
+
+
+@pytest.mark.unit
+class TestCacheInvalidationEventHandler:
+    """Tests for local cache invalidation on domain events."""
+
+    @pytest.mark.asyncio
+    async def test_user_token_rotation_invalidates_user(
+        self, handler: CacheInvalidationEventHandler, invalidation: AsyncMock
+    ) -> None:
+        """Per-user rotation drops that user's local entries."""
+        event = UserTokenRotationSucceeded(
+            user_id=uuid7(),
+            triggered_by="admin",
+            previous_version=1,
+            new_version=2,
+            reason="suspicious_activity",
+        )
+
+        await handler.handle_user_token_rotation(event)
+
+        invalidation.invalidate_user.assert_awaited_once_with(event.user_id)
+
+    @pytest.mark.asyncio
+    async def test_global_token_rotation_invalidates_all(
+        self, handler: CacheInvalidationEventHandler, invalidation: AsyncMock
+    ) -> None:
+        """Global rotation drops every local entry."""
+        event = GlobalTokenRotationSucceeded(
+            triggered_by="system",
+            previous_version=1,
+            new_version=2,
+            reason="key_rotation",
+            grace_period_seconds=300,
+        )
+
+        await handler.handle_global_token_rotation(event)
+
+        invalidation.invalidate_all.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_provider_disconnection_drops_cached_connection(
+        self, handler: CacheInvalidationEventHandler, connection_cache: AsyncMock
+    ) -> None:
+        """Disconnection removes the connection from Redis and L1 tiers."""
+        event = ProviderDisconnectionSucceeded(
+            user_id=uuid7(),
+            connection_id=uuid7(),
+            provider_id=uuid7(),
+            provider_slug="schwab",
+        )
+
+        await handler.handle_provider_connection_changed(event)
+
+        connection_cache.delete.assert_awaited_once_with(event.connection_id)
+
+    @pytest.mark.asyncio
+    async def test_invalidation_error_is_logged_not_raised(
+        self,
+        handler: CacheInvalidationEventHandler,
+        invalidation: AsyncMock,
+        logger: MagicMock,
+    ) -> None:
+        """Invalidation failure is fail-open (entries expire by TTL)."""
+        invalidation.invalidate_user.side_effect = ConnectionError("down")
+        event = UserTokenRotationSucceeded(
+            user_id=uuid7(),
+            triggered_by="system",
+            previous_version=1,
+            new_version=2,
+            reason="password_changed",
+        )
+
+        await handler.handle_user_token_rotation(event)
+
+        logger.warning.assert_called_once()
+
+    def test_connection_change_events_carry_connection_id(self) -> None:
+        """Every connection change event type declares a connection_id field."""
+        for event_class in PROVIDER_CONNECTION_CHANGE_EVENTS:
+            assert "connection_id" in event_class.__dataclass_fields__, event_class
@@ -0,0 +1,324 @@
+"""Unit tests for registry-driven query result caching.
+
+Tests cover:
+- CachedQueryHandler read-through behavior (hit, miss, store)
+- Failures are never cached
+- Fail-open on cache read/write errors
+- Metrics recording per query namespace
+- resolve_result_type() handler annotation lookup
+- QueryCacheEventHandler per-user invalidation
+
+Reference:
+    - src/application/cqrs/query_cache.py
+    - src/application/event_handlers/query_cache_event_handler.py
+"""
+
+from dataclasses import dataclass
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from uuid_extensions import uuid7
+
+from src.application.cqrs.query_cache import CachedQueryHandler, resolve_result_type
+from src.application.event_handlers.query_cache_event_handler import (
+    QUERY_CACHE_INVALIDATION_EVENTS,
+    QueryCacheEventHandler,
+)
+from src.application.queries.handlers.get_account_handler import (
+    AccountResult,
+    GetAccountHandler,
+)
+from src.application.queries.handlers.list_accounts_handler import (
+    AccountListResult,
+    ListAccountsByUserHandler,
+)
+from src.core.result import Failure, Result, Success
+from src.domain.events.data_events import AccountSyncSucceeded
+
+# =============================================================================
+# Test Helpers
+# =============================================================================
+
+
+@dataclass(frozen=True, kw_only=True)
+class SampleQuery:
+    """Query used by the tests."""
+
+    user_id: UUID
+    limit: int = 10
+
+
+@dataclass(frozen=True, kw_only=True)
+class SampleResult:
+    """Result DTO used by the tests."""
+
+    total: int
+
+
+class SampleHandler:
+    """Handler with a resolvable result annotation."""
+
+    async def handle(self, query: SampleQuery) -> Result[SampleResult, str]:
+        return Success(value=SampleResult(total=query.limit))
+
+
+NAMESPACE = "query:sample_query"
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def query() -> SampleQuery:
+    """Sample user-scoped query."""
+    return SampleQuery(user_id=cast(UUID, uuid7()))
+
+
+@pytest.fixture
+def mock_cache() -> AsyncMock:
+    """Mock QueryResultCache that misses by default."""
+    cache = AsyncMock()
+    cache.get.return_value = None
+    return cache
+
+
+@pytest.fixture
+def mock_metrics() -> MagicMock:
+    """Mock CacheMetricsProtocol."""
+    return MagicMock()
+
+
+@pytest.fixture
+def inner_handler() -> AsyncMock:
+    """Wrapped query handler returning a success result."""
+    handler = AsyncMock()
+    handler.handle.return_value = Success(value=SampleResult(total=3))
+    return handler
+
+
+@pytest.fixture
+def cached_handler(
+    inner_handler: AsyncMock, mock_cache: AsyncMock, mock_metrics: MagicMock
+) -> CachedQueryHandler:
+    """CachedQueryHandler around the mocked handler."""
+    return CachedQueryHandler(
+        handler=inner_handler,
+        cache=mock_cache,
+        metrics=mock_metrics,
+        result_type=SampleResult,
+        ttl=60,
+        namespace=NAMESPACE,
+    )
+
+
+# =============================================================================
+# CachedQueryHandler Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestCachedQueryHandler:
+    """Tests for CachedQueryHandler read-through behavior."""
+
+    @pytest.mark.asyncio
+    async def test_hit_returns_cached_value_without_calling_handler(
+        self,
+        cached_handler: CachedQueryHandler,
+        inner_handler: AsyncMock,
+        mock_cache: AsyncMock,
+        mock_metrics: MagicMock,
+        query: SampleQuery,
+    ) -> None:
+        """Cache hit returns Success(cached) and skips the database."""
+        mock_cache.get.return_value = SampleResult(total=7)
+
+        result = await cached_handler.handle(query)
+
+        assert result == Success(value=SampleResult(total=7))
+        mock_cache.get.assert_awaited_once_with(query, SampleResult)
+        inner_handler.handle.assert_not_awaited()
+        mock_metrics.record_hit.assert_called_once_with(NAMESPACE)
+        mock_metrics.record_miss.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_miss_runs_handler_and_stores_result(
+        self,
+        cached_handler: CachedQueryHandler,
+        inner_handler: AsyncMock,
+        mock_cache: AsyncMock,
+        mock_metrics: MagicMock,
+        query: SampleQuery,
+    ) -> None:
+        """Cache miss runs the handler and stores the success value."""
+        result = await cached_handler.handle(query)
+
+        assert result == Success(value=SampleResult(total=3))
+        inner_handler.handle.assert_awaited_once_with(query)
+        mock_cache.set.assert_awaited_once_with(query, SampleResult(total=3), ttl=60)
+        mock_metrics.record_miss.assert_called_once_with(NAMESPACE)
+
+    @pytest.mark.asyncio
+    async def test_failure_is_not_cached(
+        self,
+        cached_handler: CachedQueryHandler,
+        inner_handler: AsyncMock,
+        mock_cache: AsyncMock,
+        query: SampleQuery,
+    ) -> None:
+        """Failure results (not found, not owned) are returned, never stored."""
+        inner_handler.handle.return_value = Failure(error="Account not found")
+
+        result = await cached_handler.handle(query)
+
+        assert result == Failure(error="Account not found")
+        mock_cache.set.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cache_read_error_falls_through_to_handler(
+        self,
+        cached_handler: CachedQueryHandler,
+        inner_handler: AsyncMock,
+        mock_cache: AsyncMock,
+        mock_metrics: MagicMock,
+        query: SampleQuery,
+    ) -> None:
+        """Cache read error is treated as a miss (fail-open)."""
+        mock_cache.get.side_effect = ConnectionError("Redis down")
+
+        result = await cached_handler.handle(query)
+
+        assert isinstance(result, Success)
+        inner_handler.handle.assert_awaited_once_with(query)
+        mock_metrics.record_error.assert_called_once_with(NAMESPACE)
+
+    @pytest.mark.asyncio
+    async def test_cache_write_error_does_not_affect_response(
+        self,
+        cached_handler: CachedQueryHandler,
+        mock_cache: AsyncMock,
+        mock_metrics: MagicMock,
+        query: SampleQuery,
+    ) -> None:
+        """Cache write error still returns the handler result (fail-open)."""
+        mock_cache.set.side_effect = ConnectionError("Redis down")
+
+        result = await cached_handler.handle(query)
+
+        assert result == Success(value=SampleResult(total=3))
+        mock_metrics.record_error.assert_called_once_with(NAMESPACE)
+
+    @pytest.mark.asyncio
+    async def test_works_without_metrics(
+        self,
+        inner_handler: AsyncMock,
+        mock_cache: AsyncMock,
+        query: SampleQuery,
+    ) -> None:
+        """Metrics are optional."""
+        handler = CachedQueryHandler(
+            handler=inner_handler,
+            cache=mock_cache,
+            metrics=None,
+            result_type=SampleResult,
+            ttl=60,
+            namespace=NAMESPACE,
+        )
+
+        result = await handler.handle(query)
+
+        assert isinstance(result, Success)
+
+    def test_wrapped_exposes_inner_handler(
+        self, cached_handler: CachedQueryHandler, inner_handler: AsyncMock
+    ) -> None:
+        """wrapped property returns the underlying handler."""
+        assert cached_handler.wrapped is inner_handler
+
+
+# =============================================================================
+# resolve_result_type Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestResolveResultType:
+    """Tests for resolve_result_type() annotation lookup."""
+
+    def test_resolves_local_handler(self) -> None:
+        """Resolves Result[DTO, E] success type."""
+        assert resolve_result_type(SampleHandler) is SampleResult
+
+    @pytest.mark.parametrize(
+        ("handler_class", "expected"),
+        [
+            (GetAccountHandler, AccountResult),
+            (ListAccountsByUserHandler, AccountListResult),
+        ],
+    )
+    def test_resolves_real_handlers(self, handler_class: type, expected: type) -> None:
+        """Resolves DTO types of registered query handlers."""
+        assert resolve_result_type(handler_class) is expected
+
+    def test_returns_none_without_annotation(self) -> None:
+        """Handlers without a Result annotation are not cacheable."""
+
+        class UnannotatedHandler:
+            async def handle(self, query):
+                return None
+
+        assert resolve_result_type(UnannotatedHandler) is None
+
+
+# =============================================================================
+# QueryCacheEventHandler Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestQueryCacheEventHandler:
+    """Tests for QueryCacheEventHandler invalidation."""
+
+    @pytest.fixture
+    def event(self) -> AccountSyncSucceeded:
+        """Account sync succeeded event."""
+        return AccountSyncSucceeded(
+            user_id=cast(UUID, uuid7()),
+            connection_id=cast(UUID, uuid7()),
+            account_count=2,
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalidates_user_results(self, event: AccountSyncSucceeded) -> None:
+        """Data change event drops the user's cached query results."""
+        query_cache = AsyncMock()
+        query_cache.invalidate_user.return_value = 4
+        logger = MagicMock()
+        handler = QueryCacheEventHandler(query_cache=query_cache, logger=logger)
+
+        await handler.handle_user_data_changed(event)
+
+        query_cache.invalidate_user.assert_awaited_once_with(event.user_id)
+        logger.debug.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_error_is_logged_not_raised(
+        self, event: AccountSyncSucceeded
+    ) -> None:
+        """Invalidation failure is fail-open (entries expire by TTL)."""
+        query_cache = AsyncMock()
+        query_cache.invalidate_user.side_effect = ConnectionError("Redis down")
+        logger = MagicMock()
+        handler = QueryCacheEventHandler(query_cache=query_cache, logger=logger)
+
+        await handler.handle_user_data_changed(event)
+
+        logger.warning.assert_called_once()
+
+    def test_invalidation_events_carry_user_id(self) -> None:
+        """Every invalidation event type declares a user_id field."""
+        for event_class in QUERY_CACHE_INVALIDATION_EVENTS:
+            assert "user_id" in event_class.__dataclass_fields__, event_class
@@ -19,6 +19,7 @@ Note: This handler ONLY creates sessions. It does NOT authenticate users
 or generate tokens (CQRS separation).
 """
 
+import asyncio
 from dataclasses import dataclass
 from unittest.mock import AsyncMock, Mock
 from uuid import UUID
@@ -495,6 +496,57 @@ class TestCreateSessionHandlerSessionLimit:
         # Assert - Should not check session count for unlimited users
         mock_session_repo.count_active_sessions.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_enrichment_overlaps_session_count(self):
+        """Test enrichers run concurrently with the session count query."""
+        # Arrange
+        user_id = uuid7()
+        mock_user = create_mock_user(user_id=user_id, max_sessions=3)
+        count_started = asyncio.Event()
+
+        async def count_active_sessions(_user_id):
+            count_started.set()
+            return 0
+
+        async def enrich_device(_user_agent):
+            # Completes only if the count query started meanwhile
+            await asyncio.wait_for(count_started.wait(), timeout=1)
+            return MockDeviceResult(device_info="Chrome on Windows")
+
+        mock_session_repo = AsyncMock()
+        mock_session_repo.count_active_sessions.side_effect = count_active_sessions
+
+        mock_user_repo = AsyncMock()
+        mock_user_repo.find_by_id.return_value = mock_user
+
+        mock_device_enricher = AsyncMock()
+        mock_device_enricher.enrich.side_effect = enrich_device
+
+        mock_location_enricher = AsyncMock()
+        mock_location_enricher.enrich.return_value = MockLocationResult(location=None)
+
+        handler = CreateSessionHandler(
+            session_repo=mock_session_repo,
+            session_cache=AsyncMock(),
+            user_repo=mock_user_repo,
+            device_enricher=mock_device_enricher,
+            location_enricher=mock_location_enricher,
+            event_bus=AsyncMock(),
+        )
+
+        command = CreateSession(
+            user_id=user_id,
+            ip_address="8.8.8.8",
+            user_agent="Chrome",
+        )
+
+        # Act
+        result = await handler.handle(command)
+
+        # Assert
+        assert isinstance(result, Success)
+        assert result.value.device_info == "Chrome on Windows"
+
 
 @pytest.mark.unit
 class TestCreateSessionHandlerEvents:
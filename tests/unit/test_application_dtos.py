@@ -324,10 +324,12 @@ class TestDTOModuleExports:
             "GlobalRotationResult",
             "UserRotationResult",
             "BalanceChange",
+            "AccountSyncTiming",
             "SyncAccountsResult",
             "SyncTransactionsResult",
             "SyncHoldingsResult",
             "ImportResult",
+            "RecordBalanceSnapshotsResult",
         }
 
         actual_exports = set(dtos.__all__)
@@ -29,6 +29,7 @@ class TestApplicationErrorCode:
             "CONFLICT",
             "RATE_LIMIT_EXCEEDED",
             "EXTERNAL_SERVICE_ERROR",
+            "SERVICE_UNAVAILABLE",
         }
 
         actual_codes = {code.name for code in ApplicationErrorCode}
@@ -184,7 +184,7 @@ class TestGenerateAuthTokensHandlerSuccess:
 
     @pytest.mark.asyncio
     async def test_generate_tokens_persists_refresh_token(self):
-        """Test handler persists refresh token hash to database."""
+        """Test handler persists refresh token hash and selector to database."""
         # Arrange
         user_id = uuid7()
         session_id = uuid7()
@@ -199,6 +199,7 @@ class TestGenerateAuthTokensHandlerSuccess:
             "hashed_token_value",
         )
         mock_refresh_token_service.calculate_expiration.return_value = expires_at
+        mock_refresh_token_service.get_selector.return_value = "opaque_selector"
 
         mock_refresh_token_repo = AsyncMock()
         mock_security_config_repo = _create_mock_security_config_repo()
@@ -228,7 +229,9 @@ class TestGenerateAuthTokensHandlerSuccess:
             expires_at=expires_at,
             token_version=1,
             global_version_at_issuance=1,
+            token_selector="opaque_selector",
         )
+        mock_refresh_token_service.get_selector.assert_called_once_with("opaque_token")
 
     @pytest.mark.asyncio
     async def test_generate_tokens_with_multiple_roles(self):
@@ -0,0 +1,304 @@
+"""Unit tests for ImportFromFileHandler transaction ingest.
+
+Tests the bulk import path used for file-based providers:
+- One FITID prefetch per account (no per-row lookups)
+- In-memory deduplication (stored FITIDs and repeats within the file)
+- New transactions inserted in fixed-size batches
+- Progress events throttled by record count and time
+- File import providers are parsed once via parse_file()
+
+Architecture:
+- Mock repositories, provider factory, and event bus
+- Real ProviderAccountData / ProviderTransactionData DTOs
+"""
+
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from uuid_extensions import uuid7
+
+from src.application.commands.handlers import import_from_file_handler
+from src.application.commands.handlers.import_from_file_handler import (
+    ImportFromFileHandler,
+)
+from src.application.commands.import_commands import ImportFromFile
+from src.core.result import Success
+from src.domain.events.data_events import FileImportProgress, FileImportSucceeded
+from src.domain.protocols.provider_protocol import (
+    ProviderAccountData,
+    ProviderFileData,
+    ProviderTransactionData,
+)
+
+
+# =============================================================================
+# Test Helpers
+# =============================================================================
+
+
+def create_provider_transactions(fit_ids: list[str]) -> list[ProviderTransactionData]:
+    """Create parsed QFX transactions with the given FITIDs."""
+    return [
+        ProviderTransactionData(
+            provider_transaction_id=fit_id,
+            transaction_type="withdrawal",
+            amount=Decimal("-12.34"),
+            currency="USD",
+            description=f"PURCHASE {fit_id}",
+            transaction_date=date(2024, 12, 1),
+            status="settled",
+        )
+        for fit_id in fit_ids
+    ]
+
+
+def create_account(provider_account_id: str = "123456789") -> ProviderAccountData:
+    """Create a parsed QFX checking account."""
+    return ProviderAccountData(
+        provider_account_id=provider_account_id,
+        account_number_masked=f"****{provider_account_id[-4:]}",
+        name="CHECKING",
+        account_type="checking",
+        balance=Decimal("100.00"),
+        currency="USD",
+    )
+
+
+def create_handler(
+    transactions: list[ProviderTransactionData],
+    existing_ids: set[str] | None = None,
+    provider: MagicMock | None = None,
+) -> tuple[ImportFromFileHandler, dict[str, Any]]:
+    """Create handler with mocked dependencies for a one-account file.
+
+    The default provider is not a registered file import provider, so the
+    handler uses fetch_accounts() and fetch_transactions().
+    """
+    if provider is None:
+        provider = MagicMock()
+        provider.fetch_accounts = AsyncMock(
+            return_value=Success(value=[create_account()])
+        )
+        provider.fetch_transactions = AsyncMock(
+            return_value=Success(value=transactions)
+        )
+    provider_factory = MagicMock()
+    provider_factory.get_provider.return_value = provider
+
+    provider_repo = AsyncMock()
+    provider_repo.find_by_slug.return_value = MagicMock(id=uuid7())
+    connection_repo = AsyncMock()
+    connection_repo.find_by_user_id.return_value = []
+    account_repo = AsyncMock()
+    account_repo.find_by_provider_account_id.return_value = None
+
+    transaction_repo = AsyncMock()
+    transaction_repo.find_provider_transaction_ids.return_value = set(
+        existing_ids or set()
+    )
+    transaction_repo.bulk_insert.side_effect = lambda batch: len(batch)
+
+    event_bus = AsyncMock()
+
+    handler = ImportFromFileHandler(
+        connection_repo=connection_repo,
+        account_repo=account_repo,
+        transaction_repo=transaction_repo,
+        provider_repo=provider_repo,
+        provider_factory=provider_factory,
+        event_bus=event_bus,
+    )
+    return handler, {
+        "transaction_repo": transaction_repo,
+        "event_bus": event_bus,
+        "provider": provider,
+    }
+
+
+def create_command() -> ImportFromFile:
+    """Create an ImportFromFile command."""
+    return ImportFromFile(
+        user_id=uuid7(),
+        provider_slug="chase_file",
+        file_content=b"<OFX>",
+        file_format="qfx",
+        file_name="Chase_Activity.QFX",
+    )
+
+
+def published(event_bus: AsyncMock, event_type: type) -> list[Any]:
+    """Return published events of the given type."""
+    return [
+        call.args[0]
+        for call in event_bus.publish.await_args_list
+        if isinstance(call.args[0], event_type)
+    ]
+
+
+# =============================================================================
+# Bulk Ingest Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestImportFromFileBulkIngest:
+    """Tests for prefetch, deduplication, and batched inserts."""
+
+    @pytest.mark.asyncio
+    async def test_prefetches_once_and_skips_known_and_repeated_fitids(self) -> None:
+        """Stored FITIDs and in-file repeats are skipped without lookups."""
+        transactions = create_provider_transactions(["A", "B", "C", "B", "D"])
+        handler, mocks = create_handler(transactions, existing_ids={"A"})
+
+        result = await handler.handle(create_command())
+
+        assert isinstance(result, Success)
+        assert result.value.transactions_created == 3
+        assert result.value.transactions_skipped == 2
+        repo = mocks["transaction_repo"]
+        repo.find_provider_transaction_ids.assert_awaited_once()
+        repo.find_by_provider_transaction_id.assert_not_awaited()
+        repo.save.assert_not_awaited()
+        inserted = repo.bulk_insert.await_args.args[0]
+        assert [t.provider_transaction_id for t in inserted] == ["B", "C", "D"]
+
+    @pytest.mark.asyncio
+    async def test_inserts_in_fixed_size_batches(self) -> None:
+        """New transactions are inserted in _TRANSACTION_BATCH_SIZE batches."""
+        fit_ids = [f"FIT{i}" for i in range(25)]
+        handler, mocks = create_handler(create_provider_transactions(fit_ids))
+
+        with patch.object(import_from_file_handler, "_TRANSACTION_BATCH_SIZE", 10):
+            result = await handler.handle(create_command())
+
+        assert isinstance(result, Success)
+        assert result.value.transactions_created == 25
+        batch_sizes = [
+            len(call.args[0])
+            for call in mocks["transaction_repo"].bulk_insert.await_args_list
+        ]
+        assert batch_sizes == [10, 10, 5]
+
+    @pytest.mark.asyncio
+    async def test_conflicting_rows_count_as_skipped(self) -> None:
+        """Rows inserted concurrently (ON CONFLICT skipped) count as skipped."""
+        handler, mocks = create_handler(create_provider_transactions(["A", "B"]))
+        mocks["transaction_repo"].bulk_insert.side_effect = lambda batch: 1
+
+        result = await handler.handle(create_command())
+
+        assert isinstance(result, Success)
+        assert result.value.transactions_created == 1
+        assert result.value.transactions_skipped == 1
+
+
+# =============================================================================
+# Progress Throttling Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestImportFromFileProgress:
+    """Tests for throttled FileImportProgress events."""
+
+    @pytest.mark.asyncio
+    async def test_progress_throttled_by_record_interval(self) -> None:
+        """One progress event per record interval, none for the final batch."""
+        fit_ids = [f"FIT{i}" for i in range(100)]
+        handler, mocks = create_handler(create_provider_transactions(fit_ids))
+
+        with (
+            patch.object(import_from_file_handler, "_TRANSACTION_BATCH_SIZE", 10),
+            patch.object(import_from_file_handler, "_PROGRESS_RECORD_INTERVAL", 30),
+            patch.object(
+                import_from_file_handler, "_PROGRESS_TIME_INTERVAL_SECONDS", 3600
+            ),
+        ):
+            await handler.handle(create_command())
+
+        progress = published(mocks["event_bus"], FileImportProgress)
+        assert [e.records_processed for e in progress] == [30, 60, 90]
+        assert [e.progress_percent for e in progress] == [30, 60, 90]
+        assert all(e.total_records == 100 for e in progress)
+        assert len(published(mocks["event_bus"], FileImportSucceeded)) == 1
+
+    @pytest.mark.asyncio
+    async def test_progress_emitted_after_time_interval(self) -> None:
+        """A slow batch triggers a progress event before the record interval."""
+        fit_ids = [f"FIT{i}" for i in range(30)]
+        handler, mocks = create_handler(create_provider_transactions(fit_ids))
+
+        with (
+            patch.object(import_from_file_handler, "_TRANSACTION_BATCH_SIZE", 10),
+            patch.object(
+                import_from_file_handler, "_PROGRESS_RECORD_INTERVAL", 1_000_000
+            ),
+            patch.object(
+                import_from_file_handler, "_PROGRESS_TIME_INTERVAL_SECONDS", 0
+            ),
+        ):
+            await handler.handle(create_command())
+
+        progress = published(mocks["event_bus"], FileImportProgress)
+        assert [e.records_processed for e in progress] == [10, 20]
+
+    @pytest.mark.asyncio
+    async def test_small_import_emits_no_progress_events(self) -> None:
+        """Imports that finish within one batch report only success."""
+        handler, mocks = create_handler(create_provider_transactions(["A", "B"]))
+
+        await handler.handle(create_command())
+
+        assert published(mocks["event_bus"], FileImportProgress) == []
+
+
+# =============================================================================
+# Single-Pass Parse Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestImportFromFileSinglePass:
+    """Tests for reading accounts and transactions from one parse."""
+
+    @pytest.mark.asyncio
+    async def test_file_provider_parsed_once(self) -> None:
+        """A file import provider is asked for the whole file exactly once."""
+        provider = MagicMock(slug="chase_file")
+        provider.parse_file = AsyncMock(
+            return_value=Success(
+                value=ProviderFileData(
+                    accounts=[create_account("111"), create_account("222")],
+                    transactions={
+                        "111": create_provider_transactions(["A", "B"]),
+                        "222": create_provider_transactions(["C"]),
+                    },
+                )
+            )
+        )
+        handler, mocks = create_handler([], provider=provider)
+
+        result = await handler.handle(create_command())
+
+        assert isinstance(result, Success)
+        assert result.value.accounts_created == 2
+        assert result.value.transactions_created == 3
+        provider.parse_file.assert_awaited_once()
+        provider.fetch_accounts.assert_not_called()
+        provider.fetch_transactions.assert_not_called()
+        assert mocks["transaction_repo"].find_provider_transaction_ids.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_other_providers_fetch_per_account(self) -> None:
+        """Providers without parse_file() use the fetch methods."""
+        handler, mocks = create_handler(create_provider_transactions(["A"]))
+
+        result = await handler.handle(create_command())
+
+        assert isinstance(result, Success)
+        assert result.value.transactions_created == 1
+        mocks["provider"].fetch_accounts.assert_awaited_once()
+        mocks["provider"].fetch_transactions.assert_awaited_once()
@@ -1,16 +1,17 @@
 """Unit tests for ListTransactions handlers.
 
-Tests the three transaction list query handlers covering:
-- ListTransactionsByAccountHandler: Basic list, type filter, pagination
+Tests the transaction list query handlers covering:
+- ListTransactionsByAccountHandler: Basic list, type filter, keyset/offset pagination
 - ListTransactionsByDateRangeHandler: Date range filtering, validation
 - ListSecurityTransactionsHandler: Symbol filtering, pagination
+- ListTransactionsForExportHandler: Streamed export, ownership
 
 Test Coverage:
 - Successful transaction list retrieval
 - Account not found (ownership chain)
 - Connection not found (ownership chain)
 - Ownership verification failures
-- Pagination (has_more flag)
+- Pagination (has_more flag, next_cursor round trip)
 - Optional filters (transaction_type, date_range, symbol)
 - Date range validation
 - Money value object conversion to amount+currency fields
@@ -25,6 +26,7 @@ Reference:
     - docs/architecture/transaction-domain-model.md
 """
 
+from collections.abc import AsyncIterator
 from datetime import UTC, date, datetime
 from decimal import Decimal
 from typing import cast
@@ -38,11 +40,15 @@ from src.application.queries.handlers.list_transactions_handler import (
     ListTransactionsByAccountHandler,
     ListTransactionsByDateRangeHandler,
     ListTransactionsError,
+    ListTransactionsForExportHandler,
+    decode_transaction_cursor,
+    encode_transaction_cursor,
 )
 from src.application.queries.transaction_queries import (
     ListSecurityTransactions,
     ListTransactionsByAccount,
     ListTransactionsByDateRange,
+    ListTransactionsForExport,
 )
 from src.core.result import Failure, Success
 from src.domain.entities.account import Account
@@ -55,6 +61,7 @@ from src.domain.enums.credential_type import CredentialType
 from src.domain.enums.transaction_status import TransactionStatus
 from src.domain.enums.transaction_subtype import TransactionSubtype
 from src.domain.enums.transaction_type import TransactionType
+from src.domain.protocols.transaction_repository import TransactionCursor
 from src.domain.value_objects.money import Money
 from src.domain.value_objects.provider_credentials import ProviderCredentials
 
@@ -167,6 +174,26 @@ def transfer_transaction(account_id: UUID) -> Transaction:
     )
 
 
+def make_transactions(account_id: UUID, count: int) -> list[Transaction]:
+    """Create transfer transactions on consecutive days, most recent first."""
+    return [
+        Transaction(
+            id=uuid7(),
+            account_id=account_id,
+            provider_transaction_id=f"TXN{i}",
+            transaction_type=TransactionType.TRANSFER,
+            subtype=TransactionSubtype.DEPOSIT,
+            status=TransactionStatus.SETTLED,
+            amount=Money(amount=Decimal("100.00"), currency="USD"),
+            description=f"Transaction {i}",
+            transaction_date=date(2025, 6, 30 - i),
+            created_at=datetime(2025, 6, 1, 10, 0, 0, tzinfo=UTC),
+            updated_at=datetime(2025, 6, 1, 10, 0, 0, tzinfo=UTC),
+        )
+        for i in range(count)
+    ]
+
+
 # ============================================================================
 # ListTransactionsByAccount Tests
 # ============================================================================
@@ -273,24 +300,9 @@ class TestListTransactionsByAccountHandler:
         account: Account,
         provider_connection: ProviderConnection,
     ) -> None:
-        """Should set has_more=True when result count equals limit."""
-        # Create exactly 10 transactions (limit)
-        transactions = [
-            Transaction(
-                id=uuid7(),
-                account_id=account_id,
-                provider_transaction_id=f"TXN{i}",
-                transaction_type=TransactionType.TRANSFER,
-                subtype=TransactionSubtype.DEPOSIT,
-                status=TransactionStatus.SETTLED,
-                amount=Money(amount=Decimal("100.00"), currency="USD"),
-                description=f"Transaction {i}",
-                transaction_date=date(2025, 6, 1),
-                created_at=datetime(2025, 6, 1, 10, 0, 0, tzinfo=UTC),
-                updated_at=datetime(2025, 6, 1, 10, 0, 0, tzinfo=UTC),
-            )
-            for i in range(10)
-        ]
+        """Should set has_more=True and next_cursor when a row beyond limit exists."""
+        # Repository returns limit + 1 rows (lookahead row)
+        transactions = make_transactions(account_id, 11)
 
         # Mock repositories
         transaction_repo = MockTransactionRepository(
@@ -317,7 +329,137 @@ class TestListTransactionsByAccountHandler:
         dto = result.value
 
         assert len(dto.transactions) == 10
-        assert dto.has_more is True  # More results may exist
+        assert dto.has_more is True
+        assert transaction_repo.page_calls == [{"limit": 11, "after": None}]
+        # Cursor points at the last returned row
+        assert dto.next_cursor is not None
+        assert decode_transaction_cursor(dto.next_cursor) == TransactionCursor(
+            transaction_date=transactions[9].transaction_date,
+            transaction_id=transactions[9].id,
+        )
+
+    @pytest.mark.asyncio
+    async def test_last_page_has_no_cursor(
+        self,
+        user_id: UUID,
+        account_id: UUID,
+        account: Account,
+        provider_connection: ProviderConnection,
+    ) -> None:
+        """Should return next_cursor=None when the page is not full."""
+        transaction_repo = MockTransactionRepository(
+            find_by_account_id_result=make_transactions(account_id, 10)
+        )
+        handler = ListTransactionsByAccountHandler(
+            transaction_repo=transaction_repo,  # type: ignore[arg-type]
+            account_repo=MockAccountRepository(find_by_id_result=account),  # type: ignore[arg-type]
+            connection_repo=MockProviderConnectionRepository(  # type: ignore[arg-type]
+                find_by_id_result=provider_connection
+            ),
+        )
+
+        result = await handler.handle(
+            ListTransactionsByAccount(account_id=account_id, user_id=user_id, limit=10)
+        )
+
+        assert isinstance(result, Success)
+        assert len(result.value.transactions) == 10
+        assert result.value.has_more is False
+        assert result.value.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_is_passed_to_repository(
+        self,
+        user_id: UUID,
+        account_id: UUID,
+        account: Account,
+        provider_connection: ProviderConnection,
+    ) -> None:
+        """Should decode the cursor into the keyset position (offset ignored)."""
+        transaction_repo = MockTransactionRepository()
+        handler = ListTransactionsByAccountHandler(
+            transaction_repo=transaction_repo,  # type: ignore[arg-type]
+            account_repo=MockAccountRepository(find_by_id_result=account),  # type: ignore[arg-type]
+            connection_repo=MockProviderConnectionRepository(  # type: ignore[arg-type]
+                find_by_id_result=provider_connection
+            ),
+        )
+        position = TransactionCursor(
+            transaction_date=date(2025, 3, 1), transaction_id=uuid7()
+        )
+        cursor = encode_transaction_cursor(position)
+
+        result = await handler.handle(
+            ListTransactionsByAccount(
+                account_id=account_id,
+                user_id=user_id,
+                limit=25,
+                offset=100,
+                cursor=cursor,
+            )
+        )
+
+        assert isinstance(result, Success)
+        assert transaction_repo.page_calls == [{"limit": 26, "after": position}]
+        assert transaction_repo.offset_calls == []
+
+    @pytest.mark.asyncio
+    async def test_returns_failure_when_cursor_invalid(
+        self,
+        user_id: UUID,
+        account_id: UUID,
+        account: Account,
+        provider_connection: ProviderConnection,
+    ) -> None:
+        """Should return Failure for a malformed cursor."""
+        handler = ListTransactionsByAccountHandler(
+            transaction_repo=MockTransactionRepository(),  # type: ignore[arg-type]
+            account_repo=MockAccountRepository(find_by_id_result=account),  # type: ignore[arg-type]
+            connection_repo=MockProviderConnectionRepository(  # type: ignore[arg-type]
+                find_by_id_result=provider_connection
+            ),
+        )
+
+        result = await handler.handle(
+            ListTransactionsByAccount(
+                account_id=account_id, user_id=user_id, cursor="not-a-cursor"
+            )
+        )
+
+        assert isinstance(result, Failure)
+        assert result.error == ListTransactionsError.INVALID_CURSOR
+
+    @pytest.mark.asyncio
+    async def test_offset_without_cursor_uses_offset_paging(
+        self,
+        user_id: UUID,
+        account_id: UUID,
+        account: Account,
+        provider_connection: ProviderConnection,
+    ) -> None:
+        """Should keep LIMIT/OFFSET paging for clients still sending offset."""
+        transaction_repo = MockTransactionRepository(
+            find_by_account_id_result=make_transactions(account_id, 10)
+        )
+        handler = ListTransactionsByAccountHandler(
+            transaction_repo=transaction_repo,  # type: ignore[arg-type]
+            account_repo=MockAccountRepository(find_by_id_result=account),  # type: ignore[arg-type]
+            connection_repo=MockProviderConnectionRepository(  # type: ignore[arg-type]
+                find_by_id_result=provider_connection
+            ),
+        )
+
+        result = await handler.handle(
+            ListTransactionsByAccount(
+                account_id=account_id, user_id=user_id, limit=10, offset=50
+            )
+        )
+
+        assert isinstance(result, Success)
+        assert result.value.has_more is True
+        assert result.value.next_cursor is None
+        assert transaction_repo.offset_calls == [{"limit": 10, "offset": 50}]
+        assert transaction_repo.page_calls == []
 
     @pytest.mark.asyncio
     async def test_returns_success_with_empty_list(
@@ -818,6 +960,160 @@ class TestListSecurityTransactionsHandler:
         assert result.error == ListTransactionsError.NOT_OWNED_BY_USER
 
 
+# ============================================================================
+# ListTransactionsForExport Tests
+# ============================================================================
+
+
+class TestListTransactionsForExportHandler:
+    """Test ListTransactionsForExport handler."""
+
+    @pytest.mark.asyncio
+    async def test_streams_all_transactions_as_dtos(
+        self,
+        user_id: UUID,
+        account_id: UUID,
+        account: Account,
+        provider_connection: ProviderConnection,
+    ) -> None:
+        """Should return a stream yielding every transaction in order."""
+        transactions = make_transactions(account_id, 5)
+        transaction_repo = MockTransactionRepository(
+            find_by_account_id_result=transactions
+        )
+        handler = ListTransactionsForExportHandler(
+            transaction_repo=transaction_repo,  # type: ignore[arg-type]
+            account_repo=MockAccountRepository(find_by_id_result=account),  # type: ignore[arg-type]
+            connection_repo=MockProviderConnectionRepository(  # type: ignore[arg-type]
+                find_by_id_result=provider_connection
+            ),
+        )
+
+        result = await handler.handle(
+            ListTransactionsForExport(account_id=account_id, user_id=user_id)
+        )
+
+        assert isinstance(result, Success)
+        # Nothing is read until the stream is consumed
+        assert transaction_repo.stream_calls == []
+        exported = [dto async for dto in result.value]
+        assert [dto.id for dto in exported] == [t.id for t in transactions]
+        assert exported[0].amount_value == Decimal("100.00")
+        assert transaction_repo.stream_calls == [None]
+
+    @pytest.mark.asyncio
+    async def test_type_filter_passed_to_repository(
+        self,
+        user_id: UUID,
+        account_id: UUID,
+        account: Account,
+        provider_connection: ProviderConnection,
+        trade_transaction: Transaction,
+    ) -> None:
+        """Should convert the type string to TransactionType for the stream."""
+        transaction_repo = MockTransactionRepository(
+            find_by_account_and_type_result=[trade_transaction]
+        )
+        handler = ListTransactionsForExportHandler(
+            transaction_repo=transaction_repo,  # type: ignore[arg-type]
+            account_repo=MockAccountRepository(find_by_id_result=account),  # type: ignore[arg-type]
+            connection_repo=MockProviderConnectionRepository(  # type: ignore[arg-type]
+                find_by_id_result=provider_connection
+            ),
+        )
+
+        result = await handler.handle(
+            ListTransactionsForExport(
+                account_id=account_id, user_id=user_id, transaction_type="trade"
+            )
+        )
+
+        assert isinstance(result, Success)
+        exported = [dto async for dto in result.value]
+        assert [dto.symbol for dto in exported] == ["AAPL"]
+        assert transaction_repo.stream_calls == [TransactionType.TRADE]
+
+    @pytest.mark.asyncio
+    async def test_returns_failure_when_type_invalid(
+        self,
+        user_id: UUID,
+        account_id: UUID,
+        account: Account,
+        provider_connection: ProviderConnection,
+    ) -> None:
+        """Should return Failure before streaming for an unknown type."""
+        handler = ListTransactionsForExportHandler(
+            transaction_repo=MockTransactionRepository(),  # type: ignore[arg-type]
+            account_repo=MockAccountRepository(find_by_id_result=account),  # type: ignore[arg-type]
+            connection_repo=MockProviderConnectionRepository(  # type: ignore[arg-type]
+                find_by_id_result=provider_connection
+            ),
+        )
+
+        result = await handler.handle(
+            ListTransactionsForExport(
+                account_id=account_id, user_id=user_id, transaction_type="bogus"
+            )
+        )
+
+        assert isinstance(result, Failure)
+        assert result.error == ListTransactionsError.INVALID_TRANSACTION_TYPE
+
+    @pytest.mark.asyncio
+    async def test_returns_failure_when_not_owned_by_user(
+        self,
+        user_id: UUID,
+        account_id: UUID,
+        account: Account,
+        provider_connection: ProviderConnection,
+    ) -> None:
+        """Should return Failure when account not owned by user."""
+        transaction_repo = MockTransactionRepository()
+        handler = ListTransactionsForExportHandler(
+            transaction_repo=transaction_repo,  # type: ignore[arg-type]
+            account_repo=MockAccountRepository(find_by_id_result=account),  # type: ignore[arg-type]
+            connection_repo=MockProviderConnectionRepository(  # type: ignore[arg-type]
+                find_by_id_result=provider_connection
+            ),
+        )
+
+        result = await handler.handle(
+            ListTransactionsForExport(account_id=account_id, user_id=uuid7())
+        )
+
+        assert isinstance(result, Failure)
+        assert result.error == ListTransactionsError.NOT_OWNED_BY_USER
+        assert transaction_repo.stream_calls == []
+
+
+# ============================================================================
+# Cursor Encoding Tests
+# ============================================================================
+
+
+class TestTransactionCursorEncoding:
+    """Test opaque keyset cursor encoding."""
+
+    def test_round_trip(self) -> None:
+        """Should decode exactly the position that was encoded."""
+        position = TransactionCursor(
+            transaction_date=date(2024, 12, 31), transaction_id=uuid7()
+        )
+
+        cursor = encode_transaction_cursor(position)
+
+        assert "=" not in cursor  # URL-safe without padding
+        assert decode_transaction_cursor(cursor) == position
+
+    @pytest.mark.parametrize(
+        "cursor",
+        ["", "not-a-cursor", "MjAyNC0xMi0zMQ", "bm90LWEtZGF0ZXxub3QtYS11dWlk"],
+    )
+    def test_malformed_cursor_returns_none(self, cursor: str) -> None:
+        """Should return None for anything not produced by the encoder."""
+        assert decode_transaction_cursor(cursor) is None
+
+
 # ============================================================================
 # Mock Repositories
 # ============================================================================
@@ -840,13 +1136,45 @@ class MockTransactionRepository:
         self._find_security_transactions_result = (
             find_security_transactions_result or []
         )
+        self.offset_calls: list[dict[str, object]] = []
+        self.page_calls: list[dict[str, object]] = []
+        self.stream_calls: list[TransactionType | None] = []
 
     async def find_by_account_id(
         self, account_id: UUID, limit: int = 50, offset: int = 0
     ) -> list[Transaction]:
         """Mock find_by_account_id."""
+        self.offset_calls.append({"limit": limit, "offset": offset})
         return self._find_by_account_id_result
 
+    async def find_page_by_account(
+        self,
+        account_id: UUID,
+        limit: int = 50,
+        after: TransactionCursor | None = None,
+        transaction_type: TransactionType | None = None,
+    ) -> list[Transaction]:
+        """Mock find_page_by_account (returns the configured rows up to limit)."""
+        self.page_calls.append({"limit": limit, "after": after})
+        if transaction_type is not None:
+            return self._find_by_account_and_type_result[:limit]
+        return self._find_by_account_id_result[:limit]
+
+    async def stream_by_account(
+        self,
+        account_id: UUID,
+        transaction_type: TransactionType | None = None,
+    ) -> AsyncIterator[Transaction]:
+        """Mock stream_by_account (yields the configured rows)."""
+        self.stream_calls.append(transaction_type)
+        rows = (
+            self._find_by_account_and_type_result
+            if transaction_type is not None
+            else self._find_by_account_id_result
+        )
+        for transaction in rows:
+            yield transaction
+
     async def find_by_account_and_type(
         self,
         account_id: UUID,
@@ -9,6 +9,7 @@ Tests cover:
 - Cache handling (get/set, fail-open behavior)
 - Error handling (non-critical, fail-open)
 - Logging at appropriate levels
+- Per-user coalescing of events within the recalculation window
 
 Test Strategy:
 - Mock protocols (LoggerProtocol, CacheProtocol, EventBusProtocol)
@@ -21,6 +22,7 @@ Reference:
     - GitHub Issue #257
 """
 
+import asyncio
 from decimal import Decimal
 from typing import cast
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -87,8 +89,7 @@ def mock_database():
 def mock_account_repo():
     """Create mock AccountRepository."""
     repo = MagicMock()
-    repo.sum_balances_for_user = AsyncMock(return_value=Decimal("10000.00"))
-    repo.count_for_user = AsyncMock(return_value=3)
+    repo.summarize_balances_for_user = AsyncMock(return_value=(Decimal("10000.00"), 3))
     return repo
 
 
@@ -198,8 +199,7 @@ class TestHandleBalanceUpdated:
             await handler.handle_balance_updated(event)
 
         # Verify repository was queried
-        mock_account_repo.sum_balances_for_user.assert_called_once_with(user_id)
-        mock_account_repo.count_for_user.assert_called_once_with(user_id)
+        mock_account_repo.summarize_balances_for_user.assert_called_once_with(user_id)
 
 
 # =============================================================================
@@ -259,7 +259,7 @@ class TestHandleHoldingsUpdated:
             await handler.handle_holdings_updated(event)
 
         # Verify repository was queried
-        mock_account_repo.sum_balances_for_user.assert_called_once_with(user_id)
+        mock_account_repo.summarize_balances_for_user.assert_called_once_with(user_id)
 
 
 # =============================================================================
@@ -283,10 +283,9 @@ class TestRecalculateNetworth:
     ):
         """Test event emitted when net worth changes from cached value."""
         # Setup: current net worth is 10000, cache returns previous as 8000
-        mock_account_repo.sum_balances_for_user = AsyncMock(
-            return_value=Decimal("10000.00")
+        mock_account_repo.summarize_balances_for_user = AsyncMock(
+            return_value=(Decimal("10000.00"), 3)
         )
-        mock_account_repo.count_for_user = AsyncMock(return_value=3)
         mock_cache.get = AsyncMock(return_value=Success(value="8000.00"))
 
         event = AccountBalanceUpdated(
@@ -326,8 +325,8 @@ class TestRecalculateNetworth:
     ):
         """Test no event emitted when net worth is unchanged."""
         # Setup: current net worth equals cached value
-        mock_account_repo.sum_balances_for_user = AsyncMock(
-            return_value=Decimal("10000.00")
+        mock_account_repo.summarize_balances_for_user = AsyncMock(
+            return_value=(Decimal("10000.00"), 3)
         )
         mock_cache.get = AsyncMock(return_value=Success(value="10000.00"))
 
@@ -361,10 +360,9 @@ class TestRecalculateNetworth:
     ):
         """Test event emitted when cache has no previous value (first calculation)."""
         # Setup: cache returns None (no previous value)
-        mock_account_repo.sum_balances_for_user = AsyncMock(
-            return_value=Decimal("10000.00")
+        mock_account_repo.summarize_balances_for_user = AsyncMock(
+            return_value=(Decimal("10000.00"), 2)
         )
-        mock_account_repo.count_for_user = AsyncMock(return_value=2)
         mock_cache.get = AsyncMock(return_value=Success(value=None))
 
         event = AccountBalanceUpdated(
@@ -393,10 +391,9 @@ class TestRecalculateNetworth:
         self, handler, mock_logger, mock_cache, user_id, account_id, mock_account_repo
     ):
         """Test INFO log when net worth changes."""
-        mock_account_repo.sum_balances_for_user = AsyncMock(
-            return_value=Decimal("15000.00")
+        mock_account_repo.summarize_balances_for_user = AsyncMock(
+            return_value=(Decimal("15000.00"), 4)
         )
-        mock_account_repo.count_for_user = AsyncMock(return_value=4)
         mock_cache.get = AsyncMock(return_value=Success(value="12000.00"))
 
         event = AccountBalanceUpdated(
@@ -428,8 +425,8 @@ class TestRecalculateNetworth:
         self, handler, mock_logger, mock_cache, user_id, account_id, mock_account_repo
     ):
         """Test DEBUG log when net worth is unchanged."""
-        mock_account_repo.sum_balances_for_user = AsyncMock(
-            return_value=Decimal("10000.00")
+        mock_account_repo.summarize_balances_for_user = AsyncMock(
+            return_value=(Decimal("10000.00"), 3)
         )
         mock_cache.get = AsyncMock(return_value=Success(value="10000.00"))
 
@@ -496,8 +493,8 @@ class TestCacheHandling:
         self, handler, mock_cache, user_id, account_id, mock_account_repo
     ):
         """Test cache is updated with current net worth value."""
-        mock_account_repo.sum_balances_for_user = AsyncMock(
-            return_value=Decimal("25000.50")
+        mock_account_repo.summarize_balances_for_user = AsyncMock(
+            return_value=(Decimal("25000.50"), 3)
         )
 
         event = AccountBalanceUpdated(
@@ -532,10 +529,9 @@ class TestCacheHandling:
         mock_account_repo,
     ):
         """Test handler continues with previous=0 when cache get fails."""
-        mock_account_repo.sum_balances_for_user = AsyncMock(
-            return_value=Decimal("5000.00")
+        mock_account_repo.summarize_balances_for_user = AsyncMock(
+            return_value=(Decimal("5000.00"), 1)
         )
-        mock_account_repo.count_for_user = AsyncMock(return_value=1)
         mock_cache.get = AsyncMock(return_value=Failure(error="Cache connection error"))
 
         event = AccountBalanceUpdated(
@@ -609,7 +605,7 @@ class TestErrorHandling:
     ):
         """Test error logged when repository query fails."""
         mock_failing_repo = MagicMock()
-        mock_failing_repo.sum_balances_for_user = AsyncMock(
+        mock_failing_repo.summarize_balances_for_user = AsyncMock(
             side_effect=Exception("Database connection failed")
         )
 
@@ -641,7 +637,7 @@ class TestErrorHandling:
     ):
         """Test exceptions don't propagate to caller."""
         mock_failing_repo = MagicMock()
-        mock_failing_repo.sum_balances_for_user = AsyncMock(
+        mock_failing_repo.summarize_balances_for_user = AsyncMock(
             side_effect=Exception("Unexpected error")
         )
 
@@ -665,6 +661,145 @@ class TestErrorHandling:
         mock_event_bus.publish.assert_not_called()
 
 
+# =============================================================================
+# Coalescing Tests
+# =============================================================================
+
+
+COALESCE_WINDOW = 0.05
+
+
+def balance_event(user_id: UUID) -> AccountBalanceUpdated:
+    """Create an AccountBalanceUpdated event for a user."""
+    return AccountBalanceUpdated(
+        user_id=user_id,
+        account_id=cast(UUID, uuid7()),
+        previous_balance=Decimal("0"),
+        new_balance=Decimal("100"),
+        delta=Decimal("100"),
+        currency="USD",
+    )
+
+
+@pytest.fixture
+def coalescing_handler(mock_database, mock_cache, mock_event_bus, mock_logger):
+    """Create PortfolioEventHandler with a short coalescing window."""
+    return PortfolioEventHandler(
+        database=mock_database,
+        cache=mock_cache,
+        event_bus=mock_event_bus,
+        logger=mock_logger,
+        coalesce_window_seconds=COALESCE_WINDOW,
+    )
+
+
+@pytest.mark.unit
+class TestNetWorthCoalescing:
+    """Test per-user coalescing of net worth recalculations."""
+
+    @pytest.mark.asyncio
+    async def test_events_within_window_trigger_one_recalculation(
+        self, coalescing_handler, mock_event_bus, user_id, mock_account_repo
+    ):
+        """Twelve account events from one sync collapse into one recalculation."""
+        with patch(
+            "src.infrastructure.persistence.repositories.AccountRepository",
+            return_value=mock_account_repo,
+        ):
+            for _ in range(12):
+                await coalescing_handler.handle_balance_updated(balance_event(user_id))
+
+            # Nothing runs until the window closes
+            mock_account_repo.summarize_balances_for_user.assert_not_called()
+            await asyncio.sleep(COALESCE_WINDOW * 3)
+
+        mock_account_repo.summarize_balances_for_user.assert_called_once_with(user_id)
+        mock_event_bus.publish.assert_called_once()
+        assert coalescing_handler.get_stats() == {
+            "events_received": 12,
+            "events_coalesced": 11,
+            "recalculations": 1,
+            "pending_users": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_users_are_coalesced_independently(
+        self, coalescing_handler, mock_account_repo
+    ):
+        """Each user gets its own recalculation."""
+        users = [cast(UUID, uuid7()) for _ in range(3)]
+
+        with patch(
+            "src.infrastructure.persistence.repositories.AccountRepository",
+            return_value=mock_account_repo,
+        ):
+            for user in users * 2:
+                await coalescing_handler.handle_balance_updated(balance_event(user))
+            await asyncio.sleep(COALESCE_WINDOW * 3)
+
+        recalculated = [
+            call.args[0]
+            for call in mock_account_repo.summarize_balances_for_user.call_args_list
+        ]
+        assert sorted(recalculated) == sorted(users)
+        assert coalescing_handler.get_stats()["events_coalesced"] == 3
+
+    @pytest.mark.asyncio
+    async def test_event_after_window_schedules_new_recalculation(
+        self, coalescing_handler, user_id, mock_account_repo
+    ):
+        """Events arriving after a recalculation started are not lost."""
+        with patch(
+            "src.infrastructure.persistence.repositories.AccountRepository",
+            return_value=mock_account_repo,
+        ):
+            await coalescing_handler.handle_balance_updated(balance_event(user_id))
+            await asyncio.sleep(COALESCE_WINDOW * 3)
+            await coalescing_handler.handle_balance_updated(balance_event(user_id))
+            await asyncio.sleep(COALESCE_WINDOW * 3)
+
+        assert mock_account_repo.summarize_balances_for_user.call_count == 2
+        assert coalescing_handler.get_stats()["recalculations"] == 2
+
+    @pytest.mark.asyncio
+    async def test_flush_runs_pending_recalculations_immediately(
+        self, coalescing_handler, user_id, mock_account_repo
+    ):
+        """flush() does not wait for the window to close."""
+        with patch(
+            "src.infrastructure.persistence.repositories.AccountRepository",
+            return_value=mock_account_repo,
+        ):
+            await coalescing_handler.handle_balance_updated(balance_event(user_id))
+            assert coalescing_handler.get_stats()["pending_users"] == 1
+
+            await coalescing_handler.flush()
+
+            mock_account_repo.summarize_balances_for_user.assert_called_once_with(
+                user_id
+            )
+            # Cancelled timer does not recalculate again
+            await asyncio.sleep(COALESCE_WINDOW * 3)
+
+        mock_account_repo.summarize_balances_for_user.assert_called_once()
+        assert coalescing_handler.get_stats()["pending_users"] == 0
+
+    @pytest.mark.asyncio
+    async def test_zero_window_recalculates_every_event(
+        self, handler, user_id, mock_account_repo
+    ):
+        """A window of 0 disables coalescing."""
+        with patch(
+            "src.infrastructure.persistence.repositories.AccountRepository",
+            return_value=mock_account_repo,
+        ):
+            for _ in range(3):
+                await handler.handle_balance_updated(balance_event(user_id))
+
+        assert mock_account_repo.summarize_balances_for_user.call_count == 3
+        assert handler.get_stats()["events_coalesced"] == 0
+
+
 # =============================================================================
 # Integration with Event Bus Tests
 # =============================================================================
@@ -685,10 +820,9 @@ class TestEventBusIntegration:
         mock_account_repo,
     ):
         """Test PortfolioNetWorthRecalculated event has all required fields."""
-        mock_account_repo.sum_balances_for_user = AsyncMock(
-            return_value=Decimal("50000.00")
+        mock_account_repo.summarize_balances_for_user = AsyncMock(
+            return_value=(Decimal("50000.00"), 5)
         )
-        mock_account_repo.count_for_user = AsyncMock(return_value=5)
         mock_cache.get = AsyncMock(return_value=Success(value="45000.00"))
 
         event = AccountBalanceUpdated(
@@ -730,10 +864,9 @@ class TestEventBusIntegration:
         mock_account_repo,
     ):
         """Test negative delta (net worth decrease) handled correctly."""
-        mock_account_repo.sum_balances_for_user = AsyncMock(
-            return_value=Decimal("8000.00")
+        mock_account_repo.summarize_balances_for_user = AsyncMock(
+            return_value=(Decimal("8000.00"), 2)
         )
-        mock_account_repo.count_for_user = AsyncMock(return_value=2)
         mock_cache.get = AsyncMock(return_value=Success(value="10000.00"))
 
         event = AccountBalanceUpdated(
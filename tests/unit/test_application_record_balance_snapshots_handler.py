@@ -0,0 +1,131 @@
+"""Unit tests for RecordBalanceSnapshotsHandler.
+
+Tests the scheduled balance snapshot capture command handler.
+
+Architecture:
+- Tests keyset paging over active accounts
+- Tests snapshot construction and bulk insert with dedupe
+- Uses mock repositories
+"""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from uuid_extensions import uuid7
+
+from src.application.commands.handlers.record_balance_snapshots_handler import (
+    RecordBalanceSnapshotsHandler,
+)
+from src.application.commands.sync_commands import RecordBalanceSnapshots
+from src.application.services.balance_snapshot_capture import SNAPSHOT_DEDUPE_WINDOW
+from src.core.result import Failure, Success
+from src.domain.entities.account import Account
+from src.domain.enums.snapshot_source import SnapshotSource
+from src.domain.value_objects.money import Money
+
+HANDLER_MODULE = "src.application.commands.handlers.record_balance_snapshots_handler"
+
+
+def create_mock_account(amount: str = "1000.00") -> MagicMock:
+    """Create a mock Account entity with a USD balance."""
+    mock = MagicMock(spec=Account)
+    mock.id = uuid7()
+    mock.balance = Money(amount=Decimal(amount), currency="USD")
+    mock.available_balance = None
+    mock.currency = "USD"
+    return mock
+
+
+@pytest.fixture
+def mock_account_repo():
+    """Create mock AccountRepository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_snapshot_repo():
+    """Create mock BalanceSnapshotRepository returning all rows inserted."""
+    repo = AsyncMock()
+    repo.bulk_insert.side_effect = lambda snapshots, **_: len(snapshots)
+    return repo
+
+
+@pytest.fixture
+def handler(mock_account_repo, mock_snapshot_repo):
+    """Create RecordBalanceSnapshotsHandler with mocks."""
+    return RecordBalanceSnapshotsHandler(
+        account_repo=mock_account_repo,
+        snapshot_repo=mock_snapshot_repo,
+    )
+
+
+@pytest.mark.unit
+class TestRecordBalanceSnapshotsHandler:
+    """Tests for RecordBalanceSnapshotsHandler."""
+
+    async def test_records_snapshot_per_active_account(
+        self, handler, mock_account_repo, mock_snapshot_repo
+    ):
+        """Handle() snapshots each account with the command source."""
+        accounts = [create_mock_account("100.00"), create_mock_account("250.00")]
+        mock_account_repo.find_active_page.return_value = accounts
+
+        result = await handler.handle(RecordBalanceSnapshots())
+
+        assert isinstance(result, Success)
+        assert result.value.accounts_scanned == 2
+        assert result.value.snapshots_captured == 2
+        snapshots = mock_snapshot_repo.bulk_insert.call_args.args[0]
+        assert [s.account_id for s in snapshots] == [a.id for a in accounts]
+        assert {s.source for s in snapshots} == {SnapshotSource.SCHEDULED_SYNC}
+        assert len({s.captured_at for s in snapshots}) == 1
+        assert (
+            mock_snapshot_repo.bulk_insert.call_args.kwargs["dedupe_window"]
+            == SNAPSHOT_DEDUPE_WINDOW
+        )
+
+    async def test_pages_with_keyset_cursor(
+        self, handler, mock_account_repo, mock_snapshot_repo
+    ):
+        """Handle() continues after the last id until a short page."""
+        first_page = [create_mock_account(), create_mock_account()]
+        second_page = [create_mock_account()]
+        mock_account_repo.find_active_page.side_effect = [first_page, second_page]
+
+        with patch(f"{HANDLER_MODULE}.BALANCE_SNAPSHOT_CAPTURE_PAGE_SIZE", 2):
+            result = await handler.handle(RecordBalanceSnapshots())
+
+        assert isinstance(result, Success)
+        assert result.value.accounts_scanned == 3
+        calls = mock_account_repo.find_active_page.call_args_list
+        assert calls[0].kwargs == {"after_id": None, "limit": 2}
+        assert calls[1].kwargs == {"after_id": first_page[-1].id, "limit": 2}
+        assert mock_snapshot_repo.bulk_insert.await_count == 2
+        # Each page is committed on its own
+        assert all(
+            call.kwargs["commit"] is True
+            for call in mock_snapshot_repo.bulk_insert.call_args_list
+        )
+
+    async def test_no_active_accounts_inserts_nothing(
+        self, handler, mock_account_repo, mock_snapshot_repo
+    ):
+        """Handle() succeeds with zero counts when there are no accounts."""
+        mock_account_repo.find_active_page.return_value = []
+
+        result = await handler.handle(RecordBalanceSnapshots())
+
+        assert isinstance(result, Success)
+        assert result.value.accounts_scanned == 0
+        assert result.value.snapshots_captured == 0
+        mock_snapshot_repo.bulk_insert.assert_not_awaited()
+
+    async def test_repository_error_returns_failure(self, handler, mock_account_repo):
+        """Handle() returns Failure when the database raises."""
+        mock_account_repo.find_active_page.side_effect = RuntimeError("db down")
+
+        result = await handler.handle(RecordBalanceSnapshots())
+
+        assert isinstance(result, Failure)
+        assert "db down" in result.error
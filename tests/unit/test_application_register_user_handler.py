@@ -49,8 +49,8 @@ class TestRegisterUserHandlerSuccess:
         mock_verification_repo = AsyncMock()
         mock_verification_repo.save = AsyncMock()
 
-        mock_password_service = Mock()
-        mock_password_service.hash_password.return_value = "hashed_password_123"
+        mock_password_service = AsyncMock()
+        mock_password_service.hash_password_async.return_value = "hashed_password_123"
 
         mock_event_bus = AsyncMock()
 
@@ -81,8 +81,8 @@ class TestRegisterUserHandlerSuccess:
         mock_user_repo.find_by_email.return_value = None
 
         mock_verification_repo = AsyncMock()
-        mock_password_service = Mock()
-        mock_password_service.hash_password.return_value = "hashed_value"
+        mock_password_service = AsyncMock()
+        mock_password_service.hash_password_async.return_value = "hashed_value"
         mock_event_bus = AsyncMock()
 
         handler = RegisterUserHandler(
@@ -101,7 +101,7 @@ class TestRegisterUserHandlerSuccess:
         await handler.handle(command)
 
         # Assert
-        mock_password_service.hash_password.assert_called_once_with(
+        mock_password_service.hash_password_async.assert_awaited_once_with(
             "MySecretPassword123!"
         )
 
@@ -113,8 +113,8 @@ class TestRegisterUserHandlerSuccess:
         mock_user_repo.find_by_email.return_value = None
 
         mock_verification_repo = AsyncMock()
-        mock_password_service = Mock()
-        mock_password_service.hash_password.return_value = "hashed"
+        mock_password_service = AsyncMock()
+        mock_password_service.hash_password_async.return_value = "hashed"
         mock_event_bus = AsyncMock()
 
         handler = RegisterUserHandler(
@@ -147,8 +147,8 @@ class TestRegisterUserHandlerSuccess:
         mock_user_repo.find_by_email.return_value = None
 
         mock_verification_repo = AsyncMock()
-        mock_password_service = Mock()
-        mock_password_service.hash_password.return_value = "hashed"
+        mock_password_service = AsyncMock()
+        mock_password_service.hash_password_async.return_value = "hashed"
         mock_event_bus = AsyncMock()
 
         handler = RegisterUserHandler(
@@ -192,7 +192,7 @@ class TestRegisterUserHandlerFailure:
         mock_user_repo.find_by_email.return_value = existing_user
 
         mock_verification_repo = AsyncMock()
-        mock_password_service = Mock()
+        mock_password_service = AsyncMock()
         mock_event_bus = AsyncMock()
 
         handler = RegisterUserHandler(
@@ -225,7 +225,7 @@ class TestRegisterUserHandlerFailure:
         mock_user_repo.find_by_email.return_value = existing_user
 
         mock_verification_repo = AsyncMock()
-        mock_password_service = Mock()
+        mock_password_service = AsyncMock()
         mock_event_bus = AsyncMock()
 
         handler = RegisterUserHandler(
@@ -260,8 +260,8 @@ class TestRegisterUserHandlerEvents:
         mock_user_repo.find_by_email.return_value = None
 
         mock_verification_repo = AsyncMock()
-        mock_password_service = Mock()
-        mock_password_service.hash_password.return_value = "hashed"
+        mock_password_service = AsyncMock()
+        mock_password_service.hash_password_async.return_value = "hashed"
         mock_event_bus = AsyncMock()
 
         handler = RegisterUserHandler(
@@ -293,8 +293,8 @@ class TestRegisterUserHandlerEvents:
         mock_user_repo.find_by_email.return_value = None
 
         mock_verification_repo = AsyncMock()
-        mock_password_service = Mock()
-        mock_password_service.hash_password.return_value = "hashed"
+        mock_password_service = AsyncMock()
+        mock_password_service.hash_password_async.return_value = "hashed"
         mock_event_bus = AsyncMock()
 
         handler = RegisterUserHandler(
@@ -331,7 +331,7 @@ class TestRegisterUserHandlerEvents:
         mock_user_repo.find_by_email.return_value = existing_user
 
         mock_verification_repo = AsyncMock()
-        mock_password_service = Mock()
+        mock_password_service = AsyncMock()
         mock_event_bus = AsyncMock()
 
         handler = RegisterUserHandler(
@@ -364,8 +364,8 @@ class TestRegisterUserHandlerEvents:
         mock_user_repo.find_by_email.return_value = None
 
         mock_verification_repo = AsyncMock()
-        mock_password_service = Mock()
-        mock_password_service.hash_password.return_value = "hashed"
+        mock_password_service = AsyncMock()
+        mock_password_service.hash_password_async.return_value = "hashed"
         mock_event_bus = AsyncMock()
 
         handler = RegisterUserHandler(
@@ -0,0 +1,266 @@
+"""Unit tests for SyncAccountsHandler balance snapshot capture.
+
+Tests that an account sync records balance history.
+
+Architecture:
+- Tests one bulk insert per sync with per-account snapshot sources
+- Tests that snapshot failures do not fail the sync
+- Uses mock repositories and provider adapter
+"""
+
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from uuid_extensions import uuid7
+
+from src.application.commands.handlers.sync_accounts_handler import (
+    SyncAccountsHandler,
+)
+from src.application.commands.sync_commands import SyncAccounts
+from src.core.result import Success
+from src.domain.entities.account import Account
+from src.domain.entities.provider_connection import ProviderConnection
+from src.domain.enums.account_type import AccountType
+from src.domain.enums.snapshot_source import SnapshotSource
+from src.domain.events.data_events import AccountSyncSucceeded
+from src.domain.protocols.provider_protocol import ProviderAccountData
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.provider_credentials import ProviderCredentials
+
+
+# =============================================================================
+# Mock Factories
+# =============================================================================
+
+
+def create_mock_connection(
+    id: UUID | None = None,
+    user_id: UUID | None = None,
+) -> MagicMock:
+    """Create a mock active ProviderConnection entity."""
+    mock = MagicMock(spec=ProviderConnection)
+    mock.id = id or uuid7()
+    mock.user_id = user_id or uuid7()
+    mock.provider_slug = "schwab"
+    mock.last_sync_at = None
+    mock.is_connected.return_value = True
+    creds = MagicMock(spec=ProviderCredentials)
+    creds.encrypted_data = b"encrypted_data"
+    mock.credentials = creds
+    return mock
+
+
+def create_account(
+    connection_id: UUID,
+    provider_account_id: str = "ACCT-EXISTING",
+    balance: Decimal = Decimal("1000.00"),
+) -> Account:
+    """Create an existing Account entity."""
+    return Account(
+        id=uuid7(),
+        connection_id=connection_id,
+        provider_account_id=provider_account_id,
+        account_number_masked="****1234",
+        name="Checking",
+        account_type=AccountType.CHECKING,
+        balance=Money(amount=balance, currency="USD"),
+        currency="USD",
+    )
+
+
+def create_provider_account_data(
+    provider_account_id: str,
+    balance: Decimal,
+) -> ProviderAccountData:
+    """Create ProviderAccountData for testing."""
+    return ProviderAccountData(
+        provider_account_id=provider_account_id,
+        account_number_masked="****1234",
+        name="Checking",
+        account_type="checking",
+        balance=balance,
+        currency="USD",
+    )
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def mock_account_repo():
+    """Create mock AccountRepository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_connection_repo():
+    """Create mock ProviderConnectionRepository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_snapshot_repo():
+    """Create mock BalanceSnapshotRepository."""
+    repo = AsyncMock()
+    repo.bulk_insert.return_value = 2
+    return repo
+
+
+@pytest.fixture
+def mock_encryption_service():
+    """Create mock EncryptionService returning credentials."""
+    service = MagicMock()
+    service.decrypt.return_value = Success(value={"access_token": "test_token"})
+    return service
+
+
+@pytest.fixture
+def mock_provider():
+    """Create mock ProviderProtocol."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_provider_factory(mock_provider):
+    """Create mock ProviderFactoryProtocol that returns mock_provider."""
+    factory = MagicMock()
+    factory.get_provider.return_value = mock_provider
+    return factory
+
+
+@pytest.fixture
+def mock_event_bus():
+    """Create mock EventBusProtocol."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def handler(
+    mock_account_repo,
+    mock_connection_repo,
+    mock_snapshot_repo,
+    mock_encryption_service,
+    mock_provider_factory,
+    mock_event_bus,
+    mock_logger,
+):
+    """Create SyncAccountsHandler with mocks."""
+    return SyncAccountsHandler(
+        connection_repo=mock_connection_repo,
+        account_repo=mock_account_repo,
+        snapshot_repo=mock_snapshot_repo,
+        encryption_service=mock_encryption_service,
+        provider_factory=mock_provider_factory,
+        event_bus=mock_event_bus,
+        logger=mock_logger,
+    )
+
+
+@pytest.fixture
+def user_id():
+    """Fixed user ID for tests."""
+    return uuid7()
+
+
+@pytest.fixture
+def connection(mock_connection_repo, user_id):
+    """Active connection returned by the connection repository."""
+    connection = create_mock_connection(user_id=user_id)
+    mock_connection_repo.find_by_id.return_value = connection
+    return connection
+
+
+@pytest.fixture
+def existing_account(mock_account_repo, mock_provider, connection):
+    """One stored account plus one new account returned by the provider."""
+    account = create_account(connection.id)
+
+    async def find_by_provider_account_id(
+        connection_id: UUID, provider_account_id: str
+    ) -> Any:
+        if provider_account_id == account.provider_account_id:
+            return account
+        return None
+
+    mock_account_repo.find_by_provider_account_id.side_effect = (
+        find_by_provider_account_id
+    )
+    mock_provider.fetch_accounts.return_value = Success(
+        value=[
+            create_provider_account_data("ACCT-EXISTING", Decimal("1250.00")),
+            create_provider_account_data("ACCT-NEW", Decimal("300.00")),
+        ]
+    )
+    return account
+
+
+# =============================================================================
+# Balance Snapshot Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestBalanceSnapshotCapture:
+    """Tests for balance snapshot capture in SyncAccountsHandler."""
+
+    async def test_records_one_snapshot_per_account_in_one_insert(
+        self,
+        handler,
+        mock_snapshot_repo,
+        connection,
+        existing_account,
+        user_id,
+    ):
+        """Handle() records every synced account with one deduplicated insert."""
+        command = SyncAccounts(
+            connection_id=connection.id, user_id=user_id, force=False
+        )
+        result = await handler.handle(command)
+
+        assert isinstance(result, Success)
+        assert result.value.snapshots_captured == 2
+        mock_snapshot_repo.bulk_insert.assert_awaited_once()
+        snapshots = mock_snapshot_repo.bulk_insert.call_args.args[0]
+        assert [s.source for s in snapshots] == [
+            SnapshotSource.ACCOUNT_SYNC,
+            SnapshotSource.INITIAL_CONNECTION,
+        ]
+        assert snapshots[0].account_id == existing_account.id
+        assert snapshots[0].balance.amount == Decimal("1250.00")
+        assert snapshots[1].balance.amount == Decimal("300.00")
+        assert len({s.captured_at for s in snapshots}) == 1
+        assert mock_snapshot_repo.bulk_insert.call_args.kwargs["dedupe_window"]
+
+    async def test_snapshot_failure_does_not_fail_sync(
+        self,
+        handler,
+        mock_snapshot_repo,
+        mock_connection_repo,
+        mock_event_bus,
+        mock_logger,
+        connection,
+        existing_account,
+        user_id,
+    ):
+        """A snapshot insert error is logged; the sync still succeeds."""
+        mock_snapshot_repo.bulk_insert.side_effect = RuntimeError("db down")
+
+        command = SyncAccounts(
+            connection_id=connection.id, user_id=user_id, force=False
+        )
+        result = await handler.handle(command)
+
+        assert isinstance(result, Success)
+        assert result.value.snapshots_captured == 0
+        assert mock_logger.error.call_args.args[0] == (
+            "balance_snapshot_capture_failed"
+        )
+        assert mock_logger.error.call_args.kwargs["snapshot_count"] == 2
+        mock_connection_repo.save.assert_awaited_with(connection)
+        published = [call.args[0] for call in mock_event_bus.publish.call_args_list]
+        assert any(isinstance(event, AccountSyncSucceeded) for event in published)
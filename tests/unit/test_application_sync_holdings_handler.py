@@ -28,7 +28,9 @@ from src.domain.entities.account import Account
 from src.domain.entities.holding import Holding
 from src.domain.entities.provider_connection import ProviderConnection
 from src.domain.enums.connection_status import ConnectionStatus
+from src.domain.events.data_events import HoldingsSyncSucceeded
 from src.domain.protocols.provider_protocol import ProviderHoldingData
+from src.domain.value_objects.money import Money
 from src.domain.value_objects.provider_credentials import ProviderCredentials
 
 
@@ -49,6 +51,9 @@ def create_mock_account(
     mock.connection_id = connection_id or uuid7()
     mock.provider_account_id = provider_account_id
     mock.last_synced_at = last_synced_at
+    mock.balance = Money(amount=Decimal("50000.00"), currency="USD")
+    mock.available_balance = None
+    mock.currency = "USD"
     return mock
 
 
@@ -145,6 +150,14 @@ def mock_holding_repo():
     return AsyncMock()
 
 
+@pytest.fixture
+def mock_snapshot_repo():
+    """Create mock BalanceSnapshotRepository."""
+    repo = AsyncMock()
+    repo.bulk_insert.return_value = 1
+    return repo
+
+
 @pytest.fixture
 def mock_encryption_service():
     """Create mock EncryptionService."""
@@ -176,18 +189,22 @@ def handler(
     mock_account_repo,
     mock_connection_repo,
     mock_holding_repo,
+    mock_snapshot_repo,
     mock_encryption_service,
     mock_provider_factory,
     mock_event_bus,
+    mock_logger,
 ):
     """Create SyncHoldingsHandler with mocks."""
     return SyncHoldingsHandler(
         account_repo=mock_account_repo,
         connection_repo=mock_connection_repo,
         holding_repo=mock_holding_repo,
+        snapshot_repo=mock_snapshot_repo,
         encryption_service=mock_encryption_service,
         provider_factory=mock_provider_factory,
         event_bus=mock_event_bus,
+        logger=mock_logger,
     )
 
 
@@ -687,6 +704,91 @@ class TestSyncLogic:
         account.mark_synced.assert_called_once()
         mock_account_repo.save.assert_called_with(account)
 
+    async def test_records_balance_snapshot_with_holdings_value(
+        self,
+        handler,
+        mock_account_repo,
+        mock_connection_repo,
+        mock_encryption_service,
+        mock_provider,
+        mock_holding_repo,
+        mock_snapshot_repo,
+        user_id,
+        account_id,
+    ):
+        """Handle() records one deduplicated snapshot with holdings value."""
+        connection_id = uuid7()
+
+        account = create_mock_account(id=account_id, connection_id=connection_id)
+        connection = create_mock_connection(id=connection_id, user_id=user_id)
+
+        mock_account_repo.find_by_id.return_value = account
+        mock_connection_repo.find_by_id.return_value = connection
+        mock_encryption_service.decrypt.return_value = Success(
+            value={"access_token": "test_token"}
+        )
+        mock_provider.fetch_holdings.return_value = Success(
+            value=[create_provider_holding_data(market_value=Decimal("17500.00"))]
+        )
+        mock_holding_repo.find_by_provider_holding_id.return_value = None
+        mock_holding_repo.list_by_account.return_value = []
+
+        command = SyncHoldings(account_id=account_id, user_id=user_id, force=False)
+        result = await handler.handle(command)
+
+        assert isinstance(result, Success)
+        assert result.value.snapshots_captured == 1
+        mock_snapshot_repo.bulk_insert.assert_awaited_once()
+        snapshots = mock_snapshot_repo.bulk_insert.call_args.args[0]
+        assert len(snapshots) == 1
+        assert snapshots[0].account_id == account_id
+        assert snapshots[0].holdings_value.amount == Decimal("17500.00")
+        assert snapshots[0].cash_value.amount == Decimal("32500.00")
+        assert mock_snapshot_repo.bulk_insert.call_args.kwargs["dedupe_window"]
+
+    async def test_snapshot_failure_does_not_fail_sync(
+        self,
+        handler,
+        mock_account_repo,
+        mock_connection_repo,
+        mock_encryption_service,
+        mock_provider,
+        mock_holding_repo,
+        mock_snapshot_repo,
+        mock_event_bus,
+        mock_logger,
+        user_id,
+        account_id,
+    ):
+        """A snapshot insert error is logged; the sync still succeeds."""
+        connection_id = uuid7()
+
+        account = create_mock_account(id=account_id, connection_id=connection_id)
+        connection = create_mock_connection(id=connection_id, user_id=user_id)
+
+        mock_account_repo.find_by_id.return_value = account
+        mock_connection_repo.find_by_id.return_value = connection
+        mock_encryption_service.decrypt.return_value = Success(
+            value={"access_token": "test_token"}
+        )
+        mock_provider.fetch_holdings.return_value = Success(
+            value=[create_provider_holding_data()]
+        )
+        mock_holding_repo.find_by_provider_holding_id.return_value = None
+        mock_holding_repo.list_by_account.return_value = []
+        mock_snapshot_repo.bulk_insert.side_effect = RuntimeError("db down")
+
+        command = SyncHoldings(account_id=account_id, user_id=user_id, force=False)
+        result = await handler.handle(command)
+
+        assert isinstance(result, Success)
+        assert result.value.snapshots_captured == 0
+        assert mock_logger.error.call_args.args[0] == (
+            "balance_snapshot_capture_failed"
+        )
+        published = [call.args[0] for call in mock_event_bus.publish.call_args_list]
+        assert any(isinstance(event, HoldingsSyncSucceeded) for event in published)
+
 
 # =============================================================================
 # Result Message Tests
@@ -0,0 +1,279 @@
+"""Unit tests for SyncTransactionsHandler multi-account sync.
+
+Tests the concurrent fetch / ordered persist flow:
+- Accounts are fetched concurrently, bounded by the provider's limit
+- Persistence runs in account order with one bulk insert
+- Rate-limited fetches wait for Retry-After and are retried
+- Per-account timing is reported in SyncTransactionsResult
+
+Architecture:
+- Mock repositories, encryption service, provider, and event bus
+- Real ProviderConcurrencyLimiter (in-process semaphores)
+"""
+
+import asyncio
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from uuid_extensions import uuid7
+
+from src.application.commands.handlers.sync_transactions_handler import (
+    SyncTransactionsHandler,
+)
+from src.application.commands.sync_commands import SyncTransactions
+from src.core.enums import ErrorCode
+from src.core.result import Failure, Success
+from src.domain.entities.account import Account
+from src.domain.entities.provider_connection import ProviderConnection
+from src.domain.errors import ProviderRateLimitError
+from src.domain.protocols.provider_protocol import ProviderTransactionData
+from src.domain.value_objects.provider_credentials import ProviderCredentials
+from src.infrastructure.providers.concurrency_limiter import (
+    ProviderConcurrencyLimiter,
+)
+
+
+# =============================================================================
+# Test Helpers
+# =============================================================================
+
+
+def create_mock_account(provider_account_id: str) -> MagicMock:
+    """Create a mock Account entity."""
+    mock = MagicMock(spec=Account)
+    mock.id = uuid7()
+    mock.provider_account_id = provider_account_id
+    return mock
+
+
+def create_transactions(provider_account_id: str, count: int = 2):
+    """Create provider transactions for an account."""
+    return [
+        ProviderTransactionData(
+            provider_transaction_id=f"{provider_account_id}-{i}",
+            transaction_type="DEPOSIT",
+            amount=Decimal("10.00"),
+            currency="USD",
+            description="Deposit",
+            transaction_date=date(2024, 12, 1),
+            status="SETTLED",
+        )
+        for i in range(count)
+    ]
+
+
+def rate_limited(retry_after: int | None) -> Failure[ProviderRateLimitError]:
+    """Create a 429 provider failure."""
+    return Failure(
+        error=ProviderRateLimitError(
+            code=ErrorCode.PROVIDER_RATE_LIMITED,
+            message="Rate limit exceeded",
+            provider_name="schwab",
+            retry_after=retry_after,
+        )
+    )
+
+
+class StubProvider:
+    """Provider stub recording concurrency and completion order."""
+
+    def __init__(self, delays: dict[str, float] | None = None) -> None:
+        self.delays = delays or {}
+        self.responses: dict[str, list[Any]] = {}
+        self.calls: list[str] = []
+        self.completed: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def fetch_transactions(
+        self,
+        credentials: dict[str, Any],
+        provider_account_id: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ):
+        self.calls.append(provider_account_id)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delays.get(provider_account_id, 0.01))
+        self.in_flight -= 1
+        self.completed.append(provider_account_id)
+        queued = self.responses.get(provider_account_id)
+        if queued:
+            return queued.pop(0)
+        return Success(value=create_transactions(provider_account_id))
+
+
+def create_handler(
+    accounts: list[MagicMock], provider: StubProvider
+) -> tuple[SyncTransactionsHandler, dict[str, Any]]:
+    """Create handler for a connection with the given accounts."""
+    connection = MagicMock(spec=ProviderConnection)
+    connection.id = uuid7()
+    connection.user_id = uuid7()
+    connection.provider_slug = "schwab"
+    connection.is_connected.return_value = True
+    connection.credentials = MagicMock(spec=ProviderCredentials)
+    connection.credentials.encrypted_data = b"encrypted"
+    for account in accounts:
+        account.connection_id = connection.id
+
+    connection_repo = AsyncMock()
+    connection_repo.find_by_id.return_value = connection
+    account_repo = AsyncMock()
+    account_repo.find_by_connection_id.return_value = accounts
+    transaction_repo = AsyncMock()
+    transaction_repo.find_provider_transaction_ids.return_value = set()
+    transaction_repo.bulk_insert.side_effect = lambda transactions: len(transactions)
+    encryption_service = MagicMock()
+    encryption_service.decrypt.return_value = Success(value={"access_token": "t"})
+    provider_factory = MagicMock()
+    provider_factory.get_provider.return_value = provider
+
+    handler = SyncTransactionsHandler(
+        connection_repo=connection_repo,
+        account_repo=account_repo,
+        transaction_repo=transaction_repo,
+        encryption_service=encryption_service,
+        provider_factory=provider_factory,
+        event_bus=AsyncMock(),
+        concurrency_limiter=ProviderConcurrencyLimiter(),
+    )
+    command = SyncTransactions(connection_id=connection.id, user_id=connection.user_id)
+    return handler, {
+        "command": command,
+        "account_repo": account_repo,
+        "transaction_repo": transaction_repo,
+    }
+
+
+# =============================================================================
+# Concurrent Fetch Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestSyncTransactionsConcurrentFetch:
+    """Tests for bounded concurrent per-account fetching."""
+
+    @pytest.mark.asyncio
+    async def test_accounts_fetched_concurrently_up_to_provider_limit(self):
+        """Twelve accounts run at most max_concurrent_requests (4) at once."""
+        accounts = [create_mock_account(f"ACCT-{i}") for i in range(12)]
+        provider = StubProvider()
+        handler, mocks = create_handler(accounts, provider)
+
+        result = await handler.handle(mocks["command"])
+
+        assert isinstance(result, Success)
+        assert result.value.accounts_synced == 12
+        assert result.value.created == 24
+        assert provider.peak == 4
+
+    @pytest.mark.asyncio
+    async def test_persistence_follows_account_order(self):
+        """Rows are persisted in account order, not fetch completion order."""
+        accounts = [create_mock_account(f"ACCT-{i}") for i in range(3)]
+        provider = StubProvider(delays={"ACCT-0": 0.06, "ACCT-1": 0.03, "ACCT-2": 0.0})
+        handler, mocks = create_handler(accounts, provider)
+
+        await handler.handle(mocks["command"])
+
+        assert provider.completed == ["ACCT-2", "ACCT-1", "ACCT-0"]
+        repo = mocks["transaction_repo"]
+        prefetched = [
+            call.kwargs["account_id"]
+            for call in repo.find_provider_transaction_ids.await_args_list
+        ]
+        assert prefetched == [account.id for account in accounts]
+        repo.bulk_insert.assert_awaited_once()
+        inserted = repo.bulk_insert.await_args.args[0]
+        assert [t.provider_transaction_id for t in inserted] == [
+            "ACCT-0-0",
+            "ACCT-0-1",
+            "ACCT-1-0",
+            "ACCT-1-1",
+            "ACCT-2-0",
+            "ACCT-2-1",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_account_timings_reported_in_account_order(self):
+        """Each account gets a timing entry with attempts and fetched count."""
+        accounts = [create_mock_account(f"ACCT-{i}") for i in range(2)]
+        provider = StubProvider(delays={"ACCT-0": 0.03, "ACCT-1": 0.0})
+        handler, mocks = create_handler(accounts, provider)
+
+        result = await handler.handle(mocks["command"])
+
+        assert isinstance(result, Success)
+        timings = result.value.account_timings
+        assert [t.account_id for t in timings] == [a.id for a in accounts]
+        assert [t.fetched for t in timings] == [2, 2]
+        assert [t.attempts for t in timings] == [1, 1]
+        assert timings[0].duration_ms >= 30
+        assert all(t.error is None for t in timings)
+
+    @pytest.mark.asyncio
+    async def test_failed_insert_leaves_accounts_unsynced(self):
+        """A rolled-back batch does not mark any account as synced."""
+        accounts = [create_mock_account(f"ACCT-{i}") for i in range(2)]
+        handler, mocks = create_handler(accounts, StubProvider())
+        mocks["transaction_repo"].bulk_insert.side_effect = RuntimeError("db down")
+
+        result = await handler.handle(mocks["command"])
+
+        assert isinstance(result, Success)
+        assert result.value.accounts_synced == 0
+        assert result.value.created == 0
+        assert result.value.errors == 4
+        for account in accounts:
+            account.mark_synced.assert_not_called()
+        mocks["account_repo"].save.assert_not_awaited()
+
+
+# =============================================================================
+# Rate Limit Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestSyncTransactionsRateLimit:
+    """Tests for Retry-After handling during concurrent fetches."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_fetch_retried_after_retry_after(self):
+        """A 429 pauses the provider, then the account is fetched again."""
+        accounts = [create_mock_account("ACCT-0"), create_mock_account("ACCT-1")]
+        provider = StubProvider()
+        provider.responses["ACCT-0"] = [rate_limited(retry_after=0)]
+        handler, mocks = create_handler(accounts, provider)
+
+        result = await handler.handle(mocks["command"])
+
+        assert isinstance(result, Success)
+        assert result.value.errors == 0
+        assert result.value.accounts_synced == 2
+        assert provider.calls.count("ACCT-0") == 2
+        assert result.value.account_timings[0].attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_after_beyond_limit_fails_account_only(self):
+        """A Retry-After longer than the sync can wait fails just that account."""
+        accounts = [create_mock_account("ACCT-0"), create_mock_account("ACCT-1")]
+        provider = StubProvider()
+        provider.responses["ACCT-0"] = [rate_limited(retry_after=3600)]
+        handler, mocks = create_handler(accounts, provider)
+
+        result = await handler.handle(mocks["command"])
+
+        assert isinstance(result, Success)
+        assert result.value.errors == 1
+        assert result.value.accounts_synced == 1
+        assert provider.calls.count("ACCT-0") == 1
+        timing = result.value.account_timings[0]
+        assert timing.error == "Rate limit exceeded"
+        assert timing.fetched == 0
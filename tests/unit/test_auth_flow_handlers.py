@@ -270,6 +270,42 @@ class TestRefreshAccessTokenHandlerEdgeCases:
         assert isinstance(result, Failure)
         assert result.error == RefreshError.TOKEN_EXPIRED
 
+    @pytest.mark.asyncio
+    async def test_refresh_looks_up_token_by_selector(self):
+        """Test refresh passes the token's selector to the indexed lookup."""
+        # Arrange
+        mock_refresh_token_repo = AsyncMock()
+        mock_refresh_token_repo.find_by_token_verification.return_value = None
+
+        mock_refresh_token_service = Mock()
+        mock_refresh_token_service.get_selector.return_value = "selector_value"
+
+        handler = RefreshAccessTokenHandler(
+            user_repo=AsyncMock(),
+            refresh_token_repo=mock_refresh_token_repo,
+            security_config_repo=AsyncMock(),
+            token_service=Mock(),
+            refresh_token_service=mock_refresh_token_service,
+            event_bus=AsyncMock(),
+        )
+
+        command = RefreshAccessToken(refresh_token="selector_value_and_verifier")
+
+        # Act
+        result = await handler.handle(command)
+
+        # Assert
+        assert isinstance(result, Failure)
+        assert result.error == RefreshError.TOKEN_INVALID
+        mock_refresh_token_service.get_selector.assert_called_once_with(
+            "selector_value_and_verifier"
+        )
+        mock_refresh_token_repo.find_by_token_verification.assert_awaited_once_with(
+            "selector_value_and_verifier",
+            mock_refresh_token_service.verify_token_async,
+            selector="selector_value",
+        )
+
     @pytest.mark.asyncio
     async def test_refresh_fails_when_token_revoked(self):
         """Test refresh fails with TOKEN_REVOKED when token is revoked."""
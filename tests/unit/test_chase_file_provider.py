@@ -11,6 +11,7 @@ import pytest
 
 from src.core.result import Failure, Success
 from src.infrastructure.providers.chase import ChaseFileProvider
+from src.infrastructure.providers.file_parse_cache import FileParseCache
 
 
 # =============================================================================
@@ -369,7 +370,9 @@ class TestProviderCaching:
         )
 
         # Cache should have one entry
-        assert len(provider._parsed_cache) == 1
+        stats = provider._parse_cache.get_stats()
+        assert stats.entries == 1
+        assert stats.hits == 1
 
     @pytest.mark.asyncio
     async def test_clear_cache_empties_cache(
@@ -379,10 +382,10 @@ class TestProviderCaching:
     ):
         """clear_cache removes all cached data."""
         await provider.fetch_accounts(checking_credentials)
-        assert len(provider._parsed_cache) == 1
+        assert len(provider._parse_cache) == 1
 
         provider.clear_cache()
-        assert len(provider._parsed_cache) == 0
+        assert len(provider._parse_cache) == 0
 
     @pytest.mark.asyncio
     async def test_different_files_cached_separately(
@@ -395,7 +398,109 @@ class TestProviderCaching:
         await provider.fetch_accounts(checking_credentials)
         await provider.fetch_accounts(savings_credentials)
 
-        assert len(provider._parsed_cache) == 2
+        assert len(provider._parse_cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_cache_reused_across_instances(
+        self,
+        checking_credentials: dict[str, bytes | str],
+    ):
+        """Providers sharing a cache parse an uploaded file only once."""
+        cache = FileParseCache(max_bytes=1024 * 1024, max_entries=4)
+
+        await ChaseFileProvider(parse_cache=cache).parse_file(checking_credentials)
+        result = await ChaseFileProvider(parse_cache=cache).parse_file(
+            checking_credentials
+        )
+
+        assert isinstance(result, Success)
+        stats = cache.get_stats()
+        assert stats.entries == 1
+        assert stats.misses == 1
+        assert stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_file_over_budget_not_cached(
+        self,
+        checking_credentials: dict[str, bytes | str],
+    ):
+        """Files larger than the byte budget are parsed but not kept."""
+        cache = FileParseCache(max_bytes=16, max_entries=4)
+        provider = ChaseFileProvider(parse_cache=cache)
+
+        result = await provider.fetch_accounts(checking_credentials)
+
+        assert isinstance(result, Success)
+        assert len(cache) == 0
+
+
+# =============================================================================
+# Single-Pass Parse Tests
+# =============================================================================
+
+
+class TestParseFile:
+    """Tests for parse_file (accounts and transactions in one call)."""
+
+    @pytest.mark.asyncio
+    async def test_returns_accounts_and_transactions(
+        self,
+        provider: ChaseFileProvider,
+        checking_credentials: dict[str, bytes | str],
+    ):
+        """parse_file matches fetch_accounts plus fetch_transactions."""
+        result = await provider.parse_file(checking_credentials)
+        accounts = await provider.fetch_accounts(checking_credentials)
+        transactions = await provider.fetch_transactions(
+            checking_credentials, provider_account_id="123456789"
+        )
+
+        assert isinstance(result, Success)
+        assert isinstance(accounts, Success)
+        assert isinstance(transactions, Success)
+        assert result.value.accounts == accounts.value
+        assert result.value.transactions == {"123456789": transactions.value}
+
+    @pytest.mark.asyncio
+    async def test_multi_account_file(
+        self,
+        provider: ChaseFileProvider,
+        checking_credentials: dict[str, bytes | str],
+        savings_credentials: dict[str, bytes | str],
+    ):
+        """Every statement in a multi-account file is returned."""
+        savings = savings_credentials["file_content"]
+        assert isinstance(savings, bytes)
+        statement = savings[
+            savings.index(b"<STMTTRNRS>") : savings.index(b"</STMTTRNRS>") + 12
+        ]
+        checking = checking_credentials["file_content"]
+        assert isinstance(checking, bytes)
+        credentials = {
+            **checking_credentials,
+            "file_content": checking.replace(
+                b"</BANKMSGSRSV1>", statement + b"\n</BANKMSGSRSV1>"
+            ),
+        }
+
+        result = await provider.parse_file(credentials)
+
+        assert isinstance(result, Success)
+        assert [a.provider_account_id for a in result.value.accounts] == [
+            "123456789",
+            "987654321",
+        ]
+        assert len(result.value.transactions["123456789"]) == 7
+        assert len(result.value.transactions["987654321"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_file_fails(self, provider: ChaseFileProvider):
+        """Unparseable content returns Failure."""
+        result = await provider.parse_file(
+            {"file_content": b"not a qfx file", "file_format": "qfx"}
+        )
+
+        assert isinstance(result, Failure)
 
 
 # =============================================================================
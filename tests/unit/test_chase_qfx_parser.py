@@ -175,6 +175,161 @@ class TestQfxParserSuccess:
         assert rent_txn.amount == Decimal("-1500.00")
 
 
+# =============================================================================
+# Transaction List Scanner Tests
+# =============================================================================
+
+
+def build_qfx(transactions: bytes, charset: bytes = b"1252") -> bytes:
+    """Wrap raw STMTTRN entries in a minimal Chase checking statement."""
+    return (
+        b"OFXHEADER:100\nDATA:OFXSGML\nVERSION:102\nENCODING:USASCII\n"
+        b"CHARSET:" + charset + b"\n\n<OFX>\n<BANKMSGSRSV1>\n<STMTTRNRS>\n"
+        b"<STMTRS>\n<CURDEF>USD\n<BANKACCTFROM>\n<BANKID>021000021\n"
+        b"<ACCTID>123456789\n<ACCTTYPE>CHECKING\n</BANKACCTFROM>\n"
+        b"<BANKTRANLIST>\n<DTSTART>20241101\n<DTEND>20241215\n"
+        + transactions
+        + b"</BANKTRANLIST>\n<LEDGERBAL>\n<BALAMT>100.00\n<DTASOF>20241215\n"
+        b"</LEDGERBAL>\n</STMTRS>\n</STMTTRNRS>\n</BANKMSGSRSV1>\n</OFX>"
+    )
+
+
+class TestQfxTransactionScanner:
+    """Tests for the streaming STMTTRN scanner (ofxparse field rules)."""
+
+    def test_timezone_offset_shifts_posted_date_to_utc(self, parser: QfxParser):
+        """DTPOSTED [offset:TZ] suffix is applied like ofxparse."""
+        content = build_qfx(
+            b"<STMTTRN>\n<TRNTYPE>debit\n<DTPOSTED>20241210230000.000[-5:EST]\n"
+            b"<TRNAMT>-1.00\n<FITID>TZ1\n<NAME>LATE NIGHT\n</STMTTRN>\n"
+        )
+
+        result = parser.parse(content)
+
+        assert isinstance(result, Success)
+        txn = result.value.transactions[0]
+        assert txn.date_posted == date(2024, 12, 11)
+        assert txn.transaction_type == "DEBIT"
+
+    def test_amount_formats_entities_and_charset(self, parser: QfxParser):
+        """Locale amounts, "null", HTML entities and cp1252 text are decoded."""
+        content = build_qfx(
+            b"<STMTTRN>\n<TRNTYPE>DEBIT\n<DTPOSTED>20241210\n<TRNAMT>1.025,53\n"
+            b"<FITID>A1\n<NAME>AT&amp;T BILL\n<MEMO>\n</STMTTRN>\n"
+            b"<STMTTRN>\n<TRNTYPE>CREDIT\n<DTPOSTED>20241210\n<TRNAMT>null\n"
+            b"<FITID>A2\n<NAME>CAF\xe9\n</STMTTRN>\n"
+        )
+
+        result = parser.parse(content)
+
+        assert isinstance(result, Success)
+        first, second = result.value.transactions
+        assert first.amount == Decimal("1025.53")
+        assert first.name == "AT&T BILL"
+        assert first.memo is None
+        assert second.amount == Decimal("0")
+        assert second.name == "CAF\u00e9"
+
+    def test_invalid_entry_is_skipped_not_fatal(self, parser: QfxParser):
+        """An entry missing a required field is dropped; the rest import."""
+        content = build_qfx(
+            b"<STMTTRN>\n<TRNTYPE>CREDIT\n<DTPOSTED>20241210\n<FITID>BAD\n"
+            b"</STMTTRN>\n"
+            b"<STMTTRN>\n<TRNTYPE>CREDIT\n<DTPOSTED>20241210\n<TRNAMT>5.00\n"
+            b"<FITID>GOOD\n</STMTTRN>\n"
+        )
+
+        result = parser.parse(content)
+
+        assert isinstance(result, Success)
+        assert [t.fit_id for t in result.value.transactions] == ["GOOD"]
+
+    def test_large_transaction_list_preserves_order(self, parser: QfxParser):
+        """Thousands of entries are scanned in file order."""
+        entries = b"".join(
+            b"<STMTTRN>\n<TRNTYPE>DEBIT\n<DTPOSTED>20241210\n<TRNAMT>-1.00\n"
+            b"<FITID>F%d\n<NAME>SHOP\n</STMTTRN>\n" % i
+            for i in range(5000)
+        )
+
+        result = parser.parse(build_qfx(entries))
+
+        assert isinstance(result, Success)
+        fit_ids = [t.fit_id for t in result.value.transactions]
+        assert fit_ids == [f"F{i}" for i in range(5000)]
+        assert result.value.balance is not None
+        assert result.value.balance.ledger_balance == Decimal("100.00")
+
+
+def build_statement(tag: bytes, account_id: bytes, transactions: bytes) -> bytes:
+    """Build one bank (STMTRS) or credit card (CCSTMTRS) statement."""
+    account_from = (
+        b"<BANKACCTFROM>\n<BANKID>021000021\n<ACCTID>"
+        + account_id
+        + b"\n<ACCTTYPE>CHECKING\n</BANKACCTFROM>\n"
+        if tag == b"STMTRS"
+        else b"<CCACCTFROM>\n<ACCTID>" + account_id + b"\n</CCACCTFROM>\n"
+    )
+    return (
+        b"<"
+        + tag
+        + b">\n<CURDEF>USD\n"
+        + account_from
+        + b"<BANKTRANLIST>\n<DTSTART>20241101\n<DTEND>20241215\n"
+        + transactions
+        + b"</BANKTRANLIST>\n<LEDGERBAL>\n<BALAMT>100.00\n<DTASOF>20241215\n"
+        b"</LEDGERBAL>\n</" + tag + b">\n"
+    )
+
+
+def build_entries(prefix: bytes, count: int) -> bytes:
+    """Build ``count`` STMTTRN entries with FITIDs <prefix><n>."""
+    return b"".join(
+        b"<STMTTRN>\n<TRNTYPE>DEBIT\n<DTPOSTED>20241210\n<TRNAMT>-1.00\n"
+        b"<FITID>" + prefix + b"%d\n<NAME>SHOP\n</STMTTRN>\n" % i
+        for i in range(count)
+    )
+
+
+class TestQfxParserMultipleAccounts:
+    """Tests for parse_statement (every account in one pass)."""
+
+    def test_each_statement_gets_its_own_transactions(self, parser: QfxParser):
+        """Transactions stay with their statement; bank before credit card."""
+        content = (
+            b"OFXHEADER:100\nDATA:OFXSGML\nVERSION:102\nENCODING:USASCII\n"
+            b"CHARSET:1252\n\n<OFX>\n<CREDITCARDMSGSRSV1>\n<CCSTMTTRNRS>\n"
+            + build_statement(b"CCSTMTRS", b"4000111122223333", build_entries(b"C", 2))
+            + b"</CCSTMTTRNRS>\n</CREDITCARDMSGSRSV1>\n<BANKMSGSRSV1>\n"
+            b"<STMTTRNRS>\n"
+            + build_statement(b"STMTRS", b"111", build_entries(b"A", 3))
+            + b"</STMTTRNRS>\n<STMTTRNRS>\n"
+            + build_statement(b"STMTRS", b"222", b"")
+            + b"</STMTTRNRS>\n</BANKMSGSRSV1>\n</OFX>"
+        )
+
+        result = parser.parse_statement(content)
+
+        assert isinstance(result, Success)
+        accounts = result.value.accounts
+        assert [a.account_id for a in accounts] == ["111", "222", "4000111122223333"]
+        assert [t.fit_id for t in accounts[0].transactions] == ["A0", "A1", "A2"]
+        assert accounts[1].transactions == []
+        assert [t.fit_id for t in accounts[2].transactions] == ["C0", "C1"]
+        assert all(a.balance is not None for a in accounts)
+
+    def test_parse_returns_first_account(self, parser: QfxParser):
+        """parse() keeps returning the first account of the file."""
+        content = build_qfx(build_entries(b"F", 2))
+
+        statement = parser.parse_statement(content)
+        first = parser.parse(content)
+
+        assert isinstance(statement, Success)
+        assert isinstance(first, Success)
+        assert statement.value.accounts == [first.value]
+
+
 # =============================================================================
 # Parse Failure Tests
 # =============================================================================
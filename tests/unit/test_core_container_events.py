@@ -16,7 +16,8 @@ Reference:
 
 import pytest
 
-from src.core.container.events import get_event_bus
+from src.core.container.events import get_event_bus, get_portfolio_event_handler
+from src.domain.events.portfolio_events import AccountBalanceUpdated
 from src.domain.events.registry import EVENT_REGISTRY
 
 
@@ -140,6 +141,21 @@ class TestEventRegistryCompleteness:
         # AccountHoldingsUpdated -> handle_holdings_updated
         expected_portfolio = 2
 
+        # Count manual QueryCacheEventHandler subscriptions (one per event type)
+        from src.application.event_handlers.query_cache_event_handler import (
+            QUERY_CACHE_INVALIDATION_EVENTS,
+        )
+
+        expected_query_cache = len(QUERY_CACHE_INVALIDATION_EVENTS)
+
+        # Count manual CacheInvalidationEventHandler subscriptions
+        # (user + global token rotation, plus provider connection changes)
+        from src.application.event_handlers.cache_invalidation_event_handler import (
+            PROVIDER_CONNECTION_CHANGE_EVENTS,
+        )
+
+        expected_local_cache = 2 + len(PROVIDER_CONNECTION_CHANGE_EVENTS)
+
         expected_subscriptions = (
             expected_logging
             + expected_audit
@@ -147,6 +163,8 @@ class TestEventRegistryCompleteness:
             + expected_session
             + expected_sse
             + expected_portfolio
+            + expected_query_cache
+            + expected_local_cache
         )
 
         # Count actual subscriptions (sum of all handlers across all events)
@@ -164,6 +182,8 @@ class TestEventRegistryCompleteness:
             f"  - Session: {expected_session}\n"
             f"  - SSE: {expected_sse}\n"
             f"  - Portfolio: {expected_portfolio}\n"
+            f"  - Query cache: {expected_query_cache}\n"
+            f"  - Local cache: {expected_local_cache}\n"
             f"Actual: {actual_subscriptions} subscriptions\n\n"
             f"If actual < expected: Container wiring bug (missing subscriptions)\n"
             f"If actual > expected: Update EVENT_REGISTRY, SSE_EVENT_REGISTRY, or manual handler counts"
@@ -246,3 +266,14 @@ class TestEventRegistryCompleteness:
                 f"Has: {handler_types}. "
                 f"Required: LoggingEventHandler + AuditEventHandler"
             )
+
+    def test_portfolio_handler_is_the_subscribed_instance(self, event_bus) -> None:
+        """get_portfolio_event_handler() returns the handler wired to the bus.
+
+        The lifespan flushes this instance at shutdown, so it must be the one
+        receiving AccountBalanceUpdated events.
+        """
+        handler = get_portfolio_event_handler()
+
+        subscribed = [h.__self__ for h in event_bus._handlers[AccountBalanceUpdated]]
+        assert handler in subscribed
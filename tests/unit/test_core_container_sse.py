@@ -2,6 +2,7 @@
 
 Tests cover:
 - get_sse_publisher() singleton behavior
+- get_sse_hub() singleton behavior
 - get_sse_subscriber() factory behavior
 - Container wiring with mocked Redis
 
@@ -14,7 +15,11 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.core.container.sse import get_sse_publisher, get_sse_subscriber
+from src.core.container.sse import (
+    get_sse_hub,
+    get_sse_publisher,
+    get_sse_subscriber,
+)
 
 
 # =============================================================================
@@ -86,6 +91,49 @@ class TestGetSSEPublisher:
         get_sse_publisher.cache_clear()
 
 
+# =============================================================================
+# Hub Factory Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestGetSSEHub:
+    """Test get_sse_hub() factory."""
+
+    def test_hub_is_singleton(self):
+        """Test get_sse_hub returns same instance (one per process)."""
+        get_sse_hub.cache_clear()
+
+        with patch("src.core.config.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock(redis_url="redis://localhost:6379")
+
+            hub1 = get_sse_hub()
+            hub2 = get_sse_hub()
+
+            assert hub1 is hub2
+
+        get_sse_hub.cache_clear()
+
+    def test_subscribers_share_hub(self):
+        """Test each subscriber is new but all share the hub's connection."""
+        get_sse_hub.cache_clear()
+
+        with patch("src.core.config.get_settings") as mock_settings:
+            mock_settings.return_value = MagicMock(
+                redis_url="redis://localhost:6379",
+                sse_enable_retention=False,
+            )
+
+            subscriber1 = get_sse_subscriber()
+            subscriber2 = get_sse_subscriber()
+
+            assert subscriber1 is not subscriber2
+            assert subscriber1._hub is subscriber2._hub is get_sse_hub()
+            assert subscriber1._redis is get_sse_hub().redis_client
+
+        get_sse_hub.cache_clear()
+
+
 # =============================================================================
 # Subscriber Factory Tests
 # =============================================================================
@@ -23,8 +23,10 @@ from src.core.container.handler_factory import (
     create_handler,
     get_all_handler_factories,
     get_supported_dependencies,
+    get_query_cache_ttl,
     get_type_name,
     handler_factory,
+    wrap_query_handler,
 )
 
 
@@ -441,6 +443,76 @@ class TestHandlerFactory:
         assert len(_handler_factory_cache) == 0
 
 
+# =============================================================================
+# Test Query Result Caching (CachePolicy enforcement)
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestQueryCaching:
+    """Tests for registry-driven query handler caching."""
+
+    def test_cache_policy_ttl_mapping(self) -> None:
+        """Each CachePolicy maps to its configured TTL; NONE disables caching."""
+        from src.application.cqrs.metadata import CachePolicy
+        from src.core.config import settings
+
+        assert get_query_cache_ttl(CachePolicy.NONE) is None
+        assert get_query_cache_ttl(CachePolicy.SHORT) == settings.cache_query_short_ttl
+        assert (
+            get_query_cache_ttl(CachePolicy.MEDIUM) == settings.cache_query_medium_ttl
+        )
+        assert get_query_cache_ttl(CachePolicy.LONG) == settings.cache_query_long_ttl
+        assert (
+            get_query_cache_ttl(CachePolicy.AGGRESSIVE)
+            == settings.cache_query_aggressive_ttl
+        )
+
+    def test_wraps_cached_query_handler(self) -> None:
+        """Query with a cache policy is wrapped in CachedQueryHandler."""
+        from src.application.cqrs.query_cache import CachedQueryHandler
+        from src.application.queries.handlers.get_account_handler import (
+            GetAccountHandler,
+        )
+
+        handler = MagicMock()
+        with (
+            patch("src.core.container.infrastructure.get_query_result_cache"),
+            patch("src.core.container.infrastructure.get_cache_metrics"),
+        ):
+            wrapped = wrap_query_handler(GetAccountHandler, handler)
+
+        assert isinstance(wrapped, CachedQueryHandler)
+        assert wrapped.wrapped is handler
+
+    def test_command_handler_not_wrapped(self) -> None:
+        """Command handlers are never cached."""
+        from src.application.commands.handlers.register_user_handler import (
+            RegisterUserHandler,
+        )
+
+        handler = MagicMock()
+
+        assert wrap_query_handler(RegisterUserHandler, handler) is handler
+
+    def test_unregistered_handler_not_wrapped(self) -> None:
+        """Handlers outside the registry are returned unchanged."""
+        handler = SimpleHandler()
+
+        assert wrap_query_handler(SimpleHandler, handler) is handler
+
+    def test_disabled_setting_skips_wrapping(self) -> None:
+        """CACHE_QUERY_ENABLED=false returns handlers unchanged."""
+        from src.application.queries.handlers.get_account_handler import (
+            GetAccountHandler,
+        )
+        from src.core.config import settings
+
+        handler = MagicMock()
+        with patch.object(settings, "cache_query_enabled", False):
+            assert wrap_query_handler(GetAccountHandler, handler) is handler
+
+
 # =============================================================================
 # Test get_all_handler_factories
 # =============================================================================
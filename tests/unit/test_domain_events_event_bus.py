@@ -9,6 +9,7 @@ Tests cover:
 - Async handler support
 - Concurrent handler execution
 - Error logging for handler failures
+- Per-task publish context (session/metadata) under concurrent publishes
 
 Architecture:
 - Unit tests with mocked logger
@@ -17,17 +18,20 @@ Architecture:
 """
 
 import asyncio
-from unittest.mock import MagicMock
+import random
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid_extensions import uuid7
 from typing import Any
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.events.auth_events import (
     UserRegistrationSucceeded,
     UserPasswordChangeSucceeded,
 )
 from src.domain.events.base_event import DomainEvent
+from src.infrastructure.events.handlers.audit_event_handler import AuditEventHandler
 from src.infrastructure.events.in_memory_event_bus import InMemoryEventBus
 
 
@@ -489,3 +493,127 @@ class TestInMemoryEventBusEdgeCases:
         # Act - Subscribe and publish; return value is None (not used)
         event_bus.subscribe(UserRegistrationSucceeded, handler_with_return)
         await event_bus.publish(event)
+
+
+@pytest.mark.unit
+class TestInMemoryEventBusPublishContext:
+    """Test session/metadata are scoped to each publish (contextvars)."""
+
+    @pytest.mark.asyncio
+    async def test_context_visible_to_handlers_and_cleared_after(self):
+        """Handlers see the publish's session/metadata; nothing leaks after."""
+        event_bus = InMemoryEventBus(logger=MagicMock())
+        session = MagicMock()
+        seen_sessions: list[AsyncSession | None] = []
+        seen_metadata: list[dict[str, str]] = []
+
+        async def handler(event: DomainEvent) -> None:
+            await asyncio.sleep(0)
+            seen_sessions.append(event_bus.get_session())
+            seen_metadata.append(event_bus.get_metadata())
+
+        event_bus.subscribe(UserRegistrationSucceeded, handler)
+        await event_bus.publish(
+            UserRegistrationSucceeded(
+                user_id=uuid7(), email="a@example.com", verification_token="t"
+            ),
+            session=session,
+            metadata={"ip_address": "203.0.113.1"},
+        )
+
+        assert seen_sessions == [session]
+        assert seen_metadata == [{"ip_address": "203.0.113.1"}]
+        assert event_bus.get_session() is None
+        assert event_bus.get_metadata() == {}
+
+    @pytest.mark.asyncio
+    async def test_nested_publish_restores_outer_context(self):
+        """A handler publishing another event keeps its own context afterwards."""
+        event_bus = InMemoryEventBus(logger=MagicMock())
+        outer_session, inner_session = MagicMock(), MagicMock()
+        seen = []
+
+        async def inner_handler(event: DomainEvent) -> None:
+            seen.append(("inner", event_bus.get_session()))
+
+        async def outer_handler(event: DomainEvent) -> None:
+            await event_bus.publish(
+                UserPasswordChangeSucceeded(user_id=uuid7(), initiated_by="user"),
+                session=inner_session,
+            )
+            seen.append(("outer", event_bus.get_session()))
+
+        event_bus.subscribe(UserRegistrationSucceeded, outer_handler)
+        event_bus.subscribe(UserPasswordChangeSucceeded, inner_handler)
+        await event_bus.publish(
+            UserRegistrationSucceeded(
+                user_id=uuid7(), email="a@example.com", verification_token="t"
+            ),
+            session=outer_session,
+        )
+
+        assert seen == [("inner", inner_session), ("outer", outer_session)]
+
+    @pytest.mark.asyncio
+    async def test_interleaved_publishes_audit_with_own_session_and_metadata(self):
+        """Hundreds of overlapping publishes: every audit row gets its own context.
+
+        Each publish carries a distinct session and client IP. Audit handlers
+        yield at random points, so publishes interleave on the event loop.
+        """
+        event_bus = InMemoryEventBus(logger=MagicMock())
+        audit_handler = AuditEventHandler(database=MagicMock(), event_bus=event_bus)
+        rows = []
+
+        class RecordingAuditAdapter:
+            def __init__(self, session):
+                self._session = session
+
+            async def record(self, **kwargs):
+                await asyncio.sleep(random.random() / 1000)
+                rows.append((self._session, kwargs))
+
+        async def jitter(event: DomainEvent) -> None:
+            await asyncio.sleep(random.random() / 1000)
+
+        async def audit(event: DomainEvent) -> None:
+            assert isinstance(event, UserRegistrationSucceeded)
+            await audit_handler.handle_user_registration_succeeded(event)
+
+        event_bus.subscribe(UserRegistrationSucceeded, jitter)
+        event_bus.subscribe(UserRegistrationSucceeded, audit)
+
+        publishes = []
+        for index in range(500):
+            event = UserRegistrationSucceeded(
+                user_id=uuid7(),
+                email=f"user{index}@example.com",
+                verification_token="t",
+            )
+            session = AsyncMock(name=f"session-{index}")
+            metadata = {
+                "ip_address": f"10.0.{index // 256}.{index % 256}",
+                "user_agent": f"agent-{index}",
+            }
+            publishes.append((event, session, metadata))
+
+        with patch(
+            "src.infrastructure.audit.postgres_adapter.PostgresAuditAdapter",
+            RecordingAuditAdapter,
+        ):
+            await asyncio.gather(
+                *(
+                    event_bus.publish(event, session=session, metadata=metadata)
+                    for event, session, metadata in publishes
+                )
+            )
+
+        assert len(rows) == len(publishes)
+        expected = {
+            event.user_id: (session, metadata) for event, session, metadata in publishes
+        }
+        for session, kwargs in rows:
+            expected_session, expected_metadata = expected[kwargs["user_id"]]
+            assert session is expected_session
+            assert kwargs["ip_address"] == expected_metadata["ip_address"]
+            assert kwargs["user_agent"] == expected_metadata["user_agent"]
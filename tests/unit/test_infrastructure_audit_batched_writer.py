@@ -0,0 +1,269 @@
+"""Unit tests for BatchedAuditWriter.
+
+Tests cover:
+- Inline writes when no flusher is running
+- Queued records written in batches (interval and full batch)
+- Durable records persisted before record() returns
+- Retry, drop after max attempts, and durable failure results
+- Backpressure on a full queue (bounded while the database is down) and
+  drain on shutdown
+
+Architecture:
+- Unit tests with a fake Database (records INSERT batches, injects failures)
+- NO real database dependencies
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import cast
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+from uuid_extensions import uuid7
+
+from src.core.constants import AUDIT_WRITE_MAX_ATTEMPTS
+from src.core.result import Failure, Success
+from src.domain.enums import AuditAction
+from src.infrastructure.audit.batched_writer import BatchedAuditWriter
+from src.infrastructure.persistence.database import Database
+
+
+class FakeSession:
+    """Session that hands INSERT rows to its database."""
+
+    def __init__(self, database: "FakeDatabase") -> None:
+        self._database = database
+
+    async def execute(self, statement, rows):
+        await asyncio.sleep(0)
+        if self._database.failures:
+            self._database.failures -= 1
+            raise SQLAlchemyError("connection lost")
+        self._database.batches.append([row["action"] for row in rows])
+
+
+class FakeDatabase:
+    """Database double recording one list of actions per INSERT."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.batches: list[list[str]] = []
+        self.failures = failures
+
+    @asynccontextmanager
+    async def get_session(self):
+        yield FakeSession(self)
+
+    @property
+    def written(self) -> list[str]:
+        return [action for batch in self.batches for action in batch]
+
+
+def create_writer(database: FakeDatabase, **kwargs) -> BatchedAuditWriter:
+    """Create a writer with a long interval (flushes only when triggered)."""
+    kwargs.setdefault("flush_interval_seconds", 60)
+    kwargs.setdefault("logger", MagicMock())
+    return BatchedAuditWriter(database=cast(Database, database), **kwargs)
+
+
+async def record_login(writer: BatchedAuditWriter, **kwargs):
+    """Record a (non-durable) login success."""
+    return await writer.record(
+        action=AuditAction.USER_LOGIN_SUCCESS,
+        resource_type="session",
+        user_id=uuid7(),
+        **kwargs,
+    )
+
+
+@pytest.mark.unit
+class TestBatchedAuditWriter:
+    """Tests for batching and durability guarantees."""
+
+    @pytest.mark.asyncio
+    async def test_writes_inline_without_running_flusher(self):
+        """Not started: every record is written before returning."""
+        database = FakeDatabase()
+        writer = create_writer(database)
+
+        result = await record_login(writer)
+
+        assert isinstance(result, Success)
+        assert database.batches == [["user_login_success"]]
+        assert writer.get_stats().written_records == 1
+        assert writer.get_stats().durable_records == 0
+
+    @pytest.mark.asyncio
+    async def test_queued_records_written_in_one_batch(self):
+        """Non-durable records return immediately and share one INSERT."""
+        database = FakeDatabase()
+        writer = create_writer(database, flush_interval_seconds=0.01)
+        writer.start()
+
+        for _ in range(5):
+            assert isinstance(await record_login(writer), Success)
+        assert database.batches == []
+
+        await asyncio.sleep(0.05)
+        await writer.aclose()
+
+        assert database.batches == [["user_login_success"] * 5]
+        assert writer.get_stats().batches == 1
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_before_interval(self):
+        """Reaching batch_size wakes the flusher immediately."""
+        database = FakeDatabase()
+        writer = create_writer(database, batch_size=3)
+        writer.start()
+
+        for _ in range(3):
+            await record_login(writer)
+        await asyncio.sleep(0.01)
+
+        assert database.batches == [["user_login_success"] * 3]
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_durable_action_persisted_before_return(self):
+        """Compliance-critical actions wait for the batch containing them."""
+        database = FakeDatabase()
+        writer = create_writer(database)
+        writer.start()
+        await record_login(writer)
+
+        result = await writer.record(
+            action=AuditAction.USER_PASSWORD_CHANGED,
+            resource_type="user",
+            user_id=uuid7(),
+        )
+
+        assert isinstance(result, Success)
+        # Queued record ahead of it was group-committed in the same INSERT
+        assert database.batches == [["user_login_success", "user_password_changed"]]
+        assert writer.get_stats().durable_records == 1
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_durable_flag_overrides_action_default(self):
+        """durable=True forces a synchronous write for any action."""
+        database = FakeDatabase()
+        writer = create_writer(database)
+        writer.start()
+
+        await record_login(writer, durable=True)
+
+        assert database.written == ["user_login_success"]
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried(self):
+        """A transient failure keeps queued records for the next flush."""
+        database = FakeDatabase(failures=1)
+        writer = create_writer(database)
+        writer.start()
+        await record_login(writer)
+
+        await writer.flush()
+        assert database.written == []
+        await writer.flush()
+
+        assert database.written == ["user_login_success"]
+        stats = writer.get_stats()
+        assert stats.failed_batches == 1
+        assert stats.dropped_records == 0
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_record_dropped_and_logged_after_max_attempts(self):
+        """Records are dropped (with an error log) only after repeated failures."""
+        database = FakeDatabase(failures=AUDIT_WRITE_MAX_ATTEMPTS)
+        logger = MagicMock()
+        writer = create_writer(database, logger=logger)
+        writer.start()
+        await record_login(writer)
+
+        for _ in range(AUDIT_WRITE_MAX_ATTEMPTS):
+            await writer.flush()
+
+        assert writer.get_stats().dropped_records == 1
+        assert writer.get_stats().queued_records == 0
+        logger.error.assert_called_once()
+        assert logger.error.call_args[0][0] == "audit_record_dropped"
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_durable_failure_returned_to_caller(self):
+        """A failed durable write returns Failure (not retried silently)."""
+        database = FakeDatabase(failures=1)
+        writer = create_writer(database)
+        writer.start()
+
+        result = await writer.record(
+            action=AuditAction.ROLE_ASSIGNED,
+            resource_type="user",
+            user_id=uuid7(),
+        )
+
+        assert isinstance(result, Failure)
+        assert writer.get_stats().queued_records == 0
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_applies_backpressure(self):
+        """A full queue is flushed before accepting more (no records lost)."""
+        database = FakeDatabase()
+        writer = create_writer(database, max_queue_size=2)
+        writer.start()
+
+        for _ in range(3):
+            await record_login(writer)
+
+        assert len(database.written) == 2
+        assert writer.get_stats().queued_records == 1
+        await writer.aclose()
+        assert len(database.written) == 3
+
+    @pytest.mark.asyncio
+    async def test_full_queue_bounded_while_database_down(self):
+        """A failed backpressure flush does not grow the queue past its bound."""
+        database = FakeDatabase(failures=2)
+        writer = create_writer(database, max_queue_size=2)
+        writer.start()
+        for _ in range(2):
+            await record_login(writer)
+
+        result = await record_login(writer)
+
+        assert isinstance(result, Failure)
+        assert writer.get_stats().queued_records == 2
+        await writer.aclose()
+        assert len(database.written) == 2
+
+    @pytest.mark.asyncio
+    async def test_aclose_drains_queue(self):
+        """Shutdown writes every queued record; later records go inline."""
+        database = FakeDatabase()
+        writer = create_writer(database, batch_size=2)
+        writer.start()
+        for _ in range(3):
+            await record_login(writer)
+
+        await writer.aclose()
+        assert len(database.written) == 3
+        assert writer.running is False
+
+        await record_login(writer)
+        assert len(database.written) == 4
+
+    @pytest.mark.asyncio
+    async def test_batching_disabled_writes_inline(self):
+        """AUDIT_BATCH_ENABLED=false: start() is a no-op, writes are inline."""
+        database = FakeDatabase()
+        writer = create_writer(database, batching_enabled=False)
+        writer.start()
+
+        await record_login(writer)
+
+        assert writer.running is False
+        assert database.batches == [["user_login_success"]]
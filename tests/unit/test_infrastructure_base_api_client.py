@@ -353,6 +353,35 @@ class TestExecuteRequest:
         assert isinstance(result.error, ProviderUnavailableError)
         assert result.error.is_transient is True
 
+    @pytest.mark.asyncio
+    async def test_uses_shared_http_client_when_injected(self) -> None:
+        """Should send through the injected pooled client without creating one."""
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 200
+        shared_client = AsyncMock(spec=httpx.AsyncClient)
+        shared_client.request.return_value = mock_response
+
+        client = BaseProviderAPIClient(
+            base_url="https://api.test.com",
+            provider_name="test_provider",
+            http_client=shared_client,
+        )
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            result = await client._execute_request(
+                method="GET",
+                path="/accounts",
+                headers={},
+                operation="test_op",
+            )
+
+        assert isinstance(result, Success)
+        mock_client_class.assert_not_called()
+        shared_client.request.assert_awaited_once()
+        assert shared_client.request.call_args.kwargs["timeout"] == (
+            PROVIDER_TIMEOUT_DEFAULT
+        )
+
 
 class TestExecuteAndParseObject:
     """Tests for _execute_and_parse_object method."""
@@ -25,7 +25,10 @@ from uuid import UUID
 
 import pytest
 
+from src.core.enums import ErrorCode
+from src.core.result import Failure
 from src.domain.enums.audit_action import AuditAction
+from src.domain.errors.audit_error import AuditError
 from src.domain.events.auth_events import (
     UserPasswordChangeAttempted,
     UserPasswordChangeFailed,
@@ -579,6 +582,106 @@ class TestAuditEventHandler:
             assert call_kwargs["user_id"] == sample_user_id
             assert call_kwargs["context"]["reason"] == "invalid_grant"
 
+    @pytest.mark.asyncio
+    async def test_no_session_uses_batched_audit_writer(
+        self, mock_database, sample_user_id
+    ):
+        """Test events published without a session go to the audit writer."""
+        # Arrange
+        event_bus = MagicMock()
+        event_bus.get_session = MagicMock(return_value=None)
+        event_bus.get_metadata = MagicMock(
+            return_value={"ip_address": "203.0.113.9", "user_agent": "Mozilla/5.0"}
+        )
+        audit_writer = AsyncMock()
+        handler = AuditEventHandler(
+            database=mock_database, event_bus=event_bus, audit_writer=audit_writer
+        )
+        event = UserPasswordChangeSucceeded(user_id=sample_user_id, initiated_by="user")
+
+        # Act
+        await handler.handle_user_password_change_succeeded(event)
+
+        # Assert - Metadata merged, writer decides durability by action
+        audit_writer.record.assert_awaited_once()
+        call_kwargs = audit_writer.record.call_args[1]
+        assert call_kwargs["action"] == AuditAction.USER_PASSWORD_CHANGED
+        assert call_kwargs["ip_address"] == "203.0.113.9"
+        assert call_kwargs["user_agent"] == "Mozilla/5.0"
+
+    @pytest.mark.asyncio
+    async def test_failed_audit_write_is_logged(
+        self, mock_database, mock_logger, sample_user_id
+    ):
+        """Test a Failure from the audit writer is logged at error level."""
+        # Arrange
+        event_bus = MagicMock()
+        event_bus.get_session = MagicMock(return_value=None)
+        event_bus.get_metadata = MagicMock(return_value={})
+        audit_writer = AsyncMock()
+        audit_writer.record.return_value = Failure(
+            error=AuditError(
+                code=ErrorCode.AUDIT_RECORD_FAILED,
+                message="Failed to write audit record",
+            )
+        )
+        handler = AuditEventHandler(
+            database=mock_database,
+            event_bus=event_bus,
+            audit_writer=audit_writer,
+            logger=mock_logger,
+        )
+        event = UserPasswordChangeSucceeded(user_id=sample_user_id, initiated_by="user")
+
+        # Act
+        await handler.handle_user_password_change_succeeded(event)
+
+        # Assert
+        mock_logger.error.assert_called_once()
+        assert mock_logger.error.call_args.args[0] == "audit_record_failed"
+        call_kwargs = mock_logger.error.call_args.kwargs
+        assert call_kwargs["action"] == AuditAction.USER_PASSWORD_CHANGED.value
+        assert call_kwargs["error_code"] == ErrorCode.AUDIT_RECORD_FAILED.value
+
+    @pytest.mark.asyncio
+    async def test_session_takes_precedence_over_audit_writer(
+        self, mock_database, mock_event_bus, sample_user_id
+    ):
+        """Test a session passed to publish() is used inline, not the writer."""
+        # Arrange
+        audit_writer = AsyncMock()
+        handler = AuditEventHandler(
+            database=mock_database, event_bus=mock_event_bus, audit_writer=audit_writer
+        )
+        event = UserPasswordChangeSucceeded(user_id=sample_user_id, initiated_by="user")
+
+        with patch(
+            "src.infrastructure.audit.postgres_adapter.PostgresAuditAdapter"
+        ) as mock_adapter_class:
+            mock_adapter = AsyncMock()
+            mock_adapter_class.return_value = mock_adapter
+
+            # Act
+            await handler.handle_user_password_change_succeeded(event)
+
+            # Assert
+            mock_adapter.record.assert_called_once()
+            audit_writer.record.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_session_and_no_writer_raises(self, mock_database):
+        """Test missing session without an audit writer is a programming error."""
+        # Arrange
+        event_bus = MagicMock()
+        event_bus.get_session = MagicMock(return_value=None)
+        handler = AuditEventHandler(database=mock_database, event_bus=event_bus)
+
+        # Act & Assert
+        with pytest.raises(RuntimeError, match="requires a database session"):
+            await handler.handle_user_registration_attempted(
+                UserRegistrationAttempted(email="test@example.com")
+            )
+
 
 # =============================================================================
 # EmailEventHandler Tests (Stub - Behavior Only)
@@ -0,0 +1,101 @@
+"""Unit tests for the content-addressed file parse cache.
+
+Tests cover:
+- SHA-256 keys (stable, content-only)
+- LRU eviction by byte budget and by entry count
+- Files larger than the budget are not cached
+- Hit/miss/eviction statistics
+
+Architecture:
+- Pure in-memory logic (no I/O)
+"""
+
+import hashlib
+
+import pytest
+
+from src.infrastructure.providers.file_parse_cache import FileParseCache
+
+
+@pytest.mark.unit
+class TestFileParseCache:
+    """Tests for keys, bounds, and statistics."""
+
+    def test_key_is_sha256_of_content(self) -> None:
+        """Keys are hex SHA-256 digests, identical for identical bytes."""
+        content = b"OFXHEADER:100\n<OFX></OFX>"
+
+        key = FileParseCache.key_for(content)
+
+        assert key == hashlib.sha256(content).hexdigest()
+        assert FileParseCache.key_for(bytes(content)) == key
+        assert FileParseCache.key_for(content + b"\n") != key
+
+    def test_get_returns_stored_value(self) -> None:
+        """Stored values are returned; unknown keys are misses."""
+        cache = FileParseCache(max_bytes=100, max_entries=4)
+
+        assert cache.set("a", "parsed-a", size_bytes=10) is True
+
+        assert cache.get("a") == "parsed-a"
+        assert cache.get("missing") is None
+        assert cache.size_bytes == 10
+
+    def test_evicts_least_recently_used_over_byte_budget(self) -> None:
+        """Entries are evicted oldest-read first until the budget fits."""
+        cache = FileParseCache(max_bytes=100, max_entries=10)
+        cache.set("a", "a", size_bytes=40)
+        cache.set("b", "b", size_bytes=40)
+        cache.get("a")  # "b" is now least recently used
+
+        cache.set("c", "c", size_bytes=40)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "a"
+        assert cache.get("c") == "c"
+        assert cache.size_bytes == 80
+
+    def test_evicts_over_entry_bound(self) -> None:
+        """The entry bound applies even when the byte budget has room."""
+        cache = FileParseCache(max_bytes=1_000, max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, key, size_bytes=1)
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+
+    def test_file_larger_than_budget_not_cached(self) -> None:
+        """A single oversized file is rejected without evicting others."""
+        cache = FileParseCache(max_bytes=100, max_entries=4)
+        cache.set("small", "small", size_bytes=10)
+
+        assert cache.set("huge", "huge", size_bytes=101) is False
+
+        assert cache.get("huge") is None
+        assert cache.get("small") == "small"
+
+    def test_replacing_entry_releases_old_size(self) -> None:
+        """Setting an existing key does not double count its size."""
+        cache = FileParseCache(max_bytes=100, max_entries=4)
+        cache.set("a", "old", size_bytes=60)
+
+        cache.set("a", "new", size_bytes=60)
+
+        assert cache.get("a") == "new"
+        assert cache.size_bytes == 60
+
+    def test_clear_and_stats(self) -> None:
+        """Stats count hits, misses and evictions; clear empties the cache."""
+        cache = FileParseCache(max_bytes=100, max_entries=1)
+        cache.set("a", "a", size_bytes=10)
+        cache.get("a")
+        cache.get("b")
+        cache.set("b", "b", size_bytes=10)
+
+        stats = cache.get_stats()
+        assert (stats.entries, stats.size_bytes) == (1, 10)
+        assert (stats.hits, stats.misses, stats.evictions) == (1, 1, 1)
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.size_bytes == 0
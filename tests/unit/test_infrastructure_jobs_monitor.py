@@ -4,6 +4,7 @@ Tests cover:
 - check_health() - Redis reachable, unreachable, unexpected errors
 - get_queue_length() - success, Redis error
 - get_job_result() - found, not found, Redis error, unexpected error
+- get_sync_job() - found, Redis error; sync job counts in check_health()
 
 Architecture:
 - Pure unit tests (no external dependencies)
@@ -13,13 +14,16 @@ Architecture:
 """
 
 import json
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock
 
 import pytest
 from redis.exceptions import RedisError
+from uuid_extensions import uuid7
 
 from src.core.result import Failure, Success
 from src.infrastructure.jobs.monitor import JobsHealthStatus, JobsMonitor
+from src.infrastructure.jobs.sync_job_store import SyncJob, SyncJobKind, SyncJobStatus
 
 
 # =============================================================================
@@ -38,9 +42,22 @@ def mock_redis():
 
 
 @pytest.fixture
-def monitor(mock_redis):
+def mock_sync_job_store():
+    """Create mock SyncJobStore."""
+    store = AsyncMock()
+    store.count_active = AsyncMock(return_value=(0, 0))
+    store.get = AsyncMock(return_value=None)
+    return store
+
+
+@pytest.fixture
+def monitor(mock_redis, mock_sync_job_store):
     """Create JobsMonitor with mocked Redis client."""
-    return JobsMonitor(redis_client=mock_redis, queue_name="test:jobs")
+    return JobsMonitor(
+        redis_client=mock_redis,
+        queue_name="test:jobs",
+        sync_job_store=mock_sync_job_store,
+    )
 
 
 # =============================================================================
@@ -117,6 +134,17 @@ class TestJobsMonitorCheckHealth:
         assert status.redis_connected is True
         assert status.error is None
 
+    @pytest.mark.asyncio
+    async def test_reports_active_sync_jobs(self, monitor, mock_sync_job_store) -> None:
+        """Should include queued/running sync job counts."""
+        mock_sync_job_store.count_active.return_value = (2, 5)
+
+        result = await monitor.check_health()
+
+        assert isinstance(result, Success)
+        assert result.value.sync_jobs_queued == 2
+        assert result.value.sync_jobs_running == 5
+
     @pytest.mark.asyncio
     async def test_pings_redis_to_verify_connectivity(
         self, monitor, mock_redis
@@ -309,6 +337,46 @@ class TestJobsMonitorGetJobResult:
         assert "TypeError" in result.error.details["type"]
 
 
+# =============================================================================
+# Test: get_sync_job()
+# =============================================================================
+
+
+class TestJobsMonitorGetSyncJob:
+    """Test get_sync_job method."""
+
+    @pytest.mark.asyncio
+    async def test_returns_sync_job(self, monitor, mock_sync_job_store) -> None:
+        """Should return the stored sync job."""
+        job = SyncJob(
+            job_id=uuid7(),
+            kind=SyncJobKind.ACCOUNTS,
+            status=SyncJobStatus.RUNNING,
+            user_id=uuid7(),
+            target_id=uuid7(),
+            created_at=datetime.now(UTC),
+        )
+        mock_sync_job_store.get.return_value = job
+
+        result = await monitor.get_sync_job(job.job_id)
+
+        assert isinstance(result, Success)
+        assert result.value == job
+        mock_sync_job_store.get.assert_called_once_with(job.job_id)
+
+    @pytest.mark.asyncio
+    async def test_returns_failure_on_redis_error(
+        self, monitor, mock_sync_job_store
+    ) -> None:
+        """Should return Failure when Redis fails."""
+        mock_sync_job_store.get.side_effect = RedisError("Connection lost")
+
+        result = await monitor.get_sync_job(uuid7())
+
+        assert isinstance(result, Failure)
+        assert "Connection lost" in result.error.details["error"]
+
+
 # =============================================================================
 # Test: Constructor
 # =============================================================================
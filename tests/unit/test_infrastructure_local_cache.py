@@ -0,0 +1,182 @@
+"""Unit tests for the in-process (L1) cache tier and per-tier metrics.
+
+Tests cover:
+- TTL expiry and LRU eviction
+- Group (per-user) invalidation
+- Generation guard against storing values loaded before an invalidation
+- CacheMetrics.get_tier_stats combined hit rate
+
+Architecture:
+- Pure in-memory logic (no Redis); clock injected for TTL tests
+"""
+
+import pytest
+
+from src.infrastructure.cache.cache_metrics import CacheMetrics
+from src.infrastructure.cache.local_cache import LocalTTLCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_cache(
+    max_entries: int = 3, ttl_seconds: float = 5, clock: FakeClock | None = None
+) -> LocalTTLCache:
+    """Create a cache tier with a fake clock."""
+    return LocalTTLCache(
+        max_entries=max_entries, ttl_seconds=ttl_seconds, clock=clock or FakeClock()
+    )
+
+
+# =============================================================================
+# LocalTTLCache Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestLocalTTLCache:
+    """Tests for TTL, LRU eviction, and invalidation."""
+
+    def test_get_returns_stored_value(self) -> None:
+        """Stored values are returned until they expire."""
+        cache = create_cache()
+
+        cache.set("a", {"id": "a"})
+
+        assert cache.get("a") == {"id": "a"}
+        assert cache.get("missing") is None
+
+    def test_falsy_values_are_cached(self) -> None:
+        """False (e.g., a denied permission) is a hit, not a miss."""
+        cache = create_cache()
+
+        cache.set("denied", False)
+
+        assert cache.get("denied") is False
+
+    def test_entries_expire_after_ttl(self) -> None:
+        """Expired entries are misses and are purged on access."""
+        clock = FakeClock()
+        cache = create_cache(ttl_seconds=5, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 4.9
+        assert cache.get("a") == 1
+
+        clock.now = 5.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_evicted(self) -> None:
+        """When full, the entry not read for the longest time is evicted."""
+        cache = create_cache(max_entries=3)
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+
+        cache.get("a")  # "b" is now least recently used
+        cache.set("d", "d")
+
+        assert cache.get("b") is None
+        assert [cache.get(key) for key in ("a", "c", "d")] == ["a", "c", "d"]
+
+    def test_invalidate_group_drops_only_that_group(self) -> None:
+        """Group invalidation removes every entry of one user."""
+        cache = create_cache(max_entries=10)
+        cache.set("s1", 1, group="user-1")
+        cache.set("s2", 2, group="user-1")
+        cache.set("s3", 3, group="user-2")
+
+        removed = cache.invalidate_group("user-1")
+
+        assert removed == 2
+        assert cache.get("s1") is None
+        assert cache.get("s2") is None
+        assert cache.get("s3") == 3
+
+    def test_evicted_entry_leaves_its_group(self) -> None:
+        """LRU eviction also removes the key from its group index."""
+        cache = create_cache(max_entries=1)
+        cache.set("s1", 1, group="user-1")
+        cache.set("s2", 2, group="user-2")
+
+        assert cache.invalidate_group("user-1") == 0
+        assert cache.get("s2") == 2
+
+    def test_set_skipped_after_concurrent_invalidation(self) -> None:
+        """A value loaded before an invalidation is not stored."""
+        cache = create_cache()
+        generation = cache.generation
+
+        cache.delete("s1")  # e.g., session revoked while Redis read in flight
+        stored = cache.set("s1", {"is_revoked": False}, generation=generation)
+
+        assert stored is False
+        assert cache.get("s1") is None
+
+    def test_set_with_current_generation_is_stored(self) -> None:
+        """Without an intervening invalidation the value is stored."""
+        cache = create_cache()
+
+        stored = cache.set("s1", 1, generation=cache.generation)
+
+        assert stored is True
+        assert cache.get("s1") == 1
+
+    def test_clear_drops_everything(self) -> None:
+        """clear() empties entries and groups."""
+        cache = create_cache()
+        cache.set("s1", 1, group="user-1")
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.invalidate_group("user-1") == 0
+
+
+# =============================================================================
+# CacheMetrics Tier Stats Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestCacheMetricsTierStats:
+    """Tests for per-tier hit ratios."""
+
+    def test_tier_stats_combine_l1_and_l2(self) -> None:
+        """Combined hit rate counts hits in either tier per lookup."""
+        metrics = CacheMetrics()
+        # 4 lookups: 2 L1 hits, 1 L2 hit, 1 miss in both tiers
+        metrics.record_hit("session:l1")
+        metrics.record_hit("session:l1")
+        metrics.record_miss("session:l1")
+        metrics.record_miss("session:l1")
+        metrics.record_hit("session:l2")
+        metrics.record_miss("session:l2")
+
+        stats = metrics.get_tier_stats("session")
+
+        assert stats["l1"]["hit_rate"] == 0.5
+        assert stats["l2"]["hit_rate"] == 0.5
+        assert stats["hit_rate"] == 0.75
+
+    def test_tier_stats_without_local_tier(self) -> None:
+        """With only L2 recorded, the combined rate is the L2 rate."""
+        metrics = CacheMetrics()
+        metrics.record_hit("authz:l2")
+        metrics.record_miss("authz:l2")
+
+        stats = metrics.get_tier_stats("authz")
+
+        assert stats["l1"]["total_requests"] == 0
+        assert stats["hit_rate"] == 0.5
+
+    def test_tier_stats_empty(self) -> None:
+        """Unknown namespaces report a zero hit rate."""
+        assert CacheMetrics().get_tier_stats("unknown")["hit_rate"] == 0.0
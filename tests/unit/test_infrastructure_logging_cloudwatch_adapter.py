@@ -4,20 +4,84 @@ Tests cover:
 - All LoggerProtocol methods (debug, info, warning, error, critical)
 - Context binding (returns self for protocol compliance)
 - Initialization and configuration
+- Bounded flusher: single thread, overflow policy, batch limits, self-metrics
 
 Architecture:
-- Unit tests with mocked boto3
+- Unit tests with mocked boto3 (or a local stub CloudWatch Logs client)
 - NO real AWS CloudWatch dependencies
 - Tests protocol compliance, not internal implementation
 """
 
+import json
+import threading
+import time
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.core.constants import CLOUDWATCH_MAX_BATCH_BYTES, CLOUDWATCH_MAX_EVENT_BYTES
 from src.infrastructure.logging.cloudwatch_adapter import CloudWatchAdapter
 
 
+class StubLogsClient:
+    """Local stand-in for the boto3 CloudWatch Logs client.
+
+    Records every PutLogEvents call with the calling thread, tracks
+    concurrent calls, and can hold calls until ``release`` is set.
+    """
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls: list[list[dict[str, Any]]] = []
+        self.threads: set[str] = set()
+        self.release = threading.Event()
+        self.release.set()
+        self.delay = delay
+        self.max_concurrent = 0
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def create_log_group(self, **kwargs: Any) -> None:
+        pass
+
+    def create_log_stream(self, **kwargs: Any) -> None:
+        pass
+
+    def put_log_events(self, **kwargs: Any) -> dict[str, Any]:
+        with self._lock:
+            self._active += 1
+            self.max_concurrent = max(self.max_concurrent, self._active)
+            self.threads.add(threading.current_thread().name)
+        self.release.wait()
+        time.sleep(self.delay)
+        with self._lock:
+            self._active -= 1
+            self.calls.append(kwargs["logEvents"])
+        return {}
+
+    @property
+    def messages(self) -> list[str]:
+        return [json.loads(e["message"])["message"] for c in self.calls for e in c]
+
+
+def create_stub_adapter(stub: StubLogsClient, **kwargs: Any) -> CloudWatchAdapter:
+    """Create adapter wired to a stub client (no periodic flush by default)."""
+    kwargs.setdefault("batch_interval", 60.0)
+    with patch("src.infrastructure.logging.cloudwatch_adapter.boto3") as mock_boto3:
+        mock_boto3.client.return_value = stub
+        return CloudWatchAdapter(log_group="/test/group", log_stream="s", **kwargs)
+
+
+def wait_for(predicate, timeout: float = 2.0) -> bool:
+    """Poll until predicate() is true or timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return bool(predicate())
+
+
 @pytest.mark.unit
 class TestCloudWatchAdapterProtocolCompliance:
     """Test CloudWatchAdapter implements LoggerProtocol correctly."""
@@ -254,3 +318,124 @@ class TestCloudWatchAdapterErrorHandling:
             except Exception:
                 # Acceptable to fail during initialization
                 pass
+
+
+@pytest.mark.unit
+class TestCloudWatchAdapterBoundedFlusher:
+    """Test single-flusher batching, overflow policy, and self-metrics."""
+
+    def test_burst_uses_single_flusher_thread(self):
+        """Test a logging burst is shipped by one thread, one call at a time."""
+        stub = StubLogsClient(delay=0.005)
+        adapter = create_stub_adapter(stub, batch_size=10)
+        threads_before = threading.active_count()
+
+        for i in range(500):
+            adapter.info(f"burst {i}")
+        threads_during = threading.active_count()
+        adapter.close()
+
+        assert threads_during <= threads_before
+        assert stub.threads <= {"cw-logger", threading.current_thread().name}
+        assert stub.max_concurrent == 1
+        assert stub.messages == [f"burst {i}" for i in range(500)]
+        assert all(len(call) <= 10 for call in stub.calls)
+
+    def test_full_batch_wakes_flusher(self):
+        """Test reaching batch_size flushes before the interval elapses."""
+        stub = StubLogsClient()
+        adapter = create_stub_adapter(stub, batch_size=3)
+
+        for i in range(3):
+            adapter.info(f"message {i}")
+
+        assert wait_for(lambda: len(stub.calls) == 1)
+        assert len(stub.calls[0]) == 3
+        adapter.close()
+
+    def test_full_queue_drops_oldest_events(self):
+        """Test a full queue drops the oldest events and counts them."""
+        stub = StubLogsClient()
+        adapter = create_stub_adapter(stub, batch_size=100, max_queue_size=5)
+
+        for i in range(10):
+            adapter.info(f"message {i}")
+        stats = adapter.get_stats()
+        adapter.close()
+
+        assert stats.queued_events == 5
+        assert stats.dropped_events == 5
+        assert stub.messages == [f"message {i}" for i in range(5, 10)]
+
+    def test_debug_shed_when_queue_half_full(self):
+        """Test DEBUG events are shed under pressure while others are kept."""
+        stub = StubLogsClient()
+        adapter = create_stub_adapter(stub, batch_size=100, max_queue_size=4)
+
+        adapter.debug("debug kept")
+        adapter.info("info 1")
+        adapter.debug("debug shed")
+        adapter.warning("warning kept")
+        stats = adapter.get_stats()
+        adapter.close()
+
+        assert stats.shed_debug_events == 1
+        assert stats.dropped_events == 0
+        assert stub.messages == ["debug kept", "info 1", "warning kept"]
+
+    def test_batches_respect_payload_byte_limit(self):
+        """Test batches are split so each stays under the 1 MB payload limit."""
+        stub = StubLogsClient()
+        adapter = create_stub_adapter(stub, batch_size=50)
+        large = "x" * 200_000
+
+        for _ in range(10):
+            adapter.info(large)
+        adapter.close()
+
+        assert [len(call) for call in stub.calls] == [5, 5]
+        for call in stub.calls:
+            payload = sum(len(e["message"].encode()) + 26 for e in call)
+            assert payload <= CLOUDWATCH_MAX_BATCH_BYTES
+
+    def test_oversized_event_is_truncated(self):
+        """Test a single event over the size limit is sent truncated."""
+        stub = StubLogsClient()
+        adapter = create_stub_adapter(stub)
+
+        adapter.error("y" * (CLOUDWATCH_MAX_EVENT_BYTES + 1), request_id="r1")
+        adapter.close()
+
+        sent = json.loads(stub.calls[0][0]["message"])
+        assert sent["truncated"] is True
+        assert sent["original_bytes"] > CLOUDWATCH_MAX_EVENT_BYTES
+        assert len(stub.calls[0][0]["message"]) < CLOUDWATCH_MAX_EVENT_BYTES
+
+    def test_stats_report_flush_counts_and_latency(self):
+        """Test get_stats() reports sent events, flushes, and latency."""
+        stub = StubLogsClient(delay=0.01)
+        adapter = create_stub_adapter(stub, batch_size=2)
+
+        for i in range(4):
+            adapter.info(f"message {i}")
+        adapter.close()
+        stats = adapter.get_stats()
+
+        assert stats.sent_events == 4
+        assert stats.flushes == 2
+        assert stats.failed_flushes == 0
+        assert stats.queued_events == 0
+        assert stats.last_flush_latency_ms >= 10
+        assert stats.max_flush_latency_ms >= stats.last_flush_latency_ms
+        assert stats.to_dict()["sent_events"] == 4
+
+    def test_close_is_idempotent(self):
+        """Test close() can be called again (atexit) without resending."""
+        stub = StubLogsClient()
+        adapter = create_stub_adapter(stub)
+
+        adapter.info("only once")
+        adapter.close()
+        adapter.close()
+
+        assert stub.messages == ["only once"]
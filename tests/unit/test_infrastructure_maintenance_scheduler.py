@@ -0,0 +1,601 @@
+"""Unit tests for MaintenanceScheduler and the maintenance tasks.
+
+Tests cover:
+- Leader election: one leader across instances, renewal (per tick, per
+  task and while a task runs), takeover on expiry, release on aclose()
+- Scheduling: first run inside the jitter window, jittered intervals
+- Stats and structured logs per task (items, durations, failures)
+- ExpiredSessionSweeper - batched deletes stop on a short batch or the cap
+- StaleAccountRefresher - one staggered job per syncable connection,
+  recently failed connections skipped
+- BalanceSnapshotRecorder - runs RecordBalanceSnapshots, failures logged
+
+Architecture:
+- Uses fakeredis (with Lua) for the leader lock
+- Tasks use patched repositories and a fake Database (no PostgreSQL)
+"""
+
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fakeredis import FakeServer, aioredis
+from uuid_extensions import uuid7
+
+from src.application.commands.sync_commands import RecordBalanceSnapshots
+from src.application.dtos import RecordBalanceSnapshotsResult
+from src.core.result import Failure, Success
+from src.infrastructure.jobs.maintenance_scheduler import (
+    MaintenanceScheduler,
+    MaintenanceTask,
+)
+from src.infrastructure.jobs.maintenance_tasks import (
+    BalanceSnapshotRecorder,
+    ExpiredSessionSweeper,
+    StaleAccountRefresher,
+)
+from src.infrastructure.jobs.sync_job_store import SyncJobKind
+from src.infrastructure.persistence.database import Database
+
+LEADER_KEY = "test:maintenance:leader"
+
+
+class CountingTask:
+    """Task callable returning a fixed item count (or raising)."""
+
+    def __init__(self, items: int = 3, error: Exception | None = None) -> None:
+        self.items = items
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.items
+
+
+class FakeDatabase:
+    """Database double whose sessions are plain mocks."""
+
+    def __init__(self) -> None:
+        self.sessions_opened = 0
+
+    @asynccontextmanager
+    async def get_session(self):
+        self.sessions_opened += 1
+        yield MagicMock()
+
+
+@dataclass
+class FakeAccount:
+    connection_id: object
+
+
+@dataclass
+class FakeConnection:
+    id: object
+    user_id: object
+    syncable: bool = True
+
+    def can_sync(self) -> bool:
+        return self.syncable
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def server():
+    """Provide one fake Redis server shared by all instances in a test."""
+    return FakeServer()
+
+
+def _scheduler(server, tasks, logger=None, jitter_ratio=0.0, ttl=60, tick=15.0):
+    return MaintenanceScheduler(
+        redis_client=aioredis.FakeRedis(server=server),
+        tasks=tasks,
+        logger=logger or MagicMock(),
+        leader_key=LEADER_KEY,
+        leader_ttl_seconds=ttl,
+        tick_seconds=tick,
+        jitter_ratio=jitter_ratio,
+        rng=random.Random(42),
+    )
+
+
+async def _wait_until(predicate) -> None:
+    """Yield to the scheduler loop until predicate() holds (1s timeout)."""
+    async with asyncio.timeout(1):
+        while not predicate():
+            await asyncio.sleep(0.001)
+
+
+# =============================================================================
+# Scheduler
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestMaintenanceSchedulerLeadership:
+    """Test leader election across scheduler instances."""
+
+    async def test_only_leader_runs_tasks(self, server):
+        """With two instances, only the lock holder runs the task."""
+        first_task, second_task = CountingTask(), CountingTask()
+        first = _scheduler(
+            server, [MaintenanceTask(name="t", interval_seconds=60, run=first_task)]
+        )
+        second = _scheduler(
+            server, [MaintenanceTask(name="t", interval_seconds=60, run=second_task)]
+        )
+
+        await first.run_once()
+        await second.run_once()
+
+        assert first.is_leader is True
+        assert second.is_leader is False
+        assert (first_task.calls, second_task.calls) == (1, 0)
+
+    async def test_leader_renews_lock(self, server):
+        """A leader keeps leadership across ticks and extends the TTL."""
+        redis = aioredis.FakeRedis(server=server)
+        scheduler = _scheduler(server, [], ttl=60)
+
+        await scheduler.run_once()
+        await redis.pexpire(LEADER_KEY, 1000)
+        await scheduler.run_once()
+
+        assert scheduler.is_leader is True
+        assert await redis.pttl(LEADER_KEY) > 1000
+        assert scheduler.get_stats().leader_terms == 1
+
+    async def test_lock_renewed_before_each_task(self, server):
+        """A slow task does not let the lock expire before the next one."""
+        redis = aioredis.FakeRedis(server=server)
+        ttls: list[int] = []
+
+        async def slow_task() -> int:
+            await redis.pexpire(LEADER_KEY, 1000)  # Most of the TTL used up
+            return 0
+
+        async def next_task() -> int:
+            ttls.append(await redis.pttl(LEADER_KEY))
+            return 0
+
+        scheduler = _scheduler(
+            server,
+            [
+                MaintenanceTask(name="slow", interval_seconds=60, run=slow_task),
+                MaintenanceTask(name="next", interval_seconds=60, run=next_task),
+            ],
+            ttl=60,
+        )
+
+        await scheduler.run_once()
+
+        assert ttls[0] > 1000
+
+    async def test_lock_renewed_while_task_runs(self, server):
+        """A task running longer than the lock TTL keeps the lock."""
+        redis = aioredis.FakeRedis(server=server)
+        holders: list[bytes | None] = []
+
+        async def long_task() -> int:
+            await redis.pexpire(LEADER_KEY, 100)
+            await asyncio.sleep(0.3)  # Several ticks, well past the old TTL
+            holders.append(await redis.get(LEADER_KEY))
+            return 0
+
+        scheduler = _scheduler(
+            server,
+            [MaintenanceTask(name="long", interval_seconds=60, run=long_task)],
+            tick=0.02,
+        )
+
+        await scheduler.run_once()
+
+        assert holders[0] is not None
+        assert scheduler.is_leader is True
+        assert await redis.pttl(LEADER_KEY) > 1000
+
+    async def test_lock_lost_during_task_stops_run(self, server):
+        """Later tasks are skipped if another instance took the lock."""
+        redis = aioredis.FakeRedis(server=server)
+        later = CountingTask()
+
+        async def slow_task() -> int:
+            await redis.set(LEADER_KEY, "other-instance")  # Lock expired, taken
+            return 0
+
+        scheduler = _scheduler(
+            server,
+            [
+                MaintenanceTask(name="slow", interval_seconds=60, run=slow_task),
+                MaintenanceTask(name="later", interval_seconds=60, run=later),
+            ],
+        )
+
+        await scheduler.run_once()
+
+        assert later.calls == 0
+        assert scheduler.is_leader is False
+
+    async def test_lost_lock_is_taken_over(self, server):
+        """When the lock expires, another instance becomes leader."""
+        redis = aioredis.FakeRedis(server=server)
+        logger = MagicMock()
+        first = _scheduler(server, [], logger=logger)
+        second = _scheduler(server, [])
+
+        await first.run_once()
+        await redis.delete(LEADER_KEY)  # Lock expired
+        await second.run_once()
+        await first.run_once()
+
+        assert second.is_leader is True
+        assert first.is_leader is False
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args.args[0] == "maintenance_leadership_lost"
+
+    async def test_aclose_releases_lock(self, server):
+        """Closing the leader releases the lock for the next instance."""
+        first = _scheduler(server, [])
+        second = _scheduler(server, [])
+        await first.run_once()
+
+        await first.aclose()
+        await second.run_once()
+
+        assert second.is_leader is True
+
+    async def test_start_and_aclose(self, server):
+        """The background loop runs a due task and stops on aclose()."""
+        task = CountingTask()
+        scheduler = _scheduler(
+            server, [MaintenanceTask(name="t", interval_seconds=60, run=task)]
+        )
+
+        scheduler.start()
+        await _wait_until(lambda: task.calls == 1)
+        await scheduler.aclose()
+
+        assert scheduler.is_leader is False
+
+
+@pytest.mark.unit
+class TestMaintenanceSchedulerScheduling:
+    """Test task timing, stats and logs."""
+
+    async def test_task_waits_for_its_interval(self, server):
+        """A task that just ran is not run again on the next tick."""
+        task = CountingTask()
+        scheduler = _scheduler(
+            server, [MaintenanceTask(name="t", interval_seconds=60, run=task)]
+        )
+
+        await scheduler.run_once()
+        await scheduler.run_once()
+
+        assert task.calls == 1
+
+    async def test_task_runs_again_when_due(self, server):
+        """A task runs again once its next run time has passed."""
+        task = CountingTask()
+        scheduler = _scheduler(
+            server, [MaintenanceTask(name="t", interval_seconds=60, run=task)]
+        )
+        await scheduler.run_once()
+
+        scheduler._next_run["t"] = 0.0  # Interval elapsed
+        await scheduler.run_once()
+
+        assert task.calls == 2
+
+    async def test_first_run_within_jitter_window(self, server):
+        """A new leader schedules first runs within interval * jitter_ratio."""
+        scheduler = _scheduler(
+            server,
+            [MaintenanceTask(name="t", interval_seconds=100, run=CountingTask())],
+            jitter_ratio=0.1,
+        )
+
+        before = time.monotonic()
+        await scheduler._elect()
+
+        assert before <= scheduler._next_run["t"] <= time.monotonic() + 10.0
+
+    async def test_intervals_are_jittered(self, server):
+        """Jittered intervals vary within +/- jitter_ratio."""
+        scheduler = _scheduler(server, [], jitter_ratio=0.1)
+
+        intervals = {scheduler._jittered(100) for _ in range(20)}
+
+        assert len(intervals) > 1
+        assert all(90 <= interval <= 110 for interval in intervals)
+
+    async def test_stats_and_log_on_success(self, server):
+        """A run records items and duration and logs completion."""
+        logger = MagicMock()
+        scheduler = _scheduler(
+            server,
+            [MaintenanceTask(name="sweep", interval_seconds=60, run=CountingTask(5))],
+            logger=logger,
+        )
+
+        await scheduler.run_once()
+
+        stats = scheduler.get_stats()
+        assert stats.is_leader is True
+        assert stats.tasks["sweep"].runs == 1
+        assert stats.tasks["sweep"].items_processed == 5
+        assert stats.tasks["sweep"].last_run_at is not None
+        completed = [
+            c
+            for c in logger.info.call_args_list
+            if c.args[0] == "maintenance_task_completed"
+        ]
+        assert completed[0].kwargs["task"] == "sweep"
+        assert completed[0].kwargs["items"] == 5
+        assert "duration_ms" in completed[0].kwargs
+        assert stats.to_dict()["tasks"]["sweep"]["runs"] == 1
+
+    async def test_failing_task_is_counted_and_others_run(self, server):
+        """A raising task is logged and does not stop later tasks."""
+        logger = MagicMock()
+        healthy = CountingTask()
+        scheduler = _scheduler(
+            server,
+            [
+                MaintenanceTask(
+                    name="broken",
+                    interval_seconds=60,
+                    run=CountingTask(error=RuntimeError("boom")),
+                ),
+                MaintenanceTask(name="healthy", interval_seconds=60, run=healthy),
+            ],
+            logger=logger,
+        )
+
+        await scheduler.run_once()
+
+        stats = scheduler.get_stats()
+        assert stats.tasks["broken"].failures == 1
+        assert healthy.calls == 1
+        assert logger.error.call_args.args[0] == "maintenance_task_failed"
+
+
+# =============================================================================
+# Tasks
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestExpiredSessionSweeper:
+    """Test batched expired session/token deletes."""
+
+    async def test_sweeps_until_short_batch(self):
+        """Each table is swept until a batch deletes fewer than batch_size."""
+        database = FakeDatabase()
+        sessions = AsyncMock(side_effect=[2, 2, 1])
+        module = "src.infrastructure.jobs.maintenance_tasks"
+
+        with (
+            patch(f"{module}.SessionRepository") as session_repo,
+            patch(f"{module}.RefreshTokenRepository") as refresh_repo,
+            patch(f"{module}.PasswordResetTokenRepository") as reset_repo,
+            patch(f"{module}.EmailVerificationTokenRepository") as verify_repo,
+        ):
+            session_repo.return_value.cleanup_expired_sessions = sessions
+            refresh_repo.return_value.delete_expired = AsyncMock(return_value=0)
+            reset_repo.return_value.delete_expired_tokens = AsyncMock(return_value=1)
+            verify_repo.return_value.delete_expired_tokens = AsyncMock(return_value=0)
+            sweeper = ExpiredSessionSweeper(
+                database=cast(Database, database),
+                logger=MagicMock(),
+                batch_size=2,
+                max_batches=10,
+            )
+
+            deleted = await sweeper()
+
+        assert deleted == 6
+        assert sessions.await_count == 3
+        assert sessions.await_args is not None
+        assert sessions.await_args.kwargs["limit"] == 2
+        assert database.sessions_opened == 6  # 3 + 1 + 1 + 1 batches
+
+    async def test_stops_at_batch_cap(self):
+        """A run deletes at most max_batches batches per table."""
+        database = FakeDatabase()
+        module = "src.infrastructure.jobs.maintenance_tasks"
+
+        with (
+            patch(f"{module}.SessionRepository") as session_repo,
+            patch(f"{module}.RefreshTokenRepository") as refresh_repo,
+            patch(f"{module}.PasswordResetTokenRepository") as reset_repo,
+            patch(f"{module}.EmailVerificationTokenRepository") as verify_repo,
+        ):
+            session_repo.return_value.cleanup_expired_sessions = AsyncMock(
+                return_value=2
+            )
+            refresh_repo.return_value.delete_expired = AsyncMock(return_value=0)
+            reset_repo.return_value.delete_expired_tokens = AsyncMock(return_value=0)
+            verify_repo.return_value.delete_expired_tokens = AsyncMock(return_value=0)
+            sweeper = ExpiredSessionSweeper(
+                database=cast(Database, database),
+                logger=MagicMock(),
+                batch_size=2,
+                max_batches=3,
+            )
+
+            deleted = await sweeper()
+
+        assert deleted == 6
+
+
+@pytest.mark.unit
+class TestStaleAccountRefresher:
+    """Test staggered sync job submission for stale accounts."""
+
+    async def _run(
+        self, accounts, connections, submit_results=None, failed_targets=None
+    ):
+        runner = MagicMock()
+        runner.recently_failed_targets = AsyncMock(
+            return_value=Success(value=failed_targets or set())
+        )
+        runner.submit = AsyncMock(
+            side_effect=submit_results
+            or (lambda **_: Success(value=MagicMock(deduplicated=False)))
+        )
+        module = "src.infrastructure.jobs.maintenance_tasks"
+        with (
+            patch(f"{module}.AccountRepository") as account_repo,
+            patch(f"{module}.ProviderConnectionRepository") as connection_repo,
+        ):
+            account_repo.return_value.find_needing_sync = AsyncMock(
+                return_value=accounts
+            )
+            connection_repo.return_value.find_by_id = AsyncMock(
+                side_effect=lambda connection_id: connections.get(connection_id)
+            )
+            refresher = StaleAccountRefresher(
+                database=cast(Database, FakeDatabase()),
+                runner=runner,
+                build_command=lambda user_id, connection_id: (user_id, connection_id),
+                logger=MagicMock(),
+                threshold=timedelta(hours=6),
+                batch_size=10,
+                stagger_seconds=2.0,
+            )
+            enqueued = await refresher()
+        return enqueued, runner, account_repo.return_value.find_needing_sync
+
+    async def test_one_staggered_job_per_connection(self):
+        """Accounts are grouped per connection; submissions are staggered."""
+        first = FakeConnection(id=uuid7(), user_id=uuid7())
+        second = FakeConnection(id=uuid7(), user_id=uuid7())
+        accounts = [
+            FakeAccount(first.id),
+            FakeAccount(first.id),
+            FakeAccount(second.id),
+        ]
+
+        enqueued, runner, _ = await self._run(
+            accounts, {first.id: first, second.id: second}
+        )
+
+        assert enqueued == 2
+        calls = runner.submit.await_args_list
+        assert [c.kwargs["target_id"] for c in calls] == [first.id, second.id]
+        assert [c.kwargs["delay_seconds"] for c in calls] == [0.0, 2.0]
+        assert calls[0].kwargs["kind"] == SyncJobKind.ACCOUNTS
+        assert calls[0].kwargs["command"] == (first.user_id, first.id)
+
+    async def test_skips_connections_that_cannot_sync(self):
+        """Disconnected or missing connections get no job."""
+        broken = FakeConnection(id=uuid7(), user_id=uuid7(), syncable=False)
+        accounts = [FakeAccount(broken.id), FakeAccount(uuid7())]
+
+        enqueued, runner, _ = await self._run(accounts, {broken.id: broken})
+
+        assert enqueued == 0
+        runner.submit.assert_not_awaited()
+
+    async def test_stops_on_submit_failure(self):
+        """An enqueue failure (e.g. Redis down) ends the run."""
+        first = FakeConnection(id=uuid7(), user_id=uuid7())
+        second = FakeConnection(id=uuid7(), user_id=uuid7())
+
+        enqueued, runner, _ = await self._run(
+            [FakeAccount(first.id), FakeAccount(second.id)],
+            {first.id: first, second.id: second},
+            submit_results=[Failure(error=MagicMock(message="down"))],
+        )
+
+        assert enqueued == 0
+        assert runner.submit.await_count == 1
+
+    async def test_recently_failed_connections_excluded(self):
+        """Connections whose last sync failed are left out of the query."""
+        failed_id = uuid7()
+
+        _, runner, find_needing_sync = await self._run(
+            [], {}, failed_targets={failed_id}
+        )
+
+        runner.recently_failed_targets.assert_awaited_once_with(
+            SyncJobKind.ACCOUNTS, 3600.0
+        )
+        assert find_needing_sync.await_args.kwargs["exclude_connection_ids"] == {
+            failed_id
+        }
+
+    async def test_failed_target_lookup_error_skips_run(self):
+        """If recent failures can't be read (Redis down), nothing is queued."""
+        runner = MagicMock()
+        runner.recently_failed_targets = AsyncMock(
+            return_value=Failure(error=MagicMock(message="down"))
+        )
+        runner.submit = AsyncMock()
+        database = FakeDatabase()
+        refresher = StaleAccountRefresher(
+            database=cast(Database, database),
+            runner=runner,
+            build_command=lambda user_id, connection_id: (user_id, connection_id),
+            logger=MagicMock(),
+            threshold=timedelta(hours=6),
+        )
+
+        assert await refresher() == 0
+        assert database.sessions_opened == 0
+        runner.submit.assert_not_awaited()
+
+
+@pytest.mark.unit
+class TestBalanceSnapshotRecorder:
+    """Test scheduled balance snapshot capture."""
+
+    async def test_runs_command_and_returns_snapshots_captured(self):
+        """The built command is executed; recorded snapshots are the items."""
+        execute = AsyncMock(
+            return_value=Success(
+                value=RecordBalanceSnapshotsResult(
+                    accounts_scanned=5, snapshots_captured=3, message="ok"
+                )
+            )
+        )
+        logger = MagicMock()
+        recorder = BalanceSnapshotRecorder(
+            execute=execute, build_command=RecordBalanceSnapshots, logger=logger
+        )
+
+        assert await recorder() == 3
+        execute.assert_awaited_once()
+        assert execute.await_args is not None
+        assert isinstance(execute.await_args.args[0], RecordBalanceSnapshots)
+        logger.info.assert_called_once_with(
+            "maintenance_balance_snapshots", accounts_scanned=5, snapshots_captured=3
+        )
+
+    async def test_failure_is_logged_and_counts_zero(self):
+        """A failed capture is logged; the next run retries."""
+        execute = AsyncMock(return_value=Failure(error="db down"))
+        logger = MagicMock()
+        recorder = BalanceSnapshotRecorder(
+            execute=execute, build_command=RecordBalanceSnapshots, logger=logger
+        )
+
+        assert await recorder() == 0
+        logger.warning.assert_called_once_with(
+            "maintenance_balance_snapshots_failed", error_message="db down"
+        )
@@ -0,0 +1,142 @@
+"""Tests for src/infrastructure/providers/concurrency_limiter.py.
+
+Verifies ProviderConcurrencyLimiter bounds in-flight calls per provider
+(sized from the provider registry), isolates providers from each other,
+and pauses a provider after defer() (429 Retry-After).
+
+Reference:
+    - src/infrastructure/providers/concurrency_limiter.py
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.domain.providers.registry import get_provider_metadata
+from src.infrastructure.providers.concurrency_limiter import (
+    ProviderConcurrencyLimiter,
+)
+
+
+async def run_calls(
+    limiter: ProviderConcurrencyLimiter, slug: str, count: int, duration: float
+) -> int:
+    """Run ``count`` concurrent calls and return the peak in-flight count."""
+    in_flight = 0
+    peak = 0
+
+    async def call() -> None:
+        nonlocal in_flight, peak
+        async with limiter.slot(slug):
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(duration)
+            in_flight -= 1
+
+    await asyncio.gather(*(call() for _ in range(count)))
+    return peak
+
+
+class TestSlot:
+    """Tests for per-provider concurrency bounds."""
+
+    @pytest.mark.asyncio
+    async def test_limit_comes_from_provider_registry(self) -> None:
+        """Should allow max_concurrent_requests calls in flight for a provider."""
+        limiter = ProviderConcurrencyLimiter()
+        metadata = get_provider_metadata("schwab")
+        assert metadata is not None
+
+        peak = await run_calls(limiter, "schwab", count=12, duration=0.01)
+
+        assert peak == metadata.max_concurrent_requests
+        assert limiter.get_stats()["schwab"]["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_provider_uses_default_limit(self) -> None:
+        """Should fall back to the default limit for unregistered providers."""
+        limiter = ProviderConcurrencyLimiter(default_limit=2)
+
+        peak = await run_calls(limiter, "unknown", count=6, duration=0.01)
+
+        assert peak == 2
+        assert limiter.get_stats()["unknown"]["limit"] == 2
+
+    @pytest.mark.asyncio
+    async def test_providers_are_isolated(self) -> None:
+        """Should not let one provider's calls consume another's slots."""
+        limiter = ProviderConcurrencyLimiter(default_limit=1)
+
+        peak_a, peak_b = await asyncio.gather(
+            run_calls(limiter, "provider_a", count=3, duration=0.01),
+            run_calls(limiter, "provider_b", count=3, duration=0.01),
+        )
+
+        assert (peak_a, peak_b) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_keeps_counters_consistent(self) -> None:
+        """Should keep counters consistent when a waiting call is cancelled."""
+        limiter = ProviderConcurrencyLimiter(default_limit=1)
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with limiter.slot("p"):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        assert limiter.get_stats()["p"]["waiting"] == 1
+
+        waiter.cancel()
+        release.set()
+        await holder
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        stats = limiter.get_stats()["p"]
+        assert stats["waiting"] == 0
+        assert stats["in_flight"] == 0
+        await run_calls(limiter, "p", count=2, duration=0)
+
+
+class TestDefer:
+    """Tests for Retry-After pauses."""
+
+    @pytest.mark.asyncio
+    async def test_defer_delays_next_calls(self) -> None:
+        """Should hold new calls until the pause has elapsed."""
+        limiter = ProviderConcurrencyLimiter()
+        limiter.defer("schwab", 0.1)
+
+        start = time.perf_counter()
+        async with limiter.slot("schwab"):
+            elapsed = time.perf_counter() - start
+
+        assert elapsed >= 0.09
+        assert limiter.get_stats()["schwab"]["deferrals"] == 1
+
+    @pytest.mark.asyncio
+    async def test_defer_never_shortens_pause(self) -> None:
+        """Should keep the longest pause when deferred twice."""
+        limiter = ProviderConcurrencyLimiter()
+        limiter.defer("schwab", 0.1)
+        limiter.defer("schwab", 0.01)
+
+        start = time.perf_counter()
+        async with limiter.slot("schwab"):
+            elapsed = time.perf_counter() - start
+
+        assert elapsed >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_defer_does_not_pause_other_providers(self) -> None:
+        """Should only pause the rate-limited provider."""
+        limiter = ProviderConcurrencyLimiter()
+        limiter.defer("schwab", 10)
+
+        async with asyncio.timeout(1):
+            async with limiter.slot("alpaca"):
+                pass
@@ -0,0 +1,122 @@
+"""Tests for src/infrastructure/providers/http_client_registry.py.
+
+Verifies ProviderHTTPClientRegistry keeps one pooled client per provider,
+tracks request/connection counts, and releases clients on aclose().
+
+Reference:
+    - src/infrastructure/providers/http_client_registry.py
+"""
+
+from unittest.mock import patch
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from src.infrastructure.providers.http_client_registry import (
+    ConnectionPoolStats,
+    ProviderHTTPClientRegistry,
+)
+
+
+@pytest.fixture
+async def registry():
+    """Provide a registry that is closed after the test."""
+    registry = ProviderHTTPClientRegistry(max_connections=10)
+    yield registry
+    await registry.aclose()
+
+
+class TestConnectionPoolStats:
+    """Tests for ConnectionPoolStats reuse ratio."""
+
+    def test_reuse_ratio_zero_without_requests(self) -> None:
+        """Should report 0.0 when no requests were sent."""
+        assert ConnectionPoolStats().reuse_ratio == 0.0
+
+    def test_reuse_ratio_counts_reused_requests(self) -> None:
+        """Should report fraction of requests that reused a connection."""
+        stats = ConnectionPoolStats(requests=10, connections_opened=1)
+        assert stats.reuse_ratio == 0.9
+
+
+class TestGetClient:
+    """Tests for per-provider client lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_returns_same_client_for_provider(
+        self, registry: ProviderHTTPClientRegistry
+    ) -> None:
+        """Should reuse one client per provider."""
+        assert registry.get_client("schwab") is registry.get_client("schwab")
+
+    @pytest.mark.asyncio
+    async def test_returns_distinct_clients_per_provider(
+        self, registry: ProviderHTTPClientRegistry
+    ) -> None:
+        """Should isolate connection pools between providers."""
+        assert registry.get_client("schwab") is not registry.get_client("alpaca")
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_and_recreates_clients(
+        self, registry: ProviderHTTPClientRegistry
+    ) -> None:
+        """Should close clients on aclose and create a fresh one on next use."""
+        client = registry.get_client("schwab")
+
+        await registry.aclose()
+        await registry.aclose()  # Idempotent
+
+        assert client.is_closed
+        assert registry.get_all_stats() == {}
+        new_client = registry.get_client("schwab")
+        assert new_client is not client
+        assert not new_client.is_closed
+
+    def test_http2_falls_back_when_h2_missing(self) -> None:
+        """Should fall back to HTTP/1.1 when h2 is not installed."""
+        with patch(
+            "src.infrastructure.providers.http_client_registry.importlib.util.find_spec",
+            return_value=None,
+        ):
+            registry = ProviderHTTPClientRegistry(http2=True)
+
+        assert registry._http2 is False
+
+
+class TestStats:
+    """Tests for request accounting."""
+
+    @pytest.mark.asyncio
+    async def test_counts_requests_per_provider(
+        self, registry: ProviderHTTPClientRegistry, httpx_mock: HTTPXMock
+    ) -> None:
+        """Should count requests sent through each provider client."""
+        httpx_mock.add_response(url="https://api.test.com/accounts", is_reusable=True)
+        client = registry.get_client("schwab")
+
+        for _ in range(3):
+            response = await client.get("https://api.test.com/accounts")
+            assert response.status_code == 200
+
+        stats = registry.get_stats("schwab")
+        assert stats["requests"] == 3
+        assert registry.get_stats("alpaca")["requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_get_all_stats_lists_created_clients(
+        self, registry: ProviderHTTPClientRegistry
+    ) -> None:
+        """Should report stats for every provider with a client."""
+        registry.get_client("schwab")
+        registry.get_client("alpaca")
+
+        all_stats = registry.get_all_stats()
+
+        assert set(all_stats) == {"schwab", "alpaca"}
+        assert all_stats["schwab"] == {
+            "active_connections": 0,
+            "idle_connections": 0,
+            "requests": 0,
+            "connections_opened": 0,
+            "reuse_ratio": 0.0,
+        }
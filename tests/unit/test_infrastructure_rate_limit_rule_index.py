@@ -0,0 +1,111 @@
+"""Unit tests for RateLimitRuleIndex (compiled path-template lookup).
+
+Tests cover:
+- Exact and path-parameter template matching
+- Most specific template wins over parameterized siblings
+- Disabled rules dropped from the compiled route
+- Registry-built index agrees with RATE_LIMIT_RULES
+"""
+
+import pytest
+
+from src.domain.enums import RateLimitScope
+from src.domain.value_objects.rate_limit_rule import RateLimitRule
+from src.infrastructure.rate_limit.from_registry import (
+    RATE_LIMIT_INDEX,
+    RATE_LIMIT_RULES,
+)
+from src.infrastructure.rate_limit.rule_index import RateLimitRuleIndex
+
+
+def rule(scope: RateLimitScope, *, enabled: bool = True) -> RateLimitRule:
+    """Create a rule with the given scope."""
+    return RateLimitRule(max_tokens=10, refill_rate=10.0, scope=scope, enabled=enabled)
+
+
+USER = rule(RateLimitScope.USER)
+USER_PROVIDER = rule(RateLimitScope.USER_PROVIDER)
+BRAKE = rule(RateLimitScope.GLOBAL, enabled=False)
+
+
+@pytest.fixture
+def index() -> RateLimitRuleIndex:
+    """Index over a small set of templates."""
+    return RateLimitRuleIndex(
+        {
+            "GET /api/v1/providers/{provider_id}": (USER, BRAKE),
+            "GET /api/v1/providers/callback": (USER,),
+            "POST /api/v1/providers/{provider_id}/sync": (USER_PROVIDER, USER),
+            "GET /api/v1/accounts": (USER,),
+        }
+    )
+
+
+@pytest.mark.unit
+class TestRateLimitRuleIndex:
+    """Tests for template resolution."""
+
+    def test_exact_match(self, index) -> None:
+        """Templates without parameters resolve by exact key."""
+        route = index.match("GET", "/api/v1/accounts")
+
+        assert route is not None
+        assert route.endpoint == "GET /api/v1/accounts"
+
+    def test_trailing_slash_matches(self, index) -> None:
+        """Trailing slashes do not defeat matching."""
+        route = index.match("GET", "/api/v1/accounts/")
+
+        assert route is not None
+        assert route.endpoint == "GET /api/v1/accounts"
+
+    def test_path_parameter_match(self, index) -> None:
+        """Concrete paths resolve to their parameterized template."""
+        route = index.match("GET", "/api/v1/providers/abc-123")
+
+        assert route is not None
+        assert route.endpoint == "GET /api/v1/providers/{provider_id}"
+
+    def test_literal_template_preferred(self, index) -> None:
+        """A literal segment beats a placeholder at the same position."""
+        route = index.match("GET", "/api/v1/providers/callback")
+
+        assert route is not None
+        assert route.endpoint == "GET /api/v1/providers/callback"
+
+    def test_method_and_length_must_match(self, index) -> None:
+        """Wrong method or segment count does not match."""
+        assert index.match("DELETE", "/api/v1/accounts") is None
+        assert index.match("GET", "/api/v1/providers/abc/extra") is None
+
+    def test_disabled_rules_dropped(self, index) -> None:
+        """Only enabled rules (and their scopes) are compiled."""
+        route = index.match("GET", "/api/v1/providers/abc-123")
+
+        assert route is not None
+        assert route.rules == (USER,)
+        assert route.scopes == (RateLimitScope.USER,)
+
+    def test_scopes_in_rule_order(self, index) -> None:
+        """Scopes list each distinct scope once, policy rule first."""
+        route = index.match("POST", "/api/v1/providers/abc/sync")
+
+        assert route is not None
+        assert route.scopes == (RateLimitScope.USER_PROVIDER, RateLimitScope.USER)
+
+
+@pytest.mark.unit
+class TestRegistryRateLimitIndex:
+    """Tests for the registry-built RATE_LIMIT_INDEX."""
+
+    def test_every_registry_endpoint_indexed(self) -> None:
+        """Each registry template resolves to itself."""
+        assert len(RATE_LIMIT_INDEX) == len(RATE_LIMIT_RULES)
+        for endpoint, policy_rule in RATE_LIMIT_RULES.items():
+            method, _, path = endpoint.partition(" ")
+            route = RATE_LIMIT_INDEX.match(method, path)
+
+            assert route is not None, f"{endpoint} not indexed"
+            assert route.endpoint == endpoint
+            if policy_rule.enabled:
+                assert route.rules[0] == policy_rule
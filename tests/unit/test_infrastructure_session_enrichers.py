@@ -0,0 +1,226 @@
+"""Unit tests for session enricher caching.
+
+Tests cover:
+- EnrichmentCache - LRU eviction, hit/miss counters, latency stats
+- UserAgentDeviceEnricher - parse cached per user agent, parse off the
+  event loop, failures not cached
+- IPLocationEnricher - lookup cached per IP prefix (/24, /64), database
+  opened memory-mapped, misses looked up in a worker thread
+
+Architecture:
+- Parser and GeoIP reader are patched (no GeoLite2 database needed)
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+import geoip2.database
+import geoip2.errors
+import pytest
+
+from src.domain.protocols.session_enricher_protocol import DeviceEnrichmentResult
+from src.infrastructure.enrichers.device_enricher import UserAgentDeviceEnricher
+from src.infrastructure.enrichers.enrichment_cache import EnrichmentCache
+from src.infrastructure.enrichers.location_enricher import IPLocationEnricher
+
+CHROME_UA = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+LOCATION_MODULE = "src.infrastructure.enrichers.location_enricher"
+
+
+@pytest.fixture
+def geoip_reader():
+    """Patch the GeoIP2 reader and database file check."""
+    with (
+        patch(f"{LOCATION_MODULE}.geoip2.database.Reader") as reader_class,
+        patch(f"{LOCATION_MODULE}.Path.exists", return_value=True),
+    ):
+        response = Mock()
+        response.city.name = "Mountain View"
+        response.country.iso_code = "US"
+        response.location.latitude = 37.4056
+        response.location.longitude = -122.0775
+        reader_class.return_value.city.return_value = response
+        yield reader_class
+
+
+# =============================================================================
+# EnrichmentCache
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestEnrichmentCache:
+    """Test the bounded LRU cache."""
+
+    def test_hit_and_miss_counters(self):
+        """get() counts hits and misses."""
+        cache = EnrichmentCache(max_entries=10)
+        cache.get("a")
+        cache.set("a", "result")
+
+        assert cache.get("a") == "result"
+        stats = cache.get_stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.to_dict()["hit_ratio"] == 0.5
+
+    def test_evicts_least_recently_used(self):
+        """The least recently used entry is evicted when full."""
+        cache = EnrichmentCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert len(cache) == 2
+        assert cache.get_stats().evictions == 1
+
+    def test_lookup_latency(self):
+        """Recorded lookups feed average and max latency."""
+        cache = EnrichmentCache(max_entries=10)
+        cache.get("a")
+        cache.record_lookup(2.0)
+        cache.get("b")
+        cache.record_lookup(4.0)
+
+        stats = cache.get_stats().to_dict()
+
+        assert stats["avg_lookup_ms"] == 3.0
+        assert stats["max_lookup_ms"] == 4.0
+
+
+# =============================================================================
+# Device Enricher
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestUserAgentDeviceEnricherCache:
+    """Test user agent parse caching."""
+
+    async def test_repeated_user_agent_parsed_once(self, mock_logger):
+        """The same user agent is parsed once and then served from cache."""
+        enricher = UserAgentDeviceEnricher(logger=mock_logger)
+
+        with patch.object(enricher, "_parse", wraps=enricher._parse) as parse:
+            first = await enricher.enrich(CHROME_UA)
+            second = await enricher.enrich(CHROME_UA)
+
+        assert parse.call_count == 1
+        assert second == first
+        assert first.browser == "Chrome"
+        stats = enricher.get_stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    async def test_parse_runs_off_event_loop(self, mock_logger):
+        """Cache misses are parsed in a worker thread."""
+        enricher = UserAgentDeviceEnricher(logger=mock_logger)
+        loop_thread = threading.get_ident()
+        parse_threads: list[int] = []
+
+        def parse(user_agent: str) -> DeviceEnrichmentResult:
+            parse_threads.append(threading.get_ident())
+            return DeviceEnrichmentResult(device_info="Chrome on Windows")
+
+        with patch.object(enricher, "_parse", side_effect=parse):
+            await enricher.enrich(CHROME_UA)
+
+        assert parse_threads and parse_threads[0] != loop_thread
+
+    async def test_parse_failure_not_cached(self, mock_logger):
+        """A failed parse returns empty (fail-open) and is retried next time."""
+        enricher = UserAgentDeviceEnricher(logger=mock_logger)
+
+        with patch.object(
+            enricher, "_parse", side_effect=ValueError("bad agent")
+        ) as parse:
+            result = await enricher.enrich("garbage")
+            await enricher.enrich("garbage")
+
+        assert result == DeviceEnrichmentResult()
+        assert parse.call_count == 2
+        mock_logger.warning.assert_called()
+
+    async def test_oversized_user_agent_not_cached(self, mock_logger):
+        """Very long user agents are parsed but not cached."""
+        enricher = UserAgentDeviceEnricher(logger=mock_logger)
+
+        await enricher.enrich(CHROME_UA + "x" * 1024)
+
+        assert enricher.get_stats().entries == 0
+
+
+# =============================================================================
+# Location Enricher
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestIPLocationEnricherCache:
+    """Test GeoIP lookup caching."""
+
+    async def test_database_opened_memory_mapped(self, mock_logger, geoip_reader):
+        """The GeoIP database is opened with MODE_MMAP."""
+        enricher = IPLocationEnricher(logger=mock_logger, db_path="/fake/City.mmdb")
+
+        await enricher.enrich("8.8.8.8")
+
+        assert geoip_reader.call_args.kwargs["mode"] == geoip2.database.MODE_MMAP
+
+    async def test_same_ipv4_prefix_served_from_cache(self, mock_logger, geoip_reader):
+        """Addresses in one /24 share a single lookup."""
+        enricher = IPLocationEnricher(logger=mock_logger, db_path="/fake/City.mmdb")
+
+        first = await enricher.enrich("8.8.8.8")
+        second = await enricher.enrich("8.8.8.200")
+        await enricher.enrich("8.8.4.4")  # Other /24
+
+        assert second == first
+        assert geoip_reader.return_value.city.call_count == 2
+        stats = enricher.get_stats()
+        assert (stats.hits, stats.misses) == (1, 2)
+
+    async def test_same_ipv6_prefix_served_from_cache(self, mock_logger, geoip_reader):
+        """Addresses in one IPv6 /64 share a single lookup."""
+        enricher = IPLocationEnricher(logger=mock_logger, db_path="/fake/City.mmdb")
+
+        await enricher.enrich("2001:4860:4860::8888")
+        await enricher.enrich("2001:4860:4860::8844")
+
+        assert geoip_reader.return_value.city.call_count == 1
+
+    async def test_address_not_found_is_cached(self, mock_logger, geoip_reader):
+        """Unknown prefixes are cached as empty results."""
+        geoip_reader.return_value.city.side_effect = geoip2.errors.AddressNotFoundError(
+            "not found"
+        )
+        enricher = IPLocationEnricher(logger=mock_logger, db_path="/fake/City.mmdb")
+
+        first = await enricher.enrich("1.1.1.7")
+        await enricher.enrich("1.1.1.8")
+
+        assert first.location is None
+        assert geoip_reader.return_value.city.call_count == 1
+
+    async def test_lookup_runs_off_event_loop(self, mock_logger, geoip_reader):
+        """Cache misses query the database in a worker thread."""
+        loop_thread = threading.get_ident()
+        lookup_threads: list[int] = []
+        response = geoip_reader.return_value.city.return_value
+
+        def city(ip_address: str):
+            lookup_threads.append(threading.get_ident())
+            return response
+
+        geoip_reader.return_value.city.side_effect = city
+        enricher = IPLocationEnricher(logger=mock_logger, db_path="/fake/City.mmdb")
+
+        result = await enricher.enrich("8.8.8.8")
+
+        assert result.location == "Mountain View, US"
+        assert lookup_threads and lookup_threads[0] != loop_thread
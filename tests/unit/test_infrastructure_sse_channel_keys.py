@@ -4,6 +4,7 @@ Tests cover:
 - SSEChannelKeys.user_channel() - per-user pub/sub channel
 - SSEChannelKeys.broadcast_channel() - global broadcast channel
 - SSEChannelKeys.user_stream() - Redis Streams key for retention
+- SSEChannelKeys.user_stream_entry() - event_id -> stream entry index key
 - SSEChannelKeys.parse_user_id_from_channel() - reverse lookup
 - SSEChannelKeys.is_broadcast_channel() - channel type detection
 
@@ -118,6 +119,15 @@ class TestUserStream:
 
         assert stream.startswith(f"{SSE_CHANNEL_PREFIX}:")
 
+    def test_user_stream_entry_format(self):
+        """Test stream entry index key is scoped under the user stream."""
+        user_id = uuid7()
+        event_id = uuid7()
+        key = SSEChannelKeys.user_stream_entry(user_id, event_id)
+
+        expected = f"{SSE_CHANNEL_PREFIX}:stream:user:{user_id}:event:{event_id}"
+        assert key == expected
+
     def test_user_stream_includes_stream_segment(self):
         """Test user stream includes 'stream' segment."""
         user_id = uuid7()
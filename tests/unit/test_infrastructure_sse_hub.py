@@ -0,0 +1,145 @@
+"""Unit tests for SSEHub listener supervision.
+
+Tests cover:
+- A message that fails to dispatch is skipped; the listener keeps running
+- Streams end (instead of waiting forever) while Redis is unavailable
+- Open streams end when the hub loses its subscription
+
+Architecture:
+- fakeredis for pub/sub delivery; a scripted pub/sub for failures
+- Integration tests (real Redis) cover fan-out and backpressure
+"""
+
+import asyncio
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fakeredis import FakeServer, aioredis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from uuid_extensions import uuid7
+
+from src.domain.events.sse_event import SSEEvent, SSEEventType
+from src.infrastructure.sse.redis_publisher import RedisSSEPublisher
+from src.infrastructure.sse.sse_hub import SSEHub
+
+
+class ScriptedPubSub:
+    """Pub/sub that confirms subscriptions, then fails on demand."""
+
+    def __init__(self, fail_subscribe: bool = False) -> None:
+        self.fail_subscribe = fail_subscribe
+        self.lost = asyncio.Event()
+
+    async def psubscribe(self, *patterns: str) -> None:
+        if self.fail_subscribe:
+            raise RedisConnectionError("Connection refused")
+
+    async def subscribe(self, *channels: str) -> None:
+        pass
+
+    async def listen(self):
+        yield {"type": "psubscribe", "channel": b"sse:user:*", "data": 1}
+        yield {"type": "subscribe", "channel": b"sse:broadcast", "data": 2}
+        await self.lost.wait()
+        raise RedisConnectionError("Connection reset by peer")
+
+    async def aclose(self) -> None:
+        pass
+
+
+def _scripted_redis(pubsub: ScriptedPubSub) -> MagicMock:
+    redis_client = MagicMock()
+    redis_client.pubsub.return_value = pubsub
+    return redis_client
+
+
+async def _drain(stream) -> list[SSEEvent]:
+    async with asyncio.timeout(1):
+        return [event async for event in stream]
+
+
+@pytest.mark.unit
+class TestSSEHubSupervision:
+    """Test the hub listener's failure handling."""
+
+    async def test_failed_dispatch_skips_message(self):
+        """An unexpected error for one message does not stop the listener."""
+        redis_client = aioredis.FakeRedis(server=FakeServer())
+        logger = MagicMock()
+        hub = SSEHub(redis_client=redis_client, logger=logger)
+        publisher = RedisSSEPublisher(
+            redis_client=redis_client, logger=logging.getLogger("test.sse")
+        )
+        user_id = uuid7()
+        from_dict = SSEEvent.from_dict
+        calls = 0
+
+        def flaky_from_dict(data):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("boom")
+            return from_dict(data)
+
+        stream = hub.listen(user_id)
+        pending = asyncio.create_task(anext(stream))
+        async with asyncio.timeout(1):
+            while not hub._ready.is_set():
+                await asyncio.sleep(0.01)
+
+        event = SSEEvent(
+            event_type=SSEEventType.SYNC_ACCOUNTS_COMPLETED, user_id=user_id, data={}
+        )
+        with patch.object(SSEEvent, "from_dict", side_effect=flaky_from_dict):
+            await publisher.publish(event)
+            await publisher.publish(event)
+            received = await asyncio.wait_for(pending, timeout=1)
+
+        assert received.event_id == event.event_id
+        assert logger.error.call_args.args[0] == ("SSE hub failed to dispatch message")
+        await stream.aclose()
+        await hub.aclose()
+
+    async def test_stream_ends_while_redis_unavailable(self):
+        """A new stream ends after the ready timeout if Redis is down."""
+        hub = SSEHub(
+            redis_client=_scripted_redis(ScriptedPubSub(fail_subscribe=True)),
+            ready_timeout_seconds=0.05,
+            logger=MagicMock(),
+        )
+
+        assert await _drain(hub.listen(uuid7())) == []
+        assert hub.get_stats().connected_clients == 0
+        await hub.aclose()
+
+    async def test_lost_subscription_ends_open_streams(self):
+        """Open streams end when the shared subscription fails."""
+        pubsub = ScriptedPubSub()
+        logger = MagicMock()
+        hub = SSEHub(redis_client=_scripted_redis(pubsub), logger=logger)
+        streams = [asyncio.create_task(_drain(hub.listen(uuid7()))) for _ in range(2)]
+        async with asyncio.timeout(1):
+            while not hub._ready.is_set():
+                await asyncio.sleep(0.01)
+
+        pubsub.lost.set()
+
+        assert await asyncio.gather(*streams) == [[], []]
+        assert not hub._ready.is_set()
+        logger.warning.assert_called()
+        await hub.aclose()
+
+    async def test_listener_crash_ends_open_streams(self):
+        """Streams end if the listener task itself dies."""
+        hub = SSEHub(redis_client=_scripted_redis(ScriptedPubSub()), logger=MagicMock())
+        stream = asyncio.create_task(_drain(hub.listen(uuid7())))
+        async with asyncio.timeout(1):
+            while not hub._ready.is_set():
+                await asyncio.sleep(0.01)
+
+        assert hub._listener is not None
+        hub._listener.cancel()
+
+        assert await stream == []
+        await hub.aclose()
@@ -0,0 +1,468 @@
+"""Unit tests for SyncJobRunner and SyncJobStore.
+
+Tests cover:
+- submit() - job stored, executed, outcome recorded (success, failure, exception)
+- Deduplication per (kind, target) and per user, including concurrent submits
+- Per-kind concurrency caps and start delays
+- aclose() - drains, cancels and marks interrupted jobs failed
+- SyncJobStore - state sets, stale member pruning, lock release, stale
+  lock takeover, recently failed targets
+
+Architecture:
+- Uses fakeredis (with Lua) as the jobs Redis
+- Executor is a plain async function (no handlers or database)
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+from fakeredis import FakeServer, aioredis
+from redis.exceptions import RedisError
+from uuid_extensions import uuid7
+
+from src.core.enums import ErrorCode
+from src.core.result import Failure, Success
+from src.infrastructure.jobs.sync_job_runner import SyncJobRunner
+from src.infrastructure.jobs.sync_job_store import (
+    SyncJob,
+    SyncJobKind,
+    SyncJobStatus,
+    SyncJobStore,
+)
+
+
+@dataclass(frozen=True)
+class FakeSyncResult:
+    """Result DTO shaped like the sync handlers' results."""
+
+    created: int
+    message: str
+
+
+class ControlledExecutor:
+    """Executor that blocks each command until released."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.active = 0
+        self.max_active = 0
+        self.commands: list[object] = []
+
+    async def __call__(self, command: object):
+        self.commands.append(command)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await self.release.wait()
+        finally:
+            self.active -= 1
+        return Success(value=FakeSyncResult(created=1, message="Synced 1 account"))
+
+
+class SlowSyncJobStore(SyncJobStore):
+    """Store with added latency on job reads or writes (widens claim races)."""
+
+    def __init__(self, redis_client, *, get_delay=0.0, save_delay=0.0):
+        super().__init__(redis_client, key_prefix="test:sync-jobs")
+        self.get_delay = get_delay
+        self.save_delay = save_delay
+
+    async def get(self, job_id):
+        await asyncio.sleep(self.get_delay)
+        return await super().get(job_id)
+
+    async def save(self, job):
+        await asyncio.sleep(self.save_delay)
+        await super().save(job)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def redis_client():
+    """Provide an isolated fake Redis."""
+    return aioredis.FakeRedis(server=FakeServer())
+
+
+@pytest.fixture
+def store(redis_client):
+    """Create SyncJobStore on fake Redis."""
+    return SyncJobStore(redis_client, key_prefix="test:sync-jobs")
+
+
+@pytest.fixture
+def executor():
+    """Create a controllable executor."""
+    return ControlledExecutor()
+
+
+@pytest.fixture
+def runner(store, executor):
+    """Create SyncJobRunner with small caps."""
+    return SyncJobRunner(
+        store=store,
+        executor=executor,
+        logger=MagicMock(),
+        concurrency={SyncJobKind.ACCOUNTS: 1, SyncJobKind.HOLDINGS: 2},
+        shutdown_grace_seconds=0.05,
+    )
+
+
+async def _wait_until(predicate) -> None:
+    """Yield to background jobs until predicate() holds (1s timeout)."""
+    async with asyncio.timeout(1):
+        while not predicate():
+            await asyncio.sleep(0.001)
+
+
+async def _submit(runner, kind=SyncJobKind.ACCOUNTS, user_id=None, target_id=None):
+    result = await runner.submit(
+        kind=kind,
+        user_id=user_id or uuid7(),
+        target_id=target_id or uuid7(),
+        command=object(),
+    )
+    assert isinstance(result, Success)
+    return result.value
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestSyncJobRunner:
+    """Test job lifecycle through the runner."""
+
+    async def test_submit_returns_queued_job(self, runner, store, executor):
+        """Submit stores a QUEUED job and returns immediately."""
+        submission = await _submit(runner)
+
+        assert submission.deduplicated is False
+        assert submission.job.status == SyncJobStatus.QUEUED
+        stored = await store.get(submission.job.job_id)
+        assert stored is not None
+
+        executor.release.set()
+        await runner.aclose()
+
+    async def test_success_records_message_and_result(self, runner, store, executor):
+        """A successful command stores the handler summary and counts."""
+        executor.release.set()
+        submission = await _submit(runner)
+        await runner.aclose()
+
+        job = await store.get(submission.job.job_id)
+        assert job.status == SyncJobStatus.SUCCEEDED
+        assert job.message == "Synced 1 account"
+        assert job.result == {"created": 1, "message": "Synced 1 account"}
+        assert job.started_at is not None
+        assert job.finished_at is not None
+        assert await store.count_active() == (0, 0)
+
+    async def test_failure_result_records_error(self, store):
+        """A Failure result marks the job failed with the handler error."""
+
+        async def failing(command):
+            return Failure(error="Connection not found")
+
+        runner = SyncJobRunner(
+            store=store, executor=failing, logger=MagicMock(), concurrency={}
+        )
+        submission = await _submit(runner)
+        await runner.aclose()
+
+        job = await store.get(submission.job.job_id)
+        assert job.status == SyncJobStatus.FAILED
+        assert job.error == "Connection not found"
+
+    async def test_exception_records_error_and_logs(self, store):
+        """An executor exception marks the job failed and is logged."""
+        logger = MagicMock()
+
+        async def raising(command):
+            raise RuntimeError("boom")
+
+        runner = SyncJobRunner(
+            store=store, executor=raising, logger=logger, concurrency={}
+        )
+        submission = await _submit(runner)
+        await runner.aclose()
+
+        job = await store.get(submission.job.job_id)
+        assert job.status == SyncJobStatus.FAILED
+        assert "boom" in job.error
+        assert logger.error.call_args.args[0] == "sync_job_failed"
+
+    async def test_duplicate_submit_returns_active_job(self, runner, executor):
+        """A second submit for the same target returns the running job."""
+        user_id, target_id = uuid7(), uuid7()
+        first = await _submit(runner, user_id=user_id, target_id=target_id)
+        await _wait_until(lambda: executor.active == 1)
+
+        second = await _submit(runner, user_id=user_id, target_id=target_id)
+
+        assert second.deduplicated is True
+        assert second.job.job_id == first.job.job_id
+        assert second.job.status == SyncJobStatus.RUNNING
+        executor.release.set()
+        await runner.aclose()
+        assert len(executor.commands) == 1
+
+    async def test_concurrent_submits_start_one_job(self, redis_client, executor):
+        """Concurrent submits for one target share a single job."""
+        store = SlowSyncJobStore(redis_client, save_delay=0.01)
+        runner = SyncJobRunner(
+            store=store, executor=executor, logger=MagicMock(), concurrency={}
+        )
+        user_id, target_id = uuid7(), uuid7()
+
+        submissions = await asyncio.gather(
+            *(_submit(runner, user_id=user_id, target_id=target_id) for _ in range(5))
+        )
+
+        assert len({s.job.job_id for s in submissions}) == 1
+        assert [s.deduplicated for s in submissions].count(False) == 1
+        executor.release.set()
+        await runner.aclose()
+        assert len(executor.commands) == 1
+
+    async def test_same_target_other_kind_not_deduplicated(self, runner, executor):
+        """Dedupe is scoped to the sync kind."""
+        user_id, target_id = uuid7(), uuid7()
+        first = await _submit(runner, user_id=user_id, target_id=target_id)
+        second = await _submit(
+            runner,
+            kind=SyncJobKind.TRANSACTIONS,
+            user_id=user_id,
+            target_id=target_id,
+        )
+
+        assert second.deduplicated is False
+        assert second.job.job_id != first.job.job_id
+        executor.release.set()
+        await runner.aclose()
+
+    async def test_other_user_gets_own_job(self, runner, executor):
+        """Another user's submit for the same target is not deduplicated."""
+        target_id = uuid7()
+        first = await _submit(runner, target_id=target_id)
+        second = await _submit(runner, target_id=target_id)
+
+        assert second.deduplicated is False
+        assert second.job.job_id != first.job.job_id
+        executor.release.set()
+        await runner.aclose()
+
+    async def test_finished_job_releases_dedupe_lock(self, runner, executor):
+        """After a job finishes, the same target starts a new job."""
+        executor.release.set()
+        user_id, target_id = uuid7(), uuid7()
+        first = await _submit(runner, user_id=user_id, target_id=target_id)
+        await _wait_until(lambda: runner.get_stats().completed == 1)
+
+        second = await _submit(runner, user_id=user_id, target_id=target_id)
+
+        assert second.deduplicated is False
+        assert second.job.job_id != first.job.job_id
+        await runner.aclose()
+
+    async def test_concurrency_cap_per_kind(self, runner, store, executor):
+        """Jobs beyond a kind's cap wait; other kinds are unaffected."""
+        for _ in range(3):
+            await _submit(runner, kind=SyncJobKind.ACCOUNTS)
+        await _submit(runner, kind=SyncJobKind.HOLDINGS)
+        await _wait_until(lambda: executor.active == 2)
+
+        stats = runner.get_stats()
+        assert stats.running == {"accounts": 1, "transactions": 0, "holdings": 1}
+        assert stats.waiting["accounts"] == 2
+        assert executor.max_active == 2
+        assert await store.count_active() == (2, 2)
+
+        executor.release.set()
+        await runner.aclose()
+        assert runner.get_stats().completed == 4
+        assert await store.count_active() == (0, 0)
+
+    async def test_delayed_job_waits_before_running(self, runner, executor):
+        """A job submitted with delay_seconds stays queued until the delay ends."""
+        executor.release.set()
+        submission = await runner.submit(
+            kind=SyncJobKind.ACCOUNTS,
+            user_id=uuid7(),
+            target_id=uuid7(),
+            command=object(),
+            delay_seconds=0.05,
+        )
+        assert isinstance(submission, Success)
+        await asyncio.sleep(0)
+
+        assert executor.commands == []
+        assert runner.get_stats().waiting["accounts"] == 1
+
+        await _wait_until(lambda: runner.get_stats().completed == 1)
+        await runner.aclose()
+
+    async def test_aclose_cancels_and_marks_failed(self, runner, store, executor):
+        """Jobs still running after the grace period are marked failed."""
+        running = await _submit(runner)
+        waiting = await _submit(runner)
+        await _wait_until(lambda: executor.active == 1)
+
+        await runner.aclose()
+
+        for submission in (running, waiting):
+            job = await store.get(submission.job.job_id)
+            assert job.status == SyncJobStatus.FAILED
+            assert job.error == "Sync job interrupted by shutdown"
+
+    async def test_submit_after_close_fails(self, runner):
+        """No jobs are accepted once shutdown started."""
+        await runner.aclose()
+
+        result = await runner.submit(
+            kind=SyncJobKind.ACCOUNTS,
+            user_id=uuid7(),
+            target_id=uuid7(),
+            command=object(),
+        )
+
+        assert isinstance(result, Failure)
+        assert result.error.code == ErrorCode.SERVICE_UNAVAILABLE
+
+    async def test_submit_redis_error_returns_failure(self, executor):
+        """Submit returns Failure when the status store is unreachable."""
+        store = MagicMock()
+        store.claim.side_effect = RedisError("Connection refused")
+        runner = SyncJobRunner(
+            store=store, executor=executor, logger=MagicMock(), concurrency={}
+        )
+
+        result = await runner.submit(
+            kind=SyncJobKind.ACCOUNTS,
+            user_id=uuid7(),
+            target_id=uuid7(),
+            command=object(),
+        )
+
+        assert isinstance(result, Failure)
+        assert result.error.code == ErrorCode.SERVICE_UNAVAILABLE
+        assert result.error.details is not None
+        assert "Connection refused" in result.error.details["error"]
+        assert executor.commands == []
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestSyncJobStore:
+    """Test SyncJobStore directly."""
+
+    def _job(self, status=SyncJobStatus.QUEUED, target_id=None) -> SyncJob:
+        return SyncJob(
+            job_id=uuid7(),
+            kind=SyncJobKind.HOLDINGS,
+            status=status,
+            user_id=uuid7(),
+            target_id=target_id or uuid7(),
+            created_at=datetime.now(UTC),
+        )
+
+    async def test_round_trip(self, store):
+        """Saved jobs load back unchanged."""
+        job = self._job().succeeded(message="ok", result={"created": 2})
+        await store.save(job)
+
+        assert await store.get(job.job_id) == job
+
+    async def test_get_unknown_returns_none(self, store):
+        """Unknown job ids return None."""
+        assert await store.get(uuid7()) is None
+
+    async def test_stale_lock_is_taken_over(self, store, redis_client):
+        """A lock naming a finished job no longer blocks new jobs."""
+        target_id = uuid7()
+        finished = self._job(target_id=target_id).failed("boom")
+        await store.save(finished)
+        await redis_client.set(
+            f"test:sync-jobs:lock:holdings:{target_id}", str(finished.job_id)
+        )
+
+        assert await store.claim(self._job(target_id=target_id)) is None
+
+    async def test_concurrent_stale_lock_takeover_has_one_winner(self, redis_client):
+        """Only one of several claims replaces a stale lock."""
+        store = SlowSyncJobStore(redis_client, get_delay=0.01)
+        target_id = uuid7()
+        finished = self._job(target_id=target_id).failed("boom")
+        await store.save(finished)
+        await redis_client.set(
+            f"test:sync-jobs:lock:holdings:{target_id}", str(finished.job_id)
+        )
+        jobs = [self._job(target_id=target_id) for _ in range(5)]
+
+        holders = await asyncio.gather(*(store.claim(job) for job in jobs))
+
+        winners = [job for job, holder in zip(jobs, holders) if holder is None]
+        assert len(winners) == 1
+        assert {h.job_id for h in holders if h is not None} == {winners[0].job_id}
+        lock = await redis_client.get(f"test:sync-jobs:lock:holdings:{target_id}")
+        assert lock.decode() == str(winners[0].job_id)
+
+    async def test_claim_stores_queued_job(self, store):
+        """A successful claim writes the QUEUED job document with the lock."""
+        job = self._job()
+
+        assert await store.claim(job) is None
+
+        assert await store.get(job.job_id) == job
+        assert await store.count_active() == (1, 0)
+
+    async def test_finish_does_not_release_foreign_lock(self, store, redis_client):
+        """Finishing a job leaves a lock now owned by another job."""
+        target_id = uuid7()
+        owner = self._job(target_id=target_id)
+        assert await store.claim(owner) is None
+        other = self._job(target_id=target_id)
+
+        await store.save(other.failed("boom"))
+
+        lock = await redis_client.get(f"test:sync-jobs:lock:holdings:{target_id}")
+        assert lock.decode() == str(owner.job_id)
+
+    async def test_count_active_prunes_stale_members(self, store, redis_client):
+        """Members older than the lock TTL (crashed workers) are not counted."""
+        await store.save(self._job())
+        await redis_client.zadd(
+            "test:sync-jobs:running", {str(uuid7()): time.time() - 901}
+        )
+
+        assert await store.count_active() == (1, 0)
+        assert await redis_client.zcard("test:sync-jobs:running") == 0
+
+    async def test_recently_failed_targets(self, store, redis_client):
+        """Failed jobs mark their target until a job succeeds or time passes."""
+        failing, recovered, old = uuid7(), uuid7(), uuid7()
+        await store.save(self._job(target_id=failing).failed("boom"))
+        await store.save(self._job(target_id=recovered).failed("boom"))
+        await store.save(
+            self._job(target_id=recovered).succeeded(message="ok", result=None)
+        )
+        await redis_client.zadd(
+            "test:sync-jobs:failed:holdings", {str(old): time.time() - 7200}
+        )
+
+        assert await store.recently_failed(SyncJobKind.HOLDINGS, 3600) == {failing}
+        assert await store.recently_failed(SyncJobKind.ACCOUNTS, 3600) == set()
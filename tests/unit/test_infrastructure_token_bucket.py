@@ -3,7 +3,8 @@
 Tests adapter behavior with mocked storage to verify:
 - Key construction for different scopes
 - Rule lookup and disabled rule handling
-- Event publishing
+- Event publishing (and sampling)
+- Multi-scope route checks (check_route)
 - Fail-open behavior
 """
 
@@ -25,6 +26,9 @@ def mock_storage():
     storage.check_and_consume = AsyncMock(return_value=Success(value=(True, 0.0, 4)))
     storage.get_remaining = AsyncMock(return_value=Success(value=5))
     storage.reset = AsyncMock(return_value=Success(value=None))
+    storage.check_and_consume_many = AsyncMock(
+        return_value=Success(value=(True, [(0.0, 4), (0.0, 999)]))
+    )
     return storage
 
 
@@ -100,6 +104,39 @@ def adapter(mock_storage, test_rules, mock_event_bus, mock_logger):
     )
 
 
+@pytest.fixture
+def route_rules(test_rules):
+    """Route rule layers: sessions limited per IP and globally."""
+    global_rule = RateLimitRule(
+        max_tokens=1000,
+        refill_rate=1000.0,
+        scope=RateLimitScope.GLOBAL,
+        cost=1,
+        enabled=True,
+    )
+    return {
+        "POST /api/v1/sessions": (test_rules["POST /api/v1/sessions"], global_rule),
+        "POST /api/v1/disabled": (test_rules["POST /api/v1/disabled"],),
+    }
+
+
+@pytest.fixture
+def route_adapter(mock_storage, test_rules, route_rules, mock_event_bus, mock_logger):
+    """Create adapter with multi-scope route rules."""
+    return TokenBucketAdapter(
+        storage=mock_storage,
+        rules=test_rules,
+        event_bus=mock_event_bus,
+        logger=mock_logger,
+        route_rules=route_rules,
+    )
+
+
+def event_names(event_bus) -> list[str]:
+    """Names of published events, in order."""
+    return [c[0][0].__class__.__name__ for c in event_bus.publish.call_args_list]
+
+
 class TestTokenBucketAdapterKeyConstruction:
     """Tests for Redis key construction based on scope."""
 
@@ -390,3 +427,162 @@ class TestTokenBucketAdapterReset:
         )
 
         assert isinstance(result, Success)
+
+
+class TestTokenBucketAdapterCheckRoute:
+    """Tests for check_route (all scopes of a route in one storage call)."""
+
+    @pytest.mark.asyncio
+    async def test_all_buckets_checked_in_one_call(
+        self, route_adapter, mock_storage
+    ) -> None:
+        """Every enabled rule becomes one bucket of a single storage call."""
+        await route_adapter.check_route(
+            endpoint="POST /api/v1/sessions",
+            identifiers={
+                RateLimitScope.IP: "192.168.1.1",
+                RateLimitScope.GLOBAL: "global",
+            },
+        )
+
+        mock_storage.check_and_consume_many.assert_awaited_once()
+        mock_storage.check_and_consume.assert_not_called()
+        buckets = mock_storage.check_and_consume_many.call_args.kwargs["buckets"]
+        assert [key for key, _, _ in buckets] == [
+            "rate_limit:ip:192.168.1.1:POST /api/v1/sessions",
+            "rate_limit:global:POST /api/v1/sessions",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_allowed_result_reflects_fewest_remaining(
+        self, route_adapter
+    ) -> None:
+        """Headers come from the bucket closest to exhaustion."""
+        result = await route_adapter.check_route(
+            endpoint="POST /api/v1/sessions",
+            identifiers={RateLimitScope.IP: "192.168.1.1"},
+        )
+
+        assert isinstance(result, Success)
+        assert result.value.allowed is True
+        assert result.value.remaining == 4
+        assert result.value.limit == 5
+
+    @pytest.mark.asyncio
+    async def test_denied_result_reflects_longest_wait(
+        self, route_adapter, mock_storage, mock_event_bus
+    ) -> None:
+        """A denial reports the binding bucket and publishes only its event."""
+        mock_storage.check_and_consume_many.return_value = Success(
+            value=(False, [(0.0, 3), (30.0, 0)])
+        )
+
+        result = await route_adapter.check_route(
+            endpoint="POST /api/v1/sessions",
+            identifiers={RateLimitScope.IP: "192.168.1.1"},
+        )
+
+        assert result.value.allowed is False
+        assert result.value.retry_after == 30.0
+        assert result.value.limit == 1000
+        denied = [
+            c[0][0]
+            for c in mock_event_bus.publish.call_args_list
+            if c[0][0].__class__.__name__ == "RateLimitCheckDenied"
+        ]
+        assert [event.scope for event in denied] == ["global"]
+
+    @pytest.mark.asyncio
+    async def test_disabled_rules_skip_storage(
+        self, route_adapter, mock_storage
+    ) -> None:
+        """Routes whose rules are all disabled are allowed without Redis."""
+        result = await route_adapter.check_route(
+            endpoint="POST /api/v1/disabled",
+            identifiers={RateLimitScope.IP: "192.168.1.1"},
+        )
+
+        assert result.value.allowed is True
+        mock_storage.check_and_consume_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_storage_failure_returns_allowed(
+        self, route_adapter, mock_storage
+    ) -> None:
+        """Storage Failure results fail open."""
+        from src.core.enums import ErrorCode
+
+        mock_storage.check_and_consume_many.return_value = Failure(
+            error=RateLimitError(
+                code=ErrorCode.RATE_LIMIT_CHECK_FAILED,
+                message="Redis connection failed",
+            )
+        )
+
+        result = await route_adapter.check_route(
+            endpoint="POST /api/v1/sessions",
+            identifiers={RateLimitScope.IP: "192.168.1.1"},
+        )
+
+        assert isinstance(result, Success)
+        assert result.value.allowed is True
+
+
+class TestTokenBucketAdapterEventSampling:
+    """Tests for sampled Attempted/Allowed events."""
+
+    @pytest.mark.asyncio
+    async def test_unsampled_allowed_check_publishes_nothing(
+        self, mock_storage, test_rules, mock_event_bus, mock_logger
+    ) -> None:
+        """Sample rate 0: allowed checks publish no events."""
+        adapter = TokenBucketAdapter(
+            storage=mock_storage,
+            rules=test_rules,
+            event_bus=mock_event_bus,
+            logger=mock_logger,
+            event_sample_rate=0.0,
+        )
+
+        await adapter.is_allowed(
+            endpoint="POST /api/v1/sessions", identifier="192.168.1.1"
+        )
+
+        mock_event_bus.publish.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_denied_check_always_published(
+        self, mock_storage, test_rules, mock_event_bus, mock_logger
+    ) -> None:
+        """Denials are published even when not sampled."""
+        mock_storage.check_and_consume.return_value = Success(value=(False, 12.0, 0))
+        adapter = TokenBucketAdapter(
+            storage=mock_storage,
+            rules=test_rules,
+            event_bus=mock_event_bus,
+            logger=mock_logger,
+            event_sample_rate=0.0,
+        )
+
+        await adapter.is_allowed(
+            endpoint="POST /api/v1/sessions", identifier="192.168.1.1"
+        )
+
+        assert event_names(mock_event_bus) == ["RateLimitCheckDenied"]
+
+    @pytest.mark.asyncio
+    async def test_sampled_route_check_publishes_pair_per_bucket(
+        self, route_adapter, mock_event_bus
+    ) -> None:
+        """Sampled checks publish Attempted and Allowed for every bucket."""
+        await route_adapter.check_route(
+            endpoint="POST /api/v1/sessions",
+            identifiers={RateLimitScope.IP: "192.168.1.1"},
+        )
+
+        assert event_names(mock_event_bus) == [
+            "RateLimitCheckAttempted",
+            "RateLimitCheckAttempted",
+            "RateLimitCheckAllowed",
+            "RateLimitCheckAllowed",
+        ]
@@ -228,6 +228,12 @@ class TestErrorResponseBuilder:
             )
             == status.HTTP_429_TOO_MANY_REQUESTS
         )
+        assert (
+            ErrorResponseBuilder._get_status_code(
+                ApplicationErrorCode.SERVICE_UNAVAILABLE
+            )
+            == status.HTTP_503_SERVICE_UNAVAILABLE
+        )
 
     def test_get_status_code_defaults_to_500(self):
         """Test _get_status_code returns 500 for unmapped codes."""
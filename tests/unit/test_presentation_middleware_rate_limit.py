@@ -0,0 +1,291 @@
+"""Unit tests for RateLimitMiddleware (ASGI).
+
+Tests cover:
+- Rate limit headers on allowed responses
+- HTTP 429 responses (RFC 9457 body, Retry-After)
+- Fail-open on rate limiter exceptions and Failure results
+- Skipped paths and non-HTTP scopes
+- Streaming responses passed through chunk by chunk
+- Route template resolution (bucket keyed by template, not concrete path)
+
+Architecture:
+- Unit tests driving the raw ASGI interface with a stub downstream app
+- Mocked RateLimitProtocol and logger (no Redis)
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from starlette.datastructures import Headers
+from starlette.types import Message, Receive, Scope, Send
+
+from src.core.enums import ErrorCode
+from src.core.result import Failure, Success
+from src.domain.enums import RateLimitScope
+from src.domain.errors import RateLimitError
+from src.domain.value_objects.rate_limit_rule import RateLimitResult
+from src.presentation.routers.api.middleware.rate_limit_middleware import (
+    RateLimitMiddleware,
+)
+
+# Rate limited endpoint (IP scope, 5 tokens) from the route registry
+LOGIN_PATH = "/api/v1/sessions"
+
+
+# =============================================================================
+# Test Helpers
+# =============================================================================
+
+
+class StubApp:
+    """Downstream ASGI app that records calls and sends a fixed response."""
+
+    def __init__(self, chunks: tuple[bytes, ...] = (b"ok",)) -> None:
+        self.chunks = chunks
+        self.calls = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.calls += 1
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        for index, chunk in enumerate(self.chunks):
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": index < len(self.chunks) - 1,
+                }
+            )
+
+
+def create_middleware(
+    app: StubApp, result: object = None, error: Exception | None = None
+) -> tuple[RateLimitMiddleware, AsyncMock, MagicMock]:
+    """Create middleware with a mocked rate limiter and logger.
+
+    Returns:
+        The middleware, its mocked ``check_route`` and its mocked logger.
+    """
+    middleware = RateLimitMiddleware(app)
+    check_route = AsyncMock(side_effect=error, return_value=result)
+    logger = MagicMock()
+    rate_limit = AsyncMock()
+    rate_limit.check_route = check_route
+    middleware._rate_limit = rate_limit
+    middleware._logger = logger
+    return middleware, check_route, logger
+
+
+async def call_middleware(
+    middleware: RateLimitMiddleware, method: str = "POST", path: str = LOGIN_PATH
+) -> list[Message]:
+    """Run one request through the middleware and return sent messages."""
+    messages: list[Message] = []
+    scope: Scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": b"",
+        "headers": [(b"x-forwarded-for", b"203.0.113.7")],
+        "client": ("127.0.0.1", 50000),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    return messages
+
+
+def allowed(remaining: int = 4) -> Success[RateLimitResult]:
+    """Create an allowed rate limit result."""
+    return Success(
+        value=RateLimitResult(
+            allowed=True, remaining=remaining, limit=5, reset_seconds=12
+        )
+    )
+
+
+# =============================================================================
+# Allowed / Denied Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestRateLimitMiddlewareDecision:
+    """Tests for allowed and rate limited requests."""
+
+    @pytest.mark.asyncio
+    async def test_allowed_request_gets_rate_limit_headers(self) -> None:
+        """Allowed responses carry X-RateLimit-* headers."""
+        app = StubApp()
+        middleware, check_route, _ = create_middleware(app, result=allowed(remaining=4))
+
+        messages = await call_middleware(middleware)
+
+        headers = Headers(raw=messages[0]["headers"])
+        assert messages[0]["status"] == 200
+        assert headers["X-RateLimit-Limit"] == "5"
+        assert headers["X-RateLimit-Remaining"] == "4"
+        assert headers["X-RateLimit-Reset"] == "12"
+        assert app.calls == 1
+        check_route.assert_awaited_once_with(
+            endpoint=f"POST {LOGIN_PATH}",
+            identifiers={RateLimitScope.IP: "203.0.113.7"},
+        )
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_returns_429(self) -> None:
+        """Denied requests get an RFC 9457 429 and never reach the endpoint."""
+        app = StubApp()
+        denied = Success(
+            value=RateLimitResult(
+                allowed=False, retry_after=2.4, remaining=0, limit=5, reset_seconds=60
+            )
+        )
+        middleware, _, _ = create_middleware(app, result=denied)
+
+        messages = await call_middleware(middleware)
+
+        headers = Headers(raw=messages[0]["headers"])
+        body = json.loads(messages[1]["body"])
+        assert messages[0]["status"] == 429
+        assert headers["Retry-After"] == "2"
+        assert headers["X-RateLimit-Remaining"] == "0"
+        assert body["status"] == 429
+        assert body["instance"] == LOGIN_PATH
+        assert app.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_streaming_response_passed_through_unbuffered(self) -> None:
+        """Every body chunk is forwarded as its own message."""
+        app = StubApp(chunks=(b"event: a\n\n", b"event: b\n\n", b""))
+        middleware, _, _ = create_middleware(app, result=allowed())
+
+        messages = await call_middleware(
+            middleware, method="GET", path="/api/v1/events"
+        )
+
+        assert [m.get("body") for m in messages[1:]] == list(app.chunks)
+        assert [m.get("more_body") for m in messages[1:]] == [True, True, False]
+
+    @pytest.mark.asyncio
+    async def test_path_parameters_resolved_to_route_template(self) -> None:
+        """Concrete paths are checked against the registry template key."""
+        app = StubApp()
+        middleware, check_route, _ = create_middleware(app, result=allowed())
+
+        await call_middleware(
+            middleware,
+            method="GET",
+            path="/api/v1/accounts/550e8400-e29b-41d4-a716-446655440000",
+        )
+
+        call = check_route.call_args
+        assert call.kwargs["endpoint"] == "GET /api/v1/accounts/{account_id}"
+        assert set(call.kwargs["identifiers"]) == {RateLimitScope.USER}
+
+
+# =============================================================================
+# Fail-Open Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestRateLimitMiddlewareFailOpen:
+    """Tests for fail-open behavior."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_exception_allows_request(self) -> None:
+        """An exception from the rate limiter lets the request through."""
+        app = StubApp()
+        middleware, _, logger = create_middleware(
+            app, error=ConnectionError("redis down")
+        )
+
+        messages = await call_middleware(middleware)
+
+        assert messages[0]["status"] == 200
+        assert app.calls == 1
+        logger.warning.assert_called_once()
+        assert (
+            logger.warning.call_args.kwargs["event"]
+            == "rate_limit_middleware_exception"
+        )
+
+    @pytest.mark.asyncio
+    async def test_failure_result_allows_request(self) -> None:
+        """A Failure result from the rate limiter lets the request through."""
+        app = StubApp()
+        failure = Failure(
+            error=RateLimitError(
+                code=ErrorCode.RATE_LIMIT_CHECK_FAILED, message="check failed"
+            )
+        )
+        middleware, _, _ = create_middleware(app, result=failure)
+
+        messages = await call_middleware(middleware)
+
+        assert messages[0]["status"] == 200
+        assert "X-RateLimit-Limit" not in Headers(raw=messages[0]["headers"])
+        assert app.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_endpoint_exception_propagates_without_retry(self) -> None:
+        """Endpoint errors are not treated as rate limit failures."""
+        calls = 0
+
+        async def failing_app(scope: Scope, receive: Receive, send: Send) -> None:
+            nonlocal calls
+            calls += 1
+            raise ValueError("endpoint failed")
+
+        middleware, _, _ = create_middleware(StubApp(), result=allowed())
+        middleware.app = failing_app
+
+        with pytest.raises(ValueError, match="endpoint failed"):
+            await call_middleware(middleware)
+
+        assert calls == 1
+
+
+# =============================================================================
+# Skip Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestRateLimitMiddlewareSkip:
+    """Tests for requests that bypass rate limiting."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path", ["/", "/health", "/docs", "/openapi.json"])
+    async def test_skipped_paths_bypass_rate_limiter(self, path: str) -> None:
+        """Health and docs paths never consult the rate limiter."""
+        app = StubApp()
+        middleware, check_route, _ = create_middleware(app, result=allowed())
+
+        await call_middleware(middleware, method="GET", path=path)
+
+        assert app.calls == 1
+        check_route.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_non_http_scope_passed_through(self) -> None:
+        """Lifespan and websocket scopes go straight to the app."""
+        seen: list[Scope] = []
+
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            seen.append(scope)
+
+        middleware, check_route, _ = create_middleware(StubApp(), result=allowed())
+        middleware.app = app
+        scope = {"type": "lifespan"}
+
+        await middleware(scope, None, None)  # type: ignore[arg-type]
+
+        assert seen == [scope]
+        check_route.assert_not_awaited()
@@ -24,6 +24,7 @@ from src.domain.providers.registry import (
     ProviderAuthType,
     ProviderCategory,
     get_all_provider_slugs,
+    get_file_import_providers,
     get_oauth_providers,
     get_provider_metadata,
     get_providers_by_category,
@@ -115,6 +116,18 @@ class TestProviderRegistryCompleteness:
                 f"supports_holdings, or supports_balance_history must be True."
             )
 
+    def test_all_providers_allow_at_least_one_concurrent_request(self):
+        """Verify max_concurrent_requests is a usable semaphore size.
+
+        The provider concurrency limiter sizes one semaphore per provider
+        from this value; 0 would block every provider call forever.
+        """
+        for metadata in PROVIDER_REGISTRY:
+            assert metadata.max_concurrent_requests >= 1, (
+                f"Provider {metadata.slug} has max_concurrent_requests="
+                f"{metadata.max_concurrent_requests}; must be at least 1."
+            )
+
     def test_all_providers_have_required_settings(self):
         """Verify required_settings field is properly configured.
 
@@ -289,6 +302,25 @@ class TestProviderRegistryIntegration:
                 f"Registry says OAuth: {expected}, is_oauth_provider(): {result}"
             )
 
+    def test_file_import_providers_implement_parse_file(self):
+        """Verify every file import provider supports single-pass parse_file().
+
+        ImportFromFileHandler relies on get_file_import_providers() to pick
+        the single-pass path.
+        """
+        file_slugs = set(get_file_import_providers())
+        assert file_slugs == {
+            p.slug
+            for p in PROVIDER_REGISTRY
+            if p.auth_type == ProviderAuthType.FILE_IMPORT
+        }
+
+        for slug in file_slugs:
+            provider = get_provider(slug)
+            assert callable(getattr(provider, "parse_file", None)), (
+                f"File import provider {slug} does not implement parse_file()"
+            )
+
     def test_get_providers_by_category_returns_correct_providers(self):
         """Verify get_providers_by_category() returns all providers in category."""
         # Test each category